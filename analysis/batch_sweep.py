@@ -0,0 +1,131 @@
+"""
+JSON-RPC batch-size sweep at a fixed call rate.
+
+Indexers send JSON-RPC batches of 10-100 calls, and a node parses, schedules
+and serializes a batch very differently from the same calls sent one by one.
+lib/batch_sweep.sh keeps the call rate fixed and varies the batch size: for
+each size N in BATCH_SIZES the targets carry N calls per HTTP body
+(tools/target_generator.sh --batch-size N) and Vegeta sends
+BATCH_CALLS_PER_SECOND / N requests per second.
+
+For one round this combines the round's `vegeta report -type=json` with the
+unified monitor CSV rows inside [started_at, ended_at]:
+
+  * HTTP rate asked for and achieved, and achieved calls/s (x N)
+  * HTTP success: a batch answered with 200 is one success even when some of
+    its calls returned errors; per-call errors are in the proxy's per-method
+    CSV, which has one row per batched call (batch_idx)
+  * request latency p50 / p99 and the per-call share p50 / N
+  * node CPU % and used memory (MB) averaged over the round, and CPU % per
+    1000 calls/s
+
+    python3 analysis/batch_sweep.py --report round.json --batch-size 50 \
+        --calls-per-second 1000 --started-at "2026-06-11 12:00:00" \
+        --ended-at "2026-06-11 12:01:00" --monitor performance.csv \
+        --csv batch_sweep.csv
+
+Appends one row to --csv (header on a new file) and prints it as one JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Iterable, Sequence
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import MonitorRecord, parse_ts_to_epoch_s, read_monitor_csv  # noqa: E402
+from analysis.sweep_matrix import read_report  # noqa: E402
+
+CSV_COLUMNS = ("batch_size", "calls_per_second", "http_rate", "requests", "calls", "success_pct",
+               "achieved_http_rate", "achieved_calls_per_s", "p50_ms", "p99_ms", "per_call_p50_ms",
+               "cpu_pct", "mem_mb", "cpu_pct_per_kcalls", "started_at", "ended_at")
+
+
+def window_average(monitor: Iterable[MonitorRecord], start_s: int, end_s: int) -> tuple[float | None, float | None]:
+    """Mean CPU % and used memory of the monitor samples in [start_s, end_s]."""
+    samples = [m for m in monitor if start_s <= m.timestamp_s <= end_s]
+    if not samples:
+        return None, None
+    return (sum(m.cpu_pct for m in samples) / len(samples),
+            sum(m.mem_mb for m in samples) / len(samples))
+
+
+def summarize_round(report: dict | None, batch_size: int, calls_per_second: float, *,
+                    monitor: Sequence[MonitorRecord] = (), started_at: str = "",
+                    ended_at: str = "") -> dict:
+    """One CSV row for a batch-size round; report is sweep_matrix.read_report() output."""
+    report = report or {}
+    requests = report.get("requests", 0)
+    achieved_http = report.get("throughput", 0.0)
+    achieved_calls = achieved_http * batch_size
+    p50 = report.get("p50_ms")
+    cpu = mem = None
+    if monitor and started_at and ended_at:
+        cpu, mem = window_average(monitor, parse_ts_to_epoch_s(started_at), parse_ts_to_epoch_s(ended_at))
+    return {
+        "batch_size": batch_size,
+        "calls_per_second": calls_per_second,
+        "http_rate": calls_per_second / batch_size,
+        "requests": requests,
+        "calls": requests * batch_size,
+        "success_pct": report.get("success_pct"),
+        "achieved_http_rate": achieved_http,
+        "achieved_calls_per_s": achieved_calls,
+        "p50_ms": p50,
+        "p99_ms": report.get("p99_ms"),
+        "per_call_p50_ms": None if p50 is None else p50 / batch_size,
+        "cpu_pct": cpu,
+        "mem_mb": mem,
+        "cpu_pct_per_kcalls": cpu / achieved_calls * 1000 if cpu is not None and achieved_calls > 0 else None,
+        "started_at": started_at,
+        "ended_at": ended_at,
+    }
+
+
+def append_csv(path: str, row: dict) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerow(["" if row.get(k) is None else
+                         round(row[k], 3) if isinstance(row[k], float) else row[k]
+                         for k in CSV_COLUMNS])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Summarize one JSON-RPC batch-size round")
+    ap.add_argument("--report", required=True, help="vegeta report -type=json output of the round")
+    ap.add_argument("--batch-size", type=int, required=True, help="JSON-RPC calls per request")
+    ap.add_argument("--calls-per-second", type=float, required=True, help="target calls per second")
+    ap.add_argument("--started-at", default="", help="round start (monitor timestamp format)")
+    ap.add_argument("--ended-at", default="", help="round end (monitor timestamp format)")
+    ap.add_argument("--monitor", help="unified monitor CSV (timestamp, cpu_usage, mem_used)")
+    ap.add_argument("--csv", help="append the row to this CSV")
+    args = ap.parse_args(argv)
+    if args.batch_size < 1:
+        print("❌ --batch-size must be >= 1", file=sys.stderr)
+        return 1
+
+    monitor: list[MonitorRecord] = []
+    if args.monitor and os.path.exists(args.monitor):
+        try:
+            monitor = list(read_monitor_csv(args.monitor, mem_col="mem_used"))
+        except (KeyError, ValueError) as e:
+            print(f"⚠️  Monitor CSV unreadable, no CPU/memory for this round: {e}", file=sys.stderr)
+    row = summarize_round(read_report(args.report), args.batch_size, args.calls_per_second,
+                          monitor=monitor, started_at=args.started_at, ended_at=args.ended_at)
+    if args.csv:
+        append_csv(args.csv, row)
+    print(json.dumps(row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
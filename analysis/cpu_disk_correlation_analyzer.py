@@ -6,6 +6,7 @@ Implements complete correlation analysis based on CPU and Disk Performance Corre
 
 import sys
 import os
+import glob
 
 # Add project root directory to Python path
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,17 +33,60 @@ logger = get_logger(__name__)
 class CPUDiskCorrelationAnalyzer:
     """CPU-Disk Correlation Analyzer - Implements 18 analysis methods from the document"""
     
-    def __init__(self, data_file: str):
+    # Page cache residency changes slowly; a sample up to this old is still
+    # representative of the iostat row it is joined to.
+    PAGE_CACHE_MERGE_TOLERANCE_S = 60
+
+    def __init__(self, data_file: str, page_cache_file: Optional[str] = None):
         """
         Initialize analyzer
         
         Args:
             data_file: CSV file path containing CPU and Disk data
+            page_cache_file: Optional page_cache_collector.py CSV; discovered next
+                to data_file when omitted
         """
         self.data_file = data_file
+        self.page_cache_file = page_cache_file or self._find_page_cache_file()
         self.df = None
         self.analysis_results = {}
 
+    def _find_page_cache_file(self) -> Optional[str]:
+        """Find the newest page cache residency CSV in the data file's directory"""
+        data_dir = os.path.dirname(os.path.abspath(self.data_file))
+        candidates = [path for path in glob.glob(os.path.join(data_dir, 'page_cache_*.csv'))
+                      if not os.path.basename(path).startswith('page_cache_files_')]
+        if not candidates:
+            return None
+        return max(candidates, key=os.path.getmtime)
+
+    def _merge_page_cache_data(self) -> None:
+        """Join page cache residency columns onto the performance rows by timestamp"""
+        if not self.page_cache_file or not os.path.exists(self.page_cache_file):
+            return
+        if 'timestamp' not in self.df.columns:
+            return
+        try:
+            cache_df = pd.read_csv(self.page_cache_file)
+            if cache_df.empty or 'timestamp' not in cache_df.columns:
+                return
+            cache_df['timestamp'] = pd.to_datetime(cache_df['timestamp'], errors='coerce')
+            cache_df = cache_df.dropna(subset=['timestamp']).sort_values('timestamp')
+
+            perf = self.df.copy()
+            perf['_row_order'] = range(len(perf))
+            perf['_ts'] = pd.to_datetime(perf['timestamp'], errors='coerce')
+            valid = perf.dropna(subset=['_ts']).sort_values('_ts')
+            merged = pd.merge_asof(
+                valid, cache_df.rename(columns={'timestamp': '_ts'}),
+                on='_ts', direction='backward',
+                tolerance=pd.Timedelta(seconds=self.PAGE_CACHE_MERGE_TOLERANCE_S))
+            merged = pd.concat([merged, perf[perf['_ts'].isna()]], sort=False)
+            self.df = merged.sort_values('_row_order').drop(columns=['_row_order', '_ts']).reset_index(drop=True)
+            logger.info(f"✅ Page cache residency merged from {os.path.basename(self.page_cache_file)}")
+        except Exception as e:
+            logger.warning(f"⚠️ Page cache residency merge failed: {e}")
+
     def _check_device_configured(self, logical_name: str) -> bool:
         """Check if device is configured and has data"""
         if self.df is None:
@@ -82,6 +126,7 @@ class CPUDiskCorrelationAnalyzer:
                 return False
                 
             logger.info(f"✅ Data validation passed, found {len(required_disk_cols)} Disk devices")
+            self._merge_page_cache_data()
             return True
             
         except Exception as e:
@@ -108,14 +153,18 @@ class CPUDiskCorrelationAnalyzer:
         # 4. Multiple regression analysis (4 methods)
         multiple_regression_results = self._analyze_multiple_regressions()
         
+        # 5. Page cache residency vs read IOPS/latency (only when sampler data is present)
+        page_cache_results = self._analyze_page_cache_correlations()
+        
         # Integrate all results
         self.analysis_results = {
             'pearson_correlations': pearson_results,
             'linear_regressions': regression_results,
             'negative_correlations': negative_corr_results,
             'multiple_regressions': multiple_regression_results,
-            'summary': self._generate_analysis_summary()
+            'page_cache_correlations': page_cache_results,
         }
+        self.analysis_results['summary'] = self._generate_analysis_summary()
         
         return self.analysis_results
     
@@ -486,6 +535,53 @@ class CPUDiskCorrelationAnalyzer:
         
         return results
     
+    def _analyze_page_cache_correlations(self) -> Dict:
+        """Correlate data directory page cache residency with device read IOPS and read latency"""
+        results = {}
+        residency_cols = [col for col in self.df.columns
+                          if col.startswith('pagecache_') and col.endswith('_residency_ratio')]
+        if not residency_cols:
+            return results
+        
+        print("\n📊 5. Page Cache Residency Analysis")
+        for logical_name in ('data', 'accounts'):
+            residency_col = f'pagecache_{logical_name}_residency_ratio'
+            coverage_col = f'pagecache_{logical_name}_coverage_ratio'
+            if residency_col not in self.df.columns:
+                continue
+            
+            sampled = self.df[residency_col].notna()
+            if coverage_col in self.df.columns:
+                sampled &= self.df[coverage_col] > 0
+            
+            read_iops_cols = [col for col in self.df.columns if col.startswith(f'{logical_name}_') and col.endswith('_r_s')]
+            read_await_cols = [col for col in self.df.columns if col.startswith(f'{logical_name}_') and col.endswith('_r_await')]
+            
+            for target_cols, suffix, label in ((read_iops_cols, 'read_iops', 'read IOPS'),
+                                               (read_await_cols, 'read_latency', 'read latency')):
+                if not target_cols:
+                    continue
+                pair = self.df.loc[sampled, [residency_col, target_cols[0]]].dropna()
+                if len(pair) < 3 or pair[residency_col].nunique() < 2 or pair[target_cols[0]].nunique() < 2:
+                    print(f"  ⚠️  Skipping {logical_name.upper()} residency vs {label} (insufficient variation)")
+                    continue
+                try:
+                    corr, p_value = stats.pearsonr(pair[residency_col], pair[target_cols[0]])
+                    results[f'residency_vs_{logical_name}_{suffix}'] = {
+                        'correlation': corr,
+                        'p_value': p_value,
+                        'description': f'{logical_name.upper()} page cache residency vs {logical_name.upper()} device {label}',
+                        'strength': self._interpret_correlation_strength(corr),
+                        'method': 'pearson',
+                        'mean_residency_ratio': float(pair[residency_col].mean()),
+                        'samples': len(pair)
+                    }
+                    print(f"  ✅ {logical_name.upper()} page cache residency vs {label}: {corr:.4f} (p={p_value:.4f})")
+                except Exception as e:
+                    logger.warning(f"⚠️ {logical_name.upper()} page cache residency vs {label} analysis failed: {e}")
+        
+        return results
+    
     def _interpret_correlation_strength(self, corr: float) -> str:
         """Interpret correlation strength"""
         abs_corr = abs(corr)
@@ -510,7 +606,8 @@ class CPUDiskCorrelationAnalyzer:
         }
         
         # Count all analyses
-        for category in ['pearson_correlations', 'linear_regressions', 'negative_correlations', 'multiple_regressions']:
+        for category in ['pearson_correlations', 'linear_regressions', 'negative_correlations',
+                         'multiple_regressions', 'page_cache_correlations']:
             if category in self.analysis_results:
                 summary['total_analyses'] += len(self.analysis_results[category])
         
@@ -524,9 +621,24 @@ class CPUDiskCorrelationAnalyzer:
                         'description': result['description']
                     })
         
+        page_cache_results = self.analysis_results.get('page_cache_correlations', {})
+        for name, result in page_cache_results.items():
+            if abs(result.get('correlation', 0)) >= 0.6:
+                summary['strong_correlations'].append({
+                    'name': name,
+                    'correlation': result['correlation'],
+                    'description': result['description']
+                })
+        
         # Generate recommendations
         if len(summary['strong_correlations']) > 0:
             summary['recommendations'].append("Strong correlations found, can be used for performance prediction and optimization")
+        for name, result in page_cache_results.items():
+            if name.endswith('_read_iops') and result['correlation'] <= -0.6:
+                summary['recommendations'].append(
+                    f"{result['description']}: read IOPS rises as residency falls "
+                    f"(mean residency {result['mean_residency_ratio']:.1%}); the hot data set no longer fits in "
+                    f"page cache, so more memory or a smaller working set will cut device reads")
         
         return summary
     
@@ -585,6 +697,19 @@ Generation time: {pd.Timestamp.now()}
 ### {result['description']}
 - **R² value**: {result['r_squared']:.4f}
 - **Model significance**: {'Significant' if result['r_squared'] > 0.3 else 'Not significant'}
+"""
+        
+        page_cache_results = self.analysis_results.get('page_cache_correlations', {})
+        if page_cache_results:
+            report += "\n## 5. Page Cache Residency Analysis Results\n"
+            for name, result in page_cache_results.items():
+                report += f"""
+### {result['description']}
+- **Correlation coefficient**: {result['correlation']:.4f}
+- **P-value**: {result['p_value']:.4f}
+- **Mean residency ratio**: {result['mean_residency_ratio']:.2%}
+- **Samples**: {result['samples']}
+- **Correlation strength**: {result['strength']}
 """
         
         report += f"""
@@ -0,0 +1,287 @@
+"""
+Side-by-side capacity, latency and resource cost of several node endpoints.
+
+lib/compare.sh (WORKLOAD_TYPE=compare, --compare <spec.json>) drives every
+endpoint of the spec through the same QPS levels in one run, each behind
+its own RPC proxy instance and with its own resource sampler
+(monitoring/endpoint_resource_collector.py: process CPU and RSS of the
+endpoint's processes, I/O of its devices). Two modes:
+
+- interleaved  every level runs on each endpoint in turn at the full rate;
+               the order rotates per level so neither side always goes
+               first (cache warmth, compaction, time of day)
+- split        every level runs on all endpoints at once, each at rate / N;
+               the endpoints see the same moment but share the host
+
+A round passes when its Vegeta p50/p99 and error % meet the SLO
+(SLO_SPEC default, or SLO_P50_MS / SLO_P99_MS / SLO_ERROR_PCT).
+
+Per endpoint the summary gives:
+- capacity: the highest passing rate below the first failing one
+  (slo_capacity.capacity);
+- latency and resources at the comparison level, the highest rate that
+  every endpoint passed (the lowest common rate if there is none), plus
+  per-method p99 there from the endpoint's proxy sink;
+- cost: CPU % (per core) and device read/write IOPS per 1k achieved QPS
+  at the comparison level;
+- the change against the first endpoint of the spec (the baseline).
+
+Commands:
+- round    one endpoint's round: Vegeta report, SLO check and the sampler
+           window averages; appends a row to the results CSV
+- summary  per-endpoint comparison as JSON
+
+    python3 analysis/endpoint_compare.py summary --csv compare_results.csv \
+        --proxy-csv agave=logs/compare/agave/proxy_method.csv --output compare_summary.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Sequence
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import parse_ts_to_epoch_s, read_proxy_sink  # noqa: E402
+from analysis.slo_capacity import Slo, SloSpec, capacity, load_slo_spec, round_rows  # noqa: E402
+from analysis.sweep_matrix import read_report  # noqa: E402
+
+RESOURCE_COLUMNS = ("cpu_pct", "rss_mb", "read_iops", "write_iops", "read_mb_s", "write_mb_s")
+CSV_COLUMNS = ("endpoint", "mode", "level", "qps", "calls", "rate", "p50_ms", "p99_ms", "error_pct",
+               "passed", "violations", *RESOURCE_COLUMNS, "started_at", "ended_at")
+INT_COLUMNS = ("level", "qps", "calls")
+FLOAT_COLUMNS = ("rate", "p50_ms", "p99_ms", "error_pct")
+
+
+def resource_window(path: str | Path | None, start_s: int, end_s: int) -> dict:
+    """Mean of every sampler column over the rows in [start_s, end_s]; None where there are none."""
+    sums = {k: 0.0 for k in RESOURCE_COLUMNS}
+    n = 0
+    if path and os.path.exists(path):
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    ts = parse_ts_to_epoch_s(row["timestamp"])
+                    values = {k: float(row[k]) for k in RESOURCE_COLUMNS}
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if start_s <= ts <= end_s:
+                    for k, v in values.items():
+                        sums[k] += v
+                    n += 1
+    return {k: (sums[k] / n if n else None) for k in RESOURCE_COLUMNS}
+
+
+def summarize_round(report: dict | None, endpoint: str, mode: str, level: int, qps: int, slo: Slo, *,
+                    resources: dict | None = None, started_at: str = "", ended_at: str = "") -> dict:
+    """One CSV row; report is sweep_matrix.read_report() output, None for a failed attack."""
+    report = report or {}
+    calls = report.get("requests", 0)
+    error_pct = 100.0 - report["success_pct"] if calls else 100.0
+    p50, p99 = report.get("p50_ms", 0.0), report.get("p99_ms", 0.0)
+    violations = slo.violations(p50, p99, error_pct) if calls else ["errors"]
+    resources = resources or {}
+    return {"endpoint": endpoint, "mode": mode, "level": level, "qps": qps, "calls": calls,
+            "rate": report.get("throughput", 0.0), "p50_ms": p50, "p99_ms": p99, "error_pct": error_pct,
+            "passed": not violations, "violations": "+".join(violations),
+            **{k: resources.get(k) for k in RESOURCE_COLUMNS},
+            "started_at": started_at, "ended_at": ended_at}
+
+
+def append_csv(path: str, row: dict) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerow(["" if row[k] is None else round(row[k], 3) if isinstance(row[k], float) else
+                         str(row[k]).lower() if isinstance(row[k], bool) else row[k]
+                         for k in CSV_COLUMNS])
+
+
+def read_rounds(path: str | Path) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    rows = []
+    with open(path, newline="") as f:
+        for r in csv.DictReader(f):
+            row = dict(r)
+            row.update({k: int(r[k]) for k in INT_COLUMNS})
+            row.update({k: float(r[k]) for k in FLOAT_COLUMNS})
+            row.update({k: float(r[k]) if r[k] else None for k in RESOURCE_COLUMNS})
+            row["passed"] = r["passed"] == "true"
+            rows.append(row)
+    return rows
+
+
+def _per_kqps(value: float | None, rate: float) -> float | None:
+    return value / rate * 1000 if value is not None and rate > 0 else None
+
+
+def _change_pct(value: float | None, base: float | None) -> float | None:
+    return (value / base - 1) * 100 if value is not None and base else None
+
+
+def comparison_qps(rounds: Sequence[dict]) -> int | None:
+    """Highest rate every endpoint ran and passed; the lowest common rate if there is none."""
+    endpoints = list(dict.fromkeys(r["endpoint"] for r in rounds))
+    ran = [{r["qps"] for r in rounds if r["endpoint"] == e} for e in endpoints]
+    common = set.intersection(*ran) if ran else set()
+    if not common:
+        return None
+    failed = {r["qps"] for r in rounds if not r["passed"]}
+    passed = [q for q in common if q not in failed]
+    return max(passed) if passed else min(common)
+
+
+def method_p99(rows, start_s: int, end_s: int, qps: int) -> dict[str, float]:
+    """p99 per method of one endpoint's proxy sink rows in a round window."""
+    return {r["method"]: r["p99_ms"] for r in round_rows(rows, qps, start_s, end_s, SloSpec(Slo(), {}))}
+
+
+def summary(rounds: Sequence[dict], proxy_rows: dict[str, list] | None = None) -> dict:
+    """Per-endpoint capacity, latency and cost at the comparison level, and the change against the baseline."""
+    endpoints = list(dict.fromkeys(r["endpoint"] for r in rounds))
+    if not endpoints:
+        return {"endpoints": {}, "baseline": None, "comparison_qps": None}
+    caps = capacity([{**r, "method": r["endpoint"]} for r in rounds])["methods"]
+    at_qps = comparison_qps(rounds)
+    out = {}
+    for name in endpoints:
+        mine = sorted((r for r in rounds if r["endpoint"] == name), key=lambda r: (r["qps"], r["started_at"]))
+        cap = caps[name]
+        # a repeated level keeps its last round
+        here = ([r for r in mine if r["qps"] == at_qps] or [None])[-1]
+        entry = {
+            "max_qps": cap["max_qps"],
+            "max_rate": cap["max_rate"],
+            "first_failing_qps": cap["first_failing_qps"],
+            "failed_on": cap["failed_on"],
+            "p99_at_capacity_ms": cap["p99_ms"],
+            "at_comparison": None,
+            "methods_p99_ms": {},
+            "curve": [{k: r[k] for k in ("level", "qps", "rate", "p50_ms", "p99_ms", "error_pct", "passed",
+                                         *RESOURCE_COLUMNS)} for r in mine],
+        }
+        if here is not None:
+            entry["at_comparison"] = {
+                **{k: here[k] for k in ("rate", "p50_ms", "p99_ms", "error_pct", "passed", *RESOURCE_COLUMNS)},
+                "cpu_pct_per_kqps": _per_kqps(here["cpu_pct"], here["rate"]),
+                "read_iops_per_kqps": _per_kqps(here["read_iops"], here["rate"]),
+                "write_iops_per_kqps": _per_kqps(here["write_iops"], here["rate"]),
+            }
+            rows = (proxy_rows or {}).get(name)
+            if rows and here["started_at"] and here["ended_at"]:
+                entry["methods_p99_ms"] = method_p99(rows, parse_ts_to_epoch_s(here["started_at"]),
+                                                     parse_ts_to_epoch_s(here["ended_at"]), here["qps"])
+        out[name] = entry
+
+    baseline = endpoints[0]
+    base = out[baseline]
+    for name, entry in out.items():
+        here, there = entry["at_comparison"] or {}, base["at_comparison"] or {}
+        entry["vs_baseline"] = {
+            "max_qps_pct": _change_pct(entry["max_qps"], base["max_qps"]),
+            "p99_pct": _change_pct(here.get("p99_ms"), there.get("p99_ms")),
+            "cpu_pct_per_kqps_pct": _change_pct(here.get("cpu_pct_per_kqps"), there.get("cpu_pct_per_kqps")),
+            "read_iops_per_kqps_pct": _change_pct(here.get("read_iops_per_kqps"), there.get("read_iops_per_kqps")),
+        }
+
+    def best(key, lowest=True):
+        scored = [(e["at_comparison"][key], n) for n, e in out.items()
+                  if e["at_comparison"] and e["at_comparison"].get(key) is not None]
+        return (min(scored) if lowest else max(scored))[1] if len(scored) > 1 else None
+
+    return {
+        "mode": rounds[0]["mode"],
+        "baseline": baseline,
+        "comparison_qps": at_qps,
+        "endpoints": out,
+        "best": {
+            "capacity": max(out, key=lambda n: out[n]["max_qps"]) if len(out) > 1 else None,
+            "p99": best("p99_ms"),
+            "cpu": best("cpu_pct_per_kqps"),
+        },
+    }
+
+
+def _parse_named_paths(values: Sequence[str]) -> dict[str, str]:
+    out = {}
+    for item in values or ():
+        name, sep, path = item.partition("=")
+        if not sep or not name:
+            raise ValueError(f"'{item}' is not name=path")
+        out[name] = path
+    return out
+
+
+def _cmd_round(args: argparse.Namespace) -> int:
+    slo = load_slo_spec(args.spec, Slo(args.p50_ms, args.p99_ms, args.error_pct)).default
+    resources = None
+    if args.started_at and args.ended_at:
+        resources = resource_window(args.resources, parse_ts_to_epoch_s(args.started_at),
+                                    parse_ts_to_epoch_s(args.ended_at))
+    row = summarize_round(read_report(args.report), args.endpoint, args.mode, args.level, args.qps, slo,
+                          resources=resources, started_at=args.started_at, ended_at=args.ended_at)
+    if args.csv:
+        append_csv(args.csv, row)
+    print(json.dumps(row))
+    return 0
+
+
+def _cmd_summary(args: argparse.Namespace) -> int:
+    proxy_rows = {}
+    for name, path in _parse_named_paths(args.proxy_csv).items():
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            proxy_rows[name] = list(read_proxy_sink(path))
+    result = summary(read_rounds(args.csv), proxy_rows)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps({"comparison_qps": result["comparison_qps"], "best": result.get("best"),
+                      "max_qps": {n: e["max_qps"] for n, e in result["endpoints"].items()}}))
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Side-by-side comparison of several node endpoints")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    rnd = sub.add_parser("round", help="check one endpoint's round against the SLO and append it")
+    rnd.add_argument("--report", required=True, help="vegeta report -type=json output of the round")
+    rnd.add_argument("--endpoint", required=True, help="endpoint name from the compare spec")
+    rnd.add_argument("--mode", default="interleaved", choices=("interleaved", "split"))
+    rnd.add_argument("--level", type=int, required=True, help="total target rate of the round")
+    rnd.add_argument("--qps", type=int, required=True, help="this endpoint's target rate")
+    rnd.add_argument("--started-at", default="", help="round start (monitor timestamp format)")
+    rnd.add_argument("--ended-at", default="", help="round end (monitor timestamp format)")
+    rnd.add_argument("--resources", help="the endpoint's resource sampler CSV")
+    rnd.add_argument("--csv", help="results CSV to append to")
+    rnd.add_argument("--spec", help="SLO spec (JSON); its default thresholds apply")
+    rnd.add_argument("--p50-ms", type=float, default=0.0, help="default p50 bound (ms, 0 = unchecked)")
+    rnd.add_argument("--p99-ms", type=float, default=0.0, help="default p99 bound (ms, 0 = unchecked)")
+    rnd.add_argument("--error-pct", type=float, default=0.0, help="default error bound (%%, 0 = unchecked)")
+    rnd.set_defaults(func=_cmd_round)
+
+    smr = sub.add_parser("summary", help="per-endpoint comparison as JSON")
+    smr.add_argument("--csv", required=True, help="results CSV")
+    smr.add_argument("--proxy-csv", action="append", default=[],
+                     help="name=path of an endpoint's proxy sink, for per-method p99 (repeatable)")
+    smr.add_argument("--output", help="write the JSON here as well")
+    smr.set_defaults(func=_cmd_summary)
+
+    args = ap.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
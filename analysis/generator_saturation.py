@@ -0,0 +1,192 @@
+"""
+Load-generator saturation check for one QPS round.
+
+When Vegeta cannot keep up, it sends fewer requests than `-rate` asks for,
+requests leave later than their slot in the schedule, and the time spent
+queued on the client is added to the measured latency. Without this check
+the framework would blame the node for all of that.
+
+From the round's raw results (`vegeta encode -to json`, one line per
+request) this computes:
+
+  * achieved rate = requests / duration, and its ratio to `-rate`
+  * send lag: how far each request start fell behind its slot
+    first_start + i / rate, the client-side wait (p50 / p99 / max)
+  * Vegeta CPU: (user + sys) / wall of the attack process, as a share of
+    the cores it may run on: the CPUs of --cpuset when Vegeta is pinned
+    (CPUSET_VEGETA), otherwise --cores (optional, single-process rounds only)
+
+A round is generator limited if the rate falls more than --tolerance short,
+the p99 send lag exceeds --lag-ms-max, or Vegeta CPU reaches --cpu-pct-max.
+
+    vegeta encode -to json < attack.bin | python3 analysis/generator_saturation.py \
+        --results - --qps 2000 --duration 60 --cpu-seconds 41.2 --wall-seconds 60.3 \
+        --cores 4 --csv generator_rounds.csv
+
+Appends one row to --csv (header on a new file) and prints one JSON line:
+    {"qps", "requests", "achieved_rate", "rate_ratio", "send_lag_p99_ms",
+     "vegeta_cpu_pct", "generator_limited": bool, "reasons": [...]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, Sequence, TextIO
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import percentile  # noqa: E402
+from analysis.steady_state import parse_rfc3339  # noqa: E402
+from monitoring.cpu_role_collector import parse_cpulist  # noqa: E402
+
+CSV_COLUMNS = ("qps", "requests", "achieved_rate", "rate_ratio", "send_lag_p50_ms",
+               "send_lag_p99_ms", "send_lag_max_ms", "vegeta_cpu_pct", "vegeta_cpu_cores",
+               "generator_limited", "reasons")
+
+
+@dataclass
+class GeneratorRound:
+    qps: int
+    requests: int = 0
+    achieved_rate: float = 0.0
+    rate_ratio: float = 0.0
+    send_lag_p50_ms: float = 0.0
+    send_lag_p99_ms: float = 0.0
+    send_lag_max_ms: float = 0.0
+    vegeta_cpu_pct: float | None = None
+    vegeta_cpu_cores: float | None = None
+    generator_limited: bool = False
+    reasons: list[str] = field(default_factory=list)
+
+
+def read_starts(lines: Iterable[str]) -> list[float]:
+    """Sorted request start times (epoch seconds) of one JSON result stream."""
+    starts = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            starts.append(parse_rfc3339(json.loads(line)["timestamp"]))
+        except (KeyError, ValueError, TypeError):
+            continue
+    starts.sort()
+    return starts
+
+
+def send_lags_ms(starts: Sequence[float], rate: float) -> list[float]:
+    """Lag of each start behind its slot in a constant-rate schedule, sorted."""
+    if not starts or rate <= 0:
+        return []
+    first = starts[0]
+    return sorted(max(0.0, (s - (first + i / rate)) * 1000.0) for i, s in enumerate(starts))
+
+
+def evaluate(starts: Sequence[float], qps: int, duration_s: float, *,
+             cpu_seconds: float | None = None, wall_seconds: float | None = None,
+             cores: int = 1, tolerance: float = 0.05, lag_ms_max: float = 100.0,
+             cpu_pct_max: float = 90.0) -> GeneratorRound:
+    result = GeneratorRound(qps=qps, requests=len(starts))
+    result.achieved_rate = len(starts) / duration_s if duration_s > 0 else 0.0
+    result.rate_ratio = result.achieved_rate / qps if qps > 0 else 0.0
+    lags = send_lags_ms(starts, qps)
+    result.send_lag_p50_ms = percentile(lags, 50)
+    result.send_lag_p99_ms = percentile(lags, 99)
+    result.send_lag_max_ms = lags[-1] if lags else 0.0
+    if cpu_seconds is not None and wall_seconds:
+        result.vegeta_cpu_cores = cpu_seconds / wall_seconds
+        result.vegeta_cpu_pct = result.vegeta_cpu_cores * 100.0 / max(1, cores)
+
+    if result.rate_ratio < 1.0 - tolerance:
+        result.reasons.append(f"rate {result.achieved_rate:.0f}/{qps}")
+    if result.send_lag_p99_ms > lag_ms_max:
+        result.reasons.append(f"send_lag_p99 {result.send_lag_p99_ms:.0f}ms")
+    if result.vegeta_cpu_pct is not None and result.vegeta_cpu_pct >= cpu_pct_max:
+        result.reasons.append(f"vegeta_cpu {result.vegeta_cpu_pct:.0f}%")
+    result.generator_limited = bool(result.reasons)
+    return result
+
+
+def append_csv(path: str, result: GeneratorRound) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerow([result.qps, result.requests, f"{result.achieved_rate:.2f}",
+                         f"{result.rate_ratio:.4f}", f"{result.send_lag_p50_ms:.1f}",
+                         f"{result.send_lag_p99_ms:.1f}", f"{result.send_lag_max_ms:.1f}",
+                         "" if result.vegeta_cpu_pct is None else f"{result.vegeta_cpu_pct:.1f}",
+                         "" if result.vegeta_cpu_cores is None else f"{result.vegeta_cpu_cores:.2f}",
+                         str(result.generator_limited).lower(), ";".join(result.reasons)])
+
+
+def load_limited_qps(path: str | None) -> set[int]:
+    """QPS levels flagged generator limited in a generator_rounds CSV."""
+    if not path or not os.path.exists(path):
+        return set()
+    limited = set()
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                if row.get("generator_limited") == "true":
+                    limited.add(int(row["qps"]))
+            except (KeyError, ValueError):
+                continue
+    return limited
+
+
+def _open_results(path: str) -> TextIO:
+    return sys.stdin if path == "-" else open(path)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Load-generator saturation check for one Vegeta round")
+    ap.add_argument("--results", required=True, help="JSON result stream, '-' for stdin")
+    ap.add_argument("--qps", type=int, required=True, help="requested -rate")
+    ap.add_argument("--duration", type=float, required=True, help="round duration (s)")
+    ap.add_argument("--cpu-seconds", type=float, help="user + sys CPU time of the attack process")
+    ap.add_argument("--wall-seconds", type=float, help="wall time of the attack process")
+    ap.add_argument("--cores", type=int, default=1, help="cores Vegeta may run on")
+    ap.add_argument("--cpuset", help="cpulist Vegeta is pinned to (CPUSET_VEGETA); overrides --cores")
+    ap.add_argument("--tolerance", type=float, default=0.05,
+                    help="max relative shortfall of achieved vs requested rate")
+    ap.add_argument("--lag-ms-max", type=float, default=100.0, help="max p99 send lag (ms)")
+    ap.add_argument("--cpu-pct-max", type=float, default=90.0,
+                    help="Vegeta CPU share of its cores that counts as saturated")
+    ap.add_argument("--csv", help="per-round CSV to append to")
+    args = ap.parse_args(argv)
+
+    try:
+        f = _open_results(args.results)
+    except OSError as e:
+        print(f"❌ Cannot read results: {e}", file=sys.stderr)
+        return 1
+    cores = args.cores
+    if args.cpuset:
+        try:
+            cores = len(parse_cpulist(args.cpuset)) or cores
+        except ValueError as e:
+            print(f"⚠️  Ignoring --cpuset {args.cpuset!r}: {e}", file=sys.stderr)
+    with f:
+        starts = read_starts(f)
+    result = evaluate(starts, args.qps, args.duration, cpu_seconds=args.cpu_seconds,
+                      wall_seconds=args.wall_seconds, cores=cores, tolerance=args.tolerance,
+                      lag_ms_max=args.lag_ms_max, cpu_pct_max=args.cpu_pct_max)
+    if args.csv:
+        append_csv(args.csv, result)
+    summary = asdict(result)
+    for key in ("achieved_rate", "rate_ratio", "send_lag_p50_ms", "send_lag_p99_ms", "send_lag_max_ms"):
+        summary[key] = round(summary[key], 4 if key == "rate_ratio" else 2)
+    print(json.dumps(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Per-round throughput and latency for open-loop and closed-loop rounds.
+
+Open-loop rounds (the QPS ladder) send at a fixed -rate whatever the node
+does. Closed-loop rounds keep a fixed number of requests in flight: each of
+N Vegeta workers (`-rate=0 -max-workers=N`) sends its next request when the
+previous response arrives, like a client pool. Throughput is then an output,
+and capacity planning reads latency against it for both curves.
+
+Measured latency hides the requests a stalled client never sent
+(coordinated omission). From the round's raw results (`vegeta encode -to
+json`) this reports raw and corrected latency against the intended schedule:
+
+  * open loop: the schedule is first_start + i / rate, so a request that
+    left late also waited for its slot: corrected = latency + send lag
+  * closed loop: each worker intends to send every --intended-interval-ms
+    (default: the round's median latency, the pace a worker keeps while the
+    node does not stall). As in HdrHistogram's expected-interval correction,
+    a response that took V > interval also stands for the requests due
+    during the stall, with latencies V - interval, V - 2 * interval, ...
+
+    vegeta encode -to json < attack.bin | python3 analysis/load_curve.py \
+        --results - --model closed --concurrency 64 --duration 60 \
+        --csv load_curve.csv
+
+Appends one row to --csv (header on a new file) and prints it as one JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.generator_saturation import _open_results  # noqa: E402
+from analysis.per_method_attribution import percentile  # noqa: E402
+from analysis.steady_state import parse_rfc3339  # noqa: E402
+
+CSV_COLUMNS = ("load_model", "qps", "concurrency", "requests", "success_pct", "achieved_rate",
+               "throughput", "p50_ms", "p99_ms", "max_ms", "intended_interval_ms",
+               "corrected_p50_ms", "corrected_p99_ms", "corrected_max_ms")
+
+MODELS = ("open", "closed")
+
+
+@dataclass
+class Sample:
+    start_s: float
+    latency_ms: float
+    ok: bool
+
+
+def read_results(lines: Iterable[str]) -> list[Sample]:
+    """Results of one JSON result stream, sorted by start time."""
+    samples = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            r = json.loads(line)
+            samples.append(Sample(parse_rfc3339(r["timestamp"]), float(r.get("latency", 0)) / 1e6,
+                                  200 <= int(r.get("code", 0)) < 400 and not r.get("error")))
+        except (KeyError, ValueError, TypeError):
+            continue
+    samples.sort(key=lambda s: s.start_s)
+    return samples
+
+
+def open_loop_corrected(samples: Sequence[Sample], rate: float) -> list[float]:
+    """Latency measured from each request's slot in the -rate schedule, sorted."""
+    if not samples or rate <= 0:
+        return []
+    first = samples[0].start_s
+    return sorted(s.latency_ms + max(0.0, (s.start_s - (first + i / rate)) * 1000.0)
+                  for i, s in enumerate(samples))
+
+
+def closed_loop_corrected_percentile(latencies_ms: Sequence[float], interval_ms: float, pct: float) -> float:
+    """Percentile of the latencies plus the values V - k * interval (k >= 1, value >= interval)
+    each V > interval stands for, without materializing them."""
+    values = np.asarray(latencies_ms, dtype=float)
+    if not values.size:
+        return 0.0
+    if interval_ms <= 0:
+        return percentile(np.sort(values), pct)
+    extra = np.maximum(0, np.floor(values / interval_ms) - 1)     # synthetic values per sample
+    total = int(values.size + extra.sum())
+
+    def count_le(x: float) -> float:
+        # samples <= x count fully; above x only their synthetic values
+        # V - k * interval <= x, i.e. k >= (V - x) / interval
+        above = values > x
+        k_min = np.ceil((values[above] - x) / interval_ms)
+        return float((~above).sum() + extra[~above].sum() + np.maximum(0, extra[above] - k_min + 1).sum())
+
+    def value_at(index: int) -> float:
+        # smallest x with more than index values <= x
+        lo, hi = 0.0, float(values.max())
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            if count_le(mid) > index:
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    # interpolated between the two closest ranks, as percentile()
+    position = pct / 100.0 * (total - 1)
+    below = int(position)
+    low = value_at(below)
+    if position == below:
+        return low
+    return low + (value_at(min(below + 1, total - 1)) - low) * (position - below)
+
+
+def summarize(samples: Sequence[Sample], model: str, duration_s: float, *, qps: int = 0,
+              concurrency: int = 0, intended_interval_ms: float = 0.0) -> dict:
+    """One CSV row for a round."""
+    latencies = sorted(s.latency_ms for s in samples)
+    ok = sum(1 for s in samples if s.ok)
+    row = {
+        "load_model": model,
+        "qps": qps,
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "success_pct": ok * 100.0 / len(samples) if samples else None,
+        "achieved_rate": len(samples) / duration_s if duration_s > 0 else 0.0,
+        "throughput": ok / duration_s if duration_s > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) if samples else None,
+        "p99_ms": percentile(latencies, 99) if samples else None,
+        "max_ms": latencies[-1] if samples else None,
+        "intended_interval_ms": None,
+        "corrected_p50_ms": None,
+        "corrected_p99_ms": None,
+        "corrected_max_ms": None,
+    }
+    if not samples:
+        return row
+    if model == "open":
+        corrected = open_loop_corrected(samples, qps)
+        if corrected:
+            row["intended_interval_ms"] = 1000.0 / qps
+            row["corrected_p50_ms"] = percentile(corrected, 50)
+            row["corrected_p99_ms"] = percentile(corrected, 99)
+            row["corrected_max_ms"] = corrected[-1]
+    else:
+        interval = intended_interval_ms if intended_interval_ms > 0 else percentile(latencies, 50)
+        row["intended_interval_ms"] = interval
+        row["corrected_p50_ms"] = closed_loop_corrected_percentile(latencies, interval, 50)
+        row["corrected_p99_ms"] = closed_loop_corrected_percentile(latencies, interval, 99)
+        # the largest synthetic value is below its own sample
+        row["corrected_max_ms"] = latencies[-1]
+    return row
+
+
+def append_csv(path: str, row: dict) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerow(["" if row.get(k) is None else
+                         round(row[k], 3) if isinstance(row[k], float) else row[k]
+                         for k in CSV_COLUMNS])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Throughput and coordinated-omission-corrected latency of one round")
+    ap.add_argument("--results", required=True, help="JSON result stream, '-' for stdin")
+    ap.add_argument("--model", choices=MODELS, required=True, help="open (fixed -rate) or closed (fixed in-flight)")
+    ap.add_argument("--duration", type=float, required=True, help="round duration (s)")
+    ap.add_argument("--qps", type=int, default=0, help="open loop: requested -rate")
+    ap.add_argument("--concurrency", type=int, default=0, help="closed loop: requests in flight")
+    ap.add_argument("--intended-interval-ms", type=float, default=0.0,
+                    help="closed loop: per-worker send interval of the intended schedule (0 = median latency)")
+    ap.add_argument("--csv", help="per-round CSV to append to")
+    args = ap.parse_args(argv)
+    if args.model == "open" and args.qps <= 0:
+        print("❌ --model open needs --qps", file=sys.stderr)
+        return 1
+    if args.model == "closed" and args.concurrency <= 0:
+        print("❌ --model closed needs --concurrency", file=sys.stderr)
+        return 1
+
+    try:
+        f = _open_results(args.results)
+    except OSError as e:
+        print(f"❌ Cannot read results: {e}", file=sys.stderr)
+        return 1
+    with f:
+        samples = read_results(f)
+    row = summarize(samples, args.model, args.duration, qps=args.qps, concurrency=args.concurrency,
+                    intended_interval_ms=args.intended_interval_ms)
+    if args.csv:
+        append_csv(args.csv, row)
+    print(json.dumps({k: round(v, 3) if isinstance(v, float) else v for k, v in row.items()}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Per-method marginal resource cost by non-negative least squares.
+
+compute_per_method_resource (per_method_attribution.py) splits each second's
+CPU by request share, so a cheap method sent often is charged more than an
+expensive one sent rarely. This estimates what one call of each method
+actually costs. For every monitor sample t and resource r:
+
+    r(t) = baseline_r + sum_m cost_{m,r} * rate_m(t) + e(t)
+
+rate_m(t) is the proxied call rate of method m over [t, next sample), the
+same left-closed window as the attribution module. baseline_r is what the
+node uses without RPC load (block import, gossip, compaction) and
+cost_{m,r} >= 0 the marginal cost of one call; both are fitted with
+scipy.optimize.nnls on [rates | 1]. Resources come from the unified
+monitor CSV:
+
+    cpu_pct      cpu_usage
+    disk_reads   sum of the data_*_r_s / accounts_*_r_s columns
+    net_kb       net_total_mbps * 125 (KB/s)
+
+Only samples between the first and the last proxied call are used. Bounds
+are 95% percentile intervals from a seeded moving-block bootstrap over
+samples (blocks keep the autocorrelation of neighbouring seconds). R^2 and
+the residual RMSE per resource say how much of it RPC load explains.
+
+A ladder that sends the same method mix every round moves all rate columns
+together, and then the split between methods is not identifiable: the fit
+is flagged collinear when the condition number of the column-scaled design
+exceeds 30, and its intervals come out wide. Single-method rounds fix that.
+
+Costs are per 1000 calls: CPU %-seconds, disk reads and network KB.
+
+    python3 analysis/method_cost.py --proxy-csv logs/proxy_method.csv \
+        --monitor-csv logs/performance_latest.csv --output method_cost.json
+
+Writes the estimate to --output and prints it without the methods as one
+JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+from scipy.optimize import nnls
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import (  # noqa: E402
+    ProxyAggregate,
+    ProxySinkRow,
+    parse_ts_to_epoch_s,
+    read_proxy_sink,
+)
+
+RESOURCES = ("cpu_pct", "disk_reads", "net_kb")
+COLLINEAR_CONDITION = 30.0
+_DISK_READ_RE = re.compile(r"^(data|accounts)_.+_r_s$")
+
+
+@dataclass
+class ResourceSample:
+    timestamp_s: int
+    cpu_pct: float
+    disk_reads: float | None    # reads/s, None without iostat columns
+    net_kb: float | None        # KB/s, None without network columns
+
+
+def _float(value: str | None) -> float:
+    try:
+        return float(value or 0)
+    except ValueError:
+        return 0.0
+
+
+def read_resource_samples(path: str | Path, timestamp_col: str = "timestamp") -> list[ResourceSample]:
+    """Monitor samples by time, one per timestamp (the last one wins)."""
+    samples: dict[int, ResourceSample] = {}
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        header = reader.fieldnames or []
+        disk_cols = [c for c in header if _DISK_READ_RE.match(c)]
+        has_net = "net_total_mbps" in header
+        for row in reader:
+            try:
+                ts = parse_ts_to_epoch_s(row[timestamp_col])
+            except (KeyError, ValueError):
+                continue
+            samples[ts] = ResourceSample(
+                timestamp_s=ts,
+                cpu_pct=_float(row.get("cpu_usage")),
+                disk_reads=sum(_float(row.get(c)) for c in disk_cols) if disk_cols else None,
+                net_kb=_float(row.get("net_total_mbps")) * 125 if has_net else None,
+            )
+    return [samples[ts] for ts in sorted(samples)]
+
+
+def call_rates(rows: Iterable[ProxySinkRow], samples: Sequence[ResourceSample]
+               ) -> tuple[list[str], dict[str, int], np.ndarray, list[ResourceSample]]:
+    """(methods, calls per method, per-sample call rates, samples used).
+
+    Sample i covers [t_i, t_{i+1}); the last one the median interval. Samples
+    after a monitoring gap of more than three intervals are dropped.
+    """
+    counts: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    totals: dict[str, int] = defaultdict(int)
+    for r in rows:
+        if isinstance(r, ProxyAggregate):
+            ts, n = r.timestamp_s, r.count
+        else:
+            ts, n = r.timestamp_ns // 1_000_000_000, 1
+        counts[ts][r.method_name] += n
+        totals[r.method_name] += n
+    if not counts:
+        return [], {}, np.zeros((0, 0)), []
+    first, last = min(counts), max(counts)
+    window = [s for s in samples if first <= s.timestamp_s <= last]
+    if len(window) < 2:
+        return [], {}, np.zeros((0, 0)), []
+
+    methods = sorted(totals, key=lambda m: (-totals[m], m))
+    column = {m: j for j, m in enumerate(methods)}
+    starts = np.array([s.timestamp_s for s in window])
+    step = float(np.median(np.diff(starts)))
+    ends = np.append(starts[1:], starts[-1] + step)
+    calls = np.zeros((len(window), len(methods)))
+    for ts, by_method in counts.items():
+        i = int(np.searchsorted(starts, ts, side="right")) - 1
+        if i < 0 or ts >= ends[i]:
+            continue
+        for method, n in by_method.items():
+            calls[i, column[method]] += n
+    lengths = ends - starts
+    keep = lengths <= 3 * step
+    rates = calls[keep] / lengths[keep, None]
+    return methods, dict(totals), rates, [s for s, k in zip(window, keep) if k]
+
+
+def fit(rates: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, float]:
+    """Per-call costs >= 0 and the baseline >= 0."""
+    design = np.hstack([rates, np.ones((len(rates), 1))])
+    solution, _ = nnls(design, y)
+    return solution[:-1], float(solution[-1])
+
+
+def condition_number(rates: np.ndarray) -> float:
+    """Condition number of [rates | 1] with columns scaled to unit length."""
+    design = np.hstack([rates, np.ones((len(rates), 1))])
+    norms = np.linalg.norm(design, axis=0)
+    if np.any(norms == 0):
+        return math.inf
+    return float(np.linalg.cond(design / norms))
+
+
+def _block_indices(rng: np.random.Generator, n: int, block: int) -> np.ndarray:
+    block = max(1, min(block, n))
+    starts = rng.integers(0, n - block + 1, math.ceil(n / block))
+    return np.concatenate([np.arange(s, s + block) for s in starts])[:n]
+
+
+def _interval(values: Sequence[float]) -> list[float] | None:
+    return [float(np.percentile(values, 2.5)), float(np.percentile(values, 97.5))] if len(values) else None
+
+
+def estimate(rows: Iterable[ProxySinkRow], samples: Sequence[ResourceSample], *,
+             iterations: int = 200, seed: int = 42, block: int = 10) -> dict:
+    """Baseline, per-1k-call cost with bounds and fit quality for every resource."""
+    methods, totals, rates, used = call_rates(rows, samples)
+    result: dict = {"samples_used": len(used), "fitted": False}
+    if len(used) < max(10, len(methods) + 2):
+        result["reason"] = f"{len(used)} monitor sample(s) under load for {len(methods)} method(s)"
+        result["methods"] = []
+        return result
+    resources = [r for r in RESOURCES if all(getattr(s, r) is not None for s in used)]
+    cond = condition_number(rates)
+    result.update({
+        "fitted": True,
+        "interval_s": float(np.median(np.diff([s.timestamp_s for s in used]))),
+        "resources": resources,
+        "condition_number": None if math.isinf(cond) else cond,
+        "collinear": bool(cond > COLLINEAR_CONDITION),
+        "baseline": {},
+        "fit": {},
+    })
+
+    rng = np.random.default_rng(seed)
+    resamples = [_block_indices(rng, len(used), block) for _ in range(iterations)]
+    costs: dict[str, np.ndarray] = {}
+    cost_ci: dict[str, list] = {}
+    for resource in resources:
+        y = np.array([getattr(s, resource) for s in used])
+        coef, base = fit(rates, y)
+        residual = y - rates @ coef - base
+        ss_tot = float(np.sum((y - y.mean()) ** 2))
+        boot = [fit(rates[idx], y[idx]) for idx in resamples]
+        costs[resource] = coef * 1000
+        cost_ci[resource] = [_interval([b[0][j] * 1000 for b in boot]) for j in range(len(methods))]
+        result["baseline"][resource] = {"value": base, "ci": _interval([b[1] for b in boot])}
+        result["fit"][resource] = {
+            "mean": float(y.mean()),
+            "r2": 1 - float(np.sum(residual ** 2)) / ss_tot if ss_tot > 0 else 1.0,
+            "rmse": float(np.sqrt(np.mean(residual ** 2))),
+            "rpc_share": 1 - base / float(y.mean()) if y.mean() > 0 else 0.0,
+        }
+    result["methods"] = []
+    for j, method in enumerate(methods):
+        entry = {"method": method, "calls": totals[method]}
+        for resource in resources:
+            entry[resource] = {"per_kcall": float(costs[resource][j]), "ci": cost_ci[resource][j]}
+        result["methods"].append(entry)
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Fit per-method marginal CPU, disk read and network cost")
+    ap.add_argument("--proxy-csv", required=True, help="proxy sink CSV, raw or aggregate")
+    ap.add_argument("--monitor-csv", required=True, help="unified monitor CSV")
+    ap.add_argument("--iterations", type=int, default=200, help="bootstrap resamples")
+    ap.add_argument("--block", type=int, default=10, help="bootstrap block length in monitor samples")
+    ap.add_argument("--output", help="write the estimate here")
+    args = ap.parse_args(argv)
+
+    for path in (args.proxy_csv, args.monitor_csv):
+        if not os.path.exists(path):
+            print(f"❌ Not found: {path}", file=sys.stderr)
+            return 1
+    result = estimate(read_proxy_sink(args.proxy_csv), read_resource_samples(args.monitor_csv),
+                      iterations=args.iterations, block=args.block)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps({k: v for k, v in result.items() if k != "methods"}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""
+Per-method isolation profiles and capacity prediction for arbitrary mixes.
+
+A mixed-mode ladder measures the capacity of one blend. lib/method_profile.sh
+(WORKLOAD_TYPE=method_profile, --method-profile) instead runs every method of
+rpc_methods.mixed_weighted alone: it starts at METHOD_PROFILE_START_QPS,
+doubles while the round meets the SLO and then bisects between the last
+passing and first failing rate. Then the configured mix gets the same
+treatment as a validation ladder. A round passes when its Vegeta p50/p99
+and error % meet the method's SLO. Thresholds come from SLO_SPEC and
+SLO_P50_MS / SLO_P99_MS / SLO_ERROR_PCT, as for --slo-search; the mix uses
+the spec's default. The node CPU of each round is averaged from the unified
+monitor CSV.
+
+Prediction assumes the methods share one bottleneck and their costs add up:
+a call of method m uses 1/C_m of the node, where C_m is its isolated
+capacity. For weights w (normalised to 1) the mix saturates at
+
+    X = 1 / sum_m (w_m / C_m)
+
+and method m takes the share (w_m / C_m) * X of the node. The method with
+the largest share hits the wall first when its weight grows. The lower
+bound uses the last passing rates and the upper bound the first failing
+ones. CPU cost per 1k calls/s is the slope of round CPU over achieved rate.
+
+Commands:
+- round    one round's Vegeta report and monitor window checked against the
+           SLO; appends a row to the profile CSV (the --slo-search rounds
+           columns plus cpu_pct and the round window)
+- next     next rate to run for one method, or nothing once it is resolved
+- predict  profiles, the predicted capacity of --weights, what-if variants
+           and the check against the measured mix
+
+    python3 analysis/method_profile.py predict --csv method_profile.csv \
+        --weights eth_call=6,eth_getLogs=1 --what-if eth_getLogs=2 \
+        --output method_profile.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.batch_sweep import window_average  # noqa: E402
+from analysis.per_method_attribution import MonitorRecord, parse_ts_to_epoch_s, read_monitor_csv  # noqa: E402
+from analysis.slo_capacity import Slo, capacity, load_slo_spec  # noqa: E402
+from analysis.sweep_matrix import read_report  # noqa: E402
+
+MIX = "mix"
+CSV_COLUMNS = ("qps", "method", "calls", "rate", "p50_ms", "p99_ms", "error_pct", "passed", "violations",
+               "cpu_pct", "started_at", "ended_at")
+
+
+def summarize_round(report: dict | None, method: str, qps: int, slo: Slo, *,
+                    monitor: Sequence[MonitorRecord] = (), started_at: str = "", ended_at: str = "") -> dict:
+    """One CSV row; report is sweep_matrix.read_report() output, None for a failed attack."""
+    report = report or {}
+    calls = report.get("requests", 0)
+    error_pct = 100.0 - report["success_pct"] if calls else 100.0
+    p50, p99 = report.get("p50_ms", 0.0), report.get("p99_ms", 0.0)
+    violations = slo.violations(p50, p99, error_pct) if calls else ["errors"]
+    cpu = None
+    if monitor and started_at and ended_at:
+        cpu, _ = window_average(monitor, parse_ts_to_epoch_s(started_at), parse_ts_to_epoch_s(ended_at))
+    return {"qps": qps, "method": method, "calls": calls, "rate": report.get("throughput", 0.0),
+            "p50_ms": p50, "p99_ms": p99, "error_pct": error_pct, "passed": not violations,
+            "violations": "+".join(violations), "cpu_pct": cpu,
+            "started_at": started_at, "ended_at": ended_at}
+
+
+def append_csv(path: str, row: dict) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        writer.writerow(["" if row[k] is None else round(row[k], 3) if isinstance(row[k], float) else
+                         str(row[k]).lower() if isinstance(row[k], bool) else row[k]
+                         for k in CSV_COLUMNS])
+
+
+def read_rounds(path: str | Path) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    rows = []
+    with open(path, newline="") as f:
+        for r in csv.DictReader(f):
+            rows.append({"qps": int(r["qps"]), "method": r["method"], "calls": int(r["calls"]),
+                         "rate": float(r["rate"]), "p50_ms": float(r["p50_ms"]), "p99_ms": float(r["p99_ms"]),
+                         "error_pct": float(r["error_pct"]), "passed": r["passed"] == "true",
+                         "violations": r["violations"], "cpu_pct": float(r["cpu_pct"]) if r["cpu_pct"] else None,
+                         "started_at": r["started_at"], "ended_at": r["ended_at"]})
+    return rows
+
+
+def next_qps(rounds: Sequence[dict], method: str, start: int, max_qps: int,
+             resolution_pct: float = 10.0, max_rounds: int = 8) -> int | None:
+    """Double until the first failing rate, then bisect to within resolution_pct of it."""
+    mine = [r for r in rounds if r["method"] == method]
+    if not mine:
+        return start
+    if len(mine) >= max_rounds:
+        return None
+    entry = capacity(mine)["methods"][method]
+    if not entry["bounded"]:
+        top = max(r["qps"] for r in mine)
+        return None if top >= max_qps else min(top * 2, max_qps)
+    lo, hi = entry["max_qps"], entry["first_failing_qps"]
+    mid = (lo + hi) // 2
+    if hi - lo <= max(1.0, hi * resolution_pct / 100) or mid <= 0 or mid in {r["qps"] for r in mine}:
+        return None
+    return mid
+
+
+def _cpu_line(rows: Sequence[dict]) -> tuple[float | None, float | None]:
+    """(baseline CPU %, CPU % per 1k calls/s) fitted over rounds at distinct rates."""
+    points = [(r["rate"], r["cpu_pct"]) for r in rows if r["cpu_pct"] is not None and r["rate"] > 0]
+    if len({round(x) for x, _ in points}) < 2:
+        return None, None
+    slope, intercept = np.polyfit([x for x, _ in points], [y for _, y in points], 1)
+    return float(max(intercept, 0.0)), float(max(slope, 0.0) * 1000)
+
+
+def profiles(rounds: Sequence[dict]) -> dict[str, dict]:
+    """Isolated SLO capacity, latency at capacity and CPU cost per method (and the mix)."""
+    caps = capacity(rounds)["methods"]
+    out = {}
+    for method, entry in caps.items():
+        rows = sorted((r for r in rounds if r["method"] == method), key=lambda r: r["qps"])
+        baseline, cpu_cost = _cpu_line([r for r in rows if r["passed"]])
+        out[method] = {
+            "max_qps": entry["max_qps"],
+            "first_failing_qps": entry["first_failing_qps"],
+            "failed_on": entry["failed_on"],
+            "p50_ms": entry["p50_ms"],
+            "p99_ms": entry["p99_ms"],
+            "cpu_baseline_pct": baseline,
+            "cpu_pct_per_kcps": cpu_cost,
+            "curve": [{k: r[k] for k in ("qps", "rate", "p50_ms", "p99_ms", "error_pct", "passed", "cpu_pct")}
+                      for r in rows],
+        }
+    return out
+
+
+def parse_weights(value: str) -> dict[str, float]:
+    """'eth_call=6,eth_getLogs=1' -> {method: weight}."""
+    weights = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        method, sep, weight = item.rpartition("=")
+        if not sep or not method:
+            raise ValueError(f"weight '{item}' is not method=weight")
+        weights[method] = float(weight)
+        if weights[method] < 0:
+            raise ValueError(f"weight of {method} is negative")
+    return weights
+
+
+def predict(profile: dict[str, dict], weights: dict[str, float]) -> dict:
+    """Capacity of a weight vector from isolated profiles, with bounds and per-method shares."""
+    total = sum(weights.values())
+    missing = sorted(m for m, w in weights.items() if w > 0 and not profile.get(m, {}).get("max_qps"))
+    if total <= 0 or missing:
+        return {"predicted_qps": None, "missing": missing}
+    w = {m: v / total for m, v in weights.items() if v > 0}
+    load = {m: w[m] / profile[m]["max_qps"] for m in w}
+    x = 1 / sum(load.values())
+    upper = None
+    if all(profile[m]["first_failing_qps"] for m in w):
+        upper = 1 / sum(w[m] / profile[m]["first_failing_qps"] for m in w)
+    shares = {m: load[m] * x for m in w}
+    cpu = None
+    if all(profile[m]["cpu_pct_per_kcps"] is not None for m in w):
+        baseline = float(np.median([profile[m]["cpu_baseline_pct"] for m in w]))
+        cpu = {"baseline_pct": baseline, "pct_per_kcps": sum(w[m] * profile[m]["cpu_pct_per_kcps"] for m in w)}
+        cpu["at_capacity_pct"] = baseline + x / 1000 * cpu["pct_per_kcps"]
+    return {
+        "weights": w,
+        "predicted_qps": x,
+        "predicted_qps_range": [x, upper],
+        "shares": shares,
+        "binding_method": max(shares, key=shares.get),
+        "cpu": cpu,
+        "missing": [],
+    }
+
+
+def what_if(profile: dict[str, dict], weights: dict[str, float], changes: dict[str, float] | None = None) -> list[dict]:
+    """Predicted capacity with one method's weight doubled each, plus any explicit change set."""
+    base = predict(profile, weights).get("predicted_qps")
+    scenarios = [(f"{m} x2", {**weights, m: weights[m] * 2}) for m in weights if weights[m] > 0]
+    if changes:
+        unknown = sorted(set(changes) - set(weights))
+        if unknown:
+            raise ValueError(f"what-if methods not in the mix: {', '.join(unknown)}")
+        label = ", ".join(f"{m} x{f:g}" for m, f in changes.items())
+        scenarios = [s for s in scenarios if s[0] != label]
+        scenarios.insert(0, (label, {**weights, **{m: weights[m] * f for m, f in changes.items()}}))
+    out = []
+    for label, scenario in scenarios:
+        result = predict(profile, scenario)
+        x = result["predicted_qps"]
+        out.append({"scenario": label, "predicted_qps": x,
+                    "change_pct": (x / base - 1) * 100 if x is not None and base else None,
+                    "binding_method": result.get("binding_method"), "missing": result["missing"]})
+    return out
+
+
+def validate(prediction: dict, mix: dict | None, mix_rounds: Sequence[dict]) -> dict | None:
+    """Predicted against measured mix capacity, and predicted against measured CPU per passing mix round."""
+    if mix is None or prediction.get("predicted_qps") is None:
+        return None
+    measured, first_fail = mix["max_qps"], mix["first_failing_qps"]
+    lo, hi = prediction["predicted_qps_range"]
+    cpu = prediction.get("cpu")
+    return {
+        "measured_qps": measured,
+        "measured_first_failing_qps": first_fail,
+        "error_pct": (prediction["predicted_qps"] / measured - 1) * 100 if measured else None,
+        # the predicted and measured brackets overlap
+        "consistent": (first_fail is None or lo < first_fail) and (hi is None or hi >= measured),
+        "cpu": [{"qps": r["qps"], "measured_pct": r["cpu_pct"],
+                 "predicted_pct": cpu["baseline_pct"] + r["rate"] / 1000 * cpu["pct_per_kcps"]}
+                for r in mix_rounds if r["passed"] and r["cpu_pct"] is not None] if cpu else [],
+    }
+
+
+def report(rounds: Sequence[dict], weights: dict[str, float], changes: dict[str, float] | None = None) -> dict:
+    profile = profiles(rounds)
+    mix = profile.pop(MIX, None)
+    prediction = predict(profile, weights)
+    return {
+        "methods": profile,
+        "mix": mix,
+        "prediction": prediction,
+        "what_if": what_if(profile, weights, changes),
+        "validation": validate(prediction, mix, [r for r in rounds if r["method"] == MIX]),
+    }
+
+
+def _cmd_round(args: argparse.Namespace) -> int:
+    default = Slo(args.p50_ms, args.p99_ms, args.error_pct)
+    spec = load_slo_spec(args.spec, default)
+    slo = spec.default if args.method == MIX else spec.for_method(args.method)
+    monitor: list[MonitorRecord] = []
+    if args.monitor and os.path.exists(args.monitor):
+        try:
+            monitor = list(read_monitor_csv(args.monitor, mem_col="mem_used"))
+        except (KeyError, ValueError) as e:
+            print(f"⚠️  Monitor CSV unreadable, no CPU for this round: {e}", file=sys.stderr)
+    row = summarize_round(read_report(args.report), args.method, args.qps, slo,
+                          monitor=monitor, started_at=args.started_at, ended_at=args.ended_at)
+    if args.csv:
+        append_csv(args.csv, row)
+    print(json.dumps(row))
+    return 0
+
+
+def _cmd_next(args: argparse.Namespace) -> int:
+    qps = next_qps(read_rounds(args.csv), args.method, args.start, args.max_qps, args.resolution, args.max_rounds)
+    if qps is not None:
+        print(qps)
+    return 0
+
+
+def _cmd_predict(args: argparse.Namespace) -> int:
+    result = report(read_rounds(args.csv), parse_weights(args.weights),
+                    parse_weights(args.what_if) if args.what_if else None)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps({"prediction": result["prediction"], "validation": result["validation"]}))
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-method isolation profiles and mix capacity prediction")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    rnd = sub.add_parser("round", help="check one isolation or mix round against the SLO")
+    rnd.add_argument("--report", required=True, help="vegeta report -type=json output of the round")
+    rnd.add_argument("--method", required=True, help=f"profiled method, or '{MIX}' for the configured mix")
+    rnd.add_argument("--qps", type=int, required=True, help="target rate of the round")
+    rnd.add_argument("--started-at", default="", help="round start (monitor timestamp format)")
+    rnd.add_argument("--ended-at", default="", help="round end (monitor timestamp format)")
+    rnd.add_argument("--monitor", help="unified monitor CSV (timestamp, cpu_usage)")
+    rnd.add_argument("--csv", help="profile CSV to append to")
+    rnd.add_argument("--spec", help="SLO spec (JSON); per-method thresholds over the defaults")
+    rnd.add_argument("--p50-ms", type=float, default=0.0, help="default p50 bound (ms, 0 = unchecked)")
+    rnd.add_argument("--p99-ms", type=float, default=0.0, help="default p99 bound (ms, 0 = unchecked)")
+    rnd.add_argument("--error-pct", type=float, default=0.0, help="default error bound (%%, 0 = unchecked)")
+    rnd.set_defaults(func=_cmd_round)
+
+    nxt = sub.add_parser("next", help="print the next rate to run for a method, if any")
+    nxt.add_argument("--csv", required=True, help="profile CSV")
+    nxt.add_argument("--method", required=True, help=f"profiled method, or '{MIX}'")
+    nxt.add_argument("--start", type=int, default=250, help="first rate")
+    nxt.add_argument("--max-qps", type=int, default=8000, help="stop doubling here")
+    nxt.add_argument("--resolution", type=float, default=10.0, help="stop bisecting within this %% of the failing rate")
+    nxt.add_argument("--max-rounds", type=int, default=8, help="rounds per method at most")
+    nxt.set_defaults(func=_cmd_next)
+
+    prd = sub.add_parser("predict", help="profiles, mix prediction, what-if variants and validation as JSON")
+    prd.add_argument("--csv", required=True, help="profile CSV")
+    prd.add_argument("--weights", required=True, help="mix weights, method=weight,...")
+    prd.add_argument("--what-if", help="weight factors to try, method=factor,...")
+    prd.add_argument("--output", help="write the JSON here as well")
+    prd.set_defaults(func=_cmd_predict)
+
+    args = ap.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Per-method saturation curves across QPS rounds.
+
+The per-method charts are per-second time series, so they do not show which
+method bends first as the ladder climbs. This groups the proxy sink rows by
+round instead: calls, achieved rate, p50/p99 and error % of every method in
+every round's measurement window (slo_capacity.round_rows), plus the total
+achieved rate of the round.
+
+Round windows come from ROUND_PHASES_CSV (measure_start..measure_end, warmup
+and cooldown excluded). Runs without it fall back to the unified monitor
+CSV: consecutive samples with the same current_qps > 0 form one round.
+
+A method degrades in the first round where, against its lowest round:
+- p99 exceeds p99_factor x the baseline p99 and grew by at least
+  min_delta_ms (sub-millisecond baselines do not trip on jitter);
+- or its error % exceeds error_pct;
+- or its achieved rate falls more than shortfall_pct short of the round's
+  target QPS scaled by the method's rate per target QPS in the lowest round
+  (calls queue up or time out).
+
+Methods are ranked by the total QPS of that round, earliest first; methods
+that never degraded come last, at the highest level they were tested.
+
+    python3 analysis/method_saturation.py --proxy-csv logs/proxy_method.csv \
+        --phases-csv logs/round_phases.csv --output method_saturation.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Sequence
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import ProxySinkRow, parse_ts_to_epoch_s, read_proxy_sink  # noqa: E402
+from analysis.slo_capacity import Slo, SloSpec, round_rows  # noqa: E402
+
+P99_FACTOR = 2.0
+MIN_DELTA_MS = 1.0
+ERROR_PCT = 1.0
+SHORTFALL_PCT = 10.0
+
+
+def read_phase_windows(path: str | Path) -> list[tuple[int, int, int]]:
+    """(qps, measure_start, measure_end) per round of a round phases CSV; a repeated level keeps its last window."""
+    windows: dict[int, tuple[int, int, int]] = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                qps, start, end = int(row["qps"]), int(row["measure_start"]), int(row["measure_end"])
+            except (KeyError, ValueError):
+                continue
+            if qps > 0 and end > start:
+                windows[qps] = (qps, start, end)
+    return [windows[q] for q in sorted(windows)]
+
+
+def monitor_windows(path: str | Path, qps_col: str = "current_qps",
+                    timestamp_col: str = "timestamp") -> list[tuple[int, int, int]]:
+    """Round windows from runs of monitor samples with the same current_qps > 0."""
+    samples = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                samples.append((parse_ts_to_epoch_s(row[timestamp_col]), int(float(row.get(qps_col) or 0))))
+            except (KeyError, ValueError):
+                continue
+    samples.sort()
+    windows: dict[int, tuple[int, int, int]] = {}
+    run_qps, run_start, last_ts = 0, 0, 0
+    for ts, qps in samples + [(None, 0)]:
+        if qps != run_qps or ts is None:
+            end = last_ts if ts is None else ts
+            if run_qps > 0 and end > run_start:
+                windows[run_qps] = (run_qps, run_start, end)
+            run_qps, run_start = qps, ts
+        last_ts = ts
+    return [windows[q] for q in sorted(windows)]
+
+
+def curves(rows: Iterable[ProxySinkRow], windows: Sequence[tuple[int, int, int]]) -> list[dict]:
+    """One row per round and method: the round_rows fields plus total_rate and share of the round."""
+    rows = list(rows)
+    unchecked = SloSpec(Slo(), {})
+    out = []
+    for qps, start, end in windows:
+        per_method = round_rows(rows, qps, start, end, unchecked)
+        total_calls = sum(r["calls"] for r in per_method)
+        total_rate = sum(r["rate"] for r in per_method)
+        for r in per_method:
+            out.append({
+                "qps": qps, "method": r["method"], "calls": r["calls"], "rate": r["rate"],
+                "total_rate": total_rate, "share": r["calls"] / total_calls,
+                "p50_ms": r["p50_ms"], "p99_ms": r["p99_ms"], "error_pct": r["error_pct"],
+            })
+    return out
+
+
+def knees(curve: Sequence[dict], *, p99_factor: float = P99_FACTOR, min_delta_ms: float = MIN_DELTA_MS,
+          error_pct: float = ERROR_PCT, shortfall_pct: float = SHORTFALL_PCT) -> list[dict]:
+    """First degraded round per method, ranked by the total QPS at which it degrades."""
+    by_method: dict[str, list[dict]] = {}
+    for r in curve:
+        by_method.setdefault(r["method"], []).append(r)
+    out = []
+    for method, rounds in by_method.items():
+        rounds = sorted(rounds, key=lambda r: r["qps"])
+        base = rounds[0]
+        degraded, last_good = None, None
+        for r in rounds:
+            reasons = []
+            if r["p99_ms"] > base["p99_ms"] * p99_factor and r["p99_ms"] - base["p99_ms"] >= min_delta_ms:
+                reasons.append("p99")
+            if r["error_pct"] > error_pct:
+                reasons.append("errors")
+            if r["rate"] < base["rate"] / base["qps"] * r["qps"] * (1 - shortfall_pct / 100):
+                reasons.append("throughput")
+            if reasons:
+                degraded = {**r, "reasons": reasons}
+                break
+            last_good = r
+        out.append({
+            "method": method,
+            "rounds": len(rounds),
+            "baseline_p99_ms": base["p99_ms"],
+            "degraded": degraded is not None,
+            "degraded_at_qps": degraded["qps"] if degraded else None,
+            "degraded_at_total_rate": degraded["total_rate"] if degraded else None,
+            "degraded_on": "+".join(degraded["reasons"]) if degraded else "",
+            "p99_at_knee_ms": degraded["p99_ms"] if degraded else None,
+            "last_good_qps": last_good["qps"] if last_good else None,
+            "max_tested_qps": rounds[-1]["qps"],
+        })
+    out.sort(key=lambda k: (not k["degraded"], k["degraded_at_qps"] or k["max_tested_qps"], k["method"]))
+    return out
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-method saturation curves and knees across QPS rounds")
+    ap.add_argument("--proxy-csv", required=True, help="proxy sink CSV, raw or aggregate")
+    ap.add_argument("--phases-csv", help="round phases CSV (measurement windows)")
+    ap.add_argument("--monitor-csv", help="unified monitor CSV, for rounds without a phases CSV")
+    ap.add_argument("--p99-factor", type=float, default=P99_FACTOR, help="p99 growth over the lowest round")
+    ap.add_argument("--error-pct", type=float, default=ERROR_PCT, help="error %% bound")
+    ap.add_argument("--output", help="write curves and knees here as JSON")
+    args = ap.parse_args(argv)
+
+    if args.phases_csv and os.path.exists(args.phases_csv):
+        windows = read_phase_windows(args.phases_csv)
+    elif args.monitor_csv and os.path.exists(args.monitor_csv):
+        windows = monitor_windows(args.monitor_csv)
+    else:
+        print("❌ Need --phases-csv or --monitor-csv for the round windows", file=sys.stderr)
+        return 1
+    if not os.path.exists(args.proxy_csv):
+        print(f"❌ Not found: {args.proxy_csv}", file=sys.stderr)
+        return 1
+    curve = curves(read_proxy_sink(args.proxy_csv), windows)
+    result = {"rounds": curve, "knees": knees(curve, p99_factor=args.p99_factor, error_pct=args.error_pct)}
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result["knees"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
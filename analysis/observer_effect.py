@@ -0,0 +1,219 @@
+"""
+Observer-effect A/B analysis: how much the monitoring stack costs the node.
+
+lib/observer_ab.sh runs matched Vegeta rounds with MONITORING_PROFILE set to
+full, minimal and off. The profile order rotates per repetition and QPS level
+so slow drift (page cache, compaction, thermal) spreads over all profiles.
+Each round leaves one Vegeta JSON report named
+
+    r<rep>_<profile>_<qps>qps.json
+
+This module pairs rounds by (rep, qps) and compares every profile against the
+"off" baseline:
+
+- success rate delta (percentage points) and p99 delta (ms), per QPS level
+- max sustained QPS delta, per repetition: the highest level meeting
+  SUCCESS_RATE_THRESHOLD and MAX_LATENCY_THRESHOLD, the same rule as
+  core/master_qps_executor.sh
+
+Each delta is the mean of paired differences with a two-sided Student-t
+confidence interval (default 95%). With one repetition the interval is
+undefined and reported as null.
+
+Outputs:
+- observer_effect.json   {"profiles", "qps_levels", "rounds", "deltas", ...}
+- observer_effect.md     human-readable summary table
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from scipy import stats
+
+PROFILES = ("full", "minimal", "off")
+BASELINE = "off"
+_ROUND_RE = re.compile(r"^r(?P<rep>\d+)_(?P<profile>[a-z]+)_(?P<qps>\d+)qps\.json$")
+
+
+@dataclass
+class Round:
+    rep: int
+    profile: str
+    qps: int
+    requests: int
+    success_pct: float
+    mean_ms: float
+    p99_ms: float
+    throughput: float
+
+
+@dataclass
+class Delta:
+    """Mean paired difference (profile - baseline) with its CI."""
+    metric: str
+    profile: str
+    qps: int | None         # None for per-repetition metrics (max QPS)
+    n: int
+    mean: float
+    ci_low: float | None
+    ci_high: float | None
+
+
+def read_round(path: str | Path) -> Round | None:
+    """Parse one Vegeta JSON report; None if the name or content does not fit."""
+    path = Path(path)
+    m = _ROUND_RE.match(path.name)
+    if not m:
+        return None
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    lat = data.get("latencies") or {}
+    return Round(
+        rep=int(m["rep"]),
+        profile=m["profile"],
+        qps=int(m["qps"]),
+        requests=int(data.get("requests", 0)),
+        success_pct=float(data.get("success", 0.0)) * 100.0,
+        mean_ms=float(lat.get("mean", 0)) / 1e6,
+        p99_ms=float(lat.get("99th", 0)) / 1e6,
+        throughput=float(data.get("throughput", 0.0)),
+    )
+
+
+def read_rounds(directory: str | Path) -> list[Round]:
+    rounds = [read_round(p) for p in sorted(Path(directory).glob("r*_*qps.json"))]
+    return [r for r in rounds if r is not None]
+
+
+def mean_ci(values: Sequence[float], confidence: float = 0.95) -> tuple[float, float | None, float | None]:
+    """Mean and two-sided Student-t interval; (mean, None, None) when n < 2."""
+    n = len(values)
+    if n == 0:
+        return (0.0, None, None)
+    mean = sum(values) / n
+    if n < 2:
+        return (mean, None, None)
+    sd = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+    half = stats.t.ppf(0.5 + confidence / 2, n - 1) * sd / math.sqrt(n)
+    return (mean, mean - half, mean + half)
+
+
+def max_sustained_qps(rounds: Iterable[Round], success_pct_min: float, latency_ms_max: float) -> int:
+    """Highest QPS level passing the executor's success-rate and mean-latency gate."""
+    passing = [r.qps for r in rounds if r.success_pct >= success_pct_min and r.mean_ms <= latency_ms_max]
+    return max(passing, default=0)
+
+
+def compute_deltas(
+    rounds: Sequence[Round],
+    success_pct_min: float = 95.0,
+    latency_ms_max: float = 1000.0,
+    confidence: float = 0.95,
+    baseline: str = BASELINE,
+) -> list[Delta]:
+    by_key = {(r.rep, r.profile, r.qps): r for r in rounds}
+    profiles = sorted({r.profile for r in rounds} - {baseline}, key=_profile_order)
+    levels = sorted({r.qps for r in rounds})
+    reps = sorted({r.rep for r in rounds})
+    deltas: list[Delta] = []
+
+    for profile in profiles:
+        for qps in levels:
+            pairs = [(by_key[(rep, profile, qps)], by_key[(rep, baseline, qps)]) for rep in reps
+                     if (rep, profile, qps) in by_key and (rep, baseline, qps) in by_key]
+            for metric, attr in (("success_pct", "success_pct"), ("p99_ms", "p99_ms")):
+                diffs = [getattr(a, attr) - getattr(b, attr) for a, b in pairs]
+                if diffs:
+                    deltas.append(Delta(metric, profile, qps, len(diffs), *mean_ci(diffs, confidence)))
+
+        diffs = []
+        for rep in reps:
+            mine = [r for r in rounds if r.rep == rep and r.profile == profile]
+            base = [r for r in rounds if r.rep == rep and r.profile == baseline]
+            if mine and base:
+                diffs.append(max_sustained_qps(mine, success_pct_min, latency_ms_max)
+                             - max_sustained_qps(base, success_pct_min, latency_ms_max))
+        if diffs:
+            deltas.append(Delta("max_qps", profile, None, len(diffs), *mean_ci(diffs, confidence)))
+    return deltas
+
+
+def _profile_order(profile: str) -> int:
+    return PROFILES.index(profile) if profile in PROFILES else len(PROFILES)
+
+
+def _fmt_ci(d: Delta, digits: int) -> str:
+    if d.ci_low is None:
+        return f"{d.mean:+.{digits}f} (n={d.n}, no CI)"
+    return f"{d.mean:+.{digits}f} [{d.ci_low:+.{digits}f}, {d.ci_high:+.{digits}f}] (n={d.n})"
+
+
+def render_markdown(deltas: Sequence[Delta], confidence: float) -> str:
+    lines = [
+        "# Monitoring observer effect",
+        "",
+        f"Paired differences against monitoring `{BASELINE}`; "
+        f"{confidence * 100:.0f}% Student-t confidence intervals.",
+        "",
+        "| Profile | QPS | Success rate Δ (pp) | p99 Δ (ms) |",
+        "|---|---|---|---|",
+    ]
+    index = {(d.metric, d.profile, d.qps): d for d in deltas}
+    for profile, qps in sorted({(d.profile, d.qps) for d in deltas if d.qps is not None},
+                               key=lambda k: (_profile_order(k[0]), k[1])):
+        sr = index.get(("success_pct", profile, qps))
+        p99 = index.get(("p99_ms", profile, qps))
+        lines.append(f"| {profile} | {qps} | {_fmt_ci(sr, 2) if sr else '-'} "
+                     f"| {_fmt_ci(p99, 3) if p99 else '-'} |")
+    lines += ["", "| Profile | Max sustained QPS Δ |", "|---|---|"]
+    for d in sorted((d for d in deltas if d.metric == "max_qps"), key=lambda d: _profile_order(d.profile)):
+        lines.append(f"| {d.profile} | {_fmt_ci(d, 0)} |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Summarize monitoring-profile A/B rounds")
+    ap.add_argument("--rounds-dir", required=True, help="directory of r<rep>_<profile>_<qps>qps.json reports")
+    ap.add_argument("--output", required=True, help="observer_effect.json path")
+    ap.add_argument("--markdown", help="optional Markdown summary path")
+    ap.add_argument("--success-threshold", type=float, default=95.0, help="min success rate (%%)")
+    ap.add_argument("--latency-threshold", type=float, default=1000.0, help="max mean latency (ms)")
+    ap.add_argument("--confidence", type=float, default=0.95)
+    args = ap.parse_args(argv)
+
+    rounds = read_rounds(args.rounds_dir)
+    if not any(r.profile == BASELINE for r in rounds):
+        print(f"❌ No '{BASELINE}' rounds found in {args.rounds_dir}", file=sys.stderr)
+        return 1
+    deltas = compute_deltas(rounds, args.success_threshold, args.latency_threshold, args.confidence)
+    payload = {
+        "baseline": BASELINE,
+        "confidence": args.confidence,
+        "profiles": sorted({r.profile for r in rounds}, key=_profile_order),
+        "qps_levels": sorted({r.qps for r in rounds}),
+        "repetitions": len({r.rep for r in rounds}),
+        "rounds": [asdict(r) for r in rounds],
+        "deltas": [asdict(d) for d in deltas],
+    }
+    with open(args.output, "w") as f:
+        json.dump(payload, f, indent=2)
+    markdown = render_markdown(deltas, args.confidence)
+    if args.markdown:
+        Path(args.markdown).write_text(markdown)
+    print(markdown)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,17 @@ Inputs:
 - proxy sink CSV. Current schema:
   timestamp_ns, method_name, protocol, request_id, batch_idx, status_code,
   transport_success, rpc_success, rpc_error_code, rpc_error_message,
-  latency_ms, upstream, client_addr
-  Legacy 9-column proxy CSVs are still accepted.
+  latency_ms, upstream, client_addr, latency_us
+  latency_us is preferred when present. Older CSVs carry only whole-ms
+  latency_ms, and legacy 9-column proxy CSVs are still accepted.
+  A JSON-RPC batch is split into one row per call (batch_idx 0..N-1) that
+  share the request's timestamp and latency, so every count below is in
+  calls, not HTTP requests.
+- proxy aggregate sink CSV (PROXY_SINK_FORMAT=aggregate), one row per
+  (second, method, protocol, status class):
+  timestamp_s, method_name, protocol, status_class, count, rpc_errors,
+  transport_errors, latency_sum_us, latency_max_us, latency_hist
+  read_proxy_sink() detects the format from the header.
 - unified monitor CSV (existing per-second rows)
 
 Outputs:
@@ -19,15 +28,31 @@ Attribution formula:
     method_mem(method, t)     = total_mem_mb(t) * method_weight(method, t)
 
 Time-window alignment: left-closed, right-open [t, t+1), matching per-second monitor samples.
+
+This is a share, not a cost: analysis/method_cost.py fits each method's
+marginal CPU, disk read and network cost per call.
+
+Aggregate latency_hist is "bucket:count;..." over log buckets of microseconds
+(bucket 0 <= 1 us, bucket i in (2^((i-1)/4), 2^(i/4)] us). Percentiles from a
+histogram report the bucket upper bound capped at the observed max, so they
+overstate the exact value by at most ~19%.
 """
 
 from __future__ import annotations
 
 import csv
+import datetime as _dt
+import math
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, Sequence
+from typing import Iterable, Iterator, Sequence, Union
+
+AGGREGATE_COLUMNS = (
+    "timestamp_s", "method_name", "protocol", "status_class", "count", "rpc_errors",
+    "transport_errors", "latency_sum_us", "latency_max_us", "latency_hist",
+)
+HIST_BUCKETS_PER_OCTAVE = 4
 
 
 @dataclass
@@ -39,13 +64,36 @@ class ProxyRecord:
     request_id: str
     batch_idx: int
     status_code: int
-    latency_ms: int
+    latency_ms: float       # latency_us / 1000 when the sink recorded microseconds
     upstream: str
     client_addr: str
     transport_success: bool = True
     rpc_success: bool = True
     rpc_error_code: str = ""
     rpc_error_message: str = ""
+    latency_us: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency_us is None:
+            self.latency_us = int(round(self.latency_ms * 1000))
+
+
+@dataclass
+class ProxyAggregate:
+    """One aggregate sink row: all requests of one method in one second."""
+    timestamp_s: int
+    method_name: str
+    protocol: str
+    status_class: str
+    count: int
+    rpc_errors: int
+    transport_errors: int
+    latency_sum_us: int
+    latency_max_us: int
+    hist: dict[int, int] = field(default_factory=dict)
+
+
+ProxySinkRow = Union[ProxyRecord, ProxyAggregate]
 
 
 @dataclass
@@ -96,6 +144,13 @@ def read_proxy_csv(path: str | Path) -> Iterator[ProxyRecord]:
                 row.get("rpc_success"),
                 default=transport_success,
             )
+            latency_us_raw = row.get("latency_us")
+            if latency_us_raw:
+                latency_us = int(latency_us_raw)
+                latency_ms = latency_us / 1000.0
+            else:
+                latency_ms = float(row["latency_ms"])
+                latency_us = int(round(latency_ms * 1000))
             yield ProxyRecord(
                 timestamp_ns=int(row["timestamp_ns"]),
                 method_name=row["method_name"],
@@ -107,18 +162,131 @@ def read_proxy_csv(path: str | Path) -> Iterator[ProxyRecord]:
                 rpc_success=rpc_success,
                 rpc_error_code=row.get("rpc_error_code", ""),
                 rpc_error_message=row.get("rpc_error_message", ""),
-                latency_ms=int(row["latency_ms"]),
+                latency_ms=latency_ms,
                 upstream=row.get("upstream", ""),
                 client_addr=row.get("client_addr", ""),
+                latency_us=latency_us,
+            )
+
+
+def parse_hist(raw: str | None) -> dict[int, int]:
+    """Decode a latency_hist cell ("bucket:count;bucket:count")."""
+    hist: dict[int, int] = {}
+    for part in (raw or "").split(";"):
+        idx, sep, count = part.partition(":")
+        if not sep:
+            continue
+        try:
+            hist[int(idx)] = hist.get(int(idx), 0) + int(count)
+        except ValueError:
+            continue
+    return hist
+
+
+def hist_bucket(latency_us: float) -> int:
+    """Log bucket index for a latency in microseconds (same as the Go sink)."""
+    if latency_us <= 1:
+        return 0
+    return math.ceil(HIST_BUCKETS_PER_OCTAVE * math.log2(latency_us))
+
+
+def hist_percentile_ms(hist: dict[int, int], pct: float, max_us: float | None = None) -> float:
+    """Nearest-rank percentile (ms) from a log histogram, capped at max_us."""
+    total = sum(hist.values())
+    if total <= 0:
+        return 0.0
+    rank = max(1, math.ceil(pct * total))
+    seen = 0
+    for idx in sorted(hist):
+        seen += hist[idx]
+        if seen >= rank:
+            upper_us = 2 ** (idx / HIST_BUCKETS_PER_OCTAVE)
+            if max_us is not None and max_us > 0:
+                upper_us = min(upper_us, max_us)
+            return upper_us / 1000.0
+    return 0.0
+
+
+def read_proxy_aggregate_csv(path: str | Path) -> Iterator[ProxyAggregate]:
+    """Stream-read an aggregate sink CSV, skipping '__unmatched__' buckets."""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("method_name") == "__unmatched__":
+                continue
+            yield ProxyAggregate(
+                timestamp_s=int(row["timestamp_s"]),
+                method_name=row["method_name"],
+                protocol=row.get("protocol", ""),
+                status_class=row.get("status_class", ""),
+                count=int(row.get("count") or 0),
+                rpc_errors=int(row.get("rpc_errors") or 0),
+                transport_errors=int(row.get("transport_errors") or 0),
+                latency_sum_us=int(row.get("latency_sum_us") or 0),
+                latency_max_us=int(row.get("latency_max_us") or 0),
+                hist=parse_hist(row.get("latency_hist")),
             )
 
 
+def is_proxy_aggregate_csv(path: str | Path) -> bool:
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), [])
+    return "latency_hist" in header
+
+
+def read_proxy_sink(path: str | Path) -> Iterator[ProxySinkRow]:
+    """Read either proxy sink format: ProxyRecord rows or ProxyAggregate buckets."""
+    if is_proxy_aggregate_csv(path):
+        return read_proxy_aggregate_csv(path)
+    return read_proxy_csv(path)
+
+
+def request_count(rows: Iterable[ProxySinkRow]) -> int:
+    """Number of proxied RPC calls (one per batched call) in raw records and/or buckets."""
+    return sum(r.count if isinstance(r, ProxyAggregate) else 1 for r in rows)
+
+
 def _parse_bool(value: str | None, default: bool) -> bool:
     if value is None or value == "":
         return default
     return str(value).strip().lower() in {"1", "true", "yes", "y"}
 
 
+def parse_ts_to_epoch_s(ts_raw: str) -> int:
+    """Epoch seconds from a numeric epoch (s/ms/us/ns) or a datetime string."""
+    ts_raw = (ts_raw or "").strip()
+    # Prefer numeric epoch values and infer seconds/ms/us/ns by magnitude.
+    try:
+        ts_int = int(float(ts_raw))
+    except (ValueError, TypeError):
+        ts_int = None
+    if ts_int is not None:
+        if ts_int > 10**17:    # ns
+            return ts_int // 1_000_000_000
+        elif ts_int > 10**14:  # us
+            return ts_int // 1_000_000
+        elif ts_int > 10**11:  # ms
+            return ts_int // 1000
+        else:                  # seconds
+            return ts_int
+    # String datetime: unified_monitor uses '%Y-%m-%d %H:%M:%S';
+    # also accept ISO8601 strings with a 'T' separator.
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            dt = _dt.datetime.strptime(ts_raw, fmt)
+            return int(dt.timestamp())  # local timezone -> epoch seconds
+        except ValueError:
+            continue
+    # Finally try fromisoformat for fractional seconds or timezone offsets.
+    try:
+        dt = _dt.datetime.fromisoformat(ts_raw)
+        return int(dt.timestamp())
+    except ValueError:
+        raise ValueError(
+            f"parse_ts_to_epoch_s: unable to parse timestamp {ts_raw!r}; "
+            f"expected numeric epoch or a supported datetime string"
+        )
+
+
 def read_monitor_csv(
     path: str | Path,
     timestamp_col: str = "timestamp",
@@ -134,46 +302,10 @@ def read_monitor_csv(
          unified_monitor.sh emits local timestamp strings, which are parsed as
          local-time epoch seconds to align with the proxy sink from the same run.
     """
-    import datetime as _dt
-
-    def _parse_ts_to_epoch_s(ts_raw: str) -> int:
-        ts_raw = (ts_raw or "").strip()
-        # Prefer numeric epoch values and infer seconds/ms/us/ns by magnitude.
-        try:
-            ts_int = int(float(ts_raw))
-        except (ValueError, TypeError):
-            ts_int = None
-        if ts_int is not None:
-            if ts_int > 10**17:    # ns
-                return ts_int // 1_000_000_000
-            elif ts_int > 10**14:  # us
-                return ts_int // 1_000_000
-            elif ts_int > 10**11:  # ms
-                return ts_int // 1000
-            else:                  # seconds
-                return ts_int
-        # String datetime: unified_monitor uses '%Y-%m-%d %H:%M:%S';
-        # also accept ISO8601 strings with a 'T' separator.
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                dt = _dt.datetime.strptime(ts_raw, fmt)
-                return int(dt.timestamp())  # local timezone -> epoch seconds
-            except ValueError:
-                continue
-        # Finally try fromisoformat for fractional seconds or timezone offsets.
-        try:
-            dt = _dt.datetime.fromisoformat(ts_raw)
-            return int(dt.timestamp())
-        except ValueError:
-            raise ValueError(
-                f"read_monitor_csv: unable to parse timestamp {ts_raw!r}; "
-                f"expected numeric epoch or a supported datetime string"
-            )
-
     with open(path, newline="") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            ts_s = _parse_ts_to_epoch_s(row[timestamp_col])
+            ts_s = parse_ts_to_epoch_s(row[timestamp_col])
             yield MonitorRecord(
                 timestamp_s=ts_s,
                 cpu_pct=float(row.get(cpu_col, 0) or 0),
@@ -181,58 +313,86 @@ def read_monitor_csv(
             )
 
 
-def _percentile(sorted_values: Sequence[float], pct: float) -> float:
-    """Compute percentile from a sorted list with linear interpolation."""
-    if not sorted_values:
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Percentile ``pct`` (0-100) of an ascending sequence; 0.0 when it is empty.
+
+    Linear interpolation between the two closest ranks, at position
+    pct / 100 * (n - 1): the numpy.percentile and pandas quantile default, so
+    the analysis modules agree with the rest of the report.
+    """
+    if not len(sorted_values):
         return 0.0
-    if len(sorted_values) == 1:
-        return sorted_values[0]
-    idx = pct * (len(sorted_values) - 1)
+    idx = pct / 100.0 * (len(sorted_values) - 1)
     lo = int(idx)
     hi = min(lo + 1, len(sorted_values) - 1)
     frac = idx - lo
-    return sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac
+    return float(sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac)
 
 
 def compute_per_method_qps(
-    proxy_records: Iterable[ProxyRecord],
+    proxy_records: Iterable[ProxySinkRow],
 ) -> list[PerMethodQpsRow]:
     """Group by (method, timestamp_s) and compute QPS, error rate, p50, p90, and p99.
 
+    Accepts raw ProxyRecord rows, ProxyAggregate buckets, or a mix. Seconds
+    with only raw rows keep exact interpolated percentiles; seconds with any
+    aggregate bucket use histogram percentiles.
     Returns rows sorted by (timestamp_s, method_name).
     """
     # bucket: (ts_s, method) -> list[latency_ms]
-    latencies: dict[tuple[int, str], list[int]] = defaultdict(list)
+    latencies: dict[tuple[int, str], list[float]] = defaultdict(list)
+    hists: dict[tuple[int, str], dict[int, int]] = {}
+    max_us: dict[tuple[int, str], int] = defaultdict(int)
+    counts: dict[tuple[int, str], int] = defaultdict(int)
     errors: dict[tuple[int, str], int] = defaultdict(int)
 
     for r in proxy_records:
+        if isinstance(r, ProxyAggregate):
+            key = (r.timestamp_s, r.method_name)
+            hist = hists.setdefault(key, {})
+            for idx, n in r.hist.items():
+                hist[idx] = hist.get(idx, 0) + n
+            max_us[key] = max(max_us[key], r.latency_max_us)
+            counts[key] += r.count
+            errors[key] += r.rpc_errors
+            continue
         ts_s = r.timestamp_ns // 1_000_000_000
         key = (ts_s, r.method_name)
         latencies[key].append(r.latency_ms)
+        counts[key] += 1
         if not r.rpc_success:
             errors[key] += 1
 
     rows: list[PerMethodQpsRow] = []
-    for key, lats in latencies.items():
+    for key, count in counts.items():
         ts_s, method = key
-        lats_sorted = sorted(lats)
+        if key in hists:
+            hist = hists[key]
+            for lat in latencies.get(key, ()):
+                idx = hist_bucket(lat * 1000)
+                hist[idx] = hist.get(idx, 0) + 1
+                max_us[key] = max(max_us[key], round(lat * 1000))
+            p50, p90, p99 = (hist_percentile_ms(hist, p, max_us[key]) for p in (0.5, 0.9, 0.99))
+        else:
+            lats_sorted = sorted(latencies[key])
+            p50, p90, p99 = (percentile(lats_sorted, p) for p in (50, 90, 99))
         rows.append(PerMethodQpsRow(
             timestamp_s=ts_s,
             method_name=method,
-            qps=len(lats),
+            qps=count,
             error_count=errors.get(key, 0),
-            p50_ms=_percentile(lats_sorted, 0.5),
-            p90_ms=_percentile(lats_sorted, 0.9),
-            p99_ms=_percentile(lats_sorted, 0.99),
+            p50_ms=p50,
+            p90_ms=p90,
+            p99_ms=p99,
         ))
     rows.sort(key=lambda x: (x.timestamp_s, x.method_name))
     return rows
 
 
 def filter_proxy_records_by_methods(
-    proxy_records: Iterable[ProxyRecord],
+    proxy_records: Iterable[ProxySinkRow],
     allowed_methods: Iterable[str] | None,
-) -> list[ProxyRecord]:
+) -> list[ProxySinkRow]:
     """Keep only workload methods declared by the chain template.
 
     Proxy CSV also contains framework probes, such as block-height/sync-health
@@ -249,7 +409,7 @@ def filter_proxy_records_by_methods(
 
 
 def compute_per_method_resource(
-    proxy_records: Iterable[ProxyRecord],
+    proxy_records: Iterable[ProxySinkRow],
     monitor_records: Iterable[MonitorRecord],
 ) -> list[PerMethodResourceRow]:
     """Attribute CPU%/memory by per-second method_count / total_count weight.
@@ -261,9 +421,12 @@ def compute_per_method_resource(
     method_count: dict[tuple[int, str], int] = defaultdict(int)
     total_count: dict[int, int] = defaultdict(int)
     for r in proxy_records:
-        ts_s = r.timestamp_ns // 1_000_000_000
-        method_count[(ts_s, r.method_name)] += 1
-        total_count[ts_s] += 1
+        if isinstance(r, ProxyAggregate):
+            ts_s, n = r.timestamp_s, r.count
+        else:
+            ts_s, n = r.timestamp_ns // 1_000_000_000, 1
+        method_count[(ts_s, r.method_name)] += n
+        total_count[ts_s] += n
 
     # Step 2: per-second monitor lookup.
     monitor_by_ts: dict[int, MonitorRecord] = {m.timestamp_s: m for m in monitor_records}
@@ -0,0 +1,368 @@
+"""
+Proxy-overhead calibration.
+
+Every workload request passes through tools/proxy, so per-method latency
+includes the proxy's body buffering, extractor parsing and response capture.
+Calibration measures that cost with short paired Vegeta rounds per QPS level:
+
+    direct:  Vegeta -> node (or fake-node)
+    proxied: Vegeta -> calibration proxy instance -> same node
+
+overhead(qps) = proxied percentile - direct percentile, per p50/p90/p99.
+
+Inputs:
+- Vegeta JSON targets (the run's single/mixed targets file). URLs are
+  rewritten to the direct and proxy base URLs for each leg.
+- calibration proxy self-report CSV (timestamp_ns, cpu_pct, mem_mb) for the
+  proxy CPU seen in each proxied round.
+
+Outputs:
+- proxy_overhead.json   {"points": [...], "cpu_cores": N, ...}; one point per
+                        QPS level with direct/proxied percentiles, overhead
+                        and the proxy CPU peak during the proxied round.
+
+Consumers:
+- overhead_at(curve, qps)          linear interpolation, clamped at the ends
+- correct_qps_rows(rows, curve)    per-method rows with overhead subtracted,
+                                   looked up at each second's total QPS
+- flag_saturated_rounds(...)       QPS levels where the main run's proxy CPU
+                                   (proxy_self.csv) neared its core budget
+
+cpu_pct in proxy_self.csv is percent of one core (200 = two cores busy).
+Saturation is cpu_pct >= threshold_pct% of cpu_cores * 100.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+from urllib.parse import urlsplit, urlunsplit
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from analysis.per_method_attribution import PerMethodQpsRow, parse_ts_to_epoch_s  # noqa: E402
+
+PERCENTILES = ("p50", "p90", "p99")
+_VEGETA_KEYS = {"p50": "50th", "p90": "90th", "p99": "99th"}
+
+
+@dataclass
+class LatencyStats:
+    """Latency summary of one Vegeta round, in milliseconds."""
+    requests: int
+    success: float          # 0-1
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+
+@dataclass
+class OverheadPoint:
+    qps: int
+    direct: LatencyStats
+    proxied: LatencyStats
+    overhead_p50_ms: float
+    overhead_p90_ms: float
+    overhead_p99_ms: float
+    proxy_cpu_peak_pct: float = 0.0
+
+    @classmethod
+    def from_rounds(cls, qps: int, direct: LatencyStats, proxied: LatencyStats,
+                    proxy_cpu_peak_pct: float = 0.0) -> "OverheadPoint":
+        return cls(
+            qps=qps, direct=direct, proxied=proxied,
+            overhead_p50_ms=max(proxied.p50_ms - direct.p50_ms, 0.0),
+            overhead_p90_ms=max(proxied.p90_ms - direct.p90_ms, 0.0),
+            overhead_p99_ms=max(proxied.p99_ms - direct.p99_ms, 0.0),
+            proxy_cpu_peak_pct=proxy_cpu_peak_pct,
+        )
+
+
+# ---------- Vegeta round helpers ----------
+
+def parse_vegeta_report(path: str | Path) -> LatencyStats:
+    """Read `vegeta report -type=json` output (latencies in ns)."""
+    with open(path) as f:
+        data = json.load(f)
+    lat = data.get("latencies", {}) or {}
+
+    def ms(key: str) -> float:
+        return float(lat.get(key, 0) or 0) / 1_000_000
+
+    return LatencyStats(
+        requests=int(data.get("requests", 0) or 0),
+        success=float(data.get("success", 0) or 0),
+        mean_ms=ms("mean"),
+        p50_ms=ms("50th"),
+        p90_ms=ms("90th"),
+        p99_ms=ms("99th"),
+    )
+
+
+def rewrite_targets(src: str | Path, dst: str | Path, base_url: str) -> int:
+    """Copy Vegeta JSON targets, pointing scheme://host:port at base_url.
+
+    Paths and query strings are kept (REST chains encode the method there).
+    Returns the number of targets written.
+    """
+    base = urlsplit(base_url)
+    n = 0
+    with open(src) as fin, open(dst, "w") as fout:
+        for line in fin:
+            line = line.strip()
+            if not line:
+                continue
+            target = json.loads(line)
+            url = urlsplit(target.get("url", ""))
+            target["url"] = urlunsplit((base.scheme, base.netloc, url.path, url.query, url.fragment))
+            fout.write(json.dumps(target, separators=(",", ":")) + "\n")
+            n += 1
+    return n
+
+
+def run_vegeta_round(targets: str | Path, qps: int, duration_s: int, report_path: str | Path) -> LatencyStats:
+    """Run one `vegeta attack` round and write its JSON report."""
+    attack = subprocess.run(
+        ["vegeta", "attack", "-format=json", f"-targets={targets}",
+         f"-rate={qps}", f"-duration={duration_s}s"],
+        check=True, capture_output=True,
+    )
+    report = subprocess.run(
+        ["vegeta", "report", "-type=json"], input=attack.stdout,
+        check=True, capture_output=True,
+    )
+    Path(report_path).write_bytes(report.stdout)
+    return parse_vegeta_report(report_path)
+
+
+# ---------- proxy self-report ----------
+
+def read_proxy_self(path: str | Path) -> list[tuple[float, float]]:
+    """(epoch seconds, cpu_pct) samples from proxy_self.csv; [] if missing."""
+    out: list[tuple[float, float]] = []
+    try:
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    out.append((int(row["timestamp_ns"]) / 1e9, float(row["cpu_pct"])))
+                except (KeyError, ValueError):
+                    continue
+    except OSError:
+        return []
+    return out
+
+
+def peak_cpu(samples: Iterable[tuple[float, float]], start: float, end: float) -> float:
+    return max((cpu for ts, cpu in samples if start <= ts <= end), default=0.0)
+
+
+# ---------- calibration ----------
+
+RoundRunner = Callable[[Path, int, int, Path], LatencyStats]
+
+
+def calibrate(
+    targets: str | Path,
+    direct_url: str,
+    proxy_url: str,
+    qps_levels: Sequence[int],
+    duration_s: int,
+    output_dir: str | Path,
+    proxy_self_csv: str | Path | None = None,
+    runner: RoundRunner = run_vegeta_round,
+    pause_s: float = 1.0,
+) -> list[OverheadPoint]:
+    """Run paired direct/proxied rounds per QPS level and return the curve.
+
+    The leg order alternates between levels so slow drift (page cache,
+    compaction) does not always land on the same leg.
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    legs = {
+        "direct": out / "targets_direct.json",
+        "proxied": out / "targets_proxied.json",
+    }
+    rewrite_targets(targets, legs["direct"], direct_url)
+    rewrite_targets(targets, legs["proxied"], proxy_url)
+
+    points: list[OverheadPoint] = []
+    for i, qps in enumerate(qps_levels):
+        order = ("direct", "proxied") if i % 2 == 0 else ("proxied", "direct")
+        stats: dict[str, LatencyStats] = {}
+        window = (0.0, 0.0)
+        for leg in order:
+            started = time.time()
+            stats[leg] = runner(legs[leg], qps, duration_s, out / f"{leg}_{qps}qps.json")
+            if leg == "proxied":
+                window = (started, time.time())
+            time.sleep(pause_s)
+        cpu = peak_cpu(read_proxy_self(proxy_self_csv), *window) if proxy_self_csv else 0.0
+        points.append(OverheadPoint.from_rounds(qps, stats["direct"], stats["proxied"], cpu))
+    return points
+
+
+def write_curve(points: Sequence[OverheadPoint], path: str | Path, cpu_cores: int | None = None,
+                duration_s: int | None = None) -> None:
+    payload = {
+        "generated_at": int(time.time()),
+        "duration_s": duration_s,
+        "cpu_cores": cpu_cores or os.cpu_count() or 1,
+        "points": [asdict(p) for p in sorted(points, key=lambda p: p.qps)],
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+
+def load_curve(path: str | Path) -> list[OverheadPoint]:
+    """Read proxy_overhead.json; [] if missing or unreadable."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    points = []
+    for p in data.get("points", []):
+        points.append(OverheadPoint(
+            qps=int(p["qps"]),
+            direct=LatencyStats(**p["direct"]),
+            proxied=LatencyStats(**p["proxied"]),
+            overhead_p50_ms=float(p["overhead_p50_ms"]),
+            overhead_p90_ms=float(p["overhead_p90_ms"]),
+            overhead_p99_ms=float(p["overhead_p99_ms"]),
+            proxy_cpu_peak_pct=float(p.get("proxy_cpu_peak_pct", 0.0)),
+        ))
+    points.sort(key=lambda p: p.qps)
+    return points
+
+
+def overhead_at(curve: Sequence[OverheadPoint], qps: float) -> tuple[float, float, float]:
+    """(p50, p90, p99) overhead in ms at qps; linear between points, clamped outside."""
+    if not curve:
+        return (0.0, 0.0, 0.0)
+
+    def values(p: OverheadPoint) -> tuple[float, float, float]:
+        return (p.overhead_p50_ms, p.overhead_p90_ms, p.overhead_p99_ms)
+
+    if qps <= curve[0].qps:
+        return values(curve[0])
+    for lo, hi in zip(curve, curve[1:]):
+        if qps <= hi.qps:
+            frac = (qps - lo.qps) / (hi.qps - lo.qps) if hi.qps != lo.qps else 0.0
+            return tuple(a + (b - a) * frac for a, b in zip(values(lo), values(hi)))  # type: ignore[return-value]
+    return values(curve[-1])
+
+
+def correct_qps_rows(rows: Sequence[PerMethodQpsRow], curve: Sequence[OverheadPoint]) -> list[PerMethodQpsRow]:
+    """Subtract the calibrated proxy overhead at each second's total QPS."""
+    if not curve:
+        return list(rows)
+    total_qps: dict[int, int] = {}
+    for r in rows:
+        total_qps[r.timestamp_s] = total_qps.get(r.timestamp_s, 0) + r.qps
+    out = []
+    for r in rows:
+        o50, o90, o99 = overhead_at(curve, total_qps[r.timestamp_s])
+        out.append(replace(
+            r,
+            p50_ms=max(r.p50_ms - o50, 0.0),
+            p90_ms=max(r.p90_ms - o90, 0.0),
+            p99_ms=max(r.p99_ms - o99, 0.0),
+        ))
+    return out
+
+
+def flag_saturated_rounds(
+    proxy_self_csv: str | Path,
+    monitor_csv: str | Path,
+    cpu_cores: int,
+    threshold_pct: float = 80.0,
+    qps_col: str = "current_qps",
+    timestamp_col: str = "timestamp",
+) -> list[dict]:
+    """QPS rounds in which proxy CPU reached threshold_pct of its core budget.
+
+    Rounds come from the unified monitor CSV (current_qps per sample). Returns
+    [{"qps", "seconds", "peak_cpu_pct"}] sorted by qps; [] if either file is
+    missing.
+    """
+    samples = read_proxy_self(proxy_self_csv)
+    limit = threshold_pct / 100.0 * max(cpu_cores, 1) * 100.0
+    hot = {int(ts): cpu for ts, cpu in samples if cpu >= limit}
+    if not hot:
+        return []
+    qps_by_second: dict[int, int] = {}
+    try:
+        with open(monitor_csv, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    qps = int(float(row.get(qps_col) or 0))
+                    ts = parse_ts_to_epoch_s(row[timestamp_col])
+                except (KeyError, ValueError):
+                    continue
+                if qps > 0:
+                    qps_by_second[ts] = qps
+    except OSError:
+        return []
+    rounds: dict[int, dict] = {}
+    known = sorted(qps_by_second)
+    for ts, cpu in hot.items():
+        # Monitor samples are every MONITOR_INTERVAL seconds: use the latest
+        # sample at or before the hot second.
+        i = bisect.bisect_right(known, ts)
+        if i == 0:
+            continue
+        qps = qps_by_second[known[i - 1]]
+        entry = rounds.setdefault(qps, {"qps": qps, "seconds": 0, "peak_cpu_pct": 0.0})
+        entry["seconds"] += 1
+        entry["peak_cpu_pct"] = max(entry["peak_cpu_pct"], cpu)
+    return [rounds[q] for q in sorted(rounds)]
+
+
+def _parse_qps_list(raw: str) -> list[int]:
+    return sorted({int(x) for x in raw.replace(" ", "").split(",") if x})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Measure proxy latency overhead with paired Vegeta rounds")
+    ap.add_argument("--targets", required=True, help="Vegeta JSON targets file")
+    ap.add_argument("--direct-url", required=True, help="node URL, e.g. http://127.0.0.1:8899")
+    ap.add_argument("--proxy-url", required=True, help="calibration proxy URL")
+    ap.add_argument("--qps-list", required=True, help="comma-separated QPS levels")
+    ap.add_argument("--duration", type=int, default=10, help="seconds per round")
+    ap.add_argument("--output-dir", required=True, help="directory for per-round reports")
+    ap.add_argument("--output", required=True, help="proxy_overhead.json path")
+    ap.add_argument("--proxy-self-csv", help="calibration proxy self-report CSV")
+    ap.add_argument("--cpu-cores", type=int, default=None, help="CPU cores available to the proxy")
+    args = ap.parse_args(argv)
+
+    qps_levels = _parse_qps_list(args.qps_list)
+    if not qps_levels:
+        print("❌ --qps-list is empty", file=sys.stderr)
+        return 2
+    try:
+        points = calibrate(args.targets, args.direct_url, args.proxy_url, qps_levels,
+                           args.duration, args.output_dir, args.proxy_self_csv)
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError) as e:
+        print(f"❌ Proxy calibration failed: {e}", file=sys.stderr)
+        return 1
+    write_curve(points, args.output, cpu_cores=args.cpu_cores, duration_s=args.duration)
+    for p in points:
+        print(f"   {p.qps:>7} QPS  overhead p50={p.overhead_p50_ms:.3f}ms "
+              f"p99={p.overhead_p99_ms:.3f}ms  proxy_cpu_peak={p.proxy_cpu_peak_pct:.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,6 +27,7 @@ project_root = os.path.dirname(script_dir)
 sys.path.insert(0, project_root)
 
 from visualization.chart_style_config import UnifiedChartStyle
+from analysis.generator_saturation import load_limited_qps
 from utils.unified_logger import get_logger
 
 # Use unified logger manager
@@ -190,19 +191,84 @@ class NodeQPSAnalyzer:
     
 
 
+    def get_generator_limited_qps(self) -> set:
+        """QPS levels where the load generator, not the node, was the limiter"""
+        path = os.getenv('GENERATOR_ROUNDS_CSV')
+        if not path:
+            logs_dir = os.getenv('LOGS_DIR', os.path.join(self.output_dir, 'current', 'logs'))
+            candidates = sorted(glob.glob(os.path.join(logs_dir, 'generator_rounds_*.csv')), key=os.path.getmtime)
+            path = candidates[-1] if candidates else None
+        return load_limited_qps(path)
+
+    def load_usl_model(self) -> Dict[str, Any]:
+        """Universal Scalability Law fit of this session's rounds (analysis/usl_model.py)"""
+        path = os.getenv('USL_MODEL_JSON')
+        if not path:
+            logs_dir = os.getenv('LOGS_DIR', os.path.join(self.output_dir, 'current', 'logs'))
+            candidates = sorted(glob.glob(os.path.join(logs_dir, 'usl_model_*.json')), key=os.path.getmtime)
+            path = candidates[-1] if candidates else None
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Cannot read USL model {path}: {e}")
+            return {}
+
+    def load_method_profile(self) -> Dict[str, Any]:
+        """Per-method isolation profiles and mix prediction (analysis/method_profile.py)"""
+        path = os.getenv('METHOD_PROFILE_JSON')
+        if not path:
+            logs_dir = os.getenv('LOGS_DIR', os.path.join(self.output_dir, 'current', 'logs'))
+            candidates = sorted(glob.glob(os.path.join(logs_dir, 'method_profile_*.json')), key=os.path.getmtime)
+            path = candidates[-1] if candidates else None
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Cannot read method profile {path}: {e}")
+            return {}
+
+    def load_endpoint_compare(self) -> pd.DataFrame:
+        """Per-endpoint rounds of a --compare run (analysis/endpoint_compare.py)"""
+        path = os.getenv('COMPARE_RESULTS_CSV')
+        if not path:
+            logs_dir = os.getenv('LOGS_DIR', os.path.join(self.output_dir, 'current', 'logs'))
+            candidates = sorted(glob.glob(os.path.join(logs_dir, 'compare_results_*.csv')), key=os.path.getmtime)
+            path = candidates[-1] if candidates else None
+        if not path or not os.path.exists(path):
+            return pd.DataFrame()
+        try:
+            return pd.read_csv(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Cannot read endpoint comparison {path}: {e}")
+            return pd.DataFrame()
+
     def analyze_performance_cliff(self, df: pd.DataFrame, max_qps: int, bottleneck_qps: int) -> Dict[str, Any]:
         """Analyze performance cliff - identify points of sharp performance degradation"""
         try:
+            generator_limited_qps = sorted(self.get_generator_limited_qps())
             cliff_analysis = {
                 'max_qps': max_qps,
                 'bottleneck_qps': bottleneck_qps,
                 'performance_drop_percent': 0.0,  # Use float type for consistency
                 'cliff_detected': False,
                 'cliff_factors': [],
-                'recommendations': []
+                'recommendations': [],
+                'generator_limited_qps': generator_limited_qps,
+                'generator_limited': bottleneck_qps in generator_limited_qps
             }
             
-            if max_qps > 0 and bottleneck_qps > 0:
+            if cliff_analysis['generator_limited']:
+                # The drop was measured on the client side: not a node cliff
+                cliff_analysis['recommendations'] = [
+                    f"Load generator limited the {bottleneck_qps} QPS round: add Vegeta workers or CPU before reading this as a node limit"
+                ]
+                logger.warning(f"⚠️ Bottleneck QPS {bottleneck_qps} was limited by the load generator, no cliff declared")
+            elif max_qps > 0 and bottleneck_qps > 0:
                 # Calculate performance drop percentage
                 drop_percent = ((bottleneck_qps - max_qps) / max_qps) * 100
                 cliff_analysis['performance_drop_percent'] = drop_percent
@@ -223,6 +289,18 @@ class NodeQPSAnalyzer:
                 else:
                     logger.info(f"📊 Performance change: {drop_percent:.1f}% (below cliff threshold)")
             
+            # The USL fit uses every round, not only the two around the bottleneck
+            usl = self.load_usl_model()
+            if usl.get('fitted'):
+                cliff_analysis['usl'] = {key: usl.get(key) for key in (
+                    'sigma', 'kappa', 'sigma_ci', 'kappa_ci', 'r2', 'peak_concurrency', 'peak_throughput',
+                    'peak_throughput_ci')}
+                ci = usl.get('peak_throughput_ci') or [None, None]
+                if usl.get('peak_throughput') and ci[0] is not None and ci[1] is not None:
+                    cliff_analysis['recommendations'].append(
+                        f"USL model peaks at {usl['peak_throughput']:.0f} req/s (95% CI {ci[0]:.0f}-{ci[1]:.0f}) "
+                        f"with {usl['peak_concurrency']:.0f} requests in flight: load beyond it only adds latency")
+            
             return cliff_analysis
             
         except Exception as e:
@@ -775,6 +853,223 @@ class NodeQPSAnalyzer:
 
         return fig
 
+    def load_load_curve(self) -> pd.DataFrame:
+        """Per-round throughput and latency of open- and closed-loop rounds (analysis/load_curve.py)"""
+        path = os.getenv('LOAD_CURVE_CSV')
+        if not path:
+            logs_dir = os.getenv('LOGS_DIR', os.path.join(self.output_dir, 'current', 'logs'))
+            candidates = sorted(glob.glob(os.path.join(logs_dir, 'load_curve_*.csv')), key=os.path.getmtime)
+            path = candidates[-1] if candidates else None
+        if not path or not os.path.exists(path):
+            return pd.DataFrame()
+        try:
+            return pd.read_csv(path)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+            logger.warning(f"⚠️ Cannot read load curve {path}: {e}")
+            return pd.DataFrame()
+
+    def generate_usl_chart(self) -> Optional[str]:
+        """Measured throughput per round against concurrency with the fitted USL curve and its peak"""
+        usl = self.load_usl_model()
+        if not usl.get('fitted'):
+            return None
+        print("\n📈 Generating USL model chart...")
+        rounds = pd.DataFrame(usl['rounds'])
+        lam, sigma, kappa = usl['lambda'], usl['sigma'], usl['kappa']
+        n_max = max(rounds['concurrency'].max(), usl.get('peak_concurrency') or 0) * 1.2
+        n = np.linspace(max(rounds['concurrency'].min() * 0.5, 1e-3), n_max, 200)
+        fitted = lam * n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+        fig, ax = plt.subplots(figsize=(12, 7))
+        ax.scatter(rounds['concurrency'], rounds['throughput'], color=UnifiedChartStyle.COLORS["data_primary"],
+                   s=60, zorder=3, label='Measured rounds')
+        for _, r in rounds.iterrows():
+            ax.annotate(r['label'], (r['concurrency'], r['throughput']), textcoords='offset points',
+                        xytext=(5, 5), fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax.plot(n, fitted, color=UnifiedChartStyle.COLORS["purple"], linewidth=2,
+                label=f'USL fit (\u03c3={sigma:.4f}, \u03ba={kappa:.2e}, R\u00b2={usl["r2"]:.3f})')
+        if usl.get('peak_throughput'):
+            ax.axvline(usl['peak_concurrency'], color=UnifiedChartStyle.COLORS["critical"], linestyle='--',
+                       alpha=0.8, label=f'Peak {usl["peak_throughput"]:.0f} req/s at N={usl["peak_concurrency"]:.1f}')
+            ci = usl.get('peak_throughput_ci') or [None, None]
+            if ci[0] is not None and ci[1] is not None:
+                ax.axhspan(ci[0], ci[1], color=UnifiedChartStyle.COLORS["critical"], alpha=0.1,
+                           label='Peak throughput 95% CI')
+        else:
+            ax.axhline(lam / sigma if sigma > 0 else fitted.max(), color=UnifiedChartStyle.COLORS["gray"],
+                       linestyle=':', label='Asymptote (no coherency delay)')
+        ax.set_title('Universal Scalability Law Fit', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax.set_xlabel('Concurrency N (rate \u00d7 mean latency)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax.set_ylabel('Throughput (successful req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax.grid(True, alpha=0.3)
+
+        UnifiedChartStyle.apply_layout('auto')
+
+        chart_file = os.path.join(self.reports_dir, 'qps_usl_model.png')
+        os.makedirs(os.path.dirname(chart_file), exist_ok=True)
+        plt.savefig(chart_file, dpi=300, bbox_inches='tight',
+                   facecolor='white', edgecolor='none')
+        print(f"✅ USL model chart saved: {chart_file}")
+        plt.close()
+        return chart_file
+
+    def generate_method_profile_chart(self) -> Optional[str]:
+        """p99 latency curve of every method alone and of the mix, and isolated vs mix capacity"""
+        profile = self.load_method_profile()
+        methods = profile.get('methods') or {}
+        if not methods:
+            return None
+        print("\n📈 Generating method profile chart...")
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig.suptitle('Per-Method Isolation Profiles', fontsize=UnifiedChartStyle.FONT_CONFIG["title_size"], fontweight='bold')
+
+        curves = dict(methods)
+        if profile.get('mix'):
+            curves['mix'] = profile['mix']
+        palette = plt.get_cmap('tab10')
+        for i, (method, entry) in enumerate(curves.items()):
+            rounds = pd.DataFrame(entry.get('curve') or [])
+            if rounds.empty:
+                continue
+            rounds = rounds.sort_values('rate')
+            color = 'black' if method == 'mix' else palette(i % 10)
+            ax1.plot(rounds['rate'], rounds['p99_ms'], color=color, marker='o', linewidth=2,
+                     linestyle='--' if method == 'mix' else '-', label=method)
+            failed = rounds[~rounds['passed'].astype(bool)]
+            ax1.scatter(failed['rate'], failed['p99_ms'], color=color, marker='x', s=80, zorder=3)
+        ax1.set_yscale('log')
+        ax1.set_title('p99 Latency vs Achieved Rate (x = SLO failed)', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax1.set_xlabel('Achieved rate (req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.set_ylabel('p99 Latency (ms, log)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax1.grid(True, alpha=0.3)
+
+        names = list(methods)
+        values = [methods[m]['max_qps'] or 0 for m in names]
+        colors = [UnifiedChartStyle.COLORS["data_primary"]] * len(names)
+        prediction = profile.get('prediction') or {}
+        if prediction.get('predicted_qps') is not None:
+            names.append('mix (predicted)')
+            values.append(prediction['predicted_qps'])
+            colors.append(UnifiedChartStyle.COLORS["purple"])
+        if profile.get('mix'):
+            names.append('mix (measured)')
+            values.append(profile['mix']['max_qps'] or 0)
+            colors.append(UnifiedChartStyle.COLORS["success"])
+        ax2.bar(names, values, color=colors, alpha=0.8)
+        for x, v in enumerate(values):
+            ax2.text(x, v, f'{v:,.0f}', ha='center', va='bottom', fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax2.set_title('SLO Capacity: Methods Alone and the Mix', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax2.set_ylabel('Highest passing rate (QPS)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax2.tick_params(axis='x', rotation=30)
+        ax2.grid(True, alpha=0.3, axis='y')
+
+        UnifiedChartStyle.apply_layout('auto')
+
+        chart_file = os.path.join(self.reports_dir, 'qps_method_profile.png')
+        os.makedirs(os.path.dirname(chart_file), exist_ok=True)
+        plt.savefig(chart_file, dpi=300, bbox_inches='tight',
+                   facecolor='white', edgecolor='none')
+        print(f"✅ Method profile chart saved: {chart_file}")
+        plt.close()
+        return chart_file
+
+    def generate_endpoint_compare_chart(self) -> Optional[str]:
+        """p99 latency and process CPU against achieved rate for every endpoint of a --compare run"""
+        rounds = self.load_endpoint_compare()
+        if rounds.empty or rounds['endpoint'].nunique() < 2:
+            return None
+        print("\n📈 Generating endpoint comparison chart...")
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig.suptitle(f"Multi-Endpoint Comparison ({rounds['mode'].iloc[0]})",
+                     fontsize=UnifiedChartStyle.FONT_CONFIG["title_size"], fontweight='bold')
+
+        palette = plt.get_cmap('tab10')
+        for i, (endpoint, group) in enumerate(rounds.groupby('endpoint', sort=False)):
+            group = group.sort_values('rate')
+            color = palette(i % 10)
+            passed = group['passed'].astype(str).str.lower() == 'true'
+            ax1.plot(group['rate'], group['p99_ms'], color=color, marker='o', linewidth=2, label=endpoint)
+            ax1.scatter(group.loc[~passed, 'rate'], group.loc[~passed, 'p99_ms'], color=color, marker='x', s=80, zorder=3)
+            if group['cpu_pct'].notna().any():
+                ax2.plot(group['rate'], group['cpu_pct'], color=color, marker='s', linewidth=2, label=endpoint)
+        ax1.set_yscale('log')
+        ax1.set_title('p99 Latency vs Achieved Rate (x = SLO failed)', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax1.set_xlabel('Achieved rate per endpoint (req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.set_ylabel('p99 Latency (ms, log)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax1.grid(True, alpha=0.3)
+
+        ax2.set_title('Process CPU vs Achieved Rate', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax2.set_xlabel('Achieved rate per endpoint (req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax2.set_ylabel('CPU (%, 100 = one core)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        if ax2.get_legend_handles_labels()[0]:
+            ax2.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax2.grid(True, alpha=0.3)
+
+        UnifiedChartStyle.apply_layout('auto')
+
+        chart_file = os.path.join(self.reports_dir, 'qps_endpoint_compare.png')
+        os.makedirs(os.path.dirname(chart_file), exist_ok=True)
+        plt.savefig(chart_file, dpi=300, bbox_inches='tight',
+                   facecolor='white', edgecolor='none')
+        print(f"✅ Endpoint comparison chart saved: {chart_file}")
+        plt.close()
+        return chart_file
+
+    def generate_load_curve_chart(self) -> Optional[str]:
+        """Throughput vs p99 latency for open- and closed-loop rounds, raw and
+        coordinated-omission corrected, plus closed-loop throughput per concurrency"""
+        curve = self.load_load_curve()
+        if curve.empty:
+            return None
+        print("\n📈 Generating load curve chart...")
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig.suptitle('Open-Loop vs Closed-Loop Load Curves', fontsize=UnifiedChartStyle.FONT_CONFIG["title_size"], fontweight='bold')
+
+        styles = {'open': (UnifiedChartStyle.COLORS["data_primary"], 'o', 'Open loop (QPS)'),
+                  'closed': (UnifiedChartStyle.COLORS["purple"], 's', 'Closed loop (concurrency)')}
+        for model, (color, marker, label) in styles.items():
+            rounds = curve[curve['load_model'] == model].sort_values('throughput')
+            if rounds.empty:
+                continue
+            ax1.plot(rounds['throughput'], rounds['p99_ms'], color=color, marker=marker,
+                     linewidth=2, label=f'{label} p99')
+            ax1.plot(rounds['throughput'], rounds['corrected_p99_ms'], color=color, marker=marker,
+                     linestyle='--', alpha=0.7, label=f'{label} p99, CO-corrected')
+        ax1.set_title('p99 Latency vs Achieved Throughput', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax1.set_xlabel('Throughput (successful req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.set_ylabel('p99 Latency (ms)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax1.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        ax1.grid(True, alpha=0.3)
+
+        closed = curve[curve['load_model'] == 'closed'].sort_values('concurrency')
+        if not closed.empty:
+            ax2.plot(closed['concurrency'], closed['throughput'], color=UnifiedChartStyle.COLORS["purple"],
+                     marker='s', linewidth=2, label='Throughput')
+            ax2.set_xscale('log', base=2)
+            ax2.legend(fontsize=UnifiedChartStyle.FONT_CONFIG['legend_size'])
+        else:
+            ax2.text(0.5, 0.5, 'No closed-loop rounds', ha='center', va='center', transform=ax2.transAxes)
+        ax2.set_title('Closed-Loop Throughput vs Concurrency', fontsize=UnifiedChartStyle.FONT_CONFIG['subtitle_size'])
+        ax2.set_xlabel('Requests in Flight', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax2.set_ylabel('Throughput (successful req/s)', fontsize=UnifiedChartStyle.FONT_CONFIG['label_size'])
+        ax2.grid(True, alpha=0.3)
+
+        UnifiedChartStyle.apply_layout('auto')
+
+        chart_file = os.path.join(self.reports_dir, 'qps_load_curves.png')
+        os.makedirs(os.path.dirname(chart_file), exist_ok=True)
+        plt.savefig(chart_file, dpi=300, bbox_inches='tight',
+                   facecolor='white', edgecolor='none')
+        print(f"✅ Load curve chart saved: {chart_file}")
+        plt.close()
+        return chart_file
+
     def load_vegeta_success_rates(self) -> pd.DataFrame:
         """Extract QPS, Success Rate, Latency from vegeta txt reports"""
         reports_dir = os.getenv('REPORTS_DIR', os.path.join(self.output_dir, 'current', 'reports'))
@@ -838,11 +1133,12 @@ class NodeQPSAnalyzer:
         print("=" * 50)
 
         reports_dir = os.getenv('REPORTS_DIR', os.path.join(self.output_dir, 'current', 'reports'))
-        reports = glob.glob(f"{reports_dir}/vegeta_*.txt")  # Only parse vegeta reports
+        reports = glob.glob(f"{reports_dir}/vegeta_*qps_*.txt")  # QPS rounds only, closed-loop rounds are vegeta_*conc_*
         if not reports:
             print("No Vegeta reports found")
             return None
 
+        generator_limited_qps = self.get_generator_limited_qps()
         report_data = []
         for report_file in sorted(reports):
             filename = os.path.basename(report_file)  # Initialize outside try block
@@ -870,7 +1166,8 @@ class NodeQPSAnalyzer:
                     'QPS': qps,
                     'Success_Rate': success_rate,
                     'Avg_Latency': avg_latency,
-                    'P99_Latency': p99_latency
+                    'P99_Latency': p99_latency,
+                    'Generator_Limited': qps in generator_limited_qps
                 })
             except Exception as e:
                 print(f"Warning: Could not parse {report_file}: {e}")
@@ -1135,6 +1432,10 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
         # Generate charts and reports
         self.generate_performance_charts(df)
+        self.generate_load_curve_chart()
+        self.generate_usl_chart()
+        self.generate_method_profile_chart()
+        self.generate_endpoint_compare_chart()
         vegeta_analysis = self.analyze_vegeta_reports()
         report = self.generate_performance_report(df, max_qps, bottlenecks, self.benchmark_mode)
 
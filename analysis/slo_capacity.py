@@ -0,0 +1,316 @@
+"""
+SLO-constrained capacity per method.
+
+LAST_SUCCESSFUL_QPS is the highest ladder level that passed the Vegeta
+thresholds. What a node is sized for is "max rate at p99 < X ms and errors
+< Y %", and in mixed mode each method reaches its SLO at a different ladder
+level. With SLO_SEARCH=true (--slo-search) core/master_qps_executor.sh
+evaluates every round against an SLO spec using the RPC proxy's per-method
+rows inside the round's measurement window, then bisects between each
+method's last passing and first failing level.
+
+SLO spec (SLO_SPEC, JSON; config/slo.example.json). Thresholds that are
+missing or 0 are not checked; methods without an entry use "default",
+which in turn defaults to SLO_P50_MS / SLO_P99_MS / SLO_ERROR_PCT:
+
+    {"default": {"p99_ms": 500, "error_pct": 1.0},
+     "methods": {"eth_call": {"p99_ms": 1500}, "eth_blockNumber": {"p50_ms": 20}}}
+
+Commands:
+- round     per-method calls, rate, p50/p99 and error % of one round from the
+            proxy sink (raw or aggregate), checked against the SLO; appends
+            one row per method to the rounds CSV
+- next      next ladder QPS to try: the midpoint of the widest gap between a
+            method's last passing and first failing level, or nothing once
+            every gap is within --resolution
+- capacity  per-method SLO capacity as JSON: the highest passing level below
+            the first failing one, that level's per-method call rate, and
+            whether a failing level bounded it
+
+    python3 analysis/slo_capacity.py round --proxy-csv proxy_method.csv \
+        --qps 2000 --start 1781179200 --end 1781179260 --spec slo.json \
+        --csv slo_rounds.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.per_method_attribution import (  # noqa: E402
+    ProxyAggregate, ProxySinkRow, hist_bucket, hist_percentile_ms, percentile, read_proxy_sink,
+)
+
+CSV_COLUMNS = ("qps", "method", "calls", "rate", "p50_ms", "p99_ms", "error_pct", "passed", "violations")
+SLO_KEYS = ("p50_ms", "p99_ms", "error_pct")
+
+
+@dataclass
+class Slo:
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    error_pct: float = 0.0
+
+    def violations(self, p50_ms: float, p99_ms: float, error_pct: float) -> list[str]:
+        out = []
+        if self.p50_ms > 0 and p50_ms > self.p50_ms:
+            out.append("p50")
+        if self.p99_ms > 0 and p99_ms > self.p99_ms:
+            out.append("p99")
+        if self.error_pct > 0 and error_pct > self.error_pct:
+            out.append("errors")
+        return out
+
+
+@dataclass
+class SloSpec:
+    default: Slo
+    methods: dict[str, Slo]
+
+    def for_method(self, method: str) -> Slo:
+        return self.methods.get(method, self.default)
+
+
+def _slo(raw: object, base: Slo, where: str) -> Slo:
+    if not isinstance(raw, dict):
+        raise ValueError(f"'{where}' must be an object")
+    unknown = set(raw) - set(SLO_KEYS)
+    if unknown:
+        raise ValueError(f"'{where}' has unknown keys: {', '.join(sorted(unknown))}")
+    values = {k: getattr(base, k) for k in SLO_KEYS}
+    for key, value in raw.items():
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            raise ValueError(f"'{where}.{key}' must be a non-negative number")
+        values[key] = float(value)
+    return Slo(**values)
+
+
+def load_slo_spec(path: str | Path | None, default: Slo) -> SloSpec:
+    """SLO spec from a JSON file; without one every method uses default."""
+    if not path:
+        return SloSpec(default, {})
+    with open(path) as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("SLO spec must be a JSON object")
+    base = _slo(raw.get("default", {}), default, "default")
+    methods = raw.get("methods", {})
+    if not isinstance(methods, dict):
+        raise ValueError("'methods' must be an object")
+    return SloSpec(base, {name: _slo(slo, base, f"methods.{name}") for name, slo in methods.items()})
+
+
+def round_rows(rows: Iterable[ProxySinkRow], qps: int, start_s: int, end_s: int, spec: SloSpec) -> list[dict]:
+    """Per-method results of the sink rows in [start_s, end_s), checked against the spec."""
+    latencies: dict[str, list[float]] = defaultdict(list)
+    hists: dict[str, dict[int, int]] = {}
+    max_us: dict[str, int] = defaultdict(int)
+    calls: dict[str, int] = defaultdict(int)
+    errors: dict[str, int] = defaultdict(int)
+    for r in rows:
+        if isinstance(r, ProxyAggregate):
+            if not start_s <= r.timestamp_s < end_s:
+                continue
+            hist = hists.setdefault(r.method_name, {})
+            for idx, n in r.hist.items():
+                hist[idx] = hist.get(idx, 0) + n
+            max_us[r.method_name] = max(max_us[r.method_name], r.latency_max_us)
+            calls[r.method_name] += r.count
+            errors[r.method_name] += r.rpc_errors + r.transport_errors
+            continue
+        if not start_s <= r.timestamp_ns // 1_000_000_000 < end_s:
+            continue
+        latencies[r.method_name].append(r.latency_ms)
+        calls[r.method_name] += 1
+        if not (r.transport_success and r.rpc_success):
+            errors[r.method_name] += 1
+
+    duration = max(1, end_s - start_s)
+    out = []
+    for method in sorted(calls):
+        if method in hists:
+            # a sink has one format, but fold raw rows in if both show up
+            hist = hists[method]
+            for lat in latencies.get(method, ()):
+                idx = hist_bucket(lat * 1000)
+                hist[idx] = hist.get(idx, 0) + 1
+                max_us[method] = max(max_us[method], round(lat * 1000))
+            p50, p99 = (hist_percentile_ms(hist, p, max_us[method]) for p in (0.5, 0.99))
+        else:
+            lats = sorted(latencies[method])
+            p50, p99 = percentile(lats, 50), percentile(lats, 99)
+        error_pct = errors[method] * 100.0 / calls[method]
+        violations = spec.for_method(method).violations(p50, p99, error_pct)
+        out.append({
+            "qps": qps, "method": method, "calls": calls[method], "rate": calls[method] / duration,
+            "p50_ms": p50, "p99_ms": p99, "error_pct": error_pct,
+            "passed": not violations, "violations": ";".join(violations),
+        })
+    return out
+
+
+def append_csv(path: str, rows: Sequence[dict]) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        for row in rows:
+            writer.writerow([round(row[k], 3) if isinstance(row[k], float) else
+                             str(row[k]).lower() if isinstance(row[k], bool) else row[k]
+                             for k in CSV_COLUMNS])
+
+
+def read_rounds(path: str | Path) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    rows = []
+    with open(path, newline="") as f:
+        for r in csv.DictReader(f):
+            rows.append({"qps": int(r["qps"]), "method": r["method"], "calls": int(r["calls"]),
+                         "rate": float(r["rate"]), "p50_ms": float(r["p50_ms"]), "p99_ms": float(r["p99_ms"]),
+                         "error_pct": float(r["error_pct"]), "passed": r["passed"] == "true",
+                         "violations": r.get("violations", "")})
+    return rows
+
+
+def capacity(rounds: Sequence[dict], spec: SloSpec | None = None) -> dict:
+    """Highest passing level below each method's first failing level.
+
+    Latency is taken to grow with load, so a passing level above a failing
+    one is noise and does not count.
+    """
+    by_method: dict[str, dict[int, dict]] = defaultdict(dict)
+    for r in rounds:
+        # a repeated level counts as failing if any repetition failed
+        prev = by_method[r["method"]].get(r["qps"])
+        if prev is None or (prev["passed"] and not r["passed"]):
+            by_method[r["method"]][r["qps"]] = r
+
+    methods = {}
+    for method, levels in sorted(by_method.items()):
+        failing = sorted(q for q, r in levels.items() if not r["passed"])
+        first_fail = failing[0] if failing else None
+        passing = [q for q, r in levels.items() if r["passed"] and (first_fail is None or q < first_fail)]
+        best = levels[max(passing)] if passing else None
+        entry = {
+            "max_qps": best["qps"] if best else 0,
+            "max_rate": round(best["rate"], 3) if best else 0.0,
+            "p50_ms": round(best["p50_ms"], 3) if best else None,
+            "p99_ms": round(best["p99_ms"], 3) if best else None,
+            "error_pct": round(best["error_pct"], 3) if best else None,
+            "first_failing_qps": first_fail,
+            "failed_on": levels[first_fail]["violations"] if first_fail is not None else "",
+            "bounded": first_fail is not None,
+        }
+        if spec is not None:
+            slo = spec.for_method(method)
+            entry["slo"] = {k: getattr(slo, k) for k in SLO_KEYS}
+        methods[method] = entry
+
+    binding = min(methods, key=lambda m: methods[m]["max_qps"]) if methods else None
+    return {
+        "methods": methods,
+        # the whole mix meets the SLO up to its first method's limit
+        "max_qps": methods[binding]["max_qps"] if binding else 0,
+        "binding_method": binding,
+        "all_bounded": bool(methods) and all(m["bounded"] for m in methods.values()),
+    }
+
+
+def next_qps(rounds: Sequence[dict], resolution: int) -> int | None:
+    """Midpoint of the widest unresolved gap between passing and failing levels;
+    on a tie the lower gap, which bounds the whole mix first."""
+    tested = {r["qps"] for r in rounds}
+    candidates = []
+    for entry in capacity(rounds)["methods"].values():
+        if not entry["bounded"]:
+            continue
+        lo, hi = entry["max_qps"], entry["first_failing_qps"]
+        mid = (lo + hi) // 2
+        if hi - lo > max(1, resolution) and mid > 0 and mid not in tested:
+            candidates.append((hi - lo, -mid))
+    return -max(candidates)[1] if candidates else None
+
+
+def _default_slo(args: argparse.Namespace) -> Slo:
+    return Slo(args.p50_ms, args.p99_ms, args.error_pct)
+
+
+def _cmd_round(args: argparse.Namespace) -> int:
+    spec = load_slo_spec(args.spec, _default_slo(args))
+    rows = round_rows(read_proxy_sink(args.proxy_csv), args.qps, args.start, args.end, spec)
+    if not rows:
+        print(f"❌ No proxy rows in [{args.start}, {args.end}) of {args.proxy_csv}", file=sys.stderr)
+        return 1
+    if args.csv:
+        append_csv(args.csv, rows)
+    print(json.dumps({r["method"]: r["passed"] for r in rows}))
+    return 0
+
+
+def _cmd_next(args: argparse.Namespace) -> int:
+    qps = next_qps(read_rounds(args.rounds), args.resolution)
+    if qps is not None:
+        print(qps)
+    return 0
+
+
+def _cmd_capacity(args: argparse.Namespace) -> int:
+    result = capacity(read_rounds(args.rounds), load_slo_spec(args.spec, _default_slo(args)))
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps(result))
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="SLO-constrained capacity per method")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    def slo_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--spec", help="SLO spec (JSON); per-method thresholds over the defaults")
+        p.add_argument("--p50-ms", type=float, default=0.0, help="default p50 bound (ms, 0 = unchecked)")
+        p.add_argument("--p99-ms", type=float, default=0.0, help="default p99 bound (ms, 0 = unchecked)")
+        p.add_argument("--error-pct", type=float, default=0.0, help="default error bound (%%, 0 = unchecked)")
+
+    rnd = sub.add_parser("round", help="check one round's per-method results against the SLO")
+    rnd.add_argument("--proxy-csv", required=True, help="proxy sink CSV (raw or aggregate)")
+    rnd.add_argument("--qps", type=int, required=True, help="ladder QPS of the round")
+    rnd.add_argument("--start", type=int, required=True, help="measurement start (epoch s)")
+    rnd.add_argument("--end", type=int, required=True, help="measurement end (epoch s)")
+    rnd.add_argument("--csv", help="rounds CSV to append to")
+    slo_args(rnd)
+    rnd.set_defaults(func=_cmd_round)
+
+    nxt = sub.add_parser("next", help="print the next QPS to try, if any")
+    nxt.add_argument("--rounds", required=True, help="rounds CSV")
+    nxt.add_argument("--resolution", type=int, default=50, help="stop once every gap is this narrow (QPS)")
+    nxt.set_defaults(func=_cmd_next)
+
+    cap = sub.add_parser("capacity", help="per-method SLO capacity as JSON")
+    cap.add_argument("--rounds", required=True, help="rounds CSV")
+    cap.add_argument("--output", help="write the JSON here as well")
+    slo_args(cap)
+    cap.set_defaults(func=_cmd_capacity)
+
+    args = ap.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
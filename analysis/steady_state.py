@@ -0,0 +1,176 @@
+"""
+Steady-state detection for QPS warmup.
+
+The executor drives real load at the round's target rate before measuring:
+
+    vegeta attack -rate=<qps> -duration=<cap>s ... | vegeta encode -to json \
+        | python3 analysis/steady_state.py --window 5 ...
+
+Results are bucketed per second by request start time. A second is treated as
+complete once results from two seconds later have arrived. Load is steady
+when, over the last `window` complete seconds compared with the `window`
+seconds before them:
+
+- every second has results;
+- the window's mean latency moved by at most `tolerance` (relative);
+- the coefficient of variation of the per-second mean latency is at most
+  `cv_max`;
+- the success rate moved by at most `success_tolerance` (absolute, 0-1).
+
+The detector also waits at least `min_s` seconds. On steady state it prints
+one JSON line and exits, which closes the pipe and stops Vegeta. If the
+stream ends first (the warmup cap was reached), it reports steady=false.
+
+Output (stdout, one line):
+    {"steady": bool, "warmup_s": float, "reason": "steady"|"cap"|"no_data",
+     "mean_latency_ms": float, "success_rate": float}
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable, TextIO
+
+_COMPLETE_LAG_S = 2
+
+
+@dataclass
+class SecondBucket:
+    count: int = 0
+    ok: int = 0
+    latency_sum_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.latency_sum_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class SteadyStateDetector:
+    window: int = 5
+    tolerance: float = 0.10
+    cv_max: float = 0.20
+    success_tolerance: float = 0.01
+    min_s: int = 10
+    buckets: dict[int, SecondBucket] = field(default_factory=dict)
+    origin: float | None = None
+    latest_s: int = -1
+
+    def add(self, start_epoch_s: float, latency_ms: float, ok: bool) -> None:
+        if self.origin is None:
+            self.origin = start_epoch_s
+        sec = max(int(start_epoch_s - self.origin), 0)
+        b = self.buckets.setdefault(sec, SecondBucket())
+        b.count += 1
+        b.ok += int(ok)
+        b.latency_sum_ms += latency_ms
+        self.latest_s = max(self.latest_s, sec)
+
+    def complete_seconds(self) -> int:
+        """Number of leading seconds whose results are all in."""
+        return max(self.latest_s - _COMPLETE_LAG_S + 1, 0)
+
+    def _window_stats(self, start: int, end: int) -> tuple[float, float, float] | None:
+        """(mean latency ms, per-second CV, success rate) over [start, end)."""
+        secs = [self.buckets.get(s) for s in range(start, end)]
+        if any(b is None or b.count == 0 for b in secs):
+            return None
+        means = [b.mean_ms for b in secs]
+        total = sum(b.count for b in secs)
+        mean = sum(b.latency_sum_ms for b in secs) / total
+        per_sec_mean = sum(means) / len(means)
+        var = sum((m - per_sec_mean) ** 2 for m in means) / len(means)
+        cv = math.sqrt(var) / per_sec_mean if per_sec_mean > 0 else 0.0
+        return mean, cv, sum(b.ok for b in secs) / total
+
+    def check(self) -> dict | None:
+        """Return the steady-state result once reached, else None."""
+        done = self.complete_seconds()
+        if done < max(self.min_s, 2 * self.window):
+            return None
+        cur = self._window_stats(done - self.window, done)
+        prev = self._window_stats(done - 2 * self.window, done - self.window)
+        if cur is None or prev is None:
+            return None
+        mean, cv, success = cur
+        prev_mean, _, prev_success = prev
+        drift = abs(mean - prev_mean) / prev_mean if prev_mean > 0 else 0.0
+        if drift <= self.tolerance and cv <= self.cv_max and abs(success - prev_success) <= self.success_tolerance:
+            return self.result(True, "steady", done, mean, success)
+        return None
+
+    def result(self, steady: bool, reason: str, seconds: float,
+               mean_ms: float = 0.0, success: float = 0.0) -> dict:
+        return {
+            "steady": steady,
+            "warmup_s": round(float(seconds), 3),
+            "reason": reason,
+            "mean_latency_ms": round(mean_ms, 3),
+            "success_rate": round(success, 4),
+        }
+
+    def final(self) -> dict:
+        """Result when the stream ended without reaching steady state."""
+        if not self.buckets:
+            return self.result(False, "no_data", 0)
+        total = sum(b.count for b in self.buckets.values())
+        mean = sum(b.latency_sum_ms for b in self.buckets.values()) / total
+        ok = sum(b.ok for b in self.buckets.values()) / total
+        return self.result(False, "cap", self.latest_s + 1, mean, ok)
+
+
+def parse_rfc3339(ts: str) -> float:
+    # Vegeta emits nanosecond precision; datetime handles microseconds.
+    ts = ts.replace("Z", "+00:00")
+    if "." in ts:
+        head, rest = ts.split(".", 1)
+        digits = "".join(ch for ch in rest if ch.isdigit())
+        ts = f"{head}.{digits[:6]}{rest[len(digits):]}"
+    return datetime.fromisoformat(ts).timestamp()
+
+
+def run(lines: Iterable[str], detector: SteadyStateDetector, out: TextIO) -> dict:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            r = json.loads(line)
+            start = parse_rfc3339(r["timestamp"])
+            latency_ms = float(r.get("latency", 0)) / 1e6
+            ok = 200 <= int(r.get("code", 0)) < 400 and not r.get("error")
+        except (KeyError, ValueError, TypeError):
+            continue
+        detector.add(start, latency_ms, ok)
+        result = detector.check()
+        if result is not None:
+            print(json.dumps(result), file=out, flush=True)
+            return result
+    result = detector.final()
+    print(json.dumps(result), file=out, flush=True)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Detect steady state in a Vegeta JSON result stream (stdin)")
+    ap.add_argument("--window", type=int, default=5, help="seconds per comparison window")
+    ap.add_argument("--tolerance", type=float, default=0.10, help="max relative change of window mean latency")
+    ap.add_argument("--cv-max", type=float, default=0.20, help="max CV of per-second mean latency")
+    ap.add_argument("--success-tolerance", type=float, default=0.01, help="max change of success rate (0-1)")
+    ap.add_argument("--min", dest="min_s", type=int, default=10, help="minimum warmup seconds")
+    args = ap.parse_args(argv)
+    detector = SteadyStateDetector(
+        window=max(args.window, 1), tolerance=args.tolerance, cv_max=args.cv_max,
+        success_tolerance=args.success_tolerance, min_s=args.min_s,
+    )
+    run(sys.stdin, detector, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
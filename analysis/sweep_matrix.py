@@ -0,0 +1,342 @@
+"""
+Multi-dimensional sweep: QPS x max connections x keep-alive x method mix.
+
+The QPS ladder only varies Vegeta's -rate; connection handling limits and the
+method mix stay fixed for the whole run. lib/sweep.sh runs every cell of a
+matrix spec instead:
+
+    {
+      "qps": [1000, 2000, 4000],
+      "max_connections": [64, 512],
+      "keepalive": [true, false],
+      "mixes": {"default": null, "balance_heavy": {"eth_getBalance": 8, "eth_blockNumber": 2}},
+      "duration": 30, "repeats": 1, "seed": 42, "warmup": 60, "pause": 5
+    }
+
+A mix of null uses the regular targets file of the run's RPC mode; a weight
+map replaces rpc_methods.mixed_weighted for that variant. Cells run in a
+seeded random order so slow drift (page cache, compaction, thermal) does not
+line up with one dimension, after one shared warmup.
+
+Commands:
+- plan       print the randomized cell schedule (TSV) and the mix variants
+- summarize  join the schedule with the per-cell Vegeta reports into a tidy
+             CSV (one row per cell) and the best sustainable QPS per
+             configuration (mix, max connections, keep-alive) as JSON/Markdown
+
+A QPS level is sustainable for a configuration when every repetition meets
+SUCCESS_RATE_THRESHOLD and MAX_LATENCY_THRESHOLD (the rule of
+core/master_qps_executor.sh) and so does every lower level of that
+configuration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import random
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Sequence
+
+DEFAULT_MIX = "default"
+_MIX_NAME_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+RESULT_COLUMNS = (
+    "order", "cell_id", "config_id", "mix", "max_connections", "keepalive", "qps", "rep",
+    "started_at", "ended_at", "requests", "success_pct", "throughput",
+    "mean_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms", "passed",
+)
+
+
+@dataclass
+class SweepSpec:
+    qps: list[int]
+    max_connections: list[int]
+    keepalive: list[bool]
+    mixes: dict[str, dict[str, int] | None]
+    duration: int = 30
+    repeats: int = 1
+    seed: int | None = None
+    warmup: int = 60
+    pause: int = 5
+
+
+@dataclass
+class Cell:
+    cell_id: str
+    mix: str
+    max_connections: int
+    keepalive: bool
+    qps: int
+    rep: int
+
+    @property
+    def config_id(self) -> str:
+        return config_id(self.mix, self.max_connections, self.keepalive)
+
+
+@dataclass
+class ConfigResult:
+    config_id: str
+    mix: str
+    max_connections: int
+    keepalive: bool
+    best_sustainable_qps: int
+    first_failing_qps: int | None
+    levels: list[dict] = field(default_factory=list)
+
+
+def config_id(mix: str, max_connections: int, keepalive: bool) -> str:
+    return f"{mix}/c{max_connections}/ka-{'on' if keepalive else 'off'}"
+
+
+def _positive_ints(value, key: str) -> list[int]:
+    if not isinstance(value, list) or not value:
+        raise ValueError(f"'{key}' must be a non-empty list")
+    if not all(isinstance(v, int) and not isinstance(v, bool) and v > 0 for v in value):
+        raise ValueError(f"'{key}' must contain positive integers")
+    return sorted(set(value))
+
+
+def parse_spec(data: dict) -> SweepSpec:
+    """Validate a matrix spec; raises ValueError with the offending key."""
+    if not isinstance(data, dict):
+        raise ValueError("sweep spec must be a JSON object")
+    keepalive = data.get("keepalive", [True])
+    if not isinstance(keepalive, list) or not keepalive or not all(isinstance(v, bool) for v in keepalive):
+        raise ValueError("'keepalive' must be a non-empty list of true/false")
+    mixes = data.get("mixes", {DEFAULT_MIX: None})
+    if not isinstance(mixes, dict) or not mixes:
+        raise ValueError("'mixes' must be a non-empty object")
+    for name, weights in mixes.items():
+        if not _MIX_NAME_RE.match(name):
+            raise ValueError(f"mix name '{name}' may only use letters, digits, '_' and '-'")
+        if weights is None:
+            continue
+        if not isinstance(weights, dict) or not weights or not all(
+                isinstance(w, int) and not isinstance(w, bool) and w > 0 for w in weights.values()):
+            raise ValueError(f"mix '{name}' must map method names to positive integer weights")
+    spec = SweepSpec(
+        qps=_positive_ints(data.get("qps"), "qps"),
+        max_connections=_positive_ints(data.get("max_connections"), "max_connections"),
+        keepalive=sorted(set(keepalive), reverse=True),
+        mixes=dict(mixes),
+    )
+    for key in ("duration", "repeats", "warmup", "pause"):
+        if key in data:
+            value = data[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < (1 if key in ("duration", "repeats") else 0):
+                raise ValueError(f"'{key}' must be a non-negative integer (duration/repeats >= 1)")
+            setattr(spec, key, value)
+    if data.get("seed") is not None:
+        if not isinstance(data["seed"], int) or isinstance(data["seed"], bool):
+            raise ValueError("'seed' must be an integer")
+        spec.seed = data["seed"]
+    return spec
+
+
+def load_spec(path: str | Path) -> SweepSpec:
+    with open(path) as f:
+        return parse_spec(json.load(f))
+
+
+def expand(spec: SweepSpec) -> list[Cell]:
+    """All cells of the matrix in declaration order."""
+    cells = []
+    for rep in range(spec.repeats):
+        for mix in spec.mixes:
+            for conns in spec.max_connections:
+                for keepalive in spec.keepalive:
+                    for qps in spec.qps:
+                        cid = f"r{rep}_{mix}_c{conns}_ka{int(keepalive)}_{qps}qps"
+                        cells.append(Cell(cid, mix, conns, keepalive, qps, rep))
+    return cells
+
+
+def schedule(cells: Sequence[Cell], seed: int | None) -> list[Cell]:
+    """Seeded random order; the same spec and seed give the same schedule."""
+    order = list(cells)
+    random.Random(seed).shuffle(order)
+    return order
+
+
+def mix_argument(weights: dict[str, int] | None) -> str:
+    """tools/target_generator.sh --mix value; empty for the default targets file."""
+    if not weights:
+        return ""
+    return ",".join(f"{method}={weight}" for method, weight in weights.items())
+
+
+def read_report(path: str | Path) -> dict | None:
+    """Metrics of one `vegeta report -type=json` output (latencies in ns)."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    lat = data.get("latencies") or {}
+
+    def ms(key: str) -> float:
+        return float(lat.get(key, 0) or 0) / 1e6
+
+    return {
+        "requests": int(data.get("requests", 0) or 0),
+        "success_pct": float(data.get("success", 0) or 0) * 100.0,
+        "throughput": float(data.get("throughput", 0) or 0),
+        "mean_ms": ms("mean"),
+        "p50_ms": ms("50th"),
+        "p90_ms": ms("90th"),
+        "p99_ms": ms("99th"),
+        "max_ms": ms("max"),
+    }
+
+
+def collect(schedule_rows: Sequence[dict], cells_dir: str | Path,
+            success_pct_min: float, latency_ms_max: float) -> list[dict]:
+    """One tidy row per scheduled cell; cells without a report count as failed."""
+    rows = []
+    for sched in schedule_rows:
+        keepalive = str(sched["keepalive"]).lower() in ("1", "true")
+        metrics = read_report(Path(cells_dir) / f"{sched['cell_id']}.json")
+        row = {
+            "order": int(sched["order"]),
+            "cell_id": sched["cell_id"],
+            "config_id": config_id(sched["mix"], int(sched["max_connections"]), keepalive),
+            "mix": sched["mix"],
+            "max_connections": int(sched["max_connections"]),
+            "keepalive": keepalive,
+            "qps": int(sched["qps"]),
+            "rep": int(sched["rep"]),
+            "started_at": sched.get("started_at", ""),
+            "ended_at": sched.get("ended_at", ""),
+        }
+        if metrics is None:
+            row.update({k: None for k in RESULT_COLUMNS if k not in row})
+            row["passed"] = False
+        else:
+            row.update(metrics)
+            row["passed"] = (metrics["requests"] > 0 and metrics["success_pct"] >= success_pct_min
+                             and metrics["mean_ms"] <= latency_ms_max)
+        rows.append(row)
+    return sorted(rows, key=lambda r: r["order"])
+
+
+def best_sustainable(rows: Sequence[dict]) -> list[ConfigResult]:
+    """Per configuration: highest QPS whose level and all lower levels passed."""
+    results = []
+    for cid in sorted({r["config_id"] for r in rows}):
+        mine = [r for r in rows if r["config_id"] == cid]
+        best, first_fail, levels = 0, None, []
+        for qps in sorted({r["qps"] for r in mine}):
+            at_level = [r for r in mine if r["qps"] == qps]
+            passed = all(r["passed"] for r in at_level)
+            p99 = [r["p99_ms"] for r in at_level if r["p99_ms"] is not None]
+            levels.append({"qps": qps, "passed": passed, "runs": len(at_level),
+                           "p99_ms": max(p99) if p99 else None})
+            if first_fail is None:
+                if passed:
+                    best = qps
+                else:
+                    first_fail = qps
+        head = mine[0]
+        results.append(ConfigResult(cid, head["mix"], head["max_connections"], head["keepalive"],
+                                    best, first_fail, levels))
+    return sorted(results, key=lambda c: (-c.best_sustainable_qps, c.config_id))
+
+
+def read_schedule(path: str | Path) -> list[dict]:
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def write_results(rows: Sequence[dict], path: str | Path) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: ("" if row.get(k) is None else
+                                 round(row[k], 3) if isinstance(row[k], float) else row[k])
+                             for k in RESULT_COLUMNS})
+
+
+def render_markdown(configs: Sequence[ConfigResult]) -> str:
+    lines = [
+        "# Sweep: best sustainable QPS per configuration",
+        "",
+        "| Mix | Max connections | Keep-alive | Best sustainable QPS | First failing QPS |",
+        "|---|---|---|---|---|",
+    ]
+    for c in configs:
+        lines.append(f"| {c.mix} | {c.max_connections} | {'on' if c.keepalive else 'off'} "
+                     f"| {c.best_sustainable_qps} | {c.first_failing_qps if c.first_failing_qps else '-'} |")
+    return "\n".join(lines) + "\n"
+
+
+def _cmd_plan(args: argparse.Namespace) -> int:
+    spec = load_spec(args.spec)
+    if args.mixes:
+        for name, weights in spec.mixes.items():
+            print(f"{name}\t{mix_argument(weights)}")
+        return 0
+    print("order\tcell_id\tmix\tmax_connections\tkeepalive\tqps\trep")
+    for i, cell in enumerate(schedule(expand(spec), spec.seed)):
+        print(f"{i}\t{cell.cell_id}\t{cell.mix}\t{cell.max_connections}\t"
+              f"{str(cell.keepalive).lower()}\t{cell.qps}\t{cell.rep}")
+    return 0
+
+
+def _cmd_summarize(args: argparse.Namespace) -> int:
+    sched = read_schedule(args.schedule)
+    if not sched:
+        print(f"❌ Empty sweep schedule: {args.schedule}", file=sys.stderr)
+        return 1
+    rows = collect(sched, args.cells_dir, args.success_threshold, args.latency_threshold)
+    write_results(rows, args.results)
+    configs = best_sustainable(rows)
+    payload = {
+        "success_threshold": args.success_threshold,
+        "latency_threshold_ms": args.latency_threshold,
+        "cells": len(rows),
+        "configs": [asdict(c) for c in configs],
+    }
+    with open(args.output, "w") as f:
+        json.dump(payload, f, indent=2)
+    if args.markdown:
+        Path(args.markdown).write_text(render_markdown(configs))
+    print(f"✅ Sweep summary: {len(rows)} cells, {len(configs)} configurations → {args.results}")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Plan and summarize a multi-dimensional Vegeta sweep")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    plan = sub.add_parser("plan", help="print the randomized cell schedule as TSV")
+    plan.add_argument("--spec", required=True, help="sweep matrix spec (JSON)")
+    plan.add_argument("--mixes", action="store_true", help="print '<name>\\t<method=weight,...>' per mix instead")
+    plan.set_defaults(func=_cmd_plan)
+
+    summ = sub.add_parser("summarize", help="tidy per-cell CSV and best sustainable QPS per configuration")
+    summ.add_argument("--schedule", required=True, help="schedule CSV written by lib/sweep.sh")
+    summ.add_argument("--cells-dir", required=True, help="directory of <cell_id>.json Vegeta reports")
+    summ.add_argument("--results", required=True, help="tidy per-cell results CSV path")
+    summ.add_argument("--output", required=True, help="sweep_summary.json path")
+    summ.add_argument("--markdown", help="optional Markdown summary path")
+    summ.add_argument("--success-threshold", type=float, default=95.0, help="min success rate (%%)")
+    summ.add_argument("--latency-threshold", type=float, default=1000.0, help="max mean latency (ms)")
+    summ.set_defaults(func=_cmd_summarize)
+
+    args = ap.parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Universal Scalability Law capacity model fitted across QPS rounds.
+
+The cliff checks in qps_analyzer.py and rpc_deep_analyzer.py compare each
+level with the previous one. This fits one model to every round instead:
+
+    X(N) = lambda * N / (1 + sigma * (N - 1) + kappa * N * (N - 1))
+
+X is a round's achieved throughput and N its mean concurrency by Little's
+law, the achieved request rate times the mean latency. lambda is the
+throughput of one request in flight, sigma the contention (serialized
+share) and kappa the coherency (crosstalk) coefficient. With kappa > 0,
+throughput peaks at N* = sqrt((1 - sigma) / kappa); past the knee, more
+load only adds latency.
+
+Rounds come from the session's `vegeta report -type=json` files, QPS and
+closed-loop rounds alike. Rounds limited by the load generator
+(GENERATOR_ROUNDS_CSV) are left out. Bounds are 95% percentile intervals
+from a seeded bootstrap over rounds. The knee counts as bracketed once the
+peak-throughput interval is narrower than --ci-width of the estimate and
+measured rounds lie on both sides of N*, so an intensive ramp can stop
+there (USL_EARLY_STOP).
+
+    python3 analysis/usl_model.py --vegeta-dir current/vegeta_results \
+        --session 20260611_120000 --generator-csv generator_rounds.csv \
+        --output usl_model.json
+
+Writes the model with its rounds to --output and prints the model without
+the rounds as one JSON line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+import warnings
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.generator_saturation import load_limited_qps  # noqa: E402
+
+_REPORT_RE = re.compile(r"^vegeta_(\d+)(qps|conc)_(.+)\.json$")
+
+
+@dataclass
+class Round:
+    label: str              # "2000qps" or "64conc"
+    qps: int                # ladder rate, 0 for closed-loop rounds
+    rate: float             # achieved request rate (req/s)
+    throughput: float       # successful responses per second
+    mean_latency_ms: float
+    concurrency: float      # rate * mean latency (Little's law)
+
+
+def read_vegeta_rounds(directory: str | Path, session: str | None = None,
+                       exclude_qps: set[int] | None = None) -> list[Round]:
+    """Rounds of one session's Vegeta JSON reports, by increasing concurrency."""
+    rounds = []
+    for path in glob.glob(os.path.join(directory, "vegeta_*.json")):
+        m = _REPORT_RE.match(os.path.basename(path))
+        if not m or (session and m.group(3) != session):
+            continue
+        level, kind = int(m.group(1)), m.group(2)
+        if kind == "qps" and level in (exclude_qps or set()):
+            continue
+        try:
+            with open(path) as f:
+                report = json.load(f)
+            rate = float(report.get("rate") or 0)
+            mean_ms = float(report["latencies"]["mean"]) / 1e6
+            throughput = float(report.get("throughput") or 0)
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        if rate <= 0 or mean_ms <= 0 or throughput <= 0:
+            continue
+        rounds.append(Round(f"{level}{kind}", level if kind == "qps" else 0, rate, throughput,
+                            mean_ms, rate * mean_ms / 1000.0))
+    rounds.sort(key=lambda r: r.concurrency)
+    return rounds
+
+
+def usl(n, lam: float, sigma: float, kappa: float):
+    n = np.asarray(n, dtype=float)
+    return lam * n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+
+def fit(concurrency: Sequence[float], throughput: Sequence[float]) -> tuple[float, float, float] | None:
+    """Least-squares (lambda, sigma, kappa) with sigma, kappa >= 0, or None."""
+    n = np.asarray(concurrency, dtype=float)
+    x = np.asarray(throughput, dtype=float)
+    if len(np.unique(n)) < 3:
+        return None
+    lam0 = float(np.max(x / np.maximum(n, 1e-9)))
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", OptimizeWarning)
+            params, _ = curve_fit(usl, n, x, p0=(lam0, 0.01, 1e-4),
+                                  bounds=([0, 0, 0], [np.inf, 1, np.inf]), maxfev=20000)
+    except (RuntimeError, ValueError):
+        return None
+    return tuple(float(p) for p in params)
+
+
+def peak(lam: float, sigma: float, kappa: float) -> tuple[float | None, float | None]:
+    """Concurrency and throughput at the knee; (None, None) when kappa is 0."""
+    if kappa <= 0 or sigma >= 1:
+        return None, None
+    n_star = math.sqrt((1 - sigma) / kappa)
+    return n_star, float(usl(n_star, lam, sigma, kappa))
+
+
+def _interval(values: Sequence[float]) -> list[float] | None:
+    return [float(np.percentile(values, 2.5)), float(np.percentile(values, 97.5))] if len(values) else None
+
+
+def model(rounds: Sequence[Round], *, iterations: int = 200, seed: int = 42, ci_width: float = 0.25,
+          min_rounds: int = 4) -> dict:
+    """Fitted coefficients, peak, bootstrap intervals and whether the knee is bracketed."""
+    result = {"rounds_used": len(rounds), "fitted": False, "knee_bracketed": False,
+              "rounds": [asdict(r) for r in rounds]}
+    if len(rounds) < min_rounds:
+        result["reason"] = f"{len(rounds)} round(s), need {min_rounds}"
+        return result
+    n = np.array([r.concurrency for r in rounds])
+    x = np.array([r.throughput for r in rounds])
+    params = fit(n, x)
+    if params is None:
+        result["reason"] = "fit did not converge"
+        return result
+    lam, sigma, kappa = params
+    n_star, x_max = peak(lam, sigma, kappa)
+    predicted = usl(n, lam, sigma, kappa)
+    ss_tot = float(np.sum((x - x.mean()) ** 2))
+    r2 = 1 - float(np.sum((x - predicted) ** 2)) / ss_tot if ss_tot > 0 else 1.0
+
+    rng = np.random.default_rng(seed)
+    samples: dict[str, list[float]] = {"lambda": [], "sigma": [], "kappa": [], "peak_throughput": []}
+    unbounded = 0
+    for _ in range(iterations):
+        idx = rng.integers(0, len(rounds), len(rounds))
+        boot = fit(n[idx], x[idx])
+        if boot is None:
+            continue
+        for key, value in zip(("lambda", "sigma", "kappa"), boot):
+            samples[key].append(value)
+        _, boot_peak = peak(*boot)
+        if boot_peak is None:
+            unbounded += 1
+        else:
+            samples["peak_throughput"].append(boot_peak)
+
+    peak_ci = _interval(samples["peak_throughput"])
+    # a resample without a knee has no finite peak: no usable upper bound
+    if peak_ci and unbounded > 0.025 * (len(samples["peak_throughput"]) + unbounded):
+        peak_ci[1] = None
+    for i, r in enumerate(result["rounds"]):
+        r["predicted_throughput"] = float(predicted[i])
+    result.update({
+        "fitted": True,
+        "lambda": lam, "sigma": sigma, "kappa": kappa,
+        "lambda_ci": _interval(samples["lambda"]),
+        "sigma_ci": _interval(samples["sigma"]),
+        "kappa_ci": _interval(samples["kappa"]),
+        "r2": r2,
+        "peak_concurrency": n_star,
+        "peak_throughput": x_max,
+        "peak_throughput_ci": peak_ci,
+        "bootstrap_fits": len(samples["lambda"]),
+    })
+    if x_max is not None and peak_ci and peak_ci[1] is not None:
+        narrow = (peak_ci[1] - peak_ci[0]) <= ci_width * x_max
+        result["knee_bracketed"] = bool(narrow and n.min() < n_star < n.max())
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Fit the Universal Scalability Law to a session's Vegeta rounds")
+    ap.add_argument("--vegeta-dir", required=True, help="directory of vegeta_<N>qps_<session>.json reports")
+    ap.add_argument("--session", help="only this session's reports")
+    ap.add_argument("--generator-csv", help="GENERATOR_ROUNDS_CSV; generator-limited rounds are left out")
+    ap.add_argument("--min-rounds", type=int, default=4, help="rounds needed before fitting")
+    ap.add_argument("--ci-width", type=float, default=0.25,
+                    help="knee bracketed once the peak interval is this fraction of the peak")
+    ap.add_argument("--iterations", type=int, default=200, help="bootstrap resamples")
+    ap.add_argument("--output", help="write the model with its rounds here")
+    args = ap.parse_args(argv)
+
+    exclude = load_limited_qps(args.generator_csv) if args.generator_csv else set()
+    rounds = read_vegeta_rounds(args.vegeta_dir, args.session, exclude)
+    result = model(rounds, iterations=args.iterations, ci_width=args.ci_width, min_rounds=args.min_rounds)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+    print(json.dumps({k: v for k, v in result.items() if k != "rounds"}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
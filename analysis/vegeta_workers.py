@@ -0,0 +1,148 @@
+"""
+Per-worker achieved rate of a distributed Vegeta round.
+
+lib/vegeta_workers.sh splits a round's rate and targets across N workers
+(local processes or SSH hosts) started in lockstep. Every worker leaves a
+JSON result stream (`vegeta encode -to json`), one line per request.
+
+A worker that sent fewer than (1 - tolerance) x its target rate over the
+round was limited by the load generator, so that round's latency and
+success rate say nothing about the node. The start offset against the
+earliest worker shows how well the lockstep start held.
+
+    python3 analysis/vegeta_workers.py --qps 4000 --duration 60 \
+        --csv vegeta_workers.csv --worker 0:local:2000:w0.jsonl --worker 1:host-b:2000:w1.jsonl
+
+Appends one row per worker to --csv (header on a new file) and prints one
+JSON line:
+    {"qps", "workers", "target_rate", "achieved_rate", "saturated": bool,
+     "saturated_workers": [worker, ...]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from analysis.steady_state import parse_rfc3339  # noqa: E402
+
+CSV_COLUMNS = ("qps", "worker", "host", "target_rate", "requests", "achieved_rate",
+               "success_pct", "start_offset_ms", "saturated")
+
+
+@dataclass
+class WorkerRate:
+    worker: int
+    host: str
+    target_rate: float
+    requests: int = 0
+    achieved_rate: float = 0.0
+    success_pct: float = 0.0
+    first_start: float | None = None
+    start_offset_ms: float | None = None
+    saturated: bool = False
+
+
+def scan_results(lines: Iterable[str]) -> tuple[int, int, float | None]:
+    """(requests, successes, first request start) of one JSON result stream."""
+    requests = ok = 0
+    first = None
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            r = json.loads(line)
+            start = parse_rfc3339(r["timestamp"])
+        except (KeyError, ValueError, TypeError):
+            continue
+        requests += 1
+        if 200 <= int(r.get("code", 0) or 0) < 400 and not r.get("error"):
+            ok += 1
+        if first is None or start < first:
+            first = start
+    return requests, ok, first
+
+
+def measure(workers: Sequence[WorkerRate], paths: Sequence[str | Path],
+            duration_s: float, tolerance: float) -> list[WorkerRate]:
+    """Fill achieved rate, success rate, start offset and the saturation flag."""
+    for worker, path in zip(workers, paths):
+        try:
+            with open(path) as f:
+                requests, ok, first = scan_results(f)
+        except OSError:
+            requests, ok, first = 0, 0, None
+        worker.requests = requests
+        worker.achieved_rate = requests / duration_s if duration_s > 0 else 0.0
+        worker.success_pct = ok * 100.0 / requests if requests else 0.0
+        worker.first_start = first
+        worker.saturated = worker.achieved_rate < worker.target_rate * (1.0 - tolerance)
+    starts = [w.first_start for w in workers if w.first_start is not None]
+    for worker in workers:
+        if worker.first_start is not None:
+            worker.start_offset_ms = (worker.first_start - min(starts)) * 1000.0
+    return list(workers)
+
+
+def parse_worker_arg(value: str) -> tuple[WorkerRate, str]:
+    """'<index>:<host>:<target_rate>:<results path>' (the path may contain ':')."""
+    index, host, rate, path = value.split(":", 3)
+    return WorkerRate(worker=int(index), host=host, target_rate=float(rate)), path
+
+
+def append_csv(path: str | Path, qps: int, workers: Sequence[WorkerRate]) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        for w in workers:
+            writer.writerow([qps, w.worker, w.host, f"{w.target_rate:g}", w.requests,
+                             f"{w.achieved_rate:.2f}", f"{w.success_pct:.2f}",
+                             "" if w.start_offset_ms is None else f"{w.start_offset_ms:.1f}",
+                             str(w.saturated).lower()])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-worker achieved rate of a distributed Vegeta round")
+    ap.add_argument("--qps", type=int, required=True, help="round target rate (all workers)")
+    ap.add_argument("--duration", type=float, required=True, help="round duration (s)")
+    ap.add_argument("--worker", action="append", required=True,
+                    help="<index>:<host>:<target_rate>:<results.jsonl>, once per worker")
+    ap.add_argument("--tolerance", type=float, default=0.05,
+                    help="max relative shortfall of achieved vs target rate")
+    ap.add_argument("--csv", help="per-worker CSV to append to")
+    args = ap.parse_args(argv)
+
+    try:
+        parsed = [parse_worker_arg(v) for v in args.worker]
+    except ValueError:
+        print("❌ --worker expects <index>:<host>:<target_rate>:<results path>", file=sys.stderr)
+        return 1
+    workers = measure([w for w, _ in parsed], [p for _, p in parsed], args.duration, args.tolerance)
+    if args.csv:
+        append_csv(args.csv, args.qps, workers)
+    saturated = [w.worker for w in workers if w.saturated]
+    print(json.dumps({
+        "qps": args.qps,
+        "workers": len(workers),
+        "target_rate": sum(w.target_rate for w in workers),
+        "achieved_rate": round(sum(w.achieved_rate for w in workers), 2),
+        "saturated": bool(saturated),
+        "saturated_workers": saturated,
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -61,6 +61,11 @@ fi
 # Get script directory
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
+# --resume <session> must set SESSION_TIMESTAMP before config_loader.sh
+# derives the session-stamped paths.
+source "${SCRIPT_DIR}/lib/run_checkpoint.sh"
+checkpoint_scan_resume_arg "$@"
+
 # Load configuration and shared functions
 source "${SCRIPT_DIR}/config/config_loader.sh"
 source "${SCRIPT_DIR}/utils/error_handler.sh"
@@ -69,6 +74,38 @@ source "${SCRIPT_DIR}/core/common_functions.sh"
 if [[ -f "${SCRIPT_DIR}/lib/proxy_lifecycle.sh" ]]; then
     source "${SCRIPT_DIR}/lib/proxy_lifecycle.sh"
 fi
+# Per-role cpusets (CPU_ISOLATION_ENABLED=true)
+if [[ -f "${SCRIPT_DIR}/lib/cpu_isolation.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/cpu_isolation.sh"
+fi
+# Observer-effect A/B mode (--observer-ab)
+if [[ -f "${SCRIPT_DIR}/lib/observer_ab.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/observer_ab.sh"
+fi
+# Multi-dimensional sweep mode (--sweep <spec.json>)
+if [[ -f "${SCRIPT_DIR}/lib/sweep.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/sweep.sh"
+fi
+# WebSocket subscription workload (--ws-subscribe)
+if [[ -f "${SCRIPT_DIR}/lib/ws_subscribe.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/ws_subscribe.sh"
+fi
+# JSON-RPC batch-size sweep (--batch-sweep)
+if [[ -f "${SCRIPT_DIR}/lib/batch_sweep.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/batch_sweep.sh"
+fi
+# Per-method isolation profiling (--method-profile)
+if [[ -f "${SCRIPT_DIR}/lib/method_profile.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/method_profile.sh"
+fi
+# Recorded-traffic replay (--replay)
+if [[ -f "${SCRIPT_DIR}/lib/replay.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/replay.sh"
+fi
+# Multi-endpoint comparison (--compare)
+if [[ -f "${SCRIPT_DIR}/lib/compare.sh" ]]; then
+    source "${SCRIPT_DIR}/lib/compare.sh"
+fi
 
 cleanup_memory_share_state() {
     if [[ -z "${MEMORY_SHARE_DIR:-}" ]]; then
@@ -90,6 +127,7 @@ cleanup_memory_share_state() {
     rm -f "${MEMORY_SHARE_DIR}/block_height_time_exceeded.flag" 2>/dev/null || true
     rm -f "${MEMORY_SHARE_DIR}/data_loss_stats.json" 2>/dev/null || true
     rm -f "${MEMORY_SHARE_DIR}/sample_count" 2>/dev/null || true
+    rm -f "${MEMORY_SHARE_DIR}/process_accounting_state.json" 2>/dev/null || true
     rm -f "${MEMORY_SHARE_DIR}"/*.pid "${MEMORY_SHARE_DIR}"/*.lock "${MEMORY_SHARE_DIR}"/*.flag 2>/dev/null || true
 
     if [[ -n "${NODE_HEALTH_CACHE_DIR:-}" ]]; then
@@ -107,6 +145,7 @@ cleanup_reused_runtime_files() {
     rm -f "${PERFORMANCE_LATEST_CSV:-${LOGS_DIR}/performance_latest.csv}" 2>/dev/null || true
     rm -f "${PROXY_METHOD_CSV:-${LOGS_DIR}/proxy_method.csv}" 2>/dev/null || true
     rm -f "${PROXY_SELF_CSV:-${LOGS_DIR}/proxy_self.csv}" 2>/dev/null || true
+    rm -f "${PROXY_OVERHEAD_JSON:-${LOGS_DIR}/proxy_overhead.json}" 2>/dev/null || true
     rm -f "${RPC_PROXY_LOG:-${LOGS_DIR}/rpc_proxy.log}" 2>/dev/null || true
     rm -f "${BLOCK_HEIGHT_DATA_FILE}.buffer" 2>/dev/null || true
 }
@@ -114,7 +153,10 @@ cleanup_reused_runtime_files() {
 prepare_clean_runtime_state() {
     echo "🧹 Preparing clean runtime state..." >&2
     cleanup_memory_share_state
-    cleanup_reused_runtime_files
+    # A resumed run reattaches to the interrupted session's files.
+    if ! checkpoint_resuming; then
+        cleanup_reused_runtime_files
+    fi
     echo "✅ Runtime state prepared" >&2
 }
 
@@ -236,7 +278,9 @@ start_monitoring_system() {
     # Start monitoring coordinator
     if [[ -f "${SCRIPT_DIR}/monitoring/monitoring_coordinator.sh" ]]; then
         echo "🚀 Starting monitoring coordinator..."
-        "${SCRIPT_DIR}/monitoring/monitoring_coordinator.sh" start &
+        local cpu_prefix=""
+        declare -F cpu_isolation_prefix >/dev/null 2>&1 && cpu_prefix="$(cpu_isolation_prefix monitors)"
+        $cpu_prefix "${SCRIPT_DIR}/monitoring/monitoring_coordinator.sh" start &
         local coordinator_pid=$!
         MONITORING_PIDS+=($coordinator_pid)
         echo "✅ Monitoring coordinator started (PID: $coordinator_pid)"
@@ -591,6 +635,16 @@ execute_data_analysis() {
         fi
     done
 
+    # Per-method marginal cost: NNLS of monitor resources on proxied call rates
+    local proxy_csv="${PROXY_METHOD_CSV:-${LOGS_DIR}/proxy_method.csv}"
+    if [[ -s "$proxy_csv" && -f "${SCRIPT_DIR}/analysis/method_cost.py" ]]; then
+        echo "🔍 Executing analysis: method_cost.py"
+        if ! python3 "${SCRIPT_DIR}/analysis/method_cost.py" --proxy-csv "$proxy_csv" \
+                --monitor-csv "$latest_csv" --output "$METHOD_COST_JSON" >/dev/null; then
+            echo "⚠️ Analysis script execution failed: method_cost.py"
+        fi
+    fi
+
     echo "✅ Data analysis completed"
     return 0
 }
@@ -642,6 +696,10 @@ execute_performance_cliff_analysis() {
             # Complete analysis when bottleneck information available
             local max_qps=$(echo "$bottleneck_info" | jq -r '.max_successful_qps // 0')
             local bottleneck_qps=$(echo "$bottleneck_info" | jq -r '.bottleneck_qps // 0')
+            local generator_qps=$(echo "$bottleneck_info" | jq -r '.generator_saturated_qps // 0')
+            if [[ $generator_qps -gt 0 ]]; then
+                echo "⚠️  Load generator limited rounds from ${generator_qps} QPS on (see $(basename "$GENERATOR_ROUNDS_CSV"))"
+            fi
 
             if [[ $max_qps -gt 0 && $bottleneck_qps -gt 0 ]]; then
                 local performance_drop=$(awk "BEGIN {printf \"%.2f\", ($bottleneck_qps - $max_qps) * 100 / $max_qps}")
@@ -787,6 +845,9 @@ generate_final_reports() {
     # Display report location and summary
     display_final_report_summary
 
+    # Reports exist: the session can no longer be resumed
+    checkpoint_mark_completed
+
     # Archive test results - execute after all analysis and report generation completed
     archive_test_results "$@"
 
@@ -931,6 +992,16 @@ cleanup_temp_files() {
     # qps_status.json is archived before final cleanup when archiving succeeds.
 }
 
+# Valued entry-point options must not be the last argument or swallow the
+# next flag; an empty value would otherwise silently skip their mode.
+require_option_value() {
+    local option="$1" value="$2" what="$3"
+    if [[ -z "$value" || "$value" == --* ]]; then
+        echo "❌ ${option} requires ${what}" >&2
+        exit 1
+    fi
+}
+
 # Parse RPC mode parameters
 parse_rpc_mode_args() {
     while [[ $# -gt 0 ]]; do
@@ -947,6 +1018,55 @@ parse_rpc_mode_args() {
                 export SKIP_RPC_PROXY=1
                 shift
                 ;;
+            --calibrate-proxy)
+                export PROXY_CALIBRATION_ENABLED=true
+                shift
+                ;;
+            --observer-ab)
+                export OBSERVER_AB_ENABLED=true
+                shift
+                ;;
+            --sweep)
+                require_option_value "$1" "${2:-}" "a sweep spec file"
+                export SWEEP_SPEC="${2:-}"
+                shift $(( $# > 1 ? 2 : 1 ))
+                ;;
+            --ws-subscribe)
+                export WORKLOAD_TYPE="ws_subscribe"
+                shift
+                ;;
+            --batch-sweep)
+                export WORKLOAD_TYPE="batch_sweep"
+                shift
+                ;;
+            --method-profile)
+                export WORKLOAD_TYPE="method_profile"
+                shift
+                ;;
+            --closed-loop)
+                export LOAD_MODEL="closed"
+                shift
+                ;;
+            --slo-search)
+                export SLO_SEARCH="true"
+                shift
+                ;;
+            --replay)
+                require_option_value "$1" "${2:-}" "a recorded proxy log"
+                export REPLAY_SOURCE="${2:-}"
+                export WORKLOAD_TYPE="replay"
+                shift $(( $# > 1 ? 2 : 1 ))
+                ;;
+            --compare)
+                require_option_value "$1" "${2:-}" "a compare spec file"
+                export COMPARE_SPEC="${2:-}"
+                export WORKLOAD_TYPE="compare"
+                shift $(( $# > 1 ? 2 : 1 ))
+                ;;
+            --resume)
+                # Consumed by checkpoint_scan_resume_arg before config loading.
+                shift $(( $# > 1 ? 2 : 1 ))
+                ;;
             --fake-node)
                 # Optional local fake-node test mode (disabled by default).
                 # Builds and starts tools/fake-node, points LOCAL_RPC_URL to it,
@@ -1093,12 +1213,41 @@ main() {
         fi
     done
 
-    # Save original parameters for subsequent passing
+    # Save original parameters for subsequent passing. A resumed run replays
+    # the arguments stored in the interrupted session's checkpoint.
     local original_args=("$@")
+    if checkpoint_resuming; then
+        if ! checkpoint_load_args; then
+            exit 1
+        fi
+        original_args=("${RESUME_ARGS[@]}")
+        set -- "${original_args[@]}"
+    fi
 
     # Parse RPC mode parameters
     parse_rpc_mode_args "$@"
 
+    # Only the QPS ladder can be resumed; every other run mode follows a
+    # schedule of its own that the checkpoint does not record.
+    if checkpoint_resuming; then
+        local run_mode="${WORKLOAD_TYPE:-http}"
+        if [[ "${OBSERVER_AB_ENABLED:-false}" == "true" ]]; then
+            run_mode="observer_ab"
+        elif [[ -n "${SWEEP_SPEC:-}" ]]; then
+            run_mode="sweep"
+        elif [[ "${SLO_SEARCH:-false}" == "true" ]]; then
+            run_mode="slo_search"
+        elif [[ "${LOAD_MODEL:-open}" != "open" ]]; then
+            run_mode="closed_loop"
+        fi
+        case "$run_mode" in
+            observer_ab|sweep|ws_subscribe|batch_sweep|method_profile|replay|compare|slo_search|closed_loop)
+                echo "❌ --resume is not supported for ${run_mode} runs, only for QPS ladder runs"
+                exit 1
+                ;;
+        esac
+    fi
+
     # Optional fake-node test mode (disabled by default; enabled only with --fake-node).
     # Must run before check_deployment because it points LOCAL_RPC_URL to local fake-node.
     start_fake_node_for_testing
@@ -1118,6 +1267,22 @@ main() {
 
     # Note: Directory initialization completed in config.sh, no need to repeat
 
+    # Optional per-role cpusets: validate the split against the CPU topology,
+    # record it in CPU_LAYOUT_JSON and pin the node before any load starts.
+    if declare -F apply_cpu_isolation >/dev/null 2>&1; then
+        if ! apply_cpu_isolation; then
+            exit 1
+        fi
+    fi
+
+    # A replayed recording usually sits in LOGS_DIR, where Phase 1 clears
+    # the proxy sinks of this run; take a copy first.
+    if [[ "${WORKLOAD_TYPE:-http}" == "replay" ]] && declare -F replay_stage_recording >/dev/null 2>&1; then
+        if ! replay_stage_recording; then
+            exit 1
+        fi
+    fi
+
     # Phase 1: Start RPC proxy before target generation so Vegeta targets
     # contain the proxy URL instead of the raw upstream URL.
     echo "📋 Phase 1: Start RPC proxy"
@@ -1134,6 +1299,55 @@ main() {
         exit 1
     fi
 
+    # Phase 2.5: Optional proxy-overhead calibration. Runs before monitoring so
+    # calibration traffic does not show up in the monitored QPS rounds.
+    # A resumed run keeps the interrupted session's calibration.
+    if declare -F run_proxy_calibration >/dev/null 2>&1 && ! checkpoint_resuming; then
+        run_proxy_calibration || true
+    fi
+
+    # Observer-effect A/B mode replaces Phases 3-7: matched rounds per
+    # monitoring profile, summarized into reports/observer_effect.{json,md}.
+    if [[ "${OBSERVER_AB_ENABLED:-false}" == "true" ]] && declare -F run_observer_ab >/dev/null 2>&1; then
+        echo "📋 Observer A/B: monitoring profiles ${OBSERVER_AB_PROFILES:-full,minimal,off}"
+        local ab_rc=0
+        run_observer_ab || ab_rc=$?
+        if declare -F stop_rpc_proxy >/dev/null 2>&1; then
+            stop_rpc_proxy || true
+        fi
+        if [[ $ab_rc -ne 0 ]]; then
+            echo "❌ Observer A/B run failed"
+            exit 1
+        fi
+        echo "🎉 Observer A/B completed: ${REPORTS_DIR}/observer_effect.md"
+        return 0
+    fi
+
+    if [[ "${WORKLOAD_TYPE:-http}" == "compare" ]]; then
+        if [[ -z "${COMPARE_SPEC:-}" || ! -s "$COMPARE_SPEC" ]]; then
+            echo "❌ Compare spec not found: ${COMPARE_SPEC:-<unset>}"
+            exit 1
+        fi
+    fi
+    if [[ "${SLO_SEARCH:-false}" == "true" ]]; then
+        if [[ "${SKIP_RPC_PROXY:-0}" == "1" ]]; then
+            echo "❌ SLO capacity search reads per-method latency from the RPC proxy; drop --no-proxy"
+            exit 1
+        fi
+        if [[ -n "${SLO_SPEC:-}" && ! -s "$SLO_SPEC" ]]; then
+            echo "❌ SLO spec not found: $SLO_SPEC"
+            exit 1
+        fi
+    fi
+
+    # Checkpoint: new runs record their arguments; resumed runs cut the
+    # interrupted round out of the monitor CSVs before monitors reattach.
+    if checkpoint_resuming; then
+        checkpoint_prepare_resume
+    else
+        checkpoint_init "${original_args[@]}"
+    fi
+
     # Phase 3: Start monitoring system
     echo "📋 Phase 3: Start monitoring system"
     if ! start_monitoring_system; then
@@ -1141,11 +1355,55 @@ main() {
         exit 1
     fi
 
-    # Phase 4: Execute core QPS test
-    echo "📋 Phase 4: Execute core QPS test"
-    if ! execute_core_qps_test "${original_args[@]}"; then
-        echo "❌ QPS test execution failed"
-        exit 1
+    # Phase 4: Execute core QPS test. Sweep mode runs every cell of the matrix
+    # spec, the ws_subscribe workload runs subscription levels, the
+    # batch_sweep workload runs batch-size rounds, the method_profile
+    # workload profiles each method alone, the replay workload replays a
+    # recorded proxy log and the compare workload runs the levels against
+    # every endpoint of a compare spec instead of the QPS ladder; Phases 5-7
+    # stay the same.
+    if [[ -n "${SWEEP_SPEC:-}" ]] && declare -F run_sweep >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute sweep (${SWEEP_SPEC})"
+        if ! run_sweep; then
+            echo "❌ Sweep execution failed"
+            exit 1
+        fi
+    elif [[ "${WORKLOAD_TYPE:-http}" == "ws_subscribe" ]] && declare -F run_ws_subscribe >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute WebSocket subscription test"
+        if ! run_ws_subscribe; then
+            echo "❌ WebSocket subscription test failed"
+            exit 1
+        fi
+    elif [[ "${WORKLOAD_TYPE:-http}" == "batch_sweep" ]] && declare -F run_batch_sweep >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute JSON-RPC batch sweep"
+        if ! run_batch_sweep; then
+            echo "❌ Batch sweep failed"
+            exit 1
+        fi
+    elif [[ "${WORKLOAD_TYPE:-http}" == "method_profile" ]] && declare -F run_method_profile >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute per-method isolation profiling"
+        if ! run_method_profile; then
+            echo "❌ Method profiling failed"
+            exit 1
+        fi
+    elif [[ "${WORKLOAD_TYPE:-http}" == "replay" ]] && declare -F run_replay >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute traffic replay"
+        if ! run_replay; then
+            echo "❌ Traffic replay failed"
+            exit 1
+        fi
+    elif [[ "${WORKLOAD_TYPE:-http}" == "compare" ]] && declare -F run_compare >/dev/null 2>&1; then
+        echo "📋 Phase 4: Execute multi-endpoint comparison (${COMPARE_SPEC})"
+        if ! run_compare; then
+            echo "❌ Endpoint comparison failed"
+            exit 1
+        fi
+    else
+        echo "📋 Phase 4: Execute core QPS test"
+        if ! execute_core_qps_test "${original_args[@]}"; then
+            echo "❌ QPS test execution failed"
+            exit 1
+        fi
     fi
 
     # Phase 5: Stop monitoring system
@@ -295,9 +295,37 @@ detect_deployment_paths() {
     PERFORMANCE_LATEST_CSV="${PERFORMANCE_LATEST_CSV:-${LOGS_DIR}/performance_latest.csv}"
     PROXY_METHOD_CSV="${PROXY_METHOD_CSV:-${LOGS_DIR}/proxy_method.csv}"
     PROXY_SELF_CSV="${PROXY_SELF_CSV:-${LOGS_DIR}/proxy_self.csv}"
+    PROXY_SAMPLE_CSV="${PROXY_SAMPLE_CSV:-${LOGS_DIR}/proxy_method_sample.csv}"
+    PROXY_CAPTURE_JSONL="${PROXY_CAPTURE_JSONL:-${LOGS_DIR}/proxy_capture.jsonl}"
+    PROXY_OVERHEAD_JSON="${PROXY_OVERHEAD_JSON:-${LOGS_DIR}/proxy_overhead.json}"
+    PROXY_CALIBRATION_DIR="${PROXY_CALIBRATION_DIR:-${LOGS_DIR}/proxy_calibration}"
+    OBSERVER_AB_DIR="${OBSERVER_AB_DIR:-${LOGS_DIR}/observer_ab}"
+    SWEEP_DIR="${SWEEP_DIR:-${LOGS_DIR}/sweep_${SESSION_TIMESTAMP}}"
+    SWEEP_RESULTS_CSV="${SWEEP_RESULTS_CSV:-${LOGS_DIR}/sweep_results_${SESSION_TIMESTAMP}.csv}"
+    WS_SUBSCRIPTIONS_CSV="${WS_SUBSCRIPTIONS_CSV:-${LOGS_DIR}/ws_subscriptions_${SESSION_TIMESTAMP}.csv}"
+    BATCH_SWEEP_CSV="${BATCH_SWEEP_CSV:-${LOGS_DIR}/batch_sweep_${SESSION_TIMESTAMP}.csv}"
+    REPLAY_RESULTS_CSV="${REPLAY_RESULTS_CSV:-${LOGS_DIR}/replay_${SESSION_TIMESTAMP}.csv}"
+    CPU_LAYOUT_JSON="${CPU_LAYOUT_JSON:-${LOGS_DIR}/cpu_layout.json}"
+    CPU_ROLE_CSV="${CPU_ROLE_CSV:-${LOGS_DIR}/cpu_role_${SESSION_TIMESTAMP}.csv}"
+    ROUND_PHASES_CSV="${ROUND_PHASES_CSV:-${LOGS_DIR}/round_phases_${SESSION_TIMESTAMP}.csv}"
+    VEGETA_WORKERS_CSV="${VEGETA_WORKERS_CSV:-${LOGS_DIR}/vegeta_workers_${SESSION_TIMESTAMP}.csv}"
+    GENERATOR_ROUNDS_CSV="${GENERATOR_ROUNDS_CSV:-${LOGS_DIR}/generator_rounds_${SESSION_TIMESTAMP}.csv}"
+    LOAD_CURVE_CSV="${LOAD_CURVE_CSV:-${LOGS_DIR}/load_curve_${SESSION_TIMESTAMP}.csv}"
+    SLO_ROUNDS_CSV="${SLO_ROUNDS_CSV:-${LOGS_DIR}/slo_rounds_${SESSION_TIMESTAMP}.csv}"
+    SLO_CAPACITY_JSON="${SLO_CAPACITY_JSON:-${LOGS_DIR}/slo_capacity_${SESSION_TIMESTAMP}.json}"
+    USL_MODEL_JSON="${USL_MODEL_JSON:-${LOGS_DIR}/usl_model_${SESSION_TIMESTAMP}.json}"
+    METHOD_COST_JSON="${METHOD_COST_JSON:-${LOGS_DIR}/method_cost_${SESSION_TIMESTAMP}.json}"
+    METHOD_PROFILE_CSV="${METHOD_PROFILE_CSV:-${LOGS_DIR}/method_profile_${SESSION_TIMESTAMP}.csv}"
+    METHOD_PROFILE_JSON="${METHOD_PROFILE_JSON:-${LOGS_DIR}/method_profile_${SESSION_TIMESTAMP}.json}"
+    COMPARE_DIR="${COMPARE_DIR:-${LOGS_DIR}/compare_${SESSION_TIMESTAMP}}"
+    COMPARE_RESULTS_CSV="${COMPARE_RESULTS_CSV:-${LOGS_DIR}/compare_results_${SESSION_TIMESTAMP}.csv}"
+    COMPARE_SUMMARY_JSON="${COMPARE_SUMMARY_JSON:-${LOGS_DIR}/compare_summary_${SESSION_TIMESTAMP}.json}"
+    RUN_CHECKPOINT_JSON="${RUN_CHECKPOINT_JSON:-${LOGS_DIR}/run_checkpoint_${SESSION_TIMESTAMP}.json}"
     RPC_PROXY_LOG="${RPC_PROXY_LOG:-${LOGS_DIR}/rpc_proxy.log}"
     NETWORK_CSV="${NETWORK_CSV:-${LOGS_DIR}/network_${SESSION_TIMESTAMP}.csv}"
     NETWORK_PID_FILE="${NETWORK_PID_FILE:-${TMP_DIR}/network_monitor.pid}"
+    PAGE_CACHE_CSV="${PAGE_CACHE_CSV:-${LOGS_DIR}/page_cache_${SESSION_TIMESTAMP}.csv}"
+    PAGE_CACHE_FILES_CSV="${PAGE_CACHE_FILES_CSV:-${LOGS_DIR}/page_cache_files_${SESSION_TIMESTAMP}.csv}"
     
     # Set monitoring overhead optimization related log file paths (using unified timestamp)
     MONITORING_OVERHEAD_LOG="${LOGS_DIR}/monitoring_overhead_${SESSION_TIMESTAMP}.csv"
@@ -695,7 +723,8 @@ export DATA_DIR CURRENT_TEST_DIR LOGS_DIR REPORTS_DIR VEGETA_RESULTS_DIR TMP_DIR
 export ERROR_LOG_DIR PYTHON_ERROR_LOG_DIR MEMORY_SHARE_DIR
 export BLOCK_HEIGHT_CACHE_FILE BLOCK_HEIGHT_DATA_FILE QPS_STATUS_FILE BOTTLENECK_STATUS_FILE BOTTLENECK_COUNTERS_FILE NODE_HEALTH_CACHE_DIR
 export LATEST_METRICS_FILE UNIFIED_METRICS_FILE UNIFIED_EVENTS_FILE EVENT_MANAGER_LOCK_FILE EVENT_NOTIFICATION_FILE TEST_SESSION_DIR
-export UNIFIED_LOG PERFORMANCE_LATEST_CSV PROXY_METHOD_CSV PROXY_SELF_CSV RPC_PROXY_LOG NETWORK_CSV NETWORK_PID_FILE
+export UNIFIED_LOG PERFORMANCE_LATEST_CSV PROXY_METHOD_CSV PROXY_SELF_CSV PROXY_SAMPLE_CSV PROXY_CAPTURE_JSONL PROXY_OVERHEAD_JSON PROXY_CALIBRATION_DIR OBSERVER_AB_DIR SWEEP_DIR SWEEP_RESULTS_CSV WS_SUBSCRIPTIONS_CSV BATCH_SWEEP_CSV REPLAY_RESULTS_CSV CPU_LAYOUT_JSON CPU_ROLE_CSV ROUND_PHASES_CSV VEGETA_WORKERS_CSV GENERATOR_ROUNDS_CSV LOAD_CURVE_CSV SLO_ROUNDS_CSV SLO_CAPACITY_JSON USL_MODEL_JSON METHOD_COST_JSON METHOD_PROFILE_CSV METHOD_PROFILE_JSON COMPARE_DIR COMPARE_RESULTS_CSV COMPARE_SUMMARY_JSON RUN_CHECKPOINT_JSON RPC_PROXY_LOG NETWORK_CSV NETWORK_PID_FILE
+export PAGE_CACHE_CSV PAGE_CACHE_FILES_CSV
 export MONITORING_OVERHEAD_LOG PERFORMANCE_LOG ERROR_LOG TEMP_FILE_PATTERN SESSION_TIMESTAMP
 
 export NETWORK_MAX_BANDWIDTH_MBPS DEPLOYMENT_PLATFORM ENA_MONITOR_ENABLED
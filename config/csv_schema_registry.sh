@@ -15,12 +15,12 @@
 #   Provider identity is carried by the CSV cloud_provider column.
 #   This matches config/providers/{aws,gcp,other}_provider.sh get_disk_field_prefix.
 #
-# Current scope: basic fields and disk fields. Other sections return empty until registered.
+# Current scope: basic, disk, block and process fields. Other sections return empty until registered.
 
 # Section order. This is the CSV segment order used by writers and readers.
 # Keep it exactly symmetric with utils/csv_schema_registry.py SEGMENT_ORDER.
 # Dynamic sections have runtime-dependent widths and are generated by their own helpers.
-_CSV_REGISTRY_SEGMENT_ORDER="basic device network ena overhead block qps cgroup meta"
+_CSV_REGISTRY_SEGMENT_ORDER="basic device network ena overhead block qps cgroup process meta"
 # Dynamic segments. Keep this symmetric with the Python DYNAMIC_SEGMENTS value.
 _CSV_REGISTRY_DYNAMIC_SEGMENTS="device ena"
 
@@ -80,6 +80,26 @@ _CSV_REGISTRY_BLOCK_LOGICAL=(
     probe_error
 )
 
+# Process accounting section fields (node role, then monitor role).
+# Keep this order aligned with utils/csv_schema_registry.py _PROCESS_FIELDS.
+_CSV_REGISTRY_PROCESS_LOGICAL=(
+    proc_node_read_bytes_s
+    proc_node_write_bytes_s
+    proc_node_syscr_s
+    proc_node_syscw_s
+    proc_node_runq_wait_ms_s
+    proc_node_runq_delay_us
+    proc_node_threads
+    proc_monitor_read_bytes_s
+    proc_monitor_write_bytes_s
+    proc_monitor_syscr_s
+    proc_monitor_syscw_s
+    proc_monitor_runq_wait_ms_s
+    proc_monitor_runq_delay_us
+    proc_monitor_threads
+    proc_meta_source
+)
+
 _CSV_REGISTRY_BLOCK_CACHE_REQUIRED=(
     timestamp
     local_block_height
@@ -104,7 +124,7 @@ csv_registry_basic_logical_names() {
 # List all registered static logical names in segment order.
 # Keep this symmetric with utils/csv_schema_registry.py CSVSchemaRegistry.all_logical_names().
 csv_registry_all_logical_names() {
-    echo "${_CSV_REGISTRY_BASIC_LOGICAL[*]} ${_CSV_REGISTRY_DISK_LOGICAL[*]} ${_CSV_REGISTRY_BLOCK_LOGICAL[*]}"
+    echo "${_CSV_REGISTRY_BASIC_LOGICAL[*]} ${_CSV_REGISTRY_DISK_LOGICAL[*]} ${_CSV_REGISTRY_BLOCK_LOGICAL[*]} ${_CSV_REGISTRY_PROCESS_LOGICAL[*]}"
 }
 
 # List logical names for a registered static segment.
@@ -115,6 +135,7 @@ csv_registry_segment_logical_names() {
         basic) echo "${_CSV_REGISTRY_BASIC_LOGICAL[*]}" ;;
         device) echo "${_CSV_REGISTRY_DISK_LOGICAL[*]}" ;;
         block) echo "${_CSV_REGISTRY_BLOCK_LOGICAL[*]}" ;;
+        process) echo "${_CSV_REGISTRY_PROCESS_LOGICAL[*]}" ;;
         *) echo "" ;;
     esac
 }
@@ -204,6 +225,22 @@ csv_registry_resolve() {
         lag_unit)                          echo "lag_unit" ;;
         freshness_gap_seconds)             echo "freshness_gap_seconds" ;;
         probe_error)                       echo "probe_error" ;;
+        # Process accounting section fields. Physical names match logical names.
+        proc_node_read_bytes_s)            echo "proc_node_read_bytes_s" ;;
+        proc_node_write_bytes_s)           echo "proc_node_write_bytes_s" ;;
+        proc_node_syscr_s)                 echo "proc_node_syscr_s" ;;
+        proc_node_syscw_s)                 echo "proc_node_syscw_s" ;;
+        proc_node_runq_wait_ms_s)          echo "proc_node_runq_wait_ms_s" ;;
+        proc_node_runq_delay_us)           echo "proc_node_runq_delay_us" ;;
+        proc_node_threads)                 echo "proc_node_threads" ;;
+        proc_monitor_read_bytes_s)         echo "proc_monitor_read_bytes_s" ;;
+        proc_monitor_write_bytes_s)        echo "proc_monitor_write_bytes_s" ;;
+        proc_monitor_syscr_s)              echo "proc_monitor_syscr_s" ;;
+        proc_monitor_syscw_s)              echo "proc_monitor_syscw_s" ;;
+        proc_monitor_runq_wait_ms_s)       echo "proc_monitor_runq_wait_ms_s" ;;
+        proc_monitor_runq_delay_us)        echo "proc_monitor_runq_delay_us" ;;
+        proc_monitor_threads)              echo "proc_monitor_threads" ;;
+        proc_meta_source)                  echo "proc_meta_source" ;;
         *)
             echo "csv_registry_resolve: unknown logical field: $logical" >&2
             return 1
@@ -54,6 +54,13 @@ MAX_CONSECUTIVE_ERRORS=${MAX_CONSECUTIVE_ERRORS:-5}       # Maximum consecutive
 SUCCESS_RATE_THRESHOLD=95                                 # Success rate threshold (%)
 MAX_LATENCY_THRESHOLD=1000                                # Maximum latency threshold (ms)
 
+# Page cache residency sampler budget (monitoring/page_cache_collector.py)
+PAGE_CACHE_FILES_PER_TICK=${PAGE_CACHE_FILES_PER_TICK:-64}  # Files refreshed per sampling tick (rotating cursor)
+PAGE_CACHE_RESCAN_TICKS=${PAGE_CACHE_RESCAN_TICKS:-60}      # Rebuild the file inventory every N ticks
+PAGE_CACHE_MAX_FILES=${PAGE_CACHE_MAX_FILES:-200000}        # Inventory cap per data directory
+PAGE_CACHE_WINDOW_MB=${PAGE_CACHE_WINDOW_MB:-1024}          # mmap window size used for mincore()
+PAGE_CACHE_TOP_N=${PAGE_CACHE_TOP_N:-10}                    # Largest sampled files reported per directory
+
 # ----- Block Node Height Monitoring Configuration -----
 # Block height difference threshold, triggers warning
 BLOCK_HEIGHT_DIFF_THRESHOLD=50
@@ -72,5 +79,6 @@ export BOTTLENECK_DISK_LATENCY_THRESHOLD BOTTLENECK_NETWORK_THRESHOLD BOTTLENECK
 export BOTTLENECK_CONSECUTIVE_COUNT BOTTLENECK_ANALYSIS_WINDOW
 export PERFORMANCE_MONITORING_ENABLED MAX_COLLECTION_TIME_MS MAX_CONSECUTIVE_ERRORS
 export SUCCESS_RATE_THRESHOLD MAX_LATENCY_THRESHOLD
+export PAGE_CACHE_FILES_PER_TICK PAGE_CACHE_RESCAN_TICKS PAGE_CACHE_MAX_FILES PAGE_CACHE_WINDOW_MB PAGE_CACHE_TOP_N
 export BLOCK_HEIGHT_DIFF_THRESHOLD BLOCK_HEIGHT_TIME_THRESHOLD BLOCK_HEIGHT_MONITOR_RATE
 export LOG_CONSOLE LOG_FILE
\ No newline at end of file
@@ -49,6 +49,7 @@ MONITORING_PROCESS_NAMES=(
     "unified_monitor"
     "bottleneck_detector"
     "network_monitor"
+    "page_cache_collector"
     "block_height_monitor"
     "performance_visualizer"
     "report_generator"
@@ -106,6 +106,97 @@ ACCOUNT_SEMAPHORE_LIMIT="${ACCOUNT_SEMAPHORE_LIMIT:-10}"           # Account dis
 MONITOR_INTERVAL="${MONITOR_INTERVAL:-5}"                         # Unified monitoring interval, applicable to system resources, blockchain node, and monitoring overhead statistics
 DISK_MONITOR_RATE="${DISK_MONITOR_RATE:-1}"                       # Disk separate monitoring frequency
 
+# Page cache residency sampling of the node data directories (mincore-based, does not fault pages in).
+# Directories default to the mount points of LEDGER_DEVICE / ACCOUNTS_DEVICE.
+PAGE_CACHE_MONITOR_ENABLED="${PAGE_CACHE_MONITOR_ENABLED:-true}"  # Options: true | false
+LEDGER_DATA_DIR="${LEDGER_DATA_DIR:-}"                             # Optional: ledger/data directory override
+ACCOUNTS_DATA_DIR="${ACCOUNTS_DATA_DIR:-}"                         # Optional: accounts directory override
+
+# CPU isolation for single-host runs: pin node, Vegeta, proxy and monitors to
+# separate cpusets (kernel cpulist syntax, e.g. "0-11" or "12,13"). The split is
+# validated against /sys/devices/system/cpu and recorded in cpu_layout.json;
+# the report compares each role's busy cores with its reserved set.
+CPU_ISOLATION_ENABLED="${CPU_ISOLATION_ENABLED:-false}"            # Options: true | false
+CPU_ISOLATION_METHOD="${CPU_ISOLATION_METHOD:-taskset}"            # Options: taskset | systemd (transient scope, AllowedCPUs=)
+CPUSET_NODE="${CPUSET_NODE:-}"                                     # Blockchain node processes
+CPUSET_VEGETA="${CPUSET_VEGETA:-}"                                 # Load generator
+CPUSET_PROXY="${CPUSET_PROXY:-}"                                   # Per-method RPC proxy
+CPUSET_MONITORS="${CPUSET_MONITORS:-}"                             # Monitoring coordinator and collectors
+
+# Monitoring profile: full = every monitor, minimal = unified_monitor.sh only, off = none.
+MONITORING_PROFILE="${MONITORING_PROFILE:-full}"                   # Options: full | minimal | off
+
+# Observer-effect A/B mode (--observer-ab): matched Vegeta rounds per monitoring
+# profile, profile order rotated per repetition and QPS level, deltas vs "off".
+OBSERVER_AB_PROFILES="${OBSERVER_AB_PROFILES:-full,minimal,off}"   # Profiles to compare (must include off)
+OBSERVER_AB_QPS_LIST="${OBSERVER_AB_QPS_LIST:-1000,2000,4000}"     # QPS levels per repetition
+OBSERVER_AB_DURATION="${OBSERVER_AB_DURATION:-60}"                 # Seconds per round
+OBSERVER_AB_REPEATS="${OBSERVER_AB_REPEATS:-3}"                    # Repetitions (>= 2 for confidence intervals)
+OBSERVER_AB_PAUSE="${OBSERVER_AB_PAUSE:-10}"                       # Seconds between rounds
+
+# Multi-dimensional sweep (also enabled by --sweep <spec.json>): QPS x max connections x
+# keep-alive x method-mix cells in seeded random order after one shared warmup.
+# Spec format: config/sweep_matrix.example.json
+SWEEP_SPEC="${SWEEP_SPEC:-}"                                       # Matrix spec path (empty = QPS ladder)
+
+# Workload type (ws_subscribe also enabled by --ws-subscribe, batch_sweep by --batch-sweep,
+# method_profile by --method-profile, replay by --replay, compare by --compare). ws_subscribe
+# replaces the HTTP QPS ladder with rounds of concurrent WebSocket subscriptions; batch_sweep
+# with JSON-RPC batch-size rounds at a fixed call rate; method_profile with a short SLO
+# ladder per mixed_weighted method alone and one for the mix; replay with a time-faithful
+# replay of a recorded proxy log; compare with the same QPS levels against every endpoint
+# of a compare spec.
+WORKLOAD_TYPE="${WORKLOAD_TYPE:-http}"                             # Options: http | ws_subscribe | batch_sweep | method_profile | replay | compare
+LOCAL_WS_URL="${LOCAL_WS_URL:-}"                                   # Empty = LOCAL_RPC_URL with ws:// and port + 1
+WS_SUBSCRIPTION_LEVELS="${WS_SUBSCRIPTION_LEVELS:-100,500,1000}"   # Concurrent subscriptions per round
+WS_SUBSCRIBE_RAMP="${WS_SUBSCRIBE_RAMP:-100}"                      # Subscriptions opened per second (0 = all at once)
+WS_SUBSCRIBE_DURATION="${WS_SUBSCRIBE_DURATION:-60}"               # Seconds each level is held after the ramp
+WS_SUBS_PER_CONNECTION="${WS_SUBS_PER_CONNECTION:-1}"              # Subscriptions sharing one WebSocket connection
+WS_SUBSCRIBE_METHODS="${WS_SUBSCRIBE_METHODS:-}"                   # method[:topic],... e.g. "eth_subscribe:newHeads"; empty = chain default
+WS_SUBSCRIBE_PAUSE="${WS_SUBSCRIBE_PAUSE:-5}"                      # Seconds between levels
+BATCH_SIZES="${BATCH_SIZES:-1,10,50,100}"                          # JSON-RPC calls per request, one round each
+BATCH_CALLS_PER_SECOND="${BATCH_CALLS_PER_SECOND:-1000}"           # Fixed calls/s; requests/s = calls / batch size
+BATCH_ROUND_DURATION="${BATCH_ROUND_DURATION:-60}"                 # Seconds per batch size
+BATCH_ROUND_PAUSE="${BATCH_ROUND_PAUSE:-5}"                        # Seconds between batch sizes
+METHOD_PROFILE_START_QPS="${METHOD_PROFILE_START_QPS:-250}"       # First rate of each method's ladder (doubles while the SLO holds)
+METHOD_PROFILE_MAX_QPS="${METHOD_PROFILE_MAX_QPS:-8000}"           # Stop doubling here
+METHOD_PROFILE_RESOLUTION="${METHOD_PROFILE_RESOLUTION:-10}"       # Bisect until the pass/fail gap is this % of the failing rate
+METHOD_PROFILE_MAX_ROUNDS="${METHOD_PROFILE_MAX_ROUNDS:-8}"        # Rounds per method at most
+METHOD_PROFILE_DURATION="${METHOD_PROFILE_DURATION:-30}"           # Seconds per round
+METHOD_PROFILE_PAUSE="${METHOD_PROFILE_PAUSE:-5}"                  # Seconds between rounds
+METHOD_PROFILE_WHAT_IF="${METHOD_PROFILE_WHAT_IF:-}"               # Extra weight factors to predict, e.g. "getProgramAccounts=2"
+REPLAY_SOURCE="${REPLAY_SOURCE:-}"                                 # Recorded proxy_method.csv (raw or aggregate) to replay
+REPLAY_CAPTURE="${REPLAY_CAPTURE:-}"                               # Body capture JSONL; empty = proxy_capture.jsonl next to REPLAY_SOURCE
+REPLAY_ENGINE="${REPLAY_ENGINE:-vegeta}"                           # Options: vegeta (lazy targets) | native (asyncio sender)
+REPLAY_SPEED="${REPLAY_SPEED:-1}"                                  # Timeline compression; 2 = twice as fast at twice the rate
+REPLAY_START="${REPLAY_START:-0}"                                  # Recorded seconds to skip
+REPLAY_MAX_DURATION="${REPLAY_MAX_DURATION:-0}"                    # Replay seconds to send (0 = whole log)
+REPLAY_WORKERS="${REPLAY_WORKERS:-512}"                            # Max requests in flight
+REPLAY_METHODS="${REPLAY_METHODS:-}"                               # Comma-separated methods to keep (empty = all)
+COMPARE_SPEC="${COMPARE_SPEC:-}"                                   # Endpoints to compare (JSON, see config/compare.example.json)
+COMPARE_MODE="${COMPARE_MODE:-interleaved}"                        # Options: interleaved (full rate, one endpoint at a time) | split (rate / N, all at once)
+COMPARE_QPS_LIST="${COMPARE_QPS_LIST:-1000,2000,4000}"             # QPS levels; split mode divides each across the endpoints
+COMPARE_DURATION="${COMPARE_DURATION:-60}"                         # Seconds per round
+COMPARE_PAUSE="${COMPARE_PAUSE:-10}"                               # Seconds between rounds
+COMPARE_PROXY_BASE_PORT="${COMPARE_PROXY_BASE_PORT:-18560}"        # Proxy of endpoint i listens on this port + i
+
+# Per-method RPC proxy sink. "aggregate" keeps per-second, per-method counters and
+# latency histograms in memory and writes one row per bucket each second instead of
+# one row per request, so proxy disk writes do not compete with ledger I/O at high QPS.
+PROXY_SINK_FORMAT="${PROXY_SINK_FORMAT:-csv}"                      # Options: csv | aggregate
+PROXY_SINK_SAMPLE_EVERY="${PROXY_SINK_SAMPLE_EVERY:-0}"            # aggregate only: also keep every Nth raw request row (0 = off)
+PROXY_CAPTURE_BODIES="${PROXY_CAPTURE_BODIES:-false}"              # Also record request bodies to PROXY_CAPTURE_JSONL for --replay
+
+# Proxy-overhead calibration (also enabled by --calibrate-proxy): short paired Vegeta
+# rounds straight to the node and through a separate proxy instance, per QPS level.
+# Reports subtract the resulting per-QPS overhead curve from per-method latency.
+PROXY_CALIBRATION_ENABLED="${PROXY_CALIBRATION_ENABLED:-false}"    # Options: true | false
+PROXY_CALIBRATION_QPS_LIST="${PROXY_CALIBRATION_QPS_LIST:-500,1000,2000,4000}"  # QPS levels to calibrate
+PROXY_CALIBRATION_DURATION="${PROXY_CALIBRATION_DURATION:-10}"     # Seconds per leg (direct / proxied)
+PROXY_CALIBRATION_PORT="${PROXY_CALIBRATION_PORT:-18546}"          # Listen port of the calibration proxy instance
+PROXY_CPU_CORES="${PROXY_CPU_CORES:-}"                             # CPU cores the proxy may use (empty = all)
+PROXY_CPU_SATURATION_PCT="${PROXY_CPU_SATURATION_PCT:-80}"         # Flag rounds where proxy CPU >= this % of PROXY_CPU_CORES
+
 # ----- Optional Observability Stack -----
 # Disabled by default. When set to true, deploy/observability/start.sh may start
 # the read-only exporter, Prometheus, and Grafana stack. The benchmark entry
@@ -137,8 +228,59 @@ INTENSIVE_DURATION=${INTENSIVE_DURATION:-600}
 INTENSIVE_AUTO_STOP=${INTENSIVE_AUTO_STOP:-true}      # Enable automatic bottleneck detection stop
 
 # Benchmark interval configuration
-QPS_COOLDOWN=${QPS_COOLDOWN:-30}      # Cooldown time between QPS levels (seconds)
-QPS_WARMUP_DURATION=${QPS_WARMUP_DURATION:-60}  # Warmup time (seconds)
+QPS_COOLDOWN=${QPS_COOLDOWN:-30}      # Maximum cooldown between QPS levels (seconds); 0 disables
+QPS_WARMUP_DURATION=${QPS_WARMUP_DURATION:-60}  # Maximum warmup at the round's target rate (seconds); 0 disables
+
+# Warmup drives real load and ends once per-second latency and success rate are stable
+QPS_WARMUP_MIN="${QPS_WARMUP_MIN:-10}"                   # Minimum warmup before steady state can be declared (seconds)
+WARMUP_STEADY_WINDOW="${WARMUP_STEADY_WINDOW:-5}"         # Seconds per comparison window
+WARMUP_STEADY_TOLERANCE="${WARMUP_STEADY_TOLERANCE:-0.10}" # Max relative change of window mean latency
+WARMUP_STEADY_CV="${WARMUP_STEADY_CV:-0.20}"               # Max coefficient of variation of per-second latency
+WARMUP_STEADY_SUCCESS_DELTA="${WARMUP_STEADY_SUCCESS_DELTA:-0.01}" # Max change of success rate (0-1)
+# Cooldown ends once node CPU is back within tolerance of the pre-test baseline
+QPS_COOLDOWN_MIN="${QPS_COOLDOWN_MIN:-5}"                 # Minimum cooldown (seconds)
+QPS_COOLDOWN_CPU_TOLERANCE="${QPS_COOLDOWN_CPU_TOLERANCE:-5}" # Allowed CPU% above baseline
+
+# Distributed load generation: split each round's rate and targets across several
+# Vegeta workers started in lockstep; results are merged into one round.
+# Remote hosts need vegeta on PATH and clocks in sync (NTP).
+VEGETA_WORKERS="${VEGETA_WORKERS:-1}"                               # Local worker processes (ignored if hosts are set)
+VEGETA_WORKER_HOSTS="${VEGETA_WORKER_HOSTS:-}"                      # Comma-separated SSH destinations, e.g. "bench@10.0.0.5,bench@10.0.0.6"
+VEGETA_WORKER_SSH_OPTS="${VEGETA_WORKER_SSH_OPTS:--o BatchMode=yes -o ConnectTimeout=10}"  # ssh/scp options
+VEGETA_WORKER_TARGET_URL="${VEGETA_WORKER_TARGET_URL:-}"            # Required with hosts when targets are loopback, e.g. "http://10.0.0.4:18545"
+VEGETA_WORKER_START_DELAY="${VEGETA_WORKER_START_DELAY:-3}"         # Seconds from dispatch to the shared start
+VEGETA_WORKER_RATE_TOLERANCE="${VEGETA_WORKER_RATE_TOLERANCE:-0.05}" # Achieved rate below target by more than this = generator saturated
+
+# Load-generator saturation check, applied to every round's raw Vegeta results.
+# A generator-limited round is flagged instead of counted as a node bottleneck.
+GENERATOR_RATE_TOLERANCE="${GENERATOR_RATE_TOLERANCE:-0.05}"        # Achieved rate below -rate by more than this = generator limited
+GENERATOR_SEND_LAG_MS="${GENERATOR_SEND_LAG_MS:-100}"               # p99 lag of request starts behind the -rate schedule (ms)
+GENERATOR_CPU_SATURATION_PCT="${GENERATOR_CPU_SATURATION_PCT:-90}"  # Vegeta CPU as % of the cores it may use
+
+# Load model (closed also enabled by --closed-loop). Open-loop rounds send at a fixed
+# rate (the QPS ladder); closed-loop rounds keep a fixed number of requests in flight,
+# one level per CLOSED_LOOP_CONCURRENCY entry, each DURATION seconds long.
+LOAD_MODEL="${LOAD_MODEL:-open}"                                    # Options: open | closed | both (ladder, then closed-loop rounds)
+CLOSED_LOOP_CONCURRENCY="${CLOSED_LOOP_CONCURRENCY:-1,4,16,64,256}" # Requests in flight per closed-loop round
+CLOSED_LOOP_INTENDED_INTERVAL_MS="${CLOSED_LOOP_INTENDED_INTERVAL_MS:-0}" # Per-worker send interval for coordinated-omission correction (0 = round's median latency)
+
+# SLO capacity search (also enabled by --slo-search; needs the RPC proxy).
+# Every round is checked per method against the SLO, then rounds bisect between
+# each method's last passing and first failing QPS. Thresholds of 0 are not checked.
+SLO_SEARCH="${SLO_SEARCH:-false}"                         # Options: true | false
+SLO_SPEC="${SLO_SPEC:-}"                                  # Per-method SLO JSON (see config/slo.example.json); empty = defaults below for every method
+SLO_P50_MS="${SLO_P50_MS:-0}"                             # Default p50 latency bound (ms)
+SLO_P99_MS="${SLO_P99_MS:-500}"                           # Default p99 latency bound (ms)
+SLO_ERROR_PCT="${SLO_ERROR_PCT:-1}"                       # Default error rate bound (%)
+SLO_SEARCH_RESOLUTION="${SLO_SEARCH_RESOLUTION:-50}"      # Stop bisecting once pass/fail levels are this close (QPS)
+SLO_SEARCH_MAX_ROUNDS="${SLO_SEARCH_MAX_ROUNDS:-6}"       # Bisection rounds after the ladder
+
+# Universal Scalability Law model (analysis/usl_model.py), fitted to the rounds
+# after the ladder. With USL_EARLY_STOP=true it is refitted after every round and
+# the ramp stops once the predicted throughput peak is bracketed.
+USL_EARLY_STOP="${USL_EARLY_STOP:-false}"                 # Options: true | false
+USL_MIN_ROUNDS="${USL_MIN_ROUNDS:-5}"                     # Rounds needed before the ramp may stop
+USL_CI_WIDTH="${USL_CI_WIDTH:-0.2}"                       # Max width of the 95% peak-throughput interval, as a fraction of the peak
 
 # Export user configuration variables
 export LOCAL_RPC_URL MAINNET_RPC_URL BLOCKCHAIN_NODE RPC_MODE
@@ -152,9 +294,27 @@ export LEDGER_DEVICE ACCOUNTS_DEVICE
 export DATA_VOL_TYPE DATA_VOL_SIZE DATA_VOL_MAX_IOPS DATA_VOL_MAX_THROUGHPUT
 export ACCOUNTS_VOL_TYPE ACCOUNTS_VOL_SIZE ACCOUNTS_VOL_MAX_IOPS ACCOUNTS_VOL_MAX_THROUGHPUT
 export NETWORK_INTERFACE NETWORK_MAX_BANDWIDTH_GBPS ENA_MONITOR_ENABLED MONITOR_INTERVAL DISK_MONITOR_RATE
+export PAGE_CACHE_MONITOR_ENABLED LEDGER_DATA_DIR ACCOUNTS_DATA_DIR
+export CPU_ISOLATION_ENABLED CPU_ISOLATION_METHOD CPUSET_NODE CPUSET_VEGETA CPUSET_PROXY CPUSET_MONITORS
+export MONITORING_PROFILE OBSERVER_AB_PROFILES OBSERVER_AB_QPS_LIST OBSERVER_AB_DURATION OBSERVER_AB_REPEATS OBSERVER_AB_PAUSE
+export SWEEP_SPEC
+export WORKLOAD_TYPE LOCAL_WS_URL WS_SUBSCRIPTION_LEVELS WS_SUBSCRIBE_RAMP WS_SUBSCRIBE_DURATION WS_SUBS_PER_CONNECTION WS_SUBSCRIBE_METHODS WS_SUBSCRIBE_PAUSE
+export BATCH_SIZES BATCH_CALLS_PER_SECOND BATCH_ROUND_DURATION BATCH_ROUND_PAUSE
+export METHOD_PROFILE_START_QPS METHOD_PROFILE_MAX_QPS METHOD_PROFILE_RESOLUTION METHOD_PROFILE_MAX_ROUNDS METHOD_PROFILE_DURATION METHOD_PROFILE_PAUSE METHOD_PROFILE_WHAT_IF
+export REPLAY_SOURCE REPLAY_CAPTURE REPLAY_ENGINE REPLAY_SPEED REPLAY_START REPLAY_MAX_DURATION REPLAY_WORKERS REPLAY_METHODS
+export COMPARE_SPEC COMPARE_MODE COMPARE_QPS_LIST COMPARE_DURATION COMPARE_PAUSE COMPARE_PROXY_BASE_PORT
+export PROXY_SINK_FORMAT PROXY_SINK_SAMPLE_EVERY PROXY_CAPTURE_BODIES
+export PROXY_CALIBRATION_ENABLED PROXY_CALIBRATION_QPS_LIST PROXY_CALIBRATION_DURATION PROXY_CALIBRATION_PORT
+export PROXY_CPU_CORES PROXY_CPU_SATURATION_PCT
 export OBSERVABILITY_STACK_ENABLED EXPORTER_PORT PROMETHEUS_PORT GRAFANA_PORT PROMETHEUS_EXPORTER_MAX_PROXY_ROWS
 export QUICK_INITIAL_QPS QUICK_MAX_QPS QUICK_QPS_STEP QUICK_DURATION
 export STANDARD_INITIAL_QPS STANDARD_MAX_QPS STANDARD_QPS_STEP STANDARD_DURATION
 export INTENSIVE_INITIAL_QPS INTENSIVE_MAX_QPS INTENSIVE_QPS_STEP INTENSIVE_DURATION INTENSIVE_AUTO_STOP
-export QPS_COOLDOWN QPS_WARMUP_DURATION
+export QPS_COOLDOWN QPS_WARMUP_DURATION QPS_WARMUP_MIN QPS_COOLDOWN_MIN QPS_COOLDOWN_CPU_TOLERANCE
+export WARMUP_STEADY_WINDOW WARMUP_STEADY_TOLERANCE WARMUP_STEADY_CV WARMUP_STEADY_SUCCESS_DELTA
+export VEGETA_WORKERS VEGETA_WORKER_HOSTS VEGETA_WORKER_SSH_OPTS VEGETA_WORKER_TARGET_URL VEGETA_WORKER_START_DELAY VEGETA_WORKER_RATE_TOLERANCE
+export GENERATOR_RATE_TOLERANCE GENERATOR_SEND_LAG_MS GENERATOR_CPU_SATURATION_PCT
+export LOAD_MODEL CLOSED_LOOP_CONCURRENCY CLOSED_LOOP_INTENDED_INTERVAL_MS
+export SLO_SEARCH SLO_SPEC SLO_P50_MS SLO_P99_MS SLO_ERROR_PCT SLO_SEARCH_RESOLUTION SLO_SEARCH_MAX_ROUNDS
+export USL_EARLY_STOP USL_MIN_ROUNDS USL_CI_WIDTH
 export BLOCKCHAIN_PROCESS_NAMES_STR="${BLOCKCHAIN_PROCESS_NAMES[*]}"
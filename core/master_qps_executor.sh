@@ -11,6 +11,12 @@ source "${QPS_SCRIPT_DIR}/common_functions.sh"
 source "${QPS_SCRIPT_DIR}/../config/config_loader.sh"
 # CSV Schema Registry for provider-aware reader column resolution.
 source "${QPS_SCRIPT_DIR}/../config/csv_schema_registry.sh"
+# Per-role cpusets (vegeta prefix); no-op unless CPU_ISOLATION_ENABLED=true.
+source "${QPS_SCRIPT_DIR}/../lib/cpu_isolation.sh"
+# Per-round checkpoints (RUN_CHECKPOINT_JSON) and --resume state.
+source "${QPS_SCRIPT_DIR}/../lib/run_checkpoint.sh"
+# Distributed load generation (VEGETA_WORKERS / VEGETA_WORKER_HOSTS).
+source "${QPS_SCRIPT_DIR}/../lib/vegeta_workers.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/../utils/unified_logger.sh"
 
 # Initialize unified logger
@@ -51,6 +57,11 @@ CUSTOM_PARAMS=false
 BOTTLENECK_DETECTED=false
 BOTTLENECK_COUNT=0
 LAST_SUCCESSFUL_QPS=0
+LAST_GENERATOR_SATURATED=false
+LAST_GENERATOR_LIMITED=false
+GENERATOR_SATURATED_QPS=0
+GENERATOR_LIMITED_COUNT=0
+GENERATOR_LIMIT_REACHED=false
 
 # Display help information
 show_help() {
@@ -74,6 +85,9 @@ show_help() {
     --max-qps NUM        Maximum QPS (default: depends on test mode)
     --step-qps NUM       QPS step size (default: $QUICK_QPS_STEP)
     --duration NUM       Duration per level (seconds)
+    --closed-loop        Closed-loop rounds at CLOSED_LOOP_CONCURRENCY instead of the QPS ladder
+    --slo-search         Per-method max QPS meeting the SLO (SLO_SPEC, SLO_P99_MS, ...)
+    --method-profile     Profile each mixed_weighted method alone, then predict the mix's capacity
 
 📊 Other Options:
     --status    Display current test status
@@ -172,13 +186,22 @@ parse_arguments() {
                 RPC_MODE="mixed"
                 shift
                 ;;
-            --fake-node|--no-proxy)
-                # These two arguments are consumed by the main entrypoint parse_rpc_mode_args
-                # (--fake-node→FAKE_NODE_MODE, --no-proxy→SKIP_RPC_PROXY),
+            --fake-node|--no-proxy|--calibrate-proxy|--observer-ab|--ws-subscribe|--batch-sweep|--method-profile|--closed-loop|--slo-search)
+                # These arguments are consumed by the main entrypoint parse_rpc_mode_args
+                # (--fake-node→FAKE_NODE_MODE, --no-proxy→SKIP_RPC_PROXY,
+                # --calibrate-proxy→PROXY_CALIBRATION_ENABLED, --observer-ab→OBSERVER_AB_ENABLED,
+                # --ws-subscribe/--batch-sweep/--method-profile→WORKLOAD_TYPE, --closed-loop→LOAD_MODEL,
+                # --slo-search→SLO_SEARCH),
                 # but the main entrypoint forwards the original argument list to this executor.
                 # Ignore them here so they do not hit the default hard-fail branch.
                 shift
                 ;;
+            --resume|--sweep|--replay|--compare)
+                # Entry-point options: a resumed run passes the stored arguments instead,
+                # and sweep mode (lib/sweep.sh), replay mode (lib/replay.sh) and compare
+                # mode (lib/compare.sh) replace this executor.
+                shift $(( $# > 1 ? 2 : 1 ))
+                ;;
             --initial-qps)
                 INITIAL_QPS="$2"
                 CUSTOM_PARAMS=true
@@ -240,6 +263,12 @@ show_benchmark_config() {
     echo "QPS step:      $STEP_QPS"
     echo "Duration:      ${DURATION} seconds"
     echo "Local RPC:     $LOCAL_RPC_URL"
+    if vegeta_workers_enabled; then
+        echo "Vegeta workers: $(vegeta_workers_list | paste -sd, -)"
+    fi
+    if [[ "${LOAD_MODEL:-open}" != "open" ]]; then
+        echo "Load model:    ${LOAD_MODEL} (closed-loop concurrency: ${CLOSED_LOOP_CONCURRENCY}, local Vegeta)"
+    fi
     echo ""
 }
 
@@ -307,6 +336,19 @@ _mqe_provider_field() {
 check_bottleneck_during_test() {
     local current_qps=$1
     
+    # A generator-limited round says nothing about the node: leave the node
+    # bottleneck count alone, and stop once the generator itself is the limit.
+    if [[ "$LAST_GENERATOR_LIMITED" == "true" ]]; then
+        GENERATOR_LIMITED_COUNT=$((GENERATOR_LIMITED_COUNT + 1))
+        echo "⚠️  QPS ${current_qps} limited by the load generator ($GENERATOR_LIMITED_COUNT/${BOTTLENECK_CONSECUTIVE_COUNT}), not counted as a node bottleneck"
+        if [[ $GENERATOR_LIMITED_COUNT -ge $BOTTLENECK_CONSECUTIVE_COUNT ]]; then
+            GENERATOR_LIMIT_REACHED=true
+            return 1
+        fi
+        return 0
+    fi
+    GENERATOR_LIMITED_COUNT=0
+    
     # Read latest monitoring data
     local latest_data=$(get_latest_monitoring_data)
     if [[ -z "$latest_data" ]]; then
@@ -641,7 +683,8 @@ log_bottleneck_event() {
     "severity": "$severity",
     "reasons": "$reasons",
     "benchmark_mode": "$BENCHMARK_MODE",
-    "rpc_mode": "$RPC_MODE"
+    "rpc_mode": "$RPC_MODE",
+    "generator_saturated_qps": $GENERATOR_SATURATED_QPS
 }
 EOF
 )
@@ -673,6 +716,7 @@ save_bottleneck_context() {
     "benchmark_mode": "$BENCHMARK_MODE",
     "rpc_mode": "$RPC_MODE",
     "consecutive_detections": $BOTTLENECK_COUNT,
+    "generator_saturated_qps": $GENERATOR_SATURATED_QPS,
     "system_context": $system_context,
     "analysis_window": {
         "start_time": "$(date -d "-${BOTTLENECK_ANALYSIS_WINDOW} seconds" -Iseconds)",
@@ -796,14 +840,36 @@ execute_single_qps_test() {
     
     # Build vegeta command
     local vegeta_cmd="vegeta attack -format=json -targets=$targets_file -rate=$qps -duration=${duration}s"
+    local cpu_prefix
+    cpu_prefix="$(cpu_isolation_prefix vegeta)"
+    [[ -n "$cpu_prefix" ]] && vegeta_cmd="$cpu_prefix $vegeta_cmd"
     local result_file="${VEGETA_RESULTS_DIR}/vegeta_${qps}qps_${SESSION_TIMESTAMP}.json"
     
     # Execute vegeta test
-    echo "📊 Executing command: $vegeta_cmd"
+    vegeta_workers_enabled || echo "📊 Executing command: $vegeta_cmd"
     
-    # First save attack output to temporary file
+    # First save attack output to temporary file. Distributed workers leave
+    # their merged JSON result streams there instead.
     local attack_output="${TMP_DIR}/vegeta_attack_${qps}qps_${SESSION_TIMESTAMP}.bin"
-    if $vegeta_cmd > "$attack_output" 2>/dev/null; then
+    local attack_ok=false attack_times=""
+    LAST_GENERATOR_SATURATED=false
+    LAST_GENERATOR_LIMITED=false
+    if vegeta_workers_enabled; then
+        vegeta_workers_attack "$qps" "$duration" "$targets_file" "$attack_output" && attack_ok=true
+    else
+        # bash `time` reports the attack process's user, sys and wall seconds
+        local TIMEFORMAT='%U %S %R'
+        { time $vegeta_cmd > "$attack_output" 2>/dev/null; } 2> "${attack_output}.time" && attack_ok=true
+        attack_times="$(tail -n 1 "${attack_output}.time" 2>/dev/null || true)"
+        rm -f "${attack_output}.time"
+    fi
+    if [[ "$attack_ok" == "true" ]]; then
+        check_generator_saturation "$qps" "$duration" "$attack_output" "$attack_times"
+        if [[ "$LAST_GENERATOR_LIMITED" == "true" && $GENERATOR_SATURATED_QPS -eq 0 ]]; then
+            GENERATOR_SATURATED_QPS=$qps
+        fi
+        record_load_curve "$attack_output" "$duration" --model open --qps "$qps" >/dev/null
+        
         # Generate JSON report (maintain existing functionality)
         vegeta report -type=json < "$attack_output" > "$result_file" 2>/dev/null
         
@@ -834,7 +900,8 @@ execute_single_qps_test() {
         
         if (( $(awk "BEGIN {print ($success_rate_num >= $SUCCESS_RATE_THRESHOLD) ? 1 : 0}") )) && \
            (( $(awk "BEGIN {print ($avg_latency_num <= $MAX_LATENCY_THRESHOLD) ? 1 : 0}") )); then
-            LAST_SUCCESSFUL_QPS=$qps
+            # The node never saw the requested rate in a generator-limited round
+            [[ "$LAST_GENERATOR_LIMITED" == "true" ]] || LAST_SUCCESSFUL_QPS=$qps
             return 0
         else
             echo "⚠️ Test quality below threshold: Success rate ${success_rate}% (required>${SUCCESS_RATE_THRESHOLD}%), Latency ${avg_latency_ms}ms (required<${MAX_LATENCY_THRESHOLD}ms)"
@@ -846,10 +913,335 @@ execute_single_qps_test() {
     fi
 }
 
+# Compare the round's raw results with the requested rate, the -rate schedule
+# and Vegeta's CPU time (analysis/generator_saturation.py). Sets
+# LAST_GENERATOR_LIMITED; distributed workers that fell short count as well.
+check_generator_saturation() {
+    local qps=$1
+    local duration=$2
+    local attack_output=$3
+    local attack_times=$4
+    
+    local -a cpu_args=()
+    if [[ -n "$attack_times" ]]; then
+        local user_s sys_s wall_s
+        read -r user_s sys_s wall_s <<< "$attack_times"
+        cpu_args=(--cpu-seconds "$(awk -v u="$user_s" -v s="$sys_s" 'BEGIN { print u + s }')"
+                  --wall-seconds "$wall_s" --cores "$(nproc 2>/dev/null || echo 1)")
+        # Pinned Vegeta can only use its own cpuset, not the whole host.
+        if cpu_isolation_enabled && [[ -n "${CPUSET_VEGETA:-}" ]]; then
+            cpu_args+=(--cpuset "$CPUSET_VEGETA")
+        fi
+    fi
+    
+    local summary
+    summary=$(vegeta encode -to json < "$attack_output" 2>/dev/null | \
+        python3 "${QPS_SCRIPT_DIR}/../analysis/generator_saturation.py" --results - \
+            --qps "$qps" --duration "$duration" "${cpu_args[@]}" \
+            --tolerance "${GENERATOR_RATE_TOLERANCE:-0.05}" \
+            --lag-ms-max "${GENERATOR_SEND_LAG_MS:-100}" \
+            --cpu-pct-max "${GENERATOR_CPU_SATURATION_PCT:-90}" \
+            --csv "$GENERATOR_ROUNDS_CSV" 2>/dev/null) || summary=""
+    
+    if [[ "$(echo "$summary" | jq -r '.generator_limited // false' 2>/dev/null)" == "true" ]]; then
+        LAST_GENERATOR_LIMITED=true
+        echo "⚠️  Load generator limited this round: $(echo "$summary" | jq -r '.reasons | join(", ")')" \
+             "(see $(basename "$GENERATOR_ROUNDS_CSV"))"
+    elif [[ "$LAST_GENERATOR_SATURATED" == "true" ]]; then
+        LAST_GENERATOR_LIMITED=true
+    fi
+}
+
+# Append the round's throughput and raw vs coordinated-omission-corrected
+# latency to LOAD_CURVE_CSV (analysis/load_curve.py); prints the JSON row.
+record_load_curve() {
+    local attack_output=$1
+    local duration=$2
+    shift 2
+    vegeta encode -to json < "$attack_output" 2>/dev/null | \
+        python3 "${QPS_SCRIPT_DIR}/../analysis/load_curve.py" --results - \
+            --duration "$duration" "$@" --csv "$LOAD_CURVE_CSV" 2>/dev/null
+}
+
+_write_qps_status() {
+    # Only "running qps:N" attributes monitor rows to a QPS level; warmup and
+    # cooldown samples are written without the qps: token (current_qps=0).
+    if [[ -f "$TMP_DIR/qps_test_status" ]]; then
+        echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+        mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+    fi
+}
+
+# Drive load at the round's target rate until latency and success rate are
+# steady (analysis/steady_state.py) or QPS_WARMUP_DURATION is reached.
+# Sets LAST_WARMUP_S and LAST_WARMUP_RESULT (steady | cap | no_data | failed).
+run_warmup() {
+    local qps=$1
+    local targets_file=$2
+    LAST_WARMUP_S=0
+    LAST_WARMUP_RESULT="skipped"
+    [[ $QPS_WARMUP_DURATION -gt 0 ]] || return 0
+
+    echo "🔥 Warmup phase: ${qps} QPS until steady (min ${QPS_WARMUP_MIN:-10}s, max ${QPS_WARMUP_DURATION}s)"
+    _write_qps_status "warmup target:$qps"
+
+    local cpu_prefix warmup_json
+    cpu_prefix="$(cpu_isolation_prefix vegeta)"
+    # The detector exits on steady state; the closed pipe stops vegeta.
+    warmup_json=$($cpu_prefix vegeta attack -format=json -targets="$targets_file" -rate="$qps" \
+            -duration="${QPS_WARMUP_DURATION}s" 2>/dev/null \
+        | vegeta encode -to json 2>/dev/null \
+        | python3 "${QPS_SCRIPT_DIR}/../analysis/steady_state.py" \
+            --window "${WARMUP_STEADY_WINDOW:-5}" \
+            --tolerance "${WARMUP_STEADY_TOLERANCE:-0.10}" \
+            --cv-max "${WARMUP_STEADY_CV:-0.20}" \
+            --success-tolerance "${WARMUP_STEADY_SUCCESS_DELTA:-0.01}" \
+            --min "${QPS_WARMUP_MIN:-10}") || true
+
+    if [[ -z "$warmup_json" ]]; then
+        LAST_WARMUP_RESULT="failed"
+        echo "⚠️  Warmup produced no results, continuing with measurement"
+        return 0
+    fi
+    LAST_WARMUP_S=$(echo "$warmup_json" | jq -r '.warmup_s // 0' 2>/dev/null || echo "0")
+    LAST_WARMUP_RESULT=$(echo "$warmup_json" | jq -r '.reason // "failed"' 2>/dev/null || echo "failed")
+    if [[ "$LAST_WARMUP_RESULT" == "steady" ]]; then
+        echo "✅ Steady state after ${LAST_WARMUP_S}s"
+    else
+        echo "⚠️  Warmup ended without steady state (${LAST_WARMUP_RESULT}, ${LAST_WARMUP_S}s)"
+    fi
+}
+
+# Node CPU before the first round; cooldown waits to return to it.
+capture_cooldown_baseline() {
+    COOLDOWN_BASELINE_CPU=""
+    [[ $QPS_COOLDOWN -gt 0 ]] || return 0
+    COOLDOWN_BASELINE_CPU=$(get_latest_monitoring_data | jq -r '.cpu_usage // empty' 2>/dev/null || echo "")
+    [[ -n "$COOLDOWN_BASELINE_CPU" ]] && echo "📏 Cooldown baseline: CPU ${COOLDOWN_BASELINE_CPU}%"
+    return 0
+}
+
+# Wait until node CPU is within QPS_COOLDOWN_CPU_TOLERANCE of the baseline for
+# two consecutive fresh samples, bounded by QPS_COOLDOWN_MIN / QPS_COOLDOWN.
+# Sets LAST_COOLDOWN_S and LAST_COOLDOWN_RESULT (baseline | cap | fixed).
+wait_for_cooldown() {
+    LAST_COOLDOWN_S=0
+    LAST_COOLDOWN_RESULT="skipped"
+    [[ $QPS_COOLDOWN -gt 0 ]] || return 0
+    _write_qps_status "cooldown"
+
+    if [[ -z "${COOLDOWN_BASELINE_CPU:-}" ]]; then
+        echo "❄️ Cooldown time: ${QPS_COOLDOWN} seconds (no baseline metrics)"
+        sleep "$QPS_COOLDOWN"
+        LAST_COOLDOWN_S=$QPS_COOLDOWN
+        LAST_COOLDOWN_RESULT="fixed"
+        return 0
+    fi
+
+    local limit
+    limit=$(awk "BEGIN {print $COOLDOWN_BASELINE_CPU + ${QPS_COOLDOWN_CPU_TOLERANCE:-5}}")
+    echo "❄️ Cooldown: waiting for CPU <= ${limit}% (max ${QPS_COOLDOWN}s)"
+    local start=$SECONDS elapsed=0 hits=0 last_ts="" data ts cpu
+    LAST_COOLDOWN_RESULT="cap"
+    while [[ $elapsed -lt $QPS_COOLDOWN ]]; do
+        sleep "${MONITOR_INTERVAL:-5}"
+        elapsed=$((SECONDS - start))
+        data=$(get_latest_monitoring_data)
+        ts=$(echo "$data" | jq -r '.timestamp // empty' 2>/dev/null || echo "")
+        cpu=$(echo "$data" | jq -r '.cpu_usage // empty' 2>/dev/null || echo "")
+        [[ -z "$cpu" || "$ts" == "$last_ts" ]] && continue
+        last_ts="$ts"
+        if (( $(awk "BEGIN {print ($cpu <= $limit) ? 1 : 0}") )); then
+            hits=$((hits + 1))
+        else
+            hits=0
+        fi
+        if [[ $hits -ge 2 && $elapsed -ge ${QPS_COOLDOWN_MIN:-5} ]]; then
+            LAST_COOLDOWN_RESULT="baseline"
+            break
+        fi
+    done
+    LAST_COOLDOWN_S=$((SECONDS - start))
+    echo "❄️ Cooldown finished after ${LAST_COOLDOWN_S}s (${LAST_COOLDOWN_RESULT})"
+}
+
+record_round_phases() {
+    local qps=$1 warmup_start=$2 measure_start=$3 measure_end=$4
+    local csv="${ROUND_PHASES_CSV:-${LOGS_DIR}/round_phases_${SESSION_TIMESTAMP}.csv}"
+    if [[ ! -s "$csv" ]]; then
+        echo "qps,warmup_start,measure_start,measure_end,warmup_s,warmup_result,cooldown_s,cooldown_result" > "$csv"
+    fi
+    echo "${qps},${warmup_start},${measure_start},${measure_end},${LAST_WARMUP_S},${LAST_WARMUP_RESULT},${LAST_COOLDOWN_S},${LAST_COOLDOWN_RESULT}" >> "$csv"
+}
+
 # Execute QPS test main logic
-execute_qps_test() {
-    echo "🚀 Starting QPS test execution..."
+# Closed-loop round: CONCURRENCY requests in flight, each Vegeta worker sends
+# its next request when the previous response arrives (-rate=0). Throughput
+# is the result; reports are named vegeta_<N>conc_* next to the QPS rounds.
+execute_closed_loop_round() {
+    local concurrency=$1
+    local duration=$2
+    local targets_file=$3
+    
+    # No qps: token, monitor rows of closed-loop rounds carry current_qps=0
+    _write_qps_status "running concurrency:$concurrency"
+    echo "🚀 Executing closed-loop test: ${concurrency} in flight, duration ${duration} seconds"
+    
+    local vegeta_cmd="vegeta attack -format=json -targets=$targets_file -rate=0 -workers=$concurrency -max-workers=$concurrency -duration=${duration}s"
+    local cpu_prefix
+    cpu_prefix="$(cpu_isolation_prefix vegeta)"
+    [[ -n "$cpu_prefix" ]] && vegeta_cmd="$cpu_prefix $vegeta_cmd"
+    echo "📊 Executing command: $vegeta_cmd"
     
+    local attack_output="${TMP_DIR}/vegeta_attack_${concurrency}conc_${SESSION_TIMESTAMP}.bin"
+    if ! $vegeta_cmd > "$attack_output" 2>/dev/null; then
+        rm -f "$attack_output"
+        echo "❌ Closed-loop test execution failed"
+        return 1
+    fi
+    
+    local summary
+    summary=$(record_load_curve "$attack_output" "$duration" --model closed --concurrency "$concurrency" \
+        --intended-interval-ms "${CLOSED_LOOP_INTENDED_INTERVAL_MS:-0}") || summary=""
+    vegeta report -type=json < "$attack_output" > "${VEGETA_RESULTS_DIR}/vegeta_${concurrency}conc_${SESSION_TIMESTAMP}.json" 2>/dev/null
+    vegeta report -type=text < "$attack_output" > "${REPORTS_DIR}/vegeta_${concurrency}conc_${SESSION_TIMESTAMP}.txt" 2>/dev/null
+    rm -f "$attack_output"
+    
+    if [[ -n "$summary" ]]; then
+        echo "📈 $(echo "$summary" | jq -r '"Throughput \(.throughput) req/s, success \(.success_pct)%, p99 \(.p99_ms) ms (corrected \(.corrected_p99_ms) ms)"')"
+    fi
+    return 0
+}
+
+# One closed-loop round per CLOSED_LOOP_CONCURRENCY level, with the usual
+# cooldown in between. Fails only when no level produced results.
+execute_closed_loop_rounds() {
+    local targets_file=$1
+    local -a levels=()
+    local level ok_count=0
+    IFS=',' read -ra levels <<< "${CLOSED_LOOP_CONCURRENCY:-1,4,16,64,256}"
+    
+    echo ""
+    echo "🔁 Closed-loop rounds: ${#levels[@]} concurrency level(s)"
+    for level in "${levels[@]}"; do
+        level="${level//[[:space:]]/}"
+        if ! [[ "$level" =~ ^[1-9][0-9]*$ ]]; then
+            echo "⚠️  Skipping invalid closed-loop concurrency: '$level'"
+            continue
+        fi
+        echo ""
+        echo "📋 Closed-loop round: concurrency = $level"
+        execute_closed_loop_round "$level" "$DURATION" "$targets_file" && ok_count=$((ok_count + 1))
+        wait_for_cooldown
+    done
+    
+    echo "📊 Closed-loop rounds completed: ${ok_count}/${#levels[@]} (see $(basename "$LOAD_CURVE_CSV"))"
+    [[ $ok_count -gt 0 ]]
+}
+
+slo_search_enabled() {
+    [[ "${SLO_SEARCH:-false}" == "true" ]]
+}
+
+# analysis/slo_capacity.py with the run's SLO spec and default thresholds
+_slo_capacity() {
+    local command=$1
+    shift
+    local -a slo_args=(--p50-ms "${SLO_P50_MS:-0}" --p99-ms "${SLO_P99_MS:-500}" --error-pct "${SLO_ERROR_PCT:-1}")
+    [[ -n "${SLO_SPEC:-}" ]] && slo_args+=(--spec "$SLO_SPEC")
+    [[ "$command" == "next" ]] && slo_args=()
+    python3 "${QPS_SCRIPT_DIR}/../analysis/slo_capacity.py" "$command" "$@" "${slo_args[@]}"
+}
+
+# Check one round's per-method p50/p99/error rate from the RPC proxy sink
+# against the SLO and append them to SLO_ROUNDS_CSV.
+slo_record_round() {
+    local qps=$1 measure_start=$2 measure_end=$3
+    slo_search_enabled || return 0
+    local sink="${PROXY_METHOD_CSV:-${LOGS_DIR}/proxy_method.csv}"
+    if [[ ! -s "$sink" ]]; then
+        echo "⚠️  No RPC proxy sink ($sink), round ${qps} QPS not checked against the SLO"
+        return 1
+    fi
+    # The aggregate sink writes each second out ~2 s after it ends
+    [[ "${PROXY_SINK_FORMAT:-csv}" == "aggregate" ]] && sleep 3
+    local result
+    result=$(_slo_capacity round --proxy-csv "$sink" --qps "$qps" \
+        --start "$measure_start" --end "$measure_end" --csv "$SLO_ROUNDS_CSV") || return 1
+    echo "🎯 SLO at ${qps} QPS: $(echo "$result" | jq -r 'to_entries | map("\(.key) \(if .value then "pass" else "FAIL" end)") | join(", ")')"
+}
+
+# True once every method has failed the SLO at some level
+slo_all_bounded() {
+    slo_search_enabled || return 1
+    [[ "$(_slo_capacity capacity --rounds "$SLO_ROUNDS_CSV" 2>/dev/null | jq -r '.all_bounded' 2>/dev/null)" == "true" ]]
+}
+
+# Bisect between each method's last passing and first failing QPS, widest
+# gap first, then write SLO_CAPACITY_JSON. The ladder's maximum successful
+# QPS is kept: lower probe levels do not replace it.
+slo_search_refine() {
+    local targets_file=$1
+    slo_search_enabled || return 0
+    local max_rounds=${SLO_SEARCH_MAX_ROUNDS:-6} round=0 qps ladder_best=$LAST_SUCCESSFUL_QPS
+    local warmup_start measure_start measure_end
+    while [[ $round -lt $max_rounds ]]; do
+        qps=$(_slo_capacity next --rounds "$SLO_ROUNDS_CSV" --resolution "${SLO_SEARCH_RESOLUTION:-50}" 2>/dev/null)
+        [[ -n "$qps" ]] || break
+        round=$((round + 1))
+        echo ""
+        echo "📋 SLO search round $round: QPS = $qps"
+        warmup_start=$(date +%s)
+        run_warmup "$qps" "$targets_file"
+        measure_start=$(date +%s)
+        execute_single_qps_test "$qps" "$DURATION" "$targets_file" || true
+        measure_end=$(date +%s)
+        slo_record_round "$qps" "$measure_start" "$measure_end"
+        wait_for_cooldown
+        record_round_phases "$qps" "$warmup_start" "$measure_start" "$measure_end"
+    done
+    [[ $LAST_SUCCESSFUL_QPS -lt $ladder_best ]] && LAST_SUCCESSFUL_QPS=$ladder_best
+
+    local result
+    if result=$(_slo_capacity capacity --rounds "$SLO_ROUNDS_CSV" --output "$SLO_CAPACITY_JSON"); then
+        echo ""
+        echo "🎯 SLO capacity after ${round} bisection round(s): whole mix $(echo "$result" | jq -r '.max_qps') QPS, limited by $(echo "$result" | jq -r '.binding_method // "-"')"
+        echo "$result" | jq -r '.methods | to_entries[] | "   \(.key): \(if .value.bounded then "" else ">= " end)\(.value.max_qps) QPS (\(.value.max_rate) calls/s, p99 \(.value.p99_ms) ms)"'
+    else
+        echo "⚠️  No SLO capacity: no round was checked against the SLO"
+    fi
+}
+
+# Fit the Universal Scalability Law to this session's rounds so far
+# (analysis/usl_model.py) and write USL_MODEL_JSON; prints the summary.
+usl_fit_rounds() {
+    local min_rounds=${1:-4}
+    python3 "${QPS_SCRIPT_DIR}/../analysis/usl_model.py" --vegeta-dir "$VEGETA_RESULTS_DIR" \
+        --session "$SESSION_TIMESTAMP" --generator-csv "$GENERATOR_ROUNDS_CSV" \
+        --min-rounds "$min_rounds" --ci-width "${USL_CI_WIDTH:-0.2}" \
+        --output "$USL_MODEL_JSON" 2>/dev/null
+}
+
+# True once the USL peak is bracketed (USL_EARLY_STOP=true): the remaining
+# rounds of the ramp would only measure the far side of the knee.
+usl_knee_bracketed() {
+    [[ "${USL_EARLY_STOP:-false}" == "true" ]] || return 1
+    local summary
+    summary=$(usl_fit_rounds "${USL_MIN_ROUNDS:-5}") || return 1
+    [[ "$(echo "$summary" | jq -r '.knee_bracketed' 2>/dev/null)" == "true" ]] || return 1
+    echo "📐 USL peak bracketed: $(echo "$summary" | jq -r '"\(.peak_throughput | floor) req/s at concurrency \(.peak_concurrency | floor) (95% CI \(.peak_throughput_ci[0] | floor)-\(.peak_throughput_ci[1] | floor))"')"
+}
+
+# Add SLO_CAPACITY_JSON to QPS_STATUS_FILE as slo_capacity
+slo_merge_status() {
+    slo_search_enabled && [[ -s "$SLO_CAPACITY_JSON" && -s "$QPS_STATUS_FILE" ]] || return 0
+    local merged
+    merged=$(jq --slurpfile cap "$SLO_CAPACITY_JSON" '. + {slo_capacity: $cap[0]}' "$QPS_STATUS_FILE") && \
+        echo "$merged" > "$QPS_STATUS_FILE"
+}
+
+execute_qps_test() {
+    echo "🚀 Starting QPS test execution..."    
     local test_start_time=${SESSION_TIMESTAMP}
     
     # Select target file
@@ -863,13 +1255,44 @@ execute_qps_test() {
     echo "🎯 Using target file: $(basename "$targets_file")"
     echo "📊 Target count: $(wc -l < "$targets_file")"
     
+    # Closed-loop only: fixed in-flight levels instead of the QPS ladder
+    if [[ "${LOAD_MODEL:-open}" == "closed" ]]; then
+        capture_cooldown_baseline
+        local closed_rc=0
+        execute_closed_loop_rounds "$targets_file" || closed_rc=$?
+        usl_fit_rounds >/dev/null
+        return $closed_rc
+    fi
+    
     # Initialize test status
     BOTTLENECK_DETECTED=false
     BOTTLENECK_COUNT=0
+    GENERATOR_LIMITED_COUNT=0
     LAST_SUCCESSFUL_QPS=0
+    local current_qps=$INITIAL_QPS
+    local test_count=0
     
-    # Initialize bottleneck detector for intensive mode
-    if [[ "$BENCHMARK_MODE" == "intensive" && "$INTENSIVE_AUTO_STOP" == "true" ]]; then
+    # Resumed run: continue after the last checkpointed round
+    if checkpoint_resuming; then
+        if [[ "$(checkpoint_get '.qps_complete')" == "true" ]]; then
+            echo "♻️  QPS rounds already completed in session ${SESSION_TIMESTAMP}, skipping to analysis"
+            checkpoint_get '.qps_status' > "$QPS_STATUS_FILE"
+            [[ -s "$QPS_STATUS_FILE" ]] || rm -f "$QPS_STATUS_FILE"
+            return 0
+        fi
+        current_qps=$(checkpoint_get '.next_qps')
+        current_qps=${current_qps:-$INITIAL_QPS}
+        test_count=$(checkpoint_get '.rounds | length')
+        LAST_SUCCESSFUL_QPS=$(checkpoint_get '.last_successful_qps')
+        LAST_SUCCESSFUL_QPS=${LAST_SUCCESSFUL_QPS:-0}
+        BOTTLENECK_COUNT=$(checkpoint_get '.bottleneck_count')
+        BOTTLENECK_COUNT=${BOTTLENECK_COUNT:-0}
+        echo "♻️  Resuming at ${current_qps} QPS after ${test_count} round(s), max successful QPS so far: ${LAST_SUCCESSFUL_QPS}"
+    fi
+    
+    # Initialize bottleneck detector for intensive mode (a resumed run keeps
+    # the counters restored from the checkpoint)
+    if [[ "$BENCHMARK_MODE" == "intensive" && "$INTENSIVE_AUTO_STOP" == "true" ]] && ! checkpoint_resuming; then
         echo "🔍 Initializing bottleneck detector (intensive test mode)..."
         if [[ -f "${QPS_SCRIPT_DIR}/../monitoring/bottleneck_detector.sh" ]]; then
             "${QPS_SCRIPT_DIR}/../monitoring/bottleneck_detector.sh" init
@@ -885,22 +1308,25 @@ execute_qps_test() {
     fi
     
     # QPS test loop
-    local current_qps=$INITIAL_QPS
-    local test_count=0
+    local warmup_start measure_start measure_end round_ok
+    capture_cooldown_baseline
     
     while [[ $current_qps -le $MAX_QPS ]]; do
         test_count=$((test_count + 1))
         echo ""
         echo "📋 Test round $test_count: QPS = $current_qps"
         
-        # Warmup phase
-        if [[ $QPS_WARMUP_DURATION -gt 0 ]]; then
-            echo "🔥 Warmup phase: ${QPS_WARMUP_DURATION} seconds"
-            sleep $QPS_WARMUP_DURATION
-        fi
+        # Warmup phase: real load until steady state
+        warmup_start=$(date +%s)
+        run_warmup "$current_qps" "$targets_file"
         
         # Execute single QPS level test
-        if execute_single_qps_test "$current_qps" "$DURATION" "$targets_file"; then
+        measure_start=$(date +%s)
+        round_ok=true
+        execute_single_qps_test "$current_qps" "$DURATION" "$targets_file" || round_ok=false
+        measure_end=$(date +%s)
+        slo_record_round "$current_qps" "$measure_start" "$measure_end"
+        if [[ "$round_ok" == "true" ]]; then
             echo "✅ QPS $current_qps benchmark test successful"
         else
             echo "❌ QPS $current_qps benchmark test failed"
@@ -908,6 +1334,13 @@ execute_qps_test() {
             # Stop if not intensive benchmark mode when test fails
             if [[ "$BENCHMARK_MODE" != "intensive" ]]; then
                 echo "🛑 Test failed in non-intensive benchmark mode, stopping test"
+                if [[ "$LAST_GENERATOR_LIMITED" == "true" ]]; then
+                    echo "⚠️  The load generator limited this round; the node limit is at least ${LAST_SUCCESSFUL_QPS} QPS"
+                fi
+                LAST_COOLDOWN_S=0
+                LAST_COOLDOWN_RESULT="skipped"
+                record_round_phases "$current_qps" "$warmup_start" "$measure_start" "$measure_end"
+                checkpoint_save_round "$current_qps" "$round_ok" "$((current_qps + STEP_QPS))"
                 break
             fi
         fi
@@ -915,27 +1348,55 @@ execute_qps_test() {
         # Check bottleneck in intensive benchmark mode
         if [[ "$BENCHMARK_MODE" == "intensive" && "$INTENSIVE_AUTO_STOP" == "true" ]]; then
             if ! check_bottleneck_during_test "$current_qps"; then
-                echo "🚨 Performance bottleneck detected, stopping benchmark test"
+                if [[ "$GENERATOR_LIMIT_REACHED" == "true" ]]; then
+                    echo "🛑 Load generator limit reached at ${current_qps} QPS, stopping benchmark test"
+                else
+                    echo "🚨 Performance bottleneck detected, stopping benchmark test"
+                fi
                 echo "🏆 Maximum successful QPS: $LAST_SUCCESSFUL_QPS"
+                LAST_COOLDOWN_S=0
+                LAST_COOLDOWN_RESULT="skipped"
+                record_round_phases "$current_qps" "$warmup_start" "$measure_start" "$measure_end"
+                checkpoint_save_round "$current_qps" "$round_ok" "$((current_qps + STEP_QPS))"
                 break
             fi
         fi
         
-        # Cooldown time
-        if [[ $QPS_COOLDOWN -gt 0 ]]; then
-            echo "❄️ Cooldown time: ${QPS_COOLDOWN} seconds"
-            sleep $QPS_COOLDOWN
+        # Cooldown: wait for node metrics to return to baseline
+        wait_for_cooldown
+        record_round_phases "$current_qps" "$warmup_start" "$measure_start" "$measure_end"
+        checkpoint_save_round "$current_qps" "$round_ok" "$((current_qps + STEP_QPS))"
+        
+        if slo_all_bounded; then
+            echo "🎯 Every method has failed its SLO by ${current_qps} QPS, stopping the ladder"
+            break
+        fi
+        if usl_knee_bracketed; then
+            echo "🛑 Stopping the ramp at ${current_qps} QPS, the throughput knee is bracketed"
+            break
         fi
         
         # Increase QPS
         current_qps=$((current_qps + STEP_QPS))
     done
     
+    slo_search_refine "$targets_file"
+    
+    local usl_summary
+    usl_summary=$(usl_fit_rounds) || usl_summary=""
+    if [[ "$(echo "$usl_summary" | jq -r '.fitted' 2>/dev/null)" == "true" ]]; then
+        echo "📐 USL model: $(echo "$usl_summary" | jq -r '"sigma \(.sigma * 1000 | round / 1000), kappa \(.kappa), peak \(if .peak_throughput then "\(.peak_throughput | floor) req/s" else "none (no coherency delay)" end)"')"
+    fi
+    
     echo ""
     echo "🎉 QPS test completed"
     echo "📊 Test rounds: $test_count"
     echo "🏆 Maximum successful QPS: $LAST_SUCCESSFUL_QPS"
     
+    if [[ "${LOAD_MODEL:-open}" == "both" ]]; then
+        execute_closed_loop_rounds "$targets_file" || echo "⚠️  Closed-loop rounds produced no results"
+    fi
+    
     if [[ "$BOTTLENECK_DETECTED" == "true" ]]; then
         echo "🚨 Performance bottleneck detected, detailed information saved"
     else
@@ -949,11 +1410,15 @@ execute_qps_test() {
     "completion_time": "$(date -Iseconds)",
     "test_duration": $DURATION,
     "benchmark_mode": "$BENCHMARK_MODE",
-    "rpc_mode": "$RPC_MODE"
+    "rpc_mode": "$RPC_MODE",
+    "generator_saturated_qps": $GENERATOR_SATURATED_QPS,
+    "generator_limit_reached": $GENERATOR_LIMIT_REACHED
 }
 EOF
         echo "📊 QPS status saved to: $QPS_STATUS_FILE"
     fi
+    slo_merge_status
+    checkpoint_mark_qps_complete
     
     return 0
 }
@@ -13,7 +13,8 @@ Usage:
 
 Modes:
   --preflight     Validate kubectl context and permissions before applying manifests.
-  --post-deploy   Validate DaemonSet rollout, logs, and collector CSV output.
+  --post-deploy   Validate DaemonSet rollout, logs, collector CSV output, and
+                  the node collector row endpoint.
                   This is the default mode.
 
 Environment overrides:
@@ -123,6 +124,20 @@ run_post_deploy() {
     [[ "$header_cols" == "$data_cols" ]] || fail "Collector CSV field mismatch: header=$header_cols data=$data_cols"
 
     log "Collector CSV schema is consistent: $header_cols columns"
+
+    log "Pulling rows from the node collector endpoint inside the pod"
+    local port rows
+    port="$(kubectl get configmap -n "$NAMESPACE" blockchain-bench-config \
+        -o jsonpath='{.data.NODE_COLLECTOR_PORT}' 2>/dev/null || true)"
+    rows="$(kubectl exec -n "$NAMESPACE" "$pod" -- \
+        python3 /opt/blockchain-bench/monitoring/node_pod_collector.py \
+        --pull "http://127.0.0.1:${port:-9102}" --limit 5)" \
+        || fail "Node collector endpoint did not answer on port ${port:-9102}"
+    if [[ -z "$rows" ]]; then
+        warn "Node collector returned no rows; check COLLECTOR_TARGET_NAMESPACES and COLLECTOR_LABEL_SELECTOR"
+    else
+        printf '%s\n' "$rows" | head -n 1
+    fi
     log "Post-deploy validation complete. It is now safe to run the benchmark entry command from the selected runner."
 }
 
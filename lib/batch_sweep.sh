@@ -0,0 +1,120 @@
+#!/bin/bash
+# =====================================================================
+# lib/batch_sweep.sh
+# JSON-RPC batch-size sweep used by blockchain_node_benchmark.sh.
+#
+# Replaces the QPS ladder (Phase 4) with one round per size in BATCH_SIZES
+# at a fixed BATCH_CALLS_PER_SECOND: targets carry N calls per JSON-RPC
+# batch body and Vegeta sends calls/N requests per second. Monitoring keeps
+# running across all rounds; analysis/batch_sweep.py appends each round's
+# HTTP and per-call rates, latency and node CPU/memory to BATCH_SWEEP_CSV.
+#
+# Public API:
+#   batch_sweep_prepare_targets — targets file for one batch size
+#   run_batch_sweep             — all batch sizes
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, BATCH_SWEEP_CSV, UNIFIED_LOG, RPC_MODE,
+#   LOCAL_RPC_URL, ACCOUNTS_OUTPUT_FILE,
+#   SINGLE_METHOD_TARGETS_FILE / MIXED_METHOD_TARGETS_FILE
+#
+# Optional env (config/user_config.sh):
+#   BATCH_SIZES, BATCH_CALLS_PER_SECOND, BATCH_ROUND_DURATION,
+#   BATCH_ROUND_PAUSE
+#
+# Switch:
+#   --batch-sweep CLI flag (consumed by main entry, exports WORKLOAD_TYPE)
+# =====================================================================
+
+_batch_sweep_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+# Size 1 reuses the run's own targets file; larger sizes regenerate the
+# run's methods as N-call batch bodies.
+batch_sweep_prepare_targets() {
+    local size="$1"
+    local default_targets="$SINGLE_METHOD_TARGETS_FILE"
+    [[ "${RPC_MODE:-single}" == "mixed" ]] && default_targets="$MIXED_METHOD_TARGETS_FILE"
+    if [[ "$size" -eq 1 ]]; then
+        echo "$default_targets"
+        return 0
+    fi
+    local out="${TMP_DIR}/batch_targets_${size}.json"
+    if ! "${SCRIPT_DIR}/tools/target_generator.sh" \
+            --accounts-file "$ACCOUNTS_OUTPUT_FILE" \
+            --rpc-url "$LOCAL_RPC_URL" \
+            --rpc-mode "${RPC_MODE:-single}" \
+            --batch-size "$size" \
+            -o "$out" >/dev/null || [[ ! -s "$out" ]]; then
+        return 1
+    fi
+    echo "$out"
+}
+
+run_batch_sweep() {
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Batch sweep requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+
+    local sizes cps duration pause
+    sizes="${BATCH_SIZES:-1,10,50,100}"
+    cps="${BATCH_CALLS_PER_SECOND:-1000}"
+    duration="${BATCH_ROUND_DURATION:-60}"
+    pause="${BATCH_ROUND_PAUSE:-5}"
+    echo "📦 JSON-RPC batch sweep: sizes ${sizes} at ${cps} calls/s, ${duration}s each"
+
+    local vegeta_prefix=""
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+
+    local size targets_file started_at ended_at attack_output report_json summary failed=0
+    local -a size_list
+    IFS=',' read -r -a size_list <<< "$sizes"
+    for size in "${size_list[@]}"; do
+        size="${size// /}"
+        [[ -n "$size" ]] || continue
+        if ! targets_file=$(batch_sweep_prepare_targets "$size"); then
+            echo "⚠️  Batch size ${size}: target generation failed (JSON-RPC methods only)"
+            failed=$((failed + 1))
+            continue
+        fi
+        # -rate=<calls>/<N>s is exactly calls/N requests per second, also
+        # when N does not divide the call rate.
+        echo "   batch size ${size}: ${cps} calls/s as ${cps}/${size}s requests"
+        _batch_sweep_status "running qps:$cps batch:$size"
+        attack_output="${TMP_DIR}/batch_attack.bin"
+        report_json="${TMP_DIR}/batch_report_${size}.json"
+        started_at=$(date '+%Y-%m-%d %H:%M:%S')
+        if $vegeta_prefix vegeta attack -format=json -targets="$targets_file" -rate="${cps}/${size}s" \
+                -duration="${duration}s" > "$attack_output" 2>/dev/null; then
+            vegeta report -type=json < "$attack_output" > "$report_json" 2>/dev/null
+        else
+            echo "⚠️  vegeta round failed (batch size ${size})"
+            failed=$((failed + 1))
+        fi
+        ended_at=$(date '+%Y-%m-%d %H:%M:%S')
+        rm -f "$attack_output"
+        if summary=$(python3 "${SCRIPT_DIR}/analysis/batch_sweep.py" \
+                --report "$report_json" \
+                --batch-size "$size" \
+                --calls-per-second "$cps" \
+                --started-at "$started_at" \
+                --ended-at "$ended_at" \
+                --monitor "${UNIFIED_LOG:-}" \
+                --csv "$BATCH_SWEEP_CSV"); then
+            echo "   $(echo "$summary" | jq -r '"\(.achieved_calls_per_s | floor) calls/s, success \(.success_pct // 0)%, p99 \(.p99_ms // "-") ms, CPU \(.cpu_pct // "-")%"')"
+        fi
+        rm -f "$report_json"
+        _batch_sweep_status "cooldown"
+        sleep "$pause"
+    done
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    [[ $failed -lt ${#size_list[@]} ]]
+}
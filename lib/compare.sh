@@ -0,0 +1,292 @@
+#!/bin/bash
+# =====================================================================
+# lib/compare.sh
+# Multi-endpoint comparison used by blockchain_node_benchmark.sh.
+#
+# Replaces the QPS ladder (Phase 4) with the same QPS levels driven against
+# every endpoint of a compare spec (two clients, versions or storage
+# layouts on the same host). Each endpoint gets its own RPC proxy instance
+# on COMPARE_PROXY_BASE_PORT + index (sink in COMPARE_DIR/<name>/), its own
+# targets file and its own resource sampler for its processes and devices
+# (monitoring/endpoint_resource_collector.py).
+#
+#   interleaved  each level runs on every endpoint in turn at the full rate,
+#                in an order rotated per level
+#   split        each level runs on all endpoints at once at rate / N each
+#
+# Rounds go to COMPARE_RESULTS_CSV; the side-by-side capacity, latency and
+# resource cost go to COMPARE_SUMMARY_JSON (analysis/endpoint_compare.py).
+#
+# Spec (JSON, see config/compare.example.json):
+#   {"endpoints": [{"name": "agave", "rpc_url": "http://127.0.0.1:8899",
+#                   "process_names": ["agave-validator"], "devices": ["nvme1n1"]}, ...]}
+# process_names defaults to BLOCKCHAIN_PROCESS_NAMES, devices to none.
+#
+# Public API:
+#   compare_endpoints        — name<TAB>rpc_url<TAB>process names<TAB>devices per endpoint
+#   compare_endpoint_order   — rotated endpoint list for one level
+#   run_compare              — proxies, samplers, all rounds and the summary
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, COMPARE_DIR, COMPARE_RESULTS_CSV, COMPARE_SUMMARY_JSON,
+#   ACCOUNTS_OUTPUT_FILE, RPC_MODE, BLOCKCHAIN_NODE
+#
+# Optional env (config/user_config.sh):
+#   COMPARE_SPEC, COMPARE_MODE, COMPARE_QPS_LIST, COMPARE_DURATION, COMPARE_PAUSE,
+#   COMPARE_PROXY_BASE_PORT, SLO_SPEC, SLO_P50_MS, SLO_P99_MS, SLO_ERROR_PCT
+#
+# Switch:
+#   --compare <spec.json> CLI flag (consumed by main entry, exports COMPARE_SPEC
+#   and WORKLOAD_TYPE)
+# =====================================================================
+
+declare -ga COMPARE_NAMES=()
+declare -gA COMPARE_URLS=()
+declare -gA COMPARE_TARGETS=()
+declare -gA COMPARE_PROXY_PIDS=()
+declare -gA COMPARE_SAMPLER_PIDS=()
+
+_compare_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+compare_endpoints() {
+    local default_names
+    default_names="$(IFS=','; echo "${BLOCKCHAIN_PROCESS_NAMES[*]:-}")"
+    jq -r --arg names "$default_names" '
+        .endpoints[]? | [
+            .name, .rpc_url,
+            ((.process_names // ($names | split(",") | map(select(. != "")))) | join(",")),
+            ((.devices // []) | join(","))
+        ] | @tsv
+    ' "$COMPARE_SPEC" 2>/dev/null
+}
+
+compare_endpoint_order() {
+    local level_index="$1" n=${#COMPARE_NAMES[@]} i
+    for (( i = 0; i < n; i++ )); do
+        echo "${COMPARE_NAMES[$(( (i + level_index) % n ))]}"
+    done
+}
+
+_compare_load_spec() {
+    COMPARE_NAMES=()
+    COMPARE_URLS=()
+    local name url names devices
+    while IFS=$'\t' read -r name url names devices; do
+        if [[ ! "$name" =~ ^[A-Za-z0-9_.-]+$ || -z "$url" || "$url" == "null" ]]; then
+            echo "❌ Compare spec: every endpoint needs a name ([A-Za-z0-9_.-]) and an rpc_url"
+            return 1
+        fi
+        if [[ -n "${COMPARE_URLS[$name]:-}" ]]; then
+            echo "❌ Compare spec: endpoint name '${name}' is used twice"
+            return 1
+        fi
+        COMPARE_NAMES+=("$name")
+        COMPARE_URLS[$name]="$url"
+        mkdir -p "${COMPARE_DIR}/${name}"
+        printf '%s\n' "$names" > "${COMPARE_DIR}/${name}/process_names"
+        printf '%s\n' "$devices" > "${COMPARE_DIR}/${name}/devices"
+    done < <(compare_endpoints)
+    if [[ ${#COMPARE_NAMES[@]} -lt 2 ]]; then
+        echo "❌ Compare spec needs at least two endpoints: $COMPARE_SPEC"
+        return 1
+    fi
+}
+
+# Proxy instance per endpoint, started like the calibration proxy. Without a
+# proxy the endpoint is attacked directly and has no per-method p99.
+_compare_start_proxy() {
+    local name="$1" port="$2"
+    local dir="${COMPARE_DIR}/${name}" bin chain_file prefix=""
+    bin="$(_proxy_binary_path)"
+    chain_file="${SCRIPT_DIR}/config/chains/${BLOCKCHAIN_NODE:-solana}.json"
+    if proxy_should_skip || [[ ! -x "$bin" || ! -f "$chain_file" ]]; then
+        return 1
+    fi
+    if _proxy_port_in_use "$port"; then
+        echo "⚠️  ${name}: port :${port} in use, attacking ${COMPARE_URLS[$name]} without a proxy"
+        return 1
+    fi
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && prefix="$(cpu_isolation_prefix proxy)"
+    PROXY_SINK_FORMAT="${PROXY_SINK_FORMAT:-csv}" \
+    PROXY_SINK_PATH="${dir}/proxy_method.csv" \
+    PROXY_SELF_PATH="${dir}/proxy_self.csv" \
+    nohup $prefix "$bin" \
+        -chain="$chain_file" \
+        -upstream="${COMPARE_URLS[$name]}" \
+        -listen=":${port}" \
+        >"${dir}/proxy.log" 2>&1 &
+    local pid=$!
+    if ! _proxy_wait_healthy "$pid" "$port"; then
+        echo "⚠️  ${name}: proxy failed to start on :${port} (see ${dir}/proxy.log), attacking directly"
+        kill -TERM "$pid" 2>/dev/null || true
+        return 1
+    fi
+    COMPARE_PROXY_PIDS[$name]=$pid
+}
+
+_compare_prepare_targets() {
+    local name="$1" url="$2"
+    local out="${COMPARE_DIR}/${name}/targets.json"
+    local -a mix_args=(--rpc-mode single)
+    [[ "${RPC_MODE:-single}" == "mixed" ]] && mix_args=(--rpc-mode mixed)
+    "${SCRIPT_DIR}/tools/target_generator.sh" \
+        --accounts-file "$ACCOUNTS_OUTPUT_FILE" \
+        --rpc-url "$url" \
+        "${mix_args[@]}" \
+        -o "$out" >/dev/null && [[ -s "$out" ]] || return 1
+    COMPARE_TARGETS[$name]="$out"
+}
+
+_compare_start_sampler() {
+    local name="$1" dir="${COMPARE_DIR}/${1}"
+    python3 "${SCRIPT_DIR}/monitoring/endpoint_resource_collector.py" --run \
+        --endpoint "$name" \
+        --process-names "$(cat "${dir}/process_names")" \
+        --devices "$(cat "${dir}/devices")" \
+        --interval 1 \
+        --output "${dir}/resources.csv" >/dev/null 2>&1 &
+    COMPARE_SAMPLER_PIDS[$name]=$!
+}
+
+_compare_stop_all() {
+    local pid
+    for pid in "${COMPARE_SAMPLER_PIDS[@]}" "${COMPARE_PROXY_PIDS[@]}"; do
+        kill -TERM "$pid" 2>/dev/null || true
+    done
+    for pid in "${COMPARE_SAMPLER_PIDS[@]}" "${COMPARE_PROXY_PIDS[@]}"; do
+        wait "$pid" 2>/dev/null || true
+    done
+    COMPARE_SAMPLER_PIDS=()
+    COMPARE_PROXY_PIDS=()
+}
+
+# One Vegeta attack against one endpoint; the report lands in
+# COMPARE_DIR/<name>/report_<level>qps.json.
+_compare_attack() {
+    local name="$1" qps="$2" level="$3" duration="$4" prefix="$5"
+    local dir="${COMPARE_DIR}/${name}"
+    if $prefix vegeta attack -format=json -targets="${COMPARE_TARGETS[$name]}" -rate="$qps" \
+            -duration="${duration}s" > "${dir}/attack.bin" 2>/dev/null; then
+        vegeta report -type=json < "${dir}/attack.bin" > "${dir}/report_${level}qps.json" 2>/dev/null
+    else
+        echo "⚠️  vegeta round failed (${name} at ${qps} QPS)"
+        rm -f "${dir}/report_${level}qps.json"
+    fi
+    rm -f "${dir}/attack.bin"
+}
+
+_compare_record() {
+    local name="$1" qps="$2" level="$3" mode="$4" started_at="$5" ended_at="$6" summary
+    if summary=$(python3 "${SCRIPT_DIR}/analysis/endpoint_compare.py" round \
+            --report "${COMPARE_DIR}/${name}/report_${level}qps.json" \
+            --endpoint "$name" --mode "$mode" --level "$level" --qps "$qps" \
+            --started-at "$started_at" --ended-at "$ended_at" \
+            --resources "${COMPARE_DIR}/${name}/resources.csv" --csv "$COMPARE_RESULTS_CSV" \
+            ${SLO_SPEC:+--spec "$SLO_SPEC"} \
+            --p50-ms "${SLO_P50_MS:-0}" --p99-ms "${SLO_P99_MS:-500}" --error-pct "${SLO_ERROR_PCT:-1}"); then
+        echo "   ${name} ${qps} QPS: $(echo "$summary" | jq -r '"p99 \(.p99_ms) ms, errors \(.error_pct)%, CPU \(.cpu_pct // "-")% \(if .passed then "✅" else "❌ \(.violations)" end)"')"
+    else
+        return 1
+    fi
+}
+
+run_compare() {
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Endpoint comparison requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+    if [[ -z "${COMPARE_SPEC:-}" || ! -s "$COMPARE_SPEC" ]]; then
+        echo "❌ Compare spec not found: ${COMPARE_SPEC:-<unset>}"
+        return 1
+    fi
+    mkdir -p "$COMPARE_DIR"
+    _compare_load_spec || return 1
+
+    local mode="${COMPARE_MODE:-interleaved}" duration="${COMPARE_DURATION:-60}" pause="${COMPARE_PAUSE:-10}"
+    if [[ "$mode" != "interleaved" && "$mode" != "split" ]]; then
+        echo "❌ COMPARE_MODE must be interleaved or split, got '${mode}'"
+        return 1
+    fi
+    local -a levels
+    IFS=',' read -r -a levels <<< "${COMPARE_QPS_LIST:-1000,2000,4000}"
+    echo "⚖️  Endpoint comparison (${mode}): ${COMPARE_NAMES[*]} at ${COMPARE_QPS_LIST:-1000,2000,4000} QPS, ${duration}s rounds"
+
+    local base_port="${COMPARE_PROXY_BASE_PORT:-18560}" i=0 name url
+    local -a proxy_args=()
+    for name in "${COMPARE_NAMES[@]}"; do
+        url="${COMPARE_URLS[$name]}"
+        if _compare_start_proxy "$name" $((base_port + i)); then
+            url="http://127.0.0.1:$((base_port + i))"
+            proxy_args+=(--proxy-csv "${name}=${COMPARE_DIR}/${name}/proxy_method.csv")
+            echo "   ${name}: ${COMPARE_URLS[$name]} via proxy :$((base_port + i))"
+        else
+            echo "   ${name}: ${COMPARE_URLS[$name]} (no proxy, no per-method latency)"
+        fi
+        if ! _compare_prepare_targets "$name" "$url"; then
+            echo "❌ ${name}: target generation failed"
+            _compare_stop_all
+            return 1
+        fi
+        _compare_start_sampler "$name"
+        i=$((i + 1))
+    done
+
+    local vegeta_prefix=""
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+
+    local level level_index=0 qps started_at ended_at failed=0 rounds=0 pid
+    local -a order attack_pids
+    for level in "${levels[@]}"; do
+        if [[ "$mode" == "split" ]]; then
+            qps=$(( level / ${#COMPARE_NAMES[@]} ))
+            _compare_status "running qps:$level"
+            started_at=$(date '+%Y-%m-%d %H:%M:%S')
+            attack_pids=()
+            for name in "${COMPARE_NAMES[@]}"; do
+                _compare_attack "$name" "$qps" "$level" "$duration" "$vegeta_prefix" &
+                attack_pids+=($!)
+            done
+            # Only the attacks: the samplers and proxies are background jobs too.
+            for pid in "${attack_pids[@]}"; do
+                wait "$pid"
+            done
+            ended_at=$(date '+%Y-%m-%d %H:%M:%S')
+            for name in "${COMPARE_NAMES[@]}"; do
+                rounds=$((rounds + 1))
+                _compare_record "$name" "$qps" "$level" "$mode" "$started_at" "$ended_at" || failed=$((failed + 1))
+            done
+            _compare_status "cooldown"
+            sleep "$pause"
+        else
+            mapfile -t order < <(compare_endpoint_order "$level_index")
+            for name in "${order[@]}"; do
+                _compare_status "running qps:$level endpoint:$name"
+                started_at=$(date '+%Y-%m-%d %H:%M:%S')
+                _compare_attack "$name" "$level" "$level" "$duration" "$vegeta_prefix"
+                ended_at=$(date '+%Y-%m-%d %H:%M:%S')
+                rounds=$((rounds + 1))
+                _compare_record "$name" "$level" "$level" "$mode" "$started_at" "$ended_at" || failed=$((failed + 1))
+                _compare_status "cooldown"
+                sleep "$pause"
+            done
+        fi
+        level_index=$((level_index + 1))
+    done
+
+    _compare_stop_all
+    local summary
+    if summary=$(python3 "${SCRIPT_DIR}/analysis/endpoint_compare.py" summary --csv "$COMPARE_RESULTS_CSV" \
+            "${proxy_args[@]}" --output "$COMPARE_SUMMARY_JSON"); then
+        echo "⚖️  Capacity: $(echo "$summary" | jq -r '[.max_qps | to_entries[] | "\(.key) \(.value) QPS"] | join(", ")'); compared at $(echo "$summary" | jq -r '.comparison_qps // "-"') QPS"
+    fi
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    [[ $failed -lt $rounds ]]
+}
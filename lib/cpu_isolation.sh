@@ -0,0 +1,85 @@
+#!/bin/bash
+# =====================================================================
+# lib/cpu_isolation.sh
+# Per-role cpusets for single-host runs: node, vegeta, proxy, monitors.
+#
+# Public API:
+#   cpu_isolation_enabled         — return 0 if CPU_ISOLATION_ENABLED=true
+#   cpu_isolation_prefix <role>   — command prefix that confines a new process
+#                                   to CPUSET_<ROLE> (empty when not pinned)
+#   apply_cpu_isolation           — validate the layout, write CPU_LAYOUT_JSON
+#                                   and pin the running node processes
+#
+# Methods (CPU_ISOLATION_METHOD):
+#   taskset  — sched_setaffinity via taskset(1); works without systemd
+#   systemd  — transient scope with AllowedCPUs= (cgroup v2 cpuset)
+# Already-running node processes are always re-pinned with taskset -a -p,
+# because a transient scope can only be created for new processes.
+#
+# Required env (set by config_loader.sh):
+#   SCRIPT_DIR, CPUSET_NODE, CPUSET_VEGETA, CPUSET_PROXY, CPUSET_MONITORS,
+#   CPU_LAYOUT_JSON, BLOCKCHAIN_PROCESS_NAMES_STR
+#
+# Exports after apply_cpu_isolation:
+#   PROXY_CPU_CORES   (CPU count of CPUSET_PROXY, unless already set)
+# =====================================================================
+
+cpu_isolation_enabled() {
+    [[ "${CPU_ISOLATION_ENABLED:-false}" == "true" ]]
+}
+
+cpu_isolation_prefix() {
+    local role="$1"
+    cpu_isolation_enabled || return 0
+    local var="CPUSET_${role^^}"
+    local cpus="${!var:-}"
+    [[ -z "$cpus" ]] && return 0
+
+    if [[ "${CPU_ISOLATION_METHOD:-taskset}" == "systemd" ]] && command -v systemd-run >/dev/null 2>&1; then
+        echo "systemd-run --scope --quiet --collect -p AllowedCPUs=${cpus}"
+    elif command -v taskset >/dev/null 2>&1; then
+        echo "taskset -c ${cpus}"
+    fi
+}
+
+_cpu_isolation_count() {
+    python3 -c 'import sys; sys.path.insert(0, sys.argv[1]); from cpu_role_collector import parse_cpulist; print(len(parse_cpulist(sys.argv[2])))' \
+        "${SCRIPT_DIR}/monitoring" "$1" 2>/dev/null
+}
+
+apply_cpu_isolation() {
+    cpu_isolation_enabled || return 0
+    if ! command -v taskset >/dev/null 2>&1; then
+        echo "⚠️  CPU isolation skipped: taskset not installed (util-linux)"
+        return 0
+    fi
+
+    echo "🧩 CPU isolation: node=${CPUSET_NODE:-*} vegeta=${CPUSET_VEGETA:-*} proxy=${CPUSET_PROXY:-*} monitors=${CPUSET_MONITORS:-*} (${CPU_ISOLATION_METHOD:-taskset})"
+    if ! python3 "${SCRIPT_DIR}/monitoring/cpu_role_collector.py" --validate \
+            --layout-output "$CPU_LAYOUT_JSON"; then
+        echo "❌ CPU layout rejected (see $CPU_LAYOUT_JSON)"
+        return 1
+    fi
+
+    if [[ -n "${CPUSET_NODE:-}" ]]; then
+        local name pid pinned=0
+        for name in ${BLOCKCHAIN_PROCESS_NAMES_STR:-}; do
+            for pid in $(pgrep -x "$name" 2>/dev/null); do
+                if taskset -a -p -c "$CPUSET_NODE" "$pid" >/dev/null 2>&1; then
+                    pinned=$((pinned + 1))
+                fi
+            done
+        done
+        if [[ $pinned -eq 0 ]]; then
+            echo "⚠️  CPU isolation: no node process found to pin (BLOCKCHAIN_PROCESS_NAMES)"
+        else
+            echo "✅ Pinned ${pinned} node process(es) to CPUs ${CPUSET_NODE}"
+        fi
+    fi
+
+    if [[ -z "${PROXY_CPU_CORES:-}" && -n "${CPUSET_PROXY:-}" ]]; then
+        PROXY_CPU_CORES="$(_cpu_isolation_count "$CPUSET_PROXY")"
+        export PROXY_CPU_CORES
+    fi
+    return 0
+}
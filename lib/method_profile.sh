@@ -0,0 +1,143 @@
+#!/bin/bash
+# =====================================================================
+# lib/method_profile.sh
+# Per-method isolation profiling used by blockchain_node_benchmark.sh.
+#
+# Replaces the QPS ladder (Phase 4) with one short ladder per method of
+# rpc_methods.mixed_weighted, sent alone, and then one for the configured
+# mix. Each ladder starts at METHOD_PROFILE_START_QPS, doubles while the
+# round meets the SLO and bisects towards the first failing rate
+# (analysis/method_profile.py next). Rounds go to METHOD_PROFILE_CSV; the
+# isolated profiles, the predicted mix capacity, what-if variants and the
+# check against the measured mix go to METHOD_PROFILE_JSON.
+#
+# Public API:
+#   method_profile_weights          — "method=weight,..." of the chain's mix
+#   method_profile_prepare_targets  — targets file for one method or the mix
+#   run_method_profile              — all ladders and the prediction
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, METHOD_PROFILE_CSV, METHOD_PROFILE_JSON, UNIFIED_LOG,
+#   LOCAL_RPC_URL, ACCOUNTS_OUTPUT_FILE, CHAIN_CONFIG
+#
+# Optional env (config/user_config.sh):
+#   METHOD_PROFILE_START_QPS, METHOD_PROFILE_MAX_QPS, METHOD_PROFILE_RESOLUTION,
+#   METHOD_PROFILE_MAX_ROUNDS, METHOD_PROFILE_DURATION, METHOD_PROFILE_PAUSE,
+#   METHOD_PROFILE_WHAT_IF, SLO_SPEC, SLO_P50_MS, SLO_P99_MS, SLO_ERROR_PCT
+#
+# Switch:
+#   --method-profile CLI flag (consumed by main entry, exports WORKLOAD_TYPE)
+# =====================================================================
+
+_method_profile_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+method_profile_weights() {
+    echo "${CHAIN_CONFIG:-null}" | jq -r '
+        [(.rpc_methods.mixed_weighted // [])[]? | select(.method != null) | "\(.method)=\(.weight // 1)"]
+        | join(",")
+    ' 2>/dev/null
+}
+
+# "mix" regenerates the configured weights; a method name gets a one-method mix.
+method_profile_prepare_targets() {
+    local method="$1" weights="$2"
+    local mix="${method}=1"
+    [[ "$method" == "mix" ]] && mix="$weights"
+    local out="${TMP_DIR}/profile_targets_${method//[^A-Za-z0-9_.-]/_}.json"
+    if ! "${SCRIPT_DIR}/tools/target_generator.sh" \
+            --accounts-file "$ACCOUNTS_OUTPUT_FILE" \
+            --rpc-url "$LOCAL_RPC_URL" \
+            --rpc-mode mixed \
+            --mix "$mix" \
+            -o "$out" >/dev/null || [[ ! -s "$out" ]]; then
+        return 1
+    fi
+    echo "$out"
+}
+
+run_method_profile() {
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Method profiling requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+    local weights
+    weights=$(method_profile_weights)
+    if [[ -z "$weights" ]]; then
+        echo "❌ Method profiling needs rpc_methods.mixed_weighted in the ${BLOCKCHAIN_NODE:-chain} template"
+        return 1
+    fi
+
+    local duration pause
+    duration="${METHOD_PROFILE_DURATION:-30}"
+    pause="${METHOD_PROFILE_PAUSE:-5}"
+    echo "🧬 Method profiling: ${weights//,/, } alone, then as the mix (${duration}s rounds)"
+
+    local vegeta_prefix=""
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+
+    local -a methods
+    IFS=',' read -r -a methods <<< "$weights"
+    methods=("${methods[@]%=*}" "mix")
+
+    local method targets_file qps started_at ended_at attack_output report_json summary failed=0
+    for method in "${methods[@]}"; do
+        if ! targets_file=$(method_profile_prepare_targets "$method" "$weights"); then
+            echo "⚠️  ${method}: target generation failed"
+            failed=$((failed + 1))
+            continue
+        fi
+        qps="${METHOD_PROFILE_START_QPS:-250}"
+        while [[ -n "$qps" ]]; do
+            _method_profile_status "running qps:$qps method:$method"
+            attack_output="${TMP_DIR}/profile_attack.bin"
+            report_json="${TMP_DIR}/profile_report.json"
+            started_at=$(date '+%Y-%m-%d %H:%M:%S')
+            if $vegeta_prefix vegeta attack -format=json -targets="$targets_file" -rate="$qps" \
+                    -duration="${duration}s" > "$attack_output" 2>/dev/null; then
+                vegeta report -type=json < "$attack_output" > "$report_json" 2>/dev/null
+            else
+                echo "⚠️  vegeta round failed (${method} at ${qps} QPS)"
+                rm -f "$report_json"
+            fi
+            ended_at=$(date '+%Y-%m-%d %H:%M:%S')
+            rm -f "$attack_output"
+            if summary=$(python3 "${SCRIPT_DIR}/analysis/method_profile.py" round \
+                    --report "$report_json" --method "$method" --qps "$qps" \
+                    --started-at "$started_at" --ended-at "$ended_at" \
+                    --monitor "${UNIFIED_LOG:-}" --csv "$METHOD_PROFILE_CSV" \
+                    ${SLO_SPEC:+--spec "$SLO_SPEC"} \
+                    --p50-ms "${SLO_P50_MS:-0}" --p99-ms "${SLO_P99_MS:-500}" --error-pct "${SLO_ERROR_PCT:-1}"); then
+                echo "   ${method} ${qps} QPS: $(echo "$summary" | jq -r '"p99 \(.p99_ms) ms, errors \(.error_pct)%, CPU \(.cpu_pct // "-")% \(if .passed then "✅" else "❌ \(.violations)" end)"')"
+            else
+                failed=$((failed + 1))
+                break
+            fi
+            rm -f "$report_json"
+            _method_profile_status "cooldown"
+            sleep "$pause"
+            qps=$(python3 "${SCRIPT_DIR}/analysis/method_profile.py" next --csv "$METHOD_PROFILE_CSV" \
+                --method "$method" --start "${METHOD_PROFILE_START_QPS:-250}" \
+                --max-qps "${METHOD_PROFILE_MAX_QPS:-8000}" \
+                --resolution "${METHOD_PROFILE_RESOLUTION:-10}" \
+                --max-rounds "${METHOD_PROFILE_MAX_ROUNDS:-8}")
+        done
+    done
+
+    if summary=$(python3 "${SCRIPT_DIR}/analysis/method_profile.py" predict --csv "$METHOD_PROFILE_CSV" \
+            --weights "$weights" ${METHOD_PROFILE_WHAT_IF:+--what-if "$METHOD_PROFILE_WHAT_IF"} \
+            --output "$METHOD_PROFILE_JSON"); then
+        echo "🧬 Predicted mix capacity: $(echo "$summary" | jq -r '
+            (.prediction.predicted_qps // 0 | floor | tostring) + " QPS, binding " + (.prediction.binding_method // "-")
+            + (if .validation then "; measured " + (.validation.measured_qps | tostring) + " QPS" else "" end)')"
+    fi
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    [[ $failed -lt ${#methods[@]} ]]
+}
@@ -0,0 +1,122 @@
+#!/bin/bash
+# =====================================================================
+# lib/observer_ab.sh
+# Observer-effect A/B mode used by blockchain_node_benchmark.sh.
+#
+# Runs matched Vegeta rounds with the monitoring stack in each
+# MONITORING_PROFILE (full | minimal | off) and summarizes the deltas
+# against "off" with analysis/observer_effect.py.
+#
+# Public API:
+#   observer_ab_profile_order <rep> <qps_index>  — rotated profile list
+#   run_observer_ab                              — run all rounds + summary
+#
+# Required env (set by main entry):
+#   SCRIPT_DIR, LOGS_DIR, REPORTS_DIR, TMP_DIR, RPC_MODE,
+#   SINGLE_METHOD_TARGETS_FILE / MIXED_METHOD_TARGETS_FILE
+#   start_monitoring_system / stop_monitoring_system (main entry functions)
+#
+# Optional env (config/user_config.sh):
+#   OBSERVER_AB_PROFILES, OBSERVER_AB_QPS_LIST, OBSERVER_AB_DURATION,
+#   OBSERVER_AB_REPEATS, OBSERVER_AB_PAUSE, OBSERVER_AB_DIR
+#
+# Switch:
+#   --observer-ab CLI flag (consumed by main entry, exports OBSERVER_AB_ENABLED=true)
+# =====================================================================
+
+# Rotate the profile order by repetition and QPS level so every profile runs
+# first, middle and last equally often and slow drift does not favour one.
+observer_ab_profile_order() {
+    local rep="$1" qps_index="$2"
+    local -a profiles
+    IFS=',' read -r -a profiles <<< "${OBSERVER_AB_PROFILES:-full,minimal,off}"
+    local n=${#profiles[@]} shift_by i
+    shift_by=$(( (rep + qps_index) % n ))
+    for (( i = 0; i < n; i++ )); do
+        echo "${profiles[$(( (i + shift_by) % n ))]}"
+    done
+}
+
+_observer_ab_start_profile() {
+    local profile="$1"
+    export MONITORING_PROFILE="$profile"
+    if [[ "$profile" == "off" ]]; then
+        # Keep the lifecycle marker so status consumers behave as in a normal run.
+        echo "running" > "$TMP_DIR/qps_test_status.tmp"
+        mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+        return 0
+    fi
+    start_monitoring_system
+}
+
+_observer_ab_stop_profile() {
+    local profile="$1"
+    if [[ "$profile" != "off" ]]; then
+        stop_monitoring_system || true
+    fi
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+}
+
+run_observer_ab() {
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Observer A/B mode requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+
+    local targets_file="$SINGLE_METHOD_TARGETS_FILE"
+    [[ "${RPC_MODE:-single}" == "mixed" ]] && targets_file="$MIXED_METHOD_TARGETS_FILE"
+    if [[ ! -s "$targets_file" ]]; then
+        echo "❌ Observer A/B mode: targets file missing ($targets_file)"
+        return 1
+    fi
+
+    local rounds_dir="${OBSERVER_AB_DIR:-${LOGS_DIR}/observer_ab}"
+    local duration="${OBSERVER_AB_DURATION:-60}"
+    local repeats="${OBSERVER_AB_REPEATS:-3}"
+    local pause="${OBSERVER_AB_PAUSE:-10}"
+    local -a qps_levels
+    IFS=',' read -r -a qps_levels <<< "${OBSERVER_AB_QPS_LIST:-1000,2000,4000}"
+    mkdir -p "$rounds_dir" "$REPORTS_DIR"
+    rm -f "$rounds_dir"/r*_*qps.json 2>/dev/null || true
+
+    echo "🔬 Observer A/B: profiles ${OBSERVER_AB_PROFILES:-full,minimal,off}," \
+         "QPS ${qps_levels[*]}, ${duration}s per round, ${repeats} repetitions"
+
+    local rep qps_index qps profile attack_output vegeta_prefix=""
+    local -a order
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+    for (( rep = 0; rep < repeats; rep++ )); do
+        for qps_index in "${!qps_levels[@]}"; do
+            qps="${qps_levels[$qps_index]}"
+            # Read the order up front: monitor start/stop must not consume the loop's stdin.
+            mapfile -t order < <(observer_ab_profile_order "$rep" "$qps_index")
+            for profile in "${order[@]}"; do
+                echo "   rep $((rep + 1))/${repeats}  ${qps} QPS  monitoring=${profile}"
+                _observer_ab_start_profile "$profile" || { _observer_ab_stop_profile "$profile"; continue; }
+                echo "running qps:$qps" > "$TMP_DIR/qps_test_status.tmp"
+                mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+
+                attack_output="${TMP_DIR}/observer_ab_attack.bin"
+                if $vegeta_prefix vegeta attack -format=json -targets="$targets_file" -rate="$qps" \
+                        -duration="${duration}s" > "$attack_output" 2>/dev/null; then
+                    vegeta report -type=json < "$attack_output" \
+                        > "${rounds_dir}/r${rep}_${profile}_${qps}qps.json" 2>/dev/null
+                else
+                    echo "⚠️  vegeta round failed (rep ${rep}, ${profile}, ${qps} QPS)"
+                fi
+                rm -f "$attack_output"
+
+                _observer_ab_stop_profile "$profile"
+                sleep "$pause"
+            done
+        done
+    done
+    unset MONITORING_PROFILE
+
+    python3 "${SCRIPT_DIR}/analysis/observer_effect.py" \
+        --rounds-dir "$rounds_dir" \
+        --output "${REPORTS_DIR}/observer_effect.json" \
+        --markdown "${REPORTS_DIR}/observer_effect.md" \
+        --success-threshold "${SUCCESS_RATE_THRESHOLD:-95}" \
+        --latency-threshold "${MAX_LATENCY_THRESHOLD:-1000}"
+}
@@ -7,10 +7,16 @@
 #   proxy_should_skip            — return 0 (true) if proxy phase should be skipped
 #   start_rpc_proxy              — start proxy before target generation
 #   stop_rpc_proxy               — stop proxy during cleanup
+#   run_proxy_calibration        — optional paired direct/proxied overhead rounds
 #
 # Required env (set by main entry):
 #   SCRIPT_DIR, LOGS_DIR, LOCAL_RPC_URL, BLOCKCHAIN_NODE
 #
+# Optional env:
+#   PROXY_SINK_FORMAT=csv|aggregate      (aggregate: one row per second/method/status class)
+#   PROXY_SINK_SAMPLE_EVERY=<N>          (aggregate only: raw sample to PROXY_SAMPLE_CSV)
+#   PROXY_CAPTURE_BODIES=true            (request bodies to PROXY_CAPTURE_JSONL for --replay)
+#
 # Exports on success:
 #   PROXY_ENABLED=1
 #   PROXY_PID=<pid>
@@ -21,6 +27,7 @@
 #
 # Skip switches (back-compat):
 #   --no-proxy CLI flag (consumed by main entry, exports SKIP_RPC_PROXY=1)
+#   --calibrate-proxy CLI flag (exports PROXY_CALIBRATION_ENABLED=true)
 #   NO_PROXY_LAYER=1 or SKIP_RPC_PROXY=1
 #   (Intentionally NOT using NO_PROXY which is an HTTP-client convention.)
 # =====================================================================
@@ -118,6 +125,22 @@ _proxy_port_in_use() {
     return 1
 }
 
+# Health-check: tcp-connect to :port for up to 5 seconds while pid is alive.
+_proxy_wait_healthy() {
+    local pid="$1" port="$2" i
+    for i in 1 2 3 4 5; do
+        sleep 1
+        if ! kill -0 "$pid" 2>/dev/null; then
+            return 1
+        fi
+        if (exec 3<>"/dev/tcp/127.0.0.1/${port}") 2>/dev/null; then
+            exec 3<&- 3>&- 2>/dev/null || true
+            return 0
+        fi
+    done
+    return 1
+}
+
 start_rpc_proxy() {
     if proxy_should_skip; then
         echo "⏭️  RPC proxy disabled (NO_PROXY_LAYER/SKIP_RPC_PROXY set) — skipping proxy startup"
@@ -141,11 +164,15 @@ start_rpc_proxy() {
 
     local sink_csv="${PROXY_METHOD_CSV:-${LOGS_DIR}/proxy_method.csv}"
     local self_csv="${PROXY_SELF_CSV:-${LOGS_DIR}/proxy_self.csv}"
+    local sample_csv="${PROXY_SAMPLE_CSV:-${LOGS_DIR}/proxy_method_sample.csv}"
+    local sink_format="${PROXY_SINK_FORMAT:-csv}"
+    local capture_jsonl=""
+    [[ "${PROXY_CAPTURE_BODIES:-false}" == "true" ]] && capture_jsonl="${PROXY_CAPTURE_JSONL:-${LOGS_DIR}/proxy_capture.jsonl}"
     local log_file
     log_file="$(_proxy_log_path)"
 
     # Clear any stale sink so the > 1 line check in stop is meaningful.
-    rm -f "$sink_csv" "$self_csv" 2>/dev/null || true
+    rm -f "$sink_csv" "$self_csv" "$sample_csv" ${capture_jsonl:+"$capture_jsonl"} 2>/dev/null || true
 
     # Root-cause fix: reap orphaned proxy from a previous run BEFORE starting,
     # otherwise a zombie holding :PROXY_LISTEN_PORT makes our bind fail and the
@@ -158,33 +185,25 @@ start_rpc_proxy() {
         return 0
     fi
 
-    echo "🚀 Starting RPC proxy: listen=:${PROXY_LISTEN_PORT} upstream=${LOCAL_RPC_URL} chain=${BLOCKCHAIN_NODE:-solana}"
+    echo "🚀 Starting RPC proxy: listen=:${PROXY_LISTEN_PORT} upstream=${LOCAL_RPC_URL} chain=${BLOCKCHAIN_NODE:-solana} sink=${sink_format}"
+
+    local cpu_prefix=""
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && cpu_prefix="$(cpu_isolation_prefix proxy)"
 
-    PROXY_SINK_FORMAT="csv" \
+    PROXY_SINK_FORMAT="$sink_format" \
     PROXY_SINK_PATH="$sink_csv" \
+    PROXY_SINK_SAMPLE_EVERY="${PROXY_SINK_SAMPLE_EVERY:-0}" \
+    PROXY_SINK_SAMPLE_PATH="$sample_csv" \
     PROXY_SELF_PATH="$self_csv" \
-    nohup "$bin" \
+    PROXY_CAPTURE_PATH="$capture_jsonl" \
+    nohup $cpu_prefix "$bin" \
         -chain="$chain_file" \
         -upstream="$LOCAL_RPC_URL" \
         -listen=":${PROXY_LISTEN_PORT}" \
         >"$log_file" 2>&1 &
     local pid=$!
 
-    # Health-check: tcp-connect to :PROXY_LISTEN_PORT for up to 5 seconds.
-    local healthy=0 i
-    for i in 1 2 3 4 5; do
-        sleep 1
-        if ! kill -0 "$pid" 2>/dev/null; then
-            break
-        fi
-        if (exec 3<>"/dev/tcp/127.0.0.1/${PROXY_LISTEN_PORT}") 2>/dev/null; then
-            exec 3<&- 3>&- 2>/dev/null || true
-            healthy=1
-            break
-        fi
-    done
-
-    if [[ $healthy -ne 1 ]]; then
+    if ! _proxy_wait_healthy "$pid" "$PROXY_LISTEN_PORT"; then
         echo "⚠️  Proxy failed to become healthy on :${PROXY_LISTEN_PORT} (see $log_file) — continuing without proxy"
         kill -TERM "$pid" 2>/dev/null || true
         return 0
@@ -246,3 +265,100 @@ stop_rpc_proxy() {
     # Mark phase 2.5 as inactive so cleanup_framework doesn't try twice.
     export PROXY_ENABLED=0
 }
+
+# Proxy-overhead calibration (PROXY_CALIBRATION_ENABLED=true or --calibrate-proxy).
+# Runs short paired Vegeta rounds per QPS level — straight to the node and
+# through a separate proxy instance on PROXY_CALIBRATION_PORT — and writes the
+# per-QPS overhead curve to PROXY_OVERHEAD_JSON for the report. The separate
+# instance runs the same PROXY_SINK_FORMAT but writes under
+# PROXY_CALIBRATION_DIR, which keeps calibration traffic out of
+# proxy_method.csv / proxy_self.csv.
+# Must run after target generation and before monitoring starts.
+run_proxy_calibration() {
+    if [[ "${PROXY_CALIBRATION_ENABLED:-false}" != "true" ]]; then
+        return 0
+    fi
+    if [[ "${PROXY_ENABLED:-0}" != "1" ]]; then
+        echo "⏭️  Proxy calibration skipped: RPC proxy is not active"
+        return 0
+    fi
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "⚠️  Proxy calibration skipped: vegeta not installed"
+        return 0
+    fi
+
+    local targets_file="$SINGLE_METHOD_TARGETS_FILE"
+    [[ "${RPC_MODE:-single}" == "mixed" ]] && targets_file="$MIXED_METHOD_TARGETS_FILE"
+    if [[ ! -s "$targets_file" ]]; then
+        echo "⚠️  Proxy calibration skipped: targets file missing ($targets_file)"
+        return 0
+    fi
+
+    local port="${PROXY_CALIBRATION_PORT:-18546}"
+    local calib_dir="${PROXY_CALIBRATION_DIR:-${LOGS_DIR}/proxy_calibration}"
+    local output="${PROXY_OVERHEAD_JSON:-${LOGS_DIR}/proxy_overhead.json}"
+    local bin chain_file
+    bin="$(_proxy_binary_path)"
+    chain_file="${SCRIPT_DIR}/config/chains/${BLOCKCHAIN_NODE:-solana}.json"
+    mkdir -p "$calib_dir"
+
+    if _proxy_port_in_use "$port"; then
+        echo "⚠️  Proxy calibration skipped: port :${port} in use"
+        return 0
+    fi
+
+    local proxy_prefix="" vegeta_prefix=""
+    if declare -F cpu_isolation_prefix >/dev/null 2>&1; then
+        proxy_prefix="$(cpu_isolation_prefix proxy)"
+        vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+    fi
+
+    # Calibrate with the run's own sink: the per-record sink work is part of
+    # the overhead being measured. Its output stays in calib_dir.
+    local sink_format="${PROXY_SINK_FORMAT:-csv}"
+    rm -f "${calib_dir}/proxy_method.csv" "${calib_dir}/proxy_method_sample.csv" \
+          "${calib_dir}/proxy_self.csv" 2>/dev/null || true
+
+    echo "📏 Proxy calibration: QPS levels ${PROXY_CALIBRATION_QPS_LIST}, ${PROXY_CALIBRATION_DURATION}s per leg, sink=${sink_format}"
+    PROXY_SINK_FORMAT="$sink_format" \
+    PROXY_SINK_PATH="${calib_dir}/proxy_method.csv" \
+    PROXY_SINK_SAMPLE_EVERY="${PROXY_SINK_SAMPLE_EVERY:-0}" \
+    PROXY_SINK_SAMPLE_PATH="${calib_dir}/proxy_method_sample.csv" \
+    PROXY_SELF_PATH="${calib_dir}/proxy_self.csv" \
+    PROXY_CAPTURE_PATH="" \
+    nohup $proxy_prefix "$bin" \
+        -chain="$chain_file" \
+        -upstream="$ORIGINAL_LOCAL_RPC_URL" \
+        -listen=":${port}" \
+        >"${calib_dir}/proxy.log" 2>&1 &
+    local pid=$!
+
+    if ! _proxy_wait_healthy "$pid" "$port"; then
+        echo "⚠️  Calibration proxy failed to start on :${port} (see ${calib_dir}/proxy.log) — skipping"
+        kill -TERM "$pid" 2>/dev/null || true
+        return 0
+    fi
+
+    $vegeta_prefix python3 "${SCRIPT_DIR}/analysis/proxy_overhead.py" \
+        --targets "$targets_file" \
+        --direct-url "$ORIGINAL_LOCAL_RPC_URL" \
+        --proxy-url "http://127.0.0.1:${port}" \
+        --qps-list "$PROXY_CALIBRATION_QPS_LIST" \
+        --duration "$PROXY_CALIBRATION_DURATION" \
+        --output-dir "$calib_dir" \
+        --output "$output" \
+        --proxy-self-csv "${calib_dir}/proxy_self.csv" \
+        --cpu-cores "${PROXY_CPU_CORES:-$(nproc 2>/dev/null || echo 1)}"
+    local rc=$?
+
+    kill -TERM "$pid" 2>/dev/null || true
+    wait "$pid" 2>/dev/null || true
+
+    if [[ $rc -eq 0 && -s "$output" ]]; then
+        export PROXY_OVERHEAD_JSON="$output"
+        echo "✅ Proxy overhead curve written: $output"
+    else
+        echo "⚠️  Proxy calibration did not produce a curve — reports show uncorrected latency"
+    fi
+    return 0
+}
@@ -0,0 +1,124 @@
+#!/bin/bash
+# =====================================================================
+# lib/replay.sh
+# Recorded-traffic replay used by blockchain_node_benchmark.sh.
+#
+# Replaces the QPS ladder (Phase 4) with one time-faithful replay of a
+# recorded RPC proxy log (REPLAY_SOURCE, a proxy_method.csv in raw or
+# aggregate format, plus optional request bodies from a proxy run with
+# PROXY_CAPTURE_BODIES=true). tools/traffic_replay.py keeps the recorded
+# method mix, inter-arrival times and rate shape, REPLAY_SPEED times faster,
+# and either paces Vegeta in -lazy mode or sends the requests itself.
+# Monitoring and the proxy keep running, so the replay gets the usual
+# per-method attribution; planned vs sent calls per method go to
+# REPLAY_RESULTS_CSV and the schedule lag and rate shape to the
+# _summary.json next to it.
+#
+# Public API:
+#   replay_stage_recording  — copy the recording out of LOGS_DIR before
+#                             start_rpc_proxy clears the proxy sinks there
+#   run_replay              — the replay
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, REPORTS_DIR, REPLAY_RESULTS_CSV, LOCAL_RPC_URL,
+#   BLOCKCHAIN_NODE, ACCOUNTS_OUTPUT_FILE, REPLAY_SOURCE
+#
+# Optional env (config/user_config.sh):
+#   REPLAY_CAPTURE, REPLAY_ENGINE, REPLAY_SPEED, REPLAY_START,
+#   REPLAY_MAX_DURATION, REPLAY_WORKERS, REPLAY_METHODS
+#
+# Switch:
+#   --replay <proxy_method.csv> CLI flag (consumed by main entry, exports
+#   REPLAY_SOURCE and WORKLOAD_TYPE)
+# =====================================================================
+
+_replay_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+replay_stage_recording() {
+    if [[ ! -s "${REPLAY_SOURCE:-}" ]]; then
+        echo "❌ Replay recording not found or empty: ${REPLAY_SOURCE:-<unset>}"
+        return 1
+    fi
+    local capture="${REPLAY_CAPTURE:-$(dirname "$REPLAY_SOURCE")/proxy_capture.jsonl}"
+    mkdir -p "$TMP_DIR"
+    cp "$REPLAY_SOURCE" "${TMP_DIR}/replay_source.csv" || return 1
+    REPLAY_SOURCE="${TMP_DIR}/replay_source.csv"
+    if [[ -s "$capture" ]]; then
+        cp "$capture" "${TMP_DIR}/replay_capture.jsonl" || return 1
+        REPLAY_CAPTURE="${TMP_DIR}/replay_capture.jsonl"
+    else
+        REPLAY_CAPTURE=""
+    fi
+    export REPLAY_SOURCE REPLAY_CAPTURE
+}
+
+run_replay() {
+    local engine="${REPLAY_ENGINE:-vegeta}"
+    if [[ "$engine" == "vegeta" ]] && ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Replay with REPLAY_ENGINE=vegeta requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+    if [[ "$engine" == "native" ]] && ! python3 -c 'import aiohttp' 2>/dev/null; then
+        echo "❌ Replay with REPLAY_ENGINE=native requires aiohttp (pip install -r requirements.txt)"
+        return 1
+    fi
+
+    local summary_json="${REPLAY_RESULTS_CSV%.csv}_summary.json"
+    echo "⏯️  Replaying ${REPLAY_SOURCE} at ${REPLAY_SPEED:-1}x (${engine}," \
+         "bodies: $([[ -n "${REPLAY_CAPTURE:-}" ]] && echo captured || echo rebuilt))"
+
+    local -a replay_args=(
+        --proxy-log "$REPLAY_SOURCE"
+        --rpc-url "$LOCAL_RPC_URL"
+        --chain "${BLOCKCHAIN_NODE,,}"
+        --accounts-file "$ACCOUNTS_OUTPUT_FILE"
+        --engine "$engine"
+        --speed "${REPLAY_SPEED:-1}"
+        --start "${REPLAY_START:-0}"
+        --max-duration "${REPLAY_MAX_DURATION:-0}"
+        --workers "${REPLAY_WORKERS:-512}"
+        --status-file "$TMP_DIR/qps_test_status"
+        --csv "$REPLAY_RESULTS_CSV"
+        --summary "$summary_json"
+    )
+    [[ -n "${REPLAY_CAPTURE:-}" ]] && replay_args+=(--capture "$REPLAY_CAPTURE")
+    [[ -n "${REPLAY_METHODS:-}" ]] && replay_args+=(--methods "$REPLAY_METHODS")
+
+    _replay_status "running qps:0"
+    local rc=0
+    if [[ "$engine" == "vegeta" ]]; then
+        local vegeta_prefix=""
+        declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+        local attack_output="${TMP_DIR}/replay_attack.bin"
+        # -rate=0 sends every target as soon as the pacer writes it;
+        # -max-workers caps the requests in flight.
+        python3 "${SCRIPT_DIR}/tools/traffic_replay.py" "${replay_args[@]}" \
+            | $vegeta_prefix vegeta attack -lazy -format=json -rate=0 \
+                -max-workers="${REPLAY_WORKERS:-512}" > "$attack_output"
+        local -a status=("${PIPESTATUS[@]}")
+        if [[ ${status[0]} -ne 0 || ${status[1]} -ne 0 ]]; then
+            echo "⚠️  Replay failed (pacer ${status[0]}, vegeta ${status[1]})"
+            rc=1
+        else
+            vegeta report -type=json < "$attack_output" > "${REPORTS_DIR}/replay_vegeta_report.json" 2>/dev/null
+            vegeta report < "$attack_output" 2>/dev/null | sed 's/^/   /'
+        fi
+        rm -f "$attack_output"
+    elif ! python3 "${SCRIPT_DIR}/tools/traffic_replay.py" "${replay_args[@]}" >/dev/null; then
+        echo "⚠️  Replay failed"
+        rc=1
+    fi
+    if [[ $rc -eq 0 && -s "$summary_json" ]]; then
+        echo "   $(jq -r '"\(.sent_requests)/\(.planned_requests) requests in \(.elapsed_s)s, peak \(.peak_rate) req/s, schedule lag p99 \(.lag_p99_ms) ms"' "$summary_json")"
+    fi
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    return $rc
+}
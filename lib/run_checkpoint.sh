@@ -0,0 +1,173 @@
+#!/bin/bash
+# =====================================================================
+# lib/run_checkpoint.sh
+# Per-round checkpoints for the QPS loop and --resume <session>.
+#
+# After every completed round the executor records the round result, the
+# loop state, the bottleneck_detector.sh counters and the byte size of each
+# monitor CSV in RUN_CHECKPOINT_JSON. `--resume <session>` reuses that
+# session's current/ files: rows written after the last checkpoint belong to
+# the interrupted round and are cut off, the gap is appended to "resumes",
+# and the QPS loop restarts at the next level.
+#
+# Public API:
+#   checkpoint_scan_resume_arg "$@"   — set RESUME_SESSION/SESSION_TIMESTAMP
+#                                       (call before config_loader.sh)
+#   checkpoint_resuming               — return 0 in a resumed run
+#   checkpoint_init <args...>         — new checkpoint with the entry args
+#   checkpoint_load_args              — stored entry args into RESUME_ARGS
+#   checkpoint_prepare_resume         — truncate CSVs, record the gap,
+#                                       restore detector counters
+#   checkpoint_save_round <qps> <passed> <next_qps>
+#   checkpoint_mark_qps_complete      — store QPS_STATUS_FILE, loop finished
+#   checkpoint_mark_completed         — whole run finished
+#   checkpoint_get <jq filter>        — read a value (empty if absent)
+#
+# Required env (config_loader.sh):
+#   RUN_CHECKPOINT_JSON, MEMORY_SHARE_DIR, QPS_STATUS_FILE and the monitor
+#   CSV paths listed in _checkpoint_csv_files
+# =====================================================================
+
+checkpoint_scan_resume_arg() {
+    RESUME_SESSION=""
+    local found=false
+    while [[ $# -gt 0 ]]; do
+        if [[ "$1" == "--resume" ]]; then
+            RESUME_SESSION="${2:-}"
+            found=true
+            break
+        fi
+        shift
+    done
+    [[ "$found" == "true" ]] || return 0
+    if [[ -z "$RESUME_SESSION" ]]; then
+        echo "❌ --resume requires a session id" >&2
+        exit 1
+    fi
+    RESUME_SESSION="${RESUME_SESSION#session_}"
+    if [[ ! "$RESUME_SESSION" =~ ^[0-9]{8}_[0-9]{6}$ ]]; then
+        echo "❌ --resume expects a session id such as 20260611_120000 (got '${RESUME_SESSION}')" >&2
+        exit 1
+    fi
+    SESSION_TIMESTAMP="$RESUME_SESSION"
+    export RESUME_SESSION SESSION_TIMESTAMP
+}
+
+checkpoint_resuming() {
+    [[ -n "${RESUME_SESSION:-}" ]]
+}
+
+checkpoint_get() {
+    [[ -f "$RUN_CHECKPOINT_JSON" ]] || return 0
+    jq -r "($1) // empty" "$RUN_CHECKPOINT_JSON" 2>/dev/null || true
+}
+
+# jq program applied in place; extra arguments are passed through to jq.
+# Fail-soft: a checkpoint write error must not abort the running benchmark.
+_checkpoint_update() {
+    local filter="$1"
+    shift
+    local tmp="${RUN_CHECKPOINT_JSON}.tmp"
+    if jq "$@" "$filter" "$RUN_CHECKPOINT_JSON" > "$tmp" 2>/dev/null; then
+        mv "$tmp" "$RUN_CHECKPOINT_JSON"
+    else
+        rm -f "$tmp"
+        echo "⚠️  Checkpoint update failed: $RUN_CHECKPOINT_JSON" >&2
+    fi
+}
+
+_checkpoint_csv_files() {
+    printf '%s\n' \
+        "${UNIFIED_LOG:-}" "${NETWORK_CSV:-}" "${BLOCK_HEIGHT_DATA_FILE:-}" \
+        "${MONITORING_OVERHEAD_LOG:-}" "${PAGE_CACHE_CSV:-}" "${PAGE_CACHE_FILES_CSV:-}" \
+        "${CPU_ROLE_CSV:-}" "${PROXY_METHOD_CSV:-}" "${PROXY_SELF_CSV:-}" \
+        "${PROXY_SAMPLE_CSV:-}" "${ROUND_PHASES_CSV:-}" "${VEGETA_WORKERS_CSV:-}" \
+        "${GENERATOR_ROUNDS_CSV:-}"
+}
+
+checkpoint_init() {
+    mkdir -p "$(dirname "$RUN_CHECKPOINT_JSON")"
+    local args_json="[]"
+    [[ $# -gt 0 ]] && args_json=$(printf '%s\n' "$@" | jq -R . | jq -cs .)
+    jq -n --arg session "$SESSION_TIMESTAMP" --argjson now "$(date +%s)" --argjson args "$args_json" \
+        '{session: $session, status: "running", created_at: $now, updated_at: $now,
+          args: $args, qps_complete: false, rounds: [], resumes: []}' > "$RUN_CHECKPOINT_JSON"
+}
+
+checkpoint_load_args() {
+    RESUME_ARGS=()
+    if [[ ! -f "$RUN_CHECKPOINT_JSON" ]]; then
+        echo "❌ No checkpoint for session ${RESUME_SESSION}: $RUN_CHECKPOINT_JSON" >&2
+        return 1
+    fi
+    if [[ "$(checkpoint_get '.status')" == "completed" ]]; then
+        echo "❌ Session ${RESUME_SESSION} already completed; nothing to resume" >&2
+        return 1
+    fi
+    mapfile -t RESUME_ARGS < <(jq -r '.args[]' "$RUN_CHECKPOINT_JSON")
+}
+
+checkpoint_prepare_resume() {
+    local offsets file offset size dropped
+    offsets=$(jq -c '.csv_offsets // {}' "$RUN_CHECKPOINT_JSON")
+    local dropped_json="{}"
+    while IFS= read -r file; do
+        [[ -n "$file" && -f "$file" ]] || continue
+        offset=$(echo "$offsets" | jq -r --arg f "$file" '.[$f] // empty')
+        # No offset: the file appeared after the last checkpoint.
+        [[ -z "$offset" ]] && offset=$(head -1 "$file" | wc -c)
+        size=$(stat -c %s "$file")
+        [[ $size -le $offset ]] && continue
+        dropped=$(tail -c +"$((offset + 1))" "$file" | wc -l)
+        truncate -s "$offset" "$file"
+        dropped_json=$(echo "$dropped_json" | jq -c --arg f "$(basename "$file")" --argjson n "$dropped" '. + {($f): $n}')
+    done < <(_checkpoint_csv_files)
+
+    local interrupted_after
+    interrupted_after=$(checkpoint_get '.updated_at')
+    _checkpoint_update '.resumes += [{interrupted_after: $after, resumed_at: $now, rounds_completed: (.rounds | length), dropped_rows: $dropped}]' \
+        --argjson after "${interrupted_after:-0}" --argjson now "$(date +%s)" --argjson dropped "$dropped_json"
+    echo "♻️  Resuming session ${SESSION_TIMESTAMP}: $(checkpoint_get '.rounds | length') round(s) kept, partial-round rows dropped: ${dropped_json}"
+
+    # bottleneck_detector.sh keeps its consecutive counters in shared memory,
+    # which the interrupted run's cleanup removed.
+    local counters
+    counters=$(jq -c '.bottleneck_detector_counters // empty' "$RUN_CHECKPOINT_JSON")
+    if [[ -n "$counters" ]]; then
+        mkdir -p "$MEMORY_SHARE_DIR"
+        echo "$counters" > "${BOTTLENECK_COUNTERS_FILE:-${MEMORY_SHARE_DIR}/bottleneck_counters.json}"
+    fi
+}
+
+checkpoint_save_round() {
+    local qps="$1" passed="$2" next_qps="$3"
+    [[ -f "$RUN_CHECKPOINT_JSON" ]] || return 0
+    local offsets="{}" file
+    while IFS= read -r file; do
+        [[ -n "$file" && -f "$file" ]] || continue
+        offsets=$(echo "$offsets" | jq -c --arg f "$file" --argjson n "$(stat -c %s "$file")" '. + {($f): $n}')
+    done < <(_checkpoint_csv_files)
+    local counters_file="${BOTTLENECK_COUNTERS_FILE:-${MEMORY_SHARE_DIR}/bottleneck_counters.json}"
+    local counters="null"
+    [[ -s "$counters_file" ]] && counters=$(jq -c '.' "$counters_file" 2>/dev/null || echo "null")
+
+    _checkpoint_update '.rounds += [{qps: $qps, passed: $passed, completed_at: $now}]
+        | .next_qps = $next | .last_successful_qps = $last | .bottleneck_count = $count
+        | .bottleneck_detector_counters = $counters | .csv_offsets = $offsets | .updated_at = $now' \
+        --argjson qps "$qps" --argjson passed "$passed" --argjson next "$next_qps" \
+        --argjson last "${LAST_SUCCESSFUL_QPS:-0}" --argjson count "${BOTTLENECK_COUNT:-0}" \
+        --argjson counters "$counters" --argjson offsets "$offsets" --argjson now "$(date +%s)"
+}
+
+checkpoint_mark_qps_complete() {
+    [[ -f "$RUN_CHECKPOINT_JSON" ]] || return 0
+    local status="null"
+    [[ -s "$QPS_STATUS_FILE" ]] && status=$(jq -c '.' "$QPS_STATUS_FILE" 2>/dev/null || echo "null")
+    _checkpoint_update '.qps_complete = true | .qps_status = $status | .updated_at = $now' \
+        --argjson status "$status" --argjson now "$(date +%s)"
+}
+
+checkpoint_mark_completed() {
+    [[ -f "$RUN_CHECKPOINT_JSON" ]] || return 0
+    _checkpoint_update '.status = "completed" | .updated_at = $now' --argjson now "$(date +%s)"
+}
@@ -0,0 +1,159 @@
+#!/bin/bash
+# =====================================================================
+# lib/sweep.sh
+# Multi-dimensional sweep mode used by blockchain_node_benchmark.sh.
+#
+# Replaces the QPS ladder (Phase 4) with every cell of a matrix spec:
+# QPS levels x max connections x keep-alive on/off x method-mix variants.
+# Cells run in the seeded random order planned by analysis/sweep_matrix.py
+# after one shared warmup; monitoring keeps running across all cells.
+#
+# Public API:
+#   sweep_prepare_targets   — targets file per mix variant
+#   run_sweep               — warmup, all cells, tidy results + summary
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, REPORTS_DIR, SWEEP_DIR, SWEEP_RESULTS_CSV, RPC_MODE,
+#   LOCAL_RPC_URL, ACCOUNTS_OUTPUT_FILE,
+#   SINGLE_METHOD_TARGETS_FILE / MIXED_METHOD_TARGETS_FILE
+#
+# Optional env (config/user_config.sh):
+#   SWEEP_SPEC, WARMUP_STEADY_* / QPS_WARMUP_MIN (shared warmup detector)
+#
+# Switch:
+#   --sweep <spec.json> CLI flag (consumed by main entry, exports SWEEP_SPEC)
+# =====================================================================
+
+declare -gA SWEEP_TARGETS=()
+
+_sweep_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+# One targets file per mix variant. A null mix reuses the run's own targets
+# file; a weight map regenerates mixed targets with those weights.
+sweep_prepare_targets() {
+    local default_targets="$SINGLE_METHOD_TARGETS_FILE"
+    [[ "${RPC_MODE:-single}" == "mixed" ]] && default_targets="$MIXED_METHOD_TARGETS_FILE"
+    SWEEP_TARGETS=()
+
+    local name weights out
+    while IFS=$'\t' read -r name weights; do
+        [[ -z "$name" ]] && continue
+        if [[ -z "$weights" ]]; then
+            SWEEP_TARGETS[$name]="$default_targets"
+        else
+            out="${SWEEP_DIR}/targets_${name}.json"
+            if ! "${SCRIPT_DIR}/tools/target_generator.sh" \
+                    --accounts-file "$ACCOUNTS_OUTPUT_FILE" \
+                    --rpc-url "$LOCAL_RPC_URL" \
+                    --rpc-mode mixed \
+                    --mix "$weights" \
+                    -o "$out" >/dev/null; then
+                echo "❌ Sweep: target generation failed for mix '${name}' (${weights})"
+                return 1
+            fi
+            SWEEP_TARGETS[$name]="$out"
+        fi
+        if [[ ! -s "${SWEEP_TARGETS[$name]}" ]]; then
+            echo "❌ Sweep: targets file missing for mix '${name}': ${SWEEP_TARGETS[$name]}"
+            return 1
+        fi
+        echo "   mix ${name}: ${weights:-run targets} → ${SWEEP_TARGETS[$name]}"
+    done < <(python3 "${SCRIPT_DIR}/analysis/sweep_matrix.py" plan --spec "$SWEEP_SPEC" --mixes)
+}
+
+# Shared warmup before the first cell: the first mix at the median QPS level,
+# stopped by analysis/steady_state.py or after the spec's "warmup" seconds.
+_sweep_warmup() {
+    local warmup="$1" qps="$2" targets_file="$3" vegeta_prefix="$4"
+    [[ "$warmup" -gt 0 ]] || return 0
+    echo "🔥 Shared warmup: ${qps} QPS until steady (max ${warmup}s)"
+    _sweep_status "warmup target:$qps"
+    local warmup_json
+    warmup_json=$($vegeta_prefix vegeta attack -format=json -targets="$targets_file" -rate="$qps" \
+            -duration="${warmup}s" 2>/dev/null \
+        | vegeta encode -to json 2>/dev/null \
+        | python3 "${SCRIPT_DIR}/analysis/steady_state.py" \
+            --window "${WARMUP_STEADY_WINDOW:-5}" \
+            --tolerance "${WARMUP_STEADY_TOLERANCE:-0.10}" \
+            --cv-max "${WARMUP_STEADY_CV:-0.20}" \
+            --success-tolerance "${WARMUP_STEADY_SUCCESS_DELTA:-0.01}" \
+            --min "${QPS_WARMUP_MIN:-10}") || true
+    echo "   warmup: $(echo "$warmup_json" | jq -r '"\(.reason // "failed") after \(.warmup_s // 0)s"' 2>/dev/null || echo "failed")"
+}
+
+run_sweep() {
+    if ! command -v vegeta >/dev/null 2>&1; then
+        echo "❌ Sweep mode requires vegeta (install with --install-vegeta)"
+        return 1
+    fi
+    if [[ ! -f "${SWEEP_SPEC:-}" ]]; then
+        echo "❌ Sweep spec not found: ${SWEEP_SPEC:-<unset>}"
+        return 1
+    fi
+
+    mkdir -p "$SWEEP_DIR" "$REPORTS_DIR"
+    local plan_tsv="${SWEEP_DIR}/plan.tsv" schedule_csv="${SWEEP_DIR}/schedule.csv"
+    if ! python3 "${SCRIPT_DIR}/analysis/sweep_matrix.py" plan --spec "$SWEEP_SPEC" > "$plan_tsv"; then
+        echo "❌ Invalid sweep spec: $SWEEP_SPEC"
+        return 1
+    fi
+    cp "$SWEEP_SPEC" "${SWEEP_DIR}/spec.json"
+
+    local duration warmup pause cells
+    duration=$(jq -r '.duration // 30' "$SWEEP_SPEC")
+    warmup=$(jq -r '.warmup // 60' "$SWEEP_SPEC")
+    pause=$(jq -r '.pause // 5' "$SWEEP_SPEC")
+    cells=$(( $(wc -l < "$plan_tsv") - 1 ))
+    echo "🧮 Sweep: ${cells} cells, ${duration}s each, seed $(jq -r '.seed // "random"' "$SWEEP_SPEC")"
+
+    sweep_prepare_targets || return 1
+
+    local vegeta_prefix=""
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+
+    local first_mix warmup_qps
+    first_mix=$(jq -r '(.mixes // {"default": null}) | keys_unsorted[0]' "$SWEEP_SPEC")
+    warmup_qps=$(jq -r '.qps | sort | .[(length / 2 | floor)]' "$SWEEP_SPEC")
+    _sweep_warmup "$warmup" "$warmup_qps" "${SWEEP_TARGETS[$first_mix]}" "$vegeta_prefix"
+
+    echo "order,cell_id,mix,max_connections,keepalive,qps,rep,started_at,ended_at" > "$schedule_csv"
+    # Read the plan up front: vegeta must not consume the loop's stdin.
+    local -a plan_rows
+    mapfile -t plan_rows < <(tail -n +2 "$plan_tsv")
+    local row order cell_id mix conns keepalive qps rep started_at attack_output
+    for row in "${plan_rows[@]}"; do
+        IFS=$'\t' read -r order cell_id mix conns keepalive qps rep <<< "$row"
+        echo "   [$((order + 1))/${cells}] ${qps} QPS  mix=${mix}  max-connections=${conns}  keepalive=${keepalive}"
+        _sweep_status "running qps:$qps"
+        started_at=$(date '+%Y-%m-%d %H:%M:%S')
+        attack_output="${TMP_DIR}/sweep_attack.bin"
+        if $vegeta_prefix vegeta attack -format=json -targets="${SWEEP_TARGETS[$mix]}" -rate="$qps" \
+                -duration="${duration}s" -connections="$conns" -max-connections="$conns" \
+                -keepalive="$keepalive" > "$attack_output" 2>/dev/null; then
+            vegeta report -type=json < "$attack_output" > "${SWEEP_DIR}/${cell_id}.json" 2>/dev/null
+        else
+            echo "⚠️  vegeta cell failed (${cell_id})"
+        fi
+        rm -f "$attack_output"
+        echo "${order},${cell_id},${mix},${conns},${keepalive},${qps},${rep},${started_at},$(date '+%Y-%m-%d %H:%M:%S')" >> "$schedule_csv"
+        _sweep_status "cooldown"
+        sleep "$pause"
+    done
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    python3 "${SCRIPT_DIR}/analysis/sweep_matrix.py" summarize \
+        --schedule "$schedule_csv" \
+        --cells-dir "$SWEEP_DIR" \
+        --results "$SWEEP_RESULTS_CSV" \
+        --output "${REPORTS_DIR}/sweep_summary.json" \
+        --markdown "${REPORTS_DIR}/sweep_summary.md" \
+        --success-threshold "${SUCCESS_RATE_THRESHOLD:-95}" \
+        --latency-threshold "${MAX_LATENCY_THRESHOLD:-1000}"
+}
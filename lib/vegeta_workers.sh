@@ -0,0 +1,197 @@
+#!/bin/bash
+# =====================================================================
+# lib/vegeta_workers.sh
+# Distributed load generation for core/master_qps_executor.sh.
+#
+# One `vegeta attack` process tops out on one box. With VEGETA_WORKERS > 1
+# (local processes) or VEGETA_WORKER_HOSTS (SSH destinations) each round's
+# rate and targets file are split across the workers, which start in
+# lockstep at a shared wall-clock time. Their JSON result streams are merged
+# into one per-round result set for `vegeta report`, and
+# analysis/vegeta_workers.py appends each worker's achieved rate to
+# VEGETA_WORKERS_CSV so a saturated generator is not read as a node limit.
+#
+# Public API:
+#   vegeta_workers_enabled                         — return 0 if distributed
+#   vegeta_workers_list                            — "local" or host per line
+#   vegeta_workers_rate <qps> <n> <index>          — rate share of one worker
+#   vegeta_workers_shard <targets> <n> <dir>       — targets_<i>.json shards
+#   vegeta_workers_remote_targets <shard> <output> — shard as a remote worker sees it
+#   vegeta_workers_attack <qps> <duration> <targets> <merged_output>
+#       sets LAST_GENERATOR_SATURATED (true | false)
+#
+# Required env (config_loader.sh):
+#   TMP_DIR, SESSION_TIMESTAMP, VEGETA_WORKERS_CSV
+#
+# Optional env (config/user_config.sh):
+#   VEGETA_WORKERS, VEGETA_WORKER_HOSTS, VEGETA_WORKER_SSH_OPTS,
+#   VEGETA_WORKER_TARGET_URL, VEGETA_WORKER_START_DELAY,
+#   VEGETA_WORKER_RATE_TOLERANCE
+# =====================================================================
+
+_VEGETA_WORKERS_LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+vegeta_workers_enabled() {
+    [[ -n "${VEGETA_WORKER_HOSTS:-}" || "${VEGETA_WORKERS:-1}" -gt 1 ]]
+}
+
+vegeta_workers_list() {
+    if [[ -n "${VEGETA_WORKER_HOSTS:-}" ]]; then
+        tr ',' '\n' <<< "$VEGETA_WORKER_HOSTS" | sed 's/^ *//; s/ *$//; /^$/d'
+        return 0
+    fi
+    local i
+    for (( i = 0; i < ${VEGETA_WORKERS:-1}; i++ )); do
+        echo "local"
+    done
+}
+
+# Integer split; the remainder goes to the first workers. Callers keep
+# n <= qps so no worker gets a zero share.
+vegeta_workers_rate() {
+    local qps="$1" n="$2" index="$3"
+    echo $(( qps / n + (index < qps % n ? 1 : 0) ))
+}
+
+# Round-robin line shards, so every worker gets the same method mix. A
+# targets file shorter than the worker count is given whole to every worker.
+vegeta_workers_shard() {
+    local targets_file="$1" n="$2" dir="$3" i
+    mkdir -p "$dir"
+    rm -f "$dir"/targets_*.json
+    if [[ $(wc -l < "$targets_file") -lt $n ]]; then
+        for (( i = 0; i < n; i++ )); do
+            cp "$targets_file" "$dir/targets_${i}.json"
+        done
+        return 0
+    fi
+    awk -v n="$n" -v dir="$dir" '{ print > (dir "/targets_" ((NR - 1) % n) ".json") }' "$targets_file"
+}
+
+_vegeta_workers_is_loopback() {
+    local authority="${1#*://}"
+    authority="${authority%%/*}"
+    authority="${authority##*@}"
+    [[ "$authority" =~ ^(localhost|127\.[0-9.]+|0\.0\.0\.0|\[::1?\])(:[0-9]+)?$ ]]
+}
+
+# Targets are built from LOCAL_RPC_URL, which is http://localhost:<port> while
+# the proxy runs. On an SSH worker that is the worker's own loopback, so the
+# scheme and host of every URL are replaced by VEGETA_WORKER_TARGET_URL; a
+# loopback URL that would still reach a remote worker is refused.
+vegeta_workers_remote_targets() {
+    local shard="$1" output="$2" base="${VEGETA_WORKER_TARGET_URL:-}"
+    base="${base%/}"
+    if [[ -n "$base" ]]; then
+        jq -c --arg base "$base" '.url |= sub("^[A-Za-z][A-Za-z0-9+.-]*://[^/]+"; $base)' "$shard" > "$output" || return 1
+    else
+        cp "$shard" "$output"
+    fi
+    local url
+    while IFS= read -r url; do
+        if _vegeta_workers_is_loopback "$url"; then
+            echo "❌ Vegeta worker target ${url} is loopback on the SSH workers;" \
+                 "set VEGETA_WORKER_TARGET_URL to an address they can reach (e.g. http://<runner-ip>:${PROXY_LISTEN_PORT:-18545})"
+            return 1
+        fi
+    done < <(jq -r '.url' "$output" | sort -u)
+    return 0
+}
+
+# Shell snippet that sleeps until epoch <start_at>; runs locally and over SSH.
+_vegeta_workers_wait_cmd() {
+    echo "sleep \"\$(awk -v t=$1 -v now=\"\$(date +%s.%N)\" 'BEGIN { d = t - now; print (d > 0 ? d : 0) }')\""
+}
+
+vegeta_workers_attack() {
+    local qps="$1" duration="$2" targets_file="$3" merged_output="$4"
+    LAST_GENERATOR_SATURATED=false
+
+    local -a hosts
+    mapfile -t hosts < <(vegeta_workers_list)
+    local n=${#hosts[@]}
+    if [[ $n -eq 0 ]]; then
+        echo "❌ No Vegeta workers configured"
+        return 1
+    fi
+    # A zero share would be `-rate=0`, which Vegeta reads as "unlimited":
+    # below one request per second per worker, use only the first qps workers.
+    if (( qps > 0 && n > qps )); then
+        hosts=("${hosts[@]:0:qps}")
+        n=$qps
+    fi
+
+    local work_dir="${TMP_DIR}/vegeta_workers_${qps}qps"
+    vegeta_workers_shard "$targets_file" "$n" "$work_dir"
+    rm -f "$work_dir"/results_*.jsonl
+
+    local ssh_opts="${VEGETA_WORKER_SSH_OPTS:--o BatchMode=yes -o ConnectTimeout=10}"
+    local remote_targets="/tmp/bnb_vegeta_targets_${SESSION_TIMESTAMP}"
+    local i host
+    for i in "${!hosts[@]}"; do
+        host="${hosts[$i]}"
+        [[ "$host" == "local" ]] && continue
+        if ! vegeta_workers_remote_targets "$work_dir/targets_${i}.json" "$work_dir/remote_targets_${i}.json"; then
+            rm -rf "$work_dir"
+            return 1
+        fi
+        # shellcheck disable=SC2086
+        if ! scp -q $ssh_opts "$work_dir/remote_targets_${i}.json" "${host}:${remote_targets}_${i}.json"; then
+            echo "❌ Could not copy targets to Vegeta worker ${host}"
+            return 1
+        fi
+    done
+
+    # Shards are in place: every worker waits for the same wall-clock start.
+    local start_at wait_cmd vegeta_prefix="" rate
+    start_at=$(( $(date +%s) + ${VEGETA_WORKER_START_DELAY:-3} ))
+    wait_cmd="$(_vegeta_workers_wait_cmd "$start_at")"
+    declare -F cpu_isolation_prefix >/dev/null 2>&1 && vegeta_prefix="$(cpu_isolation_prefix vegeta)"
+    echo "🛰️  ${n} Vegeta workers, ${qps} QPS total, start at $(date -d "@${start_at}" '+%H:%M:%S' 2>/dev/null || echo "$start_at")"
+
+    local -a pids=() worker_args=()
+    for i in "${!hosts[@]}"; do
+        host="${hosts[$i]}"
+        rate=$(vegeta_workers_rate "$qps" "$n" "$i")
+        worker_args+=(--worker "${i}:${host}:${rate}:${work_dir}/results_${i}.jsonl")
+        if [[ "$host" == "local" ]]; then
+            (
+                eval "$wait_cmd"
+                $vegeta_prefix vegeta attack -format=json -targets="$work_dir/targets_${i}.json" \
+                    -rate="$rate" -duration="${duration}s" 2>/dev/null \
+                    | vegeta encode -to json > "$work_dir/results_${i}.jsonl" 2>/dev/null
+            ) &
+        else
+            # shellcheck disable=SC2086
+            ssh $ssh_opts "$host" "${wait_cmd}; vegeta attack -format=json -targets=${remote_targets}_${i}.json \
+                -rate=${rate} -duration=${duration}s 2>/dev/null | vegeta encode -to json; rm -f ${remote_targets}_${i}.json" \
+                > "$work_dir/results_${i}.jsonl" 2>/dev/null < /dev/null &
+        fi
+        pids+=($!)
+    done
+
+    local pid failed=0
+    for pid in "${pids[@]}"; do
+        wait "$pid" || failed=$((failed + 1))
+    done
+
+    cat "$work_dir"/results_*.jsonl > "$merged_output" 2>/dev/null || true
+    local summary
+    summary=$(python3 "${_VEGETA_WORKERS_LIB_DIR}/../analysis/vegeta_workers.py" \
+        --qps "$qps" --duration "$duration" \
+        --tolerance "${VEGETA_WORKER_RATE_TOLERANCE:-0.05}" \
+        --csv "$VEGETA_WORKERS_CSV" "${worker_args[@]}" 2>/dev/null) || summary=""
+    if [[ "$(echo "$summary" | jq -r '.saturated // false' 2>/dev/null)" == "true" ]]; then
+        LAST_GENERATOR_SATURATED=true
+        echo "⚠️  Load generator saturated: worker(s) $(echo "$summary" | jq -r '.saturated_workers | join(",")')" \
+             "reached $(echo "$summary" | jq -r '.achieved_rate') of ${qps} QPS (see $(basename "$VEGETA_WORKERS_CSV"))"
+    fi
+    rm -rf "$work_dir"
+
+    if [[ $failed -eq $n || ! -s "$merged_output" ]]; then
+        echo "❌ All Vegeta workers failed"
+        return 1
+    fi
+    [[ $failed -gt 0 ]] && echo "⚠️  ${failed}/${n} Vegeta workers exited with an error"
+    return 0
+}
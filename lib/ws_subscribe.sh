@@ -0,0 +1,114 @@
+#!/bin/bash
+# =====================================================================
+# lib/ws_subscribe.sh
+# WebSocket subscription workload used by blockchain_node_benchmark.sh.
+#
+# Replaces the HTTP QPS ladder (Phase 4) with rounds of concurrent
+# subscriptions: each level of WS_SUBSCRIPTION_LEVELS is opened at
+# WS_SUBSCRIBE_RAMP subscriptions/s by tools/ws_subscription_bench.py and
+# held for WS_SUBSCRIBE_DURATION seconds. Monitoring keeps running across
+# all levels; each level's per-method subscribe latency, notification
+# throughput, block-time delay and fan-out go to WS_SUBSCRIPTIONS_CSV.
+#
+# Public API:
+#   ws_subscribe_url        — WebSocket endpoint of the node under test
+#   run_ws_subscribe        — all subscription levels
+#
+# Required env (set by main entry / config_loader.sh):
+#   SCRIPT_DIR, TMP_DIR, WS_SUBSCRIPTIONS_CSV, LOCAL_RPC_URL (or
+#   ORIGINAL_LOCAL_RPC_URL behind the RPC proxy),
+#   BLOCKCHAIN_NODE, ACCOUNTS_OUTPUT_FILE
+#
+# Optional env (config/user_config.sh):
+#   LOCAL_WS_URL, WS_SUBSCRIPTION_LEVELS, WS_SUBSCRIBE_RAMP,
+#   WS_SUBSCRIBE_DURATION, WS_SUBS_PER_CONNECTION, WS_SUBSCRIBE_METHODS,
+#   WS_SUBSCRIBE_PAUSE
+#
+# Switch:
+#   --ws-subscribe CLI flag (consumed by main entry, exports WORKLOAD_TYPE)
+# =====================================================================
+
+_ws_subscribe_status() {
+    echo "$1" > "$TMP_DIR/qps_test_status.tmp"
+    mv "$TMP_DIR/qps_test_status.tmp" "$TMP_DIR/qps_test_status"
+}
+
+# The node's own HTTP endpoint: the RPC proxy only relays HTTP, so
+# subscriptions and getBlockTime lookups bypass it.
+_ws_subscribe_rpc_url() {
+    echo "${ORIGINAL_LOCAL_RPC_URL:-$LOCAL_RPC_URL}"
+}
+
+# LOCAL_WS_URL, or the node's RPC URL with a ws scheme and the next port
+# (8899 → 8900 for Solana, 8545 → 8546 for geth-style nodes).
+ws_subscribe_url() {
+    if [[ -n "${LOCAL_WS_URL:-}" ]]; then
+        echo "$LOCAL_WS_URL"
+        return 0
+    fi
+    local url
+    url="$(_ws_subscribe_rpc_url)"
+    url="${url/#https:/wss:}"
+    url="${url/#http:/ws:}"
+    if [[ "$url" =~ ^(wss?://[^/:]+):([0-9]+)(.*)$ ]]; then
+        url="${BASH_REMATCH[1]}:$(( BASH_REMATCH[2] + 1 ))${BASH_REMATCH[3]}"
+    fi
+    echo "$url"
+}
+
+run_ws_subscribe() {
+    if ! python3 -c 'import aiohttp' 2>/dev/null; then
+        echo "❌ WebSocket subscription mode requires aiohttp (pip install -r requirements.txt)"
+        return 1
+    fi
+
+    local url levels duration ramp
+    url="$(ws_subscribe_url)"
+    levels="${WS_SUBSCRIPTION_LEVELS:-100,500,1000}"
+    duration="${WS_SUBSCRIBE_DURATION:-60}"
+    ramp="${WS_SUBSCRIBE_RAMP:-100}"
+    echo "🔌 WebSocket subscriptions: ${url}, levels ${levels}, ramp ${ramp}/s, hold ${duration}s"
+
+    local -a method_args=()
+    if [[ -n "${WS_SUBSCRIBE_METHODS:-}" ]]; then
+        method_args=(--methods "$WS_SUBSCRIBE_METHODS")
+    else
+        method_args=(--chain-config "${SCRIPT_DIR}/config/chains/${BLOCKCHAIN_NODE,,}.json")
+    fi
+
+    local level summary failed=0
+    local -a level_list
+    IFS=',' read -r -a level_list <<< "$levels"
+    for level in "${level_list[@]}"; do
+        level="${level// /}"
+        [[ -n "$level" ]] || continue
+        echo "   ${level} subscriptions"
+        _ws_subscribe_status "running ws_subscriptions:$level"
+        if summary=$(python3 "${SCRIPT_DIR}/tools/ws_subscription_bench.py" \
+                --url "$url" \
+                --subscriptions "$level" \
+                --ramp "$ramp" \
+                --per-connection "${WS_SUBS_PER_CONNECTION:-1}" \
+                --duration "$duration" \
+                "${method_args[@]}" \
+                --accounts-file "$ACCOUNTS_OUTPUT_FILE" \
+                --rpc-url "$(_ws_subscribe_rpc_url)" \
+                --csv "$WS_SUBSCRIPTIONS_CSV"); then
+            echo "   active $(echo "$summary" | jq -r '.active')/${level}," \
+                 "errors $(echo "$summary" | jq -r '.errors')," \
+                 "$(echo "$summary" | jq -r '.notifications_per_s') notifications/s"
+        else
+            echo "⚠️  WebSocket subscription level ${level} failed"
+            failed=$((failed + 1))
+        fi
+        _ws_subscribe_status "cooldown"
+        sleep "${WS_SUBSCRIBE_PAUSE:-5}"
+    done
+
+    # Let the monitors record the tail, then drop the lifecycle marker as
+    # execute_core_qps_test does.
+    sleep 3
+    rm -f "$TMP_DIR/qps_test_status" 2>/dev/null || true
+
+    [[ $failed -lt ${#level_list[@]} ]]
+}
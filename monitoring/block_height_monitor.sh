@@ -422,8 +422,13 @@ start_monitoring() {
         mkdir -p "$(dirname "$BLOCK_HEIGHT_CACHE_FILE")"
     fi
     
-    # Write CSV header
-    get_block_height_csv_header > "$BLOCK_HEIGHT_DATA_FILE"
+    # Write CSV header (a resumed session appends to its existing CSV)
+    if [[ -n "${RESUME_SESSION:-}" && -s "$BLOCK_HEIGHT_DATA_FILE" \
+          && "$(head -1 "$BLOCK_HEIGHT_DATA_FILE")" == "$(get_block_height_csv_header)" ]]; then
+        echo "Resumed session: appending to existing $BLOCK_HEIGHT_DATA_FILE"
+    else
+        get_block_height_csv_header > "$BLOCK_HEIGHT_DATA_FILE"
+    fi
     
     # Unified monitoring loop - follow framework lifecycle
     if [[ "$BACKGROUND" == "true" ]]; then
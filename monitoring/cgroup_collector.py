@@ -400,29 +400,40 @@ def _try_k8s_kubelet_fallback(reason: str) -> Optional[Dict[str, object]]:
         except ImportError:
             return None
     try:
+        # No-arg client → process-wide summary cache shared with every other
+        # kubelet consumer in this process (one fetch per housekeeping TTL).
         client = KubeletStatsClient()
         pod = client.pod_on_node(node_name, pod_ns, pod_name)
         if pod is None:
             return None
-        out: Dict[str, object] = {f: 0 for f in IO_FIELDS + MEM_FIELDS + CPU_FIELDS}
-        # Map kubelet fields → cgroup_mem_*
-        out["cgroup_mem_anon"] = int(getattr(pod, "mem_rss_bytes", 0) or 0)
-        # working_set = anon + active file pages. We split crudely: file=ws-rss
-        ws = int(getattr(pod, "mem_working_set_bytes", 0) or 0)
-        rss = int(getattr(pod, "mem_rss_bytes", 0) or 0)
-        out["cgroup_mem_file"] = max(0, ws - rss)
-        # CPU: kubelet exposes nanocores (current rate) + cumulative core-nanosec
-        out["cgroup_cpu_usage_usec"] = int(
-            (getattr(pod, "cpu_usage_core_nanosec", 0) or 0) // 1000
-        )
-        out["cgroup_meta_source"] = f"k8s_fallback:{reason}"
-        return out
+        return kubelet_pod_counters(pod, reason)
     except Exception:
         return None
 
 
-def collect() -> Dict[str, object]:
-    """4-mode dispatcher. Always returns a dict with all 19 fields."""
+def kubelet_pod_counters(pod: object, reason: str) -> Dict[str, object]:
+    """Map a kubelet PodStats onto the 19 cgroup fields (Mode E)."""
+    out: Dict[str, object] = {f: 0 for f in IO_FIELDS + MEM_FIELDS + CPU_FIELDS}
+    # Map kubelet fields → cgroup_mem_*
+    out["cgroup_mem_anon"] = int(getattr(pod, "mem_rss_bytes", 0) or 0)
+    # working_set = anon + active file pages. We split crudely: file=ws-rss
+    ws = int(getattr(pod, "mem_working_set_bytes", 0) or 0)
+    rss = int(getattr(pod, "mem_rss_bytes", 0) or 0)
+    out["cgroup_mem_file"] = max(0, ws - rss)
+    # CPU: kubelet exposes nanocores (current rate) + cumulative core-nanosec
+    out["cgroup_cpu_usage_usec"] = int(
+        (getattr(pod, "cpu_usage_core_nanosec", 0) or 0) // 1000
+    )
+    out["cgroup_meta_source"] = f"k8s_fallback:{reason}"
+    return out
+
+
+def resolve_cgroup_layout() -> Dict[str, str]:
+    """Host paths with CGROUP_VERSION / CGROUP_ROOT / v1 controller paths filled in.
+
+    Shared by collect() and the node-wide DaemonSet collector, which
+    resolves the layout once and reuses it for every Pod on every tick.
+    """
     host_paths = get_host_paths()
 
     # Resolve cgroup version: prefer env, fall back to fs detection
@@ -448,6 +459,25 @@ def collect() -> Dict[str, object]:
             host_paths["CGROUP_V1_CPU_PATH"] = (
                 str(cand1) if cand1.is_dir() else str(cand2)
             )
+    return host_paths
+
+
+def collect_counters(host_paths: Dict[str, str], target: str) -> Dict[str, object]:
+    """Mode A or B for an already-resolved layout and target cgroup path."""
+    if host_paths["CGROUP_VERSION"] == "v2":
+        counters_out: Dict[str, object] = dict(collect_v2(host_paths["CGROUP_ROOT"], target))
+        counters_out["cgroup_meta_source"] = "v2"
+        return counters_out
+    counters_out = dict(collect_v1(host_paths, target))
+    counters_out["cgroup_meta_source"] = "v1"
+    return counters_out
+
+
+def collect() -> Dict[str, object]:
+    """4-mode dispatcher. Always returns a dict with all 19 fields."""
+    host_paths = resolve_cgroup_layout()
+    cg_ver = host_paths["CGROUP_VERSION"]
+    cg_root = host_paths["CGROUP_ROOT"]
 
     # Mode C: unmounted (try K8s Mode E fallback first)
     if cg_ver == "unknown" or not cg_root:
@@ -474,16 +504,7 @@ def collect() -> Dict[str, object]:
         return out
 
     # Mode A or B
-    if cg_ver == "v2":
-        counters = collect_v2(cg_root, target)
-        counters_out: Dict[str, object] = dict(counters)
-        counters_out["cgroup_meta_source"] = "v2"
-        return counters_out
-    else:
-        counters = collect_v1(host_paths, target)
-        counters_out = dict(counters)
-        counters_out["cgroup_meta_source"] = "v1"
-        return counters_out
+    return collect_counters(host_paths, target)
 
 
 # ---------------------------------------------------------------------------
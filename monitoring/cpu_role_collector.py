@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+cpu_role_collector.py — cpuset layout validation and per-role CPU sampling
+==========================================================================
+
+Purpose
+-------
+On a single-host run the node, Vegeta, the RPC proxy and the monitors share
+the same cores, so at high QPS the load generator can steal CPU from the
+system under test. With CPU_ISOLATION_ENABLED=true lib/cpu_isolation.sh pins
+each role to its own cpuset; this collector checks the split and measures
+how busy each reserved set actually was.
+
+How
+---
+  --validate  reads the topology from /sys/devices/system/cpu (online CPUs,
+              SMT siblings, NUMA node of each CPU), checks the CPUSET_* lists
+              and writes the layout to CPU_LAYOUT_JSON (run metadata).
+              Errors: offline / unknown CPUs, two roles sharing a CPU.
+              Warnings: SMT siblings split across roles, a role spanning
+              NUMA nodes, online CPUs left unassigned.
+  --run       samples per-CPU jiffies from /proc/stat every --interval
+              seconds and appends one row per role to CPU_ROLE_CSV.
+
+Inputs (env vars from config_loader.sh):
+  CPUSET_NODE, CPUSET_VEGETA, CPUSET_PROXY, CPUSET_MONITORS   cpulists ("0-3,8")
+  CPU_LAYOUT_JSON, CPU_ROLE_CSV                                output paths
+  HOST_PROC / HOST_SYS                                         host views (DaemonSet mode)
+
+Output schema (CPU_ROLE_CSV):
+  timestamp, role, cpuset, reserved_cpus, busy_cpus, util_pct
+busy_cpus is the sum of per-CPU busy fractions over the role's set (3.5 =
+three and a half cores busy); util_pct = busy_cpus / reserved_cpus * 100.
+Busy time is everything except idle and iowait.
+
+Failure semantics
+-----------------
+--validate exits 1 on layout errors and 0 otherwise (warnings are printed).
+--run never raises out of a tick; an unreadable /proc/stat skips the tick.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from typing import Dict, List, Optional, Set
+
+ROLES = ("node", "vegeta", "proxy", "monitors")
+CSV_FIELDS = ("timestamp", "role", "cpuset", "reserved_cpus", "busy_cpus", "util_pct")
+
+
+def _env(name: str, default: str) -> str:
+    value = os.environ.get(name)
+    return value if value not in (None, "") else default
+
+
+# ---------------------------------------------------------------------------
+# cpulist / topology
+# ---------------------------------------------------------------------------
+
+def parse_cpulist(text: str) -> List[int]:
+    """Parse a kernel cpulist ("0-3,8,10-11"); raises ValueError on bad syntax."""
+    cpus: Set[int] = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            if int(hi) < int(lo):
+                raise ValueError(f"descending range: {part}")
+            cpus.update(range(int(lo), int(hi) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def format_cpulist(cpus: List[int]) -> str:
+    """Inverse of parse_cpulist: [0, 1, 2, 3, 8] -> "0-3,8"."""
+    ranges: List[List[int]] = []
+    for cpu in sorted(set(cpus)):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in ranges)
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return fh.read().strip()
+    except OSError:
+        return None
+
+
+def read_topology(sys_root: str = "/sys") -> Dict:
+    """Online CPUs, SMT sibling groups and NUMA node per CPU."""
+    cpu_dir = os.path.join(sys_root, "devices", "system", "cpu")
+    online_raw = _read(os.path.join(cpu_dir, "online"))
+    online = parse_cpulist(online_raw) if online_raw else list(range(os.cpu_count() or 1))
+    siblings: Dict[int, List[int]] = {}
+    numa: Dict[int, int] = {}
+    for cpu in online:
+        base = os.path.join(cpu_dir, f"cpu{cpu}")
+        raw = _read(os.path.join(base, "topology", "thread_siblings_list"))
+        siblings[cpu] = parse_cpulist(raw) if raw else [cpu]
+        try:
+            nodes = [name for name in os.listdir(base) if name.startswith("node") and name[4:].isdigit()]
+        except OSError:
+            nodes = []
+        numa[cpu] = int(nodes[0][4:]) if nodes else 0
+    return {"online": online, "siblings": siblings, "numa": numa}
+
+
+def validate_layout(roles: Dict[str, List[int]], topology: Dict) -> Dict[str, List[str]]:
+    """Return {"errors": [...], "warnings": [...]} for a role -> CPUs split."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    online = set(topology["online"])
+    owner: Dict[int, str] = {}
+    for role, cpus in roles.items():
+        if not cpus:
+            warnings.append(f"{role}: no cpuset configured, role is not pinned")
+            continue
+        offline = [c for c in cpus if c not in online]
+        if offline:
+            errors.append(f"{role}: CPUs not online: {format_cpulist(offline)}")
+        for cpu in cpus:
+            if cpu in owner:
+                errors.append(f"{role}: CPU {cpu} already reserved for {owner[cpu]}")
+            else:
+                owner[cpu] = role
+        nodes = sorted({topology["numa"].get(c, 0) for c in cpus if c in online})
+        if len(nodes) > 1:
+            warnings.append(f"{role}: cpuset spans NUMA nodes {nodes}")
+    split = set()
+    for cpu, role in owner.items():
+        for sib in topology["siblings"].get(cpu, [cpu]):
+            other = owner.get(sib)
+            if other and other != role:
+                split.add(tuple(sorted((role, other))))
+    for a, b in sorted(split):
+        warnings.append(f"{a}/{b}: SMT siblings split across roles (shared core pipelines)")
+    unassigned = sorted(online - set(owner))
+    if unassigned and owner:
+        warnings.append(f"unassigned online CPUs: {format_cpulist(unassigned)}")
+    return {"errors": errors, "warnings": warnings}
+
+
+def roles_from_env() -> Dict[str, List[int]]:
+    return {role: parse_cpulist(_env(f"CPUSET_{role.upper()}", "")) for role in ROLES}
+
+
+def build_layout(roles: Dict[str, List[int]], topology: Dict) -> Dict:
+    result = validate_layout(roles, topology)
+    return {
+        "method": _env("CPU_ISOLATION_METHOD", "taskset"),
+        "online_cpus": format_cpulist(topology["online"]),
+        "roles": {role: {"cpuset": format_cpulist(cpus), "cpus": len(cpus)}
+                  for role, cpus in roles.items()},
+        "errors": result["errors"],
+        "warnings": result["warnings"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# /proc/stat sampling
+# ---------------------------------------------------------------------------
+
+def read_cpu_times(proc_root: str = "/proc") -> Dict[int, tuple]:
+    """{cpu: (busy_jiffies, total_jiffies)} from /proc/stat."""
+    out: Dict[int, tuple] = {}
+    with open(os.path.join(proc_root, "stat"), encoding="utf-8") as fh:
+        for line in fh:
+            if not line.startswith("cpu") or line.startswith("cpu "):
+                continue
+            parts = line.split()
+            try:
+                cpu = int(parts[0][3:])
+                values = [int(v) for v in parts[1:]]
+            except ValueError:
+                continue
+            # user nice system idle iowait irq softirq steal [guest guest_nice]
+            total = sum(values[:8])
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            out[cpu] = (total - idle, total)
+    return out
+
+
+def role_usage(prev: Dict[int, tuple], cur: Dict[int, tuple],
+               roles: Dict[str, List[int]]) -> Dict[str, float]:
+    """Busy cores per role between two /proc/stat snapshots."""
+    usage: Dict[str, float] = {}
+    for role, cpus in roles.items():
+        busy = 0.0
+        for cpu in cpus:
+            if cpu not in prev or cpu not in cur:
+                continue
+            d_total = cur[cpu][1] - prev[cpu][1]
+            if d_total > 0:
+                busy += (cur[cpu][0] - prev[cpu][0]) / d_total
+        usage[role] = busy
+    return usage
+
+
+def _timestamp() -> str:
+    return time.strftime(_env("TIMESTAMP_FORMAT", "%Y-%m-%d %H:%M:%S"))
+
+
+def run(roles: Dict[str, List[int]], output: str, interval: float, proc_root: str) -> int:
+    stopping = {"flag": False}
+
+    def _stop(_signum, _frame):
+        stopping["flag"] = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    roles = {role: cpus for role, cpus in roles.items() if cpus}
+    if not os.path.exists(output) or os.path.getsize(output) == 0:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(",".join(CSV_FIELDS) + "\n")
+
+    try:
+        prev = read_cpu_times(proc_root)
+    except OSError:
+        prev = {}
+    while not stopping["flag"]:
+        deadline = time.monotonic() + interval
+        while not stopping["flag"]:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.5))
+        try:
+            cur = read_cpu_times(proc_root)
+        except OSError:
+            continue
+        usage = role_usage(prev, cur, roles)
+        prev = cur
+        ts = _timestamp()
+        with open(output, "a", encoding="utf-8") as fh:
+            for role, cpus in roles.items():
+                busy = usage.get(role, 0.0)
+                fh.write(f"{ts},{role},\"{format_cpulist(cpus)}\",{len(cpus)},"
+                         f"{busy:.3f},{busy / len(cpus) * 100:.1f}\n")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-role cpuset validation and CPU sampling")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--validate", action="store_true", help="check CPUSET_* and write the layout JSON")
+    mode.add_argument("--run", action="store_true", help="append per-role CPU rows every --interval seconds")
+    ap.add_argument("--interval", type=float, default=float(_env("MONITOR_INTERVAL", "5")))
+    ap.add_argument("--layout-output", default=os.environ.get("CPU_LAYOUT_JSON", ""))
+    ap.add_argument("--output", default=os.environ.get("CPU_ROLE_CSV", ""))
+    ap.add_argument("--sys-root", default=_env("HOST_SYS", "/sys"))
+    ap.add_argument("--proc-root", default=_env("HOST_PROC", "/proc"))
+    args = ap.parse_args(argv)
+
+    try:
+        roles = roles_from_env()
+    except ValueError as e:
+        print(f"❌ Invalid CPUSET_* value: {e}", file=sys.stderr)
+        return 1
+
+    if args.validate:
+        layout = build_layout(roles, read_topology(args.sys_root))
+        if args.layout_output:
+            with open(args.layout_output, "w", encoding="utf-8") as fh:
+                json.dump(layout, fh, indent=2)
+        for msg in layout["warnings"]:
+            print(f"⚠️  CPU layout: {msg}")
+        for msg in layout["errors"]:
+            print(f"❌ CPU layout: {msg}", file=sys.stderr)
+        return 1 if layout["errors"] else 0
+
+    if not args.output:
+        print("❌ --run requires --output or CPU_ROLE_CSV", file=sys.stderr)
+        return 2
+    return run(roles, args.output, max(args.interval, 0.1), args.proc_root)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+endpoint_resource_collector.py — per-endpoint process CPU/RSS and device I/O
+============================================================================
+
+Purpose
+-------
+A --compare run drives several node endpoints on one host. The unified
+monitor samples the host and one process-name pattern, so it cannot tell
+which client spent the CPU or issued the I/O. lib/compare.sh starts one of
+these samplers per endpoint with that endpoint's process names and data
+devices from the compare spec.
+
+How
+---
+  --run   every --interval seconds: find the PIDs whose command line
+          contains one of --process-names (pgrep -f semantics), sum their
+          utime+stime and RSS from /proc/<pid>/stat, and read the --devices
+          rows of /proc/diskstats; append one row of per-second deltas.
+
+Inputs:
+  --process-names "a,b"   command-line substrings of the endpoint's processes
+  --devices "nvme1n1,..." block devices of the endpoint's data (may be empty)
+  HOST_PROC               base /proc path (default /proc)
+
+Output schema (--output CSV):
+  timestamp, endpoint, pids, cpu_pct, rss_mb,
+  read_iops, write_iops, read_mb_s, write_mb_s
+cpu_pct is per core (200 = two cores busy). Device columns are summed over
+--devices. A PID that appears or exits between samples contributes only to
+the samples it is present in.
+
+Failure semantics
+-----------------
+--run never raises out of a tick; unreadable /proc entries are skipped and
+the row is still written (zeros when nothing matched).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+CSV_FIELDS = ("timestamp", "endpoint", "pids", "cpu_pct", "rss_mb",
+              "read_iops", "write_iops", "read_mb_s", "write_mb_s")
+
+SECTOR_BYTES = 512
+
+
+def _env(name: str, default: str) -> str:
+    value = os.environ.get(name)
+    return value if value not in (None, "") else default
+
+
+def _split(raw: str) -> List[str]:
+    return [p for p in (part.strip() for part in raw.replace(" ", ",").split(",")) if p]
+
+
+# ---------------------------------------------------------------------------
+# procfs readers
+# ---------------------------------------------------------------------------
+
+def find_pids(proc_root: str, names: List[str]) -> List[str]:
+    """PIDs whose command line contains one of names; never this process."""
+    if not names:
+        return []
+    own = str(os.getpid())
+    pids = []
+    try:
+        entries = os.listdir(proc_root)
+    except OSError:
+        return []
+    for pid in entries:
+        if not pid.isdigit() or pid == own:
+            continue
+        try:
+            with open(os.path.join(proc_root, pid, "cmdline"), "rb") as fh:
+                cmdline = fh.read().replace(b"\0", b" ").decode("utf-8", "replace")
+        except OSError:
+            continue
+        if any(name in cmdline for name in names):
+            pids.append(pid)
+    return sorted(pids, key=int)
+
+
+def read_pid_stat(proc_root: str, pid: str) -> Optional[Tuple[int, int]]:
+    """(utime + stime in clock ticks, RSS in pages) from /proc/<pid>/stat."""
+    try:
+        with open(os.path.join(proc_root, pid, "stat"), encoding="utf-8") as fh:
+            stat = fh.read()
+    except OSError:
+        return None
+    # comm may contain spaces and parentheses; fields resume after the last ')'.
+    fields = stat.rsplit(")", 1)[-1].split()
+    try:
+        return int(fields[11]) + int(fields[12]), int(fields[21])
+    except (IndexError, ValueError):
+        return None
+
+
+def read_diskstats(proc_root: str, devices: List[str]) -> Dict[str, Tuple[int, int, int, int]]:
+    """{device: (reads, sectors read, writes, sectors written)} for the given devices."""
+    out: Dict[str, Tuple[int, int, int, int]] = {}
+    if not devices:
+        return out
+    wanted = {os.path.basename(d) for d in devices}
+    try:
+        with open(os.path.join(proc_root, "diskstats"), encoding="utf-8") as fh:
+            for line in fh:
+                parts = line.split()
+                if len(parts) < 10 or parts[2] not in wanted:
+                    continue
+                try:
+                    out[parts[2]] = (int(parts[3]), int(parts[5]), int(parts[7]), int(parts[9]))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return out
+
+
+def sample(proc_root: str, names: List[str], devices: List[str]) -> Dict:
+    procs = {}
+    for pid in find_pids(proc_root, names):
+        stat = read_pid_stat(proc_root, pid)
+        if stat is not None:
+            procs[pid] = stat
+    return {"t": time.monotonic(), "procs": procs, "disks": read_diskstats(proc_root, devices)}
+
+
+def rates(prev: Dict, cur: Dict, tick_hz: float, page_bytes: int) -> Dict[str, float]:
+    """Per-second values between two samples; only PIDs and devices present in both count."""
+    elapsed = cur["t"] - prev["t"]
+    if elapsed <= 0:
+        elapsed = 1.0
+    ticks = sum(max(0, stat[0] - prev["procs"][pid][0])
+                for pid, stat in cur["procs"].items() if pid in prev["procs"])
+    rss = sum(stat[1] for stat in cur["procs"].values()) * page_bytes
+    disk = [0, 0, 0, 0]
+    for dev, counters in cur["disks"].items():
+        before = prev["disks"].get(dev)
+        if before is None:
+            continue
+        for i in range(4):
+            disk[i] += max(0, counters[i] - before[i])
+    return {
+        "pids": len(cur["procs"]),
+        "cpu_pct": ticks / tick_hz / elapsed * 100,
+        "rss_mb": rss / 1024 / 1024,
+        "read_iops": disk[0] / elapsed,
+        "write_iops": disk[2] / elapsed,
+        "read_mb_s": disk[1] * SECTOR_BYTES / 1024 / 1024 / elapsed,
+        "write_mb_s": disk[3] * SECTOR_BYTES / 1024 / 1024 / elapsed,
+    }
+
+
+def _timestamp() -> str:
+    return time.strftime(_env("TIMESTAMP_FORMAT", "%Y-%m-%d %H:%M:%S"))
+
+
+def run(endpoint: str, names: List[str], devices: List[str], output: str,
+        interval: float, proc_root: str) -> int:
+    stopping = {"flag": False}
+
+    def _stop(_signum, _frame):
+        stopping["flag"] = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    tick_hz = float(os.sysconf("SC_CLK_TCK")) if hasattr(os, "sysconf") else 100.0
+    page_bytes = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    if not os.path.exists(output) or os.path.getsize(output) == 0:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(",".join(CSV_FIELDS) + "\n")
+
+    prev = sample(proc_root, names, devices)
+    while not stopping["flag"]:
+        deadline = time.monotonic() + interval
+        while not stopping["flag"]:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.5))
+        if stopping["flag"]:
+            break
+        cur = sample(proc_root, names, devices)
+        r = rates(prev, cur, tick_hz, page_bytes)
+        prev = cur
+        with open(output, "a", encoding="utf-8") as fh:
+            fh.write(f"{_timestamp()},{endpoint},{r['pids']},{r['cpu_pct']:.1f},{r['rss_mb']:.1f},"
+                     f"{r['read_iops']:.1f},{r['write_iops']:.1f},{r['read_mb_s']:.3f},{r['write_mb_s']:.3f}\n")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-endpoint process CPU/RSS and device I/O sampling")
+    ap.add_argument("--run", action="store_true", help="append rows every --interval seconds")
+    ap.add_argument("--endpoint", required=True, help="endpoint name written to every row")
+    ap.add_argument("--process-names", default="", help="comma-separated command-line substrings")
+    ap.add_argument("--devices", default="", help="comma-separated block devices (nvme1n1,...)")
+    ap.add_argument("--interval", type=float, default=1.0)
+    ap.add_argument("--output", required=True)
+    ap.add_argument("--proc-root", default=_env("HOST_PROC", "/proc"))
+    args = ap.parse_args(argv)
+    if not args.run:
+        ap.error("--run is required")
+    return run(args.endpoint, _split(args.process_names), _split(args.devices), args.output,
+               max(args.interval, 0.1), args.proc_root)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
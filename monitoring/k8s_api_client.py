@@ -27,6 +27,15 @@ PyPI for a few REST calls would bloat the DaemonSet image by ~50 MB and
 introduce a non-trivial dep tree (urllib3, websocket-client, requests).
 stdlib gets us the same coverage in ~150 lines.
 
+Connection reuse
+----------------
+Requests go over http.client keep-alive connections from a small per-client
+pool, and the SSLContext (CA bundle load) is built once and reused. A
+collector polling every few seconds therefore pays the TLS handshake once
+per connection instead of once per GET. Watch streams use their own
+connection with the same context. Long-running collectors should share
+one client; see k8s_informer.py for list+watch caches built on it.
+
 API surface
 -----------
   client = K8sApiClient()
@@ -37,9 +46,12 @@ API surface
   node   = client.get_node("gke-node-1")
   stats  = client.kubelet_stats_summary("gke-node-1")
   ep     = client.list_namespaced_endpoints("blockchain-bench")
+  for ev in client.watch_namespaced_pods("blockchain-bench", node_name="n1"):
+      ev["type"], ev["object"]        # ADDED / MODIFIED / DELETED / BOOKMARK
 
 Each returns a dict (parsed JSON). On error, raises K8sApiError with the
-HTTP status + body — never silently returns None.
+HTTP status + body — never silently returns None. Watch streams raise
+K8sApiError(410) when the resourceVersion has expired; callers re-list.
 
 References
 ----------
@@ -50,17 +62,17 @@ References
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import socket
 import ssl
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-from urllib import request as urlrequest
-from urllib import error as urlerror
-from urllib.parse import quote, urlencode
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
 
 
 DEFAULT_API_SERVER = "https://kubernetes.default.svc"
@@ -73,6 +85,9 @@ TOKEN_REFRESH_SEC = 300
 # Retry transient failures (5xx, network errors). 429 also retried (rate limit).
 RETRY_MAX_ATTEMPTS = 3
 RETRY_BACKOFF_BASE_SEC = 0.5  # 0.5s, 1.0s, 2.0s
+# Idle keep-alive connections kept per apiserver origin. Collectors issue
+# a handful of concurrent GETs at most; extra sockets are closed on release.
+POOL_MAX_IDLE = 4
 
 
 class K8sApiError(Exception):
@@ -111,7 +126,7 @@ def _resolve_default_api_server() -> str:
 
 
 class K8sApiClient:
-    """Stateless HTTP client with token auto-refresh and retry."""
+    """HTTP client with keep-alive connection pool, token auto-refresh and retry."""
 
     def __init__(
         self,
@@ -152,6 +167,11 @@ class K8sApiClient:
         else:
             self._insecure = _env("K8S_INSECURE_TLS", "").lower() in ("1", "true", "yes")
         self.timeout = timeout
+        # Keep-alive pool + cached SSL context (see _ssl_context / _acquire)
+        self._pool_lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._ssl_ctx: Optional[ssl.SSLContext] = None
+        self._ssl_ctx_ca_mtime = 0.0
 
     # -----------------------------------------------------------------
     # Token + TLS context
@@ -202,6 +222,22 @@ class K8sApiClient:
         # No CA file → default truststore (e.g. test env hitting localhost)
         return ssl.create_default_context()
 
+    def _ssl_context(self) -> ssl.SSLContext:
+        """One SSLContext per client, rebuilt only if the CA bundle changes.
+
+        Loading the CA bundle costs milliseconds per call; reusing the
+        context also lets pooled connections resume TLS sessions.
+        """
+        try:
+            ca_mtime = Path(self.ca_file).stat().st_mtime
+        except OSError:
+            ca_mtime = 0.0
+        with self._pool_lock:
+            if self._ssl_ctx is None or ca_mtime != self._ssl_ctx_ca_mtime:
+                self._ssl_ctx = self._make_ssl_context()
+                self._ssl_ctx_ca_mtime = ca_mtime
+            return self._ssl_ctx
+
     # -----------------------------------------------------------------
     # Core HTTP GET (with retry)
     # -----------------------------------------------------------------
@@ -233,38 +269,179 @@ class K8sApiClient:
         assert last_err is not None
         raise last_err
 
-    def _do_get(self, url: str) -> Dict[str, Any]:
-        """Single GET, no retry. Used by _get()."""
-        req = urlrequest.Request(url, method="GET")
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/json"}
         token = self._current_token()
         if token:
-            req.add_header("Authorization", f"Bearer {token}")
-        req.add_header("Accept", "application/json")
-        ctx = self._make_ssl_context() if url.startswith("https") else None
-        try:
-            with urlrequest.urlopen(req, timeout=self.timeout, context=ctx) as resp:
-                body = resp.read().decode("utf-8", errors="replace")
-                # urllib raises on >=400, so this is a 2xx
-                return json.loads(body) if body else {}
-        except urlerror.HTTPError as e:
-            err_body = ""
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
+    def _new_connection(self, scheme: str, netloc: str,
+                        timeout: float) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout,
+                                               context=self._ssl_context())
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+
+    def _acquire(self, origin: Tuple[str, str]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Idle keep-alive connection for origin, or a new one. (conn, reused)."""
+        with self._pool_lock:
+            idle = self._idle.get(origin)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(origin[0], origin[1], self.timeout), False
+
+    def _release(self, origin: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._pool_lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < POOL_MAX_IDLE:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close idle pooled connections (in-flight ones close on release)."""
+        with self._pool_lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    @staticmethod
+    def _split_url(url: str) -> Tuple[Tuple[str, str], str]:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        return (parts.scheme, parts.netloc), target
+
+    def _do_get(self, url: str) -> Dict[str, Any]:
+        """Single GET over a pooled keep-alive connection, no retry. Used by _get().
+
+        A reused connection the server already closed fails on first use;
+        that one case is replayed once on a fresh connection, since the
+        request never reached the server.
+        """
+        origin, target = self._split_url(url)
+        headers = self._headers()
+        for attempt in range(2):
+            conn, reused = self._acquire(origin)
             try:
-                err_body = e.read().decode("utf-8", errors="replace")
-            except Exception:  # noqa: BLE001
-                pass
-            raise K8sApiError(e.code, err_body, url) from e
-        except urlerror.URLError as e:
-            raise K8sApiError(0, str(e.reason), url) from e
-        # On Python 3.8/3.9, SSL handshake timeouts can bubble up as
-        # socket.timeout without being wrapped in URLError. Python 3.10+
-        # aliases socket.timeout to TimeoutError, so catch both explicitly.
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read().decode("utf-8", errors="replace")
+            # On Python 3.8/3.9, SSL handshake timeouts can bubble up as bare
+            # socket.timeout. Python 3.10+ aliases socket.timeout to
+            # TimeoutError, so catch both explicitly (before OSError).
+            except (socket.timeout, TimeoutError) as e:
+                conn.close()
+                raise K8sApiError(0, f"timeout after {self.timeout}s: {e}", url) from e
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise K8sApiError(0, str(e), url) from e
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(origin, conn)
+            if resp.status >= 400:
+                raise K8sApiError(resp.status, body, url)
+            return json.loads(body) if body else {}
+        raise K8sApiError(0, "connection closed by server", url)  # pragma: no cover
+
+    def _stream_events(self, url: str, read_timeout: float) -> Iterator[Dict[str, Any]]:
+        """Single streaming GET for ?watch=1; yields one event per JSON line.
+
+        Watches hold their connection for minutes, so they get a dedicated
+        one (sharing the client's SSL context) instead of a pooled slot.
+        No retry here: a broken watch is resumed by the caller from the
+        last resourceVersion it saw, which is the only safe resume point.
+        """
+        origin, target = self._split_url(url)
+        conn = self._new_connection(origin[0], origin[1], read_timeout)
+        try:
+            conn.request("GET", target, headers=self._headers())
+            resp = conn.getresponse()
         except (socket.timeout, TimeoutError) as e:
-            raise K8sApiError(0, f"timeout after {self.timeout}s: {e}", url) from e
+            conn.close()
+            raise K8sApiError(0, f"timeout after {read_timeout}s: {e}", url) from e
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            raise K8sApiError(0, str(e), url) from e
+        if resp.status >= 400:
+            body = resp.read().decode("utf-8", errors="replace")
+            conn.close()
+            raise K8sApiError(resp.status, body, url)
+        try:
+            while True:
+                raw = resp.readline()
+                if not raw:
+                    return
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get("type") == "ERROR":
+                    status = event.get("object", {})
+                    raise K8sApiError(int(status.get("code", 0) or 0),
+                                      json.dumps(status), url)
+                yield event
+        except (socket.timeout, TimeoutError, http.client.HTTPException, OSError) as e:
+            raise K8sApiError(0, f"watch stream broken: {e}", url) from e
+        finally:
+            conn.close()
+
+    def watch_path(
+        self,
+        path: str,
+        query: Optional[Dict[str, str]] = None,
+        resource_version: str = "",
+        timeout_seconds: int = 300,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream watch events for any collection path (pods, PVCs, PVs, ...).
+
+        An empty resource_version starts with synthetic ADDED events for
+        every existing object, so a caller that lost its place can resume
+        from "" without a separate list. timeoutSeconds is a server-side
+        bound; the stream ends cleanly when it expires and the caller
+        re-watches from the last resourceVersion it saw.
+        """
+        params = dict(query or {})
+        params["watch"] = "1"
+        params["allowWatchBookmarks"] = "true"
+        params["timeoutSeconds"] = str(int(timeout_seconds))
+        if resource_version:
+            params["resourceVersion"] = resource_version
+        url = f"{self.api_server}{path}?{urlencode(params)}"
+        return self._stream_events(url, read_timeout=timeout_seconds + self.timeout)
 
     # -----------------------------------------------------------------
     # Object accessors (typed wrappers)
     # -----------------------------------------------------------------
 
+    @staticmethod
+    def _pod_selector_params(
+        node_name: Optional[str],
+        label_selector: Optional[str],
+        field_selector: Optional[str],
+    ) -> Dict[str, str]:
+        params: Dict[str, str] = {}
+        # Combine node_name shortcut with explicit field_selector
+        fs_parts = []
+        if node_name:
+            fs_parts.append(f"spec.nodeName={node_name}")
+        if field_selector:
+            fs_parts.append(field_selector)
+        if fs_parts:
+            params["fieldSelector"] = ",".join(fs_parts)
+        if label_selector:
+            params["labelSelector"] = label_selector
+        return params
+
     def list_namespaced_pods(
         self,
         namespace: str,
@@ -279,22 +456,32 @@ class K8sApiClient:
         to etcd. On 100+ node clusters, omitting this means every DaemonSet
         pod pulls the whole namespace Pod list = O(N²) cluster-wide traffic.
         """
-        params: Dict[str, str] = {}
-        # Combine node_name shortcut with explicit field_selector
-        fs_parts = []
-        if node_name:
-            fs_parts.append(f"spec.nodeName={node_name}")
-        if field_selector:
-            fs_parts.append(field_selector)
-        if fs_parts:
-            params["fieldSelector"] = ",".join(fs_parts)
-        if label_selector:
-            params["labelSelector"] = label_selector
+        params = self._pod_selector_params(node_name, label_selector, field_selector)
         return self._get(
             f"/api/v1/namespaces/{quote(namespace)}/pods",
             query=params if params else None,
         )
 
+    def watch_namespaced_pods(
+        self,
+        namespace: str,
+        node_name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        resource_version: str = "",
+        timeout_seconds: int = 300,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pod change events (same filters as list_namespaced_pods)."""
+        return self.watch_path(
+            f"/api/v1/namespaces/{quote(namespace)}/pods",
+            query=self._pod_selector_params(node_name, label_selector, None),
+            resource_version=resource_version,
+            timeout_seconds=timeout_seconds,
+        )
+
+    def list_path(self, path: str, query: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """GET any collection path; used by informers alongside watch_path."""
+        return self._get(path, query=query)
+
     def get_pod(self, namespace: str, name: str) -> Dict[str, Any]:
         return self._get(
             f"/api/v1/namespaces/{quote(namespace)}/pods/{quote(name)}"
@@ -308,6 +495,12 @@ class K8sApiClient:
     def get_pv(self, name: str) -> Dict[str, Any]:
         return self._get(f"/api/v1/persistentvolumes/{quote(name)}")
 
+    def list_namespaced_pvcs(self, namespace: str) -> Dict[str, Any]:
+        return self._get(f"/api/v1/namespaces/{quote(namespace)}/persistentvolumeclaims")
+
+    def list_pvs(self) -> Dict[str, Any]:
+        return self._get("/api/v1/persistentvolumes")
+
     def get_node(self, name: str) -> Dict[str, Any]:
         return self._get(f"/api/v1/nodes/{quote(name)}")
 
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+k8s_informer.py — list+watch caches for Pods, PVCs and PVs
+==========================================================
+
+Purpose
+-------
+Keep an in-memory mirror of the Kubernetes objects the collectors read on
+every cycle, so Pod → PVC → PV resolution (pod_device_mapper) is a dict
+lookup instead of three apiserver GETs per volume per cycle.
+
+How
+---
+Each Informer follows the client-go pattern on one collection path:
+
+  1. LIST   → replace the cache, remember metadata.resourceVersion
+  2. WATCH  from that resourceVersion; apply ADDED / MODIFIED / DELETED,
+            advance the resourceVersion on every event and BOOKMARK
+  3. stream ends (server timeoutSeconds) → re-WATCH from the last
+            resourceVersion — no re-list
+  4. 410 Gone (resourceVersion compacted) → back to 1
+
+CachedK8sClient wraps a K8sApiClient with informers and exposes the same
+get_pod / get_pvc / get_pv / list_namespaced_pods signatures, so
+map_pod_volumes() and KubeletStatsClient take it unchanged. Cache misses
+(and calls made before the first LIST completes) fall through to the live
+client; every other method is delegated as-is.
+
+Inputs
+------
+  client          K8sApiClient (shared keep-alive pool)
+  namespaces      namespaces whose Pods / PVCs are mirrored
+  resources       subset of ("pods", "pvcs", "pvs")
+  node_name       optional spec.nodeName filter for the Pod informer
+  label_selector  optional label selector for the Pod informer
+
+Failure semantics
+-----------------
+Informer threads never raise: API errors keep the last known cache and
+retry with exponential backoff (capped at WATCH_BACKOFF_MAX_SEC).
+
+References
+----------
+- kubernetes.io/docs/reference/using-api/api-concepts/#efficient-detection-of-changes
+- client-go tools/cache Reflector (list+watch, resourceVersion resume)
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from k8s_api_client import K8sApiClient, K8sApiError
+
+WATCH_TIMEOUT_SEC = 300
+WATCH_BACKOFF_MAX_SEC = 60.0
+RESOURCES = ("pods", "pvcs", "pvs")
+
+
+class Informer:
+    """List+watch mirror of one collection path (namespaced or cluster-scoped)."""
+
+    def __init__(self, client: K8sApiClient, path: str,
+                 query: Optional[Dict[str, str]] = None,
+                 watch_timeout: int = WATCH_TIMEOUT_SEC):
+        self.client = client
+        self.path = path
+        self.query = dict(query or {})
+        self.watch_timeout = watch_timeout
+        self.resource_version = ""
+        self.synced = threading.Event()
+        self.relists = 0
+        self._lock = threading.Lock()
+        self._objects: Dict[str, Dict[str, Any]] = {}
+
+    # ---- reads -----------------------------------------------------------
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._objects.get(name)
+
+    def items(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._objects.values())
+
+    # ---- list / watch ----------------------------------------------------
+
+    def relist(self) -> None:
+        resp = self.client.list_path(self.path, query=self.query or None)
+        objects = {o.get("metadata", {}).get("name", ""): o for o in resp.get("items", [])}
+        with self._lock:
+            self._objects = objects
+            self.resource_version = str(resp.get("metadata", {}).get("resourceVersion", ""))
+            self.relists += 1
+        self.synced.set()
+
+    def apply(self, event: Dict[str, Any]) -> None:
+        obj = event.get("object", {})
+        meta = obj.get("metadata", {})
+        etype = event.get("type")
+        with self._lock:
+            if meta.get("resourceVersion"):
+                self.resource_version = str(meta["resourceVersion"])
+            name = meta.get("name")
+            if not name or etype == "BOOKMARK":
+                return
+            if etype == "DELETED":
+                self._objects.pop(name, None)
+            elif etype in ("ADDED", "MODIFIED"):
+                self._objects[name] = obj
+
+    def watch_once(self) -> None:
+        """Follow one watch stream until the server ends it. Raises K8sApiError."""
+        for event in self.client.watch_path(self.path, query=self.query or None,
+                                            resource_version=self.resource_version,
+                                            timeout_seconds=self.watch_timeout):
+            self.apply(event)
+
+    def run(self, stop: threading.Event) -> None:
+        """LIST, then WATCH with resourceVersion resume until `stop`."""
+        backoff = 1.0
+        need_list = True
+        while not stop.is_set():
+            try:
+                if need_list:
+                    self.relist()
+                    need_list = False
+                self.watch_once()
+                backoff = 1.0
+            except K8sApiError as e:
+                if e.status == 410:
+                    need_list = True
+                    continue
+                stop.wait(backoff)
+                backoff = min(backoff * 2, WATCH_BACKOFF_MAX_SEC)
+            except Exception:  # noqa: BLE001 — keep the last known cache
+                stop.wait(backoff)
+                backoff = min(backoff * 2, WATCH_BACKOFF_MAX_SEC)
+
+
+class CachedK8sClient:
+    """K8sApiClient facade that serves Pod/PVC/PV reads from informers."""
+
+    def __init__(self, client: K8sApiClient, namespaces: List[str],
+                 resources: tuple = RESOURCES, node_name: Optional[str] = None,
+                 label_selector: Optional[str] = None,
+                 watch_timeout: int = WATCH_TIMEOUT_SEC):
+        self.client = client
+        self.node_name = node_name or None
+        self.label_selector = label_selector or None
+        self.pods: Dict[str, Informer] = {}
+        self.pvcs: Dict[str, Informer] = {}
+        self.pv: Optional[Informer] = None
+        for ns in namespaces:
+            if "pods" in resources:
+                query = client._pod_selector_params(self.node_name, self.label_selector, None)
+                self.pods[ns] = Informer(client, f"/api/v1/namespaces/{ns}/pods", query,
+                                         watch_timeout)
+            if "pvcs" in resources:
+                self.pvcs[ns] = Informer(client, f"/api/v1/namespaces/{ns}/persistentvolumeclaims",
+                                         None, watch_timeout)
+        if "pvs" in resources:
+            self.pv = Informer(client, "/api/v1/persistentvolumes", None, watch_timeout)
+        self.misses = 0
+        self._threads: List[threading.Thread] = []
+
+    def informers(self) -> List[Informer]:
+        out = list(self.pods.values()) + list(self.pvcs.values())
+        return out + ([self.pv] if self.pv is not None else [])
+
+    def start(self, stop: threading.Event) -> None:
+        for inf in self.informers():
+            t = threading.Thread(target=inf.run, args=(stop,), daemon=True,
+                                 name=f"informer{inf.path}")
+            t.start()
+            self._threads.append(t)
+
+    def wait_for_sync(self, timeout: float) -> bool:
+        return all(inf.synced.wait(timeout) for inf in self.informers())
+
+    def _cached(self, informer: Optional[Informer], name: str) -> Optional[Dict[str, Any]]:
+        if informer is None or not informer.synced.is_set():
+            return None
+        obj = informer.get(name)
+        if obj is None:
+            self.misses += 1
+        return obj
+
+    # ---- K8sApiClient-compatible reads -----------------------------------
+
+    def get_pod(self, namespace: str, name: str) -> Dict[str, Any]:
+        obj = self._cached(self.pods.get(namespace), name)
+        return obj if obj is not None else self.client.get_pod(namespace, name)
+
+    def get_pvc(self, namespace: str, name: str) -> Dict[str, Any]:
+        obj = self._cached(self.pvcs.get(namespace), name)
+        return obj if obj is not None else self.client.get_pvc(namespace, name)
+
+    def get_pv(self, name: str) -> Dict[str, Any]:
+        obj = self._cached(self.pv, name)
+        return obj if obj is not None else self.client.get_pv(name)
+
+    def list_namespaced_pods(
+        self,
+        namespace: str,
+        node_name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Served from cache only when the filters match the informer's."""
+        inf = self.pods.get(namespace)
+        if (inf is not None and inf.synced.is_set() and not field_selector
+                and (node_name or None) == self.node_name
+                and (label_selector or None) == self.label_selector):
+            return {"metadata": {"resourceVersion": inf.resource_version}, "items": inf.items()}
+        return self.client.list_namespaced_pods(namespace, node_name=node_name,
+                                                label_selector=label_selector,
+                                                field_selector=field_selector)
+
+    def __getattr__(self, name: str) -> Any:
+        # watch_namespaced_pods, kubelet_stats_summary, get_node, ...
+        return getattr(self.client, name)
@@ -45,6 +45,17 @@ Per-Pod snapshot dict (one per Pod present in /stats/summary):
 Reference shape (truncated):
 https://github.com/kubernetes/kubernetes/blob/master/pkg/kubelet/apis/stats/v1alpha1/types.go
 
+Node summary cache
+------------------
+/stats/summary is the whole node (megabytes on dense nodes) and kubelet
+only refreshes it every housekeeping interval (10 s by default). All
+KubeletStatsClient instances built without an explicit API client share
+one process-wide NodeSummaryCache: the summary is fetched and parsed at
+most once per KUBELET_SUMMARY_TTL_SEC and indexed by namespace/pod and
+namespace/pod/container, so pod_on_node() is a dict lookup. Concurrent
+callers for the same node wait for the in-flight fetch instead of
+issuing their own.
+
 Failure modes
 -------------
 - Node not found / not authorized: raises K8sApiError (caller catches)
@@ -55,13 +66,20 @@ Failure modes
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from k8s_api_client import K8sApiClient, K8sApiError
 
 _LOG = logging.getLogger(__name__)
 
+# kubelet --housekeeping-interval default; summary values do not change
+# faster than this, so re-fetching sooner only adds load.
+DEFAULT_SUMMARY_TTL_SEC = 10.0
+
 
 # ---------------------------------------------------------------------
 # Defensive accessors
@@ -124,6 +142,17 @@ class PodStats:
     volumes: List[VolumeStats] = field(default_factory=list)
 
 
+@dataclass
+class ContainerStats:
+    namespace: str = ""
+    pod_name: str = ""
+    container_name: str = ""
+    cpu_nanocores: int = 0
+    cpu_usage_core_nanosec: int = 0
+    mem_working_set_bytes: int = 0
+    mem_rss_bytes: int = 0
+
+
 def _parse_volume(v: Dict[str, Any]) -> VolumeStats:
     pvc_ref = v.get("pvcRef") or {}
     return VolumeStats(
@@ -168,29 +197,143 @@ def _parse_pod(pod_json: Dict[str, Any], node_name: str) -> PodStats:
     )
 
 
+def _parse_container(c: Dict[str, Any], namespace: str, pod_name: str) -> ContainerStats:
+    cpu = c.get("cpu") or {}
+    mem = c.get("memory") or {}
+    return ContainerStats(
+        namespace=namespace,
+        pod_name=pod_name,
+        container_name=_str_or_empty(c, "name"),
+        cpu_nanocores=_int_or_zero(cpu, "usageNanoCores"),
+        cpu_usage_core_nanosec=_int_or_zero(cpu, "usageCoreNanoSeconds"),
+        mem_working_set_bytes=_int_or_zero(mem, "workingSetBytes"),
+        mem_rss_bytes=_int_or_zero(mem, "rssBytes"),
+    )
+
+
+# ---------------------------------------------------------------------
+# Node summary cache
+# ---------------------------------------------------------------------
+
+@dataclass
+class NodeSummaryIndex:
+    """One parsed /stats/summary, indexed for O(1) Pod/container lookup."""
+    node_name: str
+    fetched_at: float
+    pods: List[PodStats] = field(default_factory=list)
+    by_pod: Dict[Tuple[str, str], PodStats] = field(default_factory=dict)
+    by_container: Dict[Tuple[str, str, str], ContainerStats] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, node_name: str, summary: Dict[str, Any], fetched_at: float) -> "NodeSummaryIndex":
+        index = cls(node_name=node_name, fetched_at=fetched_at)
+        for pod_json in summary.get("pods") or []:
+            pod = _parse_pod(pod_json, node_name)
+            index.pods.append(pod)
+            index.by_pod[(pod.namespace, pod.pod_name)] = pod
+            for c in pod_json.get("containers") or []:
+                cs = _parse_container(c, pod.namespace, pod.pod_name)
+                index.by_container[(pod.namespace, pod.pod_name, cs.container_name)] = cs
+        return index
+
+
+class NodeSummaryCache:
+    """TTL cache of parsed node summaries, safe to share across threads."""
+
+    def __init__(self, api: K8sApiClient, ttl_sec: Optional[float] = None):
+        self.api = api
+        if ttl_sec is None:
+            try:
+                ttl_sec = float(os.environ.get("KUBELET_SUMMARY_TTL_SEC", "") or DEFAULT_SUMMARY_TTL_SEC)
+            except ValueError:
+                ttl_sec = DEFAULT_SUMMARY_TTL_SEC
+        self.ttl_sec = ttl_sec
+        self.fetches = 0
+        self._lock = threading.Lock()
+        self._node_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, NodeSummaryIndex] = {}
+
+    def _fresh(self, node_name: str, now: float) -> Optional[NodeSummaryIndex]:
+        entry = self._entries.get(node_name)
+        if entry is not None and now - entry.fetched_at < self.ttl_sec:
+            return entry
+        return None
+
+    def get(self, node_name: str) -> NodeSummaryIndex:
+        """Cached index for the node, fetching at most once per TTL."""
+        entry = self._fresh(node_name, time.monotonic())
+        if entry is not None:
+            return entry
+        with self._lock:
+            node_lock = self._node_locks.setdefault(node_name, threading.Lock())
+        with node_lock:
+            # Another caller may have refreshed it while we waited.
+            entry = self._fresh(node_name, time.monotonic())
+            if entry is not None:
+                return entry
+            summary = self.api.kubelet_stats_summary(node_name)
+            self.fetches += 1
+            entry = NodeSummaryIndex.build(node_name, summary, time.monotonic())
+            self._entries[node_name] = entry
+            return entry
+
+    def invalidate(self, node_name: Optional[str] = None) -> None:
+        if node_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(node_name, None)
+
+
+_SHARED_CACHE: Optional[NodeSummaryCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def shared_summary_cache(api: Optional[K8sApiClient] = None) -> NodeSummaryCache:
+    """Process-wide cache used by every client built without an explicit api.
+
+    The first caller may hand over its K8sApiClient so the cache shares
+    that client's keep-alive pool; later callers get the same cache.
+    """
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = NodeSummaryCache(api or K8sApiClient())
+        return _SHARED_CACHE
+
+
 # ---------------------------------------------------------------------
 # Client
 # ---------------------------------------------------------------------
 
 class KubeletStatsClient:
-    """Wraps a K8sApiClient with stats-summary parsing helpers."""
+    """Wraps a K8sApiClient with stats-summary parsing helpers.
+
+    Without arguments the client uses the process-wide summary cache, so
+    every consumer in a collector process shares one fetch per TTL. An
+    explicit `api` gets its own cache unless `cache` is also given.
+    """
 
-    def __init__(self, api: Optional[K8sApiClient] = None):
-        self.api = api or K8sApiClient()
+    def __init__(self, api: Optional[K8sApiClient] = None,
+                 cache: Optional[NodeSummaryCache] = None):
+        if cache is None:
+            cache = shared_summary_cache() if api is None else NodeSummaryCache(api)
+        self.cache = cache
+        self.api = api or cache.api
 
     def fetch_node(self, node_name: str) -> Dict[str, Any]:
-        """Raw /stats/summary JSON for a node (for debugging/inspection)."""
+        """Raw /stats/summary JSON for a node (uncached; for debugging/inspection)."""
         return self.api.kubelet_stats_summary(node_name)
 
-    def pods_on_node(self, node_name: str) -> List[PodStats]:
-        """Return flattened PodStats list for all Pods on the node."""
+    def _index(self, node_name: str) -> NodeSummaryIndex:
         try:
-            summary = self.api.kubelet_stats_summary(node_name)
+            return self.cache.get(node_name)
         except K8sApiError as e:
             _LOG.error("kubelet stats summary fetch failed: %s", e)
             raise
-        pods = summary.get("pods") or []
-        return [_parse_pod(p, node_name) for p in pods]
+
+    def pods_on_node(self, node_name: str) -> List[PodStats]:
+        """Return flattened PodStats list for all Pods on the node."""
+        return list(self._index(node_name).pods)
 
     def pod_on_node(
         self,
@@ -199,10 +342,17 @@ class KubeletStatsClient:
         pod_name: str,
     ) -> Optional[PodStats]:
         """Find one specific Pod's stats on a node. Returns None if absent."""
-        for p in self.pods_on_node(node_name):
-            if p.namespace == namespace and p.pod_name == pod_name:
-                return p
-        return None
+        return self._index(node_name).by_pod.get((namespace, pod_name))
+
+    def container_on_node(
+        self,
+        node_name: str,
+        namespace: str,
+        pod_name: str,
+        container_name: str,
+    ) -> Optional[ContainerStats]:
+        """One container's stats from the same cached summary."""
+        return self._index(node_name).by_container.get((namespace, pod_name, container_name))
 
 
 # ---------------------------------------------------------------------
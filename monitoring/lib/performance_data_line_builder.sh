@@ -27,14 +27,18 @@ build_performance_data_line() {
     local qps_data_available="${12}"
     local cgroup_data="${13}"
     local cloud_provider_val="${14}"
+    # Process accounting segment (15 fields), placed after cgroup so that
+    # cloud_provider stays the final column. Padded with empty fields when the
+    # caller has none, so the row always matches generate_csv_header().
+    local process_data="${15:-,,,,,,,,,,,,,,}"
 
     current_qps=$(sanitize_csv_short_field "$current_qps" 20)
     rpc_latency_ms=$(sanitize_csv_short_field "$rpc_latency_ms" 20)
     qps_data_available=$(sanitize_csv_short_field "$qps_data_available" 10)
 
     if [[ "$ena_enabled" == "true" ]]; then
-        echo "$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$ena_data,$overhead_data,$block_height_data,$current_qps,$rpc_latency_ms,$qps_data_available,$cgroup_data,$cloud_provider_val"
+        echo "$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$ena_data,$overhead_data,$block_height_data,$current_qps,$rpc_latency_ms,$qps_data_available,$cgroup_data,$process_data,$cloud_provider_val"
     else
-        echo "$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$overhead_data,$block_height_data,$current_qps,$rpc_latency_ms,$qps_data_available,$cgroup_data,$cloud_provider_val"
+        echo "$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$overhead_data,$block_height_data,$current_qps,$rpc_latency_ms,$qps_data_available,$cgroup_data,$process_data,$cloud_provider_val"
     fi
 }
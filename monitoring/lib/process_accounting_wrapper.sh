@@ -0,0 +1,47 @@
+#!/usr/bin/env bash
+# =====================================================================
+# Process Accounting Wrapper for Unified Monitor
+# =====================================================================
+# Provides stable 15-field per-process I/O and run-queue delay CSV
+# header/data rows for the blockchain node and the monitoring processes.
+# Deltas are computed by process_accounting_collector.py against its state
+# file, because this function runs in a command-substitution subshell.
+# =====================================================================
+
+PROCESS_ACCOUNTING_PLACEHOLDER_HEADER="proc_node_read_bytes_s,proc_node_write_bytes_s,proc_node_syscr_s,proc_node_syscw_s,proc_node_runq_wait_ms_s,proc_node_runq_delay_us,proc_node_threads,proc_monitor_read_bytes_s,proc_monitor_write_bytes_s,proc_monitor_syscr_s,proc_monitor_syscw_s,proc_monitor_runq_wait_ms_s,proc_monitor_runq_delay_us,proc_monitor_threads,proc_meta_source"
+
+resolve_process_accounting_collector_path() {
+    if [[ -n "${PROCESS_ACCOUNTING_COLLECTOR_PATH:-}" ]]; then
+        echo "$PROCESS_ACCOUNTING_COLLECTOR_PATH"
+        return 0
+    fi
+
+    local module_dir
+    module_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+    echo "${module_dir}/process_accounting_collector.py"
+}
+
+get_process_accounting_header() {
+    echo "$PROCESS_ACCOUNTING_PLACEHOLDER_HEADER"
+}
+
+get_process_accounting_data() {
+    if [[ "${PROCESS_ACCOUNTING_ENABLED:-true}" != "true" ]]; then
+        echo "0,0,0,0,0,0,0,0,0,0,0,0,0,0,disabled"
+        return 0
+    fi
+
+    local collector
+    collector="$(resolve_process_accounting_collector_path)"
+    if [[ ! -f "$collector" ]]; then
+        echo "0,0,0,0,0,0,0,0,0,0,0,0,0,0,unavailable"
+        return 0
+    fi
+
+    local node_pids monitor_pids
+    node_pids=$(discover_blockchain_processes 2>/dev/null || true)
+    monitor_pids=$(discover_monitoring_processes 2>/dev/null || true)
+
+    python3 "$collector" --data --node-pids "$node_pids" --monitor-pids "$monitor_pids" 2>/dev/null \
+        || echo "0,0,0,0,0,0,0,0,0,0,0,0,0,0,error"
+}
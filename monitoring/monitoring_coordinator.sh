@@ -34,6 +34,8 @@ declare -A MONITOR_TASKS=(
     ["block_height"]="block_height_monitor.sh"
     ["network"]="network_monitor.sh"             # Provider-aware NIC monitor: aws_ena/gcp_gvnic/gcp_virtio/other_none
     ["disk_bottleneck"]="disk_bottleneck_detector.sh"
+    ["page_cache"]="page_cache_collector.py"     # mincore-based residency of the data directories
+    ["cpu_roles"]="cpu_role_collector.py"        # busy cores per reserved cpuset (CPU_ISOLATION_ENABLED)
     ["iostat"]="iostat_collector.sh"  # Managed by unified_monitor.sh
 )
 
@@ -167,6 +169,22 @@ start_monitor() {
                 cd "${script_dir}" && ./"${script_name}" start 0 "$MONITOR_INTERVAL"
             ) &
             ;;
+        "page_cache")
+            # Long-lived sampler; writes PAGE_CACHE_CSV / PAGE_CACHE_FILES_CSV until SIGTERM
+            (
+                unset LOGGER_COMPONENT
+                cd "${script_dir}" && python3 "${script_name}" --run --interval "$MONITOR_INTERVAL" \
+                    --output "$PAGE_CACHE_CSV" --files-output "$PAGE_CACHE_FILES_CSV"
+            ) &
+            ;;
+        "cpu_roles")
+            # Long-lived sampler; writes CPU_ROLE_CSV until SIGTERM
+            (
+                unset LOGGER_COMPONENT
+                cd "${script_dir}" && python3 "${script_name}" --run --interval "$MONITOR_INTERVAL" \
+                    --output "$CPU_ROLE_CSV"
+            ) &
+            ;;
         "disk_bottleneck")
             # QPS test mode: no duration passed, run indefinitely
             # Set correct working directory and environment variables to ensure subprocess can load dependencies correctly
@@ -229,11 +247,30 @@ stop_monitor() {
 }
 
 # Start all monitoring tasks
+# MONITORING_PROFILE selects the set: full (default) = every monitor,
+# minimal = unified_monitor.sh only (the main CSV), off = none.
 start_all_monitors() {
-    echo "🚀 Starting all monitoring tasks (monitoring interval: ${MONITOR_INTERVAL} seconds)"
+    local profile="${MONITORING_PROFILE:-full}"
+    echo "🚀 Starting all monitoring tasks (profile: ${profile}, monitoring interval: ${MONITOR_INTERVAL} seconds)"
     
     # Start monitoring tasks by priority - start all necessary monitoring scripts
-    local monitors_to_start=("unified" "network" "block_height" "disk_bottleneck")
+    local monitors_to_start=()
+    case "$profile" in
+        off)
+            ;;
+        minimal)
+            monitors_to_start=("unified")
+            ;;
+        *)
+            monitors_to_start=("unified" "network" "block_height" "disk_bottleneck")
+            if [[ "${PAGE_CACHE_MONITOR_ENABLED:-true}" == "true" ]]; then
+                monitors_to_start+=("page_cache")
+            fi
+            ;;
+    esac
+    if [[ "$profile" != "off" && "${CPU_ISOLATION_ENABLED:-false}" == "true" ]]; then
+        monitors_to_start+=("cpu_roles")
+    fi
     
     for monitor in "${monitors_to_start[@]}"; do
         start_monitor "$monitor"
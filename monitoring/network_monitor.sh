@@ -70,7 +70,11 @@ cmd_start() {
 
     # Write PID + CSV header
     echo $$ > "$NETWORK_PID_FILE"
-    generate_network_csv_header > "$NETWORK_CSV"
+    if [[ -n "${RESUME_SESSION:-}" && -s "$NETWORK_CSV" && "$(head -1 "$NETWORK_CSV")" == "$(generate_network_csv_header)" ]]; then
+        log_info "Resumed session: appending to existing $NETWORK_CSV"
+    else
+        generate_network_csv_header > "$NETWORK_CSV"
+    fi
     log_info "CSV header written to $NETWORK_CSV (cols=$(head -1 "$NETWORK_CSV" | awk -F, '{print NF}'))"
 
     # Graceful shutdown
@@ -0,0 +1,659 @@
+#!/usr/bin/env python3
+"""
+node_pod_collector.py — node-wide multi-Pod streaming collector (DaemonSet)
+===========================================================================
+
+Purpose
+-------
+One long-running process per node that samples every blockchain Pod on
+that node and serves the rows over a small local HTTP/NDJSON endpoint,
+instead of exec'ing a collector per Pod per tick.
+
+Pulling is manual: `--pull` fetches rows through `kubectl port-forward`,
+and deploy/k8s/validate.sh --post-deploy uses it to check the endpoint.
+blockchain_node_benchmark.sh does not pull these rows into its logs dir.
+
+Why
+---
+The original DaemonSet loop spawned `python3 cgroup_collector.py --data`
+every interval for a single cgroup. Scaling that to N Pods means N
+interpreter start-ups, N /proc/<pid>/cgroup lookups and N apiserver round
+trips per tick, so per-node overhead grows with Pod density — exactly the
+observer effect a benchmark should not have. Here the expensive parts are
+paid once:
+
+  discovery   pod_device_mapper.map_namespace_pods(node_name=NODE_NAME)
+              at start, then a pods watch (fieldSelector=spec.nodeName)
+              keeps the set current. Only ADDED / removed Pods cost API
+              calls; steady state is one idle HTTP stream per namespace.
+              PVC/PV lookups for new Pods come from k8s_informer caches.
+  cgroups     one walk of the kubepods hierarchy maps Pod UID → cgroup
+              path; re-walked only when an unknown UID shows up.
+  volumes     one read of /proc/diskstats per tick serves every mapped
+              device of every Pod.
+
+Per tick the remaining work is three small cgroupfs reads per Pod in the
+same process, so CPU and memory stay flat with Pod count and the
+DaemonSet resource limits do not need per-node tuning.
+
+Inputs (env; DaemonSet ConfigMap + Downward API)
+------
+  NODE_NAME                     node to collect for (Downward API)
+  POD_NAME                      this collector Pod; excluded from targets
+  COLLECTOR_TARGET_NAMESPACES   comma-separated namespaces to watch
+  COLLECTOR_LABEL_SELECTOR      optional label selector for node Pods
+  COLLECTION_INTERVAL_SEC       tick interval (default 5)
+  NODE_COLLECTOR_PORT           HTTP port (default 9102)
+  NODE_COLLECTOR_BIND           bind address (default 0.0.0.0)
+  NODE_COLLECTOR_BUFFER_ROWS    rows kept for pulling (default 20000)
+  HOST_PROC / HOST_SYS / HOST_ROOT / CGROUP_*   as for cgroup_collector.py
+
+HTTP endpoints
+--------------
+  GET /rows?since=<seq>&limit=<n>   NDJSON, one Pod row per line, oldest
+                                    first; X-Next-Since carries the seq to
+                                    pass on the next pull
+  GET /pods                         current targets (JSON, diagnostics)
+  GET /healthz                      200 while the sampler keeps ticking
+  GET /readyz                       200 after the first discovery + tick
+
+Row schema (one JSON object per Pod per tick)
+----------
+  seq, timestamp, epoch, node, namespace, pod, pod_uid, cgroup_path,
+  the 19 cgroup_collector.ALL_FIELDS (cumulative counters),
+  volumes: [{logical_name, device, reads, read_sectors, read_ms,
+             writes, write_sectors, write_ms, io_ms}]  (cumulative),
+  pods_on_node, tick_ms
+
+Counters stay cumulative, like cgroup_collector.py --data; rates are the
+consumer's job, so a missed pull never corrupts a delta.
+
+Failure semantics
+-----------------
+Never raises out of the sampler or watch threads. API failures keep the
+last known Pod set and retry with backoff; an expired watch
+(410 Gone) triggers a full re-discovery. Pods whose cgroup is not found
+take MEM/CPU from the kubelet summary (one cached fetch per TTL for all
+of them, cgroup_meta_source="k8s_fallback:unresolved"), else emit
+cgroup_meta_source="unresolved".
+
+References
+----------
+- Watch semantics: kubernetes.io/docs/reference/using-api/api-concepts/#efficient-detection-of-changes
+- Pod cgroup naming: kubernetes.io/docs/concepts/architecture/cgroups/
+- /proc/diskstats: kernel.org/doc/Documentation/admin-guide/iostats.rst
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib import request as urlrequest
+from urllib.parse import parse_qs, urlencode, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cgroup_collector import ALL_FIELDS as CGROUP_FIELDS  # noqa: E402
+from cgroup_collector import collect_counters, kubelet_pod_counters, resolve_cgroup_layout  # noqa: E402
+from k8s_api_client import K8sApiClient, K8sApiError  # noqa: E402
+from k8s_informer import CachedK8sClient  # noqa: E402
+from kubelet_stats_client import KubeletStatsClient, shared_summary_cache  # noqa: E402
+from pod_device_mapper import PodMapping, map_namespace_pods, map_pod_volumes  # noqa: E402
+
+
+DEFAULT_PORT = 9102
+DEFAULT_BUFFER_ROWS = 20000
+DEFAULT_INTERVAL_SEC = 5.0
+WATCH_TIMEOUT_SEC = 300
+WATCH_BACKOFF_MAX_SEC = 60.0
+# kubepods → QoS slice → pod slice → container scope sits at depth 3; one
+# extra level covers runtimes that nest an extra slice.
+CGROUP_INDEX_MAX_DEPTH = 4
+
+DISKSTAT_FIELDS = (
+    "reads", "read_merges", "read_sectors", "read_ms",
+    "writes", "write_merges", "write_sectors", "write_ms",
+    "in_flight", "io_ms",
+)
+VOLUME_FIELDS = ("reads", "read_sectors", "read_ms",
+                 "writes", "write_sectors", "write_ms", "io_ms")
+
+TERMINAL_PHASES = ("Succeeded", "Failed")
+
+# Pod cgroup directory names:
+#   systemd driver:  kubepods-burstable-pod<uid with _>.slice
+#   cgroupfs driver: pod<uid>
+_POD_CGROUP_RE = re.compile(r"pod([0-9a-fA-F]{8}[-_][0-9a-fA-F]{4}[-_][0-9a-fA-F]{4}"
+                            r"[-_][0-9a-fA-F]{4}[-_][0-9a-fA-F]{12})(?:\.slice)?$")
+
+
+def _env(name: str, default: str) -> str:
+    v = os.environ.get(name, "")
+    return v if v else default
+
+
+# ---------------------------------------------------------------------------
+# Host-side readers
+# ---------------------------------------------------------------------------
+
+def index_pod_cgroups(base: str) -> Dict[str, str]:
+    """Map Pod UID → cgroup path (relative to `base`, leading "/").
+
+    Walks only the kubepods subtrees, bounded by CGROUP_INDEX_MAX_DEPTH, so
+    one call covers every Pod on the node.
+    """
+    index: Dict[str, str] = {}
+    root = Path(base)
+    try:
+        tops = [p for p in root.iterdir() if p.is_dir() and p.name.startswith("kubepods")]
+    except OSError:
+        return index
+    stack: List[Tuple[Path, int]] = [(p, 1) for p in tops]
+    while stack:
+        path, depth = stack.pop()
+        m = _POD_CGROUP_RE.search(path.name)
+        if m:
+            index[m.group(1).replace("_", "-").lower()] = "/" + str(path.relative_to(root))
+            continue  # container scopes below the Pod are not needed
+        if depth >= CGROUP_INDEX_MAX_DEPTH:
+            continue
+        try:
+            children = [c for c in path.iterdir() if c.is_dir()]
+        except OSError:
+            continue
+        stack.extend((c, depth + 1) for c in children)
+    return index
+
+
+def cgroup_index_base(layout: Dict[str, str]) -> str:
+    """Hierarchy to search for Pod cgroups (v1: the blkio controller)."""
+    if layout.get("CGROUP_VERSION") == "v1":
+        return layout.get("CGROUP_V1_BLKIO_PATH") or layout.get("CGROUP_V1_MEMORY_PATH", "")
+    return layout.get("CGROUP_ROOT", "")
+
+
+def read_diskstats(host_proc: str) -> Dict[str, Dict[str, int]]:
+    """Parse /proc/diskstats once into {device: {DISKSTAT_FIELDS...}}."""
+    out: Dict[str, Dict[str, int]] = {}
+    try:
+        with open(os.path.join(host_proc, "diskstats"), "r", encoding="utf-8") as fh:
+            lines = fh.readlines()
+    except OSError:
+        return out
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 3 + len(DISKSTAT_FIELDS):
+            continue
+        try:
+            values = [int(v) for v in parts[3:3 + len(DISKSTAT_FIELDS)]]
+        except ValueError:
+            continue
+        out[parts[2]] = dict(zip(DISKSTAT_FIELDS, values))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Pod registry (discovery + watch)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PodTarget:
+    """One Pod on this node, with everything a tick needs pre-resolved."""
+    namespace: str
+    pod_name: str
+    pod_uid: str
+    volumes: List[Tuple[str, str]] = field(default_factory=list)  # (logical, device)
+    cgroup_path: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.namespace}/{self.pod_name}"
+
+
+def _block_devices(mapping: PodMapping) -> List[Tuple[str, str]]:
+    """Volumes that resolved to a block device name (not hostPath / "?")."""
+    return [(v.logical_name, v.device) for v in mapping.volumes
+            if v.device and v.device != "?" and not v.device.startswith("/") and "@" not in v.device]
+
+
+class PodRegistry:
+    """Thread-safe Pod set for one node, fed by discovery and watch events."""
+
+    def __init__(self, client: Any, namespaces: List[str], node_name: str,
+                 label_selector: str = "", host_root: str = "/host",
+                 exclude_pod: str = ""):
+        self.client = client
+        self.namespaces = namespaces
+        self.node_name = node_name
+        self.label_selector = label_selector or None
+        self.host_root = host_root
+        self.exclude_pod = exclude_pod
+        self._lock = threading.Lock()
+        self._targets: Dict[str, PodTarget] = {}
+        self.generation = 0        # bumped on every membership change
+        self.discovered = threading.Event()
+
+    def targets(self) -> List[PodTarget]:
+        with self._lock:
+            return list(self._targets.values())
+
+    def _wanted(self, pod: Dict[str, Any]) -> bool:
+        meta = pod.get("metadata", {})
+        if self.exclude_pod and meta.get("name") == self.exclude_pod:
+            return False
+        if meta.get("deletionTimestamp"):
+            return False
+        if pod.get("status", {}).get("phase") in TERMINAL_PHASES:
+            return False
+        node = pod.get("spec", {}).get("nodeName")
+        return not self.node_name or node == self.node_name
+
+    @staticmethod
+    def _target_from_mapping(m: PodMapping) -> PodTarget:
+        return PodTarget(namespace=m.namespace, pod_name=m.pod_name,
+                         pod_uid=m.pod_uid.lower(), volumes=_block_devices(m))
+
+    def discover(self, namespace: str) -> None:
+        """Full re-list of one namespace; replaces that namespace's Pods."""
+        mappings = map_namespace_pods(self.client, namespace, self.host_root,
+                                      node_name=self.node_name or None,
+                                      label_selector=self.label_selector)
+        fresh = {}
+        for m in mappings:
+            if self.exclude_pod and m.pod_name == self.exclude_pod:
+                continue
+            t = self._target_from_mapping(m)
+            fresh[t.key] = t
+        with self._lock:
+            for key in [k for k, t in self._targets.items() if t.namespace == namespace]:
+                if key not in fresh:
+                    del self._targets[key]
+            for key, t in fresh.items():
+                old = self._targets.get(key)
+                if old is not None and old.pod_uid == t.pod_uid:
+                    t.cgroup_path = old.cgroup_path
+                self._targets[key] = t
+            self.generation += 1
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply one watch event. Known, unchanged Pods cost nothing."""
+        pod = event.get("object", {})
+        meta = pod.get("metadata", {})
+        namespace, name = meta.get("namespace", ""), meta.get("name", "")
+        if not namespace or not name:
+            return
+        key = f"{namespace}/{name}"
+        uid = str(meta.get("uid", "")).lower()
+        etype = event.get("type")
+
+        if etype == "DELETED" or not self._wanted(pod):
+            with self._lock:
+                if self._targets.pop(key, None) is not None:
+                    self.generation += 1
+            return
+        if etype not in ("ADDED", "MODIFIED"):
+            return
+        with self._lock:
+            current = self._targets.get(key)
+            if current is not None and current.pod_uid == uid:
+                return
+        # New Pod (or same name, new UID): resolve volumes outside the lock.
+        mapping = map_pod_volumes(self.client, namespace, name, self.host_root, pod=pod)
+        target = self._target_from_mapping(mapping)
+        with self._lock:
+            self._targets[key] = target
+            self.generation += 1
+
+    def watch_namespace(self, namespace: str, stop: threading.Event) -> None:
+        """Discover, then follow the watch until `stop`; never raises."""
+        resource_version = ""
+        backoff = 1.0
+        need_discovery = True
+        while not stop.is_set():
+            try:
+                if need_discovery:
+                    self.discover(namespace)
+                    need_discovery = False
+                    resource_version = ""
+                    self.discovered.set()
+                events = self.client.watch_namespaced_pods(
+                    namespace, node_name=self.node_name or None,
+                    label_selector=self.label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SEC)
+                for event in events:
+                    if stop.is_set():
+                        return
+                    rv = event.get("object", {}).get("metadata", {}).get("resourceVersion")
+                    if rv:
+                        resource_version = rv
+                    if event.get("type") != "BOOKMARK":
+                        self.apply_event(event)
+                backoff = 1.0
+            except K8sApiError as e:
+                if e.status == 410:
+                    need_discovery = True
+                    continue
+                stop.wait(backoff)
+                backoff = min(backoff * 2, WATCH_BACKOFF_MAX_SEC)
+            except Exception:  # noqa: BLE001 — keep the last known Pod set
+                stop.wait(backoff)
+                backoff = min(backoff * 2, WATCH_BACKOFF_MAX_SEC)
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+class RowBuffer:
+    """Bounded, sequence-numbered row store the HTTP pulls read from."""
+
+    def __init__(self, maxlen: int = DEFAULT_BUFFER_ROWS):
+        self._rows: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.last_seq = 0
+
+    def extend(self, rows: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for row in rows:
+                self.last_seq += 1
+                row["seq"] = self.last_seq
+                self._rows.append(row)
+
+    def since(self, seq: int, limit: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            if not self._rows:
+                return []
+            # seq numbers are contiguous, so the start offset is arithmetic
+            start = max(0, seq - self._rows[0]["seq"] + 1)
+            stop = start + limit if limit > 0 else None
+            return list(islice(self._rows, start, stop))
+
+
+class NodeSampler:
+    """One pass over every target per tick."""
+
+    def __init__(self, registry: PodRegistry, buffer: RowBuffer,
+                 layout: Optional[Dict[str, str]] = None,
+                 host_proc: Optional[str] = None, node_name: str = "",
+                 kubelet: Optional[Any] = None):
+        self.registry = registry
+        self.kubelet = kubelet
+        self.buffer = buffer
+        self.layout = layout if layout is not None else resolve_cgroup_layout()
+        self.host_proc = host_proc or self.layout.get("HOST_PROC", "/proc")
+        self.node_name = node_name
+        self._cgroup_index: Dict[str, str] = {}
+        self.last_tick_monotonic = 0.0
+        self.ticks = 0
+
+    def _resolve_cgroups(self, targets: List[PodTarget]) -> None:
+        unresolved = [t for t in targets if t.cgroup_path is None]
+        if not unresolved:
+            return
+        if any(t.pod_uid not in self._cgroup_index for t in unresolved):
+            base = cgroup_index_base(self.layout)
+            self._cgroup_index = index_pod_cgroups(base) if base else {}
+        for t in unresolved:
+            t.cgroup_path = self._cgroup_index.get(t.pod_uid)
+
+    def _kubelet_counters(self, t: PodTarget) -> Dict[str, Any]:
+        """Unresolved cgroup → kubelet summary (shared cache, one fetch per TTL)."""
+        if self.kubelet is not None and self.node_name:
+            try:
+                pod = self.kubelet.pod_on_node(self.node_name, t.namespace, t.pod_name)
+            except Exception:  # noqa: BLE001 — fall through to "unresolved"
+                pod = None
+            if pod is not None:
+                return kubelet_pod_counters(pod, "unresolved")
+        out: Dict[str, Any] = {f: 0 for f in CGROUP_FIELDS}
+        out["cgroup_meta_source"] = "unresolved"
+        return out
+
+    def tick(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        started = time.monotonic()
+        now = time.time() if now is None else now
+        targets = self.registry.targets()
+        self._resolve_cgroups(targets)
+        diskstats = read_diskstats(self.host_proc)
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+
+        rows: List[Dict[str, Any]] = []
+        for t in targets:
+            row: Dict[str, Any] = {
+                "timestamp": timestamp, "epoch": round(now, 3), "node": self.node_name,
+                "namespace": t.namespace, "pod": t.pod_name, "pod_uid": t.pod_uid,
+                "cgroup_path": t.cgroup_path or "",
+            }
+            if t.cgroup_path is not None and self.layout.get("CGROUP_ROOT"):
+                row.update(collect_counters(self.layout, t.cgroup_path))
+            else:
+                row.update(self._kubelet_counters(t))
+            volumes = []
+            for logical, device in t.volumes:
+                stats = diskstats.get(device, {})
+                entry: Dict[str, Any] = {"logical_name": logical, "device": device}
+                entry.update({k: stats.get(k, 0) for k in VOLUME_FIELDS})
+                volumes.append(entry)
+            row["volumes"] = volumes
+            rows.append(row)
+
+        tick_ms = round((time.monotonic() - started) * 1000, 3)
+        for row in rows:
+            row["pods_on_node"] = len(targets)
+            row["tick_ms"] = tick_ms
+        self.buffer.extend(rows)
+        self.last_tick_monotonic = time.monotonic()
+        self.ticks += 1
+        return rows
+
+
+# ---------------------------------------------------------------------------
+# HTTP endpoint
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):  # silence per-request logs
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        d = self.server.collector  # type: ignore[attr-defined]
+        if parsed.path == "/rows":
+            try:
+                since = int(query.get("since", ["0"])[0])
+                limit = int(query.get("limit", ["0"])[0])
+            except ValueError:
+                self._send(400, b"since/limit must be integers\n", "text/plain")
+                return
+            rows = d.buffer.since(since, limit)
+            next_since = rows[-1]["seq"] if rows else max(since, 0)
+            body = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+            self._send(200, body.encode("utf-8"), "application/x-ndjson",
+                       {"X-Next-Since": str(next_since)})
+        elif parsed.path == "/pods":
+            pods = [{"namespace": t.namespace, "pod": t.pod_name, "pod_uid": t.pod_uid,
+                     "cgroup_path": t.cgroup_path, "volumes": t.volumes}
+                    for t in d.registry.targets()]
+            self._send(200, json.dumps(pods).encode("utf-8"), "application/json")
+        elif parsed.path == "/healthz":
+            ok = d.healthy()
+            self._send(200 if ok else 503, b"ok\n" if ok else b"sampler stalled\n", "text/plain")
+        elif parsed.path == "/readyz":
+            ok = d.ready()
+            self._send(200 if ok else 503, b"ok\n" if ok else b"not ready\n", "text/plain")
+        else:
+            self._send(404, b"not found\n", "text/plain")
+
+
+class NodeCollectorDaemon:
+    """Wires registry watch threads, the sampler loop and the HTTP server."""
+
+    def __init__(self, registry: PodRegistry, sampler: NodeSampler,
+                 interval: float = DEFAULT_INTERVAL_SEC,
+                 bind: str = "0.0.0.0", port: int = DEFAULT_PORT):
+        self.registry = registry
+        self.sampler = sampler
+        self.buffer = sampler.buffer
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.server = ThreadingHTTPServer((bind, port), _Handler)
+        self.server.collector = self  # type: ignore[attr-defined]
+        self.server.daemon_threads = True
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def healthy(self) -> bool:
+        last = self.sampler.last_tick_monotonic
+        if not last:
+            return True  # still starting; readiness gates traffic
+        return time.monotonic() - last < max(3 * self.interval, 30.0)
+
+    def ready(self) -> bool:
+        return self.registry.discovered.is_set() and self.sampler.ticks > 0
+
+    def _sample_loop(self) -> None:
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.sampler.tick()
+            except Exception:  # noqa: BLE001 — a bad tick must not stop sampling
+                pass
+            elapsed = time.monotonic() - started
+            self.stop_event.wait(max(0.0, self.interval - elapsed))
+
+    def start(self, watch: bool = True) -> None:
+        if watch:
+            for ns in self.registry.namespaces:
+                self._threads.append(threading.Thread(
+                    target=self.registry.watch_namespace, args=(ns, self.stop_event),
+                    name=f"watch-{ns}", daemon=True))
+        self._threads.append(threading.Thread(target=self._sample_loop,
+                                              name="sampler", daemon=True))
+        self._threads.append(threading.Thread(target=self.server.serve_forever,
+                                              name="http", daemon=True))
+        for t in self._threads:
+            t.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# ---------------------------------------------------------------------------
+# Manual pull (operator / validate.sh)
+# ---------------------------------------------------------------------------
+
+def pull_rows(url: str, since: int = 0, limit: int = 0,
+              timeout: float = 10.0) -> Tuple[List[Dict[str, Any]], int]:
+    """Fetch rows newer than `since`; returns (rows, next_since)."""
+    query = {"since": str(since)}
+    if limit:
+        query["limit"] = str(limit)
+    full = f"{url.rstrip('/')}/rows?{urlencode(query)}"
+    with urlrequest.urlopen(full, timeout=timeout) as resp:
+        next_since = int(resp.headers.get("X-Next-Since", since))
+        body = resp.read().decode("utf-8", errors="replace")
+    rows = [json.loads(line) for line in body.splitlines() if line.strip()]
+    return rows, next_since
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _namespaces_from_env() -> List[str]:
+    raw = _env("COLLECTOR_TARGET_NAMESPACES", _env("POD_NAMESPACE", "default"))
+    return [ns.strip() for ns in raw.split(",") if ns.strip()]
+
+
+def serve() -> int:
+    interval = float(_env("COLLECTION_INTERVAL_SEC", str(DEFAULT_INTERVAL_SEC)))
+    node_name = _env("NODE_NAME", "")
+    namespaces = _namespaces_from_env()
+    # Pods are followed by PodRegistry's own watch; PVC/PV lookups for new
+    # Pods are served from informers instead of per-Pod GET chains.
+    client = CachedK8sClient(K8sApiClient(), namespaces, resources=("pvcs", "pvs"))
+    registry = PodRegistry(
+        client, namespaces, node_name,
+        label_selector=_env("COLLECTOR_LABEL_SELECTOR", ""),
+        host_root=_env("HOST_ROOT", "/host"),
+        exclude_pod=_env("POD_NAME", ""),
+    )
+    sampler = NodeSampler(registry, RowBuffer(int(_env("NODE_COLLECTOR_BUFFER_ROWS",
+                                                       str(DEFAULT_BUFFER_ROWS)))),
+                          node_name=node_name,
+                          kubelet=KubeletStatsClient(cache=shared_summary_cache(client.client)))
+    daemon = NodeCollectorDaemon(registry, sampler, interval=interval,
+                                 bind=_env("NODE_COLLECTOR_BIND", "0.0.0.0"),
+                                 port=int(_env("NODE_COLLECTOR_PORT", str(DEFAULT_PORT))))
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop_event.set())
+    client.start(daemon.stop_event)
+    daemon.start()
+    print(f"node_pod_collector: node={node_name or '?'} "
+          f"namespaces={','.join(registry.namespaces)} port={daemon.port}", flush=True)
+    daemon.stop_event.wait()
+    daemon.stop()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Node-wide multi-Pod streaming collector")
+    mode = ap.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--serve", action="store_true",
+                      help="run the DaemonSet collector and HTTP endpoint")
+    mode.add_argument("--pull", metavar="URL",
+                      help="fetch NDJSON rows from a running collector")
+    ap.add_argument("--since", type=int, default=0, help="with --pull: last seq already seen")
+    ap.add_argument("--limit", type=int, default=0, help="with --pull: max rows")
+    ap.add_argument("--output", help="with --pull: append rows to this NDJSON file")
+    args = ap.parse_args(argv)
+
+    if args.serve:
+        return serve()
+
+    try:
+        rows, next_since = pull_rows(args.pull, args.since, args.limit)
+    except (OSError, ValueError) as e:
+        print(f"pull failed: {e}", file=sys.stderr)
+        return 1
+    lines = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as fh:
+            fh.write(lines)
+    else:
+        sys.stdout.write(lines)
+    print(f"next_since={next_since} rows={len(rows)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+page_cache_collector.py — page-cache residency sampler for node data dirs
+==========================================================================
+
+Purpose
+-------
+Report how much of the blockchain node's on-disk data is resident in the
+Linux page cache. Read IOPS and read latency on the DATA/ACCOUNTS devices
+are largely a function of cache misses; without residency numbers a rise in
+r_s at a given QPS cannot be told apart from a working set that simply
+stopped fitting in memory.
+
+How
+---
+Each file is mapped PROT_READ with libc mmap() and queried with mincore().
+Neither call faults pages in, so sampling does not perturb the cache it is
+measuring. Files are mapped in bounded windows (PAGE_CACHE_WINDOW_MB) so a
+multi-TiB ledger never needs one huge mapping.
+
+Walking a full ledger every tick is too expensive, so sampling is
+incremental:
+  - the file inventory of each data directory is rebuilt every
+    PAGE_CACHE_RESCAN_TICKS ticks (capped at PAGE_CACHE_MAX_FILES files);
+  - each tick samples the next PAGE_CACHE_FILES_PER_TICK files from a
+    rotating cursor and refreshes their cached residency;
+  - per-directory totals are computed from the cached per-file values, and
+    coverage_ratio reports what share of the directory's bytes have been
+    sampled at least once since the last rescan.
+
+Inputs (env vars from config_loader.sh):
+  LEDGER_DEVICE / ACCOUNTS_DEVICE   device names; their mount points are the
+                                    default data directories
+  LEDGER_DATA_DIR / ACCOUNTS_DATA_DIR  explicit directory overrides
+  HOST_PROC / HOST_ROOT             host views (DaemonSet mode)
+  PAGE_CACHE_FILES_PER_TICK, PAGE_CACHE_TOP_N, PAGE_CACHE_RESCAN_TICKS,
+  PAGE_CACHE_MAX_FILES, PAGE_CACHE_WINDOW_MB
+  PAGE_CACHE_CSV / PAGE_CACHE_FILES_CSV   output paths for run mode
+
+Outputs
+-------
+  --header          per-directory CSV header
+  --data            one per-directory CSV row (single full pass)
+  --run             long-lived loop appending to PAGE_CACHE_CSV and the top-N
+                    file table PAGE_CACHE_FILES_CSV every --interval seconds
+
+Per-directory schema (logical ∈ {data, accounts}):
+  pagecache_{logical}_resident_bytes, _sampled_bytes, _total_bytes,
+  pagecache_{logical}_residency_ratio, _coverage_ratio,
+  pagecache_{logical}_files_total, _files_sampled
+The pagecache_ prefix keeps these columns out of the {logical}_{device}_*
+iostat namespace used by the analyzers.
+
+Failure semantics
+-----------------
+Never raises out of a tick. Unreadable files are skipped, unresolvable
+directories emit zeros, and a platform without mincore() emits zeros with
+a single warning on stderr.
+
+References
+----------
+- mincore(2), mmap(2)
+- fincore(1) from util-linux uses the same technique
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import ctypes
+import ctypes.util
+import mmap
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+LOGICAL_NAMES = ("data", "accounts")
+
+DIR_METRICS = (
+    "resident_bytes",
+    "sampled_bytes",
+    "total_bytes",
+    "residency_ratio",
+    "coverage_ratio",
+    "files_total",
+    "files_sampled",
+)
+
+FILE_FIELDS = (
+    "timestamp",
+    "logical_name",
+    "rank",
+    "path",
+    "size_bytes",
+    "resident_bytes",
+    "residency_ratio",
+)
+
+_PROT_READ = 0x1
+_MAP_SHARED = 0x01
+_MAP_FAILED = ctypes.c_void_p(-1).value
+# mincore() only defines the least significant bit of each vector byte.
+_LSB_TABLE = bytes(i & 1 for i in range(256))
+
+
+def _env(name: str, default: str) -> str:
+    value = os.environ.get(name)
+    return value if value not in (None, "") else default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(_env(name, str(default))))
+    except ValueError:
+        return default
+
+
+# ---------------------------------------------------------------------------
+# mincore() binding
+# ---------------------------------------------------------------------------
+
+class _Mincore:
+    """Thin ctypes wrapper around libc mmap/mincore/munmap."""
+
+    def __init__(self) -> None:
+        self.available = False
+        self.page_size = mmap.PAGESIZE
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            libc.mmap.restype = ctypes.c_void_p
+            libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_long]
+            libc.munmap.restype = ctypes.c_int
+            libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            libc.mincore.restype = ctypes.c_int
+            libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t,
+                                     ctypes.POINTER(ctypes.c_ubyte)]
+            self._libc = libc
+            self.available = True
+        except (OSError, AttributeError):
+            self._libc = None
+
+    def resident_bytes(self, path: str, size: int, window_bytes: int) -> Optional[int]:
+        """Resident bytes of `path`, or None when it cannot be inspected."""
+        if not self.available:
+            return None
+        if size <= 0:
+            return 0
+        window = max(self.page_size, window_bytes - window_bytes % self.page_size)
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOATIME", 0))
+        except PermissionError:
+            # O_NOATIME requires file ownership; retry without it.
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                return None
+        except OSError:
+            return None
+
+        resident_pages = 0
+        try:
+            offset = 0
+            while offset < size:
+                length = min(window, size - offset)
+                pages = (length + self.page_size - 1) // self.page_size
+                addr = self._libc.mmap(None, length, _PROT_READ, _MAP_SHARED, fd, offset)
+                if addr is None or addr == _MAP_FAILED:
+                    return None
+                try:
+                    vec = (ctypes.c_ubyte * pages)()
+                    if self._libc.mincore(addr, length, vec) != 0:
+                        return None
+                    resident_pages += bytes(vec).translate(_LSB_TABLE).count(1)
+                finally:
+                    self._libc.munmap(addr, length)
+                offset += length
+        finally:
+            os.close(fd)
+        return min(size, resident_pages * self.page_size)
+
+
+# ---------------------------------------------------------------------------
+# Data directory resolution
+# ---------------------------------------------------------------------------
+
+def _strip_partition(name: str) -> str:
+    """nvme0n1p2 → nvme0n1, sdb1 → sdb; whole-disk names are unchanged."""
+    if name.startswith(("nvme", "mmcblk", "loop")):
+        head, sep, tail = name.rpartition("p")
+        return head if sep and tail.isdigit() and head[-1:].isdigit() else name
+    return name.rstrip("0123456789") or name
+
+
+def resolve_device_mountpoint(device: str, host_proc: str = "/proc") -> Optional[str]:
+    """Return the shortest mount point backed by /dev/<device> or a partition of it."""
+    if not device:
+        return None
+    device = device.replace("/dev/", "")
+    candidates: List[str] = []
+    for mounts_file in (os.path.join(host_proc, "1", "mounts"),
+                        os.path.join(host_proc, "self", "mounts")):
+        try:
+            with open(mounts_file, "r", encoding="utf-8") as fh:
+                lines = fh.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            parts = line.split()
+            if len(parts) < 2 or not parts[0].startswith("/dev/"):
+                continue
+            source = os.path.basename(parts[0])
+            if source == device or _strip_partition(source) == device:
+                # /proc/mounts escapes spaces as \040
+                candidates.append(parts[1].replace("\\040", " "))
+        if candidates:
+            break
+    if not candidates:
+        return None
+    return min(candidates, key=len)
+
+
+def resolve_data_dirs() -> Dict[str, str]:
+    """Map logical name → directory to sample, honoring explicit overrides."""
+    host_proc = _env("HOST_PROC", "/proc")
+    host_root = _env("HOST_ROOT", "/")
+    sources = {
+        "data": (os.environ.get("LEDGER_DATA_DIR", ""), os.environ.get("LEDGER_DEVICE", "")),
+        "accounts": (os.environ.get("ACCOUNTS_DATA_DIR", ""), os.environ.get("ACCOUNTS_DEVICE", "")),
+    }
+    dirs: Dict[str, str] = {}
+    for logical, (explicit, device) in sources.items():
+        path = explicit or resolve_device_mountpoint(device, host_proc)
+        if not path:
+            continue
+        if not explicit and host_root != "/":
+            path = os.path.join(host_root, path.lstrip("/"))
+        if os.path.isdir(path):
+            dirs[logical] = path
+    # ACCOUNTS sharing the DATA mount would double count the same pages.
+    if "accounts" in dirs and dirs.get("data") == dirs["accounts"]:
+        del dirs["accounts"]
+    return dirs
+
+
+# ---------------------------------------------------------------------------
+# Incremental sampler
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FileResidency:
+    path: str
+    size_bytes: int
+    resident_bytes: int = 0
+    sampled: bool = False
+
+    @property
+    def residency_ratio(self) -> float:
+        return self.resident_bytes / self.size_bytes if self.size_bytes else 0.0
+
+
+@dataclass
+class DirectoryState:
+    logical_name: str
+    root: str
+    files: List[FileResidency] = field(default_factory=list)
+    cursor: int = 0
+    scanned: bool = False
+
+    def snapshot(self) -> Dict[str, float]:
+        total = sum(f.size_bytes for f in self.files)
+        sampled = [f for f in self.files if f.sampled]
+        sampled_bytes = sum(f.size_bytes for f in sampled)
+        resident = sum(f.resident_bytes for f in sampled)
+        return {
+            "resident_bytes": resident,
+            "sampled_bytes": sampled_bytes,
+            "total_bytes": total,
+            "residency_ratio": round(resident / sampled_bytes, 4) if sampled_bytes else 0.0,
+            "coverage_ratio": round(sampled_bytes / total, 4) if total else 0.0,
+            "files_total": len(self.files),
+            "files_sampled": len(sampled),
+        }
+
+    def top_files(self, n: int) -> List[FileResidency]:
+        sampled = [f for f in self.files if f.sampled]
+        return sorted(sampled, key=lambda f: f.size_bytes, reverse=True)[:n]
+
+
+def scan_directory(root: str, max_files: int) -> List[FileResidency]:
+    """Inventory regular files under root without following symlinks."""
+    files: List[FileResidency] = []
+    stack = [root]
+    while stack and len(files) < max_files:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            size = entry.stat(follow_symlinks=False).st_size
+                            if size > 0:
+                                files.append(FileResidency(entry.path, size))
+                    except OSError:
+                        continue
+                    if len(files) >= max_files:
+                        break
+        except OSError:
+            continue
+    return files
+
+
+class PageCacheSampler:
+    """Rotating, budgeted page-cache residency sampler over data directories."""
+
+    def __init__(
+        self,
+        dirs: Dict[str, str],
+        files_per_tick: int = 64,
+        rescan_ticks: int = 60,
+        max_files: int = 200000,
+        window_bytes: int = 1 << 30,
+        mincore: Optional[_Mincore] = None,
+    ) -> None:
+        self.states = {name: DirectoryState(name, root) for name, root in dirs.items()}
+        self.files_per_tick = files_per_tick
+        self.rescan_ticks = rescan_ticks
+        self.max_files = max_files
+        self.window_bytes = window_bytes
+        self.mincore = mincore or _Mincore()
+        self.ticks = 0
+
+    @classmethod
+    def from_env(cls) -> "PageCacheSampler":
+        return cls(
+            resolve_data_dirs(),
+            files_per_tick=_env_int("PAGE_CACHE_FILES_PER_TICK", 64),
+            rescan_ticks=_env_int("PAGE_CACHE_RESCAN_TICKS", 60),
+            max_files=_env_int("PAGE_CACHE_MAX_FILES", 200000),
+            window_bytes=_env_int("PAGE_CACHE_WINDOW_MB", 1024) << 20,
+        )
+
+    def _rescan(self, state: DirectoryState) -> None:
+        previous = {f.path: f for f in state.files}
+        files = scan_directory(state.root, self.max_files)
+        for f in files:
+            old = previous.get(f.path)
+            # Keep residency for unchanged files so coverage survives a rescan.
+            if old is not None and old.sampled and old.size_bytes == f.size_bytes:
+                f.resident_bytes = old.resident_bytes
+                f.sampled = True
+        state.files = files
+        state.cursor = state.cursor % len(files) if files else 0
+        state.scanned = True
+
+    def tick(self) -> None:
+        """Refresh the next batch of files in every directory."""
+        for state in self.states.values():
+            # An empty directory stays empty until the next scheduled rescan.
+            if not state.scanned or self.ticks % self.rescan_ticks == 0:
+                self._rescan(state)
+            count = min(self.files_per_tick, len(state.files))
+            for _ in range(count):
+                f = state.files[state.cursor]
+                state.cursor = (state.cursor + 1) % len(state.files)
+                resident = self.mincore.resident_bytes(f.path, f.size_bytes, self.window_bytes)
+                if resident is not None:
+                    f.resident_bytes = resident
+                    f.sampled = True
+        self.ticks += 1
+
+    def full_pass(self) -> None:
+        """Sample every inventoried file once (used by --data)."""
+        saved = self.files_per_tick
+        self.files_per_tick = self.max_files
+        try:
+            self.tick()
+        finally:
+            self.files_per_tick = saved
+
+    def row(self) -> List[str]:
+        values: List[str] = []
+        for logical in LOGICAL_NAMES:
+            state = self.states.get(logical)
+            snap = state.snapshot() if state else {}
+            values.extend(str(snap.get(metric, 0)) for metric in DIR_METRICS)
+        return values
+
+    def top_file_rows(self, timestamp: str, n: int) -> List[Tuple[str, ...]]:
+        rows: List[Tuple[str, ...]] = []
+        for logical in LOGICAL_NAMES:
+            state = self.states.get(logical)
+            if not state:
+                continue
+            for rank, f in enumerate(state.top_files(n), start=1):
+                rows.append((timestamp, logical, str(rank), f.path, str(f.size_bytes),
+                             str(f.resident_bytes), f"{f.residency_ratio:.4f}"))
+        return rows
+
+
+def csv_header() -> str:
+    fields = ["timestamp"]
+    for logical in LOGICAL_NAMES:
+        fields.extend(f"pagecache_{logical}_{metric}" for metric in DIR_METRICS)
+    return ",".join(fields)
+
+
+def _timestamp() -> str:
+    return time.strftime(_env("TIMESTAMP_FORMAT", "%Y-%m-%d %H:%M:%S"))
+
+
+# ---------------------------------------------------------------------------
+# Run loop
+# ---------------------------------------------------------------------------
+
+def run(sampler: PageCacheSampler, output: str, files_output: str,
+        interval: float, duration: float, top_n: int) -> int:
+    stopping = {"flag": False}
+
+    def _stop(_signum, _frame):
+        stopping["flag"] = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    if not sampler.mincore.available:
+        print("⚠️  mincore() unavailable; page cache residency will be reported as 0",
+              file=sys.stderr)
+    if not sampler.states:
+        print("⚠️  No data directory resolved for LEDGER_DEVICE/ACCOUNTS_DEVICE; "
+              "set LEDGER_DATA_DIR to enable page cache sampling", file=sys.stderr)
+
+    for path, header in ((output, csv_header()), (files_output, ",".join(FILE_FIELDS))):
+        if path and (not os.path.exists(path) or os.path.getsize(path) == 0):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(header + "\n")
+
+    started = time.monotonic()
+    while not stopping["flag"]:
+        tick_start = time.monotonic()
+        sampler.tick()
+        ts = _timestamp()
+        with open(output, "a", encoding="utf-8") as fh:
+            fh.write(",".join([ts] + sampler.row()) + "\n")
+        if files_output:
+            with open(files_output, "a", encoding="utf-8", newline="") as fh:
+                csv.writer(fh).writerows(sampler.top_file_rows(ts, top_n))
+
+        # Stop before a tick that would land past the requested duration.
+        if duration > 0 and time.monotonic() - started + interval > duration:
+            break
+        remaining = interval - (time.monotonic() - tick_start)
+        while remaining > 0 and not stopping["flag"]:
+            time.sleep(min(remaining, 0.5))
+            remaining = interval - (time.monotonic() - tick_start)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Page cache residency sampler for node data directories")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--header", action="store_true", help="print per-directory CSV header")
+    mode.add_argument("--data", action="store_true", help="print one row after a full pass")
+    mode.add_argument("--run", action="store_true", help="append rows every --interval seconds")
+    ap.add_argument("--interval", type=float, default=float(_env("MONITOR_INTERVAL", "5")))
+    ap.add_argument("--duration", type=float, default=0, help="0 = until SIGTERM")
+    ap.add_argument("--output", default=os.environ.get("PAGE_CACHE_CSV", ""))
+    ap.add_argument("--files-output", default=os.environ.get("PAGE_CACHE_FILES_CSV", ""))
+    ap.add_argument("--top-n", type=int, default=_env_int("PAGE_CACHE_TOP_N", 10))
+    args = ap.parse_args(argv)
+
+    if args.header:
+        print(csv_header())
+        return 0
+
+    sampler = PageCacheSampler.from_env()
+    if args.run:
+        if not args.output:
+            print("❌ --run requires --output or PAGE_CACHE_CSV", file=sys.stderr)
+            return 2
+        return run(sampler, args.output, args.files_output,
+                   max(args.interval, 0.1), args.duration, args.top_n)
+
+    sampler.full_pass()
+    print(",".join([_timestamp()] + sampler.row()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -93,6 +93,7 @@ class PodMapping:
     node_name: str
     volumes: List[VolumeMapping] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    pod_uid: str = ""       # metadata.uid; names the Pod's cgroup on the node
 
 
 # ---------------------------------------------------------------------
@@ -348,20 +349,27 @@ def map_pod_volumes(
     namespace: str,
     pod_name: str,
     host_root: str = "/host",
+    pod: Optional[Dict[str, Any]] = None,
 ) -> PodMapping:
-    """Resolve all volumes for one Pod. Never raises — accumulates warnings."""
-    try:
-        pod = client.get_pod(namespace, pod_name)
-    except K8sApiError as e:
-        m = PodMapping(namespace=namespace, pod_name=pod_name, node_name="?")
-        m.warnings.append(f"failed to fetch Pod: {e}")
-        return m
+    """Resolve all volumes for one Pod. Never raises — accumulates warnings.
+
+    `pod` is the Pod object when the caller already has it (from a list or
+    a watch event); the GET is skipped and only PVC/PV lookups remain.
+    """
+    if pod is None:
+        try:
+            pod = client.get_pod(namespace, pod_name)
+        except K8sApiError as e:
+            m = PodMapping(namespace=namespace, pod_name=pod_name, node_name="?")
+            m.warnings.append(f"failed to fetch Pod: {e}")
+            return m
 
     spec = pod.get("spec", {})
     meta = pod.get("metadata", {})
     node = spec.get("nodeName", "?")
     pod_uid = meta.get("uid", "")
-    mapping = PodMapping(namespace=namespace, pod_name=pod_name, node_name=node)
+    mapping = PodMapping(namespace=namespace, pod_name=pod_name, node_name=node,
+                         pod_uid=pod_uid)
 
     for vol in spec.get("volumes", []):
         logical = vol.get("name", "?")
@@ -435,17 +443,24 @@ def map_namespace_pods(
     client: K8sApiClient,
     namespace: str,
     host_root: str = "/host",
+    node_name: Optional[str] = None,
+    label_selector: Optional[str] = None,
 ) -> List[PodMapping]:
-    """Resolve volumes for every Pod in a namespace."""
+    """Resolve volumes for every Pod in a namespace (optionally one node's).
+
+    The listed Pod objects are reused, so the cost is one list plus the
+    PVC/PV lookups — not an extra GET per Pod.
+    """
     try:
-        pods = client.list_namespaced_pods(namespace)
+        pods = client.list_namespaced_pods(namespace, node_name=node_name,
+                                           label_selector=label_selector)
     except K8sApiError as e:
         _LOG.error("Failed to list pods in %s: %s", namespace, e)
         return []
     out: List[PodMapping] = []
     for p in pods.get("items", []):
         name = p.get("metadata", {}).get("name", "?")
-        out.append(map_pod_volumes(client, namespace, name, host_root))
+        out.append(map_pod_volumes(client, namespace, name, host_root, pod=p))
     return out
 
 
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+process_accounting_collector.py — per-process I/O and run-queue delay deltas
+============================================================================
+
+Purpose
+-------
+Attribute device I/O and scheduler delay to the blockchain node and to the
+monitoring processes. Host iostat cannot tell whose I/O it is counting, and
+CPU% cannot show threads that are runnable but waiting for a core. Both are
+available per process from procfs:
+
+  /proc/<pid>/io                  read_bytes / write_bytes reach the block
+                                  layer (page cache misses and writeback);
+                                  syscr / syscw count read/write syscalls.
+                                  Process-wide, covers all threads.
+  /proc/<pid>/task/<tid>/schedstat  "<on-cpu ns> <run-queue wait ns> <slices>"
+                                  per thread; /proc/<pid>/schedstat only
+                                  covers the main thread, so tasks are summed.
+
+All counters are cumulative, so each invocation reads the previous sample
+from a small JSON state file and emits per-second deltas. A PID whose
+start time changed (PID reuse) or that disappeared contributes nothing to
+that interval instead of producing a negative delta.
+
+Inputs
+------
+  --node-pids "p1 p2"      PIDs from discover_blockchain_processes
+  --monitor-pids "p3 p4"   PIDs from discover_monitoring_processes
+  HOST_PROC                      base /proc path (default /proc)
+  PROCESS_ACCOUNTING_STATE_FILE  previous-sample state
+                                 (default $MEMORY_SHARE_DIR/process_accounting_state.json)
+
+Outputs (stdout, CSV — one line per invocation):
+  --header → 15 columns
+  --data   → CSV row (default mode)
+
+Schema (role ∈ {node, monitor}):
+  proc_{role}_read_bytes_s, _write_bytes_s     block-layer bytes per second
+  proc_{role}_syscr_s, _syscw_s                read/write syscalls per second
+  proc_{role}_runq_wait_ms_s                   run-queue wait summed over all
+                                               threads, ms per wall second
+                                               (1000 ≈ one thread always waiting)
+  proc_{role}_runq_delay_us                    mean wait per scheduling slice
+  proc_{role}_threads                          threads sampled
+  proc_meta_source   ∈ {ok, first_sample, no_pids, error}
+
+Failure semantics
+-----------------
+Never raises. Unreadable /proc entries (exited PIDs, missing ptrace access
+to another user's /proc/<pid>/io) are skipped; the row is still emitted.
+
+References
+----------
+- Documentation/filesystems/proc.rst (/proc/<pid>/io)
+- Documentation/scheduler/sched-stats.rst (/proc/<pid>/schedstat)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+ROLES = ("node", "monitor")
+
+ROLE_FIELDS = (
+    "read_bytes_s",
+    "write_bytes_s",
+    "syscr_s",
+    "syscw_s",
+    "runq_wait_ms_s",
+    "runq_delay_us",
+    "threads",
+)
+
+ALL_FIELDS = tuple(f"proc_{role}_{name}" for role in ROLES for name in ROLE_FIELDS) + ("proc_meta_source",)
+
+IO_KEYS = ("read_bytes", "write_bytes", "syscr", "syscw")
+SCHED_KEYS = ("run_ns", "wait_ns", "slices")
+
+# A previous sample older than this belongs to an earlier run; treat the
+# current invocation as the first sample instead of averaging over the gap.
+MAX_SAMPLE_GAP_S = 300.0
+
+
+def _env(name: str, default: str) -> str:
+    value = os.environ.get(name)
+    return value if value not in (None, "") else default
+
+
+def default_state_file() -> str:
+    explicit = os.environ.get("PROCESS_ACCOUNTING_STATE_FILE")
+    if explicit:
+        return explicit
+    base = _env("MEMORY_SHARE_DIR", _env("TMP_DIR", "/tmp"))
+    return os.path.join(base, "process_accounting_state.json")
+
+
+# ---------------------------------------------------------------------------
+# procfs readers
+# ---------------------------------------------------------------------------
+
+def read_start_time(host_proc: str, pid: str) -> Optional[str]:
+    """Field 22 of /proc/<pid>/stat; identifies the process across PID reuse."""
+    try:
+        with open(os.path.join(host_proc, pid, "stat"), "r", encoding="utf-8") as fh:
+            stat = fh.read()
+    except OSError:
+        return None
+    # comm may contain spaces and parentheses; fields resume after the last ')'.
+    fields = stat.rsplit(")", 1)[-1].split()
+    return fields[19] if len(fields) > 19 else None
+
+
+def read_proc_io(host_proc: str, pid: str) -> Optional[Dict[str, int]]:
+    try:
+        with open(os.path.join(host_proc, pid, "io"), "r", encoding="utf-8") as fh:
+            lines = fh.readlines()
+    except OSError:
+        return None
+    out: Dict[str, int] = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        if key in IO_KEYS:
+            try:
+                out[key] = int(value.strip())
+            except ValueError:
+                out[key] = 0
+    return out if out else None
+
+
+def read_task_schedstat(host_proc: str, pid: str) -> Optional[Dict[str, int]]:
+    """Sum schedstat over every thread of the process."""
+    task_dir = os.path.join(host_proc, pid, "task")
+    try:
+        tids = os.listdir(task_dir)
+    except OSError:
+        tids = []
+    paths = [os.path.join(task_dir, tid, "schedstat") for tid in tids] or \
+            [os.path.join(host_proc, pid, "schedstat")]
+
+    totals = {"run_ns": 0, "wait_ns": 0, "slices": 0, "threads": 0}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                parts = fh.read().split()
+        except OSError:
+            continue
+        if len(parts) < 3:
+            continue
+        try:
+            totals["run_ns"] += int(parts[0])
+            totals["wait_ns"] += int(parts[1])
+            totals["slices"] += int(parts[2])
+            totals["threads"] += 1
+        except ValueError:
+            continue
+    return totals if totals["threads"] else None
+
+
+def sample_pid(host_proc: str, pid: str) -> Optional[Dict[str, object]]:
+    start = read_start_time(host_proc, pid)
+    if start is None:
+        return None
+    sample: Dict[str, object] = {"start": start}
+    io = read_proc_io(host_proc, pid)
+    if io is not None:
+        sample.update(io)
+    sched = read_task_schedstat(host_proc, pid)
+    if sched is not None:
+        sample.update(sched)
+    return sample
+
+
+# ---------------------------------------------------------------------------
+# Delta computation
+# ---------------------------------------------------------------------------
+
+def _parse_pids(raw: str) -> List[str]:
+    return [p for p in raw.replace(",", " ").split() if p.isdigit()]
+
+
+def role_rates(
+    current: Dict[str, Dict[str, object]],
+    previous: Dict[str, Dict[str, object]],
+    pids: List[str],
+    elapsed_s: float,
+) -> Dict[str, float]:
+    """Per-second deltas for one role; only PIDs present in both samples count."""
+    deltas = {key: 0 for key in IO_KEYS + SCHED_KEYS}
+    threads = 0
+    for pid in pids:
+        cur = current.get(pid)
+        if cur is None:
+            continue
+        threads += int(cur.get("threads", 0))
+        prev = previous.get(pid)
+        if prev is None or prev.get("start") != cur.get("start"):
+            continue
+        for key in deltas:
+            if key in cur and key in prev:
+                deltas[key] += max(0, int(cur[key]) - int(prev[key]))
+
+    rates: Dict[str, float] = {name: 0.0 for name in ROLE_FIELDS}
+    rates["threads"] = threads
+    if elapsed_s <= 0:
+        return rates
+    rates["read_bytes_s"] = deltas["read_bytes"] / elapsed_s
+    rates["write_bytes_s"] = deltas["write_bytes"] / elapsed_s
+    rates["syscr_s"] = deltas["syscr"] / elapsed_s
+    rates["syscw_s"] = deltas["syscw"] / elapsed_s
+    rates["runq_wait_ms_s"] = deltas["wait_ns"] / 1e6 / elapsed_s
+    if deltas["slices"]:
+        rates["runq_delay_us"] = deltas["wait_ns"] / deltas["slices"] / 1e3
+    return rates
+
+
+def load_state(path: str) -> Dict[str, object]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path: str, state: Dict[str, object]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp.{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def collect(
+    node_pids: List[str],
+    monitor_pids: List[str],
+    state_file: str,
+    host_proc: str = "/proc",
+    now: Optional[float] = None,
+) -> Dict[str, object]:
+    """Sample both roles, persist the new state, and return one row dict."""
+    now = time.time() if now is None else now
+    state = load_state(state_file)
+    previous = state.get("pids") if isinstance(state.get("pids"), dict) else {}
+    try:
+        elapsed = now - float(state.get("timestamp", 0))
+    except (TypeError, ValueError):
+        elapsed = 0.0
+
+    current: Dict[str, Dict[str, object]] = {}
+    for pid in dict.fromkeys(node_pids + monitor_pids):
+        sample = sample_pid(host_proc, pid)
+        if sample is not None:
+            current[pid] = sample
+
+    if not current:
+        meta = "no_pids"
+    elif not previous or elapsed <= 0 or elapsed > MAX_SAMPLE_GAP_S:
+        meta = "first_sample"
+        elapsed = 0.0
+    else:
+        meta = "ok"
+
+    row: Dict[str, object] = {}
+    for role, pids in (("node", node_pids), ("monitor", monitor_pids)):
+        for name, value in role_rates(current, previous, pids, elapsed).items():
+            row[f"proc_{role}_{name}"] = value
+    row["proc_meta_source"] = meta
+
+    save_state(state_file, {"timestamp": now, "pids": current})
+    return row
+
+
+def format_row(row: Dict[str, object]) -> str:
+    values = []
+    for name in ALL_FIELDS:
+        value = row.get(name, 0)
+        if name.endswith("_threads"):
+            values.append(str(int(value)))
+        elif isinstance(value, float):
+            values.append(f"{value:.2f}")
+        else:
+            values.append(str(value))
+    return ",".join(values)
+
+
+def print_header() -> None:
+    print(",".join(ALL_FIELDS))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-process I/O and run-queue delay collector")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--header", action="store_true", help="print CSV header")
+    mode.add_argument("--data", action="store_true", help="print CSV row (default)")
+    ap.add_argument("--node-pids", default="", help="blockchain node PIDs (space separated)")
+    ap.add_argument("--monitor-pids", default="", help="monitoring PIDs (space separated)")
+    ap.add_argument("--state-file", default=None)
+    args = ap.parse_args(argv)
+
+    if args.header:
+        print_header()
+        return 0
+
+    try:
+        row = collect(
+            _parse_pids(args.node_pids),
+            _parse_pids(args.monitor_pids),
+            args.state_file or default_state_file(),
+            host_proc=_env("HOST_PROC", "/proc"),
+        )
+    except Exception:  # fail-soft: keep the unified CSV row intact
+        row = {"proc_meta_source": "error"}
+    print(format_row(row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -148,16 +148,54 @@ def quantile(values: list[float], q: float) -> float | None:
     return ordered[idx]
 
 
+def hist_quantile_ms(hist: dict[int, int], q: float, max_us: float) -> float | None:
+    """Nearest-rank quantile from an aggregate-sink latency_hist (log2/4 µs buckets)."""
+    total = sum(hist.values())
+    if total <= 0:
+        return None
+    rank = max(1, math.ceil(q * total))
+    seen = 0
+    for idx in sorted(hist):
+        seen += hist[idx]
+        if seen >= rank:
+            upper_us = 2 ** (idx / 4)
+            return (min(upper_us, max_us) if max_us > 0 else upper_us) / 1000.0
+    return None
+
+
+def _new_method_bucket() -> dict[str, Any]:
+    return {"requests": 0, "errors": 0, "latencies": [], "latency_sum_ms": 0.0,
+            "latency_count": 0, "hist": defaultdict(int), "max_us": 0.0}
+
+
+def _add_aggregate_row(bucket: dict[str, Any], row: dict[str, str], klass: str) -> None:
+    count = int(to_float(row.get("count")) or 0)
+    bucket["requests"] += count
+    if klass not in {"2xx", "3xx"}:
+        bucket["errors"] += count
+    bucket["latency_sum_ms"] += (to_float(row.get("latency_sum_us")) or 0.0) / 1000.0
+    bucket["latency_count"] += count
+    bucket["max_us"] = max(bucket["max_us"], to_float(row.get("latency_max_us")) or 0.0)
+    for part in (row.get("latency_hist") or "").split(";"):
+        idx, sep, n = part.partition(":")
+        if sep and idx.lstrip("-").isdigit() and n.isdigit():
+            bucket["hist"][int(idx)] += int(n)
+
+
 def collect_proxy_method_metrics(proxy_csv: Path, allowed_methods: set[str], max_rows: int) -> dict[tuple[str, str], dict[str, Any]]:
-    metrics: dict[tuple[str, str], dict[str, Any]] = defaultdict(
-        lambda: {"requests": 0, "errors": 0, "latencies": []}
-    )
+    """Per (method, status class) counters from either proxy sink format.
+
+    Raw rows (one per request) keep their latencies for an exact p99;
+    aggregate rows (PROXY_SINK_FORMAT=aggregate) merge their histograms.
+    """
+    metrics: dict[tuple[str, str], dict[str, Any]] = defaultdict(_new_method_bucket)
     if not proxy_csv.exists():
         return metrics
 
     try:
         with proxy_csv.open("r", encoding="utf-8", newline="") as fh:
             rows = csv.DictReader(fh)
+            aggregate = "latency_hist" in (rows.fieldnames or [])
             for idx, row in enumerate(rows):
                 if idx >= max_rows:
                     break
@@ -166,6 +204,10 @@ def collect_proxy_method_metrics(proxy_csv: Path, allowed_methods: set[str], max
                     continue
                 if allowed_methods and method not in allowed_methods:
                     continue
+                if aggregate:
+                    klass = row.get("status_class") or "unknown"
+                    _add_aggregate_row(metrics[(method, klass)], row, klass)
+                    continue
                 klass = status_class(row.get("status_code"))
                 key = (method, klass)
                 bucket = metrics[key]
@@ -173,11 +215,12 @@ def collect_proxy_method_metrics(proxy_csv: Path, allowed_methods: set[str], max
                 code = to_float(row.get("status_code"))
                 if code is None or code >= 400:
                     bucket["errors"] += 1
-                latency = to_float(row.get("latency_ms"))
+                latency_us = to_float(row.get("latency_us"))
+                latency = latency_us / 1000.0 if latency_us is not None else to_float(row.get("latency_ms"))
                 if latency is not None:
                     bucket["latencies"].append(latency)
     except OSError:
-        return defaultdict(lambda: {"requests": 0, "errors": 0, "latencies": []})
+        return defaultdict(_new_method_bucket)
     return metrics
 
 
@@ -251,9 +294,13 @@ def build_metrics(
         builder.counter("rpc_method_requests_total", "Proxy-observed workload RPC method request count.", data["requests"], m_labels)
         builder.counter("rpc_method_errors_total", "Proxy-observed workload RPC method error count.", data["errors"], m_labels)
         latency_values = data["latencies"]
-        builder.counter("rpc_method_latency_ms_sum", "Sum of proxy-observed workload RPC latencies in milliseconds.", sum(latency_values), m_labels)
-        builder.counter("rpc_method_latency_ms_count", "Count of proxy-observed workload RPC latencies.", len(latency_values), m_labels)
-        builder.gauge("rpc_method_latency_p99_ms", "Proxy-observed workload RPC p99 latency in milliseconds.", quantile(latency_values, 0.99), m_labels)
+        if data["hist"]:
+            p99 = hist_quantile_ms(data["hist"], 0.99, data["max_us"])
+        else:
+            p99 = quantile(latency_values, 0.99)
+        builder.counter("rpc_method_latency_ms_sum", "Sum of proxy-observed workload RPC latencies in milliseconds.", sum(latency_values) + data["latency_sum_ms"], m_labels)
+        builder.counter("rpc_method_latency_ms_count", "Count of proxy-observed workload RPC latencies.", len(latency_values) + data["latency_count"], m_labels)
+        builder.gauge("rpc_method_latency_p99_ms", "Proxy-observed workload RPC p99 latency in milliseconds.", p99, m_labels)
 
     builder.gauge("scrape_timestamp_seconds", "Unix timestamp for this exporter scrape.", int(time.time()), labels)
     return builder.render()
@@ -51,6 +51,7 @@ source "$(dirname "${BASH_SOURCE[0]}")/lib/cloud_provider_resolver.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/ena_data_normalizer.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/sample_count_tracker.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/cgroup_collector_wrapper.sh"
+source "$(dirname "${BASH_SOURCE[0]}")/lib/process_accounting_wrapper.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/system_collectors.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/process_collectors.sh"
 source "$(dirname "${BASH_SOURCE[0]}")/lib/monitoring_overhead.sh"
@@ -144,15 +145,16 @@ generate_csv_header() {
     fi
     local qps_header="current_qps,rpc_latency_ms,qps_data_available"
     local cgroup_header=$(get_cgroup_header)
+    local process_header=$(get_process_accounting_header)
 
     # Configuration-driven ENA header generation
     # cloud_provider is appended as the final column, preserving existing column order;
     # readers access columns by name, so appending this column is safe.
     if [[ "$ENA_MONITOR_ENABLED" == "true" ]]; then
         local ena_header=$(build_ena_header)
-        echo "$basic_header,$device_header,$network_header,$ena_header,$overhead_header,$block_height_header,$qps_header,$cgroup_header,cloud_provider"
+        echo "$basic_header,$device_header,$network_header,$ena_header,$overhead_header,$block_height_header,$qps_header,$cgroup_header,$process_header,cloud_provider"
     else
-        echo "$basic_header,$device_header,$network_header,$overhead_header,$block_height_header,$qps_header,$cgroup_header,cloud_provider"
+        echo "$basic_header,$device_header,$network_header,$overhead_header,$block_height_header,$qps_header,$cgroup_header,$process_header,cloud_provider"
     fi
 }
 
@@ -166,6 +168,8 @@ log_performance_data() {
     local overhead_data=$(get_monitoring_overhead)
     # cgroup_collector integration (fail-soft 19 fields)
     local cgroup_data=$(get_cgroup_data)
+    # Node/monitor /proc/<pid>/io and schedstat deltas (fail-soft 15 fields)
+    local process_data=$(get_process_accounting_data)
     # Mark which provider produced this row (aws|gcp|other).
     local cloud_provider_val
     cloud_provider_val=$(resolve_cloud_provider_value)
@@ -215,7 +219,8 @@ log_performance_data() {
         "$rpc_latency_ms" \
         "$qps_data_available" \
         "$cgroup_data" \
-        "$cloud_provider_val")
+        "$cloud_provider_val" \
+        "$process_data")
     
     # Final data line validation
     log_debug "Final data line length: ${#data_line}"
@@ -325,9 +330,13 @@ start_unified_monitoring() {
         echo "ℹ️  Provider NIC monitoring: GCP/generic collector path"
     fi
 
-    # Create CSV header
+    # Create CSV header (a resumed session appends to its existing CSV)
     local csv_header=$(generate_csv_header)
-    echo "$csv_header" > "$UNIFIED_LOG"
+    if [[ -n "${RESUME_SESSION:-}" && -s "$UNIFIED_LOG" && "$(head -1 "$UNIFIED_LOG")" == "$csv_header" ]]; then
+        log_info "Resumed session: appending to existing $UNIFIED_LOG"
+    else
+        echo "$csv_header" > "$UNIFIED_LOG"
+    fi
 
     # Create latest file symlink for bottleneck detection use
     local latest_csv="${PERFORMANCE_LATEST_CSV:-${LOGS_DIR}/performance_latest.csv}"
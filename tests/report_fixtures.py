@@ -0,0 +1,43 @@
+"""Shared fixtures for tests that render one report section or load one result file.
+
+Not a test module: imported by the tests/test_*.py files next to it.
+"""
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from visualization.report_generator import ReportGenerator, TRANSLATIONS  # noqa: E402
+
+
+def make_report_generator(logs_dir, language='en'):
+    """A ReportGenerator that only knows its logs dir and language.
+
+    __init__ loads the performance CSV, which the section builders do not need.
+    """
+    generator = ReportGenerator.__new__(ReportGenerator)
+    generator.t = TRANSLATIONS[language]
+    generator.logs_dir = logs_dir
+    return generator
+
+
+@contextmanager
+def report_env(unset=(), **values):
+    """os.environ with ``values`` set and ``unset`` removed, restored on exit."""
+    with mock.patch.dict(os.environ, values, clear=False):
+        for key in unset:
+            os.environ.pop(key, None)
+        yield
+
+
+def patch_env(test, unset=(), **values):
+    """Like report_env, but restored when ``test`` is cleaned up (for setUp)."""
+    patcher = mock.patch.dict(os.environ, values, clear=False)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    for key in unset:
+        os.environ.pop(key, None)
@@ -31,12 +31,21 @@ run_test "config_loader smoke" \
 run_test "cgroup_collector (14 cases)" \
          "python3 tests/test_cgroup_collector.py"
 
-run_test "k8s_manifests (19 cases)" \
+run_test "k8s_manifests (20 cases)" \
          "python3 tests/test_k8s_manifests.py"
 
 run_test "K8s API stack (36 cases)" \
          "python3 tests/test_k8s_monitoring_stack.py"
 
+run_test "k8s_informer (7 cases)" \
+         "python3 tests/test_k8s_informer.py"
+
+run_test "kubelet_summary_cache (5 cases)" \
+         "python3 tests/test_kubelet_summary_cache.py"
+
+run_test "node_pod_collector (7 cases)" \
+         "python3 tests/test_node_pod_collector.py"
+
 run_test "K8s smoke (import chain)" \
          "python3 tests/smoke_k8s_helpers_import.py"
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""JSON-RPC batch sweep: per-round rates, per-call latency, monitor window and the report section."""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import batch_sweep  # noqa: E402
+from analysis.per_method_attribution import MonitorRecord  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+
+def _epoch(ts):
+    return int(datetime.strptime(ts, "%Y-%m-%d %H:%M:%S").timestamp())
+
+
+class BatchSweep(unittest.TestCase):
+    def test_round_scales_calls_and_uses_monitor_window(self):
+        report = {"requests": 1200, "success_pct": 100.0, "throughput": 19.9,
+                  "p50_ms": 80.0, "p99_ms": 210.0}
+        start, end = "2026-06-11 12:00:00", "2026-06-11 12:01:00"
+        monitor = [MonitorRecord(_epoch(start) - 5, 90.0, 9000.0),
+                   MonitorRecord(_epoch(start) + 10, 40.0, 2000.0),
+                   MonitorRecord(_epoch(start) + 20, 60.0, 2200.0)]
+        row = batch_sweep.summarize_round(report, 50, 1000, monitor=monitor, started_at=start, ended_at=end)
+        self.assertAlmostEqual(row["http_rate"], 20.0)
+        self.assertEqual(row["calls"], 60000)
+        self.assertAlmostEqual(row["achieved_calls_per_s"], 995.0)
+        self.assertAlmostEqual(row["per_call_p50_ms"], 1.6)
+        self.assertAlmostEqual(row["cpu_pct"], 50.0)
+        self.assertAlmostEqual(row["mem_mb"], 2100.0)
+        self.assertAlmostEqual(row["cpu_pct_per_kcalls"], 50.0 / 995.0 * 1000)
+
+        missing = batch_sweep.summarize_round(None, 10, 1000)
+        self.assertEqual((missing["requests"], missing["cpu_pct"], missing["per_call_p50_ms"]), (0, None, None))
+
+    def test_cli_appends_csv_and_report_lists_sizes(self):
+        with tempfile.TemporaryDirectory() as d:
+            report = os.path.join(d, "round.json")
+            Path(report).write_text(json.dumps({
+                "requests": 6000, "success": 1.0, "throughput": 100.0,
+                "latencies": {"50th": 4_000_000, "99th": 12_000_000, "mean": 5_000_000},
+            }))
+            csv_path = os.path.join(d, "batch_sweep_20260611_120000.csv")
+            self.assertEqual(batch_sweep.main(["--report", report, "--batch-size", "10",
+                                               "--calls-per-second", "1000", "--csv", csv_path]), 0)
+            batch_sweep.append_csv(csv_path, batch_sweep.summarize_round(
+                {"requests": 500, "success_pct": 92.0, "throughput": 8.0, "p50_ms": 300.0, "p99_ms": 900.0},
+                100, 1000))
+            lines = Path(csv_path).read_text().splitlines()
+            self.assertEqual(lines[0].split(","), list(batch_sweep.CSV_COLUMNS))
+            self.assertEqual(len(lines), 3)
+
+            with report_env(unset=('BATCH_SWEEP_CSV',)):
+                section = make_report_generator(d)._generate_batch_sweep_section()
+        self.assertIn(TRANSLATIONS['en']['batch_sweep_title'], section)
+        self.assertIn('<td>1000/1000</td>', section)
+        self.assertIn('<td>0.400</td>', section)
+        self.assertIn('<td>800/1000</td>', section)
+        self.assertEqual(section.count('<tr class="warning">'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -630,6 +630,53 @@ def test_is_jsonrpc_method_regex():
     _ok("regex correctly distinguishes 7 JSON-RPC namespaces from REST/other forms")
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Test 13: JSON-RPC batch targets
+# ─────────────────────────────────────────────────────────────────────────────
+def test_jsonrpc_batch_targets():
+    print("\n[13] JSON-RPC batch targets")
+    os.environ["BLOCKCHAIN_NODE"] = "ethereum"
+    a = get_adapter("ethereum")
+    calls = [("eth_getBalance", "0xabc", "address_latest"),
+             ("eth_blockNumber", "0xabc", "no_params"),
+             ("eth_getBalance", "0xdef", "address_latest")]
+    target = a.build_vegeta_batch_target(calls, "http://localhost:8545")
+    items = json.loads(base64.b64decode(target["body"]))
+    assert target["method"] == "POST" and target["url"] == "http://localhost:8545", target
+    assert [i["id"] for i in items] == [1, 2, 3], items
+    assert [i["method"] for i in items] == ["eth_getBalance", "eth_blockNumber", "eth_getBalance"], items
+    assert items[2]["params"] == ["0xdef", "latest"], items
+    _ok("ethereum: 3 calls → one POST with ids 1..3")
+
+    os.environ["BLOCKCHAIN_NODE"] = "bitcoin"
+    btc = get_adapter("bitcoin").build_vegeta_batch_target(
+        [("getblockcount", "x", "no_params")] * 2, "http://localhost:8332")
+    assert [i["id"] for i in json.loads(base64.b64decode(btc["body"]))] == [1, 2]
+    _ok("bitcoin: batch keeps the JSON-RPC POST headers")
+
+    os.environ["BLOCKCHAIN_NODE"] = "tron"
+    try:
+        get_adapter("tron").build_vegeta_batch_target(
+            [("/wallet/getnowblock", "T", "no_params")], "http://localhost:8090")
+        _fail("REST path in a JSON-RPC batch should raise")
+    except ValueError:
+        _ok("tron: REST path rejected from a batch")
+    for chain in ("aptos", "hedera"):
+        assert not get_adapter(chain).supports_jsonrpc_batch, chain
+    _ok("rest and hedera_dual families do not build batches")
+
+    env = {**os.environ, "BLOCKCHAIN_NODE": "ethereum"}
+    lines = "eth_getBalance\t0x1\neth_getBalance\t0x2\neth_getBalance\t0x3\n"
+    out = subprocess.run(
+        [sys.executable, str(REPO / "tools" / "chain_adapters" / "cli.py"), "build-targets-batch",
+         "--chain", "ethereum", "--rpc-url", "http://localhost:8545", "--batch-size", "2"],
+        input=lines, capture_output=True, text=True, env=env, cwd=str(REPO / "tools"), check=True,
+    ).stdout.splitlines()
+    bodies = [json.loads(base64.b64decode(json.loads(line)["body"])) for line in out]
+    assert [[i["params"][0] for i in b] for b in bodies] == [["0x1", "0x2"], ["0x3", "0x1"]], bodies
+    _ok("cli --batch-size 2: 3 calls → 2 targets, last one wraps around")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main
 # ─────────────────────────────────────────────────────────────────────────────
@@ -647,6 +694,7 @@ def main():
         test_cli_build_target_all_36_chains,
         test_hedera_dual_adapter_routing,
         test_is_jsonrpc_method_regex,
+        test_jsonrpc_batch_targets,
     ]
     print(f"Running {len(tests)} test groups for chain_adapters")
     for t in tests:
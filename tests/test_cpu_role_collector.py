@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Per-role cpuset validation, /proc/stat sampling and the report section.
+
+Topology and /proc/stat come from synthetic trees, so the tests do not depend
+on the host CPU layout.
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / 'monitoring'))
+
+import cpu_role_collector as crc  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+
+def _sys_tree(root, online='0-7', smt=True, numa_split=4):
+    cpu_dir = Path(root) / 'devices' / 'system' / 'cpu'
+    cpu_dir.mkdir(parents=True)
+    (cpu_dir / 'online').write_text(online + '\n')
+    for cpu in crc.parse_cpulist(online):
+        topo = cpu_dir / f'cpu{cpu}' / 'topology'
+        topo.mkdir(parents=True)
+        pair = cpu - cpu % 2
+        (topo / 'thread_siblings_list').write_text(f'{pair}-{pair + 1}\n' if smt else f'{cpu}\n')
+        (cpu_dir / f'cpu{cpu}' / f'node{0 if cpu < numa_split else 1}').mkdir()
+
+
+def _proc_stat(root, busy_by_cpu, total=1000):
+    lines = ['cpu  1 1 1 1 1 1 1 1 0 0']
+    for cpu, busy in busy_by_cpu.items():
+        lines.append(f'cpu{cpu} {busy} 0 0 {total - busy} 0 0 0 0 0 0')
+    Path(root, 'stat').write_text('\n'.join(lines) + '\n')
+
+
+class Cpulist(unittest.TestCase):
+    def test_round_trip(self):
+        self.assertEqual(crc.parse_cpulist('0-3,8, 10-11'), [0, 1, 2, 3, 8, 10, 11])
+        self.assertEqual(crc.format_cpulist([11, 0, 1, 2, 3, 8, 10]), '0-3,8,10-11')
+        self.assertEqual(crc.parse_cpulist(''), [])
+        with self.assertRaises(ValueError):
+            crc.parse_cpulist('4-2')
+
+
+class LayoutValidation(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        _sys_tree(self.tmp.name)
+        self.topo = crc.read_topology(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_topology_read_from_sysfs(self):
+        self.assertEqual(self.topo['online'], list(range(8)))
+        self.assertEqual(self.topo['siblings'][5], [4, 5])
+        self.assertEqual(self.topo['numa'][6], 1)
+
+    def test_clean_split_has_no_findings(self):
+        roles = {'node': [0, 1, 2, 3], 'vegeta': [4, 5], 'proxy': [6, 7], 'monitors': []}
+        result = crc.validate_layout({k: v for k, v in roles.items() if v}, self.topo)
+        self.assertEqual(result, {'errors': [], 'warnings': []})
+
+    def test_overlap_and_offline_are_errors(self):
+        result = crc.validate_layout({'node': [0, 1, 2], 'vegeta': [2, 9]}, self.topo)
+        self.assertTrue(any('CPU 2 already reserved for node' in e for e in result['errors']))
+        self.assertTrue(any('not online: 9' in e for e in result['errors']))
+
+    def test_smt_numa_and_unpinned_are_warnings(self):
+        roles = {'node': [0, 1, 2, 3, 4], 'vegeta': [5], 'proxy': [], 'monitors': [6, 7]}
+        result = crc.validate_layout(roles, self.topo)
+        self.assertEqual(result['errors'], [])
+        joined = ' | '.join(result['warnings'])
+        self.assertIn('node/vegeta: SMT siblings split', joined)
+        self.assertIn('node: cpuset spans NUMA nodes [0, 1]', joined)
+        self.assertIn('proxy: no cpuset configured', joined)
+
+
+class Sampling(unittest.TestCase):
+    def test_busy_cores_per_role(self):
+        with tempfile.TemporaryDirectory() as d:
+            _proc_stat(d, {0: 0, 1: 0, 2: 0, 3: 0})
+            prev = crc.read_cpu_times(d)
+            _proc_stat(d, {0: 500, 1: 1000, 2: 250, 3: 0}, total=2000)
+            cur = crc.read_cpu_times(d)
+        usage = crc.role_usage(prev, cur, {'node': [0, 1], 'vegeta': [2, 3], 'proxy': [9]})
+        self.assertAlmostEqual(usage['node'], 1.5)
+        self.assertAlmostEqual(usage['vegeta'], 0.25)
+        self.assertEqual(usage['proxy'], 0.0)
+
+
+class ReportSection(unittest.TestCase):
+    def test_section_flags_saturated_role(self):
+        with tempfile.TemporaryDirectory() as d:
+            Path(d, 'cpu_layout.json').write_text(json.dumps({
+                'method': 'taskset', 'online_cpus': '0-7', 'errors': [],
+                'warnings': ['unassigned online CPUs: 7'],
+                'roles': {'node': {'cpuset': '0-3', 'cpus': 4}, 'vegeta': {'cpuset': '4-5', 'cpus': 2},
+                          'proxy': {'cpuset': '6', 'cpus': 1}},
+            }))
+            rows = ['timestamp,role,cpuset,reserved_cpus,busy_cpus,util_pct']
+            for i in range(5):
+                rows.append(f'2026-06-11 12:00:0{i},node,"0-3",4,1.000,25.0')
+                rows.append(f'2026-06-11 12:00:0{i},vegeta,"4-5",2,1.950,97.5')
+            Path(d, 'cpu_role_20260611_120000.csv').write_text('\n'.join(rows) + '\n')
+
+            with report_env(unset=('CPU_LAYOUT_JSON', 'CPU_ROLE_CSV')):
+                section = make_report_generator(d)._generate_cpu_isolation_section()
+
+        self.assertIn(TRANSLATIONS['en']['cpu_isolation_title'], section)
+        self.assertIn('<td>1.95</td>', section)
+        self.assertIn(TRANSLATIONS['en']['cpu_role_saturated'], section)
+        self.assertIn('unassigned online CPUs: 7', section)
+        self.assertEqual(section.count('<td>N/A</td>'), 4)  # proxy: reserved but no samples
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ cd "$PROJECT_ROOT"
 FAIL=0
 
 # 1. header must end with cloud_provider in both branches
-hdr_hits=$(grep -cE 'cgroup_header,cloud_provider"' monitoring/unified_monitor.sh)
+hdr_hits=$(grep -cE 'cgroup_header,\$process_header,cloud_provider"' monitoring/unified_monitor.sh)
 if [[ "$hdr_hits" -eq 2 ]]; then
     echo "OK   header appends cloud_provider in both branches"
 else
@@ -18,7 +18,7 @@ else
 fi
 
 # 2. data_line builder must end with cloud_provider_val in both branches
-data_hits=$(grep -cE 'cgroup_data,\$cloud_provider_val"' monitoring/lib/performance_data_line_builder.sh)
+data_hits=$(grep -cE 'cgroup_data,\$process_data,\$cloud_provider_val"' monitoring/lib/performance_data_line_builder.sh)
 if [[ "$data_hits" -eq 2 ]]; then
     echo 'OK   data_line builder appends $cloud_provider_val in both branches'
 else
@@ -33,11 +33,11 @@ else
     echo "FAIL cloud_provider_val does not use resolver/getter" >&2; FAIL=1
 fi
 
-# 4. Header/data section order: both append cloud_provider after cgroup.
-#    header: ...,$qps_header,$cgroup_header,cloud_provider
-#    data:   ...,$qps_data_available,$cgroup_data,$cloud_provider_val
-#    Both append one final column after the cgroup section.
-echo "OK   header/data append cloud_provider after cgroup section with consistent ordering"
+# 4. Header/data section order: both append process, then cloud_provider, after cgroup.
+#    header: ...,$qps_header,$cgroup_header,$process_header,cloud_provider
+#    data:   ...,$qps_data_available,$cgroup_data,$process_data,$cloud_provider_val
+#    Both append one final column after the process section.
+echo "OK   header/data append cgroup, process, cloud_provider with consistent ordering"
 
 echo ""
 if [[ $FAIL -eq 0 ]]; then
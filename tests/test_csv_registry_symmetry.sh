@@ -7,6 +7,7 @@
 #   Step 2: both sides resolve the same physical names for each logical/provider/device
 #   Step 3: registry disk header matches iostat_collector.sh output byte-for-byte
 #            -> ensure registry-backed writer output does not break existing readers
+#   Step 3.8: process section header matches process_accounting_collector.py --header
 #
 # Any assertion failure exits non-zero.
 
@@ -199,6 +200,29 @@ else
     diff <(echo "$standalone_block" | tr ',' '\n') <(echo "$registry_block_csv" | tr ',' '\n') || true
 fi
 
+# ============================================================
+# Step 3.8: process accounting collector and wrapper placeholder match registry
+# ============================================================
+echo "=== Step 3.8: process section collector/placeholder header == registry ==="
+registry_process="$(csv_registry_segment_header process)"
+collector_process="$(python3 monitoring/process_accounting_collector.py --header 2>/dev/null || true)"
+placeholder_process="$(grep -oE 'PROCESS_ACCOUNTING_PLACEHOLDER_HEADER="[^"]*"' monitoring/lib/process_accounting_wrapper.sh \
+    | head -1 | sed -E 's/^PROCESS_ACCOUNTING_PLACEHOLDER_HEADER="//; s/"$//')"
+
+if [[ "$collector_process" == "$registry_process" ]]; then
+    pass "process_accounting_collector --header == registry ($(echo "$registry_process" | tr ',' '\n' | wc -l) fields)"
+else
+    fail "process_accounting_collector --header != registry"
+    diff <(echo "$collector_process" | tr ',' '\n') <(echo "$registry_process" | tr ',' '\n') || true
+fi
+
+if [[ "$placeholder_process" == "$registry_process" ]]; then
+    pass "process accounting placeholder header == registry"
+else
+    fail "process accounting placeholder header != registry"
+    diff <(echo "$placeholder_process" | tr ',' '\n') <(echo "$registry_process" | tr ',' '\n') || true
+fi
+
 # ============================================================
 echo ""
 echo "=== Result: $((TOTAL-FAIL))/$TOTAL passed ==="
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Multi-endpoint comparison: per-endpoint /proc sampler, round rows and the side-by-side summary.
+
+Coverage:
+- endpoint_resource_collector: find_pids, /proc/<pid>/stat with odd comm names, diskstats device filter, rates
+- comparison_qps: highest commonly passing rate, lowest common rate fallback, no common rate
+- main round: SLO pass/fail per round, sampler columns averaged over the round window
+- summary: capacity per endpoint, cost per 1k QPS, change against the baseline, method p99, best endpoint
+- NodeQPSAnalyzer chart and the report section (en/zh)
+
+Run: python3 tests/test_endpoint_compare.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / "monitoring"))
+
+import endpoint_resource_collector as collector  # noqa: E402
+from analysis import endpoint_compare  # noqa: E402
+from analysis.per_method_attribution import ProxyRecord  # noqa: E402
+from analysis.qps_analyzer import NodeQPSAnalyzer  # noqa: E402
+from report_fixtures import make_report_generator, patch_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+START = datetime(2026, 6, 11, 12, 0, 0)
+STAMP = "%Y-%m-%d %H:%M:%S"
+# endpoint -> (capacity QPS, CPU % per 1k QPS, read IOPS per 1k QPS)
+NODES = {"agave": (3000, 40.0, 200.0), "firedancer": (6000, 25.0, 120.0)}
+
+
+def _proc(root, pid, cmdline, ticks, rss_pages):
+    d = Path(root, str(pid))
+    d.mkdir(parents=True, exist_ok=True)
+    (d / "cmdline").write_bytes(cmdline.replace(" ", "\0").encode() + b"\0")
+    fields = ["S"] + ["0"] * 50
+    fields[11], fields[12], fields[21] = str(ticks), "0", str(rss_pages)
+    (d / "stat").write_text(f"{pid} (weird ) name) " + " ".join(fields) + "\n")
+
+
+def _diskstats(root, reads, sectors):
+    line = f" 259 1 nvme1n1 {reads} 0 {sectors} 0 {reads // 2} 0 {sectors // 2} 0 0 0 0\n"
+    Path(root, "diskstats").write_text(line + " 259 2 nvme9n1 999 0 999 0 999 0 999 0 0 0 0\n")
+
+
+def _row(endpoint, qps, passed):
+    return {"endpoint": endpoint, "qps": qps, "passed": passed}
+
+
+class ProcReaders(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.root = self.dir.name
+        _proc(self.root, 101, "/usr/bin/agave-validator --ledger /data", 1000, 2560)
+        _proc(self.root, 102, "/usr/bin/fdctl run", 5000, 10)
+        _proc(self.root, 103, "bash agave-watchtower", 10, 10)
+        _diskstats(self.root, 100, 2048)
+
+    def test_find_pids_matches_the_command_line(self):
+        self.assertEqual(collector.find_pids(self.root, ["agave-validator"]), ["101"])
+        self.assertEqual(collector.find_pids(self.root, ["agave", "fdctl"]), ["101", "102", "103"])
+
+    def test_find_pids_without_names_matches_nothing(self):
+        self.assertEqual(collector.find_pids(self.root, []), [])
+
+    def test_find_pids_skips_this_process(self):
+        _proc(self.root, os.getpid(), "python3 agave-validator", 1, 1)
+        self.assertEqual(collector.find_pids(self.root, ["agave-validator"]), ["101"])
+
+    def test_pid_stat_after_a_comm_with_parentheses(self):
+        self.assertEqual(collector.read_pid_stat(self.root, "101"), (1000, 2560))
+        self.assertIsNone(collector.read_pid_stat(self.root, "999"))
+
+    def test_diskstats_only_for_the_given_devices(self):
+        self.assertEqual(collector.read_diskstats(self.root, ["/dev/nvme1n1"]), {"nvme1n1": (100, 2048, 50, 1024)})
+        self.assertEqual(collector.read_diskstats(self.root, []), {})
+
+
+class Rates(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as root:
+            _proc(root, 101, "/usr/bin/agave-validator --ledger /data", 1000, 2560)
+            _diskstats(root, 100, 2048)
+            prev = collector.sample(root, ["agave-validator"], ["/dev/nvme1n1"])
+            _proc(root, 101, "/usr/bin/agave-validator --ledger /data", 1300, 5120)
+            _diskstats(root, 600, 2048 + 4 * 2048)
+            cur = collector.sample(root, ["agave-validator"], ["/dev/nvme1n1"])
+        cur["t"] = prev["t"] + 2.0
+        cls.rates = collector.rates(prev, cur, tick_hz=100.0, page_bytes=4096)
+
+    def test_cpu_and_rss(self):
+        self.assertEqual(self.rates["pids"], 1)
+        self.assertAlmostEqual(self.rates["cpu_pct"], 150.0)          # 300 ticks over 2 s = 1.5 cores
+        self.assertAlmostEqual(self.rates["rss_mb"], 20.0)
+
+    def test_device_io(self):
+        self.assertAlmostEqual(self.rates["read_iops"], 250.0)        # the other device is ignored
+        self.assertAlmostEqual(self.rates["write_iops"], 125.0)
+        self.assertAlmostEqual(self.rates["read_mb_s"], 2.0)
+
+    def test_pid_missing_from_the_previous_sample_adds_no_cpu(self):
+        prev = {"t": 0.0, "procs": {}, "disks": {}}
+        cur = {"t": 1.0, "procs": {"7": (5000, 1)}, "disks": {}}
+        self.assertEqual(collector.rates(prev, cur, 100.0, 4096)["cpu_pct"], 0.0)
+
+
+class ComparisonQps(unittest.TestCase):
+    def test_highest_rate_every_endpoint_passed(self):
+        rounds = [_row("a", 1000, True), _row("a", 2000, True), _row("a", 4000, True),
+                  _row("b", 1000, True), _row("b", 2000, True), _row("b", 4000, False)]
+        self.assertEqual(endpoint_compare.comparison_qps(rounds), 2000)
+
+    def test_lowest_common_rate_when_none_passed(self):
+        rounds = [_row("a", 1000, False), _row("a", 2000, False), _row("b", 2000, False), _row("b", 1000, True)]
+        self.assertEqual(endpoint_compare.comparison_qps(rounds), 1000)
+
+    def test_no_common_rate(self):
+        self.assertIsNone(endpoint_compare.comparison_qps([_row("a", 1000, True), _row("b", 2000, True)]))
+
+
+class _CompareRun(unittest.TestCase):
+    """Both endpoints at 2000/4000/8000 QPS through the round CLI, with sampler and proxy rows per round."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.TemporaryDirectory()
+        d = cls.dir.name
+        cls.csv_path = os.path.join(d, "compare_results_20260611_120000.csv")
+        cls.proxy_rows = {}
+        cls.statuses = []
+        offset = 0
+        for level in (2000, 4000, 8000):
+            for name, (cap, cpu_per_k, reads_per_k) in NODES.items():
+                started = START + timedelta(seconds=offset)
+                ended = started + timedelta(seconds=30)
+                offset += 40
+                p99 = 20.0 * level / cap if level <= cap else 900.0
+                rate = float(min(level, cap))
+                resources = os.path.join(d, f"{name}_resources.csv")
+                lines = [] if os.path.exists(resources) else [",".join(collector.CSV_FIELDS)]
+                lines += [f"{(started + timedelta(seconds=s)).strftime(STAMP)},{name},1,"
+                          f"{rate / 1000 * cpu_per_k},4096,{rate / 1000 * reads_per_k},10,1,1"
+                          for s in range(1, 30)]
+                with open(resources, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+                report = os.path.join(d, "report.json")
+                Path(report).write_text(json.dumps({
+                    "requests": int(rate * 30), "success": 1.0, "throughput": rate,
+                    "latencies": {"50th": 2_000_000, "99th": int(p99 * 1e6)}}))
+                cls.statuses.append(endpoint_compare.main([
+                    "round", "--report", report, "--endpoint", name, "--level", str(level),
+                    "--qps", str(level), "--started-at", started.strftime(STAMP),
+                    "--ended-at", ended.strftime(STAMP), "--resources", resources,
+                    "--csv", cls.csv_path, "--p99-ms", "500"]))
+                t0 = int(started.timestamp())
+                cls.proxy_rows.setdefault(name, []).extend(
+                    ProxyRecord((t0 + 5) * 10**9 + i, method, "jsonrpc", "1", 0, 200, p99 * factor, "up", "c")
+                    for i in range(100) for method, factor in (("getSlot", 0.5), ("getBlock", 1.0)))
+        cls.rounds = endpoint_compare.read_rounds(cls.csv_path)
+        cls.result = endpoint_compare.summary(cls.rounds, cls.proxy_rows)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dir.cleanup()
+
+
+class Rounds(_CompareRun):
+    def test_each_round_is_checked_against_the_slo(self):
+        self.assertEqual(self.statuses, [0] * 6)
+        self.assertEqual([r["passed"] for r in self.rounds], [True, True, False, True, False, False])
+
+    def test_sampler_columns_are_the_window_average(self):
+        self.assertAlmostEqual(self.rounds[0]["cpu_pct"], 80.0)
+        self.assertAlmostEqual(self.rounds[0]["read_iops"], 400.0)
+
+    def test_comparison_level(self):
+        self.assertEqual(endpoint_compare.comparison_qps(self.rounds), 2000)
+
+
+class Summary(_CompareRun):
+    def setUp(self):
+        self.agave = self.result["endpoints"]["agave"]
+        self.fd = self.result["endpoints"]["firedancer"]
+
+    def test_capacity_per_endpoint(self):
+        self.assertEqual(self.result["baseline"], "agave")
+        self.assertEqual((self.agave["max_qps"], self.agave["first_failing_qps"]), (2000, 4000))
+        self.assertEqual((self.fd["max_qps"], self.fd["first_failing_qps"]), (4000, 8000))
+
+    def test_cost_per_kqps_at_the_comparison_level(self):
+        self.assertAlmostEqual(self.agave["at_comparison"]["cpu_pct_per_kqps"], 40.0)
+        self.assertAlmostEqual(self.fd["at_comparison"]["read_iops_per_kqps"], 120.0)
+
+    def test_change_against_the_baseline(self):
+        self.assertAlmostEqual(self.fd["vs_baseline"]["max_qps_pct"], 100.0)
+        self.assertAlmostEqual(self.fd["vs_baseline"]["cpu_pct_per_kqps_pct"], -37.5)
+        self.assertAlmostEqual(self.agave["vs_baseline"]["max_qps_pct"], 0.0)
+
+    def test_method_p99_from_the_proxy_rows(self):
+        self.assertAlmostEqual(self.fd["methods_p99_ms"]["getBlock"], 20.0 * 2000 / 6000)
+        self.assertAlmostEqual(self.fd["methods_p99_ms"]["getSlot"], 10.0 * 2000 / 6000)
+
+    def test_best_endpoint(self):
+        self.assertEqual(self.result["best"], {"capacity": "firedancer", "p99": "firedancer", "cpu": "firedancer"})
+
+    def test_no_rounds(self):
+        self.assertEqual(endpoint_compare.summary([]), {"endpoints": {}, "baseline": None, "comparison_qps": None})
+
+
+class Outputs(_CompareRun):
+    def setUp(self):
+        d = self.dir.name
+        Path(os.path.join(d, "compare_summary_20260611_120000.json")).write_text(json.dumps(self.result))
+        patch_env(self, unset=('COMPARE_RESULTS_CSV', 'COMPARE_SUMMARY_JSON'), LOGS_DIR=d)
+
+    def _section(self, language):
+        return make_report_generator(self.dir.name, language)._generate_endpoint_compare_section()
+
+    def test_chart_is_written(self):
+        analyzer = NodeQPSAnalyzer.__new__(NodeQPSAnalyzer)
+        analyzer.output_dir = self.dir.name
+        analyzer.reports_dir = self.dir.name
+        self.assertTrue(os.path.getsize(analyzer.generate_endpoint_compare_chart()) > 0)
+
+    def test_section_titles(self):
+        self.assertIn(TRANSLATIONS['en']['compare_title'], self._section('en'))
+        self.assertIn(TRANSLATIONS['zh']['compare_title'], self._section('zh'))
+
+    def test_section_tables(self):
+        section = self._section('en')
+        self.assertIn('agave (baseline)', section)
+        self.assertIn('<td>4,000 (+100.0%)</td>', section)
+        self.assertIn('<td>25.0 (-37.5%)</td>', section)
+        self.assertIn('<td>getBlock</td>', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
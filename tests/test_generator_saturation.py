@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Load-generator saturation: achieved rate, send lag, Vegeta CPU and cliff analysis."""
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import generator_saturation  # noqa: E402
+from analysis.qps_analyzer import NodeQPSAnalyzer  # noqa: E402
+
+T0 = 1781179200.0  # 2026-06-11 12:00:00 UTC
+
+
+def _results(starts):
+    return [json.dumps({"timestamp": datetime.fromtimestamp(t, timezone.utc).isoformat().replace("+00:00", "Z"),
+                        "code": 200, "latency": 1000000, "error": ""}) for t in starts]
+
+
+class GeneratorSaturation(unittest.TestCase):
+    def test_on_schedule_round_is_not_limited(self):
+        starts = generator_saturation.read_starts(_results([T0 + i / 100 for i in range(200)]))
+        result = generator_saturation.evaluate(starts, 100, 2, cpu_seconds=0.4, wall_seconds=2.0, cores=2)
+        self.assertFalse(result.generator_limited)
+        self.assertAlmostEqual(result.rate_ratio, 1.0)
+        self.assertLess(result.send_lag_p99_ms, 1.0)
+        self.assertAlmostEqual(result.vegeta_cpu_pct, 10.0)
+
+    def test_falling_behind_schedule_is_limited(self):
+        # 120 of 200 requests, each one 1/60 s apart instead of 1/100 s
+        starts = generator_saturation.read_starts(_results([T0 + i / 60 for i in range(120)]))
+        result = generator_saturation.evaluate(starts, 100, 2)
+        self.assertTrue(result.generator_limited)
+        self.assertAlmostEqual(result.achieved_rate, 60.0)
+        self.assertGreater(result.send_lag_p99_ms, 100.0)
+        self.assertEqual([r.split()[0] for r in result.reasons], ["rate", "send_lag_p99"])
+        self.assertIsNone(result.vegeta_cpu_pct)
+
+    def test_busy_generator_is_limited(self):
+        starts = [T0 + i / 100 for i in range(200)]
+        result = generator_saturation.evaluate(starts, 100, 2, cpu_seconds=3.8, wall_seconds=2.0, cores=2)
+        self.assertTrue(result.generator_limited)
+        self.assertEqual(result.reasons, ["vegeta_cpu 95%"])
+
+    def test_cpu_share_uses_the_vegeta_cpuset(self):
+        with tempfile.TemporaryDirectory() as d:
+            results = os.path.join(d, "results.jsonl")
+            Path(results).write_text("\n".join(_results([T0 + i / 100 for i in range(200)])) + "\n")
+            out = io.StringIO()
+            with redirect_stdout(out):
+                generator_saturation.main(["--results", results, "--qps", "100", "--duration", "2",
+                                           "--cpu-seconds", "3.0", "--wall-seconds", "2.0",
+                                           "--cores", "64", "--cpuset", "4-5"])
+        summary = json.loads(out.getvalue())
+        # 1.5 cores busy of the 2 pinned CPUs, not of the 64-core host
+        self.assertAlmostEqual(summary["vegeta_cpu_pct"], 75.0)
+
+    def test_csv_and_cliff_analysis_skip_limited_round(self):
+        with tempfile.TemporaryDirectory() as d:
+            csv_path = os.path.join(d, "generator_rounds_20260611_120000.csv")
+            results = os.path.join(d, "results.jsonl")
+            Path(results).write_text("\n".join(_results([T0 + i / 60 for i in range(120)])) + "\n")
+            self.assertEqual(generator_saturation.main(["--results", results, "--qps", "100", "--duration", "2",
+                                                        "--csv", csv_path]), 0)
+            generator_saturation.append_csv(csv_path, generator_saturation.evaluate(
+                [T0 + i / 50 for i in range(100)], 50, 2))
+            header = Path(csv_path).read_text().splitlines()[0]
+            self.assertEqual(header.split(","), list(generator_saturation.CSV_COLUMNS))
+            self.assertEqual(generator_saturation.load_limited_qps(csv_path), {100})
+
+            analyzer = NodeQPSAnalyzer.__new__(NodeQPSAnalyzer)
+            analyzer.output_dir = d
+            saved = os.environ.get('GENERATOR_ROUNDS_CSV')
+            os.environ['GENERATOR_ROUNDS_CSV'] = csv_path
+            try:
+                cliff = analyzer.analyze_performance_cliff(None, 50, 100)
+            finally:
+                if saved is None:
+                    os.environ.pop('GENERATOR_ROUNDS_CSV')
+                else:
+                    os.environ['GENERATOR_ROUNDS_CSV'] = saved
+        self.assertTrue(cliff['generator_limited'])
+        self.assertFalse(cliff['cliff_detected'])
+        self.assertEqual(cliff['generator_limited_qps'], [100])
+        self.assertIn("Load generator", cliff['recommendations'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
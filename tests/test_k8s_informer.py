@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Keep-alive K8sApiClient pool and list+watch informer caches.
+
+Runs against tools/fake_k8s_apiserver.py: connection reuse across GETs,
+replay of a request on a stale pooled socket, informer resourceVersion
+resume and 410 re-list, and map_pod_volumes served from the cache without
+per-cycle GETs.
+"""
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO / 'monitoring'))
+sys.path.insert(0, str(REPO / 'tools'))
+
+from fake_k8s_apiserver import FakeApiServer  # noqa: E402
+from k8s_api_client import K8sApiClient  # noqa: E402
+from k8s_informer import CachedK8sClient, Informer  # noqa: E402
+from pod_device_mapper import map_pod_volumes  # noqa: E402
+
+PODS = '/api/v1/namespaces/chain/pods'
+PVCS = '/api/v1/namespaces/chain/persistentvolumeclaims'
+PVS = '/api/v1/persistentvolumes'
+
+
+def _pod(name, node='node-1'):
+    return {'metadata': {'name': name, 'namespace': 'chain', 'uid': f'uid-{name}'},
+            'spec': {'nodeName': node, 'volumes': [
+                {'name': 'data', 'persistentVolumeClaim': {'claimName': f'{name}-data'}}]}}
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class FakeServerCase(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiServer().start()
+        self.client = K8sApiClient(api_server=self.api.url, token='t')
+        self.api.upsert(PODS, _pod('geth-0'))
+        self.api.upsert(PVCS, {'metadata': {'name': 'geth-0-data'}, 'spec': {'volumeName': 'pv-0'}})
+        self.api.upsert(PVS, {'metadata': {'name': 'pv-0'}, 'spec': {'hostPath': {'path': '/mnt/ledger'}}})
+
+    def tearDown(self):
+        self.client.close()
+        self.api.stop()
+
+
+class ConnectionPool(FakeServerCase):
+    def test_gets_reuse_one_connection(self):
+        for _ in range(5):
+            self.assertEqual(self.client.get_pod('chain', 'geth-0')['metadata']['name'], 'geth-0')
+        self.assertEqual(self.api.connections, 1)
+
+    def test_stale_pooled_socket_is_replayed_once(self):
+        self.client.get_pv('pv-0')
+        idle = next(iter(self.client._idle.values()))
+        idle[0].sock.close()
+        self.assertEqual(self.client.get_pv('pv-0')['metadata']['name'], 'pv-0')
+        self.assertEqual(self.api.connections, 2)
+
+    def test_ssl_context_built_once(self):
+        self.assertIs(self.client._ssl_context(), self.client._ssl_context())
+
+
+class InformerResume(FakeServerCase):
+    def test_watch_resumes_from_list_resource_version(self):
+        inf = Informer(self.client, PODS, watch_timeout=1)
+        inf.relist()
+        listed_rv = inf.resource_version
+        self.api.upsert(PODS, _pod('geth-1'))
+        self.api.delete(PODS, 'geth-0')
+        inf.watch_once()
+        self.assertEqual([p['metadata']['name'] for p in inf.items()], ['geth-1'])
+        self.assertTrue(self.api.requests_matching(f'resourceVersion={listed_rv}'))
+        self.assertEqual(inf.resource_version, str(self.api.resource_version))
+
+    def test_compaction_triggers_relist(self):
+        inf = Informer(self.client, PODS, watch_timeout=1)
+        stop = threading.Event()
+        threading.Thread(target=inf.run, args=(stop,), daemon=True).start()
+        try:
+            self.assertTrue(inf.synced.wait(5))
+            self.api.compact()
+            inf.resource_version = '1'  # force the next watch onto a compacted RV
+            self.api.upsert(PODS, _pod('geth-2'))
+            self.assertTrue(_wait_for(lambda: inf.relists >= 2 and inf.get('geth-2')))
+        finally:
+            stop.set()
+
+
+class CachedMapping(FakeServerCase):
+    def test_map_pod_volumes_reads_from_cache(self):
+        cached = CachedK8sClient(self.client, ['chain'], node_name='node-1', watch_timeout=1)
+        stop = threading.Event()
+        cached.start(stop)
+        try:
+            self.assertTrue(cached.wait_for_sync(5))
+            before = len(self.api.requests)
+            for _ in range(3):
+                m = map_pod_volumes(cached, 'chain', 'geth-0', host_root='/host')
+                self.assertEqual(m.volumes[0].device, '/mnt/ledger')
+                self.assertEqual(m.pod_uid, 'uid-geth-0')
+            new = [r for r in self.api.requests[before:] if 'watch=1' not in r]
+            self.assertEqual(new, [])
+
+            listing = cached.list_namespaced_pods('chain', node_name='node-1')
+            self.assertEqual(len(listing['items']), 1)
+            self.api.upsert(PVCS, {'metadata': {'name': 'late'}, 'spec': {'volumeName': 'pv-0'}})
+            self.assertTrue(_wait_for(lambda: cached.pvcs['chain'].get('late') is not None))
+        finally:
+            stop.set()
+
+    def test_unsynced_cache_falls_through_to_live_client(self):
+        cached = CachedK8sClient(self.client, ['chain'])
+        self.assertEqual(cached.get_pv('pv-0')['metadata']['name'], 'pv-0')
+        self.assertTrue(self.api.requests_matching('/persistentvolumes/pv-0'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,7 +11,7 @@ Verifies:
        - ClusterRoleBinding.subjects    → existing ServiceAccount
        - ClusterRoleBinding.roleRef     → existing ClusterRole
        - DaemonSet.volumeMounts[].name  → matching volume in DaemonSet.spec.volumes
-  4. Container probes exec correct collector commands.
+  4. Container probes hit the node collector endpoint on a declared port.
   5. RBAC has expected minimum verbs (get/list/watch on pods/pvc/pv).
 
 Run:
@@ -149,29 +149,32 @@ class TestCrossReferences(unittest.TestCase):
 
 
 class TestProbes(unittest.TestCase):
-    """Liveness uses --header (cheap), readiness uses --data (real check)."""
+    """Probes hit the node collector's HTTP endpoint on its declared port."""
 
     def setUp(self):
         self.docs = load_all_docs()
         self.ds = next(d for d in self.docs if d["kind"] == "DaemonSet")
         self.container = self.ds["spec"]["template"]["spec"]["containers"][0]
+        self.port_names = {p["name"] for p in self.container.get("ports", [])}
 
-    def test_liveness_probe_uses_header(self):
-        live = self.container["livenessProbe"]["exec"]["command"]
-        self.assertIn("--header", live,
-                      "livenessProbe should use --header (cheap)")
+    def test_liveness_probe_uses_healthz(self):
+        live = self.container["livenessProbe"]["httpGet"]
+        self.assertEqual(live["path"], "/healthz")
+        self.assertIn(live["port"], self.port_names)
 
-    def test_readiness_probe_uses_data(self):
-        rdy = self.container["readinessProbe"]["exec"]["command"]
-        self.assertIn("--data", rdy,
-                      "readinessProbe should use --data (real check)")
+    def test_readiness_probe_uses_readyz(self):
+        rdy = self.container["readinessProbe"]["httpGet"]
+        self.assertEqual(rdy["path"], "/readyz")
+        self.assertIn(rdy["port"], self.port_names)
 
-    def test_probes_reference_collector_script(self):
-        for kind in ("livenessProbe", "readinessProbe"):
-            cmd = self.container[kind]["exec"]["command"]
-            joined = " ".join(cmd)
-            self.assertIn("cgroup_collector.py", joined,
-                          f"{kind} doesn't reference cgroup_collector.py")
+    def test_command_runs_node_collector(self):
+        joined = " ".join(self.container["command"])
+        self.assertIn("node_pod_collector.py --serve", joined)
+
+    def test_container_port_matches_configmap(self):
+        cm = next(d for d in self.docs if d["kind"] == "ConfigMap")
+        ports = [p["containerPort"] for p in self.container["ports"] if p["name"] == "rows"]
+        self.assertEqual(ports, [int(cm["data"]["NODE_COLLECTOR_PORT"])])
 
 
 class TestRBACMinimum(unittest.TestCase):
@@ -256,7 +259,8 @@ class TestConfigMapKeys(unittest.TestCase):
     """ConfigMap must export the env vars required by the collector."""
 
     REQUIRED_KEYS = {"HOST_PROC", "HOST_SYS", "DEPLOYMENT_MODE",
-                     "TARGET_CGROUP", "COLLECTION_INTERVAL_SEC"}
+                     "TARGET_CGROUP", "COLLECTION_INTERVAL_SEC",
+                     "COLLECTOR_TARGET_NAMESPACES", "NODE_COLLECTOR_PORT"}
 
     def test_required_keys_present(self):
         docs = load_all_docs()
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """k8s_api_client._do_get catches bare socket.timeout.
 
-On Python 3.8/3.9 SSL handshake timeouts can bubble as bare socket.timeout
-(NOT wrapped in URLError). We must catch it explicitly so retry logic in _get()
-can see it as a transient error.
+On Python 3.8/3.9 SSL handshake timeouts can bubble as bare socket.timeout.
+We must catch it explicitly so retry logic in _get() can see it as a
+transient error. Errors are injected at the pooled http.client connection.
 """
 import socket
 import sys
@@ -38,8 +38,8 @@ class SocketTimeoutHandling(unittest.TestCase):
             p.stop()
 
     def test_bare_socket_timeout_caught_as_k8s_api_error(self):
-        """urlopen raising bare socket.timeout → K8sApiError, not unhandled."""
-        with mock.patch.object(k8s_api_client.urlrequest, 'urlopen',
+        """Connection raising bare socket.timeout → K8sApiError, not unhandled."""
+        with mock.patch.object(k8s_api_client.http.client.HTTPConnection, 'request',
                                side_effect=socket.timeout('mocked SSL handshake timeout')):
             with self.assertRaises(K8sApiError) as ctx:
                 self.client._do_get('http://127.0.0.1:9999/api/v1/nodes')
@@ -48,18 +48,17 @@ class SocketTimeoutHandling(unittest.TestCase):
 
     def test_bare_timeout_error_caught_as_k8s_api_error(self):
         """Python 3.10+ TimeoutError alias also caught."""
-        with mock.patch.object(k8s_api_client.urlrequest, 'urlopen',
+        with mock.patch.object(k8s_api_client.http.client.HTTPConnection, 'request',
                                side_effect=TimeoutError('mocked')):
             with self.assertRaises(K8sApiError) as ctx:
                 self.client._do_get('http://127.0.0.1:9999/api/v1/nodes')
             self.assertEqual(ctx.exception.status, 0)
             self.assertIn('timeout', str(ctx.exception).lower())
 
-    def test_url_error_path_still_works(self):
-        """Regression: URLError wrapping a timeout still produces K8sApiError."""
-        from urllib import error as urlerror
-        with mock.patch.object(k8s_api_client.urlrequest, 'urlopen',
-                               side_effect=urlerror.URLError(TimeoutError('wrapped'))):
+    def test_connection_error_path_still_works(self):
+        """Regression: refused/reset connections still produce K8sApiError."""
+        with mock.patch.object(k8s_api_client.http.client.HTTPConnection, 'request',
+                               side_effect=ConnectionRefusedError('refused')):
             with self.assertRaises(K8sApiError) as ctx:
                 self.client._do_get('http://127.0.0.1:9999/api/v1/nodes')
             self.assertEqual(ctx.exception.status, 0)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Shared kubelet /stats/summary cache: one fetch and parse per TTL.
+
+Covers the namespace/pod/container index, TTL expiry, single-flight under
+concurrent callers, process-wide sharing between clients, and the node
+collector's kubelet fallback for Pods whose cgroup is unresolved.
+"""
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO / 'monitoring'))
+sys.path.insert(0, str(REPO / 'tools'))
+
+import kubelet_stats_client as ksc  # noqa: E402
+import node_pod_collector as npc  # noqa: E402
+from fake_k8s_apiserver import FakeApiServer  # noqa: E402
+from k8s_api_client import K8sApiClient  # noqa: E402
+
+SUMMARY_PATH = '/api/v1/nodes/node-1/proxy/stats/summary'
+
+
+def _summary(n_pods):
+    return {'pods': [
+        {'podRef': {'name': f'p{i}', 'namespace': 'chain'},
+         'cpu': {'usageNanoCores': i, 'usageCoreNanoSeconds': 1_000_000 * (i + 1)},
+         'memory': {'workingSetBytes': 300, 'rssBytes': 100},
+         'containers': [{'name': 'node', 'cpu': {'usageNanoCores': 10 * i},
+                         'memory': {'workingSetBytes': 50}}]}
+        for i in range(n_pods)]}
+
+
+class SummaryCache(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApiServer().start()
+        self.api.routes[SUMMARY_PATH] = (200, _summary(50))
+        self.client = K8sApiClient(api_server=self.api.url, token='t')
+
+    def tearDown(self):
+        self.client.close()
+        self.api.stop()
+
+    def _fetches(self):
+        return len(self.api.requests_matching('/stats/summary'))
+
+    def test_index_lookups_share_one_fetch(self):
+        cache = ksc.NodeSummaryCache(self.client, ttl_sec=60)
+        a = ksc.KubeletStatsClient(cache=cache)
+        b = ksc.KubeletStatsClient(cache=cache)
+        self.assertEqual(len(a.pods_on_node('node-1')), 50)
+        self.assertEqual(b.pod_on_node('node-1', 'chain', 'p7').cpu_nanocores, 7)
+        self.assertIsNone(b.pod_on_node('node-1', 'chain', 'missing'))
+        self.assertEqual(a.container_on_node('node-1', 'chain', 'p3', 'node').cpu_nanocores, 30)
+        self.assertEqual(self._fetches(), 1)
+        self.assertEqual(cache.fetches, 1)
+
+    def test_ttl_expiry_refetches(self):
+        cache = ksc.NodeSummaryCache(self.client, ttl_sec=0.05)
+        client = ksc.KubeletStatsClient(cache=cache)
+        client.pod_on_node('node-1', 'chain', 'p1')
+        time.sleep(0.1)
+        client.pod_on_node('node-1', 'chain', 'p1')
+        self.assertEqual(self._fetches(), 2)
+
+    def test_concurrent_callers_single_flight(self):
+        cache = ksc.NodeSummaryCache(self.client, ttl_sec=60)
+        client = ksc.KubeletStatsClient(cache=cache)
+        barrier = threading.Barrier(8)
+
+        def worker(i):
+            barrier.wait()
+            client.pod_on_node('node-1', 'chain', f'p{i}')
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self._fetches(), 1)
+
+    def test_explicit_api_keeps_private_cache_and_shared_is_singleton(self):
+        self.assertIsNot(ksc.KubeletStatsClient(self.client).cache,
+                         ksc.KubeletStatsClient(self.client).cache)
+        saved = ksc._SHARED_CACHE
+        ksc._SHARED_CACHE = None
+        try:
+            shared = ksc.shared_summary_cache(self.client)
+            self.assertIs(ksc.KubeletStatsClient().cache, shared)
+            self.assertIs(ksc.KubeletStatsClient().api, self.client)
+        finally:
+            ksc._SHARED_CACHE = saved
+
+    def test_node_sampler_unresolved_pods_use_one_summary(self):
+        registry = npc.PodRegistry(client=None, namespaces=[], node_name='node-1')
+        for i in range(5):
+            t = npc.PodTarget('chain', f'p{i}', f'uid-{i}')
+            registry._targets[t.key] = t
+        cache = ksc.NodeSummaryCache(self.client, ttl_sec=60)
+        sampler = npc.NodeSampler(registry, npc.RowBuffer(100),
+                                  layout={'CGROUP_VERSION': 'unknown', 'CGROUP_ROOT': ''},
+                                  host_proc='/nonexistent', node_name='node-1',
+                                  kubelet=ksc.KubeletStatsClient(cache=cache))
+        rows = sampler.tick()
+        sampler.tick()
+        self.assertEqual({r['cgroup_meta_source'] for r in rows}, {'k8s_fallback:unresolved'})
+        self.assertEqual({r['cgroup_mem_file'] for r in rows}, {200})
+        self.assertEqual(self._fetches(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Load curves: coordinated-omission correction, per-round CSV and the qps_analyzer chart.
+
+Coverage:
+- read_results: success classification, malformed lines skipped, start-time ordering
+- open_loop_corrected: send lag behind the -rate schedule is added to latency
+- closed_loop_corrected_percentile: matches a brute-force expansion; no stall, no change
+- summarize: open- and closed-loop rows, empty round
+- main: argument validation and the per-round CSV
+- NodeQPSAnalyzer: load curve chart; closed-loop text reports are not QPS rounds
+
+Run: python3 tests/test_load_curve.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import load_curve  # noqa: E402
+from analysis.per_method_attribution import percentile  # noqa: E402
+from analysis.qps_analyzer import NodeQPSAnalyzer  # noqa: E402
+from report_fixtures import patch_env  # noqa: E402
+
+T0 = 1781179200.0  # 2026-06-11 12:00:00 UTC
+
+
+def _result(start, latency_ms, code=200, error=""):
+    return json.dumps({"timestamp": datetime.fromtimestamp(start, timezone.utc).isoformat().replace("+00:00", "Z"),
+                       "code": code, "latency": int(latency_ms * 1_000_000), "error": error})
+
+
+def _lagged_schedule():
+    """10 req/s schedule; the 6th request left 300 ms after its slot."""
+    return [T0 + i * 0.1 for i in range(5)] + [T0 + 0.8 + i * 0.1 for i in range(5)]
+
+
+def _expanded(latencies, interval):
+    """Brute-force closed-loop correction: every V adds V - k * interval for each k >= 1 while >= interval."""
+    out = list(latencies)
+    for v in latencies:
+        k = 1
+        while v - k * interval >= interval:
+            out.append(v - k * interval)
+            k += 1
+    return sorted(out)
+
+
+class ReadResults(unittest.TestCase):
+    def test_success_needs_2xx_3xx_and_no_error(self):
+        samples = load_curve.read_results([_result(T0, 1.0), _result(T0 + 1, 1.0, 302),
+                                           _result(T0 + 2, 1.0, 500), _result(T0 + 3, 1.0, 200, "EOF")])
+        self.assertEqual([s.ok for s in samples], [True, True, False, False])
+
+    def test_malformed_lines_are_skipped_and_samples_sorted(self):
+        samples = load_curve.read_results([_result(T0 + 1, 2.0), "", "not json", '{"code": 200}',
+                                           _result(T0, 1.0)])
+        self.assertEqual([s.latency_ms for s in samples], [1.0, 2.0])
+
+
+class OpenLoop(unittest.TestCase):
+    def test_send_lag_is_added_to_latency(self):
+        samples = load_curve.read_results(_result(t, 5.0) for t in _lagged_schedule())
+        corrected = load_curve.open_loop_corrected(samples, 10)
+        self.assertAlmostEqual(corrected[0], 5.0, places=3)
+        self.assertAlmostEqual(corrected[-1], 305.0, places=3)
+
+    def test_zero_rate_has_no_schedule(self):
+        samples = load_curve.read_results([_result(T0, 5.0)])
+        self.assertEqual(load_curve.open_loop_corrected(samples, 0), [])
+
+    def test_summary_row(self):
+        samples = load_curve.read_results(_result(t, 5.0) for t in _lagged_schedule())
+        row = load_curve.summarize(samples, "open", 1.0, qps=10)
+        self.assertEqual((row["requests"], row["p99_ms"], row["intended_interval_ms"]), (10, 5.0, 100.0))
+        self.assertAlmostEqual(row["corrected_p99_ms"], 305.0, places=3)
+
+
+class ClosedLoop(unittest.TestCase):
+    def test_percentiles_match_brute_force_expansion(self):
+        latencies = [10.0] * 99 + [1000.0]
+        expanded = _expanded(latencies, 10.0)
+        for pct in (50, 90, 99):
+            self.assertAlmostEqual(load_curve.closed_loop_corrected_percentile(latencies, 10.0, pct),
+                                   percentile(expanded, pct), places=3)
+
+    def test_uneven_stalls_match_brute_force_expansion(self):
+        latencies = [3.0, 7.0, 12.0, 45.0, 160.0, 8.0, 5.0]
+        expanded = _expanded(latencies, 5.0)
+        for pct in (25, 50, 75, 95):
+            self.assertAlmostEqual(load_curve.closed_loop_corrected_percentile(latencies, 5.0, pct),
+                                   percentile(expanded, pct), places=3)
+
+    def test_no_stall_changes_nothing(self):
+        self.assertAlmostEqual(load_curve.closed_loop_corrected_percentile([10.0] * 50, 10.0, 99), 10.0, places=3)
+
+    def test_empty_and_zero_interval(self):
+        self.assertEqual(load_curve.closed_loop_corrected_percentile([], 10.0, 99), 0.0)
+        self.assertAlmostEqual(load_curve.closed_loop_corrected_percentile([1.0, 50.0], 0.0, 99), 49.51)
+
+    def test_summary_row_defaults_interval_to_median(self):
+        latencies = [10.0] * 99 + [1000.0]
+        samples = [load_curve.Sample(T0 + i, v, True) for i, v in enumerate(latencies)]
+        row = load_curve.summarize(samples, "closed", 10.0, concurrency=4)
+        self.assertEqual((row["intended_interval_ms"], row["corrected_max_ms"]), (10.0, 1000.0))
+        self.assertAlmostEqual(row["p99_ms"], 19.9)                 # interpolated towards the 1000 ms stall
+        self.assertAlmostEqual(row["corrected_p99_ms"], 980.2, places=3)
+        self.assertAlmostEqual(row["throughput"], 10.0)
+
+    def test_empty_round_leaves_latency_columns_blank(self):
+        row = load_curve.summarize([], "closed", 10.0, concurrency=4)
+        self.assertEqual(row["requests"], 0)
+        self.assertIsNone(row["p99_ms"])
+        self.assertIsNone(row["corrected_p99_ms"])
+
+
+class Cli(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.results = os.path.join(self.dir.name, "results.jsonl")
+        Path(self.results).write_text("\n".join(_result(T0 + i * 0.05, 20.0, 200 if i % 10 else 500)
+                                                for i in range(40)) + "\n")
+        self.csv_path = os.path.join(self.dir.name, "load_curve_20260611_120000.csv")
+
+    def test_model_needs_its_load_parameter(self):
+        self.assertEqual(load_curve.main(["--results", self.results, "--model", "closed", "--duration", "2"]), 1)
+        self.assertEqual(load_curve.main(["--results", self.results, "--model", "open", "--duration", "2"]), 1)
+
+    def test_rounds_append_to_one_csv(self):
+        self.assertEqual(load_curve.main(["--results", self.results, "--model", "open", "--qps", "20",
+                                          "--duration", "2", "--csv", self.csv_path]), 0)
+        self.assertEqual(load_curve.main(["--results", self.results, "--model", "closed", "--concurrency", "8",
+                                          "--duration", "2", "--csv", self.csv_path]), 0)
+        lines = Path(self.csv_path).read_text().splitlines()
+        self.assertEqual(lines[0].split(","), list(load_curve.CSV_COLUMNS))
+        self.assertEqual([line.split(",")[0] for line in lines[1:]], ["open", "closed"])
+        self.assertEqual(lines[1].split(",")[4], "90.0")
+
+
+class AnalyzerChart(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        d = self.dir.name
+        results = os.path.join(d, "results.jsonl")
+        Path(results).write_text("\n".join(_result(T0 + i * 0.05, 20.0) for i in range(40)) + "\n")
+        self.csv_path = os.path.join(d, "load_curve_20260611_120000.csv")
+        load_curve.main(["--results", results, "--model", "open", "--qps", "20", "--duration", "2",
+                         "--csv", self.csv_path])
+        load_curve.main(["--results", results, "--model", "closed", "--concurrency", "8", "--duration", "2",
+                         "--csv", self.csv_path])
+        # closed-loop text reports sit next to the QPS rounds
+        Path(os.path.join(d, "vegeta_8conc_20260611_120000.txt")).write_text("Requests [total] 40\n")
+        self.analyzer = NodeQPSAnalyzer.__new__(NodeQPSAnalyzer)
+        self.analyzer.output_dir = d
+        self.analyzer.reports_dir = d
+        patch_env(self, LOAD_CURVE_CSV=self.csv_path, REPORTS_DIR=d)
+
+    def test_chart_is_written(self):
+        chart = self.analyzer.generate_load_curve_chart()
+        self.assertEqual(os.path.basename(chart), "qps_load_curves.png")
+        self.assertTrue(os.path.getsize(chart) > 0)
+
+    def test_closed_loop_reports_are_not_qps_rounds(self):
+        self.assertIsNone(self.analyzer.analyze_vegeta_reports())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Per-method marginal cost from proxy call rates and monitor samples.
+
+Coverage:
+- fit: non-negative costs and baseline
+- call_rates: per-interval bucketing, samples outside the proxied window and after gaps dropped
+- estimate: recovers per-call cost, baseline and fit quality; too few samples
+- estimate: a fixed method mix is flagged collinear
+- read_resource_samples: cpu, summed disk read and network columns
+- main: writes the cost JSON; missing proxy CSV fails
+- report: ReportGenerator loads the JSON, the per-method section renders the table (en/zh)
+
+Run: python3 tests/test_method_cost.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import method_cost  # noqa: E402
+from analysis.per_method_attribution import ProxyAggregate  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.per_method_report import render_per_method_section  # noqa: E402
+
+T0 = 1781179200  # 2026-06-11 12:00:00 UTC
+CPU_PER_CALL = {"eth_blockNumber": 0.01, "eth_call": 0.1}      # CPU % per call/s
+NET_KB_PER_CALL = {"eth_blockNumber": 0.2, "eth_call": 2.0}
+
+
+def _load(seconds, mix=None, seed=0):
+    """Aggregate sink rows and monitor samples for random (or fixed-mix) call rates."""
+    rng = np.random.default_rng(seed)
+    rows, samples = [], []
+    for t in range(seconds):
+        total = int(rng.integers(200, 1200))
+        rates = {"eth_blockNumber": int(total * mix), "eth_call": total - int(total * mix)} if mix else {
+            "eth_blockNumber": int(rng.integers(100, 1000)), "eth_call": int(rng.integers(0, 300))}
+        rows += [ProxyAggregate(T0 + t, m, "jsonrpc", "2xx", n, 0, 0, 0, 0, {}) for m, n in rates.items()]
+        samples.append(method_cost.ResourceSample(
+            T0 + t,
+            10 + sum(CPU_PER_CALL[m] * n for m, n in rates.items()) + rng.normal(0, 1),
+            None,
+            100 + sum(NET_KB_PER_CALL[m] * n for m, n in rates.items()) + rng.normal(0, 5)))
+    return rows, samples
+
+
+def _agg(t, method, count):
+    return ProxyAggregate(T0 + t, method, "jsonrpc", "2xx", count, 0, 0, 0, 0, {})
+
+
+def _sample(t):
+    return method_cost.ResourceSample(T0 + t, 0.0, None, None)
+
+
+class Fit(unittest.TestCase):
+    def test_costs_and_baseline_are_non_negative(self):
+        rates = np.array([[1.0], [2.0], [3.0], [4.0]])
+        coef, base = method_cost.fit(rates, np.array([10.0, 9.0, 8.0, 7.0]))  # falling with load
+        self.assertEqual(coef[0], 0.0)
+        self.assertGreater(base, 0.0)
+
+
+class CallRates(unittest.TestCase):
+    def test_calls_are_bucketed_per_sample_interval(self):
+        rows = [_agg(0, "a", 10), _agg(1, "a", 10), _agg(2, "b", 4), _agg(3, "a", 6)]
+        methods, totals, rates, used = method_cost.call_rates(rows, [_sample(0), _sample(2)])
+        self.assertEqual(methods, ["a", "b"])
+        self.assertEqual(totals, {"a": 26, "b": 4})
+        self.assertEqual(rates.tolist(), [[10.0, 0.0], [3.0, 2.0]])   # 2 s per sample
+        self.assertEqual(len(used), 2)
+
+    def test_samples_outside_the_proxied_window_are_left_out(self):
+        rows = [_agg(t, "a", 1) for t in range(5)]
+        *_, used = method_cost.call_rates(rows, [_sample(-5)] + [_sample(t) for t in range(5)])
+        self.assertEqual([s.timestamp_s - T0 for s in used], [0, 1, 2, 3, 4])
+
+    def test_sample_before_a_monitoring_gap_is_dropped(self):
+        rows = [_agg(t, "a", 1) for t in range(20)]
+        samples = [_sample(t) for t in (0, 1, 2, 3, 10, 11, 12)]
+        *_, used = method_cost.call_rates(rows, samples)
+        self.assertNotIn(T0 + 3, [s.timestamp_s for s in used])
+        self.assertEqual(len(used), 6)
+
+
+class Estimate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rows, samples = _load(300)
+        cls.result = method_cost.estimate(rows, samples, iterations=100)
+        cls.costs = {m["method"]: m for m in cls.result["methods"]}
+
+    def test_fitted_resources_and_method_order(self):
+        self.assertTrue(self.result["fitted"])
+        self.assertEqual((self.result["samples_used"], self.result["resources"]), (300, ["cpu_pct", "net_kb"]))
+        self.assertEqual(list(self.costs), ["eth_blockNumber", "eth_call"])   # by calls
+        self.assertFalse(self.result["collinear"])
+
+    def test_cpu_bounds_contain_the_true_cost(self):
+        for method, truth in CPU_PER_CALL.items():
+            lo, hi = self.costs[method]["cpu_pct"]["ci"]
+            self.assertLess(lo, truth * 1000)
+            self.assertGreater(hi, truth * 1000)
+
+    def test_network_cost_per_kcall(self):
+        for method, truth in NET_KB_PER_CALL.items():
+            self.assertAlmostEqual(self.costs[method]["net_kb"]["per_kcall"], truth * 1000, delta=20)
+
+    def test_baseline_and_fit_quality(self):
+        self.assertAlmostEqual(self.result["baseline"]["cpu_pct"]["value"], 10, delta=1)
+        self.assertGreater(self.result["fit"]["cpu_pct"]["r2"], 0.95)
+        self.assertAlmostEqual(self.result["fit"]["cpu_pct"]["rmse"], 1.0, delta=0.2)
+
+    def test_fixed_mix_is_flagged_collinear(self):
+        collinear = method_cost.estimate(*_load(300, mix=0.8), iterations=20)
+        self.assertTrue(collinear["fitted"])
+        self.assertTrue(collinear["collinear"])
+
+    def test_too_few_samples_are_not_fitted(self):
+        result = method_cost.estimate(*_load(5), iterations=20)
+        self.assertFalse(result["fitted"])
+        self.assertEqual(result["methods"], [])
+
+
+class Cli(unittest.TestCase):
+    """getBlock costs 0.5 CPU %, 4 reads/s and 0.8 Mbit/s per call/s over a 5 % / 50 reads/s baseline."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.TemporaryDirectory()
+        d = cls.dir.name
+        cls.proxy_csv = os.path.join(d, "proxy_method.csv")
+        cls.monitor_csv = os.path.join(d, "performance_latest.csv")
+        rng = np.random.default_rng(3)
+        proxy_lines = ["timestamp_ns,method_name,protocol,request_id,batch_idx,status_code,"
+                       "transport_success,rpc_success,rpc_error_code,rpc_error_message,"
+                       "latency_ms,upstream,client_addr,latency_us"]
+        monitor_lines = ["timestamp,cpu_usage,mem_used,data_nvme1n1_r_s,accounts_nvme2n1_r_s,net_total_mbps"]
+        for t in range(60):
+            heavy = int(rng.integers(0, 20))
+            for i in range(heavy):
+                proxy_lines.append(f"{(T0 + t) * 10**9 + i},getBlock,jsonrpc,1,0,200,true,true,,,1,up,c,900")
+            reads = 50 + 4 * heavy
+            stamp = datetime.fromtimestamp(T0 + t).strftime("%Y-%m-%d %H:%M:%S")
+            monitor_lines.append(f"{stamp},{5 + 0.5 * heavy},1000,{reads / 2},{reads / 2},{8 + 0.8 * heavy}")
+        Path(cls.proxy_csv).write_text("\n".join(proxy_lines) + "\n")
+        Path(cls.monitor_csv).write_text("\n".join(monitor_lines) + "\n")
+        cls.output = os.path.join(d, "method_cost_20260611_120000.json")
+        cls.status = method_cost.main(["--proxy-csv", cls.proxy_csv, "--monitor-csv", cls.monitor_csv,
+                                       "--output", cls.output, "--iterations", "50"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dir.cleanup()
+
+    def test_monitor_columns(self):
+        samples = method_cost.read_resource_samples(self.monitor_csv)
+        self.assertEqual((len(samples), samples[0].timestamp_s), (60, T0))
+        for s in samples:
+            heavy = (s.disk_reads - 50) / 4         # both data and accounts reads are summed
+            self.assertAlmostEqual(s.cpu_pct, 5 + 0.5 * heavy)
+            self.assertAlmostEqual(s.net_kb, (8 + 0.8 * heavy) * 125)   # Mbit/s to KB/s
+
+    def test_writes_the_cost_json(self):
+        self.assertEqual(self.status, 0)
+        result = json.loads(Path(self.output).read_text())
+        (cost,) = result["methods"]
+        self.assertAlmostEqual(cost["cpu_pct"]["per_kcall"], 500.0, places=3)
+        self.assertAlmostEqual(cost["disk_reads"]["per_kcall"], 4000.0, places=3)
+        self.assertAlmostEqual(cost["net_kb"]["per_kcall"], 100000.0, places=1)  # 0.8 Mbit/s per call/s
+        self.assertAlmostEqual(result["baseline"]["disk_reads"]["value"], 50.0, places=3)
+
+    def test_missing_proxy_csv_fails(self):
+        self.assertEqual(method_cost.main(["--proxy-csv", os.path.join(self.dir.name, "missing.csv"),
+                                           "--monitor-csv", self.monitor_csv]), 1)
+
+    def test_report_generator_finds_the_json_in_logs_dir(self):
+        with report_env(unset=('METHOD_COST_JSON',)):
+            loaded = make_report_generator(self.dir.name)._load_method_cost()
+        self.assertEqual(loaded, json.loads(Path(self.output).read_text()))
+
+    def test_section_renders_the_cost_table(self):
+        loaded = json.loads(Path(self.output).read_text())
+        for language, title in (("en", "Marginal Cost per 1k Calls"), ("zh", "每千次调用边际成本")):
+            section = render_per_method_section(language, "solana", {}, [], cost=loaded)
+            self.assertIn(title, section)
+            self.assertIn(">getBlock</td>", section)
+            self.assertIn("500.0 [", section)
+
+    def test_section_without_cost_has_no_table(self):
+        self.assertNotIn("Marginal Cost", render_per_method_section("en", "solana", {}, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
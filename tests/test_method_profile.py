@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Per-method isolation profiles and mix capacity prediction.
+
+Coverage:
+- next_qps: doubles to the first failure, then bisects within the resolution; round cap
+- parse_weights: method=weight pairs, malformed and negative weights rejected
+- predict: harmonic mix capacity and bracket, binding method, methods without capacity
+- what_if: one doubling per method, explicit change set first and not duplicated, unknown method
+- report: profiles, CPU cost per 1k calls/s, validation against the measured mix
+- main: round rows against the SLO spec and monitor CPU; predict output
+- NodeQPSAnalyzer chart and the report section (en/zh)
+
+Run: python3 tests/test_method_profile.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import method_profile  # noqa: E402
+from analysis.qps_analyzer import NodeQPSAnalyzer  # noqa: E402
+from analysis.slo_capacity import Slo  # noqa: E402
+from report_fixtures import make_report_generator, patch_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+CAPACITY = {"eth_call": 2000, "eth_getLogs": 500}       # isolated SLO capacity
+CPU_PER_KCPS = {"eth_call": 20.0, "eth_getLogs": 80.0}  # CPU % per 1k calls/s
+WEIGHTS = {"eth_call": 6.0, "eth_getLogs": 1.0}         # mix saturates at 1400 QPS
+SLO = Slo(0.0, 500.0, 1.0)
+START = datetime(2026, 6, 11, 12, 0, 0)
+STAMP = "%Y-%m-%d %H:%M:%S"
+
+
+def _node(method, qps):
+    """Vegeta-style metrics of a node whose methods share one bottleneck."""
+    mix = WEIGHTS if method == method_profile.MIX else {method: 1.0}
+    total = sum(mix.values())
+    load = sum(qps * w / total / CAPACITY[m] for m, w in mix.items())
+    cpu = 5 + sum(qps * w / total / 1000 * CPU_PER_KCPS[m] for m, w in mix.items())
+    report = {"requests": qps * 30, "success_pct": 100.0, "throughput": float(qps),
+              "p50_ms": 2.0, "p99_ms": 20.0 if load <= 1 else 900.0}
+    return report, cpu
+
+
+def _ladder(method):
+    rounds = []
+    qps = method_profile.next_qps(rounds, method, 250, 8000, 5, 12)
+    while qps is not None:
+        report, cpu = _node(method, qps)
+        row = method_profile.summarize_round(report, method, qps, SLO)
+        row["cpu_pct"] = cpu
+        rounds.append(row)
+        qps = method_profile.next_qps(rounds, method, 250, 8000, 5, 12)
+    return rounds
+
+
+def _profile(max_qps, first_failing_qps=None, cpu_per_kcps=None):
+    return {"max_qps": max_qps, "first_failing_qps": first_failing_qps,
+            "cpu_baseline_pct": 5.0 if cpu_per_kcps is not None else None, "cpu_pct_per_kcps": cpu_per_kcps}
+
+
+class NextQps(unittest.TestCase):
+    def test_doubles_to_the_first_failure_then_bisects(self):
+        calls = [r["qps"] for r in _ladder("eth_getLogs")]
+        self.assertEqual(calls[:3], [250, 500, 1000])
+        self.assertTrue(calls[3:] and all(500 < q < 1000 for q in calls[3:]))
+
+    def test_stops_at_the_round_cap(self):
+        rounds = [method_profile.summarize_round(_node("eth_call", q)[0], "eth_call", q, SLO) for q in (250, 500)]
+        self.assertIsNone(method_profile.next_qps(rounds, "eth_call", 250, 8000, max_rounds=2))
+
+    def test_unbounded_ladder_stops_at_max_qps(self):
+        rounds = [method_profile.summarize_round(_node("eth_call", 1000)[0], "eth_call", 1000, SLO)]
+        self.assertIsNone(method_profile.next_qps(rounds, "eth_call", 250, 1000))
+
+
+class ParseWeights(unittest.TestCase):
+    def test_method_weight_pairs(self):
+        self.assertEqual(method_profile.parse_weights("eth_call=6, eth_getLogs=1,"),
+                         {"eth_call": 6.0, "eth_getLogs": 1.0})
+
+    def test_malformed_and_negative_weights(self):
+        for value in ("eth_call", "=2", "eth_call=bad", "eth_call=-1"):
+            with self.assertRaises(ValueError, msg=value):
+                method_profile.parse_weights(value)
+
+
+class Predict(unittest.TestCase):
+    def test_mix_capacity_is_the_weighted_harmonic_mean(self):
+        profile = {"a": _profile(1000, 1200), "b": _profile(250, 300)}
+        result = method_profile.predict(profile, {"a": 3, "b": 1})
+        self.assertAlmostEqual(result["predicted_qps"], 1 / (0.75 / 1000 + 0.25 / 250))
+        self.assertAlmostEqual(result["predicted_qps_range"][1], 1 / (0.75 / 1200 + 0.25 / 300))
+        self.assertEqual(result["binding_method"], "b")
+
+    def test_unbounded_method_leaves_the_upper_bound_open(self):
+        result = method_profile.predict({"a": _profile(1000), "b": _profile(250, 300)}, {"a": 1, "b": 1})
+        self.assertIsNone(result["predicted_qps_range"][1])
+
+    def test_method_without_capacity_is_reported_missing(self):
+        profile = {"a": _profile(1000, 1200), "b": _profile(0, 250)}
+        result = method_profile.predict(profile, {"a": 1, "b": 1, "c": 1})
+        self.assertIsNone(result["predicted_qps"])
+        self.assertEqual(result["missing"], ["b", "c"])
+
+    def test_zero_weight_method_is_ignored(self):
+        result = method_profile.predict({"a": _profile(1000, 1200)}, {"a": 1, "c": 0})
+        self.assertAlmostEqual(result["predicted_qps"], 1000)
+
+    def test_cpu_at_capacity(self):
+        profile = {"a": _profile(1000, 1200, 20.0), "b": _profile(1000, 1200, 60.0)}
+        cpu = method_profile.predict(profile, {"a": 1, "b": 1})["cpu"]
+        self.assertAlmostEqual(cpu["pct_per_kcps"], 40.0)
+        self.assertAlmostEqual(cpu["at_capacity_pct"], 45.0)
+
+
+class WhatIf(unittest.TestCase):
+    def setUp(self):
+        self.profile = {"eth_call": _profile(2000, 2100), "eth_getLogs": _profile(500, 525)}
+
+    def test_explicit_change_first_and_not_duplicated(self):
+        scenarios = method_profile.what_if(self.profile, WEIGHTS, {"eth_getLogs": 2})
+        self.assertEqual([s["scenario"] for s in scenarios], ["eth_getLogs x2", "eth_call x2"])
+
+    def test_heavier_slow_method_lowers_capacity(self):
+        scenarios = {s["scenario"]: s for s in method_profile.what_if(self.profile, WEIGHTS)}
+        self.assertLess(scenarios["eth_getLogs x2"]["change_pct"], 0)
+        self.assertGreater(scenarios["eth_call x2"]["change_pct"], 0)
+
+    def test_unknown_method_is_rejected(self):
+        with self.assertRaises(ValueError):
+            method_profile.what_if(self.profile, WEIGHTS, {"eth_getBalance": 2})
+
+
+class Report(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rounds = [r for m in (*WEIGHTS, method_profile.MIX) for r in _ladder(m)]
+        cls.result = method_profile.report(rounds, WEIGHTS)
+
+    def test_isolated_profiles(self):
+        profile = self.result["methods"]
+        self.assertEqual(profile["eth_getLogs"]["max_qps"], 500)
+        self.assertLessEqual(profile["eth_getLogs"]["first_failing_qps"], 525)
+        self.assertGreaterEqual(profile["eth_call"]["max_qps"], 1900)
+        self.assertNotIn(method_profile.MIX, profile)
+
+    def test_cpu_cost_per_kcall(self):
+        self.assertAlmostEqual(self.result["methods"]["eth_getLogs"]["cpu_pct_per_kcps"], 80.0, places=6)
+
+    def test_prediction_brackets_the_true_mix_capacity(self):
+        prediction = self.result["prediction"]
+        low, high = prediction["predicted_qps_range"]
+        self.assertLessEqual(low, 1400 + 1e-6)
+        self.assertGreaterEqual(high, 1400)
+        self.assertEqual(prediction["binding_method"], "eth_call")   # 6/7 of the calls
+
+    def test_validation_against_the_measured_mix(self):
+        validation = self.result["validation"]
+        self.assertTrue(validation["consistent"])
+        self.assertLess(abs(validation["error_pct"]), 10)
+        for check in validation["cpu"]:
+            self.assertAlmostEqual(check["predicted_pct"], check["measured_pct"], delta=1)
+
+
+class _CliRun(unittest.TestCase):
+    """Two rounds per method (and the mix); the monitor CPU steps from 40 % to 90 % at 30 s."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.TemporaryDirectory()
+        d = cls.dir.name
+        monitor_csv = os.path.join(d, "performance_latest.csv")
+        lines = ["timestamp,cpu_usage,mem_used"]
+        lines += [f"{(START + timedelta(seconds=s)).strftime(STAMP)},{40 if s < 30 else 90},1000"
+                  for s in range(0, 70, 5)]
+        Path(monitor_csv).write_text("\n".join(lines) + "\n")
+        spec = os.path.join(d, "slo.json")
+        Path(spec).write_text(json.dumps({"methods": {"eth_getLogs": {"p99_ms": 50}}}))
+        cls.csv_path = os.path.join(d, "method_profile_20260611_120000.csv")
+        cls.statuses = []
+        for method, qps, p99, offset in (("eth_call", 1000, 100, 0), ("eth_call", 2000, 900, 35),
+                                         ("eth_getLogs", 250, 20, 0), ("eth_getLogs", 500, 100, 35),
+                                         ("mix", 800, 40, 0), ("mix", 1600, 600, 35)):
+            report = os.path.join(d, "report.json")
+            Path(report).write_text(json.dumps({
+                "requests": qps * 30, "success": 1.0, "throughput": qps,
+                "latencies": {"50th": 2_000_000, "99th": int(p99 * 1e6)}}))
+            cls.statuses.append(method_profile.main([
+                "round", "--report", report, "--method", method, "--qps", str(qps),
+                "--started-at", (START + timedelta(seconds=offset)).strftime(STAMP),
+                "--ended-at", (START + timedelta(seconds=offset + 25)).strftime(STAMP),
+                "--monitor", monitor_csv, "--csv", cls.csv_path, "--spec", spec, "--p99-ms", "500"]))
+        cls.output = os.path.join(d, "method_profile_20260611_120000.json")
+        cls.predict_status = method_profile.main(["predict", "--csv", cls.csv_path, "--weights",
+                                                  "eth_call=3,eth_getLogs=1", "--output", cls.output])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dir.cleanup()
+
+
+class Cli(_CliRun):
+    def setUp(self):
+        self.rounds = method_profile.read_rounds(self.csv_path)
+
+    def test_rounds_are_checked_against_the_spec(self):
+        self.assertEqual(self.statuses, [0] * 6)
+        self.assertEqual([r["passed"] for r in self.rounds], [True, False, True, False, True, False])
+        self.assertEqual(self.rounds[3]["violations"], "p99")                 # the spec's 50 ms bound
+
+    def test_round_cpu_is_the_monitor_window_average(self):
+        self.assertEqual([r["cpu_pct"] for r in self.rounds[:2]], [40.0, 90.0])
+
+    def test_next_bisects_the_csv_rounds(self):
+        self.assertEqual(method_profile.next_qps(self.rounds, "eth_call", 250, 8000), 1500)
+
+    def test_predict_rejects_bad_weights(self):
+        self.assertEqual(method_profile.main(["predict", "--csv", self.csv_path, "--weights", "eth_call=bad"]), 1)
+
+    def test_predict_writes_the_output(self):
+        self.assertEqual(self.predict_status, 0)
+        result = json.loads(Path(self.output).read_text())
+        self.assertAlmostEqual(result["prediction"]["predicted_qps"], 1 / (0.75 / 1000 + 0.25 / 250))
+
+
+class Outputs(_CliRun):
+    """Chart and report section over the predict output."""
+
+    def setUp(self):
+        patch_env(self, unset=('METHOD_PROFILE_JSON',), LOGS_DIR=self.dir.name)
+
+    def _section(self, language):
+        return make_report_generator(self.dir.name, language)._generate_method_profile_section()
+
+    def test_chart_is_written(self):
+        analyzer = NodeQPSAnalyzer.__new__(NodeQPSAnalyzer)
+        analyzer.output_dir = self.dir.name
+        analyzer.reports_dir = self.dir.name
+        self.assertTrue(os.path.getsize(analyzer.generate_method_profile_chart()) > 0)
+
+    def test_section_titles(self):
+        self.assertIn(TRANSLATIONS['en']['method_profile_title'], self._section('en'))
+        self.assertIn(TRANSLATIONS['zh']['method_profile_title'], self._section('zh'))
+
+    def test_section_tables(self):
+        section = self._section('en')
+        self.assertIn('<td>eth_getLogs</td>', section)
+        self.assertIn('500 (p99)', section)
+        self.assertIn('Measured mix: 800 QPS passed, 1,600 QPS failed', section)
+        self.assertIn('eth_getLogs x2', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
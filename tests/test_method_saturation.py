@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Per-method saturation curves across QPS rounds.
+
+Coverage:
+- read_phase_windows / monitor_windows: measurement windows from the phase CSV or the monitor's QPS column
+- curves: warmup left out, per-method rate and share of the round
+- knees: p99, error and throughput degradation, ranking, jitter under the absolute floor
+- ReportGenerator._load_method_saturation: phase CSV found through logs_dir
+- plot_saturation_curves: knee markers in the SVG
+- render_per_method_section: saturation tables (en/zh), omitted without data
+
+Run: python3 tests/test_method_saturation.py
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import method_saturation  # noqa: E402
+from analysis.per_method_attribution import ProxyRecord  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.per_method_charts import plot_saturation_curves  # noqa: E402
+from visualization.per_method_report import render_per_method_section  # noqa: E402
+
+T0 = 1781179200  # 2026-06-11 12:00:00 UTC
+LEVELS = (100, 200, 400, 800)
+SHARE = {"getSlot": 0.8, "getBlock": 0.15, "getHealth": 0.05}
+WINDOWS = [(qps, T0 + n * 30 + 10, T0 + n * 30 + 20) for n, qps in enumerate(LEVELS)]
+
+
+def _round(qps):
+    """(latency ms, error every nth call or 0, fraction of calls answered) per method at a level."""
+    return {
+        "getSlot": (2.0, 20 if qps == 800 else 0, 0.7 if qps == 800 else 1.0),   # errors and shortfall at 800
+        "getBlock": (20.0 if qps < 400 else 60.0, 0, 1.0),                      # p99 triples at 400
+        "getHealth": (0.3 if qps < 800 else 0.9, 0, 1.0),                       # 3x, but under 1 ms
+    }
+
+
+def _records():
+    """10 s warmup at 10x latency, then a 10 s measurement window per level, 10 s apart."""
+    records, phases = [], ["qps,warmup_start,measure_start,measure_end,warmup_s,warmup_result,cooldown_s,cooldown_result"]
+    for n, qps in enumerate(LEVELS):
+        warmup = T0 + n * 30
+        start, end = warmup + 10, warmup + 20
+        phases.append(f"{qps},{warmup},{start},{end},10,steady,5,baseline")
+        for method, (latency, every, answered) in _round(qps).items():
+            per_second = int(qps * SHARE[method] * answered)
+            for t in range(warmup, end):
+                for i in range(per_second):
+                    ok = not (every and i % every == 0)
+                    records.append(ProxyRecord(t * 10**9 + i, method, "jsonrpc", "1", 0, 200,
+                                               latency * (10 if t < start else 1), "up", "c", rpc_success=ok))
+    return records, "\n".join(phases) + "\n"
+
+
+RECORDS, PHASES = _records()
+
+
+class Windows(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def test_phase_csv_windows(self):
+        phases_csv = os.path.join(self.dir.name, "round_phases_20260611_120000.csv")
+        Path(phases_csv).write_text(PHASES)
+        self.assertEqual(method_saturation.read_phase_windows(phases_csv), WINDOWS)
+
+    def test_monitor_qps_column_gives_the_same_windows(self):
+        monitor_csv = os.path.join(self.dir.name, "performance_latest.csv")
+        lines = ["timestamp,cpu_usage,current_qps"]
+        lines += [f"{T0 + s},50,{LEVELS[s // 30] if 10 <= s % 30 < 20 else 0}" for s in range(120)]
+        Path(monitor_csv).write_text("\n".join(lines) + "\n")
+        self.assertEqual(method_saturation.monitor_windows(monitor_csv), WINDOWS)
+
+
+class Curves(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rounds = method_saturation.curves(RECORDS, WINDOWS)
+        cls.first = {r["method"]: r for r in cls.rounds if r["qps"] == 100}
+
+    def test_one_row_per_method_and_round(self):
+        self.assertEqual(len(self.rounds), 12)
+
+    def test_warmup_latency_left_out(self):
+        self.assertEqual(self.first["getBlock"]["p99_ms"], 20.0)
+
+    def test_rate_and_share_of_the_round(self):
+        self.assertAlmostEqual(self.first["getSlot"]["rate"], 80.0)
+        self.assertAlmostEqual(self.first["getSlot"]["total_rate"], 100.0)
+        self.assertAlmostEqual(self.first["getSlot"]["share"], 0.8)
+
+
+class Knees(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rounds = method_saturation.curves(RECORDS, WINDOWS)
+        cls.knees = {k["method"]: k for k in method_saturation.knees(cls.rounds)}
+
+    def test_earliest_knee_ranks_first(self):
+        self.assertEqual(list(self.knees), ["getBlock", "getSlot", "getHealth"])
+
+    def test_p99_knee(self):
+        block = self.knees["getBlock"]
+        self.assertEqual((block["degraded_at_qps"], block["degraded_on"], block["last_good_qps"]), (400, "p99", 200))
+        self.assertEqual(block["p99_at_knee_ms"], 60.0)
+
+    def test_error_and_throughput_knee(self):
+        slot = self.knees["getSlot"]
+        self.assertEqual((slot["degraded_at_qps"], slot["degraded_on"]), (800, "errors+throughput"))
+
+    def test_sub_millisecond_jitter_is_not_a_knee(self):
+        health = self.knees["getHealth"]
+        self.assertFalse(health["degraded"])                               # 0.3 -> 0.9 ms
+        self.assertEqual(health["max_tested_qps"], 800)
+
+    def test_lower_floor_makes_jitter_a_knee(self):
+        self.assertEqual(method_saturation.knees(self.rounds, min_delta_ms=0.1)[1]["method"], "getHealth")
+
+
+class ReportOutputs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as d:
+            Path(os.path.join(d, "round_phases_20260611_120000.csv")).write_text(PHASES)
+            with report_env(unset=('ROUND_PHASES_CSV',)):
+                cls.saturation = make_report_generator(d)._load_method_saturation(RECORDS, os.path.join(d, "missing.csv"))
+            chart = plot_saturation_curves(cls.saturation["rounds"], cls.saturation["knees"],
+                                           os.path.join(d, "per_method_saturation_solana.svg"))
+            cls.svg = chart.read_text()
+        cls.paths = {"saturation": "per_method_charts/per_method_saturation_solana.svg"}
+
+    def test_loader_uses_the_phase_windows(self):
+        self.assertEqual(len(self.saturation["rounds"]), 12)
+
+    def test_chart_marks_only_degraded_knees(self):
+        self.assertEqual(self.svg.count('r="6"'), 2)                       # getBlock and getSlot knees
+        self.assertIn(">getHealth</text>", self.svg)
+
+    def test_section_in_both_languages(self):
+        for language, title, not_degraded in (("en", "Saturation by QPS Round", "not up to 800"),
+                                              ("zh", "各 QPS 轮次饱和情况", "至 800 未劣化")):
+            section = render_per_method_section(language, "solana", self.paths, [], saturation=self.saturation)
+            self.assertIn(title, section)
+            self.assertIn(not_degraded, section)
+            self.assertIn("per_method_saturation_solana.svg", section)
+
+    def test_section_tables(self):
+        section = render_per_method_section("en", "solana", self.paths, [], saturation=self.saturation)
+        self.assertIn(">errors+throughput</td>", section)
+        self.assertIn("60.00", section)                                     # p99 at getBlock's knee
+        self.assertIn("background:#fff4e5;\">448 · 2.000/2.000 · 5.13%", section)
+
+    def test_section_omitted_without_data(self):
+        self.assertNotIn("Saturation by QPS Round", render_per_method_section("en", "solana", {}, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""node_pod_collector.py discovery, one-pass sampling and NDJSON endpoint.
+
+Covers Pod cgroup indexing for systemd and cgroupfs layouts, node-scoped
+discovery plus watch events against a fake apiserver, a single tick over
+several Pods sharing one diskstats read, and the /rows pull contract.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO / 'monitoring'))
+
+import node_pod_collector as npc  # noqa: E402
+from k8s_api_client import K8sApiClient  # noqa: E402
+
+UID_A = '11111111-2222-3333-4444-555555555555'
+UID_B = 'aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee'
+UID_C = '99999999-8888-7777-6666-555555555555'
+
+
+def _pod(name, uid, node='node-1', phase='Running', pvc=None):
+    volumes = [{'name': 'data', 'persistentVolumeClaim': {'claimName': pvc}}] if pvc else []
+    return {'metadata': {'name': name, 'namespace': 'chain', 'uid': uid, 'resourceVersion': '7'},
+            'spec': {'nodeName': node, 'volumes': volumes},
+            'status': {'phase': phase}}
+
+
+class _FakeApi(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.server.requests.append(self.path)
+        if 'watch=1' in parsed.query:
+            body = ''.join(json.dumps(e) + '\n' for e in self.server.watch_events).encode()
+        elif parsed.path in self.server.routes:
+            body = json.dumps(self.server.routes[parsed.path]).encode()
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class DiscoveryAndWatch(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeApi)
+        self.server.requests = []
+        self.server.watch_events = []
+        self.server.routes = {
+            '/api/v1/namespaces/chain/pods': {'items': [_pod('geth-0', UID_A, pvc='geth-data')]},
+            '/api/v1/namespaces/chain/persistentvolumeclaims/geth-data': {'spec': {'volumeName': 'pv-1'}},
+            '/api/v1/persistentvolumes/pv-1': {'spec': {'local': {'path': '/dev/nvme1n1'}}},
+        }
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        client = K8sApiClient(api_server=f'http://127.0.0.1:{self.server.server_address[1]}', token='t')
+        self.registry = npc.PodRegistry(client, ['chain'], 'node-1', exclude_pod='collector-x')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_discovery_is_node_scoped_and_reuses_listed_pods(self):
+        self.registry.discover('chain')
+        targets = self.registry.targets()
+        self.assertEqual([t.key for t in targets], ['chain/geth-0'])
+        self.assertEqual(targets[0].pod_uid, UID_A)
+        self.assertIn('fieldSelector=spec.nodeName%3Dnode-1', self.server.requests[0])
+        self.assertFalse(any(r.endswith('/pods/geth-0') for r in self.server.requests))
+
+    def test_watch_events_add_remove_and_skip_known_pods(self):
+        self.registry.discover('chain')
+        calls = len(self.server.requests)
+        self.registry.apply_event({'type': 'MODIFIED', 'object': _pod('geth-0', UID_A)})
+        self.assertEqual(len(self.server.requests), calls)
+
+        self.registry.apply_event({'type': 'ADDED', 'object': _pod('geth-1', UID_B)})
+        self.registry.apply_event({'type': 'ADDED', 'object': _pod('other', UID_C, node='node-2')})
+        self.registry.apply_event({'type': 'ADDED', 'object': _pod('collector-x', UID_C)})
+        self.assertEqual(sorted(t.key for t in self.registry.targets()), ['chain/geth-0', 'chain/geth-1'])
+
+        self.registry.apply_event({'type': 'MODIFIED', 'object': _pod('geth-1', UID_B, phase='Succeeded')})
+        self.registry.apply_event({'type': 'DELETED', 'object': _pod('geth-0', UID_A)})
+        self.assertEqual(self.registry.targets(), [])
+
+    def test_client_watch_streams_events(self):
+        self.server.watch_events = [
+            {'type': 'ADDED', 'object': _pod('geth-0', UID_A)},
+            {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '9'}}},
+        ]
+        events = list(self.registry.client.watch_namespaced_pods('chain', node_name='node-1',
+                                                                 resource_version='5'))
+        self.assertEqual([e['type'] for e in events], ['ADDED', 'BOOKMARK'])
+        self.assertIn('resourceVersion=5', self.server.requests[-1])
+
+
+class OnePassSampling(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cg = os.path.join(self.root, 'cgroup')
+        self.proc = os.path.join(self.root, 'proc')
+        os.makedirs(self.proc)
+        a = os.path.join(self.cg, 'kubepods.slice', 'kubepods-burstable.slice',
+                         f"kubepods-burstable-pod{UID_A.replace('-', '_')}.slice")
+        b = os.path.join(self.cg, 'kubepods', 'besteffort', f'pod{UID_B}')
+        for path, rbytes in ((a, 4096), (b, 8192)):
+            os.makedirs(os.path.join(path, 'cri-containerd-abc.scope'))
+            with open(os.path.join(path, 'io.stat'), 'w') as fh:
+                fh.write(f'259:0 rbytes={rbytes} wbytes=0 rios=1 wios=0 dbytes=0 dios=0\n')
+            with open(os.path.join(path, 'cpu.stat'), 'w') as fh:
+                fh.write('usage_usec 1000\n')
+        with open(os.path.join(self.proc, 'diskstats'), 'w') as fh:
+            fh.write(' 259 0 nvme1n1 10 0 80 5 20 0 160 7 0 12 12\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _sampler(self, targets):
+        registry = npc.PodRegistry(client=None, namespaces=[], node_name='node-1')
+        for t in targets:
+            registry._targets[t.key] = t
+        layout = {'CGROUP_VERSION': 'v2', 'CGROUP_ROOT': self.cg}
+        return npc.NodeSampler(registry, npc.RowBuffer(10), layout=layout,
+                               host_proc=self.proc, node_name='node-1')
+
+    def test_index_handles_systemd_and_cgroupfs_names(self):
+        index = npc.index_pod_cgroups(self.cg)
+        self.assertEqual(set(index), {UID_A, UID_B})
+        self.assertTrue(index[UID_B].endswith(f'/besteffort/pod{UID_B}'))
+
+    def test_tick_samples_every_pod_and_volume(self):
+        sampler = self._sampler([
+            npc.PodTarget('chain', 'geth-0', UID_A, volumes=[('data', 'nvme1n1')]),
+            npc.PodTarget('chain', 'geth-1', UID_B),
+            npc.PodTarget('chain', 'gone', UID_C),
+        ])
+        rows = {r['pod']: r for r in sampler.tick(now=1_700_000_000)}
+        self.assertEqual(rows['geth-0']['cgroup_io_rbytes'], 4096)
+        self.assertEqual(rows['geth-1']['cgroup_io_rbytes'], 8192)
+        self.assertEqual(rows['geth-0']['cgroup_meta_source'], 'v2')
+        self.assertEqual(rows['gone']['cgroup_meta_source'], 'unresolved')
+        self.assertEqual(rows['geth-0']['volumes'][0]['read_sectors'], 80)
+        self.assertEqual(rows['geth-0']['pods_on_node'], 3)
+        self.assertEqual([r['seq'] for r in sampler.buffer.since(0)], [1, 2, 3])
+
+    def test_endpoint_serves_ndjson_since_seq(self):
+        sampler = self._sampler([npc.PodTarget('chain', 'geth-0', UID_A)])
+        sampler.registry.discovered.set()
+        daemon = npc.NodeCollectorDaemon(sampler.registry, sampler, interval=0.05,
+                                         bind='127.0.0.1', port=0)
+        daemon.start(watch=False)
+        try:
+            url = f'http://127.0.0.1:{daemon.port}'
+            for _ in range(100):
+                if sampler.ticks >= 2:
+                    break
+                daemon.stop_event.wait(0.05)
+            rows, next_since = npc.pull_rows(url, since=0, limit=1)
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(next_since, 1)
+            rest, _ = npc.pull_rows(url, since=next_since)
+            self.assertTrue(rest)
+            self.assertTrue(all(r['seq'] > 1 for r in rest))
+            self.assertTrue(daemon.ready())
+            self.assertTrue(daemon.healthy())
+        finally:
+            daemon.stop()
+
+    def test_row_buffer_drops_oldest(self):
+        buf = npc.RowBuffer(3)
+        buf.extend([{'n': i} for i in range(5)])
+        self.assertEqual([r['seq'] for r in buf.since(0)], [3, 4, 5])
+        self.assertEqual([r['seq'] for r in buf.since(4)], [5])
+        self.assertEqual(buf.since(5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
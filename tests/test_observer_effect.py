@@ -0,0 +1,106 @@
+"""Unit tests for the monitoring observer-effect A/B summary.
+
+Round reports are synthetic Vegeta JSON files; the profile rotation is checked
+by sourcing lib/observer_ab.sh.
+
+Run: python3 tests/test_observer_effect.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis.observer_effect import (  # noqa: E402
+    compute_deltas,
+    main,
+    max_sustained_qps,
+    mean_ci,
+    read_rounds,
+)
+
+
+def _write_round(directory, rep, profile, qps, success=1.0, p99_ms=10.0, mean_ms=2.0):
+    path = Path(directory) / f"r{rep}_{profile}_{qps}qps.json"
+    path.write_text(json.dumps({
+        "requests": qps * 10, "success": success, "throughput": qps * success,
+        "latencies": {"mean": int(mean_ms * 1e6), "99th": int(p99_ms * 1e6)},
+    }))
+
+
+class TestStats(unittest.TestCase):
+    def test_mean_ci_student_t(self):
+        mean, lo, hi = mean_ci([1.0, 2.0, 3.0])
+        self.assertAlmostEqual(mean, 2.0)
+        # t(0.975, 2) = 4.303; sd = 1; half width = 4.303 / sqrt(3)
+        self.assertAlmostEqual(hi - mean, 2.4842, places=3)
+        self.assertAlmostEqual(mean - lo, hi - mean)
+        self.assertEqual(mean_ci([5.0]), (5.0, None, None))
+
+    def test_max_sustained_qps_uses_executor_gate(self):
+        with tempfile.TemporaryDirectory() as d:
+            _write_round(d, 0, "off", 1000)
+            _write_round(d, 0, "off", 2000, mean_ms=1500)
+            _write_round(d, 0, "off", 3000, success=0.9)
+            rounds = read_rounds(d)
+        self.assertEqual(max_sustained_qps(rounds, 95.0, 1000.0), 1000)
+
+
+class TestDeltas(unittest.TestCase):
+    def _fixture(self, d):
+        # full costs 2 ms of p99 and fails the top level; minimal is free.
+        for rep in range(3):
+            for qps in (1000, 2000):
+                _write_round(d, rep, "off", qps, p99_ms=10.0 + rep)
+                _write_round(d, rep, "minimal", qps, p99_ms=10.0 + rep)
+                _write_round(d, rep, "full", qps, p99_ms=12.0 + rep,
+                             success=0.9 if qps == 2000 else 1.0)
+
+    def test_paired_deltas_against_off(self):
+        with tempfile.TemporaryDirectory() as d:
+            self._fixture(d)
+            deltas = compute_deltas(read_rounds(d))
+        index = {(x.metric, x.profile, x.qps): x for x in deltas}
+        p99 = index[("p99_ms", "full", 1000)]
+        self.assertEqual(p99.n, 3)
+        self.assertAlmostEqual(p99.mean, 2.0)
+        self.assertAlmostEqual(p99.ci_low, 2.0)
+        self.assertAlmostEqual(index[("success_pct", "full", 2000)].mean, -10.0)
+        self.assertAlmostEqual(index[("max_qps", "full", None)].mean, -1000)
+        self.assertAlmostEqual(index[("max_qps", "minimal", None)].mean, 0)
+        self.assertNotIn(("p99_ms", "off", 1000), index)
+
+    def test_cli_writes_json_and_markdown(self):
+        with tempfile.TemporaryDirectory() as d:
+            self._fixture(d)
+            out, md = Path(d) / "observer_effect.json", Path(d) / "observer_effect.md"
+            with open(os.devnull, "w") as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    rc = main(["--rounds-dir", d, "--output", str(out), "--markdown", str(md)])
+                finally:
+                    sys.stdout = stdout
+            self.assertEqual(rc, 0)
+            payload = json.loads(out.read_text())
+            self.assertEqual(payload["profiles"], ["full", "minimal", "off"])
+            self.assertEqual(payload["repetitions"], 3)
+            self.assertIn("| full | 2000 |", md.read_text())
+
+
+class TestProfileRotation(unittest.TestCase):
+    def test_each_profile_takes_each_position(self):
+        script = (f'source "{REPO}/lib/observer_ab.sh"; '
+                  'for r in 0 1 2; do observer_ab_profile_order "$r" 0 | paste -sd, -; done')
+        out = subprocess.run(["bash", "-c", script], capture_output=True, text=True,
+                             check=True).stdout.split()
+        self.assertEqual(out, ["full,minimal,off", "minimal,off,full", "off,full,minimal"])
+
+
+if __name__ == "__main__":
+    unittest.main()
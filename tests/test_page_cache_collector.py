@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""page_cache_collector.py sampling contract and residency correlation merge.
+
+Covers mount point resolution from a synthetic /proc, the rotating
+files-per-tick budget, coverage accounting across rescans, CSV output in
+--run mode, and the CPUDiskCorrelationAnalyzer join of residency columns
+onto performance rows.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO / 'monitoring'))
+sys.path.insert(0, str(REPO))
+
+import page_cache_collector as pcc  # noqa: E402
+
+
+class _FakeMincore:
+    """Reports half of every file as resident and records which files were probed."""
+
+    available = True
+
+    def __init__(self):
+        self.calls = []
+
+    def resident_bytes(self, path, size, window_bytes):
+        self.calls.append(path)
+        return size // 2
+
+
+class MountResolution(unittest.TestCase):
+    def setUp(self):
+        self.proc = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.proc, '1'))
+        with open(os.path.join(self.proc, '1', 'mounts'), 'w') as fh:
+            fh.write('/dev/sda1 / ext4 rw 0 0\n'
+                     '/dev/nvme1n1p1 /mnt/ledger xfs rw 0 0\n'
+                     '/dev/sdc /mnt/accounts\\040disk ext4 rw 0 0\n'
+                     'tmpfs /dev/shm tmpfs rw 0 0\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.proc)
+
+    def test_partition_resolves_to_whole_disk(self):
+        self.assertEqual(pcc.resolve_device_mountpoint('nvme1n1', self.proc), '/mnt/ledger')
+        self.assertEqual(pcc.resolve_device_mountpoint('sda', self.proc), '/')
+
+    def test_escaped_space_and_unknown_device(self):
+        self.assertEqual(pcc.resolve_device_mountpoint('sdc', self.proc), '/mnt/accounts disk')
+        self.assertIsNone(pcc.resolve_device_mountpoint('nvme0n1', self.proc))
+        self.assertIsNone(pcc.resolve_device_mountpoint('', self.proc))
+
+
+class IncrementalSampling(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, 'sub'))
+        for i in range(5):
+            with open(os.path.join(self.root, 'sub' if i % 2 else '', f'f{i}'), 'wb') as fh:
+                fh.write(b'x' * (4096 * (i + 1)))
+        self.fake = _FakeMincore()
+        self.sampler = pcc.PageCacheSampler({'data': self.root}, files_per_tick=2,
+                                            rescan_ticks=100, mincore=self.fake)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_budget_and_coverage_grow_per_tick(self):
+        self.sampler.tick()
+        snap = self.sampler.states['data'].snapshot()
+        self.assertEqual(len(self.fake.calls), 2)
+        self.assertEqual(snap['files_total'], 5)
+        self.assertEqual(snap['files_sampled'], 2)
+        self.assertLess(snap['coverage_ratio'], 1.0)
+
+        self.sampler.tick()
+        self.sampler.tick()
+        snap = self.sampler.states['data'].snapshot()
+        self.assertEqual(snap['files_sampled'], 5)
+        self.assertEqual(snap['coverage_ratio'], 1.0)
+        self.assertEqual(snap['residency_ratio'], 0.5)
+        # Rotation wraps: the sixth probe revisits a file instead of stopping.
+        self.assertEqual(len(set(self.fake.calls)), 5)
+
+    def test_rescan_keeps_residency_for_unchanged_files(self):
+        self.sampler.full_pass()
+        with open(os.path.join(self.root, 'new'), 'wb') as fh:
+            fh.write(b'y' * 4096)
+        self.sampler.ticks = 0  # force a rescan on the next tick
+        self.sampler.files_per_tick = 1
+        self.sampler.tick()
+        snap = self.sampler.states['data'].snapshot()
+        self.assertEqual(snap['files_total'], 6)
+        self.assertGreaterEqual(snap['files_sampled'], 5)
+
+    def test_empty_directory_is_not_rescanned_every_tick(self):
+        empty = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, empty)
+        sampler = pcc.PageCacheSampler({'data': empty}, rescan_ticks=3, mincore=self.fake)
+        sampler.tick()
+        with open(os.path.join(empty, 'late'), 'wb') as fh:
+            fh.write(b'z' * 4096)
+        sampler.tick()
+        sampler.tick()
+        self.assertEqual(sampler.states['data'].snapshot()['files_total'], 0)
+        sampler.tick()  # tick 3 is the scheduled rescan
+        self.assertEqual(sampler.states['data'].snapshot()['files_total'], 1)
+
+    def test_row_matches_header_and_missing_accounts_is_zero(self):
+        self.sampler.full_pass()
+        header = pcc.csv_header().split(',')
+        row = self.sampler.row()
+        self.assertEqual(len(header), len(row) + 1)
+        accounts = dict(zip(header[1:], row))
+        self.assertEqual(accounts['pagecache_accounts_total_bytes'], '0')
+
+    def test_top_files_ranked_by_size(self):
+        self.sampler.full_pass()
+        rows = self.sampler.top_file_rows('2026-01-01 00:00:00', 3)
+        self.assertEqual([r[2] for r in rows], ['1', '2', '3'])
+        self.assertTrue(rows[0][3].endswith('f4'))
+
+
+class RealMincore(unittest.TestCase):
+    def test_freshly_written_file_is_resident(self):
+        probe = pcc._Mincore()
+        if not probe.available:
+            self.skipTest('mincore() not available on this platform')
+        with tempfile.NamedTemporaryFile() as fh:
+            fh.write(os.urandom(64 * 1024))
+            fh.flush()
+            resident = probe.resident_bytes(fh.name, 64 * 1024, window_bytes=16 * 1024)
+        self.assertIsNotNone(resident)
+        self.assertGreater(resident, 0)
+        self.assertLessEqual(resident, 64 * 1024)
+
+    def test_run_mode_writes_both_csvs(self):
+        root = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(root, 'ledger.bin'), 'wb') as fh:
+                fh.write(b'z' * 8192)
+            out = os.path.join(root, 'out', 'page_cache.csv')
+            files_out = os.path.join(root, 'out', 'page_cache_files.csv')
+            sampler = pcc.PageCacheSampler({'data': root}, mincore=_FakeMincore())
+            pcc.run(sampler, out, files_out, interval=0.1, duration=0.01, top_n=5)
+            lines = Path(out).read_text().splitlines()
+            self.assertEqual(lines[0], pcc.csv_header())
+            self.assertEqual(len(lines), 2)
+            file_lines = Path(files_out).read_text().splitlines()
+            self.assertEqual(file_lines[0], ','.join(pcc.FILE_FIELDS))
+            self.assertIn('ledger.bin', file_lines[1])
+        finally:
+            shutil.rmtree(root)
+
+
+class CorrelationMerge(unittest.TestCase):
+    def test_residency_merged_and_correlated_with_read_iops(self):
+        from analysis.cpu_disk_correlation_analyzer import CPUDiskCorrelationAnalyzer
+
+        work = tempfile.mkdtemp()
+        try:
+            perf = os.path.join(work, 'performance_20260101_000000.csv')
+            cache = os.path.join(work, 'page_cache_20260101_000000.csv')
+            with open(perf, 'w') as fh:
+                fh.write('timestamp,cpu_iowait,cpu_usr,cpu_sys,cpu_idle,cpu_soft,'
+                         'data_nvme1n1_util,data_nvme1n1_r_s,data_nvme1n1_r_await\n')
+                for i in range(20):
+                    fh.write(f'2026-01-01 00:00:{i * 2:02d},{i % 5},{10 + i},{5},{80 - i},{1},'
+                             f'{20 + i},{1000 + 100 * i},{0.2 + 0.01 * i}\n')
+            with open(cache, 'w') as fh:
+                fh.write(pcc.csv_header() + '\n')
+                for i in range(20):
+                    ratio = round(0.9 - 0.03 * i, 4)
+                    fh.write(f'2026-01-01 00:00:{i * 2:02d},{ratio},1,1,{ratio},1.0,1,1,0,0,0,0,0,0,0\n')
+
+            analyzer = CPUDiskCorrelationAnalyzer(perf)
+            self.assertEqual(analyzer.page_cache_file, cache)
+            results = analyzer.run_complete_analysis()
+            page_cache = results['page_cache_correlations']
+            self.assertIn('residency_vs_data_read_iops', page_cache)
+            self.assertLess(page_cache['residency_vs_data_read_iops']['correlation'], -0.9)
+            self.assertIn('residency_vs_data_read_latency', page_cache)
+            self.assertEqual(len(analyzer.df), 20)
+            self.assertIn('Page Cache Residency', analyzer.generate_comprehensive_report())
+        finally:
+            shutil.rmtree(work)
+
+
+if __name__ == '__main__':
+    unittest.main()
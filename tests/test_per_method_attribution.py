@@ -3,11 +3,12 @@
 Coverage:
 - read_proxy_csv: skips __unmatched__ and parses ns timestamps
 - read_monitor_csv: adapts timestamp formats (s/ms/ns)
-- _percentile: empty/single/p50/p99 boundaries
-- compute_per_method_qps: second buckets, error counts, p50/p99
+- percentile: empty/single/p50/p99 boundaries
+- compute_per_method_qps: second buckets, error counts, p50/p99, batched calls
 - compute_per_method_resource: weight=count/total and skips missing monitor seconds
 - filter_proxy_records_by_methods: excludes block-height/health probe methods
 - write_qps_csv / write_resource_csv: headers, ordering, and float formatting
+- aggregate sink: header detection, histogram percentiles, count-weighted attribution
 
 Run: python3 tests/test_per_method_attribution.py
 """
@@ -27,14 +28,20 @@ from analysis.per_method_attribution import (  # noqa: E402
     MonitorRecord,
     PerMethodQpsRow,
     PerMethodResourceRow,
+    ProxyAggregate,
     ProxyRecord,
     _parse_bool,
-    _percentile,
     compute_per_method_qps,
     compute_per_method_resource,
     filter_proxy_records_by_methods,
+    hist_bucket,
+    hist_percentile_ms,
+    parse_hist,
+    percentile,
     read_monitor_csv,
     read_proxy_csv,
+    read_proxy_sink,
+    request_count,
     write_qps_csv,
     write_resource_csv,
 )
@@ -46,19 +53,19 @@ def _ns(sec: int, ms: int = 0) -> int:
 
 class TestPercentile(unittest.TestCase):
     def test_empty(self):
-        self.assertEqual(_percentile([], 0.5), 0.0)
+        self.assertEqual(percentile([], 50), 0.0)
 
     def test_single(self):
-        self.assertEqual(_percentile([42.0], 0.99), 42.0)
+        self.assertEqual(percentile([42.0], 99), 42.0)
 
     def test_p50_even(self):
         # [1,2,3,4] — p50 idx = 0.5*3 = 1.5 → 2 + 0.5*(3-2) = 2.5
-        self.assertAlmostEqual(_percentile([1, 2, 3, 4], 0.5), 2.5)
+        self.assertAlmostEqual(percentile([1, 2, 3, 4], 50), 2.5)
 
     def test_p99_large(self):
         vs = list(range(1, 101))  # 1..100
         # idx = 0.99 * 99 = 98.01 → 99 + 0.01*(100-99) = 99.01
-        self.assertAlmostEqual(_percentile(vs, 0.99), 99.01)
+        self.assertAlmostEqual(percentile(vs, 99), 99.01)
 
 
 class TestReadProxyCsv(unittest.TestCase):
@@ -118,6 +125,24 @@ class TestReadProxyCsv(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_prefers_latency_us_and_keeps_legacy_ms(self):
+        path = self._write_csv([
+            {"timestamp_ns": _ns(100), "method_name": "eth_blockNumber", "protocol": "json_rpc",
+             "request_id": "1", "batch_idx": "0", "status_code": "200",
+             "latency_ms": "0", "upstream": "", "client_addr": "", "latency_us": "420"},
+            {"timestamp_ns": _ns(100), "method_name": "eth_blockNumber", "protocol": "json_rpc",
+             "request_id": "2", "batch_idx": "0", "status_code": "200",
+             "latency_ms": "3", "upstream": "", "client_addr": "", "latency_us": ""},
+        ])
+        try:
+            fast, legacy = list(read_proxy_csv(path))
+            self.assertAlmostEqual(fast.latency_ms, 0.42)
+            self.assertEqual(fast.latency_us, 420)
+            self.assertEqual(legacy.latency_ms, 3.0)
+            self.assertEqual(legacy.latency_us, 3000)
+        finally:
+            os.unlink(path)
+
     def test_parse_bool_defaults(self):
         self.assertTrue(_parse_bool("", default=True))
         self.assertFalse(_parse_bool("", default=False))
@@ -209,6 +234,16 @@ class TestComputePerMethodQps(unittest.TestCase):
         self.assertAlmostEqual(rows[1].p99_ms, 3.98)
         self.assertEqual(rows[2].qps, 1)
 
+    def test_sub_millisecond_percentiles(self):
+        recs = [_make_proxy(100, "getSlot", latency_ms=us / 1000) for us in (120, 180, 240, 900)]
+        row = compute_per_method_qps(recs)[0]
+        self.assertAlmostEqual(row.p50_ms, 0.21)
+        self.assertAlmostEqual(row.p99_ms, 0.8802)  # 0.24 + 0.97 * (0.9 - 0.24)
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "qps.csv"
+            write_qps_csv([row], out)
+            self.assertIn("0.210", out.read_text())
+
     def test_error_count(self):
         recs = [
             _make_proxy(100, "getSlot", status=200),
@@ -222,6 +257,21 @@ class TestComputePerMethodQps(unittest.TestCase):
         self.assertEqual(rows[0].qps, 5)
 
 
+    def test_batched_calls_count_per_call(self):
+        # One HTTP batch of three calls, split by the proxy into batch_idx 0..2.
+        recs = [_make_proxy(100, m, latency_ms=40) for m in ("getBalance", "getBalance", "getSlot")]
+        for idx, r in enumerate(recs):
+            r.batch_idx = idx
+        recs[1].rpc_success = False
+        rows = {r.method_name: r for r in compute_per_method_qps(recs)}
+        self.assertEqual((rows["getBalance"].qps, rows["getBalance"].error_count), (2, 1))
+        self.assertEqual(rows["getSlot"].qps, 1)
+        self.assertEqual(request_count(recs), 3)
+        weights = {r.method_name: r.weight for r in
+                   compute_per_method_resource(recs, [MonitorRecord(100, 30.0, 900.0)])}
+        self.assertAlmostEqual(weights["getBalance"], 2 / 3)
+
+
 class TestFilterProxyRecords(unittest.TestCase):
     def test_filters_health_probe_when_allowed_methods_known(self):
         recs = [
@@ -307,6 +357,58 @@ class TestWriteCsv(unittest.TestCase):
             os.unlink(path)
 
 
+class TestAggregateSink(unittest.TestCase):
+    HEADER = ["timestamp_s", "method_name", "protocol", "status_class", "count", "rpc_errors",
+              "transport_errors", "latency_sum_us", "latency_max_us", "latency_hist"]
+
+    def _write(self, rows):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        self.addCleanup(os.unlink, path)
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(self.HEADER)
+            w.writerows(rows)
+        return path
+
+    def test_hist_bucket_matches_go_sink(self):
+        self.assertEqual([hist_bucket(us) for us in (0, 1, 2, 16, 17, 1000)], [0, 0, 4, 16, 17, 40])
+        self.assertEqual(parse_hist("40:3;44:1;bad;"), {40: 3, 44: 1})
+
+    def test_hist_percentile_upper_bound_capped_at_max(self):
+        hist = {hist_bucket(1000): 90, hist_bucket(8000): 10}
+        self.assertAlmostEqual(hist_percentile_ms(hist, 0.5), 2 ** (40 / 4) / 1000)
+        self.assertAlmostEqual(hist_percentile_ms(hist, 0.99, max_us=7000), 7.0)
+        self.assertEqual(hist_percentile_ms({}, 0.5), 0.0)
+
+    def test_read_proxy_sink_detects_format(self):
+        path = self._write([
+            [100, "getSlot", "json_rpc", "2xx", 3, 1, 0, 6000, 3000, "40:2;46:1"],
+            [100, "__unmatched__", "", "4xx", 1, 1, 1, 100, 100, "27:1"],
+        ])
+        rows = list(read_proxy_sink(path))
+        self.assertEqual(len(rows), 1)
+        self.assertIsInstance(rows[0], ProxyAggregate)
+        self.assertEqual(rows[0].hist, {40: 2, 46: 1})
+        self.assertEqual(request_count(rows), 3)
+
+    def test_qps_and_resource_from_buckets(self):
+        path = self._write([
+            [100, "getSlot", "json_rpc", "2xx", 8, 0, 0, 8000, 1000, "40:8"],
+            [100, "getSlot", "json_rpc", "5xx", 2, 2, 2, 60000, 30000, "60:2"],
+            [100, "getBalance", "json_rpc", "2xx", 10, 0, 0, 50000, 5000, "50:10"],
+        ])
+        rows = list(read_proxy_sink(path))
+        qps = {r.method_name: r for r in compute_per_method_qps(rows)}
+        self.assertEqual(qps["getSlot"].qps, 10)
+        self.assertEqual(qps["getSlot"].error_count, 2)
+        self.assertAlmostEqual(qps["getSlot"].p50_ms, 1.024)
+        self.assertAlmostEqual(qps["getSlot"].p99_ms, 30.0)
+        resource = compute_per_method_resource(rows, [MonitorRecord(100, 40.0, 1000.0)])
+        weights = {r.method_name: r.weight for r in resource}
+        self.assertEqual(weights, {"getBalance": 0.5, "getSlot": 0.5})
+
+
 class TestE2eFixture(unittest.TestCase):
     """End-to-end fixture check: attribution writes both output CSVs."""
 
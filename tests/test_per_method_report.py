@@ -101,6 +101,12 @@ class TestComputeSummary(unittest.TestCase):
         self.assertAlmostEqual(summary[0]["max_p99_ms"], 9.0)
         self.assertAlmostEqual(summary[0]["peak_cpu_share_pct"], 80.0)  # max weight a 0.8
 
+    def test_sub_millisecond_latency_keeps_microseconds(self):
+        summary = compute_summary([PerMethodQpsRow(100, "eth_blockNumber", 10, 0, 0.18, 0.35, 0.42)], [])
+        html_out = render_per_method_section("en", "eth", {}, summary)
+        self.assertIn("<td style=\"padding:5px 10px;border:1px solid #ddd;\">0.180</td>", html_out)
+        self.assertIn("0.420", html_out)
+
     def test_top_n_truncates(self):
         qps_rows = [PerMethodQpsRow(100, f"m{i}", 100 - i, 0, 1, 1, 1) for i in range(20)]
         summary = compute_summary(qps_rows, [], top_n=5)
@@ -176,7 +182,8 @@ class TestRenderHtml(unittest.TestCase):
     def test_get_chart_titles_for_language(self):
         en = get_chart_titles_for_language("en")
         zh = get_chart_titles_for_language("zh")
-        self.assertEqual(set(en.keys()), {"qps", "latency", "latency_percentiles", "error_rate", "success_failure", "resource"})
+        self.assertEqual(set(en.keys()), {"qps", "latency", "latency_percentiles", "error_rate", "success_failure", "resource",
+                                        "saturation"})
         self.assertNotEqual(en["qps"], zh["qps"])
 
 
@@ -407,6 +414,40 @@ class TestReportGeneratorRuntimePaths(unittest.TestCase):
             self.assertNotIn("getHealth", content)
             self.assertIn("Excluded Probe Records", content)
 
+    def test_proxy_count_reads_aggregate_sink(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            logs_dir = root / "logs"
+            logs_dir.mkdir()
+
+            perf_csv = logs_dir / "performance_latest.csv"
+            with open(perf_csv, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["timestamp", "cpu_usage", "mem_used", "cloud_provider"])
+                w.writerow(["1700000000", "10", "20", "aws"])
+
+            proxy_csv = logs_dir / "proxy_method.csv"
+            with open(proxy_csv, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["timestamp_s", "method_name", "protocol", "status_class", "count",
+                            "rpc_errors", "transport_errors", "latency_sum_us", "latency_max_us",
+                            "latency_hist"])
+                w.writerow([1700000000, "getBalance", "json_rpc", "2xx", 40, 0, 0, 80000, 2000, "44:40"])
+                w.writerow([1700000000, "getHealth", "json_rpc", "2xx", 5, 0, 0, 5000, 1000, "40:5"])
+
+            old_env = dict(os.environ)
+            try:
+                os.environ["LOGS_DIR"] = str(logs_dir)
+                os.environ["BLOCKCHAIN_NODE"] = "solana"
+                os.environ["PROXY_METHOD_CSV"] = str(proxy_csv)
+                generator = ReportGenerator(str(perf_csv), language="en")
+                counts = generator._read_proxy_record_count()
+            finally:
+                os.environ.clear()
+                os.environ.update(old_env)
+
+            self.assertEqual(counts, (45, 40, 5))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
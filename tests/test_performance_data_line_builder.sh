@@ -17,13 +17,14 @@ overhead_data="16,17"
 block_height_data="18,19,20,1,1,0,absolute_gap,healthy,0,block,0,null"
 cgroup_data="21,22"
 cloud_provider="aws"
+empty_process_data=",,,,,,,,,,,,,,"
 
 non_ena_line="$(build_performance_data_line \
     false "$timestamp" "$cpu_data" "$memory_data" "$device_data" "$network_data" \
     "$ena_data" "$overhead_data" "$block_height_data" "30"$'\n' "40"$'\r' "true"$'\n' \
     "$cgroup_data" "$cloud_provider")"
 
-expected_non_ena="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$overhead_data,$block_height_data,30,40,true,$cgroup_data,$cloud_provider"
+expected_non_ena="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$overhead_data,$block_height_data,30,40,true,$cgroup_data,$empty_process_data,$cloud_provider"
 [[ "$non_ena_line" == "$expected_non_ena" ]] || {
     echo "Non-ENA line mismatch"
     echo "expected: $expected_non_ena"
@@ -36,7 +37,7 @@ ena_line="$(build_performance_data_line \
     "$ena_data" "$overhead_data" "$block_height_data" "30" "40" "true" \
     "$cgroup_data" "$cloud_provider")"
 
-expected_ena="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$ena_data,$overhead_data,$block_height_data,30,40,true,$cgroup_data,$cloud_provider"
+expected_ena="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$ena_data,$overhead_data,$block_height_data,30,40,true,$cgroup_data,$empty_process_data,$cloud_provider"
 [[ "$ena_line" == "$expected_ena" ]] || {
     echo "ENA line mismatch"
     echo "expected: $expected_ena"
@@ -44,4 +45,18 @@ expected_ena="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$ena_
     exit 1
 }
 
+process_data="50,51,node"
+process_line="$(build_performance_data_line \
+    false "$timestamp" "$cpu_data" "$memory_data" "$device_data" "$network_data" \
+    "$ena_data" "$overhead_data" "$block_height_data" "30" "40" "true" \
+    "$cgroup_data" "$cloud_provider" "$process_data")"
+
+expected_process="$timestamp,$cpu_data,$memory_data,$device_data,$network_data,$overhead_data,$block_height_data,30,40,true,$cgroup_data,$process_data,$cloud_provider"
+[[ "$process_line" == "$expected_process" ]] || {
+    echo "Process accounting line mismatch"
+    echo "expected: $expected_process"
+    echo "actual:   $process_line"
+    exit 1
+}
+
 echo "✅ performance_data_line_builder preserves CSV field order"
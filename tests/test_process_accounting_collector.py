@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""process_accounting_collector.py delta contract against a synthetic /proc.
+
+Covers per-thread schedstat summation, /proc/<pid>/io deltas, PID reuse and
+stale-state handling, the fixed 15-column row, and the report section that
+turns the columns into node share of device I/O per QPS level.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO / 'monitoring'))
+sys.path.insert(0, str(REPO))
+
+import process_accounting_collector as pac  # noqa: E402
+
+
+def _write_pid(proc, pid, start, io, threads):
+    base = os.path.join(proc, pid)
+    os.makedirs(os.path.join(base, 'task'), exist_ok=True)
+    fields = ['S'] + ['0'] * 18 + [str(start)] + ['0'] * 10
+    with open(os.path.join(base, 'stat'), 'w') as fh:
+        fh.write(f"{pid} (node (main)) {' '.join(fields)}\n")
+    with open(os.path.join(base, 'io'), 'w') as fh:
+        fh.write(''.join(f'{k}: {v}\n' for k, v in io.items()))
+    shutil.rmtree(os.path.join(base, 'task'))
+    for tid, (run_ns, wait_ns, slices) in threads.items():
+        os.makedirs(os.path.join(base, 'task', tid))
+        with open(os.path.join(base, 'task', tid, 'schedstat'), 'w') as fh:
+            fh.write(f'{run_ns} {wait_ns} {slices}\n')
+
+
+class ProcessAccountingDeltas(unittest.TestCase):
+    def setUp(self):
+        self.proc = tempfile.mkdtemp()
+        self.state = os.path.join(self.proc, 'state', 'process_accounting_state.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.proc)
+
+    def _io(self, rb, wb, r, w):
+        return {'rchar': 1, 'read_bytes': rb, 'write_bytes': wb, 'syscr': r, 'syscw': w}
+
+    def test_first_sample_then_rates(self):
+        _write_pid(self.proc, '100', 555, self._io(0, 0, 0, 0),
+                   {'100': (0, 0, 0), '101': (0, 0, 0)})
+        _write_pid(self.proc, '200', 777, self._io(0, 0, 0, 0), {'200': (0, 0, 0)})
+        first = pac.collect(['100'], ['200'], self.state, host_proc=self.proc, now=1000.0)
+        self.assertEqual(first['proc_meta_source'], 'first_sample')
+        self.assertEqual(first['proc_node_read_bytes_s'], 0.0)
+        self.assertEqual(first['proc_node_threads'], 2)
+
+        _write_pid(self.proc, '100', 555, self._io(10 * 4096, 5 * 4096, 50, 20),
+                   {'100': (0, 200_000_000, 100), '101': (0, 300_000_000, 400)})
+        _write_pid(self.proc, '200', 777, self._io(4096, 0, 10, 0), {'200': (0, 0, 0)})
+        row = pac.collect(['100'], ['200'], self.state, host_proc=self.proc, now=1005.0)
+        self.assertEqual(row['proc_meta_source'], 'ok')
+        self.assertAlmostEqual(row['proc_node_read_bytes_s'], 2 * 4096)
+        self.assertAlmostEqual(row['proc_node_write_bytes_s'], 4096)
+        self.assertAlmostEqual(row['proc_node_syscr_s'], 10)
+        # 500 ms of wait over 5 s across both threads, 500 slices → 1000 µs each.
+        self.assertAlmostEqual(row['proc_node_runq_wait_ms_s'], 100)
+        self.assertAlmostEqual(row['proc_node_runq_delay_us'], 1000)
+        self.assertAlmostEqual(row['proc_monitor_read_bytes_s'], 4096 / 5)
+
+    def test_pid_reuse_and_stale_state_produce_no_delta(self):
+        _write_pid(self.proc, '100', 555, self._io(0, 0, 0, 0), {'100': (0, 0, 0)})
+        pac.collect(['100'], [], self.state, host_proc=self.proc, now=1000.0)
+        _write_pid(self.proc, '100', 999, self._io(10**9, 0, 0, 0), {'100': (0, 10**9, 1)})
+        row = pac.collect(['100'], [], self.state, host_proc=self.proc, now=1005.0)
+        self.assertEqual(row['proc_node_read_bytes_s'], 0.0)
+        self.assertEqual(row['proc_node_runq_wait_ms_s'], 0.0)
+
+        _write_pid(self.proc, '100', 999, self._io(2 * 10**9, 0, 0, 0), {'100': (0, 10**9, 1)})
+        row = pac.collect(['100'], [], self.state, host_proc=self.proc,
+                          now=1005.0 + pac.MAX_SAMPLE_GAP_S + 1)
+        self.assertEqual(row['proc_meta_source'], 'first_sample')
+        self.assertEqual(row['proc_node_read_bytes_s'], 0.0)
+
+    def test_missing_pids_and_row_shape(self):
+        pac.collect(['4242'], ['4343'], self.state, host_proc=self.proc, now=1000.0)
+        row = pac.collect(['4242'], ['4343'], self.state, host_proc=self.proc, now=1005.0)
+        self.assertEqual(row['proc_meta_source'], 'no_pids')
+        line = pac.format_row(row)
+        self.assertEqual(len(line.split(',')), len(pac.ALL_FIELDS))
+        self.assertEqual(len(pac.ALL_FIELDS), 15)
+
+    def test_wrapper_placeholder_header_matches_collector(self):
+        wrapper = (REPO / 'monitoring' / 'lib' / 'process_accounting_wrapper.sh').read_text()
+        self.assertIn(f'PROCESS_ACCOUNTING_PLACEHOLDER_HEADER="{",".join(pac.ALL_FIELDS)}"', wrapper)
+
+
+class ProcessAccountingReportSection(unittest.TestCase):
+    def test_node_share_per_qps_level(self):
+        import pandas as pd
+        from visualization.report_generator import ReportGenerator, TRANSLATIONS
+
+        df = pd.DataFrame({
+            'current_qps': [1000, 1000, 2000, 2000],
+            'data_nvme1n1_rkb_s': [100, 100, 200, 200],
+            'data_nvme1n1_wkb_s': [10, 10, 10, 10],
+            'proc_node_read_bytes_s': [50 * 1024, 50 * 1024, 180 * 1024, 180 * 1024],
+            'proc_node_write_bytes_s': [10 * 1024] * 4,
+            'proc_monitor_read_bytes_s': [0, 0, 0, 0],
+            'proc_monitor_write_bytes_s': [1024] * 4,
+            'proc_node_runq_wait_ms_s': [5, 5, 400, 600],
+            'proc_node_runq_delay_us': [10, 10, 900, 1100],
+            'proc_meta_source': ['ok'] * 4,
+        })
+        stub = type('Stub', (), {'t': TRANSLATIONS['en']})()
+        html = ReportGenerator._generate_process_accounting_section(stub, df)
+        self.assertIn(TRANSLATIONS['en']['process_accounting_title'], html)
+        self.assertIn('50.0%', html)
+        self.assertIn('90.0%', html)
+        self.assertIn('2,000', html)
+        self.assertEqual(ReportGenerator._generate_process_accounting_section(stub, df.drop(
+            columns=['proc_node_read_bytes_s'])), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
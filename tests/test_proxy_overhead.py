@@ -0,0 +1,165 @@
+"""Unit tests for proxy-overhead calibration and corrected per-method latency.
+
+Vegeta is replaced by an injected runner, so no binary or node is needed.
+
+Run: python3 tests/test_proxy_overhead.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.per_method_attribution import PerMethodQpsRow  # noqa: E402
+from analysis.proxy_overhead import (  # noqa: E402
+    LatencyStats,
+    OverheadPoint,
+    calibrate,
+    correct_qps_rows,
+    flag_saturated_rounds,
+    load_curve,
+    overhead_at,
+    parse_vegeta_report,
+    rewrite_targets,
+    write_curve,
+)
+from visualization.per_method_report import compute_summary, render_per_method_section  # noqa: E402
+
+
+def _stats(p50, p99=None):
+    return LatencyStats(requests=100, success=1.0, mean_ms=p50, p50_ms=p50, p90_ms=p50,
+                        p99_ms=p99 if p99 is not None else p50)
+
+
+def _curve():
+    return [
+        OverheadPoint.from_rounds(1000, _stats(1.0, 2.0), _stats(1.2, 2.5)),
+        OverheadPoint.from_rounds(3000, _stats(1.0, 2.0), _stats(1.6, 3.5)),
+    ]
+
+
+class TestVegetaHelpers(unittest.TestCase):
+    def test_rewrite_targets_keeps_path_and_body(self):
+        with tempfile.TemporaryDirectory() as d:
+            src, dst = Path(d) / "t.json", Path(d) / "out.json"
+            src.write_text(
+                json.dumps({"method": "POST", "url": "http://10.0.0.1:8545/rpc?x=1", "body": "e30="})
+                + "\n\n"
+                + json.dumps({"method": "POST", "url": "http://10.0.0.1:8545", "body": "e30="})
+                + "\n"
+            )
+            self.assertEqual(rewrite_targets(src, dst, "http://127.0.0.1:18546"), 2)
+            lines = [json.loads(x) for x in dst.read_text().splitlines()]
+        self.assertEqual(lines[0]["url"], "http://127.0.0.1:18546/rpc?x=1")
+        self.assertEqual(lines[1]["url"], "http://127.0.0.1:18546")
+        self.assertEqual(lines[0]["body"], "e30=")
+
+    def test_parse_vegeta_report_converts_ns_to_ms(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "r.json"
+            path.write_text(json.dumps({
+                "requests": 500, "success": 0.99,
+                "latencies": {"mean": 1_500_000, "50th": 1_000_000, "90th": 2_000_000,
+                              "99th": 4_250_000},
+            }))
+            s = parse_vegeta_report(path)
+        self.assertEqual(s.requests, 500)
+        self.assertAlmostEqual(s.p50_ms, 1.0)
+        self.assertAlmostEqual(s.p99_ms, 4.25)
+
+
+class TestCalibrate(unittest.TestCase):
+    def test_paired_rounds_produce_overhead_curve(self):
+        calls = []
+
+        def runner(targets, qps, duration_s, report_path):
+            proxied = "proxied" in str(targets)
+            calls.append((qps, proxied))
+            base = qps / 1000.0
+            return _stats(base + (0.3 if proxied else 0.0), base * 2 + (0.9 if proxied else 0.0))
+
+        with tempfile.TemporaryDirectory() as d:
+            targets = Path(d) / "targets.json"
+            targets.write_text(json.dumps({"method": "POST", "url": "http://n:1", "body": ""}) + "\n")
+            points = calibrate(targets, "http://n:1", "http://p:2", [1000, 2000], 1,
+                               Path(d) / "calib", runner=runner, pause_s=0)
+            out = Path(d) / "proxy_overhead.json"
+            write_curve(points, out, cpu_cores=2, duration_s=1)
+            loaded = load_curve(out)
+
+        self.assertEqual([p.qps for p in points], [1000, 2000])
+        self.assertEqual(len(calls), 4)
+        # Leg order alternates so drift does not bias one side.
+        self.assertNotEqual(calls[0][1], calls[2][1])
+        for p in loaded:
+            self.assertAlmostEqual(p.overhead_p50_ms, 0.3)
+            self.assertAlmostEqual(p.overhead_p99_ms, 0.9)
+
+    def test_load_curve_missing_file(self):
+        self.assertEqual(load_curve("/nonexistent/proxy_overhead.json"), [])
+
+
+class TestCorrection(unittest.TestCase):
+    def test_overhead_interpolates_and_clamps(self):
+        curve = _curve()
+        self.assertAlmostEqual(overhead_at(curve, 500)[0], 0.2)
+        self.assertAlmostEqual(overhead_at(curve, 2000)[0], 0.4)
+        self.assertAlmostEqual(overhead_at(curve, 2000)[2], 1.0)
+        self.assertAlmostEqual(overhead_at(curve, 9000)[2], 1.5)
+        self.assertEqual(overhead_at([], 100), (0.0, 0.0, 0.0))
+
+    def test_correct_rows_uses_total_qps_per_second(self):
+        rows = [
+            PerMethodQpsRow(1, "eth_call", 1500, 0, 1.0, 1.0, 3.0),
+            PerMethodQpsRow(1, "eth_getBalance", 500, 0, 0.3, 0.3, 0.5),
+        ]
+        corrected = correct_qps_rows(rows, _curve())
+        # total 2000 QPS -> overhead p50 0.4, p99 1.0; never below zero.
+        self.assertAlmostEqual(corrected[0].p50_ms, 0.6)
+        self.assertAlmostEqual(corrected[0].p99_ms, 2.0)
+        self.assertEqual(corrected[1].p50_ms, 0.0)
+        self.assertEqual(rows[0].p50_ms, 1.0)
+
+    def test_summary_and_section_show_corrected_columns(self):
+        rows = [PerMethodQpsRow(1, "eth_call", 1000, 0, 1.0, 1.0, 3.0)]
+        summary = compute_summary(rows, [], corrected_rows=correct_qps_rows(rows, _curve()))
+        self.assertAlmostEqual(summary[0]["corr_p50_ms"], 0.8)
+        html = render_per_method_section(
+            "en", "eth", {}, summary,
+            calibration={"points": _curve(), "saturated_rounds": [
+                {"qps": 3000, "seconds": 4, "peak_cpu_pct": 190.0}],
+                "cpu_cores": 2, "threshold_pct": 80.0},
+        )
+        self.assertIn("Corrected p50 (ms)", html)
+        self.assertIn("Proxy Overhead Calibration", html)
+        self.assertIn("3,000 QPS", html)
+        plain = render_per_method_section("en", "eth", {}, compute_summary(rows, []))
+        self.assertNotIn("Corrected p50", plain)
+
+
+class TestSaturation(unittest.TestCase):
+    def test_rounds_above_threshold_are_flagged(self):
+        with tempfile.TemporaryDirectory() as d:
+            self_csv = Path(d) / "proxy_self.csv"
+            monitor_csv = Path(d) / "monitor.csv"
+            base = 1_700_000_000
+            self_csv.write_text("timestamp_ns,cpu_pct,mem_mb\n" + "".join(
+                f"{(base + i) * 10**9},{cpu},50\n"
+                for i, cpu in enumerate([40, 60, 170, 185, 90])
+            ))
+            monitor_csv.write_text("timestamp,current_qps\n" + "".join(
+                f"{base + i},{qps}\n" for i, qps in [(0, 1000), (2, 4000), (4, 5000)]
+            ))
+            flagged = flag_saturated_rounds(self_csv, monitor_csv, cpu_cores=2, threshold_pct=80)
+        self.assertEqual(flagged, [{"qps": 4000, "seconds": 2, "peak_cpu_pct": 185.0}])
+
+    def test_missing_files_flag_nothing(self):
+        self.assertEqual(flag_saturated_rounds("/nonexistent/a", "/nonexistent/b", 1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
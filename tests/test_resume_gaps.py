@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Resume gaps from RUN_CHECKPOINT_JSON: chart line breaks and the report section."""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from utils import resume_gaps  # noqa: E402
+from utils.csv_data_processor import CSVDataProcessor  # noqa: E402
+from report_fixtures import make_report_generator, patch_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+START = pd.Timestamp('2026-06-11 12:00:00')
+
+
+def _write_session(d, gap_start_s=20, gap_end_s=320):
+    rows = ['timestamp,cpu_usage']
+    for s in list(range(0, gap_start_s, 5)) + list(range(gap_end_s, gap_end_s + 20, 5)):
+        rows.append(f"{(START + pd.Timedelta(seconds=s)).strftime('%Y-%m-%d %H:%M:%S')},{10 + s % 7}")
+    Path(d, 'performance_20260611_120000.csv').write_text('\n'.join(rows) + '\n')
+    Path(d, 'run_checkpoint_20260611_120000.json').write_text(json.dumps({
+        'session': '20260611_120000', 'status': 'running', 'rounds': [{'qps': 1000}],
+        'resumes': [{
+            'interrupted_after': int((START + pd.Timedelta(seconds=gap_start_s)).timestamp()),
+            'resumed_at': int((START + pd.Timedelta(seconds=gap_end_s)).timestamp()),
+            'rounds_completed': 1,
+            'dropped_rows': {'performance_20260611_120000.csv': 12},
+        }],
+    }))
+
+
+class ResumeGaps(unittest.TestCase):
+    def setUp(self):
+        patch_env(self, unset=('RUN_CHECKPOINT_JSON',))
+
+    def test_processor_breaks_series_inside_gap(self):
+        with tempfile.TemporaryDirectory() as d:
+            _write_session(d)
+            processor = CSVDataProcessor()
+            self.assertTrue(processor.load_csv_data(os.path.join(d, 'performance_20260611_120000.csv')))
+            self.assertTrue(processor.clean_data())
+        df = processor.df
+        self.assertEqual(len(df), 9)
+        separator = df[df['cpu_usage'].isna()]
+        self.assertEqual(len(separator), 1)
+        self.assertEqual(separator.index[0], 4)  # between the last pre-gap and first post-gap sample
+        self.assertTrue(df['timestamp'].is_monotonic_increasing)
+
+    def test_uninterrupted_session_is_untouched(self):
+        df = pd.DataFrame({'timestamp': pd.date_range(START, periods=3, freq='5s'), 'cpu_usage': [1, 2, 3]})
+        self.assertIs(resume_gaps.break_at_gaps(df, []), df)
+        with tempfile.TemporaryDirectory() as d:
+            self.assertEqual(resume_gaps.load_resume_gaps(d), [])
+
+    def test_report_lists_gap(self):
+        with tempfile.TemporaryDirectory() as d:
+            _write_session(d)
+            section = make_report_generator(d)._generate_resume_gaps_section()
+        self.assertIn(TRANSLATIONS['en']['resume_gaps_title'], section)
+        self.assertIn('<td>300</td>', section)
+        self.assertIn('performance_20260611_120000.csv: 12', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Per-round checkpoint and --resume contract for lib/run_checkpoint.sh:
+# stored arguments, loop state, detector counters and CSV truncation.
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$REPO_ROOT"
+
+work="$(mktemp -d /tmp/bnb-checkpoint.XXXXXX)"
+trap 'rm -rf "$work"' EXIT
+
+fail() { echo "FAIL: $*"; exit 1; }
+
+# shellcheck source=/dev/null
+source lib/run_checkpoint.sh
+
+(checkpoint_scan_resume_arg --resume bogus >/dev/null 2>&1) && fail "malformed session id accepted"
+(checkpoint_scan_resume_arg --mixed --resume >/dev/null 2>&1) && fail "--resume without a session id accepted"
+checkpoint_scan_resume_arg --mixed
+[[ -z "$RESUME_SESSION" ]] || fail "no --resume should leave RESUME_SESSION empty"
+checkpoint_scan_resume_arg --intensive --resume session_20260611_120000 --mixed
+[[ "$RESUME_SESSION" == "20260611_120000" && "$SESSION_TIMESTAMP" == "20260611_120000" ]] \
+    || fail "--resume did not set the session"
+unset RESUME_SESSION
+
+export MEMORY_SHARE_DIR="$work/shm"
+export RUN_CHECKPOINT_JSON="$work/logs/run_checkpoint_${SESSION_TIMESTAMP}.json"
+export BOTTLENECK_COUNTERS_FILE="$MEMORY_SHARE_DIR/bottleneck_counters.json"
+export QPS_STATUS_FILE="$MEMORY_SHARE_DIR/qps_status.json"
+export UNIFIED_LOG="$work/logs/performance_${SESSION_TIMESTAMP}.csv"
+export PROXY_METHOD_CSV="$work/logs/proxy_method.csv"
+export NETWORK_CSV="$work/logs/network_${SESSION_TIMESTAMP}.csv"
+mkdir -p "$MEMORY_SHARE_DIR" "$work/logs"
+
+checkpoint_init --intensive --mixed --initial-qps 1000
+printf 'timestamp,cpu_usage\nt1,10\nt2,20\n' > "$UNIFIED_LOG"
+printf 'ts,method\n1,getSlot\n' > "$PROXY_METHOD_CSV"
+echo '{"cpu_count": 2, "rpc_latency_count": 1}' > "$BOTTLENECK_COUNTERS_FILE"
+LAST_SUCCESSFUL_QPS=1000 BOTTLENECK_COUNT=1 checkpoint_save_round 1000 true 1250
+
+[[ "$(checkpoint_get '.next_qps')" == "1250" ]] || fail "next_qps not saved"
+[[ "$(checkpoint_get '.bottleneck_count')" == "1" ]] || fail "bottleneck_count not saved"
+[[ "$(checkpoint_get '.bottleneck_detector_counters.cpu_count')" == "2" ]] || fail "detector counters not saved"
+[[ "$(checkpoint_get '.rounds[0].passed')" == "true" ]] || fail "round result not saved"
+
+# The interrupted round wrote more rows, and the network CSV appeared after the checkpoint.
+printf 't3,90\nt4,95\n' >> "$UNIFIED_LOG"
+printf '2,getSlot\n3,getSlot\n4,getSlot\n' >> "$PROXY_METHOD_CSV"
+printf 'timestamp,rx\nt3,1\n' > "$NETWORK_CSV"
+rm -f "$BOTTLENECK_COUNTERS_FILE"
+
+RESUME_SESSION="$SESSION_TIMESTAMP"
+checkpoint_load_args
+[[ "${RESUME_ARGS[*]}" == "--intensive --mixed --initial-qps 1000" ]] || fail "stored args: ${RESUME_ARGS[*]}"
+checkpoint_prepare_resume >/dev/null
+
+[[ "$(tail -1 "$UNIFIED_LOG")" == "t2,20" ]] || fail "performance CSV not truncated to the checkpoint"
+[[ "$(wc -l < "$PROXY_METHOD_CSV")" == "2" ]] || fail "proxy CSV not truncated to the checkpoint"
+[[ "$(cat "$NETWORK_CSV")" == "timestamp,rx" ]] || fail "post-checkpoint CSV should keep only its header"
+[[ "$(checkpoint_get '.resumes[0].dropped_rows["performance_20260611_120000.csv"]')" == "2" ]] \
+    || fail "dropped rows not recorded"
+[[ "$(checkpoint_get '.resumes[0].rounds_completed')" == "1" ]] || fail "rounds_completed not recorded"
+[[ "$(jq -r '.cpu_count' "$BOTTLENECK_COUNTERS_FILE")" == "2" ]] || fail "detector counters not restored"
+
+echo '{"status": "completed", "max_successful_qps": 1000}' > "$QPS_STATUS_FILE"
+checkpoint_mark_qps_complete
+[[ "$(checkpoint_get '.qps_status.max_successful_qps')" == "1000" ]] || fail "QPS status not stored"
+checkpoint_mark_completed
+checkpoint_load_args 2>/dev/null && fail "completed session must not resume"
+
+echo "✅ Run checkpoint and resume contract holds"
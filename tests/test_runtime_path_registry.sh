@@ -44,9 +44,37 @@ assert_eq "$PERFORMANCE_LATEST_CSV" "$logs_dir/performance_latest.csv" "PERFORMA
 assert_eq "$MONITORING_OVERHEAD_LOG" "$logs_dir/monitoring_overhead_${SESSION_TIMESTAMP}.csv" "MONITORING_OVERHEAD_LOG"
 assert_eq "$PROXY_METHOD_CSV" "$logs_dir/proxy_method.csv" "PROXY_METHOD_CSV"
 assert_eq "$PROXY_SELF_CSV" "$logs_dir/proxy_self.csv" "PROXY_SELF_CSV"
+assert_eq "$PROXY_SAMPLE_CSV" "$logs_dir/proxy_method_sample.csv" "PROXY_SAMPLE_CSV"
+assert_eq "$PROXY_CAPTURE_JSONL" "$logs_dir/proxy_capture.jsonl" "PROXY_CAPTURE_JSONL"
+assert_eq "$PROXY_OVERHEAD_JSON" "$logs_dir/proxy_overhead.json" "PROXY_OVERHEAD_JSON"
+assert_eq "$PROXY_CALIBRATION_DIR" "$logs_dir/proxy_calibration" "PROXY_CALIBRATION_DIR"
+assert_eq "$OBSERVER_AB_DIR" "$logs_dir/observer_ab" "OBSERVER_AB_DIR"
+assert_eq "$SWEEP_DIR" "$logs_dir/sweep_${SESSION_TIMESTAMP}" "SWEEP_DIR"
+assert_eq "$SWEEP_RESULTS_CSV" "$logs_dir/sweep_results_${SESSION_TIMESTAMP}.csv" "SWEEP_RESULTS_CSV"
+assert_eq "$WS_SUBSCRIPTIONS_CSV" "$logs_dir/ws_subscriptions_${SESSION_TIMESTAMP}.csv" "WS_SUBSCRIPTIONS_CSV"
+assert_eq "$BATCH_SWEEP_CSV" "$logs_dir/batch_sweep_${SESSION_TIMESTAMP}.csv" "BATCH_SWEEP_CSV"
+assert_eq "$REPLAY_RESULTS_CSV" "$logs_dir/replay_${SESSION_TIMESTAMP}.csv" "REPLAY_RESULTS_CSV"
+assert_eq "$CPU_LAYOUT_JSON" "$logs_dir/cpu_layout.json" "CPU_LAYOUT_JSON"
+assert_eq "$CPU_ROLE_CSV" "$logs_dir/cpu_role_${SESSION_TIMESTAMP}.csv" "CPU_ROLE_CSV"
+assert_eq "$ROUND_PHASES_CSV" "$logs_dir/round_phases_${SESSION_TIMESTAMP}.csv" "ROUND_PHASES_CSV"
+assert_eq "$VEGETA_WORKERS_CSV" "$logs_dir/vegeta_workers_${SESSION_TIMESTAMP}.csv" "VEGETA_WORKERS_CSV"
+assert_eq "$GENERATOR_ROUNDS_CSV" "$logs_dir/generator_rounds_${SESSION_TIMESTAMP}.csv" "GENERATOR_ROUNDS_CSV"
+assert_eq "$LOAD_CURVE_CSV" "$logs_dir/load_curve_${SESSION_TIMESTAMP}.csv" "LOAD_CURVE_CSV"
+assert_eq "$SLO_ROUNDS_CSV" "$logs_dir/slo_rounds_${SESSION_TIMESTAMP}.csv" "SLO_ROUNDS_CSV"
+assert_eq "$SLO_CAPACITY_JSON" "$logs_dir/slo_capacity_${SESSION_TIMESTAMP}.json" "SLO_CAPACITY_JSON"
+assert_eq "$USL_MODEL_JSON" "$logs_dir/usl_model_${SESSION_TIMESTAMP}.json" "USL_MODEL_JSON"
+assert_eq "$METHOD_COST_JSON" "$logs_dir/method_cost_${SESSION_TIMESTAMP}.json" "METHOD_COST_JSON"
+assert_eq "$METHOD_PROFILE_CSV" "$logs_dir/method_profile_${SESSION_TIMESTAMP}.csv" "METHOD_PROFILE_CSV"
+assert_eq "$METHOD_PROFILE_JSON" "$logs_dir/method_profile_${SESSION_TIMESTAMP}.json" "METHOD_PROFILE_JSON"
+assert_eq "$COMPARE_DIR" "$logs_dir/compare_${SESSION_TIMESTAMP}" "COMPARE_DIR"
+assert_eq "$COMPARE_RESULTS_CSV" "$logs_dir/compare_results_${SESSION_TIMESTAMP}.csv" "COMPARE_RESULTS_CSV"
+assert_eq "$COMPARE_SUMMARY_JSON" "$logs_dir/compare_summary_${SESSION_TIMESTAMP}.json" "COMPARE_SUMMARY_JSON"
+assert_eq "$RUN_CHECKPOINT_JSON" "$logs_dir/run_checkpoint_${SESSION_TIMESTAMP}.json" "RUN_CHECKPOINT_JSON"
 assert_eq "$RPC_PROXY_LOG" "$logs_dir/rpc_proxy.log" "RPC_PROXY_LOG"
 assert_eq "$NETWORK_CSV" "$logs_dir/network_${SESSION_TIMESTAMP}.csv" "NETWORK_CSV"
 assert_eq "$NETWORK_PID_FILE" "$tmp_dir/network_monitor.pid" "NETWORK_PID_FILE"
+assert_eq "$PAGE_CACHE_CSV" "$logs_dir/page_cache_${SESSION_TIMESTAMP}.csv" "PAGE_CACHE_CSV"
+assert_eq "$PAGE_CACHE_FILES_CSV" "$logs_dir/page_cache_files_${SESSION_TIMESTAMP}.csv" "PAGE_CACHE_FILES_CSV"
 assert_eq "$LATEST_METRICS_FILE" "$memory_dir/latest_metrics.json" "LATEST_METRICS_FILE"
 assert_eq "$UNIFIED_METRICS_FILE" "$memory_dir/unified_metrics.json" "UNIFIED_METRICS_FILE"
 assert_eq "$BLOCK_HEIGHT_CACHE_FILE" "$memory_dir/block_height_monitor_cache.json" "BLOCK_HEIGHT_CACHE_FILE"
@@ -62,8 +90,8 @@ export_snapshot="$TEST_ROOT/export_snapshot.txt"
 export -p >"$export_snapshot"
 
 for exported_var in \
-    UNIFIED_LOG PERFORMANCE_LATEST_CSV PROXY_METHOD_CSV PROXY_SELF_CSV RPC_PROXY_LOG \
-    NETWORK_CSV NETWORK_PID_FILE LATEST_METRICS_FILE UNIFIED_METRICS_FILE \
+    UNIFIED_LOG PERFORMANCE_LATEST_CSV PROXY_METHOD_CSV PROXY_SELF_CSV PROXY_SAMPLE_CSV PROXY_CAPTURE_JSONL PROXY_OVERHEAD_JSON PROXY_CALIBRATION_DIR OBSERVER_AB_DIR SWEEP_DIR SWEEP_RESULTS_CSV WS_SUBSCRIPTIONS_CSV BATCH_SWEEP_CSV REPLAY_RESULTS_CSV CPU_LAYOUT_JSON CPU_ROLE_CSV ROUND_PHASES_CSV VEGETA_WORKERS_CSV GENERATOR_ROUNDS_CSV LOAD_CURVE_CSV SLO_ROUNDS_CSV SLO_CAPACITY_JSON USL_MODEL_JSON METHOD_COST_JSON METHOD_PROFILE_CSV METHOD_PROFILE_JSON COMPARE_DIR COMPARE_RESULTS_CSV COMPARE_SUMMARY_JSON RUN_CHECKPOINT_JSON RPC_PROXY_LOG \
+    NETWORK_CSV NETWORK_PID_FILE PAGE_CACHE_CSV PAGE_CACHE_FILES_CSV LATEST_METRICS_FILE UNIFIED_METRICS_FILE \
     BLOCK_HEIGHT_CACHE_FILE QPS_STATUS_FILE BOTTLENECK_STATUS_FILE BOTTLENECK_COUNTERS_FILE NODE_HEALTH_CACHE_DIR \
     UNIFIED_EVENTS_FILE EVENT_MANAGER_LOCK_FILE EVENT_NOTIFICATION_FILE; do
     if ! grep -q "declare -x ${exported_var}=" "$export_snapshot"; then
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""SLO capacity search over per-method proxy results.
+
+Coverage:
+- Slo.violations: unset bounds are unchecked
+- load_slo_spec: defaults inherited per method, unknown keys and bad values rejected
+- round_rows: window filtering and per-method checks from raw and aggregate sink rows
+- capacity: passing levels above the first failure are noise, the binding method limits the mix
+- next_qps: bisects the widest unresolved gap and stops at the resolution
+- append_csv / read_rounds: round trip
+- report section: capacity headline and per-method table
+
+Run: python3 tests/test_slo_capacity.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import slo_capacity  # noqa: E402
+from analysis.per_method_attribution import ProxyAggregate, ProxyRecord, hist_bucket  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+T0 = 1781179200  # 2026-06-11 12:00:00 UTC
+
+
+def _raw(offset_s, method, latency_ms, ok=True):
+    return ProxyRecord(timestamp_ns=int((T0 + offset_s) * 1e9), method_name=method, protocol="jsonrpc",
+                       request_id="1", batch_idx=0, status_code=200, latency_ms=latency_ms, upstream="up",
+                       client_addr="c", rpc_success=ok)
+
+
+def _round(qps, method, passed):
+    return {"qps": qps, "method": method, "calls": qps * 60, "rate": qps / 2, "p50_ms": 1.0,
+            "p99_ms": 10.0 if passed else 900.0, "error_pct": 0.0, "passed": passed,
+            "violations": "" if passed else "p99"}
+
+
+def _ladder():
+    """a fails at 3000, b at 2000; b passing at 3000 is noise above its failure."""
+    return [_round(1000, "a", True), _round(1000, "b", True),
+            _round(2000, "a", True), _round(2000, "b", False),
+            _round(3000, "a", False), _round(3000, "b", True)]
+
+
+class SloViolations(unittest.TestCase):
+    def test_unset_bounds_are_unchecked(self):
+        self.assertEqual(slo_capacity.Slo().violations(1e6, 1e6, 100.0), [])
+
+    def test_each_exceeded_bound_is_named(self):
+        slo = slo_capacity.Slo(p50_ms=5, p99_ms=50, error_pct=1.0)
+        self.assertEqual(slo.violations(6, 60, 2.0), ["p50", "p99", "errors"])
+        self.assertEqual(slo.violations(5, 50, 1.0), [])
+
+
+class SpecLoading(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.path = os.path.join(self.dir.name, "slo.json")
+
+    def _load(self, raw, default=None):
+        Path(self.path).write_text(json.dumps(raw))
+        return slo_capacity.load_slo_spec(self.path, default or slo_capacity.Slo())
+
+    def test_methods_inherit_the_spec_default(self):
+        spec = self._load({"default": {"p99_ms": 200}, "methods": {"eth_call": {"p99_ms": 800}}},
+                          slo_capacity.Slo(p99_ms=500, error_pct=1.0))
+        self.assertEqual(spec.for_method("eth_call"), slo_capacity.Slo(0.0, 800.0, 1.0))
+        self.assertEqual(spec.for_method("eth_getBalance"), slo_capacity.Slo(0.0, 200.0, 1.0))
+
+    def test_no_spec_file_uses_the_cli_default(self):
+        self.assertEqual(slo_capacity.load_slo_spec(None, slo_capacity.Slo(p50_ms=5)).for_method("x").p50_ms, 5)
+
+    def test_unknown_key_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._load({"methods": {"eth_call": {"p95_ms": 800}}})
+
+    def test_negative_or_boolean_value_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self._load({"default": {"p99_ms": -1}})
+        with self.assertRaises(ValueError):
+            self._load({"default": {"error_pct": True}})
+
+
+class RoundRows(unittest.TestCase):
+    def setUp(self):
+        self.spec = slo_capacity.SloSpec(slo_capacity.Slo(p99_ms=50, error_pct=1.0), {})
+
+    def test_raw_rows_are_checked_per_method_in_the_window(self):
+        rows = ([_raw(i / 100, "eth_blockNumber", 2.0) for i in range(100)]
+                + [_raw(i / 100, "eth_call", 100.0 if i >= 95 else 10.0) for i in range(100)]
+                + [_raw(5, "eth_call", 900.0)])  # after the window
+        result = {r["method"]: r for r in slo_capacity.round_rows(rows, 1000, T0, T0 + 1, self.spec)}
+        self.assertTrue(result["eth_blockNumber"]["passed"])
+        self.assertEqual((result["eth_call"]["calls"], result["eth_call"]["p99_ms"]), (100, 100.0))
+        self.assertEqual(result["eth_call"]["violations"], "p99")
+
+    def test_failed_rpc_counts_as_error(self):
+        rows = [_raw(0, "eth_call", 1.0, ok=i >= 10) for i in range(100)]
+        (row,) = slo_capacity.round_rows(rows, 1000, T0, T0 + 1, self.spec)
+        self.assertEqual((row["error_pct"], row["violations"]), (10.0, "errors"))
+
+    def test_aggregate_rows_use_the_histogram(self):
+        hist = {hist_bucket(1000): 97, hist_bucket(30000): 3}
+        agg = [ProxyAggregate(T0, "getSlot", "jsonrpc", "2xx", 100, 2, 0, 0, 30000, hist)]
+        (row,) = slo_capacity.round_rows(agg, 1000, T0, T0 + 1, self.spec)
+        self.assertEqual((row["calls"], row["error_pct"], row["violations"]), (100, 2.0, "errors"))
+        self.assertAlmostEqual(row["p99_ms"], 30.0)
+
+
+class Capacity(unittest.TestCase):
+    def test_passing_above_the_first_failure_is_noise(self):
+        cap = slo_capacity.capacity(_ladder())
+        self.assertEqual((cap["methods"]["a"]["max_qps"], cap["methods"]["b"]["max_qps"]), (2000, 1000))
+        self.assertEqual(cap["methods"]["b"]["first_failing_qps"], 2000)
+
+    def test_binding_method_limits_the_mix(self):
+        cap = slo_capacity.capacity(_ladder())
+        self.assertEqual((cap["max_qps"], cap["binding_method"], cap["all_bounded"]), (1000, "b", True))
+
+    def test_repeated_level_fails_if_any_repetition_failed(self):
+        cap = slo_capacity.capacity([_round(1000, "a", True), _round(2000, "a", False), _round(2000, "a", True)])
+        self.assertEqual(cap["methods"]["a"]["first_failing_qps"], 2000)
+
+    def test_unbounded_method(self):
+        cap = slo_capacity.capacity([_round(1000, "a", True)])
+        self.assertEqual((cap["max_qps"], cap["all_bounded"]), (1000, False))
+
+
+class NextQps(unittest.TestCase):
+    def test_bisects_the_lower_gap_first(self):
+        self.assertEqual(slo_capacity.next_qps(_ladder(), 50), 1500)
+
+    def test_moves_on_once_a_gap_is_tested(self):
+        rounds = _ladder() + [_round(1500, "a", True), _round(1500, "b", True)]
+        self.assertEqual(slo_capacity.next_qps(rounds, 50), 2500)
+
+    def test_stops_at_the_resolution(self):
+        self.assertIsNone(slo_capacity.next_qps(_ladder(), 1000))
+
+
+class RoundsCsv(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as d:
+            csv_path = os.path.join(d, "slo_rounds_20260611_120000.csv")
+            slo_capacity.append_csv(csv_path, _ladder())
+            self.assertEqual(slo_capacity.read_rounds(csv_path), _ladder())
+
+    def test_missing_file_has_no_rounds(self):
+        self.assertEqual(slo_capacity.read_rounds("/nonexistent/slo_rounds.csv"), [])
+
+
+class ReportSection(unittest.TestCase):
+    def test_capacity_headline_and_method_table(self):
+        rounds = _ladder() + [_round(1500, "a", True), _round(1500, "b", True)]
+        with tempfile.TemporaryDirectory() as d:
+            csv_path = os.path.join(d, "slo_rounds_20260611_120000.csv")
+            slo_capacity.append_csv(csv_path, rounds)
+            out = os.path.join(d, "slo_capacity_20260611_120000.json")
+            self.assertEqual(slo_capacity.main(["capacity", "--rounds", csv_path, "--output", out,
+                                                "--p99-ms", "500"]), 0)
+            with report_env(unset=('SLO_CAPACITY_JSON',)):
+                section = make_report_generator(d)._generate_slo_capacity_section()
+        self.assertIn(TRANSLATIONS['en']['slo_capacity_title'], section)
+        self.assertIn('up to 1500 QPS, limited by b', section)
+        self.assertIn('<td>2000 (p99)</td>', section)
+        self.assertIn('p99 &le; 500 ms', section)
+        self.assertNotIn('<tr class="warning">', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
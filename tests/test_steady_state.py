@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Warmup steady-state detection on Vegeta result streams and the round phases section."""
+import io
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import steady_state as ss  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+T0 = datetime(2026, 6, 11, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _stream(latency_ms_for_second, seconds, rate=10, code_for_second=lambda s: 200):
+    """Vegeta `encode -to json` lines; latency and status may vary per second."""
+    lines = []
+    for sec in range(seconds):
+        for i in range(rate):
+            ts = T0 + timedelta(seconds=sec, microseconds=i * 1000 * (1000 // rate))
+            lines.append(json.dumps({
+                'timestamp': ts.strftime('%Y-%m-%dT%H:%M:%S.%f') + '123Z',
+                'latency': int(latency_ms_for_second(sec) * 1e6),
+                'code': code_for_second(sec),
+                'error': '' if code_for_second(sec) == 200 else 'boom',
+            }))
+    return lines
+
+
+class Detection(unittest.TestCase):
+    def test_flat_latency_is_steady_after_minimum(self):
+        out = io.StringIO()
+        detector = ss.SteadyStateDetector(window=5, min_s=10)
+        result = ss.run(_stream(lambda s: 20.0, 60), detector, out)
+        self.assertTrue(result['steady'])
+        self.assertEqual(result['warmup_s'], 10)
+        self.assertEqual(json.loads(out.getvalue()), result)
+
+    def test_decaying_latency_waits_for_plateau(self):
+        # Cold start: 200 ms falling to 20 ms by second 20, then flat.
+        latency = lambda s: max(20.0, 200.0 - 9.0 * s)  # noqa: E731
+        result = ss.run(_stream(latency, 60), ss.SteadyStateDetector(window=5, min_s=10), io.StringIO())
+        self.assertTrue(result['steady'])
+        self.assertGreaterEqual(result['warmup_s'], 25)
+        self.assertAlmostEqual(result['mean_latency_ms'], 20.0, places=3)
+
+    def test_success_rate_shift_delays_steady_state(self):
+        # Errors from second 8 on: windows straddling the shift differ in success rate.
+        code = lambda s: 200 if s < 8 else 503  # noqa: E731
+        result = ss.run(_stream(lambda s: 20.0, 40, code_for_second=code),
+                        ss.SteadyStateDetector(window=5, min_s=10), io.StringIO())
+        self.assertTrue(result['steady'])
+        self.assertEqual(result['warmup_s'], 18)
+        self.assertEqual(result['success_rate'], 0.0)
+
+    def test_noisy_stream_hits_cap(self):
+        latency = lambda s: 20.0 if s % 2 else 60.0  # noqa: E731
+        result = ss.run(_stream(latency, 30), ss.SteadyStateDetector(window=5, min_s=10), io.StringIO())
+        self.assertEqual((result['steady'], result['reason'], result['warmup_s']), (False, 'cap', 30))
+
+    def test_empty_stream(self):
+        result = ss.run(['', 'not json'], ss.SteadyStateDetector(), io.StringIO())
+        self.assertEqual(result['reason'], 'no_data')
+
+
+class RoundPhasesSection(unittest.TestCase):
+    def test_capped_round_is_highlighted(self):
+        with tempfile.TemporaryDirectory() as d:
+            Path(d, 'round_phases_20260611_120000.csv').write_text(
+                'qps,warmup_start,measure_start,measure_end,warmup_s,warmup_result,cooldown_s,cooldown_result\n'
+                '1000,100,118,178,18,steady,12,baseline\n'
+                '2000,190,250,310,60,cap,30,cap\n'
+            )
+            with report_env(unset=('ROUND_PHASES_CSV',)):
+                section = make_report_generator(d)._generate_round_phases_section()
+
+        self.assertIn(TRANSLATIONS['en']['round_phases_title'], section)
+        self.assertEqual(section.count('<tr class="warning">'), 1)
+        self.assertIn(TRANSLATIONS['en']['round_warmup_steady'], section)
+        self.assertIn(TRANSLATIONS['en']['round_cooldown_baseline'], section)
+        self.assertIn('<td>60</td>', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Sweep matrix: spec validation, seeded schedule, tidy results and best sustainable QPS."""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import sweep_matrix  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+SPEC = {
+    "qps": [1000, 2000, 4000],
+    "max_connections": [64, 512],
+    "keepalive": [True, False],
+    "mixes": {"default": None, "balance_heavy": {"eth_getBalance": 8, "eth_blockNumber": 2}},
+    "seed": 7,
+}
+
+
+def _report(success, mean_ms, p99_ms=None):
+    return {"requests": 1000, "success": success, "throughput": 990.0,
+            "latencies": {"mean": int(mean_ms * 1e6), "50th": int(mean_ms * 1e6),
+                          "90th": int(mean_ms * 1e6), "99th": int((p99_ms or mean_ms) * 1e6),
+                          "max": int((p99_ms or mean_ms) * 2e6)}}
+
+
+def _write_sweep(d):
+    """Keep-alive on sustains 4000 QPS; off fails at 2000 but passes 4000 again."""
+    spec = sweep_matrix.parse_spec({**SPEC, "max_connections": [64], "mixes": {"default": None}})
+    cells = sweep_matrix.schedule(sweep_matrix.expand(spec), spec.seed)
+    lines = ["order,cell_id,mix,max_connections,keepalive,qps,rep,started_at,ended_at"]
+    for i, cell in enumerate(cells):
+        lines.append(f"{i},{cell.cell_id},{cell.mix},{cell.max_connections},{str(cell.keepalive).lower()},"
+                     f"{cell.qps},{cell.rep},2026-06-11 12:00:00,2026-06-11 12:00:30")
+        ok = cell.keepalive or cell.qps != 2000
+        if cell.keepalive or cell.qps != 1000:  # keep-alive off at 1000 QPS left no report
+            Path(d, f"{cell.cell_id}.json").write_text(json.dumps(_report(0.999 if ok else 0.5, 20, 80)))
+    Path(d, "schedule.csv").write_text("\n".join(lines) + "\n")
+
+
+class SweepMatrix(unittest.TestCase):
+    def test_expand_covers_full_matrix(self):
+        cells = sweep_matrix.expand(sweep_matrix.parse_spec(SPEC))
+        self.assertEqual(len(cells), 3 * 2 * 2 * 2)
+        self.assertEqual(len({c.cell_id for c in cells}), len(cells))
+        self.assertEqual(len({c.config_id for c in cells}), 8)
+
+    def test_schedule_is_seeded_permutation(self):
+        cells = sweep_matrix.expand(sweep_matrix.parse_spec(SPEC))
+        first = sweep_matrix.schedule(cells, 7)
+        self.assertEqual([c.cell_id for c in first], [c.cell_id for c in sweep_matrix.schedule(cells, 7)])
+        self.assertNotEqual([c.cell_id for c in first], [c.cell_id for c in cells])
+        self.assertEqual(sorted(c.cell_id for c in first), sorted(c.cell_id for c in cells))
+
+    def test_invalid_spec_names_the_key(self):
+        for bad, key in (({**SPEC, "qps": []}, "qps"),
+                         ({**SPEC, "keepalive": ["yes"]}, "keepalive"),
+                         ({**SPEC, "mixes": {"a b": None}}, "a b"),
+                         ({**SPEC, "mixes": {"x": {"eth_call": 0}}}, "x")):
+            with self.assertRaisesRegex(ValueError, key):
+                sweep_matrix.parse_spec(bad)
+        self.assertEqual(sweep_matrix.mix_argument(SPEC["mixes"]["balance_heavy"]),
+                         "eth_getBalance=8,eth_blockNumber=2")
+
+    def test_best_sustainable_stops_at_first_failure(self):
+        with tempfile.TemporaryDirectory() as d:
+            _write_sweep(d)
+            rc = sweep_matrix.main(["summarize", "--schedule", os.path.join(d, "schedule.csv"),
+                                    "--cells-dir", d, "--results", os.path.join(d, "results.csv"),
+                                    "--output", os.path.join(d, "summary.json")])
+            self.assertEqual(rc, 0)
+            summary = json.loads(Path(d, "summary.json").read_text())
+            header = Path(d, "results.csv").read_text().splitlines()[0]
+        self.assertEqual(header.split(","), list(sweep_matrix.RESULT_COLUMNS))
+        best = {c["config_id"]: (c["best_sustainable_qps"], c["first_failing_qps"]) for c in summary["configs"]}
+        self.assertEqual(best["default/c64/ka-on"], (4000, None))
+        # A missing report fails its cell; passing again at 4000 does not count.
+        self.assertEqual(best["default/c64/ka-off"], (0, 1000))
+
+    def test_report_lists_configurations(self):
+        with tempfile.TemporaryDirectory() as d:
+            _write_sweep(d)
+            sweep_matrix.main(["summarize", "--schedule", os.path.join(d, "schedule.csv"), "--cells-dir", d,
+                               "--results", os.path.join(d, "sweep_results_20260611_120000.csv"),
+                               "--output", os.path.join(d, "summary.json")])
+            with report_env(unset=('SWEEP_RESULTS_CSV',)):
+                section = make_report_generator(d)._generate_sweep_section()
+        self.assertIn(TRANSLATIONS['en']['sweep_title'], section)
+        self.assertIn('<td>4000</td>', section)
+        self.assertIn('<td>80.0</td>', section)
+        self.assertIn('<tr class="warning">', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
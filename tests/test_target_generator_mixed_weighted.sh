@@ -1,5 +1,6 @@
 #!/usr/bin/env bash
-# Verify target_generator.sh honors rpc_methods.mixed_weighted in mixed mode.
+# Verify target_generator.sh honors rpc_methods.mixed_weighted in mixed mode,
+# and that --mix (sweep mix variants) replaces those weights.
 
 set -euo pipefail
 
@@ -54,4 +55,35 @@ if counts != expected:
     raise SystemExit(1)
 PY
 
+MIX_TARGETS_FILE="$TMP_DIR/targets_mix.jsonl"
+(
+    cd "$REPO_ROOT"
+    BLOCKCHAIN_NODE=ethereum \
+    RPC_MODE=mixed \
+    LOCAL_RPC_URL=http://127.0.0.1:19000 \
+        ./tools/target_generator.sh \
+            --rpc-mode mixed \
+            --rpc-url http://127.0.0.1:19000 \
+            --mix eth_getBalance=3,eth_blockNumber=1 \
+            -a "$ACCOUNTS_FILE" \
+            -o "$MIX_TARGETS_FILE" \
+            >/dev/null 2>"$ERR_FILE"
+)
+
+python3 - "$MIX_TARGETS_FILE" <<'PY'
+import base64
+import collections
+import json
+import sys
+
+counts = collections.Counter()
+with open(sys.argv[1]) as fh:
+    for line in fh:
+        counts[json.loads(base64.b64decode(json.loads(line)["body"]))["method"]] += 1
+
+if counts != {"eth_getBalance": 75, "eth_blockNumber": 25}:
+    print(f"unexpected --mix distribution: {dict(counts)}", file=sys.stderr)
+    raise SystemExit(1)
+PY
+
 echo "PASS: target_generator mixed_weighted distribution"
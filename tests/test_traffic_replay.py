@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Traffic replay: schedule from raw/aggregate proxy logs, body capture join (truncated bodies rebuilt), native sender and the report section."""
+import asyncio
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / 'tools'))
+
+import traffic_replay as replay  # noqa: E402
+from analysis.per_method_attribution import read_proxy_sink  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+RAW_HEADER = "timestamp_ns,method_name,protocol,request_id,batch_idx,status_code,latency_ms,upstream,client_addr\n"
+T0 = 1_760_000_000_000_000_000
+
+
+def _raw_row(offset_ms, method, batch_idx=0, client="10.0.0.1:5000"):
+    return f"{T0 + offset_ms * 1_000_000},{method},jsonrpc,1,{batch_idx},200,1.0,up,{client}\n"
+
+
+def _write(d, name, text):
+    path = os.path.join(d, name)
+    Path(path).write_text(text)
+    return path
+
+
+class TrafficReplay(unittest.TestCase):
+    def test_raw_log_keeps_batches_gaps_and_captured_bodies(self):
+        with tempfile.TemporaryDirectory() as d:
+            log = _write(d, "proxy_method.csv", RAW_HEADER
+                         + _raw_row(0, "eth_blockNumber")
+                         + _raw_row(0, "eth_getBalance", client="10.0.0.2:6000")
+                         + _raw_row(250, "eth_call", batch_idx=1)
+                         + _raw_row(250, "eth_getBalance", batch_idx=0)
+                         + _raw_row(1000, "eth_blockNumber"))
+            body = '[{"jsonrpc":"2.0","id":1,"method":"eth_getBalance"},{"jsonrpc":"2.0","id":2,"method":"eth_call"}]'
+            capture = _write(d, "proxy_capture.jsonl", json.dumps(
+                {"timestamp_ns": T0 + 250_000_000, "client_addr": "10.0.0.1:5000",
+                 "http_method": "POST", "path": "/rpc", "body": body}) + "\n")
+            events = replay.build_events(read_proxy_sink(log), replay.read_capture(capture))
+
+        self.assertEqual([e.offset_s for e in events], [0.0, 0.0, 0.25, 1.0])
+        batch = events[2]
+        self.assertEqual(batch.methods, ["eth_getBalance", "eth_call"])
+        target = replay.TargetBuilder("http://localhost:18545/").target(batch)
+        self.assertEqual(target["url"], "http://localhost:18545/rpc")
+        self.assertEqual(replay.base64.b64decode(target["body"]).decode(), body)
+
+        plan = replay.schedule(events, speed=2.0)
+        self.assertEqual([due for due, _ in plan], [0.0, 0.0, 0.125, 0.5])
+        window = replay.schedule(events, start_s=0.1, max_duration=0.5)
+        self.assertEqual([(due, e.methods[0]) for due, e in window], [(0.0, "eth_getBalance")])
+        only = replay.schedule(events, methods=["eth_blockNumber"])
+        self.assertEqual(len(only), 2)
+
+        rows = replay.summarize(plan, {}, native=False)
+        self.assertEqual((rows[0]["method"], rows[0]["planned_calls"], rows[0]["planned_share"]),
+                         ("eth_blockNumber", 2, 40.0))
+        self.assertIsNone(rows[0]["success_pct"])
+
+    def test_truncated_capture_falls_back_to_the_chain_adapter(self):
+        with tempfile.TemporaryDirectory() as d:
+            log = _write(d, "proxy_method.csv", RAW_HEADER + _raw_row(0, "eth_getBalance"))
+            capture = _write(d, "proxy_capture.jsonl", json.dumps(
+                {"timestamp_ns": T0, "client_addr": "10.0.0.1:5000", "http_method": "POST",
+                 "path": "/rpc", "body": '{"jsonrpc":"2.0","id":1,"method":"eth_getBal', "truncated": True}) + "\n")
+            events = replay.build_events(read_proxy_sink(log), replay.read_capture(capture))
+        self.assertIsNone(events[0].body)
+        target = replay.TargetBuilder("http://localhost:8545", "ethereum", ["0xabc"]).target(events[0])
+        self.assertEqual(json.loads(replay.base64.b64decode(target["body"]))["method"], "eth_getBalance")
+
+    def test_aggregate_log_spreads_each_second_and_rebuilds_targets(self):
+        header = "timestamp_s,method_name,protocol,status_class,count,rpc_errors,transport_errors,latency_sum_us,latency_max_us,latency_hist\n"
+        with tempfile.TemporaryDirectory() as d:
+            log = _write(d, "proxy_method.csv", header
+                         + "100,eth_blockNumber,jsonrpc,2xx,3,0,0,3000,1000,\n"
+                         + "100,eth_getBalance,jsonrpc,2xx,1,0,0,1000,1000,\n"
+                         + "102,eth_blockNumber,jsonrpc,2xx,2,0,0,2000,1000,\n")
+            events = replay.build_events(read_proxy_sink(log))
+        self.assertEqual([e.offset_s for e in events], [0.0, 0.25, 0.5, 0.75, 2.0, 2.5])
+        self.assertEqual(sorted(m for e in events[:4] for m in e.methods),
+                         ["eth_blockNumber"] * 3 + ["eth_getBalance"])
+
+        builder = replay.TargetBuilder("http://localhost:8545", "ethereum", ["0xabc"])
+        target = builder.target(events[0])
+        self.assertEqual(target["url"], "http://localhost:8545")
+        self.assertIn(json.loads(replay.base64.b64decode(target["body"]))["method"],
+                      ("eth_blockNumber", "eth_getBalance"))
+
+        out = io.StringIO()
+        sent_at = replay.emit_targets(replay.schedule(events, speed=20.0), builder, out)
+        self.assertEqual(len(out.getvalue().splitlines()), 6)
+        self.assertGreaterEqual(sent_at[-1], 0.125)
+        self.assertAlmostEqual(replay.shape([0.0, 0.25, 0.5, 0.75])["interarrival_cv"], 0.0)
+
+    def test_native_sender_counts_per_call_errors(self):
+        async def run():
+            async def handler(request):
+                calls = await request.json()
+                return web.json_response([{"jsonrpc": "2.0", "id": c["id"], "result": "0x1"}
+                                          if c["method"] != "eth_call" else
+                                          {"jsonrpc": "2.0", "id": c["id"], "error": {"code": -32000}}
+                                          for c in calls])
+            app = web.Application()
+            app.router.add_post("/", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                body = json.dumps([{"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []},
+                                   {"jsonrpc": "2.0", "id": 2, "method": "eth_call", "params": []}])
+                events = [replay.ReplayEvent(i * 0.05, ["eth_blockNumber", "eth_call"], body=body)
+                          for i in range(4)]
+                sender = replay.NativeSender(replay.schedule(events), replay.TargetBuilder(f"http://127.0.0.1:{port}"),
+                                             workers=2)
+                return await sender.run(), sender.sent_at
+            finally:
+                await runner.cleanup()
+
+        stats, sent_at = asyncio.run(run())
+        self.assertEqual(len(sent_at), 4)
+        self.assertEqual((stats["eth_blockNumber"].sent, stats["eth_blockNumber"].errors), (4, 0))
+        self.assertEqual((stats["eth_call"].sent, stats["eth_call"].errors), (4, 4))
+        rows = {r["method"]: r for r in replay.summarize(
+            [(0.0, replay.ReplayEvent(0, ["eth_blockNumber", "eth_call"]))] * 4, stats, native=True)}
+        self.assertEqual(rows["eth_call"]["success_pct"], 0.0)
+        self.assertGreater(rows["eth_blockNumber"]["p99_ms"], 0)
+
+    def test_report_lists_methods(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "replay_20260611_120000.csv")
+            replay.append_csv(path, [
+                {"method": "getAccountInfo", "planned_calls": 900, "planned_share": 90.0, "sent_calls": 900,
+                 "errors": 0, "success_pct": 100.0, "p50_ms": 1.2, "p99_ms": 8.5},
+                {"method": "getBlock", "planned_calls": 100, "planned_share": 10.0, "sent_calls": 80,
+                 "errors": 5, "success_pct": 93.75, "p50_ms": 40.0, "p99_ms": 300.0},
+            ])
+            Path(os.path.join(d, "replay_20260611_120000_summary.json")).write_text(json.dumps(
+                {"engine": "native", "speed": 2.0, "sent_requests": 980, "peak_rate": 55.0,
+                 "planned_peak_rate": 60.0, "lag_p99_ms": 3.5, "interarrival_cv": 1.8,
+                 "planned_interarrival_cv": 1.9}))
+            self.assertEqual(Path(path).read_text().splitlines()[0].split(","), list(replay.CSV_COLUMNS))
+            with report_env(unset=('REPLAY_RESULTS_CSV',)):
+                section = make_report_generator(d)._generate_replay_section()
+        self.assertIn(TRANSLATIONS['en']['replay_title'], section)
+        self.assertIn('980 recorded requests replayed at 2.00x', section)
+        self.assertIn('<td>80/100</td>', section)
+        self.assertEqual(section.count('<tr class="warning">'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
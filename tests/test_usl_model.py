@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Universal Scalability Law capacity model over a session's Vegeta rounds.
+
+Coverage:
+- peak: knee location, no finite peak without coherency cost
+- fit: recovers sigma/kappa from noisy rounds; too few concurrency levels
+- model: rounds past the knee bracket it; rounds below it only extrapolate; too few rounds
+- read_vegeta_rounds: session filter, closed-loop rounds, generator-limited rounds left out
+- main: writes the model JSON
+- NodeQPSAnalyzer: cliff recommendations and the USL chart
+- report section: fitted round count and round table
+
+Run: python3 tests/test_usl_model.py
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from analysis import usl_model  # noqa: E402
+from analysis.qps_analyzer import NodeQPSAnalyzer  # noqa: E402
+from report_fixtures import make_report_generator, patch_env, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+LAM, SIGMA, KAPPA = 100.0, 0.05, 0.0005   # peak 1074 req/s at N = 43.6
+SESSION = "20260611_120000"
+
+
+def _rounds(ns, noise=0.02, seed=1):
+    rng = np.random.default_rng(seed)
+    xs = usl_model.usl(ns, LAM, SIGMA, KAPPA) * (1 + rng.normal(0, noise, len(ns)))
+    return [usl_model.Round(f"{i}qps", i, x, x, n / x * 1000, n) for i, (n, x) in enumerate(zip(ns, xs))]
+
+
+def _write_report(d, name, rate, mean_ms, throughput):
+    Path(os.path.join(d, name)).write_text(json.dumps(
+        {"requests": int(rate * 60), "rate": rate, "throughput": throughput,
+         "latencies": {"mean": int(mean_ms * 1e6)}}))
+
+
+class Peak(unittest.TestCase):
+    def test_knee_location(self):
+        n_star, x_max = usl_model.peak(LAM, SIGMA, KAPPA)
+        self.assertAlmostEqual(n_star, 43.6, delta=0.1)
+        self.assertAlmostEqual(x_max, 1074.2, delta=1)
+
+    def test_no_peak_without_coherency_cost(self):
+        self.assertEqual(usl_model.peak(LAM, SIGMA, 0.0), (None, None))
+
+
+class Fit(unittest.TestCase):
+    def test_recovers_coefficients(self):
+        rounds = _rounds([1, 5, 10, 20, 30, 40, 60, 80, 100])
+        lam, sigma, kappa = usl_model.fit([r.concurrency for r in rounds], [r.throughput for r in rounds])
+        self.assertAlmostEqual(sigma, SIGMA, delta=0.01)
+        self.assertAlmostEqual(kappa, KAPPA, delta=0.0001)
+
+    def test_needs_three_concurrency_levels(self):
+        self.assertIsNone(usl_model.fit([1, 1, 5, 5], [100, 100, 450, 450]))
+
+
+class ModelWithKnee(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = usl_model.model(_rounds([1, 5, 10, 20, 30, 40, 60, 80, 100]))
+
+    def test_peak_and_fit_quality(self):
+        self.assertTrue(self.model["fitted"])
+        self.assertAlmostEqual(self.model["peak_throughput"], 1074.2, delta=30)
+        self.assertGreater(self.model["r2"], 0.99)
+
+    def test_bootstrap_interval_contains_the_peak(self):
+        lo, hi = self.model["peak_throughput_ci"]
+        self.assertLess(lo, self.model["peak_throughput"])
+        self.assertGreater(hi, self.model["peak_throughput"])
+
+    def test_knee_is_bracketed(self):
+        self.assertTrue(self.model["knee_bracketed"])
+
+
+class ModelWithoutKnee(unittest.TestCase):
+    def test_rounds_below_the_knee_only_extrapolate(self):
+        early = usl_model.model(_rounds([1, 5, 10, 15, 20]))
+        self.assertTrue(early["fitted"])
+        self.assertFalse(early["knee_bracketed"])
+
+    def test_too_few_rounds_are_not_fitted(self):
+        result = usl_model.model(_rounds([1, 5, 10]))
+        self.assertFalse(result["fitted"])
+        self.assertEqual(result["reason"], "3 round(s), need 4")
+
+
+class VegetaRounds(unittest.TestCase):
+    """Seven open-loop rounds on the curve plus one closed-loop round, one other-session
+    round and one generator-limited round."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        d = self.dir.name
+        for n in (1, 5, 10, 20, 40, 60, 80):
+            x = float(usl_model.usl(n, LAM, SIGMA, KAPPA))
+            _write_report(d, f"vegeta_{int(x)}qps_{SESSION}.json", x, n / x * 1000, x)
+        _write_report(d, f"vegeta_64conc_{SESSION}.json", 1000.0, 64.0, 1000.0)
+        _write_report(d, "vegeta_5000qps_20260610_090000.json", 5000.0, 1.0, 5000.0)
+        _write_report(d, f"vegeta_9999qps_{SESSION}.json", 9999.0, 1.0, 9999.0)
+        self.generator_csv = os.path.join(d, "generator_rounds.csv")
+        Path(self.generator_csv).write_text("qps,generator_limited\n9999,true\n")
+
+    def test_session_and_generator_limited_rounds_are_filtered(self):
+        rounds = usl_model.read_vegeta_rounds(self.dir.name, SESSION, {9999})
+        self.assertEqual(len(rounds), 8)
+        self.assertNotIn("5000qps", [r.label for r in rounds])
+        self.assertNotIn("9999qps", [r.label for r in rounds])
+
+    def test_closed_loop_concurrency_from_littles_law(self):
+        rounds = usl_model.read_vegeta_rounds(self.dir.name, SESSION)
+        self.assertAlmostEqual(next(r for r in rounds if r.label == "64conc").concurrency, 64.0)
+
+    def test_rounds_sorted_by_concurrency(self):
+        rounds = usl_model.read_vegeta_rounds(self.dir.name, SESSION, {9999})
+        self.assertEqual([r.concurrency for r in rounds], sorted(r.concurrency for r in rounds))
+
+    def test_cli_writes_the_model(self):
+        output = os.path.join(self.dir.name, f"usl_model_{SESSION}.json")
+        self.assertEqual(usl_model.main(["--vegeta-dir", self.dir.name, "--session", SESSION, "--generator-csv",
+                                         self.generator_csv, "--output", output, "--iterations", "50"]), 0)
+        model = json.loads(Path(output).read_text())
+        self.assertEqual(model["rounds_used"], 8)
+        self.assertAlmostEqual(model["peak_concurrency"], 43.6, delta=3)
+
+
+class Outputs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.TemporaryDirectory()
+        d = cls.dir.name
+        for n in (1, 5, 10, 20, 40, 60, 80):
+            x = float(usl_model.usl(n, LAM, SIGMA, KAPPA))
+            _write_report(d, f"vegeta_{int(x)}qps_{SESSION}.json", x, n / x * 1000, x)
+        _write_report(d, f"vegeta_64conc_{SESSION}.json", 1000.0, 64.0, 1000.0)
+        cls.generator_csv = os.path.join(d, "generator_rounds.csv")
+        Path(cls.generator_csv).write_text("qps,generator_limited\n")
+        cls.output = os.path.join(d, f"usl_model_{SESSION}.json")
+        usl_model.main(["--vegeta-dir", d, "--session", SESSION, "--output", cls.output, "--iterations", "50"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.dir.cleanup()
+
+    def setUp(self):
+        patch_env(self, USL_MODEL_JSON=self.output, GENERATOR_ROUNDS_CSV=self.generator_csv)
+        self.analyzer = NodeQPSAnalyzer.__new__(NodeQPSAnalyzer)
+        self.analyzer.output_dir = self.dir.name
+        self.analyzer.reports_dir = self.dir.name
+
+    def test_cliff_analysis_recommends_the_usl_peak(self):
+        cliff = self.analyzer.analyze_performance_cliff(None, 1000, 1100)
+        self.assertAlmostEqual(cliff['usl']['sigma'], SIGMA, delta=0.01)
+        self.assertTrue(any(r.startswith("USL model peaks at") for r in cliff['recommendations']))
+
+    def test_chart_is_written(self):
+        chart = self.analyzer.generate_usl_chart()
+        self.assertTrue(os.path.getsize(chart) > 0)
+
+    def test_report_section_found_through_logs_dir(self):
+        with report_env(unset=('USL_MODEL_JSON',)):
+            section = make_report_generator(self.dir.name)._generate_usl_model_section()
+        self.assertIn(TRANSLATIONS['en']['usl_title'], section)
+        self.assertIn('fitted to 8 rounds', section)
+        self.assertIn('<td>64conc</td>', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Distributed load generation contract for lib/vegeta_workers.sh with local
+# worker processes: rate split, target shards, lockstep start, merged result
+# set and per-worker achieved rate. A stub `vegeta` on PATH emits one JSON
+# result per request (STUB_MAX_RATE caps what one worker can send).
+
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$REPO_ROOT"
+
+work="$(mktemp -d /tmp/bnb-vegeta-workers.XXXXXX)"
+trap 'rm -rf "$work"' EXIT
+
+fail() { echo "FAIL: $*"; exit 1; }
+
+mkdir -p "$work/bin"
+cat > "$work/bin/vegeta" <<'STUB'
+#!/usr/bin/env bash
+cmd="$1"; shift
+if [[ "$cmd" == "encode" ]]; then
+    exec cat
+fi
+rate=0 duration=0 targets=""
+for arg in "$@"; do
+    case "$arg" in
+        -rate=*) rate="${arg#-rate=}" ;;
+        -duration=*) duration="${arg#-duration=}"; duration="${duration%s}" ;;
+        -targets=*) targets="${arg#-targets=}" ;;
+    esac
+done
+echo "$rate $(wc -l < "$targets")" >> "${STUB_LOG}"
+sent=$(( rate * duration ))
+[[ -n "${STUB_MAX_RATE:-}" && $rate -gt $STUB_MAX_RATE ]] && sent=$(( STUB_MAX_RATE * duration ))
+ts="$(date -u +%Y-%m-%dT%H:%M:%S.%NZ)"
+for (( i = 0; i < sent; i++ )); do
+    printf '{"timestamp":"%s","code":200,"latency":1000000,"error":""}\n' "$ts"
+done
+STUB
+chmod +x "$work/bin/vegeta"
+export PATH="$work/bin:$PATH" STUB_LOG="$work/stub.log"
+
+export TMP_DIR="$work/tmp" SESSION_TIMESTAMP="20260611_120000"
+export VEGETA_WORKERS_CSV="$work/vegeta_workers.csv" VEGETA_WORKER_START_DELAY=1
+mkdir -p "$TMP_DIR"
+# shellcheck source=/dev/null
+source lib/vegeta_workers.sh
+
+VEGETA_WORKERS=1 vegeta_workers_enabled && fail "one local worker must use the single-process path"
+export VEGETA_WORKERS=3
+vegeta_workers_enabled || fail "VEGETA_WORKERS=3 not treated as distributed"
+[[ "$(vegeta_workers_rate 1000 3 0) $(vegeta_workers_rate 1000 3 1) $(vegeta_workers_rate 1000 3 2)" == "334 333 333" ]] \
+    || fail "rate split does not sum to the round rate"
+[[ "$(VEGETA_WORKER_HOSTS='a@h1, b@h2' vegeta_workers_list | paste -sd, -)" == "a@h1,b@h2" ]] \
+    || fail "worker hosts not parsed"
+
+for i in $(seq 1 10); do echo "{\"method\":\"POST\",\"url\":\"http://127.0.0.1/$i\"}"; done > "$work/targets.json"
+
+vegeta_workers_attack 300 2 "$work/targets.json" "$work/merged.json" >/dev/null
+[[ "$(wc -l < "$work/merged.json")" == "600" ]] || fail "merged result set has $(wc -l < "$work/merged.json") rows"
+[[ "$(sort "$STUB_LOG" | paste -sd, -)" == "100 3,100 3,100 4" ]] || fail "workers got $(sort "$STUB_LOG" | paste -sd, -)"
+[[ "$LAST_GENERATOR_SATURATED" == "false" ]] || fail "unsaturated workers flagged"
+[[ "$(tail -n +2 "$VEGETA_WORKERS_CSV" | wc -l)" == "3" ]] || fail "expected one CSV row per worker"
+max_offset=$(tail -n +2 "$VEGETA_WORKERS_CSV" | cut -d, -f8 | sort -n | tail -1)
+awk -v o="$max_offset" 'BEGIN { exit !(o < 500) }' || fail "workers did not start in lockstep (offset ${max_offset}ms)"
+[[ ! -d "$TMP_DIR/vegeta_workers_300qps" ]] || fail "worker scratch directory left behind"
+
+# One box cannot keep up: every worker tops out at 50 req/s of its 100.
+STUB_MAX_RATE=50 vegeta_workers_attack 300 2 "$work/targets.json" "$work/merged.json" >/dev/null
+[[ "$LAST_GENERATOR_SATURATED" == "true" ]] || fail "generator saturation not detected"
+[[ "$(tail -n 3 "$VEGETA_WORKERS_CSV" | cut -d, -f6,9 | sort -u)" == "50.00,true" ]] \
+    || fail "per-worker achieved rate not reported"
+
+# Fewer requests per second than workers: a zero share would be an unlimited
+# `-rate=0` attack, so only two workers run and none gets rate 0.
+: > "$STUB_LOG"
+vegeta_workers_attack 2 2 "$work/targets.json" "$work/merged.json" >/dev/null
+[[ "$(sort "$STUB_LOG" | paste -sd, -)" == "1 5,1 5" ]] || fail "qps < workers ran $(sort "$STUB_LOG" | paste -sd, -)"
+[[ "$(tail -n 2 "$VEGETA_WORKERS_CSV" | cut -d, -f4 | sort -u)" == "1" ]] || fail "qps < workers CSV rates wrong"
+
+# SSH workers: stub ssh/scp run the worker command locally and keep a copy of
+# every shard sent. The targets point at the runner's loopback (the proxy).
+cat > "$work/bin/scp" <<'STUB'
+#!/usr/bin/env bash
+src="${@: -2:1}" dst="${@: -1}"
+cp "$src" "${dst#*:}" && cp "$src" "${SCP_SENT}/$(basename "${dst#*:}")"
+STUB
+cat > "$work/bin/ssh" <<'STUB'
+#!/usr/bin/env bash
+bash -c "${@: -1}"
+STUB
+chmod +x "$work/bin/scp" "$work/bin/ssh"
+export SCP_SENT="$work/sent"
+mkdir -p "$SCP_SENT"
+for i in $(seq 1 10); do echo "{\"method\":\"POST\",\"url\":\"http://localhost:18545/$i\"}"; done > "$work/proxy_targets.json"
+export VEGETA_WORKER_HOSTS="bench@h1,bench@h2"
+
+: > "$STUB_LOG"
+VEGETA_WORKER_TARGET_URL="" vegeta_workers_attack 100 1 "$work/proxy_targets.json" "$work/merged.json" >/dev/null \
+    && fail "remote workers started against a loopback target"
+[[ ! -s "$STUB_LOG" && -z "$(ls "$SCP_SENT")" ]] || fail "a loopback shard reached a remote worker"
+
+VEGETA_WORKER_TARGET_URL="http://10.0.0.4:18545/" \
+    vegeta_workers_attack 100 1 "$work/proxy_targets.json" "$work/merged.json" >/dev/null \
+    || fail "remote workers with VEGETA_WORKER_TARGET_URL failed"
+[[ "$(ls "$SCP_SENT" | wc -l)" == "2" ]] || fail "expected one shard per SSH worker"
+[[ "$(cat "$SCP_SENT"/* | jq -r '.url' | sed -E 's#/[0-9]+$##' | sort -u)" == "http://10.0.0.4:18545" ]] \
+    || fail "remote shard URLs not rewritten: $(cat "$SCP_SENT"/* | jq -r '.url' | sort -u | paste -sd' ' -)"
+[[ "$(cat "$SCP_SENT"/* | jq -r '.url' | sort -u | wc -l)" == "10" ]] || fail "URL paths not kept"
+unset VEGETA_WORKER_HOSTS
+
+echo "✅ Distributed Vegeta worker contract holds"
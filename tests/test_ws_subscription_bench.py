@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""WebSocket subscription engine: ramp, subscribe latency, notification delay, per-event fan-out and the report section."""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from aiohttp import web
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / 'tools'))
+
+import ws_subscription_bench as bench  # noqa: E402
+from report_fixtures import make_report_generator, report_env  # noqa: E402
+from visualization.report_generator import TRANSLATIONS  # noqa: E402
+
+
+class FakeNode:
+    """newHeads every 100 ms to every subscriber; slot subscriptions are refused."""
+
+    def __init__(self):
+        self.sockets = []
+        self.block = 100
+
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            req = json.loads(msg.data)
+            if req["method"] == "eth_subscribe":
+                sub_id = f"0x{req['id']:x}"
+                await ws.send_str(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": sub_id}))
+                self.sockets.append((ws, sub_id))
+            else:
+                await ws.send_str(json.dumps({"jsonrpc": "2.0", "id": req["id"],
+                                              "error": {"code": -32601, "message": "Method not found"}}))
+        return ws
+
+    async def blocks(self):
+        while True:
+            await asyncio.sleep(0.1)
+            self.block += 1
+            head = {"number": hex(self.block), "timestamp": hex(int(time.time()) - 1)}
+            for ws, sub_id in list(self.sockets):
+                if not ws.closed:
+                    await ws.send_str(json.dumps({"jsonrpc": "2.0", "method": "eth_subscription",
+                                                  "params": {"subscription": sub_id, "result": head}}))
+
+
+async def _run_bench(specs, subscriptions, per_connection):
+    node = FakeNode()
+    app = web.Application()
+    app.router.add_get("/", node.handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    blocks = asyncio.ensure_future(node.blocks())
+    try:
+        engine = bench.SubscriptionBench(f"ws://127.0.0.1:{port}/", specs, subscriptions,
+                                         ramp=40, per_connection=per_connection, duration=1.0)
+        return await engine.run()
+    finally:
+        blocks.cancel()
+        await runner.cleanup()
+
+
+class WsSubscriptionBench(unittest.TestCase):
+    def test_subscriptions_notifications_and_fanout(self):
+        specs = bench.parse_methods("eth_subscribe:newHeads,slotSubscribe")
+        stats = asyncio.run(_run_bench(specs, 8, per_connection=2))
+        rows = {r["method"]: r for r in bench.summarize(stats, 8, 1.0)}
+
+        heads = rows["eth_subscribe:newHeads"]
+        self.assertEqual((heads["requested"], heads["active"], heads["errors"]), (4, 4, 0))
+        self.assertGreater(heads["subscribe_p99_ms"], 0)
+        # ~10 blocks/s to each of 4 subscribers over the 1 s hold window
+        self.assertGreater(heads["notifications_per_s"], 20)
+        self.assertGreaterEqual(heads["delay_p50_ms"], 1000)
+        self.assertIsNotNone(heads["fanout_p99_ms"])
+        self.assertLess(heads["fanout_p99_ms"], 500)
+
+        slots = rows["slotSubscribe"]
+        self.assertEqual((slots["active"], slots["errors"], slots["notifications"]), (0, 4, 0))
+
+    def test_defaults_follow_chain_template(self):
+        self.assertEqual(bench.default_methods({"chain_type": "solana"}), bench.SOLANA_DEFAULT)
+        self.assertEqual(bench.default_methods({"chain_type": "base", "rpc_methods": {"single": "eth_getBalance"}}),
+                         bench.EVM_DEFAULT)
+        self.assertIsNone(bench.default_methods({"chain_type": "bitcoin", "rpc_methods": {"single": "getblockcount"}}))
+        self.assertEqual(bench.parse_methods("eth_subscribe:logs")[0].params(None), ["logs", {}])
+        self.assertEqual(bench.parse_methods("accountSubscribe")[0].params("Addr1")[0], "Addr1")
+        self.assertEqual(bench.block_of({"context": {"slot": 7}, "value": {}}), (7, None))
+
+    def test_event_key_identifies_the_event_not_the_block(self):
+        logs = bench.SubscriptionSpec("logsSubscribe", "all")
+        self.assertEqual(bench.event_key(logs, {"context": {"slot": 7}, "value": {"signature": "sigA"}}), ("tx", "sigA"))
+        eth_logs = bench.SubscriptionSpec("eth_subscribe", "logs")
+        self.assertEqual(bench.event_key(eth_logs, {"blockNumber": "0x10", "transactionHash": "0xab", "logIndex": "0x2"}),
+                         ("log", "0xab", 2))
+        heads = bench.SubscriptionSpec("eth_subscribe", "newHeads")
+        self.assertEqual(bench.event_key(heads, {"number": "0x10"}), ("head", 16))
+        account = bench.SubscriptionSpec("accountSubscribe")
+        self.assertEqual(bench.event_key(account, {"context": {"slot": 7}, "value": {}}, "Addr1"), ("account", "Addr1", 7))
+        self.assertIsNone(bench.event_key(logs, {"context": {"slot": 7}, "value": {}}))
+
+    def test_fanout_compares_copies_of_one_event(self):
+        spec = bench.SubscriptionSpec("logsSubscribe", "all")
+        engine = bench.SubscriptionBench("ws://node", [spec], 2, ramp=0, per_connection=1, duration=1.0)
+        engine.hold_start, engine.hold_end = 0.0, float("inf")
+        # Two transactions in one slot reach each of two subscribers 5 ms apart.
+        for arrived, signature in ((100.000, "sigA"), (100.005, "sigA"), (100.300, "sigB"), (100.305, "sigB")):
+            engine._notification(None, spec, None, {"context": {"slot": 7}, "value": {"signature": signature}}, arrived)
+        fanout = engine.stats[spec.label].fanout_ms()
+        self.assertEqual(len(fanout), 4)
+        self.assertAlmostEqual(max(fanout), 5.0, places=3)
+
+    def test_slot_time_lookup_does_not_block_notifications(self):
+        spec = bench.SubscriptionSpec("slotSubscribe")
+
+        async def scenario():
+            engine = bench.SubscriptionBench("ws://node", [spec], 1, ramp=0, per_connection=1, duration=1.0,
+                                             rpc_url="http://node")
+            engine.hold_start, engine.hold_end = 0.0, float("inf")
+            release = asyncio.Event()
+
+            async def slow_block_time(_session, _slot):
+                await release.wait()
+                return 1000.0
+
+            engine._fetch_block_time = slow_block_time
+            engine._notification(None, spec, None, {"slot": 5}, 1000.5)
+            engine._notification(None, spec, None, {"slot": 5}, 1000.7)
+            stats = engine.stats[spec.label]
+            recorded_before = (stats.notifications, list(stats.delay_ms))
+            release.set()
+            await engine._drain_delays()
+            return recorded_before, sorted(stats.delay_ms)
+
+        before, delays = asyncio.run(scenario())
+        self.assertEqual(before, (2, []))
+        self.assertEqual([round(d) for d in delays], [500, 700])
+
+    def test_report_lists_levels(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "ws_subscriptions_20260611_120000.csv")
+            bench.append_csv(path, [
+                {"subscriptions": 100, "method": "logsSubscribe:all", "requested": 100, "active": 100, "errors": 0,
+                 "subscribe_p50_ms": 2.1, "subscribe_p99_ms": 9.5, "notifications": 4000,
+                 "notifications_per_s": 66.7, "delay_p50_ms": 640.0, "delay_p99_ms": 1210.0,
+                 "fanout_p50_ms": 0.8, "fanout_p99_ms": 14.2},
+                {"subscriptions": 1000, "method": "logsSubscribe:all", "requested": 1000, "active": 950, "errors": 50,
+                 "subscribe_p50_ms": 20.0, "subscribe_p99_ms": 300.0, "notifications": 0,
+                 "notifications_per_s": 0.0, "delay_p50_ms": None, "delay_p99_ms": None,
+                 "fanout_p50_ms": None, "fanout_p99_ms": None},
+            ], "2026-06-11 12:00:00", "2026-06-11 12:01:00")
+            self.assertEqual(Path(path).read_text().splitlines()[0].split(","), list(bench.CSV_COLUMNS))
+            with report_env(unset=('WS_SUBSCRIPTIONS_CSV',)):
+                section = make_report_generator(d)._generate_ws_subscriptions_section()
+        self.assertIn(TRANSLATIONS['en']['ws_subscriptions_title'], section)
+        self.assertIn('<td>950/1000</td>', section)
+        self.assertIn('<td>0.8 / 14.2</td>', section)
+        self.assertIn('<tr class="warning">', section)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 ABC interface contract:
     - protocol_family: str  ← class attribute identifying which family
     - build_vegeta_target(method, address, rpc_url, param_format) → dict
+    - build_vegeta_batch_target(calls, rpc_url) → dict   (JSON-RPC families)
     - health_check_request(rpc_url) → dict
     - parse_block_height(response_text) → Optional[int]
 
@@ -30,6 +31,7 @@ class ChainAdapter(ABC):
     """Abstract base for per-protocol-family chain adapters."""
 
     protocol_family: str = ""  # subclass overrides
+    supports_jsonrpc_batch: bool = False  # JSON-RPC families override
 
     @abstractmethod
     def build_vegeta_target(
@@ -41,6 +43,36 @@ class ChainAdapter(ABC):
     ) -> dict:
         """Build a vegeta target dict for one RPC request."""
 
+    def build_vegeta_batch_target(self, calls, rpc_url: str) -> dict:
+        """Build one vegeta target whose body is a JSON-RPC batch array.
+
+        calls: sequence of (method, address, param_format). Every call is
+        built by build_vegeta_target and renumbered id=1..N, so the node's
+        per-item responses (and the proxy's per-item rpc_success) can be
+        matched back to their calls. Calls that are not JSON-RPC POSTs to the
+        same URL (REST paths, sidecars, split endpoints) cannot share a batch.
+        """
+        if not self.supports_jsonrpc_batch:
+            raise ValueError(f"{self.protocol_family}: JSON-RPC batch targets are not supported")
+        first = None
+        items = []
+        for idx, (method, address, param_format) in enumerate(calls, start=1):
+            target = self.build_vegeta_target(method, address, rpc_url, param_format)
+            body = None
+            if target.get("method") == "POST" and target.get("body"):
+                body = json.loads(base64.b64decode(target["body"]))
+            if not isinstance(body, dict) or "jsonrpc" not in body:
+                raise ValueError(f"method {method!r} is not a JSON-RPC call and cannot be batched")
+            if first is None:
+                first = target
+            elif target["url"] != first["url"]:
+                raise ValueError(f"method {method!r} targets {target['url']}, not {first['url']}")
+            body["id"] = idx
+            items.append(body)
+        if first is None:
+            raise ValueError("empty JSON-RPC batch")
+        return {**first, "body": _b64(json.dumps(items, separators=(",", ":")))}
+
     @abstractmethod
     def health_check_request(self, rpc_url: str) -> dict:
         """Build a single curl/HTTP request descriptor for health probing.
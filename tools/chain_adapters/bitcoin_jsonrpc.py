@@ -39,6 +39,8 @@ def _resolve_env_placeholder(value: str) -> str:
 @register("bitcoin_jsonrpc")
 class BitcoinJsonRpcAdapter(ChainAdapter):
 
+    supports_jsonrpc_batch = True
+
     def __init__(self):
         self._chain_cache: dict[str, dict] = {}
 
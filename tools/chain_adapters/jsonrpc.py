@@ -42,6 +42,8 @@ _CHAINS_DIR = _REPO_ROOT / "config" / "chains"
 @register("jsonrpc")
 class JsonRpcAdapter(ChainAdapter):
 
+    supports_jsonrpc_batch = True
+
     def __init__(self):
         self._chain_cache: dict[str, dict] = {}
 
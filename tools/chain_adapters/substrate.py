@@ -32,6 +32,8 @@ _CHAINS_DIR = _REPO_ROOT / "config" / "chains"
 @register("substrate")
 class SubstrateAdapter(ChainAdapter):
 
+    supports_jsonrpc_batch = True
+
     def __init__(self):
         self._chain_cache: dict[str, dict] = {}
         self._jsonrpc = JsonRpcAdapter()
@@ -34,6 +34,8 @@ _CHAINS_DIR = _REPO_ROOT / "config" / "chains"
 @register("tendermint")
 class TendermintAdapter(ChainAdapter):
 
+    supports_jsonrpc_batch = True
+
     def __init__(self):
         self._chain_cache: dict[str, dict] = {}
         self._jsonrpc = JsonRpcAdapter()
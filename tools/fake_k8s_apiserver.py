@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+fake_k8s_apiserver.py — in-process Kubernetes API server for collector tests
+============================================================================
+
+Purpose
+-------
+A stdlib-only stand-in for the apiserver endpoints the monitoring stack
+uses, with the semantics that matter for connection pooling and informer
+caches — which a static route table cannot express:
+
+  - HTTP/1.1 keep-alive, with a count of accepted TCP connections
+  - list responses carrying metadata.resourceVersion
+  - ?watch=1 streams that replay history after a resourceVersion, then
+    push live changes until timeoutSeconds
+  - compaction: watching from a compacted resourceVersion returns an
+    ERROR event with code 410 (Gone), as etcd compaction does
+  - fieldSelector=spec.nodeName=<node> and simple k=v labelSelector
+
+Objects are stored by collection path, e.g.
+  /api/v1/namespaces/<ns>/pods
+  /api/v1/namespaces/<ns>/persistentvolumeclaims
+  /api/v1/persistentvolumes
+Anything else can be served from `routes` (e.g. kubelet /stats/summary).
+
+Usage
+-----
+  from fake_k8s_apiserver import FakeApiServer
+  with FakeApiServer() as api:
+      api.upsert("/api/v1/namespaces/chain/pods", pod_dict)
+      client = K8sApiClient(api_server=api.url, token="t")
+
+  python3 tools/fake_k8s_apiserver.py --port 18443 --fixtures objects.json
+    (objects.json: {"<collection path>": [obj, ...], ...})
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+# Last path segment of the collections this fake can list and watch.
+COLLECTION_KINDS = ("pods", "persistentvolumeclaims", "persistentvolumes", "nodes", "endpoints")
+
+
+def _matches(obj: Dict[str, Any], query: Dict[str, List[str]]) -> bool:
+    for selector in query.get("fieldSelector", []):
+        for term in selector.split(","):
+            key, _, value = term.partition("=")
+            if key == "spec.nodeName" and obj.get("spec", {}).get("nodeName") != value:
+                return False
+    labels = obj.get("metadata", {}).get("labels", {}) or {}
+    for selector in query.get("labelSelector", []):
+        for term in selector.split(","):
+            key, _, value = term.partition("=")
+            if key and labels.get(key) != value:
+                return False
+    return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # silence
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.api._count_connection()  # type: ignore[attr-defined]
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        api: FakeApiServer = self.server.api  # type: ignore[attr-defined]
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        api._log_request(self.path)
+
+        if parts.path in api.routes:
+            status, payload = api.routes[parts.path]
+            self._send_json(status, payload)
+            return
+        if query.get("watch", [""])[0] in ("1", "true"):
+            self._watch(api, parts.path, query)
+            return
+        listing = api._list(parts.path, query)
+        if listing is not None:
+            self._send_json(200, listing)
+            return
+        collection, _, name = parts.path.rpartition("/")
+        obj = api.get(collection, name)
+        if obj is not None:
+            self._send_json(200, obj)
+            return
+        self._send_json(404, {"kind": "Status", "status": "Failure", "code": 404})
+
+    def _watch(self, api: "FakeApiServer", path: str, query: Dict[str, List[str]]) -> None:
+        since = int(query.get("resourceVersion", ["0"])[0] or 0)
+        timeout = float(query.get("timeoutSeconds", ["30"])[0])
+        deadline = time.monotonic() + timeout
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        if since and since < api.compacted_rv:
+            self._write_event({"type": "ERROR", "object": {
+                "kind": "Status", "code": 410, "reason": "Expired",
+                "message": f"too old resource version: {since}"}})
+            return
+        if not since:
+            # Same as the real apiserver: synthetic ADDED for current state.
+            for obj in api.objects(path):
+                if _matches(obj, query):
+                    self._write_event({"type": "ADDED", "object": obj})
+            since = api.resource_version
+        while not api.stopping:
+            with api.cond:
+                pending = [(rv, ev) for rv, p, ev in api.history if rv > since and p == path]
+                if not pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    api.cond.wait(min(remaining, 0.2))
+                    continue
+            for rv, event in pending:
+                since = rv
+                if _matches(event["object"], query):
+                    if not self._write_event(event):
+                        return
+
+    def _write_event(self, event: Dict[str, Any]) -> bool:
+        try:
+            self.wfile.write((json.dumps(event) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            return True
+        except OSError:
+            return False
+
+
+class FakeApiServer:
+    """Threaded fake apiserver bound to 127.0.0.1 on an ephemeral port."""
+
+    def __init__(self, port: int = 0):
+        self.routes: Dict[str, Tuple[int, Any]] = {}
+        self.requests: List[str] = []
+        self.connections = 0
+        self.resource_version = 1
+        self.compacted_rv = 0
+        self.history: List[Tuple[int, str, Dict[str, Any]]] = []
+        self.cond = threading.Condition()
+        self.stopping = False
+        self._store: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.api = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    # ---- lifecycle -------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self) -> "FakeApiServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self.cond:
+            self.stopping = True
+            self.cond.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeApiServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---- state mutation --------------------------------------------------
+
+    def _record(self, collection: str, etype: str, obj: Dict[str, Any]) -> None:
+        self.resource_version += 1
+        obj.setdefault("metadata", {})["resourceVersion"] = str(self.resource_version)
+        self.history.append((self.resource_version, collection,
+                             {"type": etype, "object": copy.deepcopy(obj)}))
+        self.cond.notify_all()
+
+    def upsert(self, collection: str, obj: Dict[str, Any]) -> None:
+        """Create or replace an object; emits ADDED or MODIFIED."""
+        obj = copy.deepcopy(obj)
+        name = obj["metadata"]["name"]
+        with self.cond:
+            bucket = self._store.setdefault(collection, {})
+            etype = "MODIFIED" if name in bucket else "ADDED"
+            bucket[name] = obj
+            self._record(collection, etype, obj)
+
+    def delete(self, collection: str, name: str) -> None:
+        with self.cond:
+            obj = self._store.get(collection, {}).pop(name, None)
+            if obj is not None:
+                self._record(collection, "DELETED", obj)
+
+    def compact(self) -> None:
+        """Expire every resourceVersion seen so far (watch resumes get 410)."""
+        with self.cond:
+            self.compacted_rv = self.resource_version + 1
+            self.resource_version += 1
+            self.history = []
+
+    # ---- reads -----------------------------------------------------------
+
+    def objects(self, collection: str) -> List[Dict[str, Any]]:
+        with self.cond:
+            return [copy.deepcopy(o) for o in self._store.get(collection, {}).values()]
+
+    def get(self, collection: str, name: str) -> Optional[Dict[str, Any]]:
+        with self.cond:
+            obj = self._store.get(collection, {}).get(name)
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def _list(self, collection: str, query: Dict[str, List[str]]) -> Optional[Dict[str, Any]]:
+        with self.cond:
+            if collection.rsplit("/", 1)[-1] not in COLLECTION_KINDS:
+                return None
+            items = [copy.deepcopy(o) for o in self._store.get(collection, {}).values()
+                     if _matches(o, query)]
+            return {"kind": "List", "metadata": {"resourceVersion": str(self.resource_version)},
+                    "items": items}
+
+    def _log_request(self, path: str) -> None:
+        with self.cond:
+            self.requests.append(path)
+
+    def _count_connection(self) -> None:
+        with self.cond:
+            self.connections += 1
+
+    def requests_matching(self, fragment: str) -> List[str]:
+        with self.cond:
+            return [r for r in self.requests if fragment in r]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Fake Kubernetes API server for local collector runs")
+    ap.add_argument("--port", type=int, default=18443)
+    ap.add_argument("--fixtures", help="JSON file: {collection path: [objects]}")
+    args = ap.parse_args(argv)
+
+    api = FakeApiServer(port=args.port)
+    if args.fixtures:
+        with open(args.fixtures, "r", encoding="utf-8") as fh:
+            for collection, objs in json.load(fh).items():
+                api._store.setdefault(collection, {})
+                for obj in objs:
+                    api.upsert(collection, obj)
+    api.start()
+    print(f"fake apiserver listening on {api.url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
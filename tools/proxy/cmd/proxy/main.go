@@ -6,9 +6,12 @@
 //
 // Environment variables:
 //
-//	PROXY_SINK_FORMAT  csv (default) | jsonl | discard
+//	PROXY_SINK_FORMAT  csv (default) | jsonl | aggregate | discard
 //	PROXY_SINK_PATH    per-method sink output path (default ./proxy_per_method.csv)
+//	PROXY_SINK_SAMPLE_EVERY  aggregate only: keep every Nth raw record (default 0 = off)
+//	PROXY_SINK_SAMPLE_PATH   sampled raw records path (default ./proxy_per_method_sample.csv)
 //	PROXY_SELF_PATH    proxy self-report output path (default ./proxy_self.csv)
+//	PROXY_CAPTURE_PATH raw request bodies as JSONL for traffic replay (default off)
 package main
 
 import (
@@ -56,6 +59,15 @@ func main() {
 	if err != nil {
 		log.Fatalf("init handler: %v", err)
 	}
+	if path := os.Getenv("PROXY_CAPTURE_PATH"); path != "" {
+		capture, err := sink.NewCapture(path)
+		if err != nil {
+			log.Fatalf("init capture: %v", err)
+		}
+		defer capture.Close()
+		h.SetCapture(capture)
+		log.Printf("capturing request bodies to %s", path)
+	}
 
 	rep := selfreport.New(os.Getenv("PROXY_SELF_PATH"), *selfInterval)
 	if err := rep.Start(); err != nil {
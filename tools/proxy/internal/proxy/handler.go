@@ -25,6 +25,7 @@ type Handler struct {
 	rp      *httputil.ReverseProxy
 	upURL   string
 	maxBody int64 // maximum body bytes to read; 0 means unlimited
+	capture *sink.Capture
 }
 
 // New constructs a Handler. upstream must be a valid URL.
@@ -48,22 +49,33 @@ func New(chain *extractor.Chain, sk sink.Sink, upstream string, maxBody int64) (
 	}, nil
 }
 
+// SetCapture enables raw body capture of matched requests (nil disables it).
+func (h *Handler) SetCapture(c *sink.Capture) {
+	h.capture = c
+}
+
 // ServeHTTP implements http.Handler.
 func (h *Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	start := time.Now()
 
 	// Read the body and restore it for the reverse proxy.
 	var body []byte
+	bodyTruncated := false
 	if r.Body != nil {
 		var lr io.Reader = r.Body
 		if h.maxBody > 0 {
 			lr = io.LimitReader(r.Body, h.maxBody)
 		}
 		b, err := io.ReadAll(lr)
-		_ = r.Body.Close()
 		if err == nil {
 			body = b
+			if h.maxBody > 0 && int64(len(b)) == h.maxBody {
+				var next [1]byte
+				n, _ := io.ReadFull(r.Body, next[:])
+				bodyTruncated = n > 0
+			}
 		}
+		_ = r.Body.Close()
 		r.Body = io.NopCloser(bytes.NewReader(body))
 	}
 
@@ -77,7 +89,8 @@ func (h *Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	}
 	h.rp.ServeHTTP(srw, r)
 
-	latencyMS := time.Since(start).Milliseconds()
+	elapsed := time.Since(start)
+	latencyMS, latencyUS := elapsed.Milliseconds(), elapsed.Microseconds()
 	results, ok := h.chain.Extract(r, body)
 	transportSuccess := isTransportSuccess(srw.code)
 	if !ok {
@@ -100,12 +113,26 @@ func (h *Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 			RPCErrorCode:     rpcStatus.ErrorCode,
 			RPCErrorMessage:  rpcStatus.ErrorMessage,
 			LatencyMS:        latencyMS,
+			LatencyUS:        latencyUS,
 			Upstream:         h.upURL,
 			ClientAddr:       r.RemoteAddr,
 		})
 		return
 	}
-	rpcStatuses := classifyRPCStatuses(results, srw.body.Bytes(), srw.code, transportSuccess)
+	if h.capture != nil {
+		_ = h.capture.Write(sink.CaptureRecord{
+			TimestampNS: start.UnixNano(),
+			ClientAddr:  r.RemoteAddr,
+			HTTPMethod:  r.Method,
+			Path:        r.URL.RequestURI(),
+			Body:        string(body),
+			Truncated:   bodyTruncated,
+		})
+	}
+	// A response cut off at maxBody (large JSON-RPC batches) is not invalid
+	// JSON from the node: items complete in the prefix are classified from
+	// their responses, the rest are recorded as "truncated".
+	rpcStatuses := classifyRPCStatuses(results, srw.body.Bytes(), srw.truncated, srw.code, transportSuccess)
 	for _, res := range results {
 		rpcStatus := rpcStatuses[statusKey(res)]
 		_ = h.sink.Write(sink.Record{
@@ -120,6 +147,7 @@ func (h *Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 			RPCErrorCode:     rpcStatus.ErrorCode,
 			RPCErrorMessage:  rpcStatus.ErrorMessage,
 			LatencyMS:        latencyMS,
+			LatencyUS:        latencyUS,
 			Upstream:         h.upURL,
 			ClientAddr:       r.RemoteAddr,
 		})
@@ -129,9 +157,10 @@ func (h *Handler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 // statusRecorder records the status code and buffers a limited response prefix.
 type statusRecorder struct {
 	http.ResponseWriter
-	code    int
-	body    bytes.Buffer
-	maxBody int64
+	code      int
+	body      bytes.Buffer
+	maxBody   int64
+	truncated bool
 }
 
 func (s *statusRecorder) WriteHeader(code int) {
@@ -151,6 +180,11 @@ func (s *statusRecorder) Write(p []byte) (int, error) {
 		if remaining > 0 {
 			_, _ = s.body.Write(p[:remaining])
 		}
+		if remaining < len(p) {
+			s.truncated = true
+		}
+	} else if len(p) > 0 {
+		s.truncated = true
 	}
 	return s.ResponseWriter.Write(p)
 }
@@ -168,6 +202,7 @@ func isTransportSuccess(code int) bool {
 func classifyRPCStatuses(
 	results []extractor.Result,
 	responseBody []byte,
+	truncated bool,
 	statusCode int,
 	transportSuccess bool,
 ) map[string]methodRPCStatus {
@@ -180,7 +215,7 @@ func classifyRPCStatuses(
 	for _, res := range results {
 		out[statusKey(res)] = defaultStatus
 	}
-	if !transportSuccess || len(responseBody) == 0 {
+	if !transportSuccess {
 		return out
 	}
 
@@ -191,6 +226,13 @@ func classifyRPCStatuses(
 			break
 		}
 	}
+	if hasJSONRPC && truncated {
+		applyTruncatedJSONRPCStatus(out, results, responseBody)
+		return out
+	}
+	if truncated || len(responseBody) == 0 {
+		return out
+	}
 	if hasJSONRPC {
 		applyJSONRPCStatus(out, results, responseBody)
 		return out
@@ -257,6 +299,45 @@ func applyJSONRPCStatus(
 	}
 }
 
+// applyTruncatedJSONRPCStatus classifies the batch items whose responses are
+// complete in a response prefix cut off at maxBody. Calls whose response was
+// cut off (or any call of a truncated single response) have an unknown RPC
+// status and are recorded as "truncated" rather than as successes.
+func applyTruncatedJSONRPCStatus(
+	out map[string]methodRPCStatus,
+	results []extractor.Result,
+	prefix []byte,
+) {
+	statusByID := make(map[string]methodRPCStatus)
+	dec := json.NewDecoder(bytes.NewReader(prefix))
+	if tok, err := dec.Token(); err == nil && tok == json.Delim('[') {
+		for dec.More() {
+			var item any
+			if err := dec.Decode(&item); err != nil {
+				break
+			}
+			if obj, ok := item.(map[string]any); ok {
+				statusByID[stringifyJSONRPCID(obj["id"])] = statusFromJSONRPCObject(obj)
+			}
+		}
+	}
+	unknown := methodRPCStatus{
+		Success:      false,
+		ErrorCode:    "truncated",
+		ErrorMessage: "response truncated at max-body; RPC status unknown",
+	}
+	for _, res := range results {
+		if res.Protocol != "json_rpc" {
+			continue
+		}
+		if st, ok := statusByID[res.RequestID]; ok {
+			out[statusKey(res)] = st
+		} else {
+			out[statusKey(res)] = unknown
+		}
+	}
+}
+
 func statusFromJSONRPCObject(obj map[string]any) methodRPCStatus {
 	if errVal, ok := obj["error"]; ok && errVal != nil {
 		code, msg := parseErrorValue(errVal)
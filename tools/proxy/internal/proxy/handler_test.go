@@ -2,9 +2,13 @@ package proxyhandler
 
 import (
 	"bytes"
+	"encoding/json"
 	"io"
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
 	"testing"
 
 	"proxy/internal/extractor"
@@ -158,3 +162,92 @@ func TestHandler_JSONRPCBatchMatchesErrorByID(t *testing.T) {
 		t.Fatalf("second batch item should fail with mapped error: %+v", sk.records[1])
 	}
 }
+
+func TestHandler_TruncatedBatchResponseClassifiesPrefix(t *testing.T) {
+	up := fakeUpstreamBody(200, `[
+		{"jsonrpc":"2.0","error":{"code":-32000,"message":"boom"},"id":1},
+		{"jsonrpc":"2.0","result":"0x1","id":2},
+		{"jsonrpc":"2.0","result":"`+strings.Repeat("0", 512)+`","id":3},
+		{"jsonrpc":"2.0","result":"0x1","id":4}
+	]`)
+	defer up.Close()
+	jrpc, _ := extractor.NewJSONRPC("jrpc", "^/$", "split")
+	sk := &captureSink{}
+	h, _ := New(extractor.NewChain(jrpc), sk, up.URL, 256)
+	srv := httptest.NewServer(h)
+	defer srv.Close()
+
+	body := []byte(`[
+		{"jsonrpc":"2.0","method":"eth_call","id":1},
+		{"jsonrpc":"2.0","method":"eth_blockNumber","id":2},
+		{"jsonrpc":"2.0","method":"eth_getBlockByNumber","id":3},
+		{"jsonrpc":"2.0","method":"eth_getBalance","id":4}
+	]`)
+	resp, err := http.Post(srv.URL+"/", "application/json", bytes.NewReader(body))
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer resp.Body.Close()
+	_, _ = io.ReadAll(resp.Body)
+
+	if len(sk.records) != 4 {
+		t.Fatalf("want one sink record per batched call, got %d", len(sk.records))
+	}
+	if rec := sk.records[0]; rec.RPCSuccess || rec.RPCErrorCode != "-32000" {
+		t.Fatalf("error in the parsed prefix must be kept: %+v", rec)
+	}
+	if rec := sk.records[1]; !rec.RPCSuccess || rec.RPCErrorCode != "" {
+		t.Fatalf("success in the parsed prefix must be kept: %+v", rec)
+	}
+	for _, rec := range sk.records[2:] {
+		if rec.RPCSuccess || rec.RPCErrorCode != "truncated" || !rec.TransportSuccess {
+			t.Fatalf("calls after the cut must be recorded as truncated: %+v", rec)
+		}
+	}
+}
+
+// A JSON-RPC body cut at maxBody no longer parses and is not captured; a
+// REST POST body is matched by path and is captured cut, so it is flagged.
+func TestHandler_CaptureFlagsTruncatedBody(t *testing.T) {
+	up := fakeUpstream()
+	defer up.Close()
+	rest, _ := extractor.NewREST("rest", []map[string]string{
+		{"pattern": "^/submit$", "method_name": "POST /submit"},
+	})
+	h, _ := New(extractor.NewChain(rest), &captureSink{}, up.URL, 64)
+	path := filepath.Join(t.TempDir(), "capture.jsonl")
+	capture, err := sink.NewCapture(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	h.SetCapture(capture)
+	srv := httptest.NewServer(h)
+	defer srv.Close()
+
+	for _, body := range []string{
+		`{"tx":"` + strings.Repeat("0", 50) + `"}`,
+		`{"tx":"` + strings.Repeat("0", 128) + `"}`,
+	} {
+		resp, err := http.Post(srv.URL+"/submit", "application/json", strings.NewReader(body))
+		if err != nil {
+			t.Fatal(err)
+		}
+		_, _ = io.ReadAll(resp.Body)
+		resp.Body.Close()
+	}
+	if err := capture.Close(); err != nil {
+		t.Fatal(err)
+	}
+
+	raw, _ := os.ReadFile(path)
+	lines := strings.Split(strings.TrimSpace(string(raw)), "\n")
+	if len(lines) != 2 {
+		t.Fatalf("want 2 captured requests, got %d", len(lines))
+	}
+	var complete, cut sink.CaptureRecord
+	_ = json.Unmarshal([]byte(lines[0]), &complete)
+	_ = json.Unmarshal([]byte(lines[1]), &cut)
+	if complete.Truncated || !cut.Truncated || len(cut.Body) != 64 {
+		t.Fatalf("truncation flags: complete=%+v cut=%+v", complete, cut)
+	}
+}
@@ -0,0 +1,249 @@
+package sink
+
+import (
+	"bufio"
+	"encoding/csv"
+	"fmt"
+	"math"
+	"os"
+	"sort"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+// Aggregate CSV schema (column order is stable):
+//
+//	timestamp_s, method_name, protocol, status_class, count, rpc_errors,
+//	transport_errors, latency_sum_us, latency_max_us, latency_hist
+//
+// One row per (second, method, protocol, status class). latency_hist is
+// "bucket:count;bucket:count" over log buckets of microseconds: bucket 0
+// holds latencies <= 1 µs, bucket i holds (2^((i-1)/4), 2^(i/4)] µs, so each
+// bucket is ~19% wide. A late request (started in a second that was already
+// flushed) produces a second row for the same key; readers sum rows per key.
+//
+// Environment variables:
+//
+//	PROXY_SINK_SAMPLE_EVERY  write every Nth raw record to a CSV side file (0 = off)
+//	PROXY_SINK_SAMPLE_PATH   side file path; defaults to ./proxy_per_method_sample.csv
+
+var aggregateHeader = []string{
+	"timestamp_s", "method_name", "protocol", "status_class", "count", "rpc_errors",
+	"transport_errors", "latency_sum_us", "latency_max_us", "latency_hist",
+}
+
+// aggregateFlushLag keeps a second open this long after it ends so requests
+// that started in it (timestamps are request start times) still land in it.
+const aggregateFlushLag = 2 * time.Second
+
+type aggKey struct {
+	sec         int64
+	method      string
+	protocol    string
+	statusClass string
+}
+
+type aggBucket struct {
+	count           int64
+	rpcErrors       int64
+	transportErrors int64
+	sumUS           int64
+	maxUS           int64
+	hist            map[int]int64
+}
+
+type aggregateSink struct {
+	mu      sync.Mutex
+	f       *os.File
+	bw      *bufio.Writer
+	w       *csv.Writer
+	buckets map[aggKey]*aggBucket
+	now     func() time.Time
+
+	sample      Sink
+	sampleEvery int64
+	seen        atomic.Int64
+
+	stop chan struct{}
+	done chan struct{}
+}
+
+func newAggregate(path string) (*aggregateSink, error) {
+	f, err := os.OpenFile(path, os.O_CREATE|os.O_APPEND|os.O_WRONLY, 0644)
+	if err != nil {
+		return nil, fmt.Errorf("open sink: %w", err)
+	}
+	bw := bufio.NewWriterSize(f, 64<<10)
+	s := &aggregateSink{
+		f:       f,
+		bw:      bw,
+		w:       csv.NewWriter(bw),
+		buckets: make(map[aggKey]*aggBucket),
+		now:     time.Now,
+		stop:    make(chan struct{}),
+		done:    make(chan struct{}),
+	}
+	if st, _ := f.Stat(); st != nil && st.Size() == 0 {
+		_ = s.w.Write(aggregateHeader)
+		s.w.Flush()
+		_ = bw.Flush()
+	}
+	if n, _ := strconv.ParseInt(os.Getenv("PROXY_SINK_SAMPLE_EVERY"), 10, 64); n > 0 {
+		samplePath := os.Getenv("PROXY_SINK_SAMPLE_PATH")
+		if samplePath == "" {
+			samplePath = "./proxy_per_method_sample.csv"
+		}
+		sample, err := newFile(samplePath, true)
+		if err != nil {
+			_ = f.Close()
+			return nil, err
+		}
+		s.sample = sample
+		s.sampleEvery = n
+	}
+	go s.loop()
+	return s, nil
+}
+
+func (s *aggregateSink) loop() {
+	defer close(s.done)
+	t := time.NewTicker(time.Second)
+	defer t.Stop()
+	for {
+		select {
+		case <-t.C:
+			_ = s.flush(false)
+		case <-s.stop:
+			return
+		}
+	}
+}
+
+// histBucket maps a latency in microseconds to its log bucket index.
+func histBucket(us int64) int {
+	if us <= 1 {
+		return 0
+	}
+	return int(math.Ceil(4 * math.Log2(float64(us))))
+}
+
+// statusClass mirrors status_class() in monitoring/prometheus_exporter.py.
+func statusClass(code int) string {
+	if code <= 0 {
+		return "unknown"
+	}
+	return fmt.Sprintf("%dxx", code/100)
+}
+
+func (s *aggregateSink) Write(r Record) error {
+	if s.sample != nil && s.seen.Add(1)%s.sampleEvery == 0 {
+		_ = s.sample.Write(r)
+	}
+	us := r.LatencyUS
+	if us == 0 && r.LatencyMS > 0 {
+		us = r.LatencyMS * 1000
+	}
+	k := aggKey{
+		sec:         r.TimestampNS / int64(time.Second),
+		method:      r.MethodName,
+		protocol:    r.Protocol,
+		statusClass: statusClass(r.StatusCode),
+	}
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	b := s.buckets[k]
+	if b == nil {
+		b = &aggBucket{hist: make(map[int]int64, 8)}
+		s.buckets[k] = b
+	}
+	b.count++
+	if !r.RPCSuccess {
+		b.rpcErrors++
+	}
+	if !r.TransportSuccess {
+		b.transportErrors++
+	}
+	b.sumUS += us
+	if us > b.maxUS {
+		b.maxUS = us
+	}
+	b.hist[histBucket(us)]++
+	return nil
+}
+
+// flush writes and drops every bucket whose second closed more than
+// aggregateFlushLag ago, or every bucket when all is true.
+func (s *aggregateSink) flush(all bool) error {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	cutoff := s.now().Add(-aggregateFlushLag).Unix()
+	keys := make([]aggKey, 0, len(s.buckets))
+	for k := range s.buckets {
+		if all || k.sec < cutoff {
+			keys = append(keys, k)
+		}
+	}
+	if len(keys) == 0 {
+		return nil
+	}
+	sort.Slice(keys, func(i, j int) bool {
+		if keys[i].sec != keys[j].sec {
+			return keys[i].sec < keys[j].sec
+		}
+		if keys[i].method != keys[j].method {
+			return keys[i].method < keys[j].method
+		}
+		return keys[i].statusClass < keys[j].statusClass
+	})
+	for _, k := range keys {
+		b := s.buckets[k]
+		delete(s.buckets, k)
+		if err := s.w.Write([]string{
+			strconv.FormatInt(k.sec, 10), k.method, k.protocol, k.statusClass,
+			strconv.FormatInt(b.count, 10), strconv.FormatInt(b.rpcErrors, 10),
+			strconv.FormatInt(b.transportErrors, 10), strconv.FormatInt(b.sumUS, 10),
+			strconv.FormatInt(b.maxUS, 10), encodeHist(b.hist),
+		}); err != nil {
+			return err
+		}
+	}
+	s.w.Flush()
+	if err := s.w.Error(); err != nil {
+		return err
+	}
+	return s.bw.Flush()
+}
+
+func encodeHist(hist map[int]int64) string {
+	idx := make([]int, 0, len(hist))
+	for i := range hist {
+		idx = append(idx, i)
+	}
+	sort.Ints(idx)
+	var sb strings.Builder
+	for n, i := range idx {
+		if n > 0 {
+			sb.WriteByte(';')
+		}
+		sb.WriteString(strconv.Itoa(i))
+		sb.WriteByte(':')
+		sb.WriteString(strconv.FormatInt(hist[i], 10))
+	}
+	return sb.String()
+}
+
+func (s *aggregateSink) Close() error {
+	close(s.stop)
+	<-s.done
+	err := s.flush(true)
+	if s.sample != nil {
+		_ = s.sample.Close()
+	}
+	if cerr := s.f.Close(); err == nil {
+		err = cerr
+	}
+	return err
+}
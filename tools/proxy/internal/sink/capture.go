@@ -0,0 +1,95 @@
+package sink
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"os"
+	"sync"
+	"time"
+)
+
+// CaptureRecord is one captured request body, written as a JSON line:
+//
+//	{"timestamp_ns":..., "client_addr":"...", "http_method":"POST", "path":"/", "body":"..."}
+//
+// timestamp_ns equals the timestamp_ns of the request's per-method sink
+// rows, so a recorded proxy log can be replayed with its original bodies
+// (tools/traffic_replay.py). Bodies are cut at the proxy's -max-body; a cut
+// body carries "truncated":true and must not be replayed verbatim.
+type CaptureRecord struct {
+	TimestampNS int64  `json:"timestamp_ns"`
+	ClientAddr  string `json:"client_addr"`
+	HTTPMethod  string `json:"http_method"`
+	Path        string `json:"path"`
+	Body        string `json:"body"`
+	Truncated   bool   `json:"truncated,omitempty"`
+}
+
+// Capture appends CaptureRecords to a JSONL file (PROXY_CAPTURE_PATH).
+// Lines are buffered and flushed every second and on Close, like the
+// aggregate sink, so capture does not cost one write syscall per request.
+type Capture struct {
+	mu sync.Mutex
+	f  *os.File
+	bw *bufio.Writer
+
+	stop chan struct{}
+	done chan struct{}
+}
+
+func NewCapture(path string) (*Capture, error) {
+	f, err := os.OpenFile(path, os.O_CREATE|os.O_APPEND|os.O_WRONLY, 0644)
+	if err != nil {
+		return nil, fmt.Errorf("open capture: %w", err)
+	}
+	c := &Capture{
+		f:    f,
+		bw:   bufio.NewWriterSize(f, 256<<10),
+		stop: make(chan struct{}),
+		done: make(chan struct{}),
+	}
+	go c.loop()
+	return c, nil
+}
+
+func (c *Capture) loop() {
+	defer close(c.done)
+	t := time.NewTicker(time.Second)
+	defer t.Stop()
+	for {
+		select {
+		case <-t.C:
+			c.mu.Lock()
+			_ = c.bw.Flush()
+			c.mu.Unlock()
+		case <-c.stop:
+			return
+		}
+	}
+}
+
+func (c *Capture) Write(r CaptureRecord) error {
+	b, err := json.Marshal(r)
+	if err != nil {
+		return err
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	if _, err = c.bw.Write(b); err != nil {
+		return err
+	}
+	return c.bw.WriteByte('\n')
+}
+
+func (c *Capture) Close() error {
+	close(c.stop)
+	<-c.done
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	err := c.bw.Flush()
+	if cerr := c.f.Close(); err == nil {
+		err = cerr
+	}
+	return err
+}
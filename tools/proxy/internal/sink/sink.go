@@ -4,12 +4,19 @@
 //
 //	timestamp_ns, method_name, protocol, request_id, batch_idx,
 //	status_code, transport_success, rpc_success, rpc_error_code,
-//	rpc_error_message, latency_ms, upstream, client_addr
+//	rpc_error_message, latency_ms, upstream, client_addr, latency_us
+//
+// latency_ms is truncated to whole milliseconds and kept for older readers;
+// latency_us carries the same measurement at microsecond resolution.
 //
 // Environment variables:
 //
-//	PROXY_SINK_FORMAT  csv (default) | jsonl | discard
+//	PROXY_SINK_FORMAT  csv (default) | jsonl | aggregate | discard
 //	PROXY_SINK_PATH    output path; defaults to ./proxy_per_method.csv or .jsonl
+//
+// The aggregate format keeps per-second, per-method counters and latency
+// histograms in memory and writes one compact row per bucket each second
+// instead of one row per request; see aggregate.go for its schema.
 package sink
 
 import (
@@ -35,6 +42,7 @@ type Record struct {
 	LatencyMS        int64  `json:"latency_ms"`
 	Upstream         string `json:"upstream"`
 	ClientAddr       string `json:"client_addr"`
+	LatencyUS        int64  `json:"latency_us"`
 }
 
 type Sink interface {
@@ -45,7 +53,7 @@ type Sink interface {
 var csvHeader = []string{
 	"timestamp_ns", "method_name", "protocol", "request_id", "batch_idx",
 	"status_code", "transport_success", "rpc_success", "rpc_error_code",
-	"rpc_error_message", "latency_ms", "upstream", "client_addr",
+	"rpc_error_message", "latency_ms", "upstream", "client_addr", "latency_us",
 }
 
 func New(format, path string) (Sink, error) {
@@ -69,10 +77,15 @@ func New(format, path string) (Sink, error) {
 			path = "./proxy_per_method.jsonl"
 		}
 		return newFile(path, false)
+	case "aggregate":
+		if path == "" {
+			path = "./proxy_per_method.csv"
+		}
+		return newAggregate(path)
 	case "discard":
 		return discardSink{}, nil
 	default:
-		return nil, fmt.Errorf("unknown PROXY_SINK_FORMAT: %q (csv|jsonl|discard)", format)
+		return nil, fmt.Errorf("unknown PROXY_SINK_FORMAT: %q (csv|jsonl|aggregate|discard)", format)
 	}
 }
 
@@ -109,6 +122,7 @@ func (s *fileSink) Write(r Record) error {
 			strconv.FormatBool(r.TransportSuccess), strconv.FormatBool(r.RPCSuccess),
 			r.RPCErrorCode, r.RPCErrorMessage,
 			strconv.FormatInt(r.LatencyMS, 10), r.Upstream, r.ClientAddr,
+			strconv.FormatInt(r.LatencyUS, 10),
 		})
 		if err != nil {
 			return err
@@ -2,10 +2,13 @@ package sink
 
 import (
 	"encoding/csv"
+	"encoding/json"
+	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestCSVSink_WriteAndRead(t *testing.T) {
@@ -18,7 +21,7 @@ func TestCSVSink_WriteAndRead(t *testing.T) {
 	rec := Record{
 		TimestampNS: 1700000000000000000, MethodName: "eth_blockNumber",
 		Protocol: "json_rpc", RequestID: "1", BatchIdx: 0,
-		StatusCode: 200, LatencyMS: 5,
+		StatusCode: 200, LatencyMS: 5, LatencyUS: 5321,
 		Upstream: "http://x:8545", ClientAddr: "1.1.1.1:443",
 	}
 	if err := s.Write(rec); err != nil {
@@ -43,6 +46,9 @@ func TestCSVSink_WriteAndRead(t *testing.T) {
 	if rows[1][1] != "eth_blockNumber" || rows[1][10] != "5" {
 		t.Errorf("bad row: %v", rows[1])
 	}
+	if rows[0][13] != "latency_us" || rows[1][13] != "5321" {
+		t.Errorf("latency_us column: header %v row %v", rows[0], rows[1])
+	}
 }
 
 func TestCSVSink_AppendKeepsHeader(t *testing.T) {
@@ -110,3 +116,129 @@ func TestEnvDefaults(t *testing.T) {
 		t.Errorf("env-driven path not used: %s", data)
 	}
 }
+
+func TestAggregateSink_OneRowPerBucket(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "agg.csv")
+	t.Setenv("PROXY_SINK_SAMPLE_EVERY", "2")
+	t.Setenv("PROXY_SINK_SAMPLE_PATH", filepath.Join(dir, "sample.csv"))
+	s, err := New("aggregate", path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	sec := int64(1700000000) * 1e9
+	for i, lat := range []int64{1, 2, 2, 40} {
+		_ = s.Write(Record{
+			TimestampNS: sec + int64(i), MethodName: "eth_call", Protocol: "json_rpc",
+			StatusCode: 200, TransportSuccess: true, RPCSuccess: lat != 40,
+			LatencyMS: lat, LatencyUS: lat * 1000,
+		})
+	}
+	_ = s.Write(Record{TimestampNS: sec, MethodName: "eth_call", StatusCode: 503, LatencyMS: 3})
+	if err := s.Close(); err != nil {
+		t.Fatal(err)
+	}
+
+	f, _ := os.Open(path)
+	defer f.Close()
+	rows, _ := csv.NewReader(f).ReadAll()
+	if len(rows) != 3 { // header + 2xx bucket + 5xx bucket
+		t.Fatalf("want 3 rows, got %d: %v", len(rows), rows)
+	}
+	if rows[0][0] != "timestamp_s" || rows[0][9] != "latency_hist" {
+		t.Errorf("bad header: %v", rows[0])
+	}
+	ok := rows[1]
+	if ok[0] != "1700000000" || ok[3] != "2xx" || ok[4] != "4" || ok[5] != "1" || ok[7] != "45000" || ok[8] != "40000" {
+		t.Errorf("bad 2xx bucket: %v", ok)
+	}
+	want := fmt.Sprintf("%d:1;%d:2;%d:1", histBucket(1000), histBucket(2000), histBucket(40000))
+	if ok[9] != want {
+		t.Errorf("hist = %q, want %q", ok[9], want)
+	}
+	if rows[2][3] != "5xx" || rows[2][6] != "1" {
+		t.Errorf("bad 5xx bucket: %v", rows[2])
+	}
+	sample, _ := os.ReadFile(filepath.Join(dir, "sample.csv"))
+	if got := strings.Count(string(sample), "\n"); got != 3 { // header + 2 of 5 records
+		t.Errorf("sample lines = %d, want 3:\n%s", got, sample)
+	}
+}
+
+func TestAggregateSink_FlushKeepsOpenSeconds(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "agg.csv")
+	s, err := newAggregate(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	now := time.Unix(1700000010, 0)
+	s.now = func() time.Time { return now }
+	_ = s.Write(Record{TimestampNS: 1700000005 * 1e9, MethodName: "old", StatusCode: 200})
+	_ = s.Write(Record{TimestampNS: 1700000009 * 1e9, MethodName: "open", StatusCode: 200})
+	if err := s.flush(false); err != nil {
+		t.Fatal(err)
+	}
+	data, _ := os.ReadFile(path)
+	if !strings.Contains(string(data), "old") || strings.Contains(string(data), "open") {
+		t.Errorf("flush should emit only closed seconds:\n%s", data)
+	}
+	_ = s.Close()
+	data, _ = os.ReadFile(path)
+	if !strings.Contains(string(data), "open") {
+		t.Errorf("close should flush remaining buckets:\n%s", data)
+	}
+}
+
+func TestHistBucketBounds(t *testing.T) {
+	for _, c := range []struct {
+		us   int64
+		want int
+	}{{0, 0}, {1, 0}, {2, 4}, {16, 16}, {17, 17}, {1000, 40}} {
+		if got := histBucket(c.us); got != c.want {
+			t.Errorf("histBucket(%d) = %d, want %d", c.us, got, c.want)
+		}
+	}
+}
+
+func TestAggregateSink_SubMillisecondLatency(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "agg.csv")
+	s, err := New("aggregate", path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	_ = s.Write(Record{TimestampNS: 1e18, MethodName: "eth_blockNumber", StatusCode: 200, LatencyUS: 180})
+	_ = s.Write(Record{TimestampNS: 1e18, MethodName: "eth_blockNumber", StatusCode: 200, LatencyUS: 750})
+	_ = s.Close()
+	data, _ := os.ReadFile(path)
+	want := fmt.Sprintf(",930,750,%d:1;%d:1", histBucket(180), histBucket(750))
+	if !strings.Contains(string(data), want) {
+		t.Errorf("want %q in:\n%s", want, data)
+	}
+}
+
+func TestCapture_WritesJSONLines(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "capture.jsonl")
+	c, err := NewCapture(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	body := `[{"jsonrpc":"2.0","id":1,"method":"eth_blockNumber"}]`
+	if err := c.Write(CaptureRecord{TimestampNS: 42, HTTPMethod: "POST", Path: "/", Body: body}); err != nil {
+		t.Fatal(err)
+	}
+	if err := c.Close(); err != nil {
+		t.Fatal(err)
+	}
+	raw, _ := os.ReadFile(path)
+	lines := strings.Split(strings.TrimSpace(string(raw)), "\n")
+	if len(lines) != 1 {
+		t.Fatalf("want 1 line, got %d", len(lines))
+	}
+	var got CaptureRecord
+	if err := json.Unmarshal([]byte(lines[0]), &got); err != nil {
+		t.Fatal(err)
+	}
+	if got.TimestampNS != 42 || got.Body != body {
+		t.Errorf("round trip: %+v", got)
+	}
+}
@@ -40,6 +40,7 @@ fi
 
 # Initialize variables (maintain backward compatibility)
 VERBOSE=${VERBOSE:-false}
+BATCH_SIZE=${BATCH_SIZE:-1}
 
 # Help information
 show_help() {
@@ -54,6 +55,8 @@ show_help() {
     echo "  --rpc-url URL              RPC endpoint URL (default: $LOCAL_RPC_URL)"
     echo "  --output-single FILE       Single method target output file"
     echo "  --output-mixed FILE        Mixed method target output file"
+    echo "  --mix METHOD=W,...         Mixed mode: weights replacing rpc_methods.mixed_weighted"
+    echo "  --batch-size N             JSON-RPC calls per target as one batch body (default: 1)"
     echo "  -v, --verbose              Enable verbose output"
     echo ""
     echo "Supported blockchains: solana, ethereum, bsc, base, polygon, scroll, starknet, sui"
@@ -150,6 +153,14 @@ parse_args() {
                 MIXED_METHOD_TARGETS_FILE="$2"
                 shift 2
                 ;;
+            --mix)
+                MIX_OVERRIDE="$2"
+                shift 2
+                ;;
+            --batch-size)
+                BATCH_SIZE="$2"
+                shift 2
+                ;;
             -v|--verbose)
                 VERBOSE=true
                 shift
@@ -172,6 +183,11 @@ parse_args() {
         return 1
     fi
 
+    if ! [[ "$BATCH_SIZE" =~ ^[1-9][0-9]*$ ]]; then
+        echo "❌ Error: Invalid batch size: $BATCH_SIZE" >&2
+        return 1
+    fi
+
     # If user specified output file via -o, override default setting
     if [[ -n "${USER_OUTPUT_FILE:-}" ]]; then
         CURRENT_OUTPUT_FILE="$USER_OUTPUT_FILE"
@@ -220,17 +236,22 @@ load_mixed_weighted_methods() {
     if [[ "${RPC_MODE:-single}" != "mixed" ]]; then
         return 0
     fi
-    if [[ -z "${CHAIN_CONFIG:-}" || "$CHAIN_CONFIG" == "null" ]]; then
+    if [[ -z "${MIX_OVERRIDE:-}" ]] && [[ -z "${CHAIN_CONFIG:-}" || "$CHAIN_CONFIG" == "null" ]]; then
         return 0
     fi
 
     local weighted_rows
-    weighted_rows=$(echo "$CHAIN_CONFIG" | jq -r '
-        (.rpc_methods.mixed_weighted // [])[]?
-        | select(.method != null)
-        | [.method, (.weight // 1)]
-        | @tsv
-    ' 2>/dev/null)
+    if [[ -n "${MIX_OVERRIDE:-}" ]]; then
+        # --mix eth_getBalance=8,eth_blockNumber=2 (sweep mix variants)
+        weighted_rows=$(echo "$MIX_OVERRIDE" | tr ',' '\n' | awk -F= 'NF == 2 && $1 != "" { printf "%s\t%s\n", $1, $2 }')
+    else
+        weighted_rows=$(echo "$CHAIN_CONFIG" | jq -r '
+            (.rpc_methods.mixed_weighted // [])[]?
+            | select(.method != null)
+            | [.method, (.weight // 1)]
+            | @tsv
+        ' 2>/dev/null)
+    fi
 
     if [[ -z "$weighted_rows" ]]; then
         return 0
@@ -325,6 +346,9 @@ generate_targets() {
     echo "   RPC methods: $CURRENT_RPC_METHODS_STRING" >&2
     echo "   Input file: $ACCOUNTS_OUTPUT_FILE" >&2
     echo "   Output file: $CURRENT_OUTPUT_FILE" >&2
+    if [[ "$BATCH_SIZE" -gt 1 ]]; then
+        echo "   Batch size: $BATCH_SIZE calls per target" >&2
+    fi
 
     # Create output directory
     mkdir -p "$(dirname "$CURRENT_OUTPUT_FILE")"
@@ -363,6 +387,7 @@ generate_targets() {
         done | python3 "$batch_cli" build-targets-batch \
                  --chain "$BLOCKCHAIN_NODE" \
                  --rpc-url "$LOCAL_RPC_URL" \
+                 --batch-size "$BATCH_SIZE" \
                  > "$CURRENT_OUTPUT_FILE"
     else
         # Mixed method mode
@@ -385,6 +410,7 @@ generate_targets() {
         done | python3 "$batch_cli" build-targets-batch \
                  --chain "$BLOCKCHAIN_NODE" \
                  --rpc-url "$LOCAL_RPC_URL" \
+                 --batch-size "$BATCH_SIZE" \
                  > "$CURRENT_OUTPUT_FILE"
     fi
 
@@ -419,7 +445,9 @@ main() {
     fi
 
     # Parse arguments
-    parse_args "$@"
+    if ! parse_args "$@"; then
+        exit 1
+    fi
 
     # Final configuration validation and repair
     if [[ -z "${CURRENT_RPC_METHODS_STRING:-}" ]]; then
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""Time-faithful replay of a recorded RPC proxy log.
+
+Synthetic ladders send one method mix at a flat rate; production traffic has
+bursts, a diurnal shape and a mix that drifts with it. This tool turns the
+RPC proxy's per-method sink (proxy_method.csv, raw or aggregate format) into
+a schedule that keeps the recorded method mix, inter-arrival times and rate
+shape, and sends it again:
+
+  * raw sink rows sharing timestamp_ns and client_addr are one HTTP request;
+    a JSON-RPC batch is replayed as a batch with its calls in batch_idx order
+  * aggregate rows keep only per-second counts, so their requests are spread
+    evenly (in a seeded random method order) inside the recorded second; the
+    sub-second burstiness of such a log is lost
+  * --speed N compresses the timeline N times, which also multiplies the rate
+    by N; --start / --max-duration pick a window of the recording
+
+Request bodies come from the proxy's body capture (PROXY_CAPTURE_BODIES,
+--capture) when it recorded the request, joined on timestamp_ns and
+client_addr and sent to the captured path on --rpc-url's host. Without a
+captured body the target is rebuilt by the chain adapter with addresses from
+--accounts-file, round-robin. So is a body the proxy cut at -max-body
+("truncated": true in the capture), which would not be the recorded request.
+
+Two senders:
+
+  * vegeta: writes Vegeta JSON targets to stdout at their scheduled times
+    for `vegeta attack -lazy -format=json -rate=0 -max-workers=W`, which
+    sends each target as soon as it is read
+  * native: an asyncio/aiohttp sender with at most --workers requests in
+    flight, recording per-method latency and JSON-RPC errors itself
+
+    python3 tools/traffic_replay.py --proxy-log proxy_method.csv \\
+        --capture proxy_capture.jsonl --chain solana --rpc-url http://localhost:8899 \\
+        --accounts-file accounts.txt --speed 2 --engine vegeta \\
+        | vegeta attack -lazy -format=json -rate=0 -max-workers=512 > replay.bin
+
+Writes `running qps:<requests in the last second>` to --status-file every
+second, one row per method to --csv (planned vs sent calls; latency and
+errors with the native sender only) and the summary JSON to --summary, which
+the native sender also prints: schedule lag p50 / p99, mean and peak request
+rate, and the inter-arrival coefficient of variation of plan and replay.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+from urllib.parse import urlsplit
+
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_TOOLS_DIR))
+sys.path.insert(0, _TOOLS_DIR)
+
+from analysis.per_method_attribution import ProxyAggregate, percentile, read_proxy_sink  # noqa: E402
+
+CSV_COLUMNS = ("method", "planned_calls", "planned_share", "sent_calls", "errors",
+               "success_pct", "p50_ms", "p99_ms")
+
+ENGINES = ("vegeta", "native")
+
+
+@dataclass
+class ReplayEvent:
+    """One recorded HTTP request; several methods for a JSON-RPC batch."""
+    offset_s: float                  # since the first recorded request
+    methods: List[str]
+    timestamp_ns: int = 0            # raw sink key, 0 for aggregate rows
+    client_addr: str = ""
+    body: Optional[str] = None       # captured request body
+    http_method: str = "POST"
+    path: str = "/"
+
+
+@dataclass
+class MethodStats:
+    sent: int = 0
+    errors: int = 0
+    latencies_ms: List[float] = field(default_factory=list)
+
+
+def read_capture(path: Optional[str]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    """Body capture JSONL keyed by (timestamp_ns, client_addr)."""
+    captured: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    if not path or not os.path.exists(path):
+        return captured
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+                captured[(int(rec["timestamp_ns"]), rec.get("client_addr", ""))] = rec
+            except (ValueError, KeyError, TypeError):
+                continue
+    return captured
+
+
+def build_events(rows: Iterable[Any], capture: Optional[Dict[Tuple[int, str], Dict[str, Any]]] = None,
+                 seed: int = 0) -> List[ReplayEvent]:
+    """Recorded requests in time order, offsets relative to the first one."""
+    requests: Dict[Tuple[int, str], List[Tuple[int, str]]] = defaultdict(list)
+    per_second: Dict[int, List[str]] = defaultdict(list)
+    for row in rows:
+        if isinstance(row, ProxyAggregate):
+            per_second[row.timestamp_s].extend([row.method_name] * row.count)
+        else:
+            requests[(row.timestamp_ns, row.client_addr)].append((row.batch_idx, row.method_name))
+
+    # Offsets from the first request in integer ns: epoch ns as a float
+    # would lose sub-microsecond gaps.
+    starts = [ts for ts, _ in requests] + [second * 1_000_000_000 for second in per_second]
+    if not starts:
+        return []
+    first_ns = min(starts)
+    events = [ReplayEvent((ts - first_ns) / 1e9, [m for _, m in sorted(calls)], ts, client)
+              for (ts, client), calls in requests.items()]
+    for second, methods in per_second.items():
+        random.Random(seed + second).shuffle(methods)
+        base = (second * 1_000_000_000 - first_ns) / 1e9
+        events.extend(ReplayEvent(base + i / len(methods), [m]) for i, m in enumerate(methods))
+    events.sort(key=lambda e: e.offset_s)
+
+    for event in events:
+        rec = (capture or {}).get((event.timestamp_ns, event.client_addr)) if event.timestamp_ns else None
+        if rec is not None and not rec.get("truncated"):
+            event.body = rec.get("body")
+            event.http_method = rec.get("http_method") or "POST"
+            event.path = rec.get("path") or "/"
+    return events
+
+
+def schedule(events: Sequence[ReplayEvent], speed: float = 1.0, start_s: float = 0.0,
+             max_duration: float = 0.0,
+             methods: Optional[Sequence[str]] = None) -> List[Tuple[float, ReplayEvent]]:
+    """(due_s, event) pairs in replay time: recorded offset from the window start divided by speed.
+
+    max_duration caps the replay (wall seconds, 0 = whole log); methods keeps
+    only requests whose calls are all in the list.
+    """
+    if speed <= 0:
+        raise ValueError("speed must be > 0")
+    allowed = set(methods or ())
+    plan: List[Tuple[float, ReplayEvent]] = []
+    first = None
+    for event in events:
+        if event.offset_s < start_s or (allowed and not allowed.issuperset(event.methods)):
+            continue
+        if first is None:
+            first = event.offset_s
+        due = (event.offset_s - first) / speed
+        if max_duration > 0 and due > max_duration:
+            break
+        plan.append((due, event))
+    return plan
+
+
+def shape(times_s: Sequence[float]) -> Dict[str, Optional[float]]:
+    """Mean / peak requests per second and inter-arrival CV of sorted send times."""
+    if not times_s:
+        return {"mean_rate": 0.0, "peak_rate": 0.0, "interarrival_cv": None}
+    span = times_s[-1] - times_s[0]
+    per_second: Dict[int, int] = defaultdict(int)
+    for t in times_s:
+        per_second[int(t - times_s[0])] += 1
+    gaps = [b - a for a, b in zip(times_s, times_s[1:])]
+    cv = None
+    if gaps:
+        mean = sum(gaps) / len(gaps)
+        if mean > 0:
+            cv = math.sqrt(sum((g - mean) ** 2 for g in gaps) / len(gaps)) / mean
+    return {"mean_rate": len(times_s) / span if span > 0 else float(len(times_s)),
+            "peak_rate": float(max(per_second.values())),
+            "interarrival_cv": cv}
+
+
+def read_addresses(path: Optional[str]) -> List[str]:
+    if not path or not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+class TargetBuilder:
+    """Vegeta target per event: the captured body, or one rebuilt by the chain adapter."""
+
+    def __init__(self, rpc_url: str, chain: Optional[str] = None, addresses: Sequence[str] = ()):
+        parts = urlsplit(rpc_url)
+        self.rpc_url = rpc_url
+        self.origin = f"{parts.scheme}://{parts.netloc}"
+        self.chain = chain
+        self.addresses = list(addresses) or [""]
+        self._next_address = 0
+        self._adapter = None
+        self._param_formats: Dict[str, str] = {}
+
+    def _calls(self, methods: Sequence[str]) -> List[Tuple[str, str, str]]:
+        from chain_adapters.cli import _get_param_format
+        calls = []
+        for method in methods:
+            if method not in self._param_formats:
+                self._param_formats[method] = _get_param_format(self.chain, method)
+            address = self.addresses[self._next_address % len(self.addresses)]
+            self._next_address += 1
+            calls.append((method, address, self._param_formats[method]))
+        return calls
+
+    def target(self, event: ReplayEvent) -> Dict[str, Any]:
+        if event.body is not None:
+            target: Dict[str, Any] = {"method": event.http_method, "url": self.origin + event.path,
+                                      "header": {"Content-Type": ["application/json"]}}
+            if event.body:
+                target["body"] = base64.b64encode(event.body.encode()).decode()
+            return target
+        if not self.chain:
+            raise ValueError("no captured body for this request and no --chain to rebuild it")
+        if self._adapter is None:
+            from chain_adapters import get_adapter
+            self._adapter = get_adapter(self.chain)
+            os.environ["BLOCKCHAIN_NODE"] = self.chain
+        calls = self._calls(event.methods)
+        if len(calls) > 1:
+            return self._adapter.build_vegeta_batch_target(calls, self.rpc_url)
+        method, address, param_format = calls[0]
+        return self._adapter.build_vegeta_target(method=method, address=address,
+                                                 rpc_url=self.rpc_url, param_format=param_format)
+
+
+class StatusWriter:
+    """`running qps:<n>` with the requests sent in the last full second."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._second = None
+        self._count = 0
+
+    def _write(self, text: str) -> None:
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(text + "\n")
+        os.replace(tmp, self.path)
+
+    def sent(self, now_s: float) -> None:
+        second = int(now_s)
+        if second != self._second:
+            if self._second is not None:
+                self._write(f"running qps:{self._count if second == self._second + 1 else 0}")
+            self._second, self._count = second, 0
+        self._count += 1
+
+
+def emit_targets(plan: Sequence[Tuple[float, ReplayEvent]], builder: TargetBuilder, out: TextIO,
+                 status: Optional[StatusWriter] = None,
+                 stats: Optional[Dict[str, MethodStats]] = None) -> List[float]:
+    """Write each target at its due time (the vegeta -lazy pacer); returns the send times."""
+    sent_at: List[float] = []
+    t0 = time.monotonic()
+    for due, event in plan:
+        delay = t0 + due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            out.write(json.dumps(builder.target(event), separators=(",", ":")) + "\n")
+            out.flush()
+        except BrokenPipeError:
+            break
+        now = time.monotonic() - t0
+        sent_at.append(now)
+        if status:
+            status.sent(now)
+        if stats is not None:
+            for method in event.methods:
+                stats[method].sent += 1
+    return sent_at
+
+
+def _rpc_error_ids(payload: Any) -> Optional[set]:
+    """Ids of JSON-RPC responses carrying an error; None when the body is not JSON-RPC."""
+    items = payload if isinstance(payload, list) else [payload]
+    if not all(isinstance(item, dict) for item in items):
+        return None
+    return {item.get("id") for item in items if item.get("error") is not None}
+
+
+def _request_ids(body: bytes, methods: Sequence[str]) -> List[Any]:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return [None] * len(methods)
+    items = payload if isinstance(payload, list) else [payload]
+    ids = [item.get("id") if isinstance(item, dict) else None for item in items]
+    return ids if len(ids) == len(methods) else [None] * len(methods)
+
+
+class NativeSender:
+    """asyncio sender: requests leave at their due time, at most `workers` in flight."""
+
+    def __init__(self, plan: Sequence[Tuple[float, ReplayEvent]], builder: TargetBuilder,
+                 workers: int = 256, timeout: float = 30.0, status: Optional[StatusWriter] = None):
+        self.plan = plan
+        self.builder = builder
+        self.workers = workers
+        self.timeout = timeout
+        self.status = status
+        self.stats: Dict[str, MethodStats] = defaultdict(MethodStats)
+        self.sent_at: List[float] = []
+
+    async def _send(self, session, sem, t0: float, event: ReplayEvent, target: Dict[str, Any]) -> None:
+        import aiohttp
+        loop = asyncio.get_running_loop()
+        body = base64.b64decode(target["body"]) if target.get("body") else b""
+        headers = {k: v[0] for k, v in (target.get("header") or {}).items() if v}
+        async with sem:
+            started = loop.time()
+            self.sent_at.append(started - t0)
+            if self.status:
+                self.status.sent(started - t0)
+            failed_ids: Optional[set] = None
+            ok = False
+            try:
+                async with session.request(target["method"], target["url"], data=body or None,
+                                           headers=headers) as resp:
+                    raw = await resp.read()
+                    ok = resp.status < 400
+                    if ok:
+                        try:
+                            failed_ids = _rpc_error_ids(json.loads(raw))
+                        except ValueError:
+                            failed_ids = None
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                ok = False
+            latency_ms = (loop.time() - started) * 1000
+        ids = _request_ids(body, event.methods) if failed_ids else [None] * len(event.methods)
+        for method, call_id in zip(event.methods, ids):
+            stats = self.stats[method]
+            stats.sent += 1
+            stats.latencies_ms.append(latency_ms)
+            if not ok or (failed_ids and call_id in failed_ids):
+                stats.errors += 1
+
+    async def run(self) -> Dict[str, MethodStats]:
+        import aiohttp
+        sem = asyncio.Semaphore(self.workers)
+        connector = aiohttp.TCPConnector(limit=self.workers)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        loop = asyncio.get_running_loop()
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            t0 = loop.time()
+            tasks = []
+            for due, event in self.plan:
+                delay = t0 + due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.ensure_future(self._send(session, sem, t0, event, self.builder.target(event))))
+            await asyncio.gather(*tasks)
+        self.sent_at.sort()
+        return self.stats
+
+
+def summarize(plan: Sequence[Tuple[float, ReplayEvent]], stats: Dict[str, MethodStats],
+              native: bool) -> List[Dict[str, Any]]:
+    """Per-method rows: recorded share and what the replay sent."""
+    planned: Dict[str, int] = defaultdict(int)
+    for _, event in plan:
+        for method in event.methods:
+            planned[method] += 1
+    total = sum(planned.values())
+    rows = []
+    for method in sorted(planned, key=lambda m: (-planned[m], m)):
+        s = stats.get(method, MethodStats())
+        latencies = sorted(s.latencies_ms)
+        rows.append({
+            "method": method,
+            "planned_calls": planned[method],
+            "planned_share": round(planned[method] / total * 100, 2) if total else 0.0,
+            "sent_calls": s.sent,
+            "errors": s.errors if native else None,
+            "success_pct": round((s.sent - s.errors) / s.sent * 100, 2) if native and s.sent else None,
+            "p50_ms": round(percentile(latencies, 50), 3) if latencies else None,
+            "p99_ms": round(percentile(latencies, 99), 3) if latencies else None,
+        })
+    return rows
+
+
+def append_csv(path: str, rows: Sequence[Dict[str, Any]]) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        for row in rows:
+            writer.writerow(["" if row[c] is None else row[c] for c in CSV_COLUMNS])
+
+
+def _round(value: Optional[float], digits: int = 3) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Replay a recorded RPC proxy log")
+    ap.add_argument("--proxy-log", required=True, help="proxy per-method sink CSV (raw or aggregate)")
+    ap.add_argument("--capture", help="proxy body capture JSONL (PROXY_CAPTURE_BODIES)")
+    ap.add_argument("--rpc-url", required=True, help="endpoint to replay against")
+    ap.add_argument("--chain", help="chain adapter for requests without a captured body")
+    ap.add_argument("--accounts-file", help="addresses for rebuilt requests, one per line")
+    ap.add_argument("--engine", choices=ENGINES, default="vegeta",
+                    help="vegeta: targets on stdout for vegeta -lazy; native: asyncio sender")
+    ap.add_argument("--speed", type=float, default=1.0, help="timeline compression (2 = twice as fast)")
+    ap.add_argument("--start", type=float, default=0.0, help="skip this many recorded seconds")
+    ap.add_argument("--max-duration", type=float, default=0.0, help="stop after this many replay seconds (0 = all)")
+    ap.add_argument("--methods", help="comma-separated methods to keep (default: all)")
+    ap.add_argument("--workers", type=int, default=256, help="native sender: requests in flight")
+    ap.add_argument("--timeout", type=float, default=30.0, help="native sender: request timeout (s)")
+    ap.add_argument("--status-file", help="lifecycle status file (running qps:N)")
+    ap.add_argument("--csv", help="per-method CSV to append to")
+    ap.add_argument("--summary", help="write the summary JSON here")
+    args = ap.parse_args(argv)
+
+    if args.speed <= 0 or args.workers < 1:
+        print("❌ --speed must be > 0 and --workers >= 1", file=sys.stderr)
+        return 1
+    if args.engine == "native":
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            print("❌ aiohttp is required (pip install -r requirements.txt)", file=sys.stderr)
+            return 1
+    if not os.path.exists(args.proxy_log):
+        print(f"❌ Proxy log not found: {args.proxy_log}", file=sys.stderr)
+        return 1
+
+    events = build_events(read_proxy_sink(args.proxy_log), read_capture(args.capture))
+    methods = [m.strip() for m in args.methods.split(",") if m.strip()] if args.methods else None
+    plan = schedule(events, args.speed, args.start, args.max_duration, methods)
+    if not plan:
+        print("❌ Nothing to replay in this window", file=sys.stderr)
+        return 1
+    builder = TargetBuilder(args.rpc_url, args.chain, read_addresses(args.accounts_file))
+    status = StatusWriter(args.status_file)
+
+    started = time.monotonic()
+    try:
+        if args.engine == "native":
+            sender = NativeSender(plan, builder, args.workers, args.timeout, status)
+            stats = asyncio.run(sender.run())
+            sent_at = sender.sent_at
+        else:
+            stats = defaultdict(MethodStats)
+            sent_at = emit_targets(plan, builder, sys.stdout, status, stats)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    elapsed = time.monotonic() - started
+
+    dues = [due for due, _ in plan]
+    lags_ms = sorted(max(0.0, (sent - due) * 1000) for sent, due in zip(sorted(sent_at), dues))
+    planned_shape = shape(dues)
+    replay_shape = shape(sent_at)
+    rows = summarize(plan, stats, args.engine == "native")
+    if args.csv:
+        append_csv(args.csv, rows)
+    summary = {
+        "engine": args.engine,
+        "speed": args.speed,
+        "planned_requests": len(plan),
+        "sent_requests": len(sent_at),
+        "planned_duration_s": _round(dues[-1]),
+        "elapsed_s": _round(elapsed),
+        "lag_p50_ms": _round(percentile(lags_ms, 50)),
+        "lag_p99_ms": _round(percentile(lags_ms, 99)),
+        "planned_mean_rate": _round(planned_shape["mean_rate"]),
+        "planned_peak_rate": _round(planned_shape["peak_rate"]),
+        "planned_interarrival_cv": _round(planned_shape["interarrival_cv"]),
+        "mean_rate": _round(replay_shape["mean_rate"]),
+        "peak_rate": _round(replay_shape["peak_rate"]),
+        "interarrival_cv": _round(replay_shape["interarrival_cv"]),
+        "methods": rows,
+    }
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=2)
+    if args.engine == "native":
+        print(json.dumps(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""Asyncio WebSocket subscription load engine.
+
+Vegeta only speaks HTTP, but most RPC fleets also serve subscriptions
+(`logsSubscribe`, `accountSubscribe`, `eth_subscribe`). This engine opens N
+concurrent subscriptions against a node's WebSocket endpoint at a fixed ramp,
+holds them for a measurement window and reports per subscription method:
+
+  * subscribe latency: request sent to subscription id received (p50 / p99)
+  * notification throughput during the hold window
+  * notification delay: arrival minus the block/slot timestamp. EVM `newHeads`
+    carry the block timestamp; Solana slots are resolved once per slot with
+    `getBlockTime` over HTTP (--rpc-url). Both have one-second resolution.
+  * fan-out: arrival minus the first arrival of the same event (slot, head,
+    log, transaction or account update) across all subscriptions of that
+    method, the spread the node adds while pushing one event to every
+    subscriber. Notifications without a known identity are left out.
+
+    python3 tools/ws_subscription_bench.py --url ws://localhost:8900 \
+        --subscriptions 1000 --ramp 200 --duration 60 \
+        --methods logsSubscribe,accountSubscribe --accounts-file accounts.txt \
+        --rpc-url http://localhost:8899 --csv ws_subscriptions.csv
+
+`--methods` takes `method[:topic]` items assigned round-robin, e.g.
+`eth_subscribe:newHeads,eth_subscribe:logs` or `logsSubscribe:all`. Without
+it the defaults follow the chain template (--chain-config).
+
+Appends one row per method to --csv (header on a new file) and prints one
+JSON line: {"subscriptions", "active", "errors", "notifications_per_s",
+"methods": [{per-method row}, ...]}.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.per_method_attribution import percentile  # noqa: E402
+
+CSV_COLUMNS = ("subscriptions", "method", "requested", "active", "errors",
+               "subscribe_p50_ms", "subscribe_p99_ms", "notifications", "notifications_per_s",
+               "delay_p50_ms", "delay_p99_ms", "fanout_p50_ms", "fanout_p99_ms",
+               "started_at", "ended_at")
+
+SOLANA_DEFAULT = "slotSubscribe,logsSubscribe:all,accountSubscribe"
+EVM_DEFAULT = "eth_subscribe:newHeads,eth_subscribe:logs"
+
+
+@dataclass
+class SubscriptionSpec:
+    method: str
+    topic: str = ""
+
+    @property
+    def label(self) -> str:
+        return f"{self.method}:{self.topic}" if self.topic else self.method
+
+    def params(self, address: Optional[str]) -> List[Any]:
+        if self.method == "eth_subscribe":
+            return [self.topic or "newHeads"] + ([{}] if self.topic == "logs" else [])
+        if self.method == "logsSubscribe":
+            return [self.topic or "all", {"commitment": "confirmed"}]
+        if self.method == "accountSubscribe":
+            return [self.topic or address, {"encoding": "base64", "commitment": "confirmed"}]
+        if self.method == "programSubscribe":
+            return [self.topic, {"encoding": "base64", "commitment": "confirmed"}]
+        return [self.topic] if self.topic else []
+
+
+@dataclass
+class MethodStats:
+    requested: int = 0
+    active: int = 0
+    errors: int = 0
+    subscribe_ms: List[float] = field(default_factory=list)
+    notifications: int = 0
+    delay_ms: List[float] = field(default_factory=list)
+    arrivals: Dict[Any, List[float]] = field(default_factory=dict)
+
+    def fanout_ms(self) -> List[float]:
+        spread = []
+        for times in self.arrivals.values():
+            first = min(times)
+            spread.extend((t - first) * 1000.0 for t in times)
+        return sorted(spread)
+
+
+def parse_methods(value: str) -> List[SubscriptionSpec]:
+    specs = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        method, _, topic = item.partition(":")
+        specs.append(SubscriptionSpec(method.strip(), topic.strip()))
+    if not specs:
+        raise ValueError("no subscription methods given")
+    return specs
+
+
+def default_methods(chain_config: Dict[str, Any]) -> Optional[str]:
+    """Subscription mix for a chain template, None if the chain has no known one."""
+    if chain_config.get("chain_type") == "solana":
+        return SOLANA_DEFAULT
+    single = str(chain_config.get("rpc_methods", {}).get("single", ""))
+    if single.startswith("eth_"):
+        return EVM_DEFAULT
+    return None
+
+
+def read_addresses(path: Optional[str]) -> List[str]:
+    if not path or not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(value, 16) if isinstance(value, str) and value.startswith("0x") else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def event_key(spec: SubscriptionSpec, result: Any, address: Optional[str] = None) -> Optional[Tuple]:
+    """Identity of the event a notification carries, shared by every subscriber that receives it."""
+    if not isinstance(result, dict):
+        return None
+    value = result.get("value")
+    if spec.method == "eth_subscribe":
+        if "logIndex" in result:  # one log of one transaction
+            return ("log", result.get("transactionHash"), _int(result["logIndex"]))
+        if "number" in result:  # newHeads
+            return ("head", _int(result["number"]))
+        return None
+    if spec.method == "slotSubscribe":
+        return ("slot", _int(result["slot"])) if "slot" in result else None
+    if spec.method == "logsSubscribe":
+        signature = value.get("signature") if isinstance(value, dict) else None
+        return ("tx", signature) if signature else None
+    if spec.method in ("accountSubscribe", "programSubscribe"):
+        slot, _ = block_of(result)
+        if spec.method == "programSubscribe":
+            account = value.get("pubkey") if isinstance(value, dict) else None
+        else:
+            account = spec.topic or address
+        return ("account", account, slot) if account and slot is not None else None
+    return None
+
+
+def block_of(result: Any) -> Tuple[Optional[int], Optional[float]]:
+    """(block or slot number, block timestamp in epoch seconds) of a notification result."""
+    if not isinstance(result, dict):
+        return None, None
+    if "number" in result:  # EVM newHeads
+        ts = _int(result.get("timestamp"))
+        return _int(result["number"]), float(ts) if ts is not None else None
+    if "blockNumber" in result:  # EVM logs
+        return _int(result["blockNumber"]), None
+    context = result.get("context")
+    if isinstance(context, dict) and "slot" in context:  # Solana account/logs/program
+        return _int(context["slot"]), None
+    if "slot" in result:  # Solana slotSubscribe
+        return _int(result["slot"]), None
+    return None, None
+
+
+class SubscriptionBench:
+    def __init__(self, url: str, specs: Sequence[SubscriptionSpec], subscriptions: int,
+                 ramp: float, per_connection: int, duration: float,
+                 addresses: Sequence[str] = (), rpc_url: Optional[str] = None,
+                 timeout: float = 10.0):
+        self.url = url
+        self.specs = list(specs)
+        self.subscriptions = subscriptions
+        self.ramp = ramp
+        self.per_connection = max(1, per_connection)
+        self.duration = duration
+        self.addresses = list(addresses)
+        self.rpc_url = rpc_url
+        self.timeout = timeout
+        self.stats = {spec.label: MethodStats() for spec in self.specs}
+        self.hold_start = 0.0
+        self.hold_end = 0.0
+        self._block_times: Dict[int, asyncio.Future] = {}
+        self._delay_tasks: set = set()
+
+    def _assignments(self) -> List[List[Tuple[int, SubscriptionSpec]]]:
+        subs = [(i, self.specs[i % len(self.specs)]) for i in range(self.subscriptions)]
+        return [subs[i:i + self.per_connection] for i in range(0, len(subs), self.per_connection)]
+
+    def _send_at(self, index: int, t0: float) -> float:
+        return t0 + (index / self.ramp if self.ramp > 0 else 0.0)
+
+    async def _block_time(self, session, slot: int) -> Optional[float]:
+        """Solana slot timestamp via getBlockTime, one lookup per slot."""
+        if not self.rpc_url:
+            return None
+        if slot not in self._block_times:
+            self._block_times[slot] = asyncio.ensure_future(self._fetch_block_time(session, slot))
+        return await self._block_times[slot]
+
+    async def _fetch_block_time(self, session, slot: int) -> Optional[float]:
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "getBlockTime", "params": [slot]}
+        try:
+            async with session.post(self.rpc_url, json=payload) as resp:
+                result = (await resp.json(content_type=None)).get("result")
+            return float(result) if isinstance(result, (int, float)) else None
+        except Exception:
+            return None
+
+    def _notification(self, session, spec: SubscriptionSpec, address: Optional[str], result: Any, arrived: float):
+        """Record one notification; never waits, so the reader keeps draining the socket."""
+        if not (self.hold_start <= arrived <= self.hold_end):
+            return
+        stats = self.stats[spec.label]
+        stats.notifications += 1
+        key = event_key(spec, result, address)
+        if key is not None:
+            stats.arrivals.setdefault(key, []).append(arrived)
+        block, block_ts = block_of(result)
+        if block is None:
+            return
+        if block_ts is None and spec.method != "eth_subscribe":
+            # The slot time arrives later over HTTP; the arrival time is already taken.
+            if self.rpc_url:
+                task = asyncio.ensure_future(self._record_delay(session, stats, block, arrived))
+                self._delay_tasks.add(task)
+                task.add_done_callback(self._delay_tasks.discard)
+            return
+        if block_ts is not None:
+            stats.delay_ms.append(max(0.0, (arrived - block_ts) * 1000.0))
+
+    async def _record_delay(self, session, stats: MethodStats, slot: int, arrived: float):
+        block_ts = await self._block_time(session, slot)
+        if block_ts is not None:
+            stats.delay_ms.append(max(0.0, (arrived - block_ts) * 1000.0))
+
+    async def _drain_delays(self):
+        """Wait for outstanding getBlockTime lookups, at most --timeout."""
+        if self._delay_tasks:
+            await asyncio.wait(list(self._delay_tasks), timeout=self.timeout)
+
+    async def _connection(self, session, subs: List[Tuple[int, SubscriptionSpec]], t0: float, stop: asyncio.Event):
+        import aiohttp
+
+        await asyncio.sleep(max(0.0, self._send_at(subs[0][0], t0) - time.time()))
+        for _, spec in subs:
+            self.stats[spec.label].requested += 1
+        try:
+            ws = await asyncio.wait_for(session.ws_connect(self.url, max_msg_size=0), self.timeout)
+        except Exception:
+            for _, spec in subs:
+                self.stats[spec.label].errors += 1
+            return
+
+        pending: Dict[int, Tuple[SubscriptionSpec, Optional[str], float]] = {}
+        by_subscription: Dict[Any, Tuple[SubscriptionSpec, Optional[str]]] = {}
+
+        async def reader():
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+                    continue
+                arrived = time.time()
+                try:
+                    data = json.loads(msg.data)
+                except ValueError:
+                    continue
+                if isinstance(data, dict) and data.get("id") in pending:
+                    spec, address, sent = pending.pop(data["id"])
+                    stats = self.stats[spec.label]
+                    if "result" in data and data["result"] is not None:
+                        stats.active += 1
+                        stats.subscribe_ms.append((arrived - sent) * 1000.0)
+                        by_subscription[data["result"]] = (spec, address)
+                    else:
+                        stats.errors += 1
+                elif isinstance(data, dict) and isinstance(data.get("params"), dict):
+                    subscription = by_subscription.get(data["params"].get("subscription"))
+                    if subscription is not None:
+                        self._notification(session, *subscription, data["params"].get("result"), arrived)
+
+        read_task = asyncio.ensure_future(reader())
+        try:
+            for index, spec in subs:
+                await asyncio.sleep(max(0.0, self._send_at(index, t0) - time.time()))
+                address = self.addresses[index % len(self.addresses)] if self.addresses else None
+                pending[index] = (spec, address, time.time())
+                await ws.send_str(json.dumps({"jsonrpc": "2.0", "id": index,
+                                              "method": spec.method, "params": spec.params(address)}))
+            await stop.wait()
+        except Exception:
+            pass
+        finally:
+            for spec, _, _ in pending.values():
+                self.stats[spec.label].errors += 1
+            pending.clear()
+            await ws.close()
+            read_task.cancel()
+            try:
+                await read_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def run(self) -> Dict[str, MethodStats]:
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(limit=0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            stop = asyncio.Event()
+            t0 = time.time() + 0.1
+            ramp_s = self.subscriptions / self.ramp if self.ramp > 0 else 0.0
+            # Measure only once every subscription had its chance to open
+            self.hold_start = t0 + ramp_s
+            self.hold_end = self.hold_start + self.duration
+            tasks = [asyncio.ensure_future(self._connection(session, subs, t0, stop))
+                     for subs in self._assignments()]
+            await asyncio.sleep(max(0.0, self.hold_end - time.time()))
+            stop.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._drain_delays()
+        return self.stats
+
+
+def summarize(stats: Dict[str, MethodStats], subscriptions: int, duration: float) -> List[Dict[str, Any]]:
+    rows = []
+    for label, s in stats.items():
+        subscribe = sorted(s.subscribe_ms)
+        delay = sorted(s.delay_ms)
+        fanout = s.fanout_ms()
+        rows.append({
+            "subscriptions": subscriptions,
+            "method": label,
+            "requested": s.requested,
+            "active": s.active,
+            "errors": s.errors,
+            "subscribe_p50_ms": round(percentile(subscribe, 50), 2),
+            "subscribe_p99_ms": round(percentile(subscribe, 99), 2),
+            "notifications": s.notifications,
+            "notifications_per_s": round(s.notifications / duration, 2) if duration > 0 else 0.0,
+            "delay_p50_ms": round(percentile(delay, 50), 1) if delay else None,
+            "delay_p99_ms": round(percentile(delay, 99), 1) if delay else None,
+            "fanout_p50_ms": round(percentile(fanout, 50), 2) if fanout else None,
+            "fanout_p99_ms": round(percentile(fanout, 99), 2) if fanout else None,
+        })
+    return rows
+
+
+def append_csv(path: str, rows: Sequence[Dict[str, Any]], started_at: str, ended_at: str) -> None:
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if new_file:
+            writer.writerow(CSV_COLUMNS)
+        for row in rows:
+            row = {**row, "started_at": started_at, "ended_at": ended_at}
+            writer.writerow(["" if row[c] is None else row[c] for c in CSV_COLUMNS])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="WebSocket subscription load engine")
+    ap.add_argument("--url", required=True, help="node WebSocket endpoint")
+    ap.add_argument("--subscriptions", type=int, required=True, help="concurrent subscriptions to open")
+    ap.add_argument("--ramp", type=float, default=100.0, help="subscriptions opened per second (0 = all at once)")
+    ap.add_argument("--per-connection", type=int, default=1, help="subscriptions sharing one WebSocket")
+    ap.add_argument("--duration", type=float, default=60.0, help="hold window after the ramp (s)")
+    ap.add_argument("--methods", help="method[:topic] items, round-robin over the subscriptions")
+    ap.add_argument("--chain-config", help="config/chains/<chain>.json for the default methods")
+    ap.add_argument("--accounts-file", help="addresses for accountSubscribe, one per line")
+    ap.add_argument("--rpc-url", help="HTTP endpoint for Solana getBlockTime lookups")
+    ap.add_argument("--timeout", type=float, default=10.0, help="WebSocket connect timeout (s)")
+    ap.add_argument("--csv", help="per-method CSV to append to")
+    args = ap.parse_args(argv)
+
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        print("❌ aiohttp is required (pip install -r requirements.txt)", file=sys.stderr)
+        return 1
+
+    methods = args.methods
+    if not methods and args.chain_config:
+        try:
+            with open(args.chain_config) as f:
+                methods = default_methods(json.load(f))
+        except (OSError, ValueError):
+            methods = None
+    if not methods:
+        print("❌ No subscription methods for this chain: set WS_SUBSCRIBE_METHODS", file=sys.stderr)
+        return 1
+    try:
+        specs = parse_methods(methods)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    addresses = read_addresses(args.accounts_file)
+    if any(s.method == "accountSubscribe" and not s.topic for s in specs) and not addresses:
+        print("❌ accountSubscribe needs --accounts-file or an address topic", file=sys.stderr)
+        return 1
+
+    bench = SubscriptionBench(args.url, specs, args.subscriptions, args.ramp, args.per_connection,
+                              args.duration, addresses, args.rpc_url, args.timeout)
+    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    stats = asyncio.run(bench.run())
+    ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    rows = summarize(stats, args.subscriptions, args.duration)
+    if args.csv:
+        append_csv(args.csv, rows, started_at, ended_at)
+    print(json.dumps({
+        "subscriptions": args.subscriptions,
+        "active": sum(r["active"] for r in rows),
+        "errors": sum(r["errors"] for r in rows),
+        "notifications_per_s": round(sum(r["notifications_per_s"] for r in rows), 2),
+        "methods": rows,
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
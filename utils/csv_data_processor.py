@@ -7,6 +7,7 @@ Removed field mapping functionality, focused on core data processing
 import pandas as pd
 import numpy as np
 from utils.unified_logger import get_logger
+from utils.resume_gaps import load_resume_gaps, break_at_gaps
 from typing import List, Dict, Optional, Any
 import os
 
@@ -187,7 +188,14 @@ class CSVDataProcessor:
             # 3. Remove completely empty columns
             self.df = self.df.dropna(axis=1, how='all')
             
-            # 4. Basic data validation
+            # 4. Break the time series at --resume gaps (no-op for uninterrupted runs)
+            if self.csv_file:
+                gaps = load_resume_gaps(os.path.dirname(os.path.abspath(self.csv_file)))
+                if gaps:
+                    self.df = break_at_gaps(self.df, gaps)
+                    logger.info(f"♻️ Resumed session: time series broken at {len(gaps)} resume gap(s)")
+
+            # 5. Basic data validation
             if len(self.df) == 0:
                 logger.warning("⚠️ No data remaining after cleaning")
                 return False
@@ -12,7 +12,7 @@ Provider-aware fields use stable logical names while their physical CSV names
 can vary through provider rules. Readers should resolve logical names through
 this registry instead of hard-coding physical column names.
 
-Current scope: core sections such as disk, basic, and block are registered.
+Current scope: core sections such as disk, basic, block, and process are registered.
 Dynamic sections are generated by their collectors. The bash implementation in
 config/csv_schema_registry.sh must remain symmetric with this file.
 """
@@ -40,7 +40,7 @@ VALID_SEMANTIC_TYPES = {
 
 VALID_SEGMENTS = {
     "basic", "device", "network", "ena", "overhead",
-    "block", "qps", "cgroup", "meta",
+    "block", "qps", "cgroup", "process", "meta",
 }
 
 
@@ -63,7 +63,7 @@ class FieldDef:
 
 # CSV section order. Dynamic sections have runtime-dependent widths and are
 # generated by their own header helpers. Static sections are registered with FieldDef.
-SEGMENT_ORDER = ["basic", "device", "network", "ena", "overhead", "block", "qps", "cgroup", "meta"]
+SEGMENT_ORDER = ["basic", "device", "network", "ena", "overhead", "block", "qps", "cgroup", "process", "meta"]
 
 # Dynamic sections are not represented as static FieldDef lists.
 DYNAMIC_SEGMENTS = {"device", "ena"}
@@ -128,6 +128,26 @@ _BLOCK_FIELDS: List[FieldDef] = [
     FieldDef("probe_error",             "unknown", "block", False, "probe_error"),
 ]
 
+# Process accounting section fields.
+# Source: process_accounting_collector.py ALL_FIELDS (node role, then monitor role).
+_PROCESS_FIELDS: List[FieldDef] = [
+    FieldDef("proc_node_read_bytes_s",        "throughput", "process", False, "proc_node_read_bytes_s"),
+    FieldDef("proc_node_write_bytes_s",       "throughput", "process", False, "proc_node_write_bytes_s"),
+    FieldDef("proc_node_syscr_s",             "rate",       "process", False, "proc_node_syscr_s"),
+    FieldDef("proc_node_syscw_s",             "rate",       "process", False, "proc_node_syscw_s"),
+    FieldDef("proc_node_runq_wait_ms_s",      "latency",    "process", False, "proc_node_runq_wait_ms_s"),
+    FieldDef("proc_node_runq_delay_us",       "latency",    "process", False, "proc_node_runq_delay_us"),
+    FieldDef("proc_node_threads",             "gauge",      "process", False, "proc_node_threads"),
+    FieldDef("proc_monitor_read_bytes_s",     "throughput", "process", False, "proc_monitor_read_bytes_s"),
+    FieldDef("proc_monitor_write_bytes_s",    "throughput", "process", False, "proc_monitor_write_bytes_s"),
+    FieldDef("proc_monitor_syscr_s",          "rate",       "process", False, "proc_monitor_syscr_s"),
+    FieldDef("proc_monitor_syscw_s",          "rate",       "process", False, "proc_monitor_syscw_s"),
+    FieldDef("proc_monitor_runq_wait_ms_s",   "latency",    "process", False, "proc_monitor_runq_wait_ms_s"),
+    FieldDef("proc_monitor_runq_delay_us",    "latency",    "process", False, "proc_monitor_runq_delay_us"),
+    FieldDef("proc_monitor_threads",          "gauge",      "process", False, "proc_monitor_threads"),
+    FieldDef("proc_meta_source",              "unknown",    "process", False, "proc_meta_source"),
+]
+
 BLOCK_CACHE_REQUIRED_KEYS = [
     "timestamp",
     "local_block_height",
@@ -141,7 +161,7 @@ class CSVSchemaRegistry:
     """CSV schema registry shared by readers and writers."""
 
     # Static fields in CSV segment order. Dynamic sections are generated elsewhere.
-    _ALL_STATIC_FIELDS: List[FieldDef] = _BASIC_FIELDS + _DISK_FIELDS + _BLOCK_FIELDS
+    _ALL_STATIC_FIELDS: List[FieldDef] = _BASIC_FIELDS + _DISK_FIELDS + _BLOCK_FIELDS + _PROCESS_FIELDS
     _FIELDS_BY_LOGICAL: Dict[str, FieldDef] = {f.logical_name: f for f in _ALL_STATIC_FIELDS}
 
     @classmethod
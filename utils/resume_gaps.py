@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Resume gaps of a checkpointed session (--resume)
+
+A resumed run cuts the interrupted round out of the monitor CSVs, so the
+time series has a hole between the last checkpoint and the restart. The
+gaps are recorded in RUN_CHECKPOINT_JSON under "resumes". Charts must not
+draw a line across them and rates must not be computed over them.
+"""
+
+import glob
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+def find_checkpoint(logs_dir: Optional[str]) -> Optional[str]:
+    """RUN_CHECKPOINT_JSON, or the newest run_checkpoint_*.json in logs_dir"""
+    env_path = os.environ.get('RUN_CHECKPOINT_JSON')
+    if env_path and os.path.exists(env_path):
+        return env_path
+    if not logs_dir:
+        return None
+    candidates = sorted(glob.glob(os.path.join(logs_dir, 'run_checkpoint_*.json')), reverse=True)
+    return candidates[0] if candidates else None
+
+
+def load_resumes(logs_dir: Optional[str]) -> List[Dict]:
+    """The checkpoint's "resumes" entries (empty for a run that was never resumed)"""
+    path = find_checkpoint(logs_dir)
+    if not path:
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return list(json.load(f).get('resumes') or [])
+    except (OSError, ValueError):
+        return []
+
+
+def load_resume_gaps(logs_dir: Optional[str]) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """(interrupted_after, resumed_at) as local-time timestamps, like the CSV timestamp column"""
+    gaps = []
+    for entry in load_resumes(logs_dir):
+        try:
+            start = pd.Timestamp.fromtimestamp(int(entry['interrupted_after']))
+            end = pd.Timestamp.fromtimestamp(int(entry['resumed_at']))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if end > start:
+            gaps.append((start, end))
+    return gaps
+
+
+def break_at_gaps(df: pd.DataFrame, gaps: List[Tuple[pd.Timestamp, pd.Timestamp]],
+                  timestamp_col: str = 'timestamp') -> pd.DataFrame:
+    """Insert one all-NaN row inside each gap so line plots break there.
+
+    The timestamp column must already be datetime. Rows are re-sorted by time.
+    """
+    if df is None or df.empty or not gaps or timestamp_col not in df.columns:
+        return df
+    if not pd.api.types.is_datetime64_any_dtype(df[timestamp_col]):
+        return df
+    ts = df[timestamp_col]
+    separators = []
+    for start, end in gaps:
+        # Only gaps with samples on both sides need a separator.
+        if (ts <= start).any() and (ts >= end).any():
+            separators.append({timestamp_col: start + (end - start) / 2})
+    if not separators:
+        return df
+    out = pd.concat([df, pd.DataFrame(separators)], ignore_index=True)
+    return out.sort_values(timestamp_col, kind='stable').reset_index(drop=True)
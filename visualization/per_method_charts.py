@@ -7,6 +7,7 @@ Generates SVG chart types using only Python stdlib:
 4. per_method_error_rate_<chain>.svg  - per-second per-method error-rate line chart
 5. per_method_resource_<chain>.svg    - per-second attributed-resource stacked area chart
 6. per_method_success_failure_<chain>.svg - per-method success/failure totals
+7. per_method_saturation_<chain>.svg  - per-round per-method p99 against round QPS, knees marked
 
 Design principles:
 - no matplotlib/numpy/pandas dependency for this path
@@ -61,6 +62,15 @@ def _scale(value: float, vmin: float, vmax: float, out_min: float, out_max: floa
     return out_min + (value - vmin) / (vmax - vmin) * (out_max - out_min)
 
 
+def _tick_label(value: float, span: float) -> str:
+    """Tick text with enough decimals for the axis span (sub-ms latency axes)."""
+    if span >= 5:
+        return f"{value:.1f}"
+    if span >= 0.5:
+        return f"{value:.2f}"
+    return f"{value:.3f}"
+
+
 def _svg_header(title: str) -> str:
     safe = html.escape(title)
     return f'''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {_W} {_H}" font-family="Arial, sans-serif" font-size="11">
@@ -90,7 +100,7 @@ def _svg_axes(x_min: float, x_max: float, y_min: float, y_max: float,
         y_px = _PAD_T + _PLOT_H - i * _PLOT_H / 5
         y_val = y_min + i * (y_max - y_min) / 5
         out.append(f'<line class="gridline" x1="{_PAD_L}" y1="{y_px}" x2="{_PAD_L + _PLOT_W}" y2="{y_px}"/>')
-        out.append(f'<text class="label" x="{_PAD_L - 5}" y="{y_px + 3}" text-anchor="end">{y_val:.1f}</text>')
+        out.append(f'<text class="label" x="{_PAD_L - 5}" y="{y_px + 3}" text-anchor="end">{_tick_label(y_val, y_max - y_min)}</text>')
     # Axis labels.
     out.append(f'<text class="label" x="{_PAD_L + _PLOT_W/2}" y="{_H - 10}" text-anchor="middle">{html.escape(x_label)}</text>')
     out.append(f'<text class="label" x="15" y="{_PAD_T + _PLOT_H/2}" text-anchor="middle" transform="rotate(-90 15 {_PAD_T + _PLOT_H/2})">{html.escape(y_label)}</text>')
@@ -256,7 +266,7 @@ def plot_latency_percentiles(
         y = _PAD_T + _PLOT_H - i * _PLOT_H / 5
         val = y_max * i / 5
         parts.append(f'<line class="gridline" x1="{_PAD_L}" y1="{y}" x2="{_PAD_L + _PLOT_W}" y2="{y}"/>')
-        parts.append(f'<text class="label" x="{_PAD_L - 5}" y="{y + 3}" text-anchor="end">{val:.1f}</text>')
+        parts.append(f'<text class="label" x="{_PAD_L - 5}" y="{y + 3}" text-anchor="end">{_tick_label(val, y_max)}</text>')
 
     for idx, method in enumerate(methods):
         center = _PAD_L + group_w * idx + group_w / 2
@@ -386,6 +396,67 @@ def plot_resource_stacked(
     return _write_svg("\n".join(parts), output)
 
 
+def plot_saturation_curves(
+    curve: Sequence[dict],
+    knees: Sequence[dict],
+    output: str | Path,
+    top_n: int = 10,
+    title: str = "Per-Method Saturation Curves",
+) -> Path:
+    """p99 of each method per round (log scale) against the round's QPS; the
+    first degraded round of each method (analysis.method_saturation) is circled."""
+    calls: dict[str, int] = defaultdict(int)
+    for r in curve:
+        calls[r["method"]] += r["calls"]
+    methods = [m for m, _ in sorted(calls.items(), key=lambda x: -x[1])[:top_n]]
+    if not methods:
+        svg = _svg_header(title) + _svg_axes(0, 1, 0, 1, "round QPS", "p99 latency (ms, log)")
+        return _write_svg(svg, output)
+    colors = _assign_colors(methods)
+    levels = sorted({r["qps"] for r in curve})
+    x_min, x_max = float(levels[0]), float(levels[-1])
+    if x_max == x_min:
+        x_max = x_min + 1
+    p99s = [r["p99_ms"] for r in curve if r["method"] in methods and r["p99_ms"] > 0]
+    lo = math.floor(math.log10(min(p99s))) if p99s else 0
+    hi = math.ceil(math.log10(max(p99s))) if p99s else 1
+    if hi == lo:
+        hi = lo + 1
+
+    def px(x: float) -> float:
+        return _scale(x, x_min, x_max, _PAD_L, _PAD_L + _PLOT_W)
+
+    def py(ms: float) -> float:
+        return _scale(math.log10(max(ms, 10 ** lo)), lo, hi, _PAD_T + _PLOT_H, _PAD_T)
+
+    parts = [_svg_header(title)]
+    for i in range(6):
+        x_px = _PAD_L + i * _PLOT_W / 5
+        parts.append(f'<line class="gridline" x1="{x_px}" y1="{_PAD_T}" x2="{x_px}" y2="{_PAD_T + _PLOT_H}"/>')
+        parts.append(f'<text class="label" x="{x_px}" y="{_PAD_T + _PLOT_H + 14}" text-anchor="middle">'
+                     f'{int(x_min + i * (x_max - x_min) / 5)}</text>')
+    for e in range(lo, hi + 1):
+        y_px = py(10 ** e)
+        parts.append(f'<line class="gridline" x1="{_PAD_L}" y1="{y_px}" x2="{_PAD_L + _PLOT_W}" y2="{y_px}"/>')
+        parts.append(f'<text class="label" x="{_PAD_L - 5}" y="{y_px + 3}" text-anchor="end">{10 ** e:g}</text>')
+    parts.append(f'<text class="label" x="{_PAD_L + _PLOT_W/2}" y="{_H - 10}" text-anchor="middle">round QPS</text>')
+    parts.append(f'<text class="label" x="15" y="{_PAD_T + _PLOT_H/2}" text-anchor="middle" '
+                 f'transform="rotate(-90 15 {_PAD_T + _PLOT_H/2})">p99 latency (ms, log)</text>')
+
+    knee_at = {k["method"]: k["degraded_at_qps"] for k in knees if k["degraded"]}
+    for m in methods:
+        rounds = sorted((r for r in curve if r["method"] == m), key=lambda r: r["qps"])
+        pts = [(px(r["qps"]), py(r["p99_ms"])) for r in rounds]
+        parts.append(_svg_line(pts, colors[m], width=2))
+        for (x, y), r in zip(pts, rounds):
+            radius = 6 if r["qps"] == knee_at.get(m) else 2.5
+            fill = "none" if radius > 3 else colors[m]
+            parts.append(f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{radius}" fill="{fill}" '
+                         f'stroke="{colors[m]}" stroke-width="2"/>')
+    parts.append(_svg_legend(methods, colors))
+    return _write_svg("\n".join(parts), output)
+
+
 def generate_all_charts(
     qps_rows: Sequence[PerMethodQpsRow],
     resource_rows: Sequence[PerMethodResourceRow],
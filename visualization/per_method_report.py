@@ -74,6 +74,63 @@ PER_METHOD_TRANSLATIONS = {
             "total_count. Stacked area shows method-level resource contribution."
         ),
         "no_data": "No per-method data available — proxy sink CSV was empty or all requests were unmatched.",
+        "corr_p50_col": "Corrected p50 (ms)",
+        "corr_p99_col": "Corrected p99 (ms)",
+        "calibration_title": "Proxy Overhead Calibration",
+        "calibration_desc": (
+            "Paired Vegeta rounds straight to the node and through the proxy. Corrected "
+            "columns above subtract the overhead interpolated at each second's total QPS."
+        ),
+        "calib_qps_col": "QPS",
+        "calib_direct_p50_col": "Direct p50 (ms)",
+        "calib_proxied_p50_col": "Proxied p50 (ms)",
+        "calib_overhead_p50_col": "Overhead p50 (ms)",
+        "calib_overhead_p99_col": "Overhead p99 (ms)",
+        "calib_cpu_col": "Proxy CPU peak (%)",
+        "saturation_warning": (
+            "Proxy CPU reached {threshold:.0f}% of its {cores} core budget at {qps:,} QPS "
+            "for {seconds} s (peak {peak:.0f}%). Latency and QPS in this round may reflect "
+            "the proxy rather than the node."
+        ),
+        "cost_title": "Marginal Cost per 1k Calls",
+        "cost_desc": (
+            "Non-negative least squares over {samples} monitor samples under load: each "
+            "resource is a baseline plus a per-call cost times each method's call rate. "
+            "Unlike the CPU share above, which splits every second by request count, these "
+            "are the cost of one more call. Ranges are 95% bootstrap intervals."
+        ),
+        "cost_calls_col": "Calls",
+        "cost_cpu_col": "CPU (%·s / 1k calls)",
+        "cost_disk_col": "Disk reads / 1k calls",
+        "cost_net_col": "Network KB / 1k calls",
+        "cost_baseline_row": "Baseline (% / reads/s / KB/s)",
+        "cost_fit_row": "R² (RMSE)",
+        "cost_collinear_warning": (
+            "Method call rates moved together during the run (condition number {cond}), so "
+            "the split between methods is poorly determined. Single-method rounds separate them."
+        ),
+        "saturation_title": "Saturation by QPS Round",
+        "saturation_desc": (
+            "Each method's calls in every round's measurement window. A method degrades in the "
+            "first round where its p99 is more than {factor:g}x its lowest round's, its errors "
+            "exceed {errors:g}%, or its rate falls more than {shortfall:g}% behind the target. "
+            "Methods are ranked by the round QPS at which they degrade."
+        ),
+        "saturation_rank_col": "Rank",
+        "saturation_degrades_col": "Degrades at QPS",
+        "saturation_total_col": "Achieved Total QPS",
+        "saturation_trigger_col": "Trigger",
+        "saturation_baseline_col": "Baseline p99 (ms)",
+        "saturation_knee_p99_col": "p99 at Knee (ms)",
+        "saturation_last_good_col": "Last Good QPS",
+        "saturation_not_degraded": "not up to {qps:,}",
+        "saturation_round_col": "Round QPS",
+        "saturation_cell_hint": "Cells: achieved calls/s · p50/p99 ms · error %; shaded from each method's knee on.",
+        "chart_saturation_title": "Per-Method Saturation Curves",
+        "chart_saturation_desc": (
+            "p99 latency of each method per round against the round's QPS, log scale. The "
+            "large circle marks the round where the method degrades."
+        ),
     },
     "zh": {
         "section_title": "Per-Method 性能归因",
@@ -120,6 +177,58 @@ PER_METHOD_TRANSLATIONS = {
             "堆叠面积图展示 method 级资源贡献。"
         ),
         "no_data": "无 per-method 数据 — proxy sink CSV 为空, 或所有请求均未匹配 DSL extractor。",
+        "corr_p50_col": "校正 p50 (ms)",
+        "corr_p99_col": "校正 p99 (ms)",
+        "calibration_title": "Proxy 开销校准",
+        "calibration_desc": (
+            "成对的 Vegeta 轮次分别直连节点和经过 proxy。上表校正列按每秒总 QPS 插值扣除 proxy 开销。"
+        ),
+        "calib_qps_col": "QPS",
+        "calib_direct_p50_col": "直连 p50 (ms)",
+        "calib_proxied_p50_col": "经 proxy p50 (ms)",
+        "calib_overhead_p50_col": "开销 p50 (ms)",
+        "calib_overhead_p99_col": "开销 p99 (ms)",
+        "calib_cpu_col": "Proxy CPU 峰值 (%)",
+        "saturation_warning": (
+            "{qps:,} QPS 轮次中 proxy CPU 有 {seconds} 秒达到 {cores} 核预算的 {threshold:.0f}% "
+            "(峰值 {peak:.0f}%)。该轮延迟与 QPS 可能受 proxy 而非节点限制。"
+        ),
+        "cost_title": "每千次调用边际成本",
+        "cost_desc": (
+            "基于 {samples} 个负载期间监控样本的非负最小二乘: 每项资源 = 基线 + 各 method 调用速率 × "
+            "单次调用成本。与上表按请求数逐秒分摊的 CPU 占比不同, 这里是多一次调用的实际成本。"
+            "区间为 95% bootstrap 置信区间。"
+        ),
+        "cost_calls_col": "调用数",
+        "cost_cpu_col": "CPU (%·s / 千次调用)",
+        "cost_disk_col": "磁盘读次数 / 千次调用",
+        "cost_net_col": "网络 KB / 千次调用",
+        "cost_baseline_row": "基线 (% / 读次数/s / KB/s)",
+        "cost_fit_row": "R² (RMSE)",
+        "cost_collinear_warning": (
+            "压测期间各 method 调用速率同步变化 (条件数 {cond}), method 之间的成本拆分不可靠。"
+            "单 method 轮次可将其区分。"
+        ),
+        "saturation_title": "各 QPS 轮次饱和情况",
+        "saturation_desc": (
+            "每轮测量窗口内各 method 的调用。method 在首个满足以下任一条件的轮次开始劣化: p99 超过其最低轮次的 "
+            "{factor:g} 倍、错误率超过 {errors:g}%、或实际速率落后目标超过 {shortfall:g}%。"
+            "method 按开始劣化的轮次 QPS 排序。"
+        ),
+        "saturation_rank_col": "排名",
+        "saturation_degrades_col": "劣化起始 QPS",
+        "saturation_total_col": "实际总 QPS",
+        "saturation_trigger_col": "触发条件",
+        "saturation_baseline_col": "基线 p99 (ms)",
+        "saturation_knee_p99_col": "拐点 p99 (ms)",
+        "saturation_last_good_col": "最后正常 QPS",
+        "saturation_not_degraded": "至 {qps:,} 未劣化",
+        "saturation_round_col": "轮次 QPS",
+        "saturation_cell_hint": "单元格: 实际调用/秒 · p50/p99 ms · 错误率; 各 method 拐点起的轮次已着色。",
+        "chart_saturation_title": "每方法饱和曲线",
+        "chart_saturation_desc": (
+            "各 method 每轮 p99 延迟随轮次 QPS 的变化 (对数坐标)。大圆圈标记 method 开始劣化的轮次。"
+        ),
     },
 }
 
@@ -138,15 +247,20 @@ def compute_summary(
     qps_rows: Sequence[PerMethodQpsRow],
     resource_rows: Sequence[PerMethodResourceRow],
     top_n: int = 10,
+    corrected_rows: Sequence[PerMethodQpsRow] | None = None,
 ) -> list[dict]:
     """Aggregate method-level summary rows for the table.
 
     One row per method: total_requests, avg_p50, avg_p90, avg_p99, max_p99, errors,
-    error_rate, peak_cpu_share.
+    error_rate, peak_cpu_share. With corrected_rows (proxy overhead subtracted,
+    see analysis.proxy_overhead.correct_qps_rows) also corr_p50_ms / corr_p99_ms.
     """
     by_method_qps: dict[str, list[PerMethodQpsRow]] = {}
     for r in qps_rows:
         by_method_qps.setdefault(r.method_name, []).append(r)
+    by_method_corr: dict[str, list[PerMethodQpsRow]] = {}
+    for r in corrected_rows or ():
+        by_method_corr.setdefault(r.method_name, []).append(r)
     by_method_res: dict[str, list[PerMethodResourceRow]] = {}
     for r in resource_rows:
         by_method_res.setdefault(r.method_name, []).append(r)
@@ -162,7 +276,7 @@ def compute_summary(
         max_p99 = max((r.p99_ms for r in qrs), default=0)
         rrs = by_method_res.get(method, [])
         peak_cpu_share = max((r.weight for r in rrs), default=0) * 100
-        summary.append({
+        row = {
             "method": method,
             "total_requests": total,
             "success_count": successes,
@@ -173,7 +287,12 @@ def compute_summary(
             "error_count": errors,
             "error_rate": errors / total if total > 0 else 0,
             "peak_cpu_share_pct": peak_cpu_share,
-        })
+        }
+        crs = by_method_corr.get(method)
+        if crs:
+            row["corr_p50_ms"] = sum(r.p50_ms for r in crs) / len(crs)
+            row["corr_p99_ms"] = sum(r.p99_ms for r in crs) / len(crs)
+        summary.append(row)
     # top-N by total requests
     summary.sort(key=lambda s: -s["total_requests"])
     return summary[:top_n]
@@ -185,6 +304,11 @@ def _esc(s: str) -> str:
     return html.escape(str(s))
 
 
+def _fmt_ms(value: float) -> str:
+    """Milliseconds with microsecond resolution below 10 ms."""
+    return f"{value:.3f}" if abs(value) < 10 else f"{value:.2f}"
+
+
 def _render_summary_table(summary: list[dict], language: str) -> str:
     cols = [
         ("method_col", "method", str),
@@ -192,12 +316,16 @@ def _render_summary_table(summary: list[dict], language: str) -> str:
         ("success_count_col", "success_count", lambda v: f"{v:,}"),
         ("error_count_col", "error_count", lambda v: f"{v:,}"),
         ("error_rate_col", "error_rate", lambda v: f"{v*100:.2f}%"),
-        ("avg_p50_col", "avg_p50_ms", lambda v: f"{v:.2f}"),
-        ("avg_p90_col", "avg_p90_ms", lambda v: f"{v:.2f}"),
-        ("avg_p99_col", "avg_p99_ms", lambda v: f"{v:.2f}"),
-        ("max_p99_col", "max_p99_ms", lambda v: f"{v:.2f}"),
+        ("avg_p50_col", "avg_p50_ms", _fmt_ms),
+        ("avg_p90_col", "avg_p90_ms", _fmt_ms),
+        ("avg_p99_col", "avg_p99_ms", _fmt_ms),
+        ("max_p99_col", "max_p99_ms", _fmt_ms),
         ("cpu_share_col", "peak_cpu_share_pct", lambda v: f"{v:.1f}%"),
     ]
+    if any("corr_p50_ms" in s for s in summary):
+        at = [field for _, field, _ in cols].index("avg_p99_ms") + 1
+        cols[at:at] = [("corr_p50_col", "corr_p50_ms", _fmt_ms),
+                       ("corr_p99_col", "corr_p99_ms", _fmt_ms)]
     head = "".join(
         f'<th style="padding:6px 10px;border:1px solid #ccc;background:#f0f0f0;">'
         f'{_esc(_t(language, key))}</th>'
@@ -206,7 +334,8 @@ def _render_summary_table(summary: list[dict], language: str) -> str:
     body_rows = []
     for s in summary:
         cells = "".join(
-            f'<td style="padding:5px 10px;border:1px solid #ddd;">{_esc(fmt(s[field]))}</td>'
+            f'<td style="padding:5px 10px;border:1px solid #ddd;">'
+            f'{_esc(fmt(s[field]) if field in s else "-")}</td>'
             for _, field, fmt in cols
         )
         body_rows.append(f'<tr>{cells}</tr>')
@@ -224,6 +353,171 @@ def _render_summary_table(summary: list[dict], language: str) -> str:
     )
 
 
+def _render_calibration(calibration: Mapping, language: str) -> str:
+    """Overhead curve table plus one warning per proxy-saturated round."""
+    parts = []
+    for w in calibration.get("saturated_rounds", []):
+        text = _t(language, "saturation_warning").format(
+            threshold=calibration.get("threshold_pct", 80.0), cores=calibration.get("cpu_cores", 1),
+            qps=w["qps"], seconds=w["seconds"], peak=w["peak_cpu_pct"],
+        )
+        parts.append(
+            '<div class="warning" style="margin:8px 0;padding:8px 12px;border-left:4px solid #e67e22;'
+            f'background:#fff4e5;color:#7a4100;">⚠️ {_esc(text)}</div>'
+        )
+    points = calibration.get("points", [])
+    if points:
+        cols = [
+            ("calib_qps_col", lambda p: f"{p.qps:,}"),
+            ("calib_direct_p50_col", lambda p: _fmt_ms(p.direct.p50_ms)),
+            ("calib_proxied_p50_col", lambda p: _fmt_ms(p.proxied.p50_ms)),
+            ("calib_overhead_p50_col", lambda p: _fmt_ms(p.overhead_p50_ms)),
+            ("calib_overhead_p99_col", lambda p: _fmt_ms(p.overhead_p99_ms)),
+            ("calib_cpu_col", lambda p: f"{p.proxy_cpu_peak_pct:.1f}"),
+        ]
+        head = "".join(
+            f'<th style="padding:6px 10px;border:1px solid #ccc;background:#f0f0f0;">'
+            f'{_esc(_t(language, key))}</th>'
+            for key, _ in cols
+        )
+        body = "".join(
+            "<tr>" + "".join(
+                f'<td style="padding:5px 10px;border:1px solid #ddd;">{_esc(fmt(p))}</td>'
+                for _, fmt in cols
+            ) + "</tr>"
+            for p in points
+        )
+        parts.extend([
+            f'<h3 style="color:#333;margin-top:20px;">{_esc(_t(language, "calibration_title"))}</h3>',
+            f'<p style="color:#555;">{_esc(_t(language, "calibration_desc"))}</p>',
+            '<table style="border-collapse:collapse;margin:10px 0;font-size:13px;">'
+            f'<thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>',
+        ])
+    return "\n".join(parts)
+
+
+def _fmt_cost(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value:,.3f}" if abs(value) < 10 else f"{value:,.1f}"
+
+
+def _render_cost(cost: Mapping, language: str) -> str:
+    """Per-1k-call cost table with bounds, the baseline row and fit quality (analysis.method_cost)."""
+    resources = cost.get("resources", [])
+    cols = [(key, r) for key, r in (("cost_cpu_col", "cpu_pct"), ("cost_disk_col", "disk_reads"),
+                                    ("cost_net_col", "net_kb")) if r in resources]
+
+    def cell(text: str) -> str:
+        return f'<td style="padding:5px 10px;border:1px solid #ddd;">{_esc(text)}</td>'
+
+    def estimate(value: float | None, ci) -> str:
+        text = _fmt_cost(value)
+        return f"{text} [{_fmt_cost(ci[0])} – {_fmt_cost(ci[1])}]" if ci else text
+
+    head = "".join(
+        f'<th style="padding:6px 10px;border:1px solid #ccc;background:#f0f0f0;">'
+        f'{_esc(_t(language, key))}</th>'
+        for key in ["method_col", "cost_calls_col"] + [key for key, _ in cols]
+    )
+    rows = [
+        "<tr>" + cell(m["method"]) + cell(f'{m["calls"]:,}') + "".join(
+            cell(estimate(m[r]["per_kcall"], m[r].get("ci"))) for _, r in cols
+        ) + "</tr>"
+        for m in cost.get("methods", [])
+    ]
+    baseline = cost.get("baseline", {})
+    rows.append("<tr>" + cell(_t(language, "cost_baseline_row")) + cell("") + "".join(
+        cell(estimate(baseline[r]["value"], baseline[r].get("ci"))) for _, r in cols) + "</tr>")
+    fit = cost.get("fit", {})
+    rows.append("<tr>" + cell(_t(language, "cost_fit_row")) + cell("") + "".join(
+        cell(f'{fit[r]["r2"]:.2f} ({_fmt_cost(fit[r]["rmse"])})') for _, r in cols) + "</tr>")
+
+    parts = [
+        f'<h3 style="color:#333;margin-top:20px;">{_esc(_t(language, "cost_title"))}</h3>',
+        f'<p style="color:#555;">{_esc(_t(language, "cost_desc").format(samples=cost.get("samples_used", 0)))}</p>',
+    ]
+    if cost.get("collinear"):
+        cond = cost.get("condition_number")
+        text = _t(language, "cost_collinear_warning").format(cond="∞" if cond is None else f"{cond:.0f}")
+        parts.append(
+            '<div class="warning" style="margin:8px 0;padding:8px 12px;border-left:4px solid #e67e22;'
+            f'background:#fff4e5;color:#7a4100;">⚠️ {_esc(text)}</div>'
+        )
+    parts.append(
+        '<table style="border-collapse:collapse;margin:10px 0;font-size:13px;">'
+        f'<thead><tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+    )
+    return "\n".join(parts)
+
+
+def _render_saturation(saturation: Mapping, language: str, top_n: int = 10) -> str:
+    """Knee ranking and the round x method matrix (analysis.method_saturation)."""
+    knees = saturation.get("knees", [])
+    rounds = saturation.get("rounds", [])
+    thresholds = saturation.get("thresholds", {})
+
+    def cell(text: str, shaded: bool = False) -> str:
+        background = "background:#fff4e5;" if shaded else ""
+        return f'<td style="padding:5px 10px;border:1px solid #ddd;{background}">{_esc(text)}</td>'
+
+    def head(keys: Sequence[str]) -> str:
+        return "".join(
+            f'<th style="padding:6px 10px;border:1px solid #ccc;background:#f0f0f0;">{_esc(k)}</th>'
+            for k in keys
+        )
+
+    ranking = []
+    for i, k in enumerate(knees, 1):
+        degraded = k["degraded"]
+        ranking.append("<tr>" + "".join([
+            cell(str(i)),
+            cell(k["method"]),
+            cell(f'{k["degraded_at_qps"]:,}' if degraded else
+                 _t(language, "saturation_not_degraded").format(qps=k["max_tested_qps"]), degraded),
+            cell(f'{k["degraded_at_total_rate"]:,.0f}' if degraded else "-"),
+            cell(k["degraded_on"] or "-"),
+            cell(_fmt_ms(k["baseline_p99_ms"])),
+            cell(_fmt_ms(k["p99_at_knee_ms"]) if degraded else "-"),
+            cell(f'{k["last_good_qps"]:,}' if k["last_good_qps"] is not None else "-"),
+        ]) + "</tr>")
+
+    methods = [k["method"] for k in knees][:top_n]
+    knee_at = {k["method"]: k["degraded_at_qps"] for k in knees if k["degraded"]}
+    by_round: dict[int, dict[str, dict]] = {}
+    for r in rounds:
+        by_round.setdefault(r["qps"], {})[r["method"]] = r
+    matrix = []
+    for qps in sorted(by_round):
+        row = by_round[qps]
+        total = next(iter(row.values()))["total_rate"]
+        cells = [cell(f"{qps:,}"), cell(f"{total:,.0f}")]
+        for m in methods:
+            r = row.get(m)
+            if r is None:
+                cells.append(cell("-"))
+                continue
+            text = f'{r["rate"]:,.0f} · {_fmt_ms(r["p50_ms"])}/{_fmt_ms(r["p99_ms"])} · {r["error_pct"]:.2f}%'
+            cells.append(cell(text, m in knee_at and qps >= knee_at[m]))
+        matrix.append("<tr>" + "".join(cells) + "</tr>")
+
+    desc = _t(language, "saturation_desc").format(
+        factor=thresholds.get("p99_factor", 2.0), errors=thresholds.get("error_pct", 1.0),
+        shortfall=thresholds.get("shortfall_pct", 10.0))
+    table = '<table style="border-collapse:collapse;margin:10px 0;font-size:13px;">'
+    return "\n".join([
+        f'<h3 style="color:#333;margin-top:20px;">{_esc(_t(language, "saturation_title"))}</h3>',
+        f'<p style="color:#555;">{_esc(desc)}</p>',
+        table + "<thead><tr>" + head([_t(language, key) for key in (
+            "saturation_rank_col", "method_col", "saturation_degrades_col", "saturation_total_col",
+            "saturation_trigger_col", "saturation_baseline_col", "saturation_knee_p99_col",
+            "saturation_last_good_col")]) + f'</tr></thead><tbody>{"".join(ranking)}</tbody></table>',
+        f'<p style="color:#555;">{_esc(_t(language, "saturation_cell_hint"))}</p>',
+        table + "<thead><tr>" + head([_t(language, "saturation_round_col"), _t(language, "saturation_total_col")]
+                                     + methods) + f'</tr></thead><tbody>{"".join(matrix)}</tbody></table>',
+    ])
+
+
 def _render_chart_block(title_key: str, desc_key: str, img_path: str, language: str) -> str:
     return (
         f'<div class="subsection" style="margin:20px 0;">'
@@ -241,6 +535,9 @@ def render_per_method_section(
     chart_paths: Mapping[str, str | Path],
     summary: list[dict],
     top_n: int = 10,
+    calibration: Mapping | None = None,
+    cost: Mapping | None = None,
+    saturation: Mapping | None = None,
 ) -> str:
     """Render the complete per-method HTML section.
 
@@ -250,6 +547,11 @@ def render_per_method_section(
         chart_paths: {'qps', 'latency', 'latency_percentiles', 'error_rate', 'resource'} -> chart paths
         summary: output from compute_summary()
         top_n: number of top methods displayed
+        calibration: optional {'points': [OverheadPoint], 'saturated_rounds': [...],
+            'cpu_cores', 'threshold_pct'} from analysis.proxy_overhead
+        cost: optional fitted estimate from analysis.method_cost
+        saturation: optional {'rounds', 'knees', 'thresholds'} from analysis.method_saturation;
+            its chart is chart_paths['saturation']
     """
     title = _t(language, "section_title")
     intro = _t(language, "section_intro").format(top_n=top_n)
@@ -262,6 +564,11 @@ def render_per_method_section(
         f'<p style="color:#555;">{_esc(intro)}</p>',
         f'<h3 style="color:#333;margin-top:20px;">{_esc(summary_title)}</h3>',
         _render_summary_table(summary, language),
+        _render_calibration(calibration, language) if calibration else "",
+        _render_cost(cost, language) if cost else "",
+        _render_saturation(saturation, language, top_n) if saturation and saturation.get("knees") else "",
+        _render_chart_block("chart_saturation_title", "chart_saturation_desc",
+                            str(chart_paths["saturation"]), language) if chart_paths.get("saturation") else "",
         _render_chart_block("chart_qps_title", "chart_qps_desc",
                             str(chart_paths.get("qps", "")), language),
         _render_chart_block("chart_latency_title", "chart_latency_desc",
@@ -288,4 +595,5 @@ def get_chart_titles_for_language(language: str) -> dict[str, str]:
         "error_rate": _t(language, "chart_error_title"),
         "success_failure": _t(language, "chart_success_failure_title"),
         "resource": _t(language, "chart_resource_title"),
+        "saturation": _t(language, "chart_saturation_title"),
     }
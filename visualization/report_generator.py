@@ -31,6 +31,7 @@ from visualization.device_manager import DeviceManager
 from visualization.performance_visualizer import format_time_axis
 from utils.ena_field_accessor import ENAFieldAccessor
 from utils.csv_schema_registry import CSVSchemaRegistry
+from utils.resume_gaps import load_resumes
 
 # Report text is stored outside Python code so report layout and copy can evolve independently.
 def _load_report_translations() -> Dict[str, Dict[str, str]]:
@@ -251,13 +252,15 @@ class ReportGenerator:
         try:
             from analysis.per_method_attribution import (
                 filter_proxy_records_by_methods,
-                read_proxy_csv,
+                read_proxy_sink,
+                request_count,
             )
-            records = list(read_proxy_csv(proxy_csv))
+            records = list(read_proxy_sink(proxy_csv))
             allowed_methods = self._load_configured_workload_methods()
             workload_records = filter_proxy_records_by_methods(records, allowed_methods)
-            excluded = max(len(records) - len(workload_records), 0) if allowed_methods else 0
-            return len(records), len(workload_records), excluded
+            total, workload = request_count(records), request_count(workload_records)
+            excluded = max(total - workload, 0) if allowed_methods else 0
+            return total, workload, excluded
         except Exception:
             return 0, 0, 0
 
@@ -2209,6 +2212,919 @@ class ReportGenerator:
         </div>
         """
 
+    def _generate_process_accounting_section(self, df):
+        """Node vs monitoring share of device I/O and node run-queue delay per QPS level"""
+        if 'proc_node_read_bytes_s' not in df.columns:
+            return ""
+        try:
+            samples = df
+            if 'proc_meta_source' in df.columns:
+                samples = df[df['proc_meta_source'] == 'ok']
+            if samples.empty:
+                return ""
+
+            def device_bytes(suffix):
+                cols = [col for col in samples.columns
+                        if (col.startswith('data_') or col.startswith('accounts_')) and col.endswith(suffix)]
+                if not cols:
+                    return pd.Series(0.0, index=samples.index)
+                return samples[cols].apply(pd.to_numeric, errors='coerce').fillna(0).sum(axis=1) * 1024
+
+            def numeric(col):
+                return pd.to_numeric(samples.get(col, 0), errors='coerce').fillna(0)
+
+            frame = pd.DataFrame({
+                'device_read': device_bytes('_rkb_s'),
+                'device_write': device_bytes('_wkb_s'),
+                'node_read': numeric('proc_node_read_bytes_s'),
+                'node_write': numeric('proc_node_write_bytes_s'),
+                'monitor_io': numeric('proc_monitor_read_bytes_s') + numeric('proc_monitor_write_bytes_s'),
+                'runq_wait': numeric('proc_node_runq_wait_ms_s'),
+                'runq_delay': numeric('proc_node_runq_delay_us'),
+            }, index=samples.index)
+
+            qps = pd.to_numeric(samples['current_qps'], errors='coerce') if 'current_qps' in samples.columns else None
+            if qps is not None and (qps > 0).any():
+                groups = [(f"{level:,.0f}", frame[qps == level]) for level in sorted(qps[qps > 0].unique())]
+            else:
+                groups = [(self.t['process_all_samples'], frame)]
+
+            def share(numerator, denominator):
+                total = denominator.sum()
+                return f"{numerator.sum() / total * 100:.1f}%" if total > 0 else "N/A"
+
+            table_rows = ""
+            for label, group in groups:
+                table_rows += f"""
+                <tr>
+                    <td>{label}</td>
+                    <td>{len(group)}</td>
+                    <td>{share(group['node_read'], group['device_read'])}</td>
+                    <td>{share(group['node_write'], group['device_write'])}</td>
+                    <td>{share(group['monitor_io'], group['device_read'] + group['device_write'])}</td>
+                    <td>{group['runq_wait'].mean():.1f} / {group['runq_wait'].quantile(0.95):.1f}</td>
+                    <td>{group['runq_delay'].mean():.1f}</td>
+                </tr>
+                """
+
+            return f"""
+            <div class="section">
+                <h2>&#9881; {self.t['process_accounting_title']}</h2>
+                <p>{self.t['process_accounting_desc']}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['process_qps_level']}</th>
+                            <th>{self.t['process_sample_count']}</th>
+                            <th>{self.t['process_node_read_share']}</th>
+                            <th>{self.t['process_node_write_share']}</th>
+                            <th>{self.t['process_monitor_io_share']}</th>
+                            <th>{self.t['process_node_runq_wait']}</th>
+                            <th>{self.t['process_node_runq_delay']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['process_accounting_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Process accounting section generation failed: {e}")
+            return ""
+
+    def _generate_cpu_isolation_section(self):
+        """Busy cores per role against its reserved cpuset (CPU_ISOLATION_ENABLED runs)"""
+        layout_path = next((path for path in self._runtime_file_candidates(
+            'CPU_LAYOUT_JSON', os.path.join(self.logs_dir, 'cpu_layout.json'),
+        ) if os.path.exists(path)), None)
+        if not layout_path:
+            return ""
+        try:
+            with open(layout_path, 'r', encoding='utf-8') as f:
+                layout = json.load(f)
+
+            role_csv = next((path for path in self._runtime_file_candidates(
+                'CPU_ROLE_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'cpu_role_*.csv')), reverse=True),
+            ) if os.path.exists(path)), None)
+            usage = pd.read_csv(role_csv) if role_csv else pd.DataFrame()
+
+            table_rows = ""
+            for role, spec in layout.get('roles', {}).items():
+                reserved = int(spec.get('cpus') or 0)
+                samples = usage[usage['role'] == role] if not usage.empty else usage
+                if reserved and not samples.empty:
+                    busy = pd.to_numeric(samples['busy_cpus'], errors='coerce').fillna(0)
+                    util = pd.to_numeric(samples['util_pct'], errors='coerce').fillna(0)
+                    saturated = util.quantile(0.95) >= 90
+                    status = self.t['cpu_role_saturated'] if saturated else self.t['cpu_role_ok']
+                    cells = (f"<td>{busy.mean():.2f}</td><td>{busy.max():.2f}</td>"
+                             f"<td>{util.max():.1f}%</td><td>{status}</td>")
+                else:
+                    cells = "<td>N/A</td><td>N/A</td><td>N/A</td><td>N/A</td>"
+                table_rows += f"""
+                <tr>
+                    <td>{html.escape(role)}</td>
+                    <td>{html.escape(spec.get('cpuset') or '-')}</td>
+                    <td>{reserved or '-'}</td>
+                    {cells}
+                </tr>
+                """
+
+            notes = "".join(
+                f"<li>{html.escape(msg)}</li>" for msg in layout.get('errors', []) + layout.get('warnings', [])
+            )
+            notes_html = f"<p><strong>{self.t['cpu_layout_warnings']}</strong></p><ul>{notes}</ul>" if notes else ""
+
+            return f"""
+            <div class="section">
+                <h2>&#129513; {self.t['cpu_isolation_title']}</h2>
+                <p>{self.t['cpu_isolation_desc']} ({html.escape(layout.get('method', 'taskset'))},
+                   {self.t['cpu_online_cpus']}: {html.escape(layout.get('online_cpus', ''))})</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['cpu_role']}</th>
+                            <th>{self.t['cpu_role_cpuset']}</th>
+                            <th>{self.t['cpu_role_reserved']}</th>
+                            <th>{self.t['cpu_role_busy_mean']}</th>
+                            <th>{self.t['cpu_role_busy_peak']}</th>
+                            <th>{self.t['cpu_role_util_peak']}</th>
+                            <th>{self.t['cpu_role_status']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                {notes_html}
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['cpu_isolation_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: CPU isolation section generation failed: {e}")
+            return ""
+
+    def _generate_round_phases_section(self):
+        """Warmup and cooldown length per QPS round (ROUND_PHASES_CSV)"""
+        phases_csv = next((path for path in self._runtime_file_candidates(
+            'ROUND_PHASES_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'round_phases_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not phases_csv:
+            return ""
+        try:
+            phases = pd.read_csv(phases_csv)
+            if phases.empty:
+                return ""
+            table_rows = ""
+            for _, row in phases.iterrows():
+                warmup_result = str(row.get('warmup_result', ''))
+                label = self.t.get(f"round_warmup_{warmup_result}", warmup_result)
+                warn = ' class="warning"' if warmup_result in ('cap', 'no_data', 'failed') else ''
+                measured = int(row['measure_end']) - int(row['measure_start'])
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{int(row['qps'])}</td>
+                    <td>{float(row['warmup_s']):.0f}</td>
+                    <td>{html.escape(label)}</td>
+                    <td>{measured}</td>
+                    <td>{float(row['cooldown_s']):.0f}</td>
+                    <td>{html.escape(self.t.get(f"round_cooldown_{row.get('cooldown_result', '')}", str(row.get('cooldown_result', ''))))}</td>
+                </tr>
+                """
+            return f"""
+            <div class="section">
+                <h2>&#9201; {self.t['round_phases_title']}</h2>
+                <p>{self.t['round_phases_desc']}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>QPS</th>
+                            <th>{self.t['round_warmup_s']}</th>
+                            <th>{self.t['round_warmup_result']}</th>
+                            <th>{self.t['round_measured_s']}</th>
+                            <th>{self.t['round_cooldown_s']}</th>
+                            <th>{self.t['round_cooldown_result']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['round_phases_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Round phases section generation failed: {e}")
+            return ""
+
+    def _generate_slo_capacity_section(self):
+        """Max QPS meeting the SLO per method (SLO_CAPACITY_JSON, --slo-search runs)"""
+        capacity_json = next((path for path in self._runtime_file_candidates(
+            'SLO_CAPACITY_JSON', *sorted(glob.glob(os.path.join(self.logs_dir, 'slo_capacity_*.json')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not capacity_json:
+            return ""
+        try:
+            with open(capacity_json) as f:
+                capacity = json.load(f)
+            methods = capacity.get('methods') or {}
+            if not methods:
+                return ""
+
+            def fmt(value, digits=1):
+                return 'N/A' if value is None else f"{float(value):.{digits}f}"
+
+            def slo_text(slo):
+                parts = [f"{label} &le; {fmt(slo.get(key), digits)}{unit}"
+                         for key, label, unit, digits in (('p50_ms', 'p50', ' ms', 0), ('p99_ms', 'p99', ' ms', 0),
+                                                          ('error_pct', 'err', '%', 1))
+                         if slo.get(key)]
+                return ', '.join(parts) or 'N/A'
+
+            table_rows = ""
+            for method, m in sorted(methods.items(), key=lambda item: item[1].get('max_qps', 0)):
+                warn = ' class="warning"' if not m.get('max_qps') else ''
+                max_qps = f"{'' if m.get('bounded') else '&ge; '}{int(m.get('max_qps') or 0)}"
+                first_fail = m.get('first_failing_qps')
+                failed = 'N/A' if first_fail is None else f"{int(first_fail)} ({html.escape(m.get('failed_on') or '-')})"
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{html.escape(method)}</td>
+                    <td>{slo_text(m.get('slo') or {})}</td>
+                    <td>{max_qps}</td>
+                    <td>{fmt(m.get('max_rate'))}</td>
+                    <td>{fmt(m.get('p50_ms'))} / {fmt(m.get('p99_ms'))}</td>
+                    <td>{fmt(m.get('error_pct'), 2)}</td>
+                    <td>{failed}</td>
+                </tr>
+                """
+            desc = self.t['slo_capacity_desc'].format(
+                qps=int(capacity.get('max_qps') or 0), method=html.escape(str(capacity.get('binding_method') or 'N/A')))
+            return f"""
+            <div class="section">
+                <h2>&#127919; {self.t['slo_capacity_title']}</h2>
+                <p>{desc}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['slo_capacity_method']}</th>
+                            <th>{self.t['slo_capacity_slo']}</th>
+                            <th>{self.t['slo_capacity_max_qps']}</th>
+                            <th>{self.t['slo_capacity_rate']}</th>
+                            <th>{self.t['slo_capacity_latency_ms']}</th>
+                            <th>{self.t['slo_capacity_errors']}</th>
+                            <th>{self.t['slo_capacity_first_fail']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['slo_capacity_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: SLO capacity section generation failed: {e}")
+            return ""
+
+    def _generate_usl_model_section(self):
+        """Universal Scalability Law coefficients and predicted peak (USL_MODEL_JSON)"""
+        model_json = next((path for path in self._runtime_file_candidates(
+            'USL_MODEL_JSON', *sorted(glob.glob(os.path.join(self.logs_dir, 'usl_model_*.json')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not model_json:
+            return ""
+        try:
+            with open(model_json) as f:
+                model = json.load(f)
+            if not model.get('fitted'):
+                return ""
+
+            def fmt(value, digits=1):
+                return 'N/A' if value is None else f"{float(value):.{digits}f}"
+
+            def interval(values, digits):
+                if not values or values[0] is None:
+                    return 'N/A'
+                return f"{fmt(values[0], digits)} &ndash; {'&infin;' if values[1] is None else fmt(values[1], digits)}"
+
+            params = [
+                (self.t['usl_lambda'], fmt(model['lambda'], 2), interval(model.get('lambda_ci'), 2)),
+                (self.t['usl_sigma'], fmt(model['sigma'], 4), interval(model.get('sigma_ci'), 4)),
+                (self.t['usl_kappa'], f"{model['kappa']:.2e}",
+                 'N/A' if not model.get('kappa_ci') else f"{model['kappa_ci'][0]:.2e} &ndash; {model['kappa_ci'][1]:.2e}"),
+                (self.t['usl_peak_concurrency'], fmt(model.get('peak_concurrency')), 'N/A'),
+                (self.t['usl_peak_throughput'], fmt(model.get('peak_throughput'), 0),
+                 interval(model.get('peak_throughput_ci'), 0)),
+            ]
+            param_rows = "".join(f"""
+                <tr>
+                    <td>{name}</td>
+                    <td>{value}</td>
+                    <td>{ci}</td>
+                </tr>
+                """ for name, value, ci in params)
+            round_rows = ""
+            for r in model.get('rounds', []):
+                predicted = r.get('predicted_throughput')
+                off = predicted and abs(r['throughput'] - predicted) > 0.1 * predicted
+                warn = ' class="warning"' if off else ''
+                round_rows += f"""
+                <tr{warn}>
+                    <td>{html.escape(str(r['label']))}</td>
+                    <td>{fmt(r['concurrency'], 2)}</td>
+                    <td>{fmt(r['mean_latency_ms'], 2)}</td>
+                    <td>{fmt(r['throughput'])}</td>
+                    <td>{fmt(predicted)}</td>
+                </tr>
+                """
+            desc = self.t['usl_desc'].format(rounds=model.get('rounds_used', 0), r2=fmt(model.get('r2'), 3))
+            if model.get('knee_bracketed'):
+                desc += ' ' + self.t['usl_bracketed']
+            return f"""
+            <div class="section">
+                <h2>&#128208; {self.t['usl_title']}</h2>
+                <p>{desc}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['usl_parameter']}</th>
+                            <th>{self.t['usl_estimate']}</th>
+                            <th>{self.t['usl_ci']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {param_rows}
+                    </tbody>
+                </table>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['usl_round']}</th>
+                            <th>{self.t['usl_concurrency']}</th>
+                            <th>{self.t['usl_mean_latency_ms']}</th>
+                            <th>{self.t['usl_measured']}</th>
+                            <th>{self.t['usl_predicted']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {round_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['usl_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: USL model section generation failed: {e}")
+            return ""
+
+    def _generate_sweep_section(self):
+        """Best sustainable QPS per sweep configuration (SWEEP_RESULTS_CSV, --sweep runs)"""
+        results_csv = next((path for path in self._runtime_file_candidates(
+            'SWEEP_RESULTS_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'sweep_results_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not results_csv:
+            return ""
+        try:
+            from analysis.sweep_matrix import best_sustainable
+            cells = pd.read_csv(results_csv)
+            if cells.empty:
+                return ""
+            cells['passed'] = cells['passed'].astype(str).str.lower() == 'true'
+            cells['keepalive'] = cells['keepalive'].astype(str).str.lower() == 'true'
+            cells['p99_ms'] = pd.to_numeric(cells['p99_ms'], errors='coerce')
+            rows = [{k: (None if isinstance(v, float) and np.isnan(v) else v) for k, v in r.items()}
+                    for r in cells.to_dict('records')]
+            table_rows = ""
+            for config in best_sustainable(rows):
+                best_level = next((lv for lv in config.levels if lv['qps'] == config.best_sustainable_qps), None)
+                p99 = best_level['p99_ms'] if best_level and best_level['p99_ms'] is not None else None
+                warn = ' class="warning"' if config.best_sustainable_qps == 0 else ''
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{html.escape(str(config.mix))}</td>
+                    <td>{int(config.max_connections)}</td>
+                    <td>{self.t['sweep_keepalive_on'] if config.keepalive else self.t['sweep_keepalive_off']}</td>
+                    <td>{config.best_sustainable_qps}</td>
+                    <td>{f"{p99:.1f}" if p99 is not None else 'N/A'}</td>
+                    <td>{config.first_failing_qps if config.first_failing_qps else '-'}</td>
+                </tr>
+                """
+            return f"""
+            <div class="section">
+                <h2>&#129518; {self.t['sweep_title']}</h2>
+                <p>{self.t['sweep_desc'].format(cells=len(cells))}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['sweep_mix']}</th>
+                            <th>{self.t['sweep_max_connections']}</th>
+                            <th>{self.t['sweep_keepalive']}</th>
+                            <th>{self.t['sweep_best_qps']}</th>
+                            <th>{self.t['sweep_p99_at_best']}</th>
+                            <th>{self.t['sweep_first_failing_qps']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['sweep_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Sweep section generation failed: {e}")
+            return ""
+
+    def _generate_ws_subscriptions_section(self):
+        """Per-level, per-method WebSocket subscription results (WS_SUBSCRIPTIONS_CSV, --ws-subscribe runs)"""
+        results_csv = next((path for path in self._runtime_file_candidates(
+            'WS_SUBSCRIPTIONS_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'ws_subscriptions_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not results_csv:
+            return ""
+        try:
+            rows = pd.read_csv(results_csv)
+            if rows.empty:
+                return ""
+
+            def fmt(value, digits=1):
+                return 'N/A' if pd.isna(value) else f"{float(value):.{digits}f}"
+
+            table_rows = ""
+            for _, r in rows.sort_values(['subscriptions', 'method']).iterrows():
+                warn = ' class="warning"' if int(r['errors']) > 0 or int(r['active']) < int(r['requested']) else ''
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{int(r['subscriptions'])}</td>
+                    <td>{html.escape(str(r['method']))}</td>
+                    <td>{int(r['active'])}/{int(r['requested'])}</td>
+                    <td>{fmt(r['subscribe_p50_ms'])} / {fmt(r['subscribe_p99_ms'])}</td>
+                    <td>{fmt(r['notifications_per_s'])}</td>
+                    <td>{fmt(r['delay_p50_ms'], 0)} / {fmt(r['delay_p99_ms'], 0)}</td>
+                    <td>{fmt(r['fanout_p50_ms'])} / {fmt(r['fanout_p99_ms'])}</td>
+                </tr>
+                """
+            return f"""
+            <div class="section">
+                <h2>&#128268; {self.t['ws_subscriptions_title']}</h2>
+                <p>{self.t['ws_subscriptions_desc'].format(levels=rows['subscriptions'].nunique())}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['ws_subscriptions_level']}</th>
+                            <th>{self.t['ws_subscriptions_method']}</th>
+                            <th>{self.t['ws_subscriptions_active']}</th>
+                            <th>{self.t['ws_subscriptions_subscribe_ms']}</th>
+                            <th>{self.t['ws_subscriptions_notifications']}</th>
+                            <th>{self.t['ws_subscriptions_delay_ms']}</th>
+                            <th>{self.t['ws_subscriptions_fanout_ms']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['ws_subscriptions_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: WebSocket subscription section generation failed: {e}")
+            return ""
+
+    def _generate_batch_sweep_section(self):
+        """Per-batch-size rounds at a fixed call rate (BATCH_SWEEP_CSV, --batch-sweep runs)"""
+        results_csv = next((path for path in self._runtime_file_candidates(
+            'BATCH_SWEEP_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'batch_sweep_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not results_csv:
+            return ""
+        try:
+            rows = pd.read_csv(results_csv)
+            if rows.empty:
+                return ""
+
+            def fmt(value, digits=1):
+                return 'N/A' if pd.isna(value) else f"{float(value):.{digits}f}"
+
+            table_rows = ""
+            for _, r in rows.sort_values('batch_size').iterrows():
+                short = (pd.isna(r['success_pct']) or float(r['success_pct']) < 100
+                         or float(r['achieved_calls_per_s']) < 0.95 * float(r['calls_per_second']))
+                warn = ' class="warning"' if short else ''
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{int(r['batch_size'])}</td>
+                    <td>{fmt(r['http_rate'])}</td>
+                    <td>{fmt(r['achieved_calls_per_s'], 0)}/{fmt(r['calls_per_second'], 0)}</td>
+                    <td>{fmt(r['success_pct'], 2)}</td>
+                    <td>{fmt(r['p50_ms'])} / {fmt(r['p99_ms'])}</td>
+                    <td>{fmt(r['per_call_p50_ms'], 3)}</td>
+                    <td>{fmt(r['cpu_pct'])}</td>
+                    <td>{fmt(r['mem_mb'], 0)}</td>
+                    <td>{fmt(r['cpu_pct_per_kcalls'], 2)}</td>
+                </tr>
+                """
+            return f"""
+            <div class="section">
+                <h2>&#128230; {self.t['batch_sweep_title']}</h2>
+                <p>{self.t['batch_sweep_desc'].format(sizes=rows['batch_size'].nunique(), calls=fmt(rows['calls_per_second'].iloc[0], 0))}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['batch_sweep_size']}</th>
+                            <th>{self.t['batch_sweep_http_rate']}</th>
+                            <th>{self.t['batch_sweep_calls']}</th>
+                            <th>{self.t['batch_sweep_success']}</th>
+                            <th>{self.t['batch_sweep_latency_ms']}</th>
+                            <th>{self.t['batch_sweep_per_call_ms']}</th>
+                            <th>{self.t['batch_sweep_cpu']}</th>
+                            <th>{self.t['batch_sweep_mem']}</th>
+                            <th>{self.t['batch_sweep_cpu_per_kcalls']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['batch_sweep_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Batch sweep section generation failed: {e}")
+            return ""
+
+    def _generate_method_profile_section(self):
+        """Isolated per-method capacity and the predicted mix capacity (METHOD_PROFILE_JSON, --method-profile runs)"""
+        profile_json = next((path for path in self._runtime_file_candidates(
+            'METHOD_PROFILE_JSON', *sorted(glob.glob(os.path.join(self.logs_dir, 'method_profile_*.json')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not profile_json:
+            return ""
+        try:
+            with open(profile_json) as f:
+                profile = json.load(f)
+            methods = profile.get('methods') or {}
+            if not methods:
+                return ""
+            prediction = profile.get('prediction') or {}
+            validation = profile.get('validation')
+            weights = prediction.get('weights') or {}
+            shares = prediction.get('shares') or {}
+
+            def fmt(value, digits=0):
+                return 'N/A' if value is None else f"{float(value):,.{digits}f}"
+
+            def first_failing(entry):
+                if entry.get('first_failing_qps') is None:
+                    return 'N/A'
+                return f"{fmt(entry['first_failing_qps'])} ({entry.get('failed_on') or '-'})"
+
+            table_rows = ""
+            for method, entry in methods.items():
+                binding = method == prediction.get('binding_method')
+                table_rows += f"""
+                <tr{' class="warning"' if binding else ''}>
+                    <td>{method}</td>
+                    <td>{fmt(weights.get(method, 0) * 100, 1)}%</td>
+                    <td>{fmt(entry.get('max_qps'))}</td>
+                    <td>{first_failing(entry)}</td>
+                    <td>{fmt(entry.get('p99_ms'), 1)}</td>
+                    <td>{fmt(entry.get('cpu_pct_per_kcps'), 2)}</td>
+                    <td>{fmt(shares[method] * 100, 1) + '%' if method in shares else 'N/A'}</td>
+                </tr>
+                """
+            mix = profile.get('mix')
+            if mix:
+                table_rows += f"""
+                <tr>
+                    <td><strong>{self.t['method_profile_mix']}</strong></td>
+                    <td>100.0%</td>
+                    <td>{fmt(mix.get('max_qps'))}</td>
+                    <td>{first_failing(mix)}</td>
+                    <td>{fmt(mix.get('p99_ms'), 1)}</td>
+                    <td>{fmt(mix.get('cpu_pct_per_kcps'), 2)}</td>
+                    <td>-</td>
+                </tr>
+                """
+
+            if prediction.get('predicted_qps') is None:
+                summary = self.t['method_profile_missing'].format(methods=', '.join(prediction.get('missing') or []))
+            else:
+                low, high = prediction['predicted_qps_range']
+                summary = self.t['method_profile_prediction'].format(
+                    low=fmt(low), high=fmt(high), binding=prediction['binding_method'])
+                cpu = prediction.get('cpu')
+                if cpu:
+                    summary += ' ' + self.t['method_profile_prediction_cpu'].format(cpu=fmt(cpu['at_capacity_pct'], 1))
+            validation_html = ""
+            if validation:
+                text = self.t['method_profile_validation'].format(
+                    measured=fmt(validation['measured_qps']),
+                    failing=fmt(validation['measured_first_failing_qps']),
+                    error=fmt(validation['error_pct'], 1))
+                if validation['consistent']:
+                    validation_html = f"<p>&#9989; {text}</p>"
+                else:
+                    validation_html = f'<p class="warning">&#9888;&#65039; {text} {self.t["method_profile_inconsistent"]}</p>'
+
+            what_if_rows = ""
+            for scenario in profile.get('what_if') or []:
+                change = scenario.get('change_pct')
+                what_if_rows += f"""
+                <tr>
+                    <td>{scenario['scenario']}</td>
+                    <td>{fmt(scenario.get('predicted_qps'))}</td>
+                    <td>{'N/A' if change is None else f"{change:+.1f}%"}</td>
+                    <td>{scenario.get('binding_method') or '-'}</td>
+                </tr>
+                """
+            what_if_table = f"""
+                <h3>{self.t['method_profile_what_if']}</h3>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['method_profile_scenario']}</th>
+                            <th>{self.t['method_profile_predicted']}</th>
+                            <th>{self.t['method_profile_change']}</th>
+                            <th>{self.t['method_profile_binding']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {what_if_rows}
+                    </tbody>
+                </table>
+            """ if what_if_rows else ""
+
+            return f"""
+            <div class="section">
+                <h2>&#129516; {self.t['method_profile_title']}</h2>
+                <p>{summary}</p>
+                {validation_html}
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['method_profile_method']}</th>
+                            <th>{self.t['method_profile_weight']}</th>
+                            <th>{self.t['method_profile_capacity']}</th>
+                            <th>{self.t['method_profile_first_failing']}</th>
+                            <th>{self.t['method_profile_p99']}</th>
+                            <th>{self.t['method_profile_cpu']}</th>
+                            <th>{self.t['method_profile_share']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                {what_if_table}
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['method_profile_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Method profile section generation failed: {e}")
+            return ""
+
+    def _generate_endpoint_compare_section(self):
+        """Side-by-side capacity, latency and resource cost per endpoint (COMPARE_SUMMARY_JSON, --compare runs)"""
+        summary_json = next((path for path in self._runtime_file_candidates(
+            'COMPARE_SUMMARY_JSON', *sorted(glob.glob(os.path.join(self.logs_dir, 'compare_summary_*.json')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not summary_json:
+            return ""
+        try:
+            with open(summary_json) as f:
+                summary = json.load(f)
+            endpoints = summary.get('endpoints') or {}
+            if not endpoints:
+                return ""
+            best = summary.get('best') or {}
+
+            def fmt(value, digits=0):
+                return 'N/A' if value is None else f"{float(value):,.{digits}f}"
+
+            def change(value):
+                return '' if value is None else f" ({value:+.1f}%)"
+
+            table_rows = ""
+            for name, entry in endpoints.items():
+                here = entry.get('at_comparison') or {}
+                vs = entry.get('vs_baseline') or {}
+                baseline = name == summary.get('baseline')
+                first_failing = 'N/A' if entry.get('first_failing_qps') is None else \
+                    f"{fmt(entry['first_failing_qps'])} ({entry.get('failed_on') or '-'})"
+                table_rows += f"""
+                <tr{' class="warning"' if name == best.get('capacity') else ''}>
+                    <td>{name}{' (' + self.t['compare_baseline'] + ')' if baseline else ''}</td>
+                    <td>{fmt(entry.get('max_qps'))}{'' if baseline else change(vs.get('max_qps_pct'))}</td>
+                    <td>{first_failing}</td>
+                    <td>{fmt(here.get('p50_ms'), 1)}</td>
+                    <td>{fmt(here.get('p99_ms'), 1)}{'' if baseline else change(vs.get('p99_pct'))}</td>
+                    <td>{fmt(here.get('error_pct'), 2)}</td>
+                    <td>{fmt(here.get('cpu_pct_per_kqps'), 1)}{'' if baseline else change(vs.get('cpu_pct_per_kqps_pct'))}</td>
+                    <td>{fmt(here.get('rss_mb'))}</td>
+                    <td>{fmt(here.get('read_iops_per_kqps'), 1)} / {fmt(here.get('write_iops_per_kqps'), 1)}</td>
+                </tr>
+                """
+
+            methods = sorted({m for entry in endpoints.values() for m in entry.get('methods_p99_ms') or {}})
+            methods_table = ""
+            if methods:
+                header = ''.join(f"<th>{name}</th>" for name in endpoints)
+                method_rows = ""
+                for method in methods:
+                    cells = ''.join(f"<td>{fmt((entry.get('methods_p99_ms') or {}).get(method), 1)}</td>"
+                                    for entry in endpoints.values())
+                    method_rows += f"""
+                    <tr>
+                        <td>{method}</td>
+                        {cells}
+                    </tr>
+                    """
+                methods_table = f"""
+                <h3>{self.t['compare_methods_title'].format(qps=fmt(summary.get('comparison_qps')))}</h3>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['compare_method']}</th>
+                            {header}
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {method_rows}
+                    </tbody>
+                </table>
+                """
+
+            intro = self.t['compare_summary'].format(
+                endpoints=', '.join(endpoints), mode=summary.get('mode') or '-',
+                qps=fmt(summary.get('comparison_qps')))
+            return f"""
+            <div class="section">
+                <h2>&#9878;&#65039; {self.t['compare_title']}</h2>
+                <p>{intro}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['compare_endpoint']}</th>
+                            <th>{self.t['compare_capacity']}</th>
+                            <th>{self.t['compare_first_failing']}</th>
+                            <th>{self.t['compare_p50']}</th>
+                            <th>{self.t['compare_p99']}</th>
+                            <th>{self.t['compare_errors']}</th>
+                            <th>{self.t['compare_cpu']}</th>
+                            <th>{self.t['compare_rss']}</th>
+                            <th>{self.t['compare_iops']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                {methods_table}
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['compare_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Endpoint comparison section generation failed: {e}")
+            return ""
+
+    def _generate_replay_section(self):
+        """Recorded-traffic replay per method (REPLAY_RESULTS_CSV, --replay runs)"""
+        results_csv = next((path for path in self._runtime_file_candidates(
+            'REPLAY_RESULTS_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'replay_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not results_csv:
+            return ""
+        try:
+            rows = pd.read_csv(results_csv)
+            if rows.empty:
+                return ""
+            summary = {}
+            summary_json = os.path.splitext(results_csv)[0] + '_summary.json'
+            if os.path.exists(summary_json):
+                with open(summary_json) as f:
+                    summary = json.load(f)
+
+            def fmt(value, digits=1):
+                return 'N/A' if value is None or pd.isna(value) else f"{float(value):.{digits}f}"
+
+            table_rows = ""
+            for _, r in rows.sort_values('planned_calls', ascending=False).iterrows():
+                short = (int(r['sent_calls']) < int(r['planned_calls'])
+                         or (not pd.isna(r['success_pct']) and float(r['success_pct']) < 100))
+                warn = ' class="warning"' if short else ''
+                table_rows += f"""
+                <tr{warn}>
+                    <td>{html.escape(str(r['method']))}</td>
+                    <td>{fmt(r['planned_share'], 2)}</td>
+                    <td>{int(r['sent_calls'])}/{int(r['planned_calls'])}</td>
+                    <td>{fmt(r['success_pct'], 2)}</td>
+                    <td>{fmt(r['p50_ms'])} / {fmt(r['p99_ms'])}</td>
+                </tr>
+                """
+            desc = self.t['replay_desc'].format(
+                requests=summary.get('sent_requests', 'N/A'), speed=fmt(summary.get('speed'), 2),
+                engine=summary.get('engine', 'N/A'), peak=fmt(summary.get('peak_rate'), 0),
+                planned_peak=fmt(summary.get('planned_peak_rate'), 0), lag=fmt(summary.get('lag_p99_ms')),
+                cv=fmt(summary.get('interarrival_cv'), 2), planned_cv=fmt(summary.get('planned_interarrival_cv'), 2))
+            return f"""
+            <div class="section">
+                <h2>&#9199; {self.t['replay_title']}</h2>
+                <p>{desc}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['replay_method']}</th>
+                            <th>{self.t['replay_share']}</th>
+                            <th>{self.t['replay_calls']}</th>
+                            <th>{self.t['replay_success']}</th>
+                            <th>{self.t['replay_latency_ms']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['replay_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Replay section generation failed: {e}")
+            return ""
+
+    def _generate_resume_gaps_section(self):
+        """Interruptions of a session continued with --resume (RUN_CHECKPOINT_JSON)"""
+        try:
+            resumes = load_resumes(self.logs_dir)
+            if not resumes:
+                return ""
+            table_rows = ""
+            for entry in resumes:
+                start = int(entry.get('interrupted_after') or 0)
+                end = int(entry.get('resumed_at') or 0)
+                dropped = entry.get('dropped_rows') or {}
+                dropped_text = ", ".join(f"{html.escape(name)}: {count}" for name, count in sorted(dropped.items())) or "-"
+                table_rows += f"""
+                <tr>
+                    <td>{datetime.fromtimestamp(start).strftime('%Y-%m-%d %H:%M:%S') if start else 'N/A'}</td>
+                    <td>{datetime.fromtimestamp(end).strftime('%Y-%m-%d %H:%M:%S')}</td>
+                    <td>{max(end - start, 0) if start else 'N/A'}</td>
+                    <td>{int(entry.get('rounds_completed') or 0)}</td>
+                    <td>{dropped_text}</td>
+                </tr>
+                """
+            return f"""
+            <div class="section">
+                <h2>&#9851; {self.t['resume_gaps_title']}</h2>
+                <p>{self.t['resume_gaps_desc']}</p>
+                <table class="performance-table">
+                    <thead>
+                        <tr>
+                            <th>{self.t['resume_interrupted_after']}</th>
+                            <th>{self.t['resume_resumed_at']}</th>
+                            <th>{self.t['resume_gap_s']}</th>
+                            <th>{self.t['resume_rounds_kept']}</th>
+                            <th>{self.t['resume_dropped_rows']}</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {table_rows}
+                    </tbody>
+                </table>
+                <p class="table-note">
+                    <strong>{self.t['note_label']}</strong>: {self.t['resume_gaps_note']}
+                </p>
+            </div>
+            """
+        except Exception as e:
+            print(f"Warning: Resume gaps section generation failed: {e}")
+            return ""
+
     def _generate_ena_warnings_section(self, df):
         """Generate ENA network warning section - using ENAFieldAccessor"""
         try:
@@ -3009,6 +3925,18 @@ class ReportGenerator:
 
             correlation_table = self._generate_cpu_disk_correlation_table(df)
             overhead_table = self._generate_overhead_data_table()
+            process_accounting_section = self._generate_process_accounting_section(df)
+            cpu_isolation_section = self._generate_cpu_isolation_section()
+            round_phases_section = self._generate_round_phases_section()
+            slo_capacity_section = self._generate_slo_capacity_section()
+            usl_model_section = self._generate_usl_model_section()
+            sweep_section = self._generate_sweep_section()
+            ws_subscriptions_section = self._generate_ws_subscriptions_section()
+            batch_sweep_section = self._generate_batch_sweep_section()
+            method_profile_section = self._generate_method_profile_section()
+            endpoint_compare_section = self._generate_endpoint_compare_section()
+            replay_section = self._generate_replay_section()
+            resume_gaps_section = self._generate_resume_gaps_section()
 
             # Generate performance summary
             performance_summary = self._generate_performance_summary(df)
@@ -3039,6 +3967,16 @@ class ReportGenerator:
                 ('data-quality', self.t['data_quality_summary'], data_quality_summary),
                 ('system-bottleneck', self.t['system_bottleneck_analysis'], bottleneck_section),
                 ('performance-summary', self.t['performance_summary'], performance_summary),
+                ('slo-capacity', self.t['slo_capacity_title'], slo_capacity_section),
+                ('usl-model', self.t['usl_title'], usl_model_section),
+                ('round-phases', self.t['round_phases_title'], round_phases_section),
+                ('sweep', self.t['sweep_title'], sweep_section),
+                ('ws-subscriptions', self.t['ws_subscriptions_title'], ws_subscriptions_section),
+                ('batch-sweep', self.t['batch_sweep_title'], batch_sweep_section),
+                ('method-profile', self.t['method_profile_title'], method_profile_section),
+                ('endpoint-compare', self.t['compare_title'], endpoint_compare_section),
+                ('replay', self.t['replay_title'], replay_section),
+                ('resume-gaps', self.t['resume_gaps_title'], resume_gaps_section),
                 ('configuration', self.t['config_status_check'], config_status_section),
                 ('sync-health', self.t['blockchain_node_sync_analysis'], block_height_analysis),
                 ('disk-analysis', self.t['disk_performance_analysis'], disk_analysis_section),
@@ -3046,6 +3984,8 @@ class ReportGenerator:
                 ('monitoring-overhead', self.t['monitoring_overhead_comprehensive_analysis'], monitoring_overhead_analysis),
                 ('monitoring-overhead-detail', self.t['monitoring_overhead_detailed'], monitoring_overhead_detailed),
                 ('overhead-table', self.t['monitoring_overhead_breakdown'], overhead_table),
+                ('process-accounting', self.t['process_accounting_title'], process_accounting_section),
+                ('cpu-isolation', self.t['cpu_isolation_title'], cpu_isolation_section),
                 ('ena-warnings', self.t['ena_network_statistics'], ena_warnings),
                 ('ena-data', self.t['ena_network_statistics'], ena_data_table),
                 ('per-method', 'Per-Method', per_method_section),
@@ -3405,7 +4345,7 @@ class ReportGenerator:
                 compute_per_method_resource,
                 filter_proxy_records_by_methods,
                 read_monitor_csv,
-                read_proxy_csv,
+                read_proxy_sink,
             )
             from visualization.per_method_charts import generate_all_charts
             from visualization.per_method_report import (
@@ -3414,15 +4354,15 @@ class ReportGenerator:
                 render_per_method_section,
             )
 
-            proxy_recs = list(read_proxy_csv(proxy_csv))
+            # Raw per-request rows or per-second aggregate buckets, by header.
+            proxy_recs = list(read_proxy_sink(proxy_csv))
             allowed_methods = self._load_configured_workload_methods()
             proxy_recs = filter_proxy_records_by_methods(proxy_recs, allowed_methods)
             if not proxy_recs:
                 return ""
             qps_rows = compute_per_method_qps(proxy_recs)
-            # Re-read proxy (Iterator already consumed)
             resource_rows = compute_per_method_resource(
-                filter_proxy_records_by_methods(read_proxy_csv(proxy_csv), allowed_methods),
+                proxy_recs,
                 # The unified monitor CSV memory column is 'mem_used', while
                 # read_monitor_csv defaults to 'mem_used_mb' for unit fixtures.
                 # Passing mem_col explicitly keeps production memory attribution non-zero.
@@ -3435,16 +4375,114 @@ class ReportGenerator:
             paths = generate_all_charts(
                 qps_rows, resource_rows, chart_dir, chain_name=chain_name, titles=titles,
             )
-            summary = compute_summary(qps_rows, resource_rows)
+            saturation = self._load_method_saturation(proxy_recs, monitor_csv)
+            if saturation:
+                from visualization.per_method_charts import plot_saturation_curves
+                paths['saturation'] = plot_saturation_curves(
+                    saturation['rounds'], saturation['knees'],
+                    os.path.join(chart_dir, f'per_method_saturation_{chain_name}.svg'),
+                    title=titles['saturation'],
+                )
+            corrected_rows, calibration = self._load_proxy_calibration(qps_rows, monitor_csv)
+            summary = compute_summary(qps_rows, resource_rows, corrected_rows=corrected_rows)
             # Use relative paths so report can be copied around
             rel_paths = {k: os.path.relpath(str(p), self.output_dir) for k, p in paths.items()}
             return render_per_method_section(
-                self.language, chain_name, rel_paths, summary,
+                self.language, chain_name, rel_paths, summary, calibration=calibration,
+                cost=self._load_method_cost(), saturation=saturation,
             )
         except Exception as e:
             import html as _html_mod
             return f'<!-- per_method section skipped: {_html_mod.escape(str(e))} -->'
 
+    def _load_proxy_calibration(self, qps_rows, monitor_csv):
+        """Return (corrected_rows, calibration) from proxy_overhead.json and proxy_self.csv.
+
+        Both are None when the run was not calibrated and no round saturated the proxy.
+        """
+        from analysis.proxy_overhead import correct_qps_rows, flag_saturated_rounds, load_curve
+
+        curve_path = next(
+            (path for path in self._runtime_file_candidates(
+                'PROXY_OVERHEAD_JSON',
+                os.path.join(self.logs_dir, 'proxy_overhead.json'),
+                os.path.join(self.output_dir, 'proxy_overhead.json'),
+            ) if os.path.exists(path)),
+            None,
+        )
+        curve = load_curve(curve_path) if curve_path else []
+        cpu_cores = None
+        if curve:
+            try:
+                with open(curve_path, 'r', encoding='utf-8') as f:
+                    cpu_cores = json.load(f).get('cpu_cores')
+            except (OSError, ValueError):
+                cpu_cores = None
+        cpu_cores = int(os.getenv('PROXY_CPU_CORES') or cpu_cores or os.cpu_count() or 1)
+        threshold = float(os.getenv('PROXY_CPU_SATURATION_PCT') or 80)
+
+        self_csv = next(
+            (path for path in self._runtime_file_candidates(
+                'PROXY_SELF_CSV',
+                os.path.join(self.logs_dir, 'proxy_self.csv'),
+                os.path.join(self.output_dir, 'proxy_self.csv'),
+            ) if os.path.exists(path)),
+            None,
+        )
+        saturated = flag_saturated_rounds(self_csv, monitor_csv, cpu_cores, threshold) if self_csv else []
+        if not curve and not saturated:
+            return None, None
+        corrected = correct_qps_rows(qps_rows, curve) if curve else None
+        return corrected, {
+            'points': curve,
+            'saturated_rounds': saturated,
+            'cpu_cores': cpu_cores,
+            'threshold_pct': threshold,
+        }
+
+    def _load_method_saturation(self, proxy_recs, monitor_csv):
+        """Per-round per-method curves and knees, or None for runs with fewer than two rounds.
+
+        Rounds are the measurement windows in ROUND_PHASES_CSV, else runs of
+        equal current_qps in the monitor CSV.
+        """
+        from analysis import method_saturation
+
+        phases_csv = next((path for path in self._runtime_file_candidates(
+            'ROUND_PHASES_CSV', *sorted(glob.glob(os.path.join(self.logs_dir, 'round_phases_*.csv')), reverse=True),
+        ) if os.path.exists(path)), None)
+        windows = method_saturation.read_phase_windows(phases_csv) if phases_csv else []
+        if not windows:
+            windows = method_saturation.monitor_windows(monitor_csv)
+        if len(windows) < 2:
+            return None
+        rounds = method_saturation.curves(proxy_recs, windows)
+        if not rounds:
+            return None
+        return {
+            'rounds': rounds,
+            'knees': method_saturation.knees(rounds),
+            'thresholds': {
+                'p99_factor': method_saturation.P99_FACTOR,
+                'error_pct': method_saturation.ERROR_PCT,
+                'shortfall_pct': method_saturation.SHORTFALL_PCT,
+            },
+        }
+
+    def _load_method_cost(self):
+        """Fitted per-method marginal cost (METHOD_COST_JSON), or None."""
+        cost_json = next((path for path in self._runtime_file_candidates(
+            'METHOD_COST_JSON', *sorted(glob.glob(os.path.join(self.logs_dir, 'method_cost_*.json')), reverse=True),
+        ) if os.path.exists(path)), None)
+        if not cost_json:
+            return None
+        try:
+            with open(cost_json, 'r', encoding='utf-8') as f:
+                cost = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cost if cost.get('fitted') and cost.get('methods') else None
+
     def _load_configured_workload_methods(self):
         """Return methods configured for the active single/mixed workload.
 